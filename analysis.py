@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+
+# Works out which words of a program are code, by following control flow
+# from the entry point instead of decoding from address 0.  Along the way it
+# finds functions, basic blocks, and which instructions call, jump to, read,
+# or write each address.
+#
+# The challenge binary patches itself during its self test and decrypts
+# most of memory at boot, and passes functions around in registers and
+# tables, so:
+#
+#   - It looks at memory once the program first asks for input, which only
+#     depends on the binary, so the result is cached on disk by its hash
+#   - Within a block, registers set to a literal are tracked, so "call r0"
+#     right after "set r0 1234" is followed
+#   - Literals the code loads, and words in what's left as data, might be
+#     function pointers.  Each one is decoded, and only kept if that gets to
+#     the end of every path without hitting something that isn't valid code
+
+import hashlib
+import json
+import os
+from bisect import bisect_right
+
+from program import _all_opcodes, _opcodes, format_instruction, OutputSink, Program
+
+CACHE_DIR = "analysis_cache"
+_VERSION = 1
+# '! opcodes' can hide opcodes, the analysis always uses them all
+_ALL = {k: v for k, v in _all_opcodes.items() if k != 'names'}
+_NAME = {k: v['name'] for k, v in _ALL.items()}
+# Opcodes that write to the register named by their first operand
+_WRITES = {"set", "add", "mult", "mod", "eq", "gt", "and", "or", "not", "rmem", "pop", "in"}
+_ENDS = {"jmp", "ret", "halt"}
+_BOOT_BUDGET = 10000000
+_XREFS = ("calls", "jumps", "reads", "writes")
+
+
+class Analysis:
+    def __init__(self, size):
+        self.size = size
+        # 1 where an instruction starts, 2 for the rest of it, 0 for data
+        self.code = bytearray(size)
+        self.functions = []
+        self.blocks = []
+        # Each of these maps an address to the instructions that refer to it
+        self.calls = {}
+        self.jumps = {}
+        self.reads = {}
+        self.writes = {}
+
+    def start_of(self, addr):
+        # The instruction addr is part of, or addr itself for data
+        while 0 < addr < self.size and self.code[addr] == 2:
+            addr -= 1
+        return addr
+
+    def function_of(self, pc):
+        # The closest function that starts at or before pc
+        i = bisect_right(self.functions, pc)
+        return self.functions[i - 1] if i > 0 else None
+
+    def xrefs(self, addr):
+        return {name: getattr(self, name).get(addr, []) for name in _XREFS}
+
+    def save(self, filename):
+        data = {'version': _VERSION, 'size': self.size, 'code': self.code.hex()}
+        data['functions'] = self.functions
+        data['blocks'] = self.blocks
+        for name in _XREFS:
+            data[name] = {str(k): v for k, v in getattr(self, name).items()}
+        with open(filename, "w") as f:
+            json.dump(data, f)
+
+    @staticmethod
+    def load(filename):
+        with open(filename) as f:
+            data = json.load(f)
+        if data['version'] != _VERSION:
+            return None
+        ret = Analysis(data['size'])
+        ret.code = bytearray.fromhex(data['code'])
+        ret.functions = data['functions']
+        ret.blocks = data['blocks']
+        for name in _XREFS:
+            setattr(ret, name, {int(k): v for k, v in data[name].items()})
+        return ret
+
+
+def _descend(memory, code, root, speculative):
+    # Follows every path from root through instructions not yet found.
+    # Returns ({pc: size}, [(xref, target, pc)], blocks, pointers), or None
+    # if speculative and something along the way isn't valid code
+    size = len(memory)
+    found = {}
+    refs = []
+    blocks = {root}
+    pointers = []
+    todo = [root]
+    while len(todo) > 0:
+        pc = todo.pop()
+        # Registers known to hold a literal in this block
+        known = {}
+        while True:
+            if pc >= size or code[pc] == 2 or memory[pc] not in _ALL:
+                if speculative:
+                    return None
+                break
+            if code[pc] == 1 or pc in found:
+                break
+            name = _NAME[memory[pc]]
+            next_pc = pc + _ALL[memory[pc]]['size']
+            args = memory[pc + 1:next_pc]
+            if next_pc > size or any(code[x] for x in range(pc + 1, next_pc)):
+                if speculative:
+                    return None
+                break
+            if name in _WRITES and args[0] < 32768:
+                # The VM would stop here
+                if speculative:
+                    return None
+                break
+            found[pc] = next_pc - pc
+
+            args = [known.get(x, x) if name not in _WRITES or i > 0 else x for i, x in enumerate(args)]
+            target = None
+            if name in ("jmp", "call"):
+                target = args[0]
+            elif name in ("jt", "jf"):
+                target = args[1]
+            if target is not None and target < 32768:
+                refs.append(("calls" if name == "call" else "jumps", target, pc))
+                blocks.add(target)
+                todo.append(target)
+            if name == "rmem" and args[1] < 32768:
+                refs.append(("reads", args[1], pc))
+            if name == "wmem" and args[0] < 32768:
+                refs.append(("writes", args[0], pc))
+
+            if name == "set" and args[1] < 32768:
+                known[args[0]] = args[1]
+                pointers.append(args[1])
+            elif name in _WRITES:
+                known.pop(args[0], None)
+            elif name == "push" and args[0] < 32768:
+                pointers.append(args[0])
+            elif name == "call":
+                known = {}
+
+            if name in _ENDS:
+                break
+            if name in ("jt", "jf", "call"):
+                blocks.add(next_pc)
+            pc = next_pc
+    return found, refs, blocks, pointers
+
+
+def analyze(memory, entry=0):
+    ret = Analysis(len(memory))
+    functions = {entry}
+    blocks = set()
+
+    def add(result):
+        found, refs, new_blocks, pointers = result
+        for pc, length in found.items():
+            ret.code[pc] = 1
+            ret.code[pc + 1:pc + length] = b"\2" * (length - 1)
+        for name, target, pc in refs:
+            getattr(ret, name).setdefault(target, []).append(pc)
+            if name == "calls":
+                functions.add(target)
+        blocks.update(new_blocks)
+        return pointers
+
+    pointers = add(_descend(memory, ret.code, entry, False))
+    for guesses in (pointers, [memory[x] for x in range(len(memory)) if ret.code[x] == 0]):
+        while len(guesses) > 0:
+            pc = guesses.pop()
+            if pc >= len(memory) or ret.code[pc] != 0:
+                continue
+            result = _descend(memory, ret.code, pc, True)
+            # A lone instruction is more likely data that happens to decode
+            if result is not None and len(result[0]) > 1:
+                functions.add(pc)
+                guesses.extend(add(result))
+
+    ret.functions = sorted(functions)
+    ret.blocks = sorted(blocks | functions)
+    for name in _XREFS:
+        for refs in getattr(ret, name).values():
+            refs.sort()
+    return ret
+
+
+_analyses = {}
+
+
+def analysis_for(program):
+    # The analysis of the binary program was loaded from, from the cache if
+    # it's been done before
+    image = program.image if program.image is not None else program.memory
+    if len(image) == 0:
+        return Analysis(0)
+    cached = _analyses.get(id(image))
+    if cached is not None:
+        return cached[1]
+
+    key = hashlib.blake2b(image.tobytes(), digest_size=16).hexdigest()
+    filename = os.path.join(CACHE_DIR, key + ".json")
+    ret = Analysis.load(filename) if os.path.isfile(filename) else None
+    if ret is None:
+        memory, booted = _boot(image)
+        ret = analyze(memory)
+        if not booted:
+            # Whatever stopped it might not happen next time, so this is
+            # only good for now
+            return ret
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        ret.save(filename)
+    _analyses[id(image)] = (image, ret)
+    return ret
+
+
+def _boot(image):
+    # Memory once a fresh copy of the program first waits for input, with
+    # nothing shown or logged, and whether it got that far.  It runs with
+    # every opcode, whatever '! opcodes' has turned off
+    boot = Program()
+    boot.memory = image.copy()
+    boot.sink = OutputSink(log_name=None)
+    logger = Program.set_logger(None)
+    enabled = dict(_opcodes)
+    _opcodes.clear()
+    _opcodes.update(_all_opcodes)
+    try:
+        reason = boot.run(abort_on_input=True, hide_output=True, budget=_BOOT_BUDGET)
+    finally:
+        _opcodes.clear()
+        _opcodes.update(enabled)
+        Program.set_logger(logger)
+    return boot.memory, reason == ""
+
+
+def format_data(pc, value):
+    if 32 <= value < 127:
+        return f"{pc:5d}: data {value} '{chr(value)}'"
+    return f"{pc:5d}: data {value}"
+
+
+def listing(program, first=0, last=None):
+    # Yields (pc, text) for the code and data from the one covering first
+    # through last, as memory is now.  Code that's been patched since boot
+    # is decoded as it is now
+    found = analysis_for(program)
+    memory = program.memory
+    if last is None:
+        last = len(memory) - 1
+    pc = found.start_of(first)
+    while pc <= last and pc < len(memory):
+        if pc < found.size and found.code[pc] == 1 and memory[pc] in _ALL:
+            size = _ALL[memory[pc]]['size']
+            info = format_instruction(pc, memory[pc:pc + size], _all_opcodes)
+        else:
+            size = 1
+            info = format_data(pc, memory[pc])
+        yield pc, info
+        pc += size
@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 
 from command_opts import opt, main_entry
-from program import Program, _opcodes
+from program import Program, _opcodes, _intrinsics, _default_sink
+from program import OutputLine, InputNeeded, BudgetExhausted, Halted, HALTED, OutputSink
+import intrinsics
+from snapshots import open_store
+from tracer import render_trace
 import zipfile
+import io
 import os
 import re
 import json
@@ -39,10 +44,10 @@ def run_mem(savedstate=""):
             show_all = not show_all
         elif temp.startswith("room "):
             temp = temp[4:]
-            program.memory[2732] = int(temp)
+            program.poke(2732, int(temp))
         elif temp.startswith("mem "):
             temp = temp[4:].split(' ')
-            program.memory[int(temp[0])] = int(temp[1])
+            program.poke(int(temp[0]), int(temp[1]))
         elif temp == "reset":
             memory = program.memory[:]
         else:
@@ -58,10 +63,165 @@ def run():
     program.run()
 
 
+async def _serve_session(base, greeting, quantum, sessions, reader, writer):
+    # One player: a copy of the booted program, with its input coming from
+    # the connection.  Each quantum ends by handing control back to the
+    # event loop, so a long running session can't hold up the others
+    import asyncio
+    program = base.clone()
+    program.sink = OutputSink(log_name=None)
+    events = program.execute(quantum)
+    sessions.add(writer)
+    for line in greeting:
+        writer.write((line + "\n").encode("utf-8"))
+    print(f"Session opened, {len(sessions)} active")
+    try:
+        value = None
+        while True:
+            event = events.send(value)
+            value = None
+            if isinstance(event, OutputLine):
+                writer.write((event.value + "\n").encode("utf-8"))
+            elif isinstance(event, InputNeeded):
+                await writer.drain()
+                line = await reader.readline()
+                if len(line) == 0:
+                    break
+                value = line.decode("utf-8", "replace").rstrip("\r\n")
+            elif isinstance(event, BudgetExhausted):
+                # A program that only prints still waits for the player
+                # to keep up
+                await writer.drain()
+                await asyncio.sleep(0)
+            else:
+                reason = HALTED if isinstance(event, Halted) else event.value
+                writer.write(f"ERROR: {reason}\n".encode("utf-8"))
+                await writer.drain()
+                break
+    except ConnectionError:
+        pass
+    finally:
+        events.close()
+        sessions.discard(writer)
+        writer.close()
+        print(f"Session closed, {len(sessions)} active")
+
+
+@opt("Serve the program to many players over TCP")
+def serve(host="127.0.0.1", port=8023, quantum=20000, state=""):
+    # Line protocol: every line the program outputs is sent as-is, and each
+    # line received is the next command.  The session ends when the program
+    # halts, which is sent as an "ERROR: " line, or the connection closes
+    import asyncio
+    with zipfile.ZipFile(os.path.join("source", "challenge.zip"), 'r') as zip:
+        machine = zip.read('challenge.bin')
+    base = Program()
+    base.load_bytes(machine)
+    if len(state) > 0:
+        base.deserialize(state)
+    # Boot once, up to the first prompt, and hand every session a copy
+    base.sink = OutputSink(log_name=None)
+    greeting = []
+    for event in base.execute():
+        if not isinstance(event, OutputLine):
+            break
+        greeting.append(event.value)
+
+    async def main():
+        sessions = set()
+        server = await asyncio.start_server(
+            lambda reader, writer: _serve_session(base, greeting, quantum, sessions, reader, writer),
+            host, port,
+        )
+        print(f"Serving on {host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+class _CodeFinder:
+    # Aho-Corasick over a set of strings, fed one character at a time, so
+    # every string can be looked for in a single pass
+    def __init__(self, words):
+        self.goto = [{}]
+        self.fail = [0]
+        self.word = [None]
+        for word in words:
+            state = 0
+            for c in word:
+                if c not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.word.append(None)
+                    self.goto[state][c] = len(self.goto) - 1
+                state = self.goto[state][c]
+            self.word[state] = word
+        todo = deque(self.goto[0].values())
+        while len(todo) > 0:
+            state = todo.popleft()
+            for c, next_state in self.goto[state].items():
+                fail = self.fail[state]
+                while fail != 0 and c not in self.goto[fail]:
+                    fail = self.fail[fail]
+                self.fail[next_state] = self.goto[fail].get(c, 0)
+                if self.word[next_state] is None:
+                    self.word[next_state] = self.word[self.fail[next_state]]
+                todo.append(next_state)
+        self.state = 0
+
+    def feed(self, c):
+        # Returns the word that ends with c, if any
+        state = self.state
+        while state != 0 and c not in self.goto[state]:
+            state = self.fail[state]
+        self.state = self.goto[state].get(c, 0)
+        return self.word[self.state]
+
+
+# Every this many characters, script.js has the whole state so the player
+# can start from there
+KEYFRAME_EVERY = 1000
+# Digits for the numbers in the event stream, the first half end a number,
+# the second half carry on to the next 5 bits
+_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-_"
+
+
+def _varint(value):
+    ret = ""
+    while value >= 32:
+        ret += _DIGITS[32 + (value & 31)]
+        value >>= 5
+    return ret + _DIGITS[value]
+
+
+def _zigzag(delta):
+    # Small changes either way as small numbers, wrapping like the VM does
+    delta = ((delta + 16384) % 32768) - 16384
+    return delta * 2 if delta >= 0 else -delta * 2 - 1
+
+
 class Logger:
+    # Writes script.js for images/run_script.html as it goes, as statements
+    # filling in a replay object:
+    #
+    #   text       everything shown, in chunks
+    #   modes      [offset, mode] each time it changes between output,
+    #              input, and code
+    #   events     register and memory changes, in chunks.  Each is the
+    #              number of characters since the last one, a mask of the
+    #              registers that changed with 256 set if memory did too,
+    #              each register's change, and then the number of memory
+    #              changes and each one's index in tracked and value
+    #   keyframes  [offset, events position, offset of the last event,
+    #              registers, tracked memory] every KEYFRAME_EVERY
+    #              characters, so the player can seek
+    #   codes      [offset, code] where each code first shows up
     def __init__(self):
         self.state = "output"
-        self.script = []
         self.last_register = {}
         self.last_memory = {2732: -1}
         self.track = {
@@ -69,6 +229,12 @@ class Logger:
             2690, 2694, 2698, 2702, 2706, 2710, 
             2714, 2718, 2722, 2726, 2730, 
         }
+        self.order = sorted(self.track)
+        # Tracked addresses written since they were last looked at, kept
+        # up to date by a watchpoint on the program being logged
+        self.dirty = set(self.track)
+        self.program = None
+        self.registers = None
         self.codes = set([
             'fbCcIPhFoGGd',
             'KtYzSlsHSBIz',
@@ -79,41 +245,92 @@ class Logger:
             'SlpnGuEnfhcE',
             'YOUlUoXioTpY',
         ])
+        self.finder = _CodeFinder(self.codes)
+        self.found = []
+        # Characters so far, and where the last event was
+        self.offset = 0
+        self.event_offset = 0
+        self.events_length = 0
+        self.keyframe = 0
+        # Not yet written out
+        self.text = ""
+        self.events = ""
+        self.file = None
+        self.finished = False
 
     def reset(self):
         self.last_memory = {2732: -2}
+        self.dirty = set(self.track)
+
+    def memory_changed(self, program, addr, old, value):
+        self.dirty.add(addr)
 
-    def add(self, value):
-        self.script.append(value)
+    def _add(self, name, value):
+        if self.file is None:
+            self.file = open("script.js", "w", newline='')
+            self.file.write(f"var replay = {{version: 2, tracked: {json.dumps(self.order)}, ")
+            self.file.write("text: [], modes: [], events: [], keyframes: [], codes: []};\n")
+        self.file.write(f"replay.{name}.push({json.dumps(value)});\n")
 
     def handle_memory(self, program):
-        temp = []
-        for i in range(len(program.registers)):
-            if self.last_register.get(i, -1) != program.registers[i]:
-                temp.append(f"{i}{program.registers[i]}")
-                self.last_register[i] = program.registers[i]
-        if len(temp) > 0:
-            self.add(f"~r{','.join(temp)}~")
-        temp = []
-        for cur in self.track:
-            if cur < len(program.memory):
-                if self.last_memory.get(cur, -1) != program.memory[cur]:
-                    temp.append(f"{cur}{program.memory[cur]}")
-                    self.last_memory[cur] = program.memory[cur]
-        if len(temp) > 0:
-            self.add(f"~v{','.join(temp)}~")
-            if f"~v{','.join(temp)}~" == "~v~":
-                exit(1)
+        if program is not self.program:
+            # Anything could have changed while another program was logged
+            self.program = program
+            program.watch([x for x in self.track if x < len(program.memory)], self.memory_changed)
+            self.dirty = set(self.track)
+        if self.offset - self.keyframe >= KEYFRAME_EVERY:
+            self.keyframe = self.offset
+            self._add("keyframes", [
+                self.offset, self.events_length + len(self.events), self.event_offset,
+                [self.last_register.get(i, 0) for i in range(8)],
+                [max(self.last_memory.get(x, -1), -1) for x in self.order],
+            ])
+
+        mask = 0
+        event = ""
+        registers = program.registers.tobytes()
+        if registers != self.registers:
+            self.registers = registers
+            for i in range(len(program.registers)):
+                if self.last_register.get(i, -1) != program.registers[i]:
+                    mask |= 1 << i
+                    event += _varint(_zigzag(program.registers[i] - self.last_register.get(i, 0)))
+                    self.last_register[i] = program.registers[i]
+        if len(self.dirty) > 0:
+            changes = []
+            for i, cur in enumerate(self.order):
+                if cur in self.dirty and cur < len(program.memory):
+                    if self.last_memory.get(cur, -1) != program.memory[cur]:
+                        changes.append(_varint(i) + _varint(program.memory[cur]))
+                        self.last_memory[cur] = program.memory[cur]
+            self.dirty = set()
+            if len(changes) > 0:
+                mask |= 256
+                event += _varint(len(changes)) + "".join(changes)
+        if mask != 0:
+            self.events += _varint(self.offset - self.event_offset) + _varint(mask) + event
+            self.event_offset = self.offset
+            if len(self.events) >= 1000:
+                self.events_length += len(self.events)
+                self._add("events", self.events)
+                self.events = ""
 
     def add_message(self, state, value):
         if self.state != state:
-            self.add(f"~m{state}~")
+            self._add("modes", [self.offset, state])
             self.state = state
-        if value == "'":
-            value = "\\'"
-        elif value == "\n":
-            value = "\\n"
-        self.add(value)
+        self.text += value
+        self.offset += 1
+        code = self.finder.feed(value)
+        if code is not None and code in self.codes:
+            self.codes.remove(code)
+            self.found.append(code)
+            self._add("modes", [self.offset - len(code), "code"])
+            self._add("modes", [self.offset, "output"])
+            self._add("codes", [self.offset - len(code), code])
+        if len(self.text) >= 1000:
+            self._add("text", self.text)
+            self.text = ""
 
     def handle_input(self, program, value):
         self.handle_memory(program)
@@ -124,45 +341,81 @@ class Logger:
         self.add_message("output", value)
 
     def finish(self):
-        if self.script is not None:
-            found = True
-            while found:
-                found = False
-                digits = []
-                for i in range(len(self.script)):
-                    if self.script[i][0] != "~":
-                        digits.append((self.script[i], i))
-                    digits = digits[-12:]
-                    if "".join([x[0] for x in digits]) in self.codes:
-                        x = "".join([x[0] for x in digits])
-                        found = True
-                        print(x)
-                        self.codes.remove(x)
-                        a, b = digits[0][1], digits[-1][1] + 1
-                        self.script = self.script[:a] + ["~mcode~"] + self.script[a:b] + ["~moutput~"] + self.script[b:]
-                        break
-
-            temp = ['']
-            for cur in self.script:
-                if len(temp[-1]) >= 100:
-                    temp.append('')
-                temp[-1] += cur
-
-            with open("script.js", "w", newline='') as f:
-                f.write("var script = '';\n")
-                for cur in temp:
-                    f.write(f"script += '{cur}'\n")
-            self.script = None
+        if not self.finished:
+            for code in self.found:
+                print(code)
+            self._add("text", self.text)
+            self._add("events", self.events)
+            self.file.close()
+            self.finished = True
+
+
+def _worker_pool(workers=0, initializer=None, initargs=()):
+    # Workers are forked with a copy of whatever output and log lines are
+    # still buffered, so those go out first or they'd be written again
+    from concurrent.futures import ProcessPoolExecutor
+    _default_sink.flush()
+    return ProcessPoolExecutor(max_workers=workers if workers > 0 else None, initializer=initializer, initargs=initargs)
+
+
+_probe_program = None
+
+
+def _probe_init(machine, state):
+    # Workers don't log, each one's last lines would be lost when it exits
+    global _probe_program
+    _probe_program = Program()
+    _probe_program.sink = OutputSink(log_name=None)
+    _probe_program.load_bytes(machine)
+    _probe_program.deserialize(io.BytesIO(state))
+
+
+def _probe_room(address, value, budget, max_output):
+    # Poke value into address, look around, and report what happened
+    program = _probe_program.clone()
+    program.poke(address, value)
+    program.room = []
+    program.input_buffer = "look\n"
+    try:
+        reason = program.run(abort_on_input=True, hide_output=True, budget=budget, max_output=max_output)
+    except Exception as e:
+        reason = f"{type(e).__name__}: {e}"
+    ret = {
+        'id': value,
+        'title': None,
+        'exits': [],
+        'reason': reason if len(reason) > 0 else "Waiting for input",
+    }
+    # Only the first description counts, the game can show a room twice
+    left = 0
+    for cur in program.room:
+        m = re.search("== (.*) ==", cur)
+        if m is not None:
+            if ret['title'] is not None:
+                break
+            ret['title'] = m.group(1)
+        m = re.search("There (are|is) ([0-9]+) exits{0,1}:", cur)
+        if m is not None:
+            left = int(m.group(2))
+        if left > 0 and cur.startswith("- "):
+            left -= 1
+            ret['exits'].append(cur[2:])
+    return ret
 
 
 @opt("Find all rooms")
-def find_rooms():
+def find_rooms(first=2000, last=3000, address=2732, workers=0, budget=2000000, max_output=20000, output=""):
+    # Every id is tried in a worker process against the same beach snapshot,
+    # each with a limit on instructions and output, so runaway ids just end
+    # up with a reason instead of hanging the sweep
     with zipfile.ZipFile(os.path.join("source", "challenge.zip"), 'r') as zip:
         machine = zip.read('challenge.bin')
     program = Program()
     program.load_bytes(machine)
     program.deserialize(os.path.join("source", "beach.zip"))
     program.run(abort_on_input=True, hide_output=True)
+    state = io.BytesIO()
+    program.serialize(state)
 
     known_rooms = set([
         2317, 2327, 2332, 2337, 2342, 2347, 2352, 2357, 2362, 
@@ -175,22 +428,22 @@ def find_rooms():
         2508, 2518, 2563, 2568, 2583, 2598, 2628, 2633, 2638, 
         2648, 2653, 2658, 
     ])
+    todo = [x for x in range(first, last) if address != 2732 or x not in known_rooms]
 
-    start = program.clone()
-
-    for i in range(2000, 3000):
-        if i not in known_rooms:
-            program = start.clone()
-            program.memory[2732] = i
-            program.input_buffer = "look\n"
-            try:
-                val = program.run(abort_on_input=True, hide_output=True)
-                if val not in {"Unknown output character", "Halt instruction hit!"}:
-                    print(i, val)
-                    program.input_buffer = "look\n"
-                    program.run(abort_on_input=True)
-            except:
-                pass
+    with _worker_pool(workers, _probe_init, (machine, state.getvalue())) as pool:
+        results = list(pool.map(_probe_room, [address] * len(todo), todo, [budget] * len(todo), [max_output] * len(todo), chunksize=16))
+
+    reasons = {}
+    for cur in results:
+        reasons[cur['reason']] = reasons.get(cur['reason'], 0) + 1
+        if cur['reason'] == "Waiting for input":
+            print(f"{cur['id']}: {cur['title']}, exits: {', '.join(cur['exits'])}")
+    for reason, count in sorted(reasons.items()):
+        print(f"{count:5d} x {reason}")
+
+    if len(output) > 0:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=4)
 
 
 @opt("Run the program, with input")
@@ -205,6 +458,24 @@ def run_input(filename, log_all="no"):
         Program.set_logger(logger)
     program = Program()
     memory_log = {}
+    # Logged addresses written since the last look
+    memory_dirty = set()
+    use_jit = False
+    native = {}
+    trace = None
+    profile = False
+
+    def memory_changed(program, addr, old, value):
+        memory_dirty.add(addr)
+
+    def show_memory_log():
+        if len(memory_dirty) > 0:
+            for x in memory_log:
+                if x in memory_dirty and memory_log[x] != program.memory[x]:
+                    val = program.memory[x]
+                    program.show(f">> Memory {x} changed to {val}")
+                    memory_log[x] = val
+            memory_dirty.clear()
 
     with open(filename) as f:
         for cur in f:
@@ -224,7 +495,47 @@ def run_input(filename, log_all="no"):
                 elif cur.startswith("! log_memory "):
                     cur = cur[13:]
                     memory_log[int(cur)] = -1
+                    memory_dirty.add(int(cur))
+                    program.watch([int(cur)], memory_changed)
                     program.show(f"> Memory log for {cur} enabled")
+                elif cur.startswith("! intrinsic "):
+                    name, address = cur[12:].split(' ')
+                    native[int(address)] = name
+                    program.add_intrinsic(int(address), name)
+                    program.show(f"> Intrinsic '{name}' ({_intrinsics[name]['help']}) enabled at {address}")
+                elif cur == "! jit":
+                    use_jit = True
+                    program.enable_jit()
+                    program.show(f"> JIT enabled")
+                elif cur.startswith("! trace "):
+                    # ! trace <file> [first-last pcs] [first-last addresses]
+                    # or ! trace off
+                    cur = cur[8:].split(' ')
+                    program.disable_trace()
+                    if cur[0] == "off":
+                        trace = None
+                        program.show(f"> Trace stopped")
+                    else:
+                        ranges = [tuple(int(x) for x in value.split('-')) for value in cur[1:]]
+                        trace = (cur[0],) + tuple(ranges) + (None,) * (2 - len(ranges))
+                        program.enable_trace(*trace)
+                        program.show(f"> Tracing to {cur[0]}")
+                elif cur == "! profile":
+                    profile = True
+                    program.enable_profile()
+                    program.show(f"> Profiling enabled")
+                elif cur.startswith("! profile "):
+                    # Writes <prefix>.txt, .folded, .dot, and a dump with
+                    # counts as <prefix>.dump.txt
+                    cur = cur[10:]
+                    if program.profiler is None:
+                        program.show("> ERROR: Profiling not enabled, use '! profile' first")
+                    else:
+                        program.profiler.write_report(cur + ".txt")
+                        program.profiler.write_collapsed(cur + ".folded")
+                        program.profiler.write_call_graph(cur + ".dot")
+                        program.dump(cur + ".dump.txt")
+                        program.show(f"> Profile written to {cur}.*")
                 elif cur.startswith("! log_reads"):
                     program.log_reads = True
                     program.show(f"> Read log enabled")
@@ -250,22 +561,32 @@ def run_input(filename, log_all="no"):
                         if str(op) in cur or "all" in cur:
                             _opcodes[op] = all_codes[op]
                     _opcodes['names'] = all_codes['names']
+                    # Instructions decoded so far used the old table
+                    program.reset_decoded()
                     program.show("> Enabled opcodes: " + ", ".join(cur))
                 elif cur == "! run":
+                    program.disable_trace()
                     program = Program()
                     program.need_header = False
                     program.load_bytes(machine)
+                    if use_jit:
+                        program.enable_jit()
+                    for address, name in native.items():
+                        program.add_intrinsic(address, name)
+                    if trace is not None:
+                        program.enable_trace(*trace)
+                    if profile:
+                        program.enable_profile()
                     logger.reset()
+                    program.watch(memory_log, memory_changed)
+                    memory_dirty.update(memory_log)
                     ret = program.run(abort_on_input=True)
                     if len(ret) > 0:
                         program.show(f"> ERROR: {ret}")
-                    for x in memory_log:
-                        if memory_log[x] != program.memory[x]:
-                            val = program.memory[x]
-                            program.show(f">> Memory {x} changed to {val}")
-                            memory_log[x] = val
+                    show_memory_log()
                 elif cur == "! end":
                     program.show("> Goodbye!")
+                    program.disable_trace()
                     logger.finish()
                     exit(0)
                 elif cur.startswith("! type "):
@@ -276,32 +597,33 @@ def run_input(filename, log_all="no"):
                             program.show("> " + lines[i].strip("\r\n"))
                 elif cur.startswith("! decompile "):
                     cur = [int(x) for x in cur[12:].split(' ')]
-                    pc = 0
                     program.show(f"> Decompiling from {cur[0]} to {cur[1]}:")
-                    while pc < len(program.memory):
-                        next_pc, info = program.decode(pc)
-                        if pc >= cur[0]:
-                            program.show("> " + info)
-                        if next_pc > cur[1]:
-                            break
-                        pc = next_pc
+                    for _, info in program.listing(cur[0], cur[1]):
+                        program.show("> " + info)
+                elif cur.startswith("! xref "):
+                    cur = int(cur[7:])
+                    found = program.analysis()
+                    program.show(f"> {cur} is in function {found.function_of(cur)}")
+                    for name, refs in found.xrefs(cur).items():
+                        if len(refs) > 0:
+                            program.show(f"> {name.capitalize()} from " + ", ".join(str(x) for x in refs))
                 elif cur.startswith("! set_register "):
                     cur = cur[15:].split(' ')
                     program.registers[int(cur[0])-1] = int(cur[1])
                     program.show(f"> Register #{cur[0]} set to {cur[1]}")
                 elif cur.startswith("! set_memory "):
                     cur = cur[13:].split(' ')
-                    program.memory[int(cur[0])] = int(cur[1])
+                    program.poke(int(cur[0]), int(cur[1]))
                     program.show(f"> Memory address {cur[0]} set to {cur[1]}")
                 elif cur.startswith("! op "):
                     cur = cur[5:].split(' ')
-                    program.memory[int(cur[0])] = _opcodes['names'][cur[1]]
+                    program.poke(int(cur[0]), _opcodes['names'][cur[1]])
                     program.show(f"> Set {cur[0]} to {cur[1]}")
                 elif cur.startswith("! no_op "):
                     cur = int(cur[8:])
                     num_to_set = _opcodes[program.memory[cur]]['size']
                     for i in range(num_to_set):
-                        program.memory[cur + i] = 21
+                        program.poke(cur + i, 21)
                     program.show(f"> Set {num_to_set} values starting at {cur} to noop")
                 else:
                     raise Exception()
@@ -310,15 +632,49 @@ def run_input(filename, log_all="no"):
                 ret = program.run(abort_on_input=True)
                 if len(ret) > 0:
                     program.show(f"> ERROR: {ret}")
-                for x in memory_log:
-                    if memory_log[x] != program.memory[x]:
-                        val = program.memory[x]
-                        program.show(f">> Memory {x} changed to {val}")
-                        memory_log[x] = val
+                show_memory_log()
 
+    program.disable_trace()
     logger.finish()
                 
 
+@opt("Decode a binary trace from '! trace'")
+def show_trace(filename, output=""):
+    render_trace(filename, output if len(output) > 0 else None)
+
+
+@opt("Manage a snapshot store: list, add, remove, or gc")
+def snapshot_store(action="list", path="snapshots.db", files=""):
+    # add copies each zip snapshot in files, a comma separated list, into
+    # the store under its name without the .zip.  remove takes names
+    store = open_store(path)
+    files = [x for x in files.split(",") if len(x) > 0]
+    if action == "list":
+        for name in store.names():
+            print(name)
+    elif action == "add":
+        with zipfile.ZipFile(os.path.join("source", "challenge.zip"), 'r') as zip:
+            machine = zip.read('challenge.bin')
+        base = Program()
+        base.load_bytes(machine)
+        for cur in files:
+            program = base.clone()
+            program.deserialize(cur)
+            name = os.path.basename(cur)
+            if name.endswith(".zip"):
+                name = name[:-4]
+            store.save(name, program)
+            print(f"Added {name}")
+    elif action == "remove":
+        for name in files:
+            store.remove(name)
+            print(f"Removed {name}")
+    elif action == "gc":
+        print(f"Removed {store.gc()} unused objects")
+    else:
+        raise Exception(f"Unknown action '{action}'")
+
+
 @opt("Run the program from a saved state")
 def load(filename):
     with zipfile.ZipFile(os.path.join("source", "challenge.zip"), 'r') as zip:
@@ -347,44 +703,249 @@ def solve_coins():
             break
 
 
-@opt("Find the target energy level")
-def energy_level():
-    def pow(base, exp, div):
-        ret = 1
-        for _ in range(exp):
-            ret = (ret * base) % div
-        return ret
+def _energy_f3(b, r8):
+    # Closed form of the confirmation routine for f(3, b)
+    d1 = pow(r8 + 1, b, 0x8000)
+    d2 = pow(r8 + 1, b, r8 * 0x8000)
+    d2 -= 1
+    if d2 == -1:
+        d2 = r8 - 1
+
+    ret = d1 * ((r8 + 1) * (r8 + 1) + r8) + d2 // r8 * (2 * r8 + 1)
+    return ret & 0x7fff
+
+
+def _energy_range(values):
+    # f(4, 1) for each r8 in values
+    return [_energy_f3(_energy_f3(r8, r8), r8) for r8 in values]
 
-    def f3(b, r8):
-        d1 = pow(r8 + 1, b, 0x8000)
-        d2 = pow(r8 + 1, b, r8 * 0x8000)
-        d2 -= 1
-        if d2 == -1:
-            d2 = r8 - 1
 
+def _energy_numpy(values):
+    # The same as _energy_range, but for every value at once
+    import numpy as np
+    r8 = np.array(values, dtype=np.int64)
+
+    def pow_mod(base, exp, div):
+        ret = np.ones_like(base)
+        base = base % div
+        exp = exp.copy()
+        while exp.any():
+            ret = np.where(exp & 1, ret * base % div, ret)
+            base = base * base % div
+            exp >>= 1
+        return ret
+
+    def f3(b):
+        d1 = pow_mod(r8 + 1, b, 0x8000)
+        d2 = pow_mod(r8 + 1, b, r8 * 0x8000) - 1
+        d2 = np.where(d2 == -1, r8 - 1, d2)
         ret = d1 * ((r8 + 1) * (r8 + 1) + r8) + d2 // r8 * (2 * r8 + 1)
         return ret & 0x7fff
 
-    def f41(r8):
-        return f3(f3(r8, r8), r8)
+    return f3(f3(r8)).tolist()
 
-    for i in range(1, 32879):
-        result = f41(i)
-        if i % 500 == 0:
-            print(f"r8 = {i:5d}, f(4, 1) => {result}")
-        if result == 6:
-            print(f"The target is {i}")
-            break
+
+@opt("Find the target energy level")
+def energy_level(mode="auto", target=6, workers=0):
+    # mode is one of numpy, pool, or serial, auto picks numpy if it's around
+    values = list(range(1, 32768))
+    if mode == "auto":
+        try:
+            import numpy
+            mode = "numpy"
+        except ImportError:
+            mode = "pool"
+
+    if mode == "numpy":
+        results = _energy_numpy(values)
+    elif mode == "pool":
+        chunks = [values[i:i + 1024] for i in range(0, len(values), 1024)]
+        with _worker_pool(workers) as pool:
+            results = [x for chunk in pool.map(_energy_range, chunks) for x in chunk]
+    elif mode == "serial":
+        results = _energy_range(values)
+    else:
+        raise Exception(f"Unknown mode '{mode}'")
+
+    found = [r8 for r8, result in zip(values, results) if result == target]
+    for r8 in found:
+        print(f"The target is {r8}")
+    print(f"Found {len(found)} value(s) of r8 where f(4, 1) => {target}")
+
+
+_verify_program = None
+
+
+def _verify_init(machine):
+    global _verify_program
+    _verify_program = Program()
+    _verify_program.sink = OutputSink(log_name=None)
+    _verify_program.load_bytes(machine)
+
+
+def _verify_r8(address, a, b, r8):
+    # Run the routine at address in the VM, with every call back into it
+    # memoized on (a, b, r8), and return what it leaves in r0
+    program = _verify_program.clone()
+    regs = program.registers
+    regs[0], regs[1], regs[7] = a, b, r8
+    done = len(program.memory)
+    program.stack = program.stack[:0]
+    program.stack.append(done)
+    program.pc = address
+    op_call, op_ret = _opcodes['names']['call'], _opcodes['names']['ret']
+    memo = {}
+    frames = [(1, (a, b, r8))]
+    while program.pc != done:
+        entry = program.decoded_at(program.pc)
+        if entry[3] == op_call and program.get_val(entry[1][0]) == address:
+            key = (regs[0], regs[1], regs[7])
+            if key in memo:
+                regs[0], regs[1] = memo[key]
+                program.pc = entry[2]
+                continue
+            frames.append((len(program.stack) + 1, key))
+        elif entry[3] == op_ret and len(program.stack) == frames[-1][0]:
+            memo[frames.pop()[1]] = (regs[0], regs[1])
+        program.pc = entry[2]
+        entry[0](program, *entry[1])
+    return r8, regs[0]
+
+
+@opt("Run the VM's confirmation routine for each r8")
+def verify_confirm(progress="confirm_progress.txt", workers=0, first=1, last=32767, address=6027, target=6, binary=""):
+    # Results are appended to progress as they come in, so a later run
+    # with the same file only does what's left
+    if len(binary) == 0:
+        with zipfile.ZipFile(os.path.join("source", "challenge.zip"), 'r') as zip:
+            machine = zip.read('challenge.bin')
+    else:
+        with open(binary, "rb") as f:
+            machine = f.read()
+
+    results = {}
+    if os.path.isfile(progress):
+        # A run that was stopped can leave half a row at the end, which is
+        # cut off so it's checked again and new rows start on a new line
+        good = 0
+        with open(progress, "rb") as f:
+            for row in f:
+                try:
+                    if not row.endswith(b"\n"):
+                        raise ValueError(row)
+                    r8, result = row.decode("utf-8").strip().split(",")
+                    results[int(r8)] = int(result)
+                except ValueError:
+                    print(f"Ignoring everything in {progress} from byte {good} on")
+                    break
+                good += len(row)
+        if good < os.path.getsize(progress):
+            with open(progress, "r+b") as f:
+                f.truncate(good)
+    todo = [x for x in range(first, last + 1) if x not in results]
+    print(f"{len(todo)} values of r8 left to check, {len(results)} already done")
+
+    from concurrent.futures import as_completed
+    with open(progress, "a") as f:
+        with _worker_pool(workers, _verify_init, (machine,)) as pool:
+            jobs = [pool.submit(_verify_r8, address, 4, 1, r8) for r8 in todo]
+            for i, job in enumerate(as_completed(jobs)):
+                r8, result = job.result()
+                results[r8] = result
+                f.write(f"{r8},{result}\n")
+                f.flush()
+                if result == target:
+                    print(f"r8 = {r8} gives {target}")
+                if (i + 1) % 100 == 0:
+                    print(f"Checked {i + 1} of {len(todo)}")
+
+    found = sorted(r8 for r8, result in results.items() if result == target and first <= r8 <= last)
+    for r8 in found:
+        print(f"The target is {r8}")
+    print(f"Found {len(found)} value(s) of r8 where the routine returns {target}")
+
+
+def _drive(jobs, quantum=20000, limit=500):
+    # Runs each (program, commands) job a quantum of instructions at a time,
+    # taking turns, and sends the commands in as each one asks for input.
+    # Returns the lines each job output after its last command, or None for
+    # the jobs that halted, failed, or ran for more than limit quanta
+    results = [None] * len(jobs)
+    todo = deque()
+    for i, (program, commands) in enumerate(jobs):
+        todo.append((i, program.execute(quantum), deque(commands), []))
+    slices = [0] * len(jobs)
+    while len(todo) > 0:
+        i, events, commands, lines = todo.popleft()
+        value = None
+        while True:
+            event = events.send(value)
+            value = None
+            if isinstance(event, OutputLine):
+                lines.append(event.value)
+            elif isinstance(event, InputNeeded):
+                if len(commands) == 0:
+                    results[i] = lines
+                    events.close()
+                    break
+                value = commands.popleft()
+                lines.clear()
+            elif isinstance(event, BudgetExhausted):
+                slices[i] += 1
+                if slices[i] <= limit:
+                    todo.append((i, events, commands, lines))
+                else:
+                    events.close()
+                break
+            else:
+                break
+    return results
+
+
+def _map_room(room, lantern):
+    # Look around a room, then try each of its exits from there
+    program = _probe_program.clone()
+    program.poke(2732, room)
+    if lantern:
+        program.poke(2682, 0)
+    program.run(abort_on_input=True, hide_output=True)
+    program.room = []
+    program.input_buffer = "look\n"
+    program.run(abort_on_input=True, hide_output=True)
+
+    name = ''
+    exits = []
+    left = 0
+    for cur in program.room:
+        m = re.search("== (.*) ==", cur)
+        if m is not None:
+            name = m.group(1)
+        m = re.search("There (are|is) ([0-9]+) exits{0,1}:", cur)
+        if m is not None:
+            left = int(m.group(2))
+        if left > 0 and cur.startswith("- "):
+            left -= 1
+            exits.append(cur[2:])
+
+    ret = []
+    for cur in exits:
+        temp = program.clone()
+        temp.input_buffer = cur + "\n"
+        temp.run(abort_on_input=True, hide_output=True)
+        ret.append((cur, temp.memory[2732]))
+    return room, lantern, name, ret
 
 
 @opt("Find map of rooms")
-def maps():
+def maps(workers=0):
+    # Every start is explored at once, a level at a time across a pool of
+    # workers.  A room is only probed once for each lantern setting, and
+    # each start's map is then read back out of what was found
+    import csv
     with zipfile.ZipFile(os.path.join("source", "challenge.zip"), 'r') as zip:
         machine = zip.read('challenge.bin')
-
-    todo = [2317]
-    todo = [2488]
-    todo = [2498]
+    with open(os.path.join("source", "start_state.zip"), "rb") as f:
+        state = f.read()
 
     starts = [
         {'name': 'start', 'room': 2317, 'lantern': False},
@@ -393,91 +954,89 @@ def maps():
         {'name': 'island', 'room': 2498, 'lantern': False},
     ]
 
-    for start in starts:
-        rooms = {}
-        todo = [start['room']]
+    # (room, lantern) => name, (room, lantern) => exits, and
+    # (room, lantern, exit) => the room it leads to
+    names = {}
+    exits = {}
+    transitions = {}
+    todo = list(dict.fromkeys((start['room'], start['lantern']) for start in starts))
+    seen = set(todo)
+    with _worker_pool(workers, _probe_init, (machine, state)) as pool:
         while len(todo) > 0:
-            room = todo.pop(0)
-            rooms[room] = {
-                'id': room,
-                'connections': [],
-                'name': ''
-            }
-            program = Program()
-            program.load_bytes(machine)
-            program.deserialize(os.path.join("source", "start_state.zip"))
-            program.memory[2732] = room
-            if start['lantern']:
-                program.memory[2682] = 0
-            program.run(abort_on_input=True, hide_output=True)
-            program.room = []
-            program.input_buffer = "look\n"
-            program.run(abort_on_input=True, hide_output=True)
+            results = list(pool.map(_map_room, [x[0] for x in todo], [x[1] for x in todo]))
+            todo = []
+            for room, lantern, name, ret in results:
+                names[(room, lantern)] = name
+                exits[(room, lantern)] = [dir for dir, _ in ret]
+                for dir, other in ret:
+                    transitions[(room, lantern, dir)] = other
+                    if (other, lantern) not in seen:
+                        seen.add((other, lantern))
+                        todo.append((other, lantern))
 
-            left = 0
-            for cur in program.room:
-                m = re.search("== (.*) ==", cur)
-                if m is not None:
-                    rooms[room]['name'] = m.group(1)
-                m = re.search("There (are|is) ([0-9]+) exits{0,1}:", cur)
-                if m is not None:
-                    left = int(m.group(2))
-                if left > 0 and cur.startswith("- "):
-                    left -= 1
-                    rooms[room]['connections'].append([cur[2:], -1])
-            temp = program.clone()
-            for i in range(len(rooms[room]['connections'])):
-                program = temp.clone()
-                program.input_buffer = rooms[room]['connections'][i][0] + "\n"
-                program.run(abort_on_input=True, hide_output=True)
-                rooms[room]['connections'][i][1] = program.memory[2732]
-                if rooms[room]['connections'][i][1] not in rooms:
-                    rooms[rooms[room]['connections'][i][1]] = None
-                    todo.append(rooms[room]['connections'][i][1])
+    for start in starts:
+        lantern = start['lantern']
+        rooms = [start['room']]
+        found = set(rooms)
+        for room in rooms:
+            for dir in exits[(room, lantern)]:
+                other = transitions[(room, lantern, dir)]
+                if other not in found:
+                    found.add(other)
+                    rooms.append(other)
 
-        import csv
         edge = 0
         with open("edges_" + start['name'] + ".csv", "w", newline='') as f_edges:
             cw_edges = csv.writer(f_edges)
             cw_edges.writerow(['id', 'source', 'source_name', 'dest', 'dest_name', 'dir'])
 
-            for room in rooms.values():
-                # cw_nodes.writerow(["node" + str(room['id']), room['name']])
-                for dir, other in room['connections']:
+            for room in rooms:
+                for dir in exits[(room, lantern)]:
+                    other = transitions[(room, lantern, dir)]
                     edge += 1
-                    cw_edges.writerow(["edge" + str(edge), "node" + str(room['id']), room['name'], "node" + str(other), rooms[other]['name'], dir])
+                    cw_edges.writerow(["edge" + str(edge), "node" + str(room), names[(room, lantern)], "node" + str(other), names[(other, lantern)], dir])
 
         print("Done with " + start['name'])
 
 
 @opt("Find layout of vault rooms")
-def vaults():
+def vaults(store=""):
+    # The rooms come from the room_*.zip files auto() leaves behind, or from
+    # the room_* snapshots in a snapshot store
     with zipfile.ZipFile(os.path.join("source", "challenge.zip"), 'r') as zip:
         machine = zip.read('challenge.bin')
+    if len(store) > 0:
+        names = [(x, os.path.join(store, x)) for x in open_store(store).names()]
+    else:
+        names = [(x[:-4], x) for x in os.listdir(".") if x.endswith(".zip")]
     rooms = []
     ids = set()
-    for cur in os.listdir("."):
-        if cur.startswith("room_") and cur.endswith(".zip"):
+    for cur, name in names:
+        if cur.startswith("room_"):
             rooms.append({
-                "id": int(cur[5:-4]),
-                "name": cur,
+                "id": int(cur[5:]),
+                "name": name,
                 "connections": [],
                 'oper': '',
                 'special': '',
             })
-            ids.add(int(cur[5:-4]))
+            ids.add(int(cur[5:]))
     
-    target = 0
+    jobs = []
+    saved = {}
     for room in rooms:
         program = Program()
         program.load_bytes(machine)
         program.deserialize(room['name'])
-        program.run(abort_on_input=True, hide_output=True)
-        program.room = []
-        program.input_buffer = "look\n"
-        program.run(abort_on_input=True, hide_output=True)
-        steps = []
-        for cur in program.room:
+        saved[room['id']] = program.clone()
+        jobs.append((program, ["look"]))
+
+    target = 0
+    steps = {}
+    results = _drive(jobs)
+    for room, lines in [(rooms[i], results[i]) for i in range(len(rooms))]:
+        steps[room['id']] = []
+        for cur in lines or []:
             m = re.search("The floor of this room is a large mosaic depicting a '(.*)' symbol.", cur)
             if m is not None:
                 room['oper'] = m.group(1)
@@ -491,17 +1050,24 @@ def vaults():
             if m is not None:
                 target = int(m.group(1))
             if cur.startswith("- "):
-                steps.append(cur[2:])
+                steps[room['id']].append(cur[2:])
             if cur == "== Vault Antechamber ==":
                 room['special'] = 'start'
             if cur == "== Vault Door ==":
                 room['special'] = 'end'
-        for step in steps:
-            program.deserialize(room['name'])
-            program.input_buffer = step + "\n"
-            program.run(abort_on_input=True, hide_output=True)
-            if program.memory[2732] in ids and program.memory[2732] != room['id']:
-                room['connections'].append((step, program.memory[2732]))
+
+    # Try every exit of every room at once
+    jobs = []
+    moves = []
+    for room in rooms:
+        for step in steps[room['id']]:
+            program = saved[room['id']].clone()
+            jobs.append((program, [step]))
+            moves.append((room, step, program))
+    results = _drive(jobs)
+    for (room, step, program), lines in [(moves[i], results[i]) for i in range(len(moves))]:
+        if lines is not None and program.memory[2732] in ids and program.memory[2732] != room['id']:
+            room['connections'].append((step, program.memory[2732]))
 
     temp = rooms
     rooms = {}
@@ -537,147 +1103,248 @@ def vaults():
                     steps.append((sub, path[:] + [dir], val[:]))
 
 
-@opt("Run the program, looking for events")
-def auto(state=""):
-    with zipfile.ZipFile(os.path.join("source", "challenge.zip"), 'r') as zip:
-        machine = zip.read('challenge.bin')
-    program = Program()
-    program.load_bytes(machine)
-    if len(state) == 0:
-        state = os.path.join("source", "start_state.zip")
-    program.deserialize(state)
-
-    ignore = set([
-        'The passage to the east looks very dark; you think you hear a Grue.',
-        'The east passage appears very dark; you feel likely to be eaten by a Grue.',
-        'emBLbWMgDhds',
-        '\n\nThat door is locked.\n\nWhat do you do?',
-        '\n\nYou have been eaten by a grue.',
-        "\n\nThe vault door is sealed.\n\nWhat do you do?",
-    ])
+_auto_ignore = set([
+    'The passage to the east looks very dark; you think you hear a Grue.',
+    'The east passage appears very dark; you feel likely to be eaten by a Grue.',
+    'emBLbWMgDhds',
+    '\n\nThat door is locked.\n\nWhat do you do?',
+    '\n\nYou have been eaten by a grue.',
+    "\n\nThe vault door is sealed.\n\nWhat do you do?",
+])
+
+
+def _auto_init(machine, state):
+    # Game state all lives below 3000, so that's all the search hashes
+    _probe_init(machine, state)
+    _probe_program.set_hash_mask(range(3000))
+
+
+def _explore_state(delta, step, path, inv, seen=None):
+    # Take one step from a state, then pick up everything in the room.  The
+    # result says where to go next, or why the search should stop.  If seen
+    # is given, a state that's in it isn't looked at any further
+    program = _probe_program.clone()
+    if delta is not None:
+        program.apply_delta(delta)
+    if step is not None:
+        program.input_buffer += step + "\n"
+        path = path + [step]
+    inv = inv[:]
+
+    ret = {
+        'stop': None,
+        'path': path,
+        'inv': inv,
+        'mem': None,
+        'doors': [],
+        'teleported': False,
+        'vault': None,
+        'state': None,
+    }
 
-    states = [(program.clone(), None, [], [])]
-    seen = set()
-    while len(states) > 0:
-        program, step, path, inv = states.pop(0)
-        if step is not None:
-            program.input_buffer += step + "\n"
-            path = path + [step]
+    program.run(abort_on_input=True, hide_output=True)
+    room = "\n".join(program.room)
 
+    m = re.search("Chiseled on the wall of one of the passageways, you see:\n\n    (?P<code>[a-zA-Z0-9]+)\n\nYou take note of this and keep walking.(?P<other>.*)", room, flags=re.DOTALL)
+    if m is not None:
+        if m.group("code") not in _auto_ignore:
+            ret['stop'] = {'reason': "New code", 'value': m.group("code")}
+            return program, ret
+        else:
+            room = m.group("other")
+
+    room = re.sub("^\n\nAs you (approach the vault door|(enter|leave) the room).*?\n", "\n", room, flags=re.DOTALL)
+    room = re.sub("^\n\nAs you (approach the vault door|(enter|leave) the room).*?\n", "\n", room, flags=re.DOTALL)
+
+    if room in _auto_ignore:
+        return program, ret
+
+    m = re.search("^\n\n(?P<room>== .*? ==\n.*?)\n\n(?P<other>.*)\n\nWhat do you do\\?$", room, flags=re.DOTALL)
+    if m is None:
+        state = io.BytesIO()
+        program.serialize(state)
+        ret['state'] = state.getvalue()
+        ret['stop'] = {'reason': "Room with odd description", 'value': room}
+        return program, ret
+
+    room, other = m.group("room"), m.group("other")
+    mem = program.state_hash()
+    ret['mem'] = mem
+    if seen is not None and mem in seen:
+        return program, ret
+
+    in_list = ""
+    lists = {
+        "door": [],
+        "item": [],
+        'other': [],
+    }
+
+    for cur in other.split("\n"):
+        if re.search("^There (are|is) [0-9]+ exits{0,1}:$", cur):
+            in_list = "door"
+        elif cur == "Things of interest here:":
+            in_list = "item"
+        elif cur == "":
+            in_list = ""
+        elif cur.startswith("- "):
+            lists[in_list].append(cur[2:])
+        elif re.search('[0-9_]+ \\+ [0-9_]+ \\* [0-9_]+\\^2 \\+ [0-9_]+\\^3 \\- [0-9_]+ = 399', cur):
+            lists["other"].append(cur)
+        else:
+            known = False
+            if cur in _auto_ignore:
+                known = True
+            if not known:
+                if re.search("The floor of this room is a large mosaic depicting a '(.*)' symbol.", cur):
+                    known = True
+            if not known:
+                if re.search("The floor of this room is a large mosaic depicting the number '([0-9]+)'.", cur):
+                    known = True
+            if not known:
+                ret['stop'] = {'reason': "Unknown line of desc", 'value': cur}
+                return program, ret
+
+    for other in lists["other"]:
+        if len([x for x in inv if x.endswith("coin")]) == 5:
+            # From solve_coins
+            order = ["blue", "red", "shiny", "concave", "corroded"]
+            for test in order:
+                test += " coin"
+                inv.remove(test)
+                path = path + ['use ' + test]
+                program.input_buffer += path[-1] + "\n"
+                program.run(abort_on_input=True, hide_output=True)
+            lists['door'] = ["look"] + lists['door']
+
+    for item in lists["item"]:
+        if item not in {"empty lantern", "can", "teleporter", 'business card', 'strange book', 'journal', 'orb'} and not item.endswith("coin"):
+            ret['stop'] = {'reason': "Unknown item", 'value': item}
+            return program, ret
+        inv.append(item)
+        path = path + ['take ' + item]
+        program.input_buffer += path[-1] + "\n"
         program.run(abort_on_input=True, hide_output=True)
-        room = "\n".join(program.room)
 
-        m = re.search("Chiseled on the wall of one of the passageways, you see:\n\n    (?P<code>[a-zA-Z0-9]+)\n\nYou take note of this and keep walking.(?P<other>.*)", room, flags=re.DOTALL)
-        if m is not None:
-            if m.group("code") not in ignore:
-                print(path)
-                print("New code: " + m.group("code"))
-                exit(1)
-            else:
-                room = m.group("other")
+        if len(inv) == 2 and 'can' in inv and 'empty lantern' in inv:
+            path = path + ['use can']
+            program.input_buffer += path[-1] + "\n"
+            program.run(abort_on_input=True, hide_output=True)
+            path = path + ['use lantern']
+            program.input_buffer += path[-1] + "\n"
+            program.run(abort_on_input=True, hide_output=True)
 
-        room = re.sub("^\n\nAs you (approach the vault door|(enter|leave) the room).*?\n", "\n", room, flags=re.DOTALL)
-        room = re.sub("^\n\nAs you (approach the vault door|(enter|leave) the room).*?\n", "\n", room, flags=re.DOTALL)
+        if item == 'teleporter':
+            inv.remove('teleporter')
+            path = path + ['use teleporter']
+            program.input_buffer += path[-1] + "\n"
+            program.run(abort_on_input=True, hide_output=True)
 
-        if room not in ignore:
-            m = re.search("^\n\n(?P<room>== .*? ==\n.*?)\n\n(?P<other>.*)\n\nWhat do you do\\?$", room, flags=re.DOTALL)
-            if m is None:
-                program.serialize("temp.zip")
-                print("Room with odd description: " + json.dumps(room))
-                exit(1)
-            else:
-                room, other = m.group("room"), m.group("other")
-                mem = ""
-                for key, value in program.changed.items():
-                    if key < 3000:
-                        mem += f"{key},{value}|"
-                if mem not in seen:
-                    seen.add(mem)
-                    in_list = ""
-                    lists = {
-                        "door": [],
-                        "item": [],
-                        'other': [],
-                    }
+            ret['teleported'] = True
+            lists['door'] = ['look']
+
+    ret['path'] = path
+    if "== Vault" in room:
+        save = program.save_state
+        if save is not None:
+            state = io.BytesIO()
+            save.serialize(state)
+            ret['vault'] = (program.memory[2732], state.getvalue())
+    ret['doors'] = lists['door']
+    if len(ret['doors']) > 0:
+        ret['state'] = program.delta(_probe_program)
+    return program, ret
 
-                    for cur in other.split("\n"):
-                        if re.search("^There (are|is) [0-9]+ exits{0,1}:$", cur):
-                            in_list = "door"
-                        elif cur == "Things of interest here:":
-                            in_list = "item"
-                        elif cur == "":
-                            in_list = ""
-                        elif cur.startswith("- "):
-                            lists[in_list].append(cur[2:])
-                        elif re.search('[0-9_]+ \\+ [0-9_]+ \\* [0-9_]+\\^2 \\+ [0-9_]+\\^3 \\- [0-9_]+ = 399', cur):
-                            lists["other"].append(cur)
-                        else:
-                            known = False
-                            if cur in ignore:
-                                known = True
-                            if not known:
-                                if re.search("The floor of this room is a large mosaic depicting a '(.*)' symbol.", cur):
-                                    known = True
-                            if not known:
-                                if re.search("The floor of this room is a large mosaic depicting the number '([0-9]+)'.", cur):
-                                    known = True
-                            if not known:
-                                print("Unknown line of desc: " + json.dumps(cur))
-                                print("Inventory: ", inv)
-                                exit(1)
-
-                    for other in lists["other"]:
-                        if len([x for x in inv if x.endswith("coin")]) == 5:
-                            # From solve_coins
-                            order = ["blue", "red", "shiny", "concave", "corroded"]
-                            for test in order:
-                                test += " coin"
-                                inv.remove(test)
-                                path = path + ['use ' + test]
-                                program.input_buffer += path[-1] + "\n"
-                                program.run(abort_on_input=True)
-                            lists['door'] = ["look"] + lists['door']
-
-                    for item in lists["item"]:
-                        if item not in {"empty lantern", "can", "teleporter", 'business card', 'strange book', 'journal', 'orb'} and not item.endswith("coin"):
-                            print(item)
-                            print(inv)
-                            print("-- Path --:")
-                            for temp in path:
-                                print(temp)
-                            exit(1)
-                        inv.append(item)
-                        path = path + ['take ' + item]
-                        program.input_buffer += path[-1] + "\n"
-                        program.run(abort_on_input=True, hide_output=True)
-
-                        if len(inv) == 2 and 'can' in inv and 'empty lantern' in inv:
-                            path = path + ['use can']
-                            program.input_buffer += path[-1] + "\n"
-                            program.run(abort_on_input=True)
-                            path = path + ['use lantern']
-                            program.input_buffer += path[-1] + "\n"
-                            program.run(abort_on_input=True)
-
-                        if item == 'teleporter':
-                            inv.remove('teleporter')
-                            path = path + ['use teleporter']
-                            program.input_buffer += path[-1] + "\n"
-                            program.run(abort_on_input=True)
-
-                            states = []
-                            lists['door'] = ['look']
-                    
-                    if "== Vault" in room:
-                        program.save_state.serialize("room_" + str(program.memory[2732]) + ".zip")
-                    for door in lists["door"]:
-                        states.append((program.clone(), door, path[:], inv[:]))
 
+def _explore(delta, step, path, inv):
+    return _explore_state(delta, step, path, inv)[1]
+
+
+@opt("Run the program, looking for events")
+def auto(state="", workers=0, store=""):
+    # A breadth first search of the game, a whole level of the queue at a
+    # time spread across worker processes.  Results are merged back in
+    # queue order against one set of seen states, so the search visits the
+    # same states in the same order as it would one at a time.  Returns
+    # the reason it stopped, if any, along with the path to get there.
+    # Vault rooms are saved to room_*.zip, or into store if it's given.
+    # States are deduped on the contents of memory below 3000
+    with zipfile.ZipFile(os.path.join("source", "challenge.zip"), 'r') as zip:
+        machine = zip.read('challenge.bin')
+    if len(state) == 0:
+        state = os.path.join("source", "start_state.zip")
+    with open(state, "rb") as f:
+        state = f.read()
+    _auto_init(machine, state)
+
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    states = deque([(None, None, [], [])])
+    seen = set()
+    last = None
+    result = None
+    pool = None
+    if workers > 1:
+        pool = _worker_pool(workers, _auto_init, (machine, state))
+    try:
+        while len(states) > 0 and result is None:
+            batch = list(states)
+            states.clear()
+            if pool is None:
+                # Run each state as it's merged, so duplicates are caught
+                # before they're expanded
+                rets = (_explore_state(*x, seen=seen)[1] for x in batch)
+            else:
+                chunksize = max(1, len(batch) // (workers * 4))
+                rets = pool.map(_explore, *[[x[i] for x in batch] for i in range(4)], chunksize=chunksize)
+            for i, ret in enumerate(rets):
+                last = (batch[i], ret['mem'] in seen)
+                if ret['stop'] is not None:
+                    result = ret['stop']
+                    result['path'] = ret['path']
+                    result['inv'] = ret['inv']
+                    if ret['state'] is not None:
+                        with open("temp.zip", "wb") as f:
+                            f.write(ret['state'])
+                    break
+                if ret['mem'] is None or ret['mem'] in seen:
+                    continue
+                seen.add(ret['mem'])
+                if ret['vault'] is not None:
+                    if len(store) > 0:
+                        room = _probe_program.clone()
+                        room.deserialize(io.BytesIO(ret['vault'][1]))
+                        open_store(store).save("room_" + str(ret['vault'][0]), room)
+                    else:
+                        with open("room_" + str(ret['vault'][0]) + ".zip", "wb") as f:
+                            f.write(ret['vault'][1])
+                if ret['teleported']:
+                    states.clear()
+                for door in ret['doors']:
+                    states.append((ret['state'], door, ret['path'], ret['inv']))
+                if ret['teleported']:
+                    break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if result is not None:
+        print(f"{result['reason']}: {json.dumps(result['value'])}")
+        print("Inventory: ", result['inv'])
+        print("-- Path --:")
+        for cur in result['path']:
+            print(cur)
+        return result
+
+    # Only the last state's program is needed, so run it again here
+    item, duplicate = last
+    program, ret = _explore_state(*item, seen=seen if duplicate else None)
     print("--- All steps ---")
-    for cur in path:
+    for cur in ret['path']:
         print(cur)
 
     program.save_state.serialize(os.path.join('source', 'book.zip'))
+    return {'reason': None, 'value': None, 'path': ret['path'], 'inv': ret['inv']}
 
 
 if __name__ == "__main__":
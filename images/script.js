@@ -1,4527 +1,435 @@
-var script = '';
-script += '~r00,10,20,30,40,50,60,70~# Welcome!  Lines like this are comments from me.\n# Input commands that s'
-script += 'tart with a "!" are instructions for the interpreter\n# The first code is in the machine spec itself'
-script += '\n~minput~! type arch-spec:28,33\n~moutput~> == hints ==\n> - Start with operations 0, 19, and 21.\n'
-script += '> - Here\'s a code for the challenge website: ~mcode~fbCcIPhFoGGd~moutput~\n> - The program "9,32768'
-script += ',32769,4,19,32768" occupies six memory addresses and should:\n>   - Store into register 0 the sum of'
-script += ' 4 and the value contained in register 1.\n>   - Output to the terminal the character with the ascii'
-script += ' code contained in register 0.\n# Start a test run, with just the first opcodes the hint suggests\n~minput~'
-script += '! opcodes 0,19,21\n~moutput~> Enabled opcodes: 0, 19, 21\n# Running the machine now will reveal the '
-script += 'second code\n~minput~! run\n~v26902452,27222643,26942473,27262488,26982483,27182623,27322317,27302553,26702317,27022468,26742357,27062478,267832767,27102463,27142488,268232767,26862417~'
-script += '~moutput~Welcome to the Synacor Challenge!\nPlease record your progress by putting codes like\nthis '
-script += 'one into the challenge website: ~mcode~KtYzSlsHSBIz~moutput~\n\nExecuting self-test...\n\n> ERROR: U'
-script += 'nknown opcode: 6\n# Now start the machine again, this time with all of the opcodes turned on\n~minput~'
-script += '! opcodes all\n~moutput~> Enabled opcodes: all\n# This time when it\'s run, the bootup test sequence'
-script += ' will reveal the third code\n~minput~! run\n~v26902452,27222643,26942473,27262488,26982483,27182623,27322317,27302553,26702317,27022468,26742357,27062478,267832767,27102463,27142488,268232767,26862417~'
-script += '~moutput~Welcome to the Synacor Challenge!\nPlease record your progress by putting codes like\nthis '
-script += 'one into the challenge website: KtYzSlsHSBIz\n\nExecuting self-test...\n\n~r0115,26124,36081,435,51528,66080~'
-script += 's~r0101,11,36082~e~r0108,12,36083~l~r0102,13,36084~f~r045,14,36085~-~r0116,15,36086~t~r0101,16,36087~'
-script += 'e~r0115,17,36088~s~r0116,18,36089~t~r032,19,36090~ ~r099,110,36091~c~r0111,111,36092~o~r0109,112,36093~'
-script += 'm~r0112,113,36094~p~r0108,114,36095~l~r0101,115,36096~e~r0116,116,36097~t~r0101,117,36098~e~r044,118,36099~'
-script += ',~r032,119,36100~ ~r097,120,36101~a~r0108,121,36102~l~r122,36103~l~r032,123,36104~ ~r0116,124,36105~'
-script += 't~r0101,125,36106~e~r0115,126,36107~s~r0116,127,36108~t~r0115,128,36109~s~r032,129,36110~ ~r0112,130,36111~'
-script += 'p~r097,131,36112~a~r0115,132,36113~s~r133,36114~s~r010,134,36115~\n~r084,17799,27799,326852,448,51531,626851~'
-script += 'T~r0104,326853~h~r0101,326854~e~r032,326855~ ~r0115,326856~s~r0101,326857~e~r0108,326858~l~r0102,326859~'
-script += 'f~r045,326860~-~r0116,326861~t~r0101,326862~e~r0115,326863~s~r0116,326864~t~r032,326865~ ~r099,326866~'
-script += 'c~r0111,326867~o~r0109,326868~m~r0112,326869~p~r0108,326870~l~r0101,326871~e~r0116,326872~t~r0105,326873~'
-script += 'i~r0111,326874~o~r0110,326875~n~r032,326876~ ~r099,326877~c~r0111,326878~o~r0100,326879~d~r0101,326880~'
-script += 'e~r032,326881~ ~r0105,326882~i~r0115,326883~s~r058,326884~:~r032,326885~ ~r0111,326886~~mcode~o~r078,326887~'
-script += 'N~r084,326888~T~r070,326889~F~r0109,326890~m~r0111,326891~o~r0105,326892~i~r084,326893~T~r082,326894~'
-script += 'R~r084,326895~T~r077,326896~M~r071,326897~G~moutput~~r010,326898~\n~r326899~\n~r02317,10,26124,31,4101,50,60~'
-script += '== ~r070,36143,49,51528,66142~F~r0111,11,36144~o~r12,36145~o~r0116,13,36146~t~r0104,14,36147~h~r0105,15,36148~'
-script += 'i~r0108,16,36149~l~r17,36150~l~r0115,18,36151~s~r06142,10,31,4101,50,60~ ==\n~r089,36153,4183,51528,66152~'
-script += 'Y~r0111,11,36154~o~r0117,12,36155~u~r032,13,36156~ ~r0102,14,36157~f~r0105,15,36158~i~r0110,16,36159~'
-script += 'n~r0100,17,36160~d~r032,18,36161~ ~r0121,19,36162~y~r0111,110,36163~o~r0117,111,36164~u~r0114,112,36165~'
-script += 'r~r0115,113,36166~s~r0101,114,36167~e~r0108,115,36168~l~r0102,116,36169~f~r032,117,36170~ ~r0115,118,36171~'
-script += 's~r0116,119,36172~t~r097,120,36173~a~r0110,121,36174~n~r0100,122,36175~d~r0105,123,36176~i~r0110,124,36177~'
-script += 'n~r0103,125,36178~g~r032,126,36179~ ~r097,127,36180~a~r0116,128,36181~t~r032,129,36182~ ~r0116,130,36183~'
-script += 't~r0104,131,36184~h~r0101,132,36185~e~r032,133,36186~ ~r098,134,36187~b~r097,135,36188~a~r0115,136,36189~'
-script += 's~r0101,137,36190~e~r032,138,36191~ ~r0111,139,36192~o~r0102,140,36193~f~r032,141,36194~ ~r097,142,36195~'
-script += 'a~r0110,143,36196~n~r032,144,36197~ ~r0101,145,36198~e~r0110,146,36199~n~r0111,147,36200~o~r0114,148,36201~'
-script += 'r~r0109,149,36202~m~r0111,150,36203~o~r0117,151,36204~u~r0115,152,36205~s~r032,153,36206~ ~r0109,154,36207~'
-script += 'm~r0111,155,36208~o~r0117,156,36209~u~r0110,157,36210~n~r0116,158,36211~t~r097,159,36212~a~r0105,160,36213~'
-script += 'i~r0110,161,36214~n~r046,162,36215~.~r032,163,36216~ ~r164,36217~ ~r065,165,36218~A~r0116,166,36219~'
-script += 't~r032,167,36220~ ~r0105,168,36221~i~r0116,169,36222~t~r0115,170,36223~s~r032,171,36224~ ~r098,172,36225~'
-script += 'b~r097,173,36226~a~r0115,174,36227~s~r0101,175,36228~e~r032,176,36229~ ~r0116,177,36230~t~r0111,178,36231~'
-script += 'o~r032,179,36232~ ~r0116,180,36233~t~r0104,181,36234~h~r0101,182,36235~e~r032,183,36236~ ~r0110,184,36237~'
-script += 'n~r0111,185,36238~o~r0114,186,36239~r~r0116,187,36240~t~r0104,188,36241~h~r044,189,36242~,~r032,190,36243~'
-script += ' ~r0116,191,36244~t~r0104,192,36245~h~r0101,193,36246~e~r0114,194,36247~r~r0101,195,36248~e~r032,196,36249~'
-script += ' ~r0105,197,36250~i~r0115,198,36251~s~r032,199,36252~ ~r097,1100,36253~a~r032,1101,36254~ ~r0109,1102,36255~'
-script += 'm~r097,1103,36256~a~r0115,1104,36257~s~r1105,36258~s~r0105,1106,36259~i~r0118,1107,36260~v~r0101,1108,36261~'
-script += 'e~r032,1109,36262~ ~r0100,1110,36263~d~r0111,1111,36264~o~r1112,36265~o~r0114,1113,36266~r~r0119,1114,36267~'
-script += 'w~r097,1115,36268~a~r0121,1116,36269~y~r046,1117,36270~.~r032,1118,36271~ ~r1119,36272~ ~r065,1120,36273~'
-script += 'A~r032,1121,36274~ ~r0115,1122,36275~s~r0105,1123,36276~i~r0103,1124,36277~g~r0110,1125,36278~n~r032,1126,36279~'
-script += ' ~r0110,1127,36280~n~r0101,1128,36281~e~r097,1129,36282~a~r0114,1130,36283~r~r098,1131,36284~b~r0121,1132,36285~'
-script += 'y~r032,1133,36286~ ~r0114,1134,36287~r~r0101,1135,36288~e~r097,1136,36289~a~r0100,1137,36290~d~r0115,1138,36291~'
-script += 's~r032,1139,36292~ ~r034,1140,36293~"~r075,1141,36294~K~r0101,1142,36295~e~r1143,36296~e~r0112,1144,36297~'
-script += 'p~r032,1145,36298~ ~r0111,1146,36299~o~r0117,1147,36300~u~r0116,1148,36301~t~r033,1149,36302~!~r032,1150,36303~'
-script += ' ~r1151,36304~ ~r068,1152,36305~D~r0101,1153,36306~e~r0102,1154,36307~f~r0105,1155,36308~i~r0110,1156,36309~'
-script += 'n~r0105,1157,36310~i~r0116,1158,36311~t~r0101,1159,36312~e~r0108,1160,36313~l~r0121,1161,36314~y~r032,1162,36315~'
-script += ' ~r0110,1163,36316~n~r0111,1164,36317~o~r032,1165,36318~ ~r0116,1166,36319~t~r0114,1167,36320~r~r0101,1168,36321~'
-script += 'e~r097,1169,36322~a~r0115,1170,36323~s~r0117,1171,36324~u~r0114,1172,36325~r~r0101,1173,36326~e~r032,1174,36327~'
-script += ' ~r0119,1175,36328~w~r0105,1176,36329~i~r0116,1177,36330~t~r0104,1178,36331~h~r0105,1179,36332~i~r0110,1180,36333~'
-script += 'n~r033,1181,36334~!~r034,1182,36335~"~r06152,10,31,4101,50,60~\n~r010,19212,29212,327456,426,51531,627455~'
-script += '\n~r084,327457~T~r0104,327458~h~r0105,327459~i~r0110,327460~n~r0103,327461~g~r0115,327462~s~r032,327463~'
-script += ' ~r0111,327464~o~r0102,327465~f~r032,327466~ ~r0105,327467~i~r0110,327468~n~r0116,327469~t~r0101,327470~'
-script += 'e~r0114,327471~r~r0101,327472~e~r0115,327473~s~r0116,327474~t~r032,327475~ ~r0104,327476~h~r0101,327477~'
-script += 'e~r0114,327478~r~r0101,327479~e~r058,327480~:~r010,327481~\n~r018062,10,22317,31,416,55893,627381~- '
-script += '~r0116,318063,46,51528,618062~t~r097,11,318064~a~r098,12,318065~b~r0108,13,318066~l~r0101,14,318067~'
-script += 'e~r0116,15,318068~t~r018062,10,31,416,55893,627381~\n~r02,20,4101,50,60~\nThere are ~r050,110,210,332766,450,51~'
-script += '2~r02,10,20,31,4101,50~ exits:\n~r06336,326901,42,55814,626900~- ~r0100,36337,47,51528,66336~d~r0111,11,36338~'
-script += 'o~r12,36339~o~r0114,13,36340~r~r0119,14,36341~w~r097,15,36342~a~r0121,16,36343~y~r06336,10,326901,42,55814,626900~'
-script += '\n~r06344,11,326902~- ~r0115,10,36345,45,51528,66344~s~r0111,11,36346~o~r0117,12,36347~u~r0116,13,36348~'
-script += 't~r0104,14,36349~h~r06344,11,326902,42,55814,626900~\n~r010,132613,232613,327415,417,51531,627414~\n'
-script += '~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~t~r025976,4116,51~a~r025977,497,52~'
-script += 'k~r025978,4107,53~e~r025979,4101,54~ ~r025980,432,55~t~r025981,4116,56~a~r025982,497,57~b~r025983,498,58~'
-script += 'l~r025984,4108,59~e~r025985,4101,510~t~r025986,4116,511~\n~r032,26124,31,4101,50~~moutput~\n\n~r084,114065,214065,328055,47,51531,628054~'
-script += '~v26700~T~r097,328056~a~r0107,328057~k~r0101,328058~e~r0110,328059~n~r046,328060~.~r010,328061~\n~r132613,232613,327415,417,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~# Using the tablet reveals the fo'
-script += 'urth code\n~minput~u~r025976,4117,51~s~r025977,4115,52~e~r025978,4101,53~ ~r025979,432,54~t~r025980,4116,55~'
-script += 'a~r025981,497,56~b~r025982,498,57~l~r025983,4108,58~e~r025984,4101,59~t~r025985,4116,510~\n~r032,24,36,4101,50~'
-script += '~moutput~\n\n~r089,114053,214053,328370,427,51531,628369~Y~r0111,328371~o~r0117,328372~u~r032,328373~'
-script += ' ~r0102,328374~f~r0105,328375~i~r0110,328376~n~r0100,328377~d~r032,328378~ ~r0121,328379~y~r0111,328380~'
-script += 'o~r0117,328381~u~r0114,328382~r~r0115,328383~s~r0101,328384~e~r0108,328385~l~r0102,328386~f~r032,328387~'
-script += ' ~r0119,328388~w~r0114,328389~r~r0105,328390~i~r0116,328391~t~r0105,328392~i~r0110,328393~n~r0103,328394~'
-script += 'g~r032,328395~ ~r034,328396~"~r077,10,232767,36130,412,51528,66129~~mcode~M~r066,11,36131~B~r084,12,36132~'
-script += 'T~r0100,13,36133~d~r071,14,36134~G~r0103,15,36135~g~r0117,16,36136~u~r0110,17,36137~n~r0100,18,36138~'
-script += 'd~r072,19,36139~H~r081,110,36140~Q~r071,111,36141~G~moutput~~r034,132127,232127,328402,451,51531,628401~'
-script += '"~r032,328403~ ~r0111,328404~o~r0110,328405~n~r032,328406~ ~r0116,328407~t~r0104,328408~h~r0101,328409~'
-script += 'e~r032,328410~ ~r0116,328411~t~r097,328412~a~r098,328413~b~r0108,328414~l~r0101,328415~e~r0116,328416~'
-script += 't~r046,328417~.~r032,328418~ ~r328419~ ~r080,328420~P~r0101,328421~e~r0114,328422~r~r0104,328423~h~r097,328424~'
-script += 'a~r0112,328425~p~r0115,328426~s~r032,328427~ ~r0105,328428~i~r0116,328429~t~r039,328430~\'~r0115,328431~'
-script += 's~r032,328432~ ~r0115,328433~s~r0111,328434~o~r0109,328435~m~r0101,328436~e~r032,328437~ ~r0107,328438~'
-script += 'k~r0105,328439~i~r0110,328440~n~r0100,328441~d~r032,328442~ ~r0111,328443~o~r0102,328444~f~r032,328445~'
-script += ' ~r099,328446~c~r0111,328447~o~r0100,328448~d~r0101,328449~e~r063,328450~?~r010,328451~\n~r328452~\n'
-script += '~r132613,232613,327415,417,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~'
-script += ' ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~'
-script += ' ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~'
-script += 'd~r025976,4100,51~o~r025977,4111,52~o~r025978,53~r~r025979,4114,54~w~r025980,4119,55~a~r025981,497,56~'
-script += 'y~r025982,4121,57~\n~r032,23,36,4101,50~~moutput~\n\n~r02327,10,20,37~~v27322327~== ~r068,36442,49,51528,66441~'
-script += 'D~r097,11,36443~a~r0114,12,36444~r~r0107,13,36445~k~r032,14,36446~ ~r099,15,36447~c~r097,16,36448~a~r0118,17,36449~'
-script += 'v~r0101,18,36450~e~r06441,10,37,4101,50,60~ ==\n~r084,36452,4133,51528,66451~T~r0104,11,36453~h~r0105,12,36454~'
-script += 'i~r0115,13,36455~s~r032,14,36456~ ~r0115,15,36457~s~r0101,16,36458~e~r17,36459~e~r0109,18,36460~m~r0115,19,36461~'
-script += 's~r032,110,36462~ ~r0116,111,36463~t~r0111,112,36464~o~r032,113,36465~ ~r098,114,36466~b~r0101,115,36467~'
-script += 'e~r032,116,36468~ ~r0116,117,36469~t~r0104,118,36470~h~r0101,119,36471~e~r032,120,36472~ ~r0109,121,36473~'
-script += 'm~r0111,122,36474~o~r0117,123,36475~u~r0116,124,36476~t~r0104,125,36477~h~r032,126,36478~ ~r0111,127,36479~'
-script += 'o~r0102,128,36480~f~r032,129,36481~ ~r097,130,36482~a~r032,131,36483~ ~r0100,132,36484~d~r0101,133,36485~'
-script += 'e~r134,36486~e~r0112,135,36487~p~r032,136,36488~ ~r099,137,36489~c~r097,138,36490~a~r0118,139,36491~'
-script += 'v~r0101,140,36492~e~r046,141,36493~.~r032,142,36494~ ~r143,36495~ ~r065,144,36496~A~r0115,145,36497~'
-script += 's~r032,146,36498~ ~r0121,147,36499~y~r0111,148,36500~o~r0117,149,36501~u~r032,150,36502~ ~r0112,151,36503~'
-script += 'p~r0101,152,36504~e~r153,36505~e~r0114,154,36506~r~r032,155,36507~ ~r0110,156,36508~n~r0111,157,36509~'
-script += 'o~r0114,158,36510~r~r0116,159,36511~t~r0104,160,36512~h~r032,161,36513~ ~r0105,162,36514~i~r0110,163,36515~'
-script += 'n~r0116,164,36516~t~r0111,165,36517~o~r032,166,36518~ ~r0116,167,36519~t~r0104,168,36520~h~r0101,169,36521~'
-script += 'e~r032,170,36522~ ~r0100,171,36523~d~r097,172,36524~a~r0114,173,36525~r~r0107,174,36526~k~r0110,175,36527~'
-script += 'n~r0101,176,36528~e~r0115,177,36529~s~r178,36530~s~r044,179,36531~,~r032,180,36532~ ~r0121,181,36533~'
-script += 'y~r0111,182,36534~o~r0117,183,36535~u~r032,184,36536~ ~r0116,185,36537~t~r0104,186,36538~h~r0105,187,36539~'
-script += 'i~r0110,188,36540~n~r0107,189,36541~k~r032,190,36542~ ~r0121,191,36543~y~r0111,192,36544~o~r0117,193,36545~'
-script += 'u~r032,194,36546~ ~r0104,195,36547~h~r0101,196,36548~e~r097,197,36549~a~r0114,198,36550~r~r032,199,36551~'
-script += ' ~r0116,1100,36552~t~r0104,1101,36553~h~r0101,1102,36554~e~r032,1103,36555~ ~r0101,1104,36556~e~r099,1105,36557~'
-script += 'c~r0104,1106,36558~h~r0111,1107,36559~o~r0101,1108,36560~e~r0115,1109,36561~s~r032,1110,36562~ ~r0111,1111,36563~'
-script += 'o~r0102,1112,36564~f~r032,1113,36565~ ~r098,1114,36566~b~r097,1115,36567~a~r0116,1116,36568~t~r0115,1117,36569~'
-script += 's~r032,1118,36570~ ~r0100,1119,36571~d~r0101,1120,36572~e~r1121,36573~e~r0112,1122,36574~p~r0101,1123,36575~'
-script += 'e~r0114,1124,36576~r~r032,1125,36577~ ~r0119,1126,36578~w~r0105,1127,36579~i~r0116,1128,36580~t~r0104,1129,36581~'
-script += 'h~r0105,1130,36582~i~r0110,1131,36583~n~r046,1132,36584~.~r06451,10,37,4101,50,60~\n~r02~\nThere are'
-script += ' ~r050,110,210,332766,450,51~2~r02,10,20,37,4101,50~ exits:\n~r06585,326911,42,55814,626910~- ~r0110,36586,45,51528,66585~'
-script += 'n~r0111,11,36587~o~r0114,12,36588~r~r0116,13,36589~t~r0104,14,36590~h~r06585,10,326911,42,55814,626910~'
-script += '\n~r06591,11,326912~- ~r0115,10,36592,45,51528,66591~s~r0111,11,36593~o~r0117,12,36594~u~r0116,13,36595~'
-script += 't~r0104,14,36596~h~r06591,11,326912,42,55814,626910~\n~r010,132613,232613,327415,417,51531,627414~\n'
-script += '~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~n~r025976,4110,51~o~r025977,4111,52~'
-script += 'r~r025978,4114,53~t~r025979,4116,54~h~r025980,4104,55~\n~r032,20,37,4101,50~~moutput~\n\n~r02332,10,35~'
-script += '~v27322332~== ~r068,36598,49,51528,66597~D~r097,11,36599~a~r0114,12,36600~r~r0107,13,36601~k~r032,14,36602~'
-script += ' ~r099,15,36603~c~r097,16,36604~a~r0118,17,36605~v~r0101,18,36606~e~r06597,10,35,4101,50,60~ ==\n~r084,36608,491,51528,66607~'
-script += 'T~r0104,11,36609~h~r0101,12,36610~e~r032,13,36611~ ~r099,14,36612~c~r097,15,36613~a~r0118,16,36614~v'
-script += '~r0101,17,36615~e~r032,18,36616~ ~r0105,19,36617~i~r0115,110,36618~s~r032,111,36619~ ~r0115,112,36620~'
-script += 's~r0111,113,36621~o~r0109,114,36622~m~r0101,115,36623~e~r0119,116,36624~w~r0104,117,36625~h~r097,118,36626~'
-script += 'a~r0116,119,36627~t~r032,120,36628~ ~r0110,121,36629~n~r097,122,36630~a~r0114,123,36631~r~r124,36632~'
-script += 'r~r0111,125,36633~o~r0119,126,36634~w~r032,127,36635~ ~r0104,128,36636~h~r0101,129,36637~e~r0114,130,36638~'
-script += 'r~r0101,131,36639~e~r044,132,36640~,~r032,133,36641~ ~r097,134,36642~a~r0110,135,36643~n~r0100,136,36644~'
-script += 'd~r032,137,36645~ ~r0116,138,36646~t~r0104,139,36647~h~r0101,140,36648~e~r032,141,36649~ ~r0108,142,36650~'
-script += 'l~r0105,143,36651~i~r0103,144,36652~g~r0104,145,36653~h~r0116,146,36654~t~r032,147,36655~ ~r0102,148,36656~'
-script += 'f~r0114,149,36657~r~r0111,150,36658~o~r0109,151,36659~m~r032,152,36660~ ~r0116,153,36661~t~r0104,154,36662~'
-script += 'h~r0101,155,36663~e~r032,156,36664~ ~r0100,157,36665~d~r0111,158,36666~o~r159,36667~o~r0114,160,36668~'
-script += 'r~r0119,161,36669~w~r097,162,36670~a~r0121,163,36671~y~r032,164,36672~ ~r0116,165,36673~t~r0111,166,36674~'
-script += 'o~r032,167,36675~ ~r0116,168,36676~t~r0104,169,36677~h~r0101,170,36678~e~r032,171,36679~ ~r0115,172,36680~'
-script += 's~r0111,173,36681~o~r0117,174,36682~u~r0116,175,36683~t~r0104,176,36684~h~r032,177,36685~ ~r0105,178,36686~'
-script += 'i~r0115,179,36687~s~r032,180,36688~ ~r0113,181,36689~q~r0117,182,36690~u~r0105,183,36691~i~r0116,184,36692~'
-script += 't~r0101,185,36693~e~r032,186,36694~ ~r0100,187,36695~d~r0105,188,36696~i~r0109,189,36697~m~r046,190,36698~'
-script += '.~r06607,10,35,4101,50,60~\n~r02~\nThere are ~r050,110,210,332766,450,51~2~r02,10,20,35,4101,50~ exi'
-script += 'ts:\n~r06699,326917,42,55814,626916~- ~r0110,36700,45,51528,66699~n~r0111,11,36701~o~r0114,12,36702~'
-script += 'r~r0116,13,36703~t~r0104,14,36704~h~r06699,10,326917,42,55814,626916~\n~r06705,11,326918~- ~r0115,10,36706,45,51528,66705~'
-script += 's~r0111,11,36707~o~r0117,12,36708~u~r0116,13,36709~t~r0104,14,36710~h~r06705,11,326918,42,55814,626916~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~n~r025976,4110,51~o~r025977,4111,52~r~r025978,4114,53~t~r025979,4116,54~h~r025980,4104,55~\n'
-script += '~r032,20,35,4101,50~~moutput~\n\n~r02337,10~~v27322337~== ~r068,36712,49,51528,66711~D~r097,11,36713~'
-script += 'a~r0114,12,36714~r~r0107,13,36715~k~r032,14,36716~ ~r099,15,36717~c~r097,16,36718~a~r0118,17,36719~v'
-script += '~r0101,18,36720~e~r06711,10,35,4101,50,60~ ==\n~r084,36722,4187,51528,66721~T~r0104,11,36723~h~r0101,12,36724~'
-script += 'e~r032,13,36725~ ~r099,14,36726~c~r097,15,36727~a~r0118,16,36728~v~r0101,17,36729~e~r032,18,36730~ ~r097,19,36731~'
-script += 'a~r099,110,36732~c~r0111,111,36733~o~r0117,112,36734~u~r0115,113,36735~s~r0116,114,36736~t~r0105,115,36737~'
-script += 'i~r099,116,36738~c~r0115,117,36739~s~r032,118,36740~ ~r0100,119,36741~d~r0114,120,36742~r~r097,121,36743~'
-script += 'a~r0109,122,36744~m~r097,123,36745~a~r0116,124,36746~t~r0105,125,36747~i~r099,126,36748~c~r097,127,36749~'
-script += 'a~r0108,128,36750~l~r129,36751~l~r0121,130,36752~y~r032,131,36753~ ~r099,132,36754~c~r0104,133,36755~'
-script += 'h~r097,134,36756~a~r0110,135,36757~n~r0103,136,36758~g~r0101,137,36759~e~r032,138,36760~ ~r097,139,36761~'
-script += 'a~r0115,140,36762~s~r032,141,36763~ ~r0121,142,36764~y~r0111,143,36765~o~r0117,144,36766~u~r032,145,36767~'
-script += ' ~r0102,146,36768~f~r0105,147,36769~i~r0110,148,36770~n~r0100,149,36771~d~r032,150,36772~ ~r0121,151,36773~'
-script += 'y~r0111,152,36774~o~r0117,153,36775~u~r0114,154,36776~r~r0115,155,36777~s~r0101,156,36778~e~r0108,157,36779~'
-script += 'l~r0102,158,36780~f~r032,159,36781~ ~r097,160,36782~a~r0116,161,36783~t~r032,162,36784~ ~r097,163,36785~'
-script += 'a~r032,164,36786~ ~r0108,165,36787~l~r0101,166,36788~e~r0103,167,36789~g~r0100,168,36790~d~r0101,169,36791~'
-script += 'e~r032,170,36792~ ~r097,171,36793~a~r098,172,36794~b~r0111,173,36795~o~r0118,174,36796~v~r0101,175,36797~'
-script += 'e~r032,176,36798~ ~r097,177,36799~a~r032,178,36800~ ~r0108,179,36801~l~r097,180,36802~a~r0114,181,36803~'
-script += 'r~r0103,182,36804~g~r0101,183,36805~e~r032,184,36806~ ~r099,185,36807~c~r0104,186,36808~h~r097,187,36809~'
-script += 'a~r0115,188,36810~s~r0109,189,36811~m~r046,190,36812~.~r032,191,36813~ ~r192,36814~ ~r084,193,36815~'
-script += 'T~r0104,194,36816~h~r0101,195,36817~e~r0114,196,36818~r~r0101,197,36819~e~r032,198,36820~ ~r0105,199,36821~'
-script += 'i~r0115,1100,36822~s~r032,1101,36823~ ~r098,1102,36824~b~r097,1103,36825~a~r0114,1104,36826~r~r0101,1105,36827~'
-script += 'e~r0108,1106,36828~l~r0121,1107,36829~y~r032,1108,36830~ ~r0101,1109,36831~e~r0110,1110,36832~n~r0111,1111,36833~'
-script += 'o~r0117,1112,36834~u~r0103,1113,36835~g~r0104,1114,36836~h~r032,1115,36837~ ~r0108,1116,36838~l~r0105,1117,36839~'
-script += 'i~r0103,1118,36840~g~r0104,1119,36841~h~r0116,1120,36842~t~r032,1121,36843~ ~r0104,1122,36844~h~r0101,1123,36845~'
-script += 'e~r0114,1124,36846~r~r0101,1125,36847~e~r032,1126,36848~ ~r0116,1127,36849~t~r0111,1128,36850~o~r032,1129,36851~'
-script += ' ~r0110,1130,36852~n~r0111,1131,36853~o~r0116,1132,36854~t~r0105,1133,36855~i~r099,1134,36856~c~r0101,1135,36857~'
-script += 'e~r032,1136,36858~ ~r097,1137,36859~a~r032,1138,36860~ ~r0114,1139,36861~r~r0111,1140,36862~o~r0112,1141,36863~'
-script += 'p~r0101,1142,36864~e~r032,1143,36865~ ~r098,1144,36866~b~r0114,1145,36867~r~r0105,1146,36868~i~r0100,1147,36869~'
-script += 'd~r0103,1148,36870~g~r0101,1149,36871~e~r032,1150,36872~ ~r0108,1151,36873~l~r0101,1152,36874~e~r097,1153,36875~'
-script += 'a~r0100,1154,36876~d~r0105,1155,36877~i~r0110,1156,36878~n~r0103,1157,36879~g~r032,1158,36880~ ~r0111,1159,36881~'
-script += 'o~r0117,1160,36882~u~r0116,1161,36883~t~r032,1162,36884~ ~r0105,1163,36885~i~r0110,1164,36886~n~r0116,1165,36887~'
-script += 't~r0111,1166,36888~o~r032,1167,36889~ ~r0116,1168,36890~t~r0104,1169,36891~h~r0101,1170,36892~e~r032,1171,36893~'
-script += ' ~r0100,1172,36894~d~r097,1173,36895~a~r0114,1174,36896~r~r0107,1175,36897~k~r032,1176,36898~ ~r0101,1177,36899~'
-script += 'e~r0109,1178,36900~m~r0112,1179,36901~p~r0116,1180,36902~t~r0105,1181,36903~i~r0110,1182,36904~n~r0101,1183,36905~'
-script += 'e~r0115,1184,36906~s~r1185,36907~s~r046,1186,36908~.~r06721,10,35,4101,50,60~\n~r02~\nThere are ~r050,110,210,332766,450,51~'
-script += '2~r02,10,20,35,4101,50~ exits:\n~r06909,326923,42,55814,626922~- ~r098,36910,46,51528,66909~b~r0114,11,36911~'
-script += 'r~r0105,12,36912~i~r0100,13,36913~d~r0103,14,36914~g~r0101,15,36915~e~r06909,10,326923,42,55814,626922~'
-script += '\n~r06916,11,326924~- ~r0115,10,36917,45,51528,66916~s~r0111,11,36918~o~r0117,12,36919~u~r0116,13,36920~'
-script += 't~r0104,14,36921~h~r06916,11,326924,42,55814,626922~\n~r010,132613,232613,327415,417,51531,627414~\n'
-script += '~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~b~r025976,498,51~r~r025977,4114,52~'
-script += 'i~r025978,4105,53~d~r025979,4100,54~g~r025980,4103,55~e~r025981,4101,56~\n~r032,20,35,50~~moutput~\n'
-script += '\n~r02342,10,36~~v27322342~== ~r082,36923,411,51528,66922~R~r0111,11,36924~o~r0112,12,36925~p~r0101,13,36926~'
-script += 'e~r032,14,36927~ ~r098,15,36928~b~r0114,16,36929~r~r0105,17,36930~i~r0100,18,36931~d~r0103,19,36932~'
-script += 'g~r0101,110,36933~e~r06922,10,36,4101,50,60~ ==\n~r084,36935,4121,51528,66934~T~r0104,11,36936~h~r0105,12,36937~'
-script += 'i~r0115,13,36938~s~r032,14,36939~ ~r0114,15,36940~r~r0111,16,36941~o~r0112,17,36942~p~r0101,18,36943~'
-script += 'e~r032,19,36944~ ~r098,110,36945~b~r0114,111,36946~r~r0105,112,36947~i~r0100,113,36948~d~r0103,114,36949~'
-script += 'g~r0101,115,36950~e~r032,116,36951~ ~r099,117,36952~c~r0114,118,36953~r~r0101,119,36954~e~r097,120,36955~'
-script += 'a~r0107,121,36956~k~r0115,122,36957~s~r032,123,36958~ ~r097,124,36959~a~r0115,125,36960~s~r032,126,36961~'
-script += ' ~r0121,127,36962~y~r0111,128,36963~o~r0117,129,36964~u~r032,130,36965~ ~r0119,131,36966~w~r097,132,36967~'
-script += 'a~r0108,133,36968~l~r0107,134,36969~k~r032,135,36970~ ~r097,136,36971~a~r0108,137,36972~l~r0111,138,36973~'
-script += 'o~r0110,139,36974~n~r0103,140,36975~g~r032,141,36976~ ~r0105,142,36977~i~r0116,143,36978~t~r046,144,36979~'
-script += '.~r032,145,36980~ ~r146,36981~ ~r089,147,36982~Y~r0111,148,36983~o~r0117,149,36984~u~r032,150,36985~'
-script += ' ~r097,151,36986~a~r0114,152,36987~r~r0101,153,36988~e~r0110,154,36989~n~r039,155,36990~\'~r0116,156,36991~'
-script += 't~r032,157,36992~ ~r0115,158,36993~s~r0117,159,36994~u~r0114,160,36995~r~r0101,161,36996~e~r032,162,36997~'
-script += ' ~r0104,163,36998~h~r0111,164,36999~o~r0119,165,37000~w~r032,166,37001~ ~r0111,167,37002~o~r0108,168,37003~'
-script += 'l~r0100,169,37004~d~r032,170,37005~ ~r0105,171,37006~i~r0116,172,37007~t~r032,173,37008~ ~r0105,174,37009~'
-script += 'i~r0115,175,37010~s~r044,176,37011~,~r032,177,37012~ ~r0111,178,37013~o~r0114,179,37014~r~r032,180,37015~'
-script += ' ~r0119,181,37016~w~r0104,182,37017~h~r0101,183,37018~e~r0116,184,37019~t~r0104,185,37020~h~r0101,186,37021~'
-script += 'e~r0114,187,37022~r~r032,188,37023~ ~r0105,189,37024~i~r0116,190,37025~t~r032,191,37026~ ~r099,192,37027~'
-script += 'c~r097,193,37028~a~r0110,194,37029~n~r032,195,37030~ ~r0101,196,37031~e~r0118,197,37032~v~r0101,198,37033~'
-script += 'e~r0110,199,37034~n~r032,1100,37035~ ~r0115,1101,37036~s~r0117,1102,37037~u~r0112,1103,37038~p~r1104,37039~'
-script += 'p~r0111,1105,37040~o~r0114,1106,37041~r~r0116,1107,37042~t~r032,1108,37043~ ~r0121,1109,37044~y~r0111,1110,37045~'
-script += 'o~r0117,1111,37046~u~r0114,1112,37047~r~r032,1113,37048~ ~r0119,1114,37049~w~r0101,1115,37050~e~r0105,1116,37051~'
-script += 'i~r0103,1117,37052~g~r0104,1118,37053~h~r0116,1119,37054~t~r046,1120,37055~.~r06934,10,36,4101,50,60~'
-script += '\n~r02~\nThere are ~r050,110,210,332766,450,51~2~r02,10,20,36,4101,50~ exits:\n~r07056,326929,42,55814,626928~'
-script += '- ~r099,37057,48,51528,67056~c~r0111,11,37058~o~r0110,12,37059~n~r0116,13,37060~t~r0105,14,37061~i~r0110,15,37062~'
-script += 'n~r0117,16,37063~u~r0101,17,37064~e~r07056,10,326929,42,55814,626928~\n~r07065,11,326930~- ~r098,10,37066,44,51528,67065~'
-script += 'b~r097,11,37067~a~r099,12,37068~c~r0107,13,37069~k~r07065,11,326930,42,55814,626928~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~c~r025976,499,51~o~r025977,4111,52~'
-script += 'n~r025978,4110,53~t~r025979,4116,54~i~r025980,4105,55~n~r025981,4110,56~u~r025982,4117,57~e~r025983,4101,58~'
-script += '\n~r032,20,36,50~~moutput~\n\n~r02347,10,38~~v27322347~== ~r070,37071,424,51528,67070~F~r097,11,37072~'
-script += 'a~r0108,12,37073~l~r13,37074~l~r0105,14,37075~i~r0110,15,37076~n~r0103,16,37077~g~r032,17,37078~ ~r0116,18,37079~'
-script += 't~r0104,19,37080~h~r0114,110,37081~r~r0111,111,37082~o~r0117,112,37083~u~r0103,113,37084~g~r0104,114,37085~'
-script += 'h~r032,115,37086~ ~r0116,116,37087~t~r0104,117,37088~h~r0101,118,37089~e~r032,119,37090~ ~r097,120,37091~'
-script += 'a~r0105,121,37092~i~r0114,122,37093~r~r033,123,37094~!~r07070,10,38,4101,50,60~ ==\n~r065,37096,4169,51528,67095~'
-script += 'A~r0115,11,37097~s~r032,12,37098~ ~r0121,13,37099~y~r0111,14,37100~o~r0117,15,37101~u~r032,16,37102~'
-script += ' ~r099,17,37103~c~r0111,18,37104~o~r0110,19,37105~n~r0116,110,37106~t~r0105,111,37107~i~r0110,112,37108~'
-script += 'n~r0117,113,37109~u~r0101,114,37110~e~r032,115,37111~ ~r097,116,37112~a~r0108,117,37113~l~r0111,118,37114~'
-script += 'o~r0110,119,37115~n~r0103,120,37116~g~r032,121,37117~ ~r0116,122,37118~t~r0104,123,37119~h~r0101,124,37120~'
-script += 'e~r032,125,37121~ ~r098,126,37122~b~r0114,127,37123~r~r0105,128,37124~i~r0100,129,37125~d~r0103,130,37126~'
-script += 'g~r0101,131,37127~e~r044,132,37128~,~r032,133,37129~ ~r0105,134,37130~i~r0116,135,37131~t~r032,136,37132~'
-script += ' ~r0115,137,37133~s~r0110,138,37134~n~r097,139,37135~a~r0112,140,37136~p~r0115,141,37137~s~r033,142,37138~'
-script += '!~r032,143,37139~ ~r144,37140~ ~r089,145,37141~Y~r0111,146,37142~o~r0117,147,37143~u~r032,148,37144~'
-script += ' ~r0116,149,37145~t~r0114,150,37146~r~r0121,151,37147~y~r032,152,37148~ ~r0116,153,37149~t~r0111,154,37150~'
-script += 'o~r032,155,37151~ ~r0103,156,37152~g~r0114,157,37153~r~r097,158,37154~a~r098,159,37155~b~r032,160,37156~'
-script += ' ~r0116,161,37157~t~r0104,162,37158~h~r0101,163,37159~e~r032,164,37160~ ~r098,165,37161~b~r0114,166,37162~'
-script += 'r~r0105,167,37163~i~r0100,168,37164~d~r0103,169,37165~g~r0101,170,37166~e~r044,171,37167~,~r032,172,37168~'
-script += ' ~r098,173,37169~b~r0117,174,37170~u~r0116,175,37171~t~r032,176,37172~ ~r0105,177,37173~i~r0116,178,37174~'
-script += 't~r032,179,37175~ ~r0101,180,37176~e~r0118,181,37177~v~r097,182,37178~a~r0100,183,37179~d~r0101,184,37180~'
-script += 'e~r0115,185,37181~s~r032,186,37182~ ~r0121,187,37183~y~r0111,188,37184~o~r0117,189,37185~u~r0114,190,37186~'
-script += 'r~r032,191,37187~ ~r0103,192,37188~g~r0114,193,37189~r~r097,194,37190~a~r0115,195,37191~s~r0112,196,37192~'
-script += 'p~r032,197,37193~ ~r0105,198,37194~i~r0110,199,37195~n~r032,1100,37196~ ~r0116,1101,37197~t~r0104,1102,37198~'
-script += 'h~r0101,1103,37199~e~r032,1104,37200~ ~r0100,1105,37201~d~r097,1106,37202~a~r0114,1107,37203~r~r0107,1108,37204~'
-script += 'k~r0110,1109,37205~n~r0101,1110,37206~e~r0115,1111,37207~s~r1112,37208~s~r046,1113,37209~.~r032,1114,37210~'
-script += ' ~r1115,37211~ ~r089,1116,37212~Y~r0111,1117,37213~o~r0117,1118,37214~u~r032,1119,37215~ ~r097,1120,37216~'
-script += 'a~r0114,1121,37217~r~r0101,1122,37218~e~r032,1123,37219~ ~r0112,1124,37220~p~r0108,1125,37221~l~r0117,1126,37222~'
-script += 'u~r0109,1127,37223~m~r1128,37224~m~r0101,1129,37225~e~r0116,1130,37226~t~r0105,1131,37227~i~r0110,1132,37228~'
-script += 'n~r0103,1133,37229~g~r032,1134,37230~ ~r0113,1135,37231~q~r0117,1136,37232~u~r0105,1137,37233~i~r099,1138,37234~'
-script += 'c~r0107,1139,37235~k~r0108,1140,37236~l~r0121,1141,37237~y~r032,1142,37238~ ~r0100,1143,37239~d~r0111,1144,37240~'
-script += 'o~r0119,1145,37241~w~r0110,1146,37242~n~r0119,1147,37243~w~r097,1148,37244~a~r0114,1149,37245~r~r0100,1150,37246~'
-script += 'd~r032,1151,37247~ ~r0105,1152,37248~i~r0110,1153,37249~n~r0116,1154,37250~t~r0111,1155,37251~o~r032,1156,37252~'
-script += ' ~r0116,1157,37253~t~r0104,1158,37254~h~r0101,1159,37255~e~r032,1160,37256~ ~r099,1161,37257~c~r0104,1162,37258~'
-script += 'h~r097,1163,37259~a~r0115,1164,37260~s~r0109,1165,37261~m~r046,1166,37262~.~r1167,37263~.~r1168,37264~'
-script += '.~r07095,10,38,4101,50,60~\n~r01,21~\nThere is ~r049,110,210,332767,449,51~1~r01,10,21,38,4101,50~ e'
-script += 'xit:\n~r07265,326935,41,55814,626934~- ~r0100,37266,44,51528,67265~d~r0111,11,37267~o~r0119,12,37268~'
-script += 'w~r0110,13,37269~n~r07265,10,326935,41,55814,626934~\n~r010,132613,232613,327415,417,51531,627414~\n'
-script += '~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~d~r025976,4100,51~o~r025977,4111,52~'
-script += 'w~r025978,4119,53~n~r025979,4110,54~\n~r032,20,38,4101,50~~moutput~\n\n~r02352,10,34~~v27322352~== ~r077,37271,411,51528,67270~'
-script += 'M~r0111,11,37272~o~r0115,12,37273~s~r13,37274~s~r032,14,37275~ ~r099,15,37276~c~r097,16,37277~a~r0118,17,37278~'
-script += 'v~r0101,18,37279~e~r0114,19,37280~r~r0110,110,37281~n~r07270,10,34,4101,50,60~ ==\n~r089,37283,4209,51528,67282~'
-script += 'Y~r0111,11,37284~o~r0117,12,37285~u~r032,13,37286~ ~r097,14,37287~a~r0114,15,37288~r~r0101,16,37289~'
-script += 'e~r032,17,37290~ ~r0115,18,37291~s~r0116,19,37292~t~r097,110,37293~a~r0110,111,37294~n~r0100,112,37295~'
-script += 'd~r0105,113,37296~i~r0110,114,37297~n~r0103,115,37298~g~r032,116,37299~ ~r0105,117,37300~i~r0110,118,37301~'
-script += 'n~r032,119,37302~ ~r097,120,37303~a~r032,121,37304~ ~r0108,122,37305~l~r097,123,37306~a~r0114,124,37307~'
-script += 'r~r0103,125,37308~g~r0101,126,37309~e~r032,127,37310~ ~r099,128,37311~c~r097,129,37312~a~r0118,130,37313~'
-script += 'v~r0101,131,37314~e~r0114,132,37315~r~r0110,133,37316~n~r032,134,37317~ ~r0102,135,37318~f~r0117,136,37319~'
-script += 'u~r0108,137,37320~l~r138,37321~l~r032,139,37322~ ~r0111,140,37323~o~r0102,141,37324~f~r032,142,37325~'
-script += ' ~r098,143,37326~b~r0105,144,37327~i~r0111,145,37328~o~r0108,146,37329~l~r0117,147,37330~u~r0109,148,37331~'
-script += 'm~r0105,149,37332~i~r0110,150,37333~n~r0101,151,37334~e~r0115,152,37335~s~r099,153,37336~c~r0101,154,37337~'
-script += 'e~r0110,155,37338~n~r0116,156,37339~t~r032,157,37340~ ~r0109,158,37341~m~r0111,159,37342~o~r0115,160,37343~'
-script += 's~r161,37344~s~r046,162,37345~.~r032,163,37346~ ~r164,37347~ ~r073,165,37348~I~r0116,166,37349~t~r032,167,37350~'
-script += ' ~r0109,168,37351~m~r0117,169,37352~u~r0115,170,37353~s~r0116,171,37354~t~r032,172,37355~ ~r0104,173,37356~'
-script += 'h~r097,174,37357~a~r0118,175,37358~v~r0101,176,37359~e~r032,177,37360~ ~r098,178,37361~b~r0114,179,37362~'
-script += 'r~r0111,180,37363~o~r0107,181,37364~k~r0101,182,37365~e~r0110,183,37366~n~r032,184,37367~ ~r0121,185,37368~'
-script += 'y~r0111,186,37369~o~r0117,187,37370~u~r0114,188,37371~r~r032,189,37372~ ~r0102,190,37373~f~r097,191,37374~'
-script += 'a~r0108,192,37375~l~r193,37376~l~r033,194,37377~!~r032,195,37378~ ~r196,37379~ ~r084,197,37380~T~r0104,198,37381~'
-script += 'h~r0101,199,37382~e~r032,1100,37383~ ~r099,1101,37384~c~r097,1102,37385~a~r0118,1103,37386~v~r0101,1104,37387~'
-script += 'e~r0114,1105,37388~r~r0110,1106,37389~n~r032,1107,37390~ ~r0101,1108,37391~e~r0120,1109,37392~x~r0116,1110,37393~'
-script += 't~r0101,1111,37394~e~r0110,1112,37395~n~r0100,1113,37396~d~r0115,1114,37397~s~r032,1115,37398~ ~r0116,1116,37399~'
-script += 't~r0111,1117,37400~o~r032,1118,37401~ ~r0116,1119,37402~t~r0104,1120,37403~h~r0101,1121,37404~e~r032,1122,37405~'
-script += ' ~r0101,1123,37406~e~r097,1124,37407~a~r0115,1125,37408~s~r0116,1126,37409~t~r032,1127,37410~ ~r097,1128,37411~'
-script += 'a~r0110,1129,37412~n~r0100,1130,37413~d~r032,1131,37414~ ~r0119,1132,37415~w~r0101,1133,37416~e~r0115,1134,37417~'
-script += 's~r0116,1135,37418~t~r059,1136,37419~;~r032,1137,37420~ ~r097,1138,37421~a~r0116,1139,37422~t~r032,1140,37423~'
-script += ' ~r0116,1141,37424~t~r0104,1142,37425~h~r0101,1143,37426~e~r032,1144,37427~ ~r0119,1145,37428~w~r0101,1146,37429~'
-script += 'e~r0115,1147,37430~s~r0116,1148,37431~t~r032,1149,37432~ ~r0101,1150,37433~e~r0110,1151,37434~n~r0100,1152,37435~'
-script += 'd~r044,1153,37436~,~r032,1154,37437~ ~r0121,1155,37438~y~r0111,1156,37439~o~r0117,1157,37440~u~r032,1158,37441~'
-script += ' ~r0116,1159,37442~t~r0104,1160,37443~h~r0105,1161,37444~i~r0110,1162,37445~n~r0107,1163,37446~k~r032,1164,37447~'
-script += ' ~r0121,1165,37448~y~r0111,1166,37449~o~r0117,1167,37450~u~r032,1168,37451~ ~r0115,1169,37452~s~r0101,1170,37453~'
-script += 'e~r1171,37454~e~r032,1172,37455~ ~r097,1173,37456~a~r032,1174,37457~ ~r0112,1175,37458~p~r097,1176,37459~'
-script += 'a~r0115,1177,37460~s~r1178,37461~s~r097,1179,37462~a~r0103,1180,37463~g~r0101,1181,37464~e~r032,1182,37465~'
-script += ' ~r0108,1183,37466~l~r0101,1184,37467~e~r097,1185,37468~a~r0100,1186,37469~d~r0105,1187,37470~i~r0110,1188,37471~'
-script += 'n~r0103,1189,37472~g~r032,1190,37473~ ~r0111,1191,37474~o~r0117,1192,37475~u~r0116,1193,37476~t~r032,1194,37477~'
-script += ' ~r0111,1195,37478~o~r0102,1196,37479~f~r032,1197,37480~ ~r0116,1198,37481~t~r0104,1199,37482~h~r0101,1200,37483~'
-script += 'e~r032,1201,37484~ ~r099,1202,37485~c~r097,1203,37486~a~r0118,1204,37487~v~r0101,1205,37488~e~r0114,1206,37489~'
-script += 'r~r0110,1207,37490~n~r046,1208,37491~.~r07282,10,34,4101,50,60~\n~r02~\nThere are ~r050,110,210,332766,450,51~'
-script += '2~r02,10,20,34,4101,50~ exits:\n~r07492,326939,42,55814,626938~- ~r0119,37493,44,51528,67492~w~r0101,11,37494~'
-script += 'e~r0115,12,37495~s~r0116,13,37496~t~r07492,10,326939,42,55814,626938~\n~r07497,11,326940~- ~r0101,10,37498,44,51528,67497~'
-script += 'e~r097,11,37499~a~r0115,12,37500~s~r0116,13,37501~t~r07497,11,326940,42,55814,626938~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~e~r025976,51~a~r025977,497,52~'
-script += 's~r025978,4115,53~t~r025979,4116,54~\n~r032,20,34,4101,50~~moutput~\n\n~r02357,10~~v27322357~== ~r077,37503,411,51528,67502~'
-script += 'M~r0111,11,37504~o~r0115,12,37505~s~r13,37506~s~r032,14,37507~ ~r099,15,37508~c~r097,16,37509~a~r0118,17,37510~'
-script += 'v~r0101,18,37511~e~r0114,19,37512~r~r0110,110,37513~n~r07502,10,34,4101,50,60~ ==\n~r089,37515,496,51528,67514~'
-script += 'Y~r0111,11,37516~o~r0117,12,37517~u~r032,13,37518~ ~r097,14,37519~a~r0114,15,37520~r~r0101,16,37521~'
-script += 'e~r032,17,37522~ ~r0115,18,37523~s~r0116,19,37524~t~r097,110,37525~a~r0110,111,37526~n~r0100,112,37527~'
-script += 'd~r0105,113,37528~i~r0110,114,37529~n~r0103,115,37530~g~r032,116,37531~ ~r0105,117,37532~i~r0110,118,37533~'
-script += 'n~r032,119,37534~ ~r097,120,37535~a~r032,121,37536~ ~r0108,122,37537~l~r097,123,37538~a~r0114,124,37539~'
-script += 'r~r0103,125,37540~g~r0101,126,37541~e~r032,127,37542~ ~r099,128,37543~c~r097,129,37544~a~r0118,130,37545~'
-script += 'v~r0101,131,37546~e~r0114,132,37547~r~r0110,133,37548~n~r032,134,37549~ ~r0102,135,37550~f~r0117,136,37551~'
-script += 'u~r0108,137,37552~l~r138,37553~l~r032,139,37554~ ~r0111,140,37555~o~r0102,141,37556~f~r032,142,37557~'
-script += ' ~r098,143,37558~b~r0105,144,37559~i~r0111,145,37560~o~r0108,146,37561~l~r0117,147,37562~u~r0109,148,37563~'
-script += 'm~r0105,149,37564~i~r0110,150,37565~n~r0101,151,37566~e~r0115,152,37567~s~r099,153,37568~c~r0101,154,37569~'
-script += 'e~r0110,155,37570~n~r0116,156,37571~t~r032,157,37572~ ~r0109,158,37573~m~r0111,159,37574~o~r0115,160,37575~'
-script += 's~r161,37576~s~r046,162,37577~.~r032,163,37578~ ~r164,37579~ ~r084,165,37580~T~r0104,166,37581~h~r0101,167,37582~'
-script += 'e~r032,168,37583~ ~r099,169,37584~c~r097,170,37585~a~r0118,171,37586~v~r0101,172,37587~e~r0114,173,37588~'
-script += 'r~r0110,174,37589~n~r032,175,37590~ ~r0101,176,37591~e~r0120,177,37592~x~r0116,178,37593~t~r0101,179,37594~'
-script += 'e~r0110,180,37595~n~r0100,181,37596~d~r0115,182,37597~s~r032,183,37598~ ~r0116,184,37599~t~r0111,185,37600~'
-script += 'o~r032,186,37601~ ~r0116,187,37602~t~r0104,188,37603~h~r0101,189,37604~e~r032,190,37605~ ~r0119,191,37606~'
-script += 'w~r0101,192,37607~e~r0115,193,37608~s~r0116,194,37609~t~r046,195,37610~.~r07514,10,34,4101,50,60~\n~r010,19212,29212,327456,426,51531,627455~'
-script += '\n~r084,327457~T~r0104,327458~h~r0105,327459~i~r0110,327460~n~r0103,327461~g~r0115,327462~s~r032,327463~'
-script += ' ~r0111,327464~o~r0102,327465~f~r032,327466~ ~r0105,327467~i~r0110,327468~n~r0116,327469~t~r0101,327470~'
-script += 'e~r0114,327471~r~r0101,327472~e~r0115,327473~s~r0116,327474~t~r032,327475~ ~r0104,327476~h~r0101,327477~'
-script += 'e~r0114,327478~r~r0101,327479~e~r058,327480~:~r010,327481~\n~r018206,11,22357,31,416,55893,627381~- '
-script += '~r0101,10,318207,413,51528,618206~e~r0109,11,318208~m~r0112,12,318209~p~r0116,13,318210~t~r0121,14,318211~'
-script += 'y~r032,15,318212~ ~r0108,16,318213~l~r097,17,318214~a~r0110,18,318215~n~r0116,19,318216~t~r0101,110,318217~'
-script += 'e~r0114,111,318218~r~r0110,112,318219~n~r018206,11,31,416,55893,627381~\n~r01,10,21,34,4101,50,60~\n'
-script += 'There is ~r049,110,210,332767,449,51~1~r01,10,21,34,4101,50~ exit:\n~r07611,326945,41,55814,626944~-'
-script += ' ~r0119,37612,44,51528,67611~w~r0101,11,37613~e~r0115,12,37614~s~r0116,13,37615~t~r07611,10,326945,41,55814,626944~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~t~r025976,4116,51~a~r025977,497,52~k~r025978,4107,53~e~r025979,4101,54~ ~r025980,432,55~e~r025981,4101,56~'
-script += 'm~r025982,4109,57~p~r025983,4112,58~t~r025984,4116,59~y~r025985,4121,510~ ~r025986,432,511~l~r025987,4108,512~'
-script += 'a~r025988,497,513~n~r025989,4110,514~t~r025990,4116,515~e~r025991,4101,516~r~r025992,4114,517~n~r025993,4110,518~'
-script += '\n~r032,20,34,4101,50~~moutput~\n\n~r084,114065,214065,328055,47,51531,628054~~v26740~T~r097,328056~'
-script += 'a~r0107,328057~k~r0101,328058~e~r0110,328059~n~r046,328060~.~r010,328061~\n~r132613,232613,327415,417,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~w~r025976,4119,51~e~r025977,4101,52~'
-script += 's~r025978,4115,53~t~r025979,4116,54~\n~r032,24,313,4101,50~~moutput~\n\n~r02352,10,20,34~~v27322352~'
-script += '== ~r077,37271,411,51528,67270~M~r0111,11,37272~o~r0115,12,37273~s~r13,37274~s~r032,14,37275~ ~r099,15,37276~'
-script += 'c~r097,16,37277~a~r0118,17,37278~v~r0101,18,37279~e~r0114,19,37280~r~r0110,110,37281~n~r07270,10,34,4101,50,60~'
-script += ' ==\n~r089,37283,4209,51528,67282~Y~r0111,11,37284~o~r0117,12,37285~u~r032,13,37286~ ~r097,14,37287~'
-script += 'a~r0114,15,37288~r~r0101,16,37289~e~r032,17,37290~ ~r0115,18,37291~s~r0116,19,37292~t~r097,110,37293~'
-script += 'a~r0110,111,37294~n~r0100,112,37295~d~r0105,113,37296~i~r0110,114,37297~n~r0103,115,37298~g~r032,116,37299~'
-script += ' ~r0105,117,37300~i~r0110,118,37301~n~r032,119,37302~ ~r097,120,37303~a~r032,121,37304~ ~r0108,122,37305~'
-script += 'l~r097,123,37306~a~r0114,124,37307~r~r0103,125,37308~g~r0101,126,37309~e~r032,127,37310~ ~r099,128,37311~'
-script += 'c~r097,129,37312~a~r0118,130,37313~v~r0101,131,37314~e~r0114,132,37315~r~r0110,133,37316~n~r032,134,37317~'
-script += ' ~r0102,135,37318~f~r0117,136,37319~u~r0108,137,37320~l~r138,37321~l~r032,139,37322~ ~r0111,140,37323~'
-script += 'o~r0102,141,37324~f~r032,142,37325~ ~r098,143,37326~b~r0105,144,37327~i~r0111,145,37328~o~r0108,146,37329~'
-script += 'l~r0117,147,37330~u~r0109,148,37331~m~r0105,149,37332~i~r0110,150,37333~n~r0101,151,37334~e~r0115,152,37335~'
-script += 's~r099,153,37336~c~r0101,154,37337~e~r0110,155,37338~n~r0116,156,37339~t~r032,157,37340~ ~r0109,158,37341~'
-script += 'm~r0111,159,37342~o~r0115,160,37343~s~r161,37344~s~r046,162,37345~.~r032,163,37346~ ~r164,37347~ ~r073,165,37348~'
-script += 'I~r0116,166,37349~t~r032,167,37350~ ~r0109,168,37351~m~r0117,169,37352~u~r0115,170,37353~s~r0116,171,37354~'
-script += 't~r032,172,37355~ ~r0104,173,37356~h~r097,174,37357~a~r0118,175,37358~v~r0101,176,37359~e~r032,177,37360~'
-script += ' ~r098,178,37361~b~r0114,179,37362~r~r0111,180,37363~o~r0107,181,37364~k~r0101,182,37365~e~r0110,183,37366~'
-script += 'n~r032,184,37367~ ~r0121,185,37368~y~r0111,186,37369~o~r0117,187,37370~u~r0114,188,37371~r~r032,189,37372~'
-script += ' ~r0102,190,37373~f~r097,191,37374~a~r0108,192,37375~l~r193,37376~l~r033,194,37377~!~r032,195,37378~'
-script += ' ~r196,37379~ ~r084,197,37380~T~r0104,198,37381~h~r0101,199,37382~e~r032,1100,37383~ ~r099,1101,37384~'
-script += 'c~r097,1102,37385~a~r0118,1103,37386~v~r0101,1104,37387~e~r0114,1105,37388~r~r0110,1106,37389~n~r032,1107,37390~'
-script += ' ~r0101,1108,37391~e~r0120,1109,37392~x~r0116,1110,37393~t~r0101,1111,37394~e~r0110,1112,37395~n~r0100,1113,37396~'
-script += 'd~r0115,1114,37397~s~r032,1115,37398~ ~r0116,1116,37399~t~r0111,1117,37400~o~r032,1118,37401~ ~r0116,1119,37402~'
-script += 't~r0104,1120,37403~h~r0101,1121,37404~e~r032,1122,37405~ ~r0101,1123,37406~e~r097,1124,37407~a~r0115,1125,37408~'
-script += 's~r0116,1126,37409~t~r032,1127,37410~ ~r097,1128,37411~a~r0110,1129,37412~n~r0100,1130,37413~d~r032,1131,37414~'
-script += ' ~r0119,1132,37415~w~r0101,1133,37416~e~r0115,1134,37417~s~r0116,1135,37418~t~r059,1136,37419~;~r032,1137,37420~'
-script += ' ~r097,1138,37421~a~r0116,1139,37422~t~r032,1140,37423~ ~r0116,1141,37424~t~r0104,1142,37425~h~r0101,1143,37426~'
-script += 'e~r032,1144,37427~ ~r0119,1145,37428~w~r0101,1146,37429~e~r0115,1147,37430~s~r0116,1148,37431~t~r032,1149,37432~'
-script += ' ~r0101,1150,37433~e~r0110,1151,37434~n~r0100,1152,37435~d~r044,1153,37436~,~r032,1154,37437~ ~r0121,1155,37438~'
-script += 'y~r0111,1156,37439~o~r0117,1157,37440~u~r032,1158,37441~ ~r0116,1159,37442~t~r0104,1160,37443~h~r0105,1161,37444~'
-script += 'i~r0110,1162,37445~n~r0107,1163,37446~k~r032,1164,37447~ ~r0121,1165,37448~y~r0111,1166,37449~o~r0117,1167,37450~'
-script += 'u~r032,1168,37451~ ~r0115,1169,37452~s~r0101,1170,37453~e~r1171,37454~e~r032,1172,37455~ ~r097,1173,37456~'
-script += 'a~r032,1174,37457~ ~r0112,1175,37458~p~r097,1176,37459~a~r0115,1177,37460~s~r1178,37461~s~r097,1179,37462~'
-script += 'a~r0103,1180,37463~g~r0101,1181,37464~e~r032,1182,37465~ ~r0108,1183,37466~l~r0101,1184,37467~e~r097,1185,37468~'
-script += 'a~r0100,1186,37469~d~r0105,1187,37470~i~r0110,1188,37471~n~r0103,1189,37472~g~r032,1190,37473~ ~r0111,1191,37474~'
-script += 'o~r0117,1192,37475~u~r0116,1193,37476~t~r032,1194,37477~ ~r0111,1195,37478~o~r0102,1196,37479~f~r032,1197,37480~'
-script += ' ~r0116,1198,37481~t~r0104,1199,37482~h~r0101,1200,37483~e~r032,1201,37484~ ~r099,1202,37485~c~r097,1203,37486~'
-script += 'a~r0118,1204,37487~v~r0101,1205,37488~e~r0114,1206,37489~r~r0110,1207,37490~n~r046,1208,37491~.~r07282,10,34,4101,50,60~'
-script += '\n~r02~\nThere are ~r050,110,210,332766,450,51~2~r02,10,20,34,4101,50~ exits:\n~r07492,326939,42,55814,626938~'
-script += '- ~r0119,37493,44,51528,67492~w~r0101,11,37494~e~r0115,12,37495~s~r0116,13,37496~t~r07492,10,326939,42,55814,626938~'
-script += '\n~r07497,11,326940~- ~r0101,10,37498,44,51528,67497~e~r097,11,37499~a~r0115,12,37500~s~r0116,13,37501~'
-script += 't~r07497,11,326940,42,55814,626938~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~w~r025976,4119,51~e~r025977,4101,52~s~r025978,4115,53~'
-script += 't~r025979,4116,54~\n~r032,20,34,4101,50~~moutput~\n\n~r02362,10~~v27322362~== ~r077,37617,411,51528,67616~'
-script += 'M~r0111,11,37618~o~r0115,12,37619~s~r13,37620~s~r032,14,37621~ ~r099,15,37622~c~r097,16,37623~a~r0118,17,37624~'
-script += 'v~r0101,18,37625~e~r0114,19,37626~r~r0110,110,37627~n~r07616,10,34,4101,50,60~ ==\n~r089,37629,4157,51528,67628~'
-script += 'Y~r0111,11,37630~o~r0117,12,37631~u~r032,13,37632~ ~r097,14,37633~a~r0114,15,37634~r~r0101,16,37635~'
-script += 'e~r032,17,37636~ ~r0115,18,37637~s~r0116,19,37638~t~r097,110,37639~a~r0110,111,37640~n~r0100,112,37641~'
-script += 'd~r0105,113,37642~i~r0110,114,37643~n~r0103,115,37644~g~r032,116,37645~ ~r0105,117,37646~i~r0110,118,37647~'
-script += 'n~r032,119,37648~ ~r097,120,37649~a~r032,121,37650~ ~r0108,122,37651~l~r097,123,37652~a~r0114,124,37653~'
-script += 'r~r0103,125,37654~g~r0101,126,37655~e~r032,127,37656~ ~r099,128,37657~c~r097,129,37658~a~r0118,130,37659~'
-script += 'v~r0101,131,37660~e~r0114,132,37661~r~r0110,133,37662~n~r032,134,37663~ ~r0102,135,37664~f~r0117,136,37665~'
-script += 'u~r0108,137,37666~l~r138,37667~l~r032,139,37668~ ~r0111,140,37669~o~r0102,141,37670~f~r032,142,37671~'
-script += ' ~r098,143,37672~b~r0105,144,37673~i~r0111,145,37674~o~r0108,146,37675~l~r0117,147,37676~u~r0109,148,37677~'
-script += 'm~r0105,149,37678~i~r0110,150,37679~n~r0101,151,37680~e~r0115,152,37681~s~r099,153,37682~c~r0101,154,37683~'
-script += 'e~r0110,155,37684~n~r0116,156,37685~t~r032,157,37686~ ~r0109,158,37687~m~r0111,159,37688~o~r0115,160,37689~'
-script += 's~r161,37690~s~r046,162,37691~.~r032,163,37692~ ~r164,37693~ ~r084,165,37694~T~r0104,166,37695~h~r0101,167,37696~'
-script += 'e~r032,168,37697~ ~r099,169,37698~c~r097,170,37699~a~r0118,171,37700~v~r0101,172,37701~e~r0114,173,37702~'
-script += 'r~r0110,174,37703~n~r032,175,37704~ ~r0101,176,37705~e~r0120,177,37706~x~r0116,178,37707~t~r0101,179,37708~'
-script += 'e~r0110,180,37709~n~r0100,181,37710~d~r0115,182,37711~s~r032,183,37712~ ~r0116,184,37713~t~r0111,185,37714~'
-script += 'o~r032,186,37715~ ~r0116,187,37716~t~r0104,188,37717~h~r0101,189,37718~e~r032,190,37719~ ~r0101,191,37720~'
-script += 'e~r097,192,37721~a~r0115,193,37722~s~r0116,194,37723~t~r046,195,37724~.~r032,196,37725~ ~r197,37726~'
-script += ' ~r084,198,37727~T~r0104,199,37728~h~r0101,1100,37729~e~r0114,1101,37730~r~r0101,1102,37731~e~r032,1103,37732~'
-script += ' ~r0105,1104,37733~i~r0115,1105,37734~s~r032,1106,37735~ ~r097,1107,37736~a~r032,1108,37737~ ~r099,1109,37738~'
-script += 'c~r0114,1110,37739~r~r0101,1111,37740~e~r0118,1112,37741~v~r0105,1113,37742~i~r0115,1114,37743~s~r0101,1115,37744~'
-script += 'e~r032,1116,37745~ ~r0105,1117,37746~i~r0110,1118,37747~n~r032,1119,37748~ ~r0116,1120,37749~t~r0104,1121,37750~'
-script += 'h~r0101,1122,37751~e~r032,1123,37752~ ~r0114,1124,37753~r~r0111,1125,37754~o~r099,1126,37755~c~r0107,1127,37756~'
-script += 'k~r0115,1128,37757~s~r032,1129,37758~ ~r0119,1130,37759~w~r0104,1131,37760~h~r0105,1132,37761~i~r099,1133,37762~'
-script += 'c~r0104,1134,37763~h~r032,1135,37764~ ~r0111,1136,37765~o~r0112,1137,37766~p~r0101,1138,37767~e~r0110,1139,37768~'
-script += 'n~r0115,1140,37769~s~r032,1141,37770~ ~r0105,1142,37771~i~r0110,1143,37772~n~r0116,1144,37773~t~r0111,1145,37774~'
-script += 'o~r032,1146,37775~ ~r097,1147,37776~a~r032,1148,37777~ ~r0112,1149,37778~p~r097,1150,37779~a~r0115,1151,37780~'
-script += 's~r1152,37781~s~r097,1153,37782~a~r0103,1154,37783~g~r0101,1155,37784~e~r046,1156,37785~.~r07628,10,34,4101,50,60~'
-script += '\n~r02~\nThere are ~r050,110,210,332766,450,51~2~r02,10,20,34,4101,50~ exits:\n~r07786,326949,42,55814,626948~'
-script += '- ~r0101,37787,44,51528,67786~e~r097,11,37788~a~r0115,12,37789~s~r0116,13,37790~t~r07786,10,326949,42,55814,626948~'
-script += '\n~r07791,11,326950~- ~r0112,10,37792,47,51528,67791~p~r097,11,37793~a~r0115,12,37794~s~r13,37795~s~r097,14,37796~'
-script += 'a~r0103,15,37797~g~r0101,16,37798~e~r07791,11,326950,42,55814,626948~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~p~r025976,4112,51~a~r025977,497,52~'
-script += 's~r025978,4115,53~s~r025979,54~a~r025980,497,55~g~r025981,4103,56~e~r025982,4101,57~\n~r032,20,34,50~'
-script += '~moutput~\n\n~r02367,10,37~~v27322367~== ~r080,37800,47,51528,67799~P~r097,11,37801~a~r0115,12,37802~'
-script += 's~r13,37803~s~r097,14,37804~a~r0103,15,37805~g~r0101,16,37806~e~r07799,10,37,4101,50,60~ ==\n~r089,37808,4176,51528,67807~'
-script += 'Y~r0111,11,37809~o~r0117,12,37810~u~r032,13,37811~ ~r097,14,37812~a~r0114,15,37813~r~r0101,16,37814~'
-script += 'e~r032,17,37815~ ~r0105,18,37816~i~r0110,19,37817~n~r032,110,37818~ ~r097,111,37819~a~r032,112,37820~'
-script += ' ~r099,113,37821~c~r0114,114,37822~r~r0101,115,37823~e~r0118,116,37824~v~r0105,117,37825~i~r0115,118,37826~'
-script += 's~r0101,119,37827~e~r032,120,37828~ ~r0111,121,37829~o~r0110,122,37830~n~r032,123,37831~ ~r0116,124,37832~'
-script += 't~r0104,125,37833~h~r0101,126,37834~e~r032,127,37835~ ~r0119,128,37836~w~r0101,129,37837~e~r0115,130,37838~'
-script += 's~r0116,131,37839~t~r032,132,37840~ ~r0119,133,37841~w~r097,134,37842~a~r0108,135,37843~l~r136,37844~'
-script += 'l~r032,137,37845~ ~r0111,138,37846~o~r0102,139,37847~f~r032,140,37848~ ~r0116,141,37849~t~r0104,142,37850~'
-script += 'h~r0101,143,37851~e~r032,144,37852~ ~r0109,145,37853~m~r0111,146,37854~o~r0115,147,37855~s~r148,37856~'
-script += 's~r032,149,37857~ ~r099,150,37858~c~r097,151,37859~a~r0118,152,37860~v~r0101,153,37861~e~r0114,154,37862~'
-script += 'r~r0110,155,37863~n~r046,156,37864~.~r032,157,37865~ ~r158,37866~ ~r065,159,37867~A~r032,160,37868~ '
-script += '~r0100,161,37869~d~r097,162,37870~a~r0114,163,37871~r~r0107,164,37872~k~r032,165,37873~ ~r0112,166,37874~'
-script += 'p~r097,167,37875~a~r0115,168,37876~s~r169,37877~s~r097,170,37878~a~r0103,171,37879~g~r0101,172,37880~'
-script += 'e~r032,173,37881~ ~r0108,174,37882~l~r0101,175,37883~e~r097,176,37884~a~r0100,177,37885~d~r0115,178,37886~'
-script += 's~r032,179,37887~ ~r0102,180,37888~f~r0117,181,37889~u~r0114,182,37890~r~r0116,183,37891~t~r0104,184,37892~'
-script += 'h~r0101,185,37893~e~r0114,186,37894~r~r032,187,37895~ ~r0119,188,37896~w~r0101,189,37897~e~r0115,190,37898~'
-script += 's~r0116,191,37899~t~r046,192,37900~.~r032,193,37901~ ~r194,37902~ ~r084,195,37903~T~r0104,196,37904~'
-script += 'h~r0101,197,37905~e~r0114,198,37906~r~r0101,199,37907~e~r032,1100,37908~ ~r0105,1101,37909~i~r0115,1102,37910~'
-script += 's~r032,1103,37911~ ~r097,1104,37912~a~r032,1105,37913~ ~r0108,1106,37914~l~r097,1107,37915~a~r0100,1108,37916~'
-script += 'd~r1109,37917~d~r0101,1110,37918~e~r0114,1111,37919~r~r032,1112,37920~ ~r0104,1113,37921~h~r0101,1114,37922~'
-script += 'e~r0114,1115,37923~r~r0101,1116,37924~e~r032,1117,37925~ ~r0119,1118,37926~w~r0104,1119,37927~h~r0105,1120,37928~'
-script += 'i~r099,1121,37929~c~r0104,1122,37930~h~r032,1123,37931~ ~r0108,1124,37932~l~r0101,1125,37933~e~r097,1126,37934~'
-script += 'a~r0100,1127,37935~d~r0115,1128,37936~s~r032,1129,37937~ ~r0100,1130,37938~d~r0111,1131,37939~o~r0119,1132,37940~'
-script += 'w~r0110,1133,37941~n~r032,1134,37942~ ~r0105,1135,37943~i~r0110,1136,37944~n~r0116,1137,37945~t~r0111,1138,37946~'
-script += 'o~r032,1139,37947~ ~r097,1140,37948~a~r032,1141,37949~ ~r0115,1142,37950~s~r0109,1143,37951~m~r097,1144,37952~'
-script += 'a~r0108,1145,37953~l~r1146,37954~l~r0101,1147,37955~e~r0114,1148,37956~r~r044,1149,37957~,~r032,1150,37958~'
-script += ' ~r0109,1151,37959~m~r0111,1152,37960~o~r0115,1153,37961~s~r1154,37962~s~r045,1155,37963~-~r0102,1156,37964~'
-script += 'f~r0105,1157,37965~i~r0108,1158,37966~l~r1159,37967~l~r0101,1160,37968~e~r0100,1161,37969~d~r032,1162,37970~'
-script += ' ~r099,1163,37971~c~r097,1164,37972~a~r0118,1165,37973~v~r0101,1166,37974~e~r0114,1167,37975~r~r0110,1168,37976~'
-script += 'n~r032,1169,37977~ ~r098,1170,37978~b~r0101,1171,37979~e~r0108,1172,37980~l~r0111,1173,37981~o~r0119,1174,37982~'
-script += 'w~r046,1175,37983~.~r07807,10,37,4101,50,60~\n~r03~\nThere are ~r051,110,210,332765,451,51~3~r03,10,20,37,4101,50~'
-script += ' exits:\n~r07984,326955,43,55814,626954~- ~r099,37985,46,51528,67984~c~r097,11,37986~a~r0118,12,37987~'
-script += 'v~r0101,13,37988~e~r0114,14,37989~r~r0110,15,37990~n~r07984,10,326955,43,55814,626954~\n~r07991,11,326956~'
-script += '- ~r0108,10,37992,46,51528,67991~l~r097,11,37993~a~r0100,12,37994~d~r13,37995~d~r0101,14,37996~e~r0114,15,37997~'
-script += 'r~r07991,11,326956,43,55814,626954~\n~r07998,12,326957~- ~r0100,10,37999,48,51528,67998~d~r097,11,38000~'
-script += 'a~r0114,12,38001~r~r0107,13,38002~k~r0110,14,38003~n~r0101,15,38004~e~r0115,16,38005~s~r17,38006~s~r07998,12,326957,43,55814,626954~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~l~r025976,4108,51~a~r025977,497,52~d~r025978,4100,53~d~r025979,54~e~r025980,4101,55~r~r025981,4114,56~'
-script += '\n~r032,20,37,4101,50~~moutput~\n\n~r02377,10,36~~v27322377~== ~r084,38164,415,51528,68163~T~r0119,11,38165~'
-script += 'w~r0105,12,38166~i~r0115,13,38167~s~r0116,14,38168~t~r0121,15,38169~y~r032,16,38170~ ~r0112,17,38171~'
-script += 'p~r097,18,38172~a~r0115,19,38173~s~r110,38174~s~r097,111,38175~a~r0103,112,38176~g~r0101,113,38177~e'
-script += '~r0115,114,38178~s~r08163,10,36,4101,50,60~ ==\n~r089,38180,4123,51528,68179~Y~r0111,11,38181~o~r0117,12,38182~'
-script += 'u~r032,13,38183~ ~r097,14,38184~a~r0114,15,38185~r~r0101,16,38186~e~r032,17,38187~ ~r0105,18,38188~i'
-script += '~r0110,19,38189~n~r032,110,38190~ ~r097,111,38191~a~r032,112,38192~ ~r0109,113,38193~m~r097,114,38194~'
-script += 'a~r0122,115,38195~z~r0101,116,38196~e~r032,117,38197~ ~r0111,118,38198~o~r0102,119,38199~f~r032,120,38200~'
-script += ' ~r0116,121,38201~t~r0119,122,38202~w~r0105,123,38203~i~r0115,124,38204~s~r0116,125,38205~t~r0121,126,38206~'
-script += 'y~r032,127,38207~ ~r0108,128,38208~l~r0105,129,38209~i~r0116,130,38210~t~r131,38211~t~r0108,132,38212~'
-script += 'l~r0101,133,38213~e~r032,134,38214~ ~r0112,135,38215~p~r097,136,38216~a~r0115,137,38217~s~r138,38218~'
-script += 's~r097,139,38219~a~r0103,140,38220~g~r0101,141,38221~e~r0115,142,38222~s~r044,143,38223~,~r032,144,38224~'
-script += ' ~r097,145,38225~a~r0108,146,38226~l~r147,38227~l~r032,148,38228~ ~r0100,149,38229~d~r0105,150,38230~'
-script += 'i~r0109,151,38231~m~r0108,152,38232~l~r0121,153,38233~y~r032,154,38234~ ~r0108,155,38235~l~r0105,156,38236~'
-script += 'i~r0116,157,38237~t~r032,158,38238~ ~r098,159,38239~b~r0121,160,38240~y~r032,161,38241~ ~r0109,162,38242~'
-script += 'm~r0111,163,38243~o~r0114,164,38244~r~r0101,165,38245~e~r032,166,38246~ ~r098,167,38247~b~r0105,168,38248~'
-script += 'i~r0111,169,38249~o~r0108,170,38250~l~r0117,171,38251~u~r0109,172,38252~m~r0105,173,38253~i~r0110,174,38254~'
-script += 'n~r0101,175,38255~e~r0115,176,38256~s~r099,177,38257~c~r0101,178,38258~e~r0110,179,38259~n~r0116,180,38260~'
-script += 't~r032,181,38261~ ~r0109,182,38262~m~r0111,183,38263~o~r0115,184,38264~s~r185,38265~s~r046,186,38266~'
-script += '.~r032,187,38267~ ~r188,38268~ ~r084,189,38269~T~r0104,190,38270~h~r0101,191,38271~e~r0114,192,38272~'
-script += 'r~r0101,193,38273~e~r032,194,38274~ ~r0105,195,38275~i~r0115,196,38276~s~r032,197,38277~ ~r097,198,38278~'
-script += 'a~r032,199,38279~ ~r0108,1100,38280~l~r097,1101,38281~a~r0100,1102,38282~d~r1103,38283~d~r0101,1104,38284~'
-script += 'e~r0114,1105,38285~r~r032,1106,38286~ ~r0104,1107,38287~h~r0101,1108,38288~e~r0114,1109,38289~r~r0101,1110,38290~'
-script += 'e~r032,1111,38291~ ~r0108,1112,38292~l~r0101,1113,38293~e~r097,1114,38294~a~r0100,1115,38295~d~r0105,1116,38296~'
-script += 'i~r0110,1117,38297~n~r0103,1118,38298~g~r032,1119,38299~ ~r0117,1120,38300~u~r0112,1121,38301~p~r046,1122,38302~'
-script += '.~r08179,10,36,4101,50,60~\n~r05~\nThere are ~r053,110,210,332763,453,51~5~r05,10,20,36,4101,50~ exi'
-script += 'ts:\n~r08303,326972,45,55814,626971~- ~r0108,38304,46,51528,68303~l~r097,11,38305~a~r0100,12,38306~d'
-script += '~r13,38307~d~r0101,14,38308~e~r0114,15,38309~r~r08303,10,326972,45,55814,626971~\n~r08310,11,326973~'
-script += '- ~r0110,10,38311,51528,68310~n~r0111,11,38312~o~r0114,12,38313~r~r0116,13,38314~t~r0104,14,38315~h~r08310,11,326973,55814,626971~'
-script += '\n~r08316,12,326974~- ~r0115,10,38317,51528,68316~s~r0111,11,38318~o~r0117,12,38319~u~r0116,13,38320~'
-script += 't~r0104,14,38321~h~r08316,12,326974,55814,626971~\n~r08322,13,326975~- ~r0101,10,38323,44,51528,68322~'
-script += 'e~r097,11,38324~a~r0115,12,38325~s~r0116,13,38326~t~r08322,326975,45,55814,626971~\n~r08327,14,326976~'
-script += '- ~r0119,10,38328,44,51528,68327~w~r0101,11,38329~e~r0115,12,38330~s~r0116,13,38331~t~r08327,14,326976,45,55814,626971~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~w~r025976,4119,51~e~r025977,4101,52~s~r025978,4115,53~t~r025979,4116,54~\n~r032,20,36,4101,50~'
-script += '~moutput~\n\n~r02397,10,34~~v27322397~== ~r084,38674,415,51528,68673~T~r0119,11,38675~w~r0105,12,38676~'
-script += 'i~r0115,13,38677~s~r0116,14,38678~t~r0121,15,38679~y~r032,16,38680~ ~r0112,17,38681~p~r097,18,38682~'
-script += 'a~r0115,19,38683~s~r110,38684~s~r097,111,38685~a~r0103,112,38686~g~r0101,113,38687~e~r0115,114,38688~'
-script += 's~r08673,10,34,4101,50,60~ ==\n~r089,38690,455,51528,68689~Y~r0111,11,38691~o~r0117,12,38692~u~r032,13,38693~'
-script += ' ~r097,14,38694~a~r0114,15,38695~r~r0101,16,38696~e~r032,17,38697~ ~r0105,18,38698~i~r0110,19,38699~'
-script += 'n~r032,110,38700~ ~r097,111,38701~a~r032,112,38702~ ~r0108,113,38703~l~r0105,114,38704~i~r0116,115,38705~'
-script += 't~r116,38706~t~r0108,117,38707~l~r0101,118,38708~e~r032,119,38709~ ~r0109,120,38710~m~r097,121,38711~'
-script += 'a~r0122,122,38712~z~r0101,123,38713~e~r032,124,38714~ ~r0111,125,38715~o~r0102,126,38716~f~r032,127,38717~'
-script += ' ~r0116,128,38718~t~r0119,129,38719~w~r0105,130,38720~i~r0115,131,38721~s~r0116,132,38722~t~r0121,133,38723~'
-script += 'y~r032,134,38724~ ~r0112,135,38725~p~r097,136,38726~a~r0115,137,38727~s~r138,38728~s~r097,139,38729~'
-script += 'a~r0103,140,38730~g~r0101,141,38731~e~r0115,142,38732~s~r044,143,38733~,~r032,144,38734~ ~r097,145,38735~'
-script += 'a~r0108,146,38736~l~r147,38737~l~r032,148,38738~ ~r097,149,38739~a~r0108,150,38740~l~r0105,151,38741~'
-script += 'i~r0107,152,38742~k~r0101,153,38743~e~r046,154,38744~.~r08689,10,34,4101,50,60~\n~r03~\nThere are ~r051,110,210,332765,451,51~'
-script += '3~r03,10,20,34,4101,50~ exits:\n~r08745,327010,43,55814,627009~- ~r0110,38746,45,51528,68745~n~r0111,11,38747~'
-script += 'o~r0114,12,38748~r~r0116,13,38749~t~r0104,14,38750~h~r08745,10,327010,43,55814,627009~\n~r08751,11,327011~'
-script += '- ~r0115,10,38752,45,51528,68751~s~r0111,11,38753~o~r0117,12,38754~u~r0116,13,38755~t~r0104,14,38756~'
-script += 'h~r08751,11,327011,43,55814,627009~\n~r08757,12,327012~- ~r0101,10,38758,44,51528,68757~e~r097,11,38759~'
-script += 'a~r0115,12,38760~s~r0116,13,38761~t~r08757,12,327012,43,55814,627009~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~s~r025976,4115,51~o~r025977,4111,52~'
-script += 'u~r025978,4117,53~t~r025979,4116,54~h~r025980,4104,55~\n~r032,20,34,4101,50~~moutput~\n\n~r02402,10,35~'
-script += '~v27322402~== ~r084,38763,415,51528,68762~T~r0119,11,38764~w~r0105,12,38765~i~r0115,13,38766~s~r0116,14,38767~'
-script += 't~r0121,15,38768~y~r032,16,38769~ ~r0112,17,38770~p~r097,18,38771~a~r0115,19,38772~s~r110,38773~s~r097,111,38774~'
-script += 'a~r0103,112,38775~g~r0101,113,38776~e~r0115,114,38777~s~r08762,10,35,4101,50,60~ ==\n~r089,38779,4131,51528,68778~'
-script += 'Y~r0111,11,38780~o~r0117,12,38781~u~r032,13,38782~ ~r097,14,38783~a~r0114,15,38784~r~r0101,16,38785~'
-script += 'e~r032,17,38786~ ~r0105,18,38787~i~r0110,19,38788~n~r032,110,38789~ ~r097,111,38790~a~r032,112,38791~'
-script += ' ~r0116,113,38792~t~r0119,114,38793~w~r0105,115,38794~i~r0115,116,38795~s~r0116,117,38796~t~r0121,118,38797~'
-script += 'y~r032,119,38798~ ~r097,120,38799~a~r0108,121,38800~l~r0105,122,38801~i~r0107,123,38802~k~r0101,124,38803~'
-script += 'e~r032,125,38804~ ~r0111,126,38805~o~r0102,127,38806~f~r032,128,38807~ ~r0108,129,38808~l~r0105,130,38809~'
-script += 'i~r0116,131,38810~t~r132,38811~t~r0108,133,38812~l~r0101,134,38813~e~r032,135,38814~ ~r0112,136,38815~'
-script += 'p~r097,137,38816~a~r0115,138,38817~s~r139,38818~s~r097,140,38819~a~r0103,141,38820~g~r0101,142,38821~'
-script += 'e~r0115,143,38822~s~r044,144,38823~,~r032,145,38824~ ~r097,146,38825~a~r0108,147,38826~l~r148,38827~'
-script += 'l~r032,149,38828~ ~r0109,150,38829~m~r097,151,38830~a~r0122,152,38831~z~r0101,153,38832~e~r046,154,38833~'
-script += '.~r010,155,38834~\n~r156,38835~\n~r084,157,38836~T~r0104,158,38837~h~r0101,159,38838~e~r032,160,38839~'
-script += ' ~r0101,161,38840~e~r097,162,38841~a~r0115,163,38842~s~r0116,164,38843~t~r032,165,38844~ ~r0112,166,38845~'
-script += 'p~r097,167,38846~a~r0115,168,38847~s~r169,38848~s~r097,170,38849~a~r0103,171,38850~g~r0101,172,38851~'
-script += 'e~r032,173,38852~ ~r097,174,38853~a~r0112,175,38854~p~r176,38855~p~r0101,177,38856~e~r097,178,38857~'
-script += 'a~r0114,179,38858~r~r0115,180,38859~s~r032,181,38860~ ~r0118,182,38861~v~r0101,183,38862~e~r0114,184,38863~'
-script += 'r~r0121,185,38864~y~r032,186,38865~ ~r0100,187,38866~d~r097,188,38867~a~r0114,189,38868~r~r0107,190,38869~'
-script += 'k~r059,191,38870~;~r032,192,38871~ ~r0121,193,38872~y~r0111,194,38873~o~r0117,195,38874~u~r032,196,38875~'
-script += ' ~r0102,197,38876~f~r0101,198,38877~e~r199,38878~e~r0108,1100,38879~l~r032,1101,38880~ ~r0108,1102,38881~'
-script += 'l~r0105,1103,38882~i~r0107,1104,38883~k~r0101,1105,38884~e~r0108,1106,38885~l~r0121,1107,38886~y~r032,1108,38887~'
-script += ' ~r0116,1109,38888~t~r0111,1110,38889~o~r032,1111,38890~ ~r098,1112,38891~b~r0101,1113,38892~e~r032,1114,38893~'
-script += ' ~r0101,1115,38894~e~r097,1116,38895~a~r0116,1117,38896~t~r0101,1118,38897~e~r0110,1119,38898~n~r032,1120,38899~'
-script += ' ~r098,1121,38900~b~r0121,1122,38901~y~r032,1123,38902~ ~r097,1124,38903~a~r032,1125,38904~ ~r071,1126,38905~'
-script += 'G~r0114,1127,38906~r~r0117,1128,38907~u~r0101,1129,38908~e~r046,1130,38909~.~r08778,10,35,4101,50,60~'
-script += '\n~r04~\nThere are ~r052,110,210,332764,452,51~4~r04,10,20,35,4101,50~ exits:\n~r08910,327018,44,55814,627017~'
-script += '- ~r0110,38911,45,51528,68910~n~r0111,11,38912~o~r0114,12,38913~r~r0116,13,38914~t~r0104,14,38915~h~r08910,10,327018,44,55814,627017~'
-script += '\n~r08916,11,327019~- ~r0115,10,38917,45,51528,68916~s~r0111,11,38918~o~r0117,12,38919~u~r0116,13,38920~'
-script += 't~r0104,14,38921~h~r08916,11,327019,44,55814,627017~\n~r08922,12,327020~- ~r0119,10,38923,51528,68922~'
-script += 'w~r0101,11,38924~e~r0115,12,38925~s~r0116,13,38926~t~r08922,12,327020,55814,627017~\n~r08927,13,327021~'
-script += '- ~r0101,10,38928,51528,68927~e~r097,11,38929~a~r0115,12,38930~s~r0116,13,38931~t~r08927,327021,55814,627017~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '# This shows the fifth code in the ruins\n~minput~n~r025976,4110,51~o~r025977,4111,52~r~r025978,4114,53~'
-script += 't~r025979,4116,54~h~r025980,4104,55~\n~r032,20,35,4101,50~~moutput~\n\n~r067,130181,230181,328237,462,51531,628236~'
-script += '~v27322412~C~r0104,328238~h~r0105,328239~i~r0115,328240~s~r0101,328241~e~r0108,328242~l~r0101,328243~'
-script += 'e~r0100,328244~d~r032,328245~ ~r0111,328246~o~r0110,328247~n~r032,328248~ ~r0116,328249~t~r0104,328250~'
-script += 'h~r0101,328251~e~r032,328252~ ~r0119,328253~w~r097,328254~a~r0108,328255~l~r328256~l~r032,328257~ ~r0111,328258~'
-script += 'o~r0102,328259~f~r032,328260~ ~r0111,328261~o~r0110,328262~n~r0101,328263~e~r032,328264~ ~r0111,328265~'
-script += 'o~r0102,328266~f~r032,328267~ ~r0116,328268~t~r0104,328269~h~r0101,328270~e~r032,328271~ ~r0112,328272~'
-script += 'p~r097,328273~a~r0115,328274~s~r328275~s~r097,328276~a~r0103,328277~g~r0101,328278~e~r0119,328279~w~r097,328280~'
-script += 'a~r0121,328281~y~r0115,328282~s~r044,328283~,~r032,328284~ ~r0121,328285~y~r0111,328286~o~r0117,328287~'
-script += 'u~r032,328288~ ~r0115,328289~s~r0101,328290~e~r328291~e~r058,328292~:~r010,328293~\n~r328294~\n~r032,328295~'
-script += ' ~r328296~ ~r328297~ ~r328298~ ~r0101,10,232767,36130,412,51528,66129~~mcode~e~r0109,11,36131~m~r066,12,36132~'
-script += 'B~r076,13,36133~L~r098,14,36134~b~r087,15,36135~W~r077,16,36136~M~r0103,17,36137~g~r068,18,36138~D~r0104,19,36139~'
-script += 'h~r0100,110,36140~d~r0115,111,36141~s~moutput~~r010,1738,2738,328304,443,51531,628303~\n~r328305~\n~r089,328306~'
-script += 'Y~r0111,328307~o~r0117,328308~u~r032,328309~ ~r0116,328310~t~r097,328311~a~r0107,328312~k~r0101,328313~'
-script += 'e~r032,328314~ ~r0110,328315~n~r0111,328316~o~r0116,328317~t~r0101,328318~e~r032,328319~ ~r0111,328320~'
-script += 'o~r0102,328321~f~r032,328322~ ~r0116,328323~t~r0104,328324~h~r0105,328325~i~r0115,328326~s~r032,328327~'
-script += ' ~r097,328328~a~r0110,328329~n~r0100,328330~d~r032,328331~ ~r0107,328332~k~r0101,328333~e~r328334~e~r0112,328335~'
-script += 'p~r032,328336~ ~r0119,328337~w~r097,328338~a~r0108,328339~l~r0107,328340~k~r0105,328341~i~r0110,328342~'
-script += 'n~r0103,328343~g~r046,328344~.~r010,328345~\n~r328346~\n~r02417,10,20,35,4101,50,60~~v27322417~== ~r084,39099,415,51528,69098~'
-script += 'T~r0119,11,39100~w~r0105,12,39101~i~r0115,13,39102~s~r0116,14,39103~t~r0121,15,39104~y~r032,16,39105~'
-script += ' ~r0112,17,39106~p~r097,18,39107~a~r0115,19,39108~s~r110,39109~s~r097,111,39110~a~r0103,112,39111~g~r0101,113,39112~'
-script += 'e~r0115,114,39113~s~r09098,10,35,4101,50,60~ ==\n~r089,39115,455,51528,69114~Y~r0111,11,39116~o~r0117,12,39117~'
-script += 'u~r032,13,39118~ ~r097,14,39119~a~r0114,15,39120~r~r0101,16,39121~e~r032,17,39122~ ~r0105,18,39123~i'
-script += '~r0110,19,39124~n~r032,110,39125~ ~r097,111,39126~a~r032,112,39127~ ~r0109,113,39128~m~r097,114,39129~'
-script += 'a~r0122,115,39130~z~r0101,116,39131~e~r032,117,39132~ ~r0111,118,39133~o~r0102,119,39134~f~r032,120,39135~'
-script += ' ~r0116,121,39136~t~r0119,122,39137~w~r0105,123,39138~i~r0115,124,39139~s~r0116,125,39140~t~r0121,126,39141~'
-script += 'y~r032,127,39142~ ~r0108,128,39143~l~r0105,129,39144~i~r0116,130,39145~t~r131,39146~t~r0108,132,39147~'
-script += 'l~r0101,133,39148~e~r032,134,39149~ ~r0112,135,39150~p~r097,136,39151~a~r0115,137,39152~s~r138,39153~'
-script += 's~r097,139,39154~a~r0103,140,39155~g~r0101,141,39156~e~r0115,142,39157~s~r044,143,39158~,~r032,144,39159~'
-script += ' ~r097,145,39160~a~r0108,146,39161~l~r147,39162~l~r032,148,39163~ ~r097,149,39164~a~r0108,150,39165~'
-script += 'l~r0105,151,39166~i~r0107,152,39167~k~r0101,153,39168~e~r046,154,39169~.~r09114,10,35,4101,50,60~\n~r010,19212,29212,327456,426,51531,627455~'
-script += '\n~r084,327457~T~r0104,327458~h~r0105,327459~i~r0110,327460~n~r0103,327461~g~r0115,327462~s~r032,327463~'
-script += ' ~r0111,327464~o~r0102,327465~f~r032,327466~ ~r0105,327467~i~r0110,327468~n~r0116,327469~t~r0101,327470~'
-script += 'e~r0114,327471~r~r0101,327472~e~r0115,327473~s~r0116,327474~t~r032,327475~ ~r0104,327476~h~r0101,327477~'
-script += 'e~r0114,327478~r~r0101,327479~e~r058,327480~:~r010,327481~\n~r018568,14,22417,31,416,55893,627381~- '
-script += '~r099,10,318569,43,51528,618568~c~r097,11,318570~a~r0110,12,318571~n~r018568,14,31,416,55893,627381~'
-script += '\n~r01,10,21,35,4101,50,60~\nThere is ~r049,110,210,332767,449,51~1~r01,10,21,35,4101,50~ exit:\n~r09170,327040,41,55814,627039~'
-script += '- ~r0119,39171,44,51528,69170~w~r0101,11,39172~e~r0115,12,39173~s~r0116,13,39174~t~r09170,10,327040,41,55814,627039~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~t~r025976,4116,51~a~r025977,497,52~k~r025978,4107,53~e~r025979,4101,54~ ~r025980,432,55~c~r025981,499,56~'
-script += 'a~r025982,497,57~n~r025983,4110,58~\n~r032,20,35,4101,50~~moutput~\n\n~r084,114065,214065,328055,47,51531,628054~'
-script += '~v26860~T~r097,328056~a~r0107,328057~k~r0101,328058~e~r0110,328059~n~r046,328060~.~r010,328061~\n~r132613,232613,327415,417,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~u~r025976,4117,51~s~r025977,4115,52~'
-script += 'e~r025978,4101,53~ ~r025979,432,54~c~r025980,499,55~a~r025981,497,56~n~r025982,4110,57~\n~r032,24,33,4101,50~'
-script += '~moutput~\n\n~r089,121104,221104,328454,456,51531,628453~~v267432767,26780,268632767~Y~r0111,328455~'
-script += 'o~r0117,328456~u~r032,328457~ ~r0102,328458~f~r0105,328459~i~r0108,328460~l~r328461~l~r032,328462~ ~r0121,328463~'
-script += 'y~r0111,328464~o~r0117,328465~u~r0114,328466~r~r032,328467~ ~r0108,328468~l~r097,328469~a~r0110,328470~'
-script += 'n~r0116,328471~t~r0101,328472~e~r0114,328473~r~r0110,328474~n~r032,328475~ ~r0119,328476~w~r0105,328477~'
-script += 'i~r0116,328478~t~r0104,328479~h~r032,328480~ ~r0111,328481~o~r0105,328482~i~r0108,328483~l~r046,328484~'
-script += '.~r032,328485~ ~r328486~ ~r073,328487~I~r0116,328488~t~r032,328489~ ~r0115,328490~s~r0101,328491~e~r328492~'
-script += 'e~r0109,328493~m~r0115,328494~s~r032,328495~ ~r0116,328496~t~r0111,328497~o~r032,328498~ ~r099,328499~'
-script += 'c~r0104,328500~h~r0101,328501~e~r328502~e~r0114,328503~r~r032,328504~ ~r0117,328505~u~r0112,328506~p'
-script += '~r033,328507~!~r010,328508~\n~r328509~\n~r132613,232613,327415,417,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~u~r025976,4117,51~s~r025977,4115,52~e~r025978,4101,53~'
-script += ' ~r025979,432,54~l~r025980,4108,55~a~r025981,497,56~n~r025982,4110,57~t~r025983,4116,58~e~r025984,4101,59~'
-script += 'r~r025985,4114,510~n~r025986,4110,511~\n~r032,23,33,4101,50~~moutput~\n\n~r089,115608,215608,328570,425,51531,628569~'
-script += '~v267832767,26820~Y~r0111,328571~o~r0117,328572~u~r032,328573~ ~r0108,328574~l~r0105,328575~i~r0103,328576~'
-script += 'g~r0104,328577~h~r0116,328578~t~r032,328579~ ~r0121,328580~y~r0111,328581~o~r0117,328582~u~r0114,328583~'
-script += 'r~r032,328584~ ~r0108,328585~l~r097,328586~a~r0110,328587~n~r0116,328588~t~r0101,328589~e~r0114,328590~'
-script += 'r~r0110,328591~n~r046,328592~.~r010,328593~\n~r328594~\n~r02417,10,23,37,4101,50,60~== ~r084,39099,415,51528,69098~'
-script += 'T~r0119,11,39100~w~r0105,12,39101~i~r0115,13,39102~s~r0116,14,39103~t~r0121,15,39104~y~r032,16,39105~'
-script += ' ~r0112,17,39106~p~r097,18,39107~a~r0115,19,39108~s~r110,39109~s~r097,111,39110~a~r0103,112,39111~g~r0101,113,39112~'
-script += 'e~r0115,114,39113~s~r09098,10,37,4101,50,60~ ==\n~r089,39115,455,51528,69114~Y~r0111,11,39116~o~r0117,12,39117~'
-script += 'u~r032,13,39118~ ~r097,14,39119~a~r0114,15,39120~r~r0101,16,39121~e~r032,17,39122~ ~r0105,18,39123~i'
-script += '~r0110,19,39124~n~r032,110,39125~ ~r097,111,39126~a~r032,112,39127~ ~r0109,113,39128~m~r097,114,39129~'
-script += 'a~r0122,115,39130~z~r0101,116,39131~e~r032,117,39132~ ~r0111,118,39133~o~r0102,119,39134~f~r032,120,39135~'
-script += ' ~r0116,121,39136~t~r0119,122,39137~w~r0105,123,39138~i~r0115,124,39139~s~r0116,125,39140~t~r0121,126,39141~'
-script += 'y~r032,127,39142~ ~r0108,128,39143~l~r0105,129,39144~i~r0116,130,39145~t~r131,39146~t~r0108,132,39147~'
-script += 'l~r0101,133,39148~e~r032,134,39149~ ~r0112,135,39150~p~r097,136,39151~a~r0115,137,39152~s~r138,39153~'
-script += 's~r097,139,39154~a~r0103,140,39155~g~r0101,141,39156~e~r0115,142,39157~s~r044,143,39158~,~r032,144,39159~'
-script += ' ~r097,145,39160~a~r0108,146,39161~l~r147,39162~l~r032,148,39163~ ~r097,149,39164~a~r0108,150,39165~'
-script += 'l~r0105,151,39166~i~r0107,152,39167~k~r0101,153,39168~e~r046,154,39169~.~r09114,10,37,4101,50,60~\n~r01,21~'
-script += '\nThere is ~r049,110,210,332767,449,51~1~r01,10,21,37,4101,50~ exit:\n~r09170,327040,41,55814,627039~'
-script += '- ~r0119,39171,44,51528,69170~w~r0101,11,39172~e~r0115,12,39173~s~r0116,13,39174~t~r09170,10,327040,41,55814,627039~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~w~r025976,4119,51~e~r025977,4101,52~s~r025978,4115,53~t~r025979,4116,54~\n~r032,23,37,4101,50~'
-script += '~moutput~\n\n~r02377,10,20,34~~v27322377~== ~r084,38164,415,51528,68163~T~r0119,11,38165~w~r0105,12,38166~'
-script += 'i~r0115,13,38167~s~r0116,14,38168~t~r0121,15,38169~y~r032,16,38170~ ~r0112,17,38171~p~r097,18,38172~'
-script += 'a~r0115,19,38173~s~r110,38174~s~r097,111,38175~a~r0103,112,38176~g~r0101,113,38177~e~r0115,114,38178~'
-script += 's~r08163,10,34,4101,50,60~ ==\n~r089,38180,4123,51528,68179~Y~r0111,11,38181~o~r0117,12,38182~u~r032,13,38183~'
-script += ' ~r097,14,38184~a~r0114,15,38185~r~r0101,16,38186~e~r032,17,38187~ ~r0105,18,38188~i~r0110,19,38189~'
-script += 'n~r032,110,38190~ ~r097,111,38191~a~r032,112,38192~ ~r0109,113,38193~m~r097,114,38194~a~r0122,115,38195~'
-script += 'z~r0101,116,38196~e~r032,117,38197~ ~r0111,118,38198~o~r0102,119,38199~f~r032,120,38200~ ~r0116,121,38201~'
-script += 't~r0119,122,38202~w~r0105,123,38203~i~r0115,124,38204~s~r0116,125,38205~t~r0121,126,38206~y~r032,127,38207~'
-script += ' ~r0108,128,38208~l~r0105,129,38209~i~r0116,130,38210~t~r131,38211~t~r0108,132,38212~l~r0101,133,38213~'
-script += 'e~r032,134,38214~ ~r0112,135,38215~p~r097,136,38216~a~r0115,137,38217~s~r138,38218~s~r097,139,38219~'
-script += 'a~r0103,140,38220~g~r0101,141,38221~e~r0115,142,38222~s~r044,143,38223~,~r032,144,38224~ ~r097,145,38225~'
-script += 'a~r0108,146,38226~l~r147,38227~l~r032,148,38228~ ~r0100,149,38229~d~r0105,150,38230~i~r0109,151,38231~'
-script += 'm~r0108,152,38232~l~r0121,153,38233~y~r032,154,38234~ ~r0108,155,38235~l~r0105,156,38236~i~r0116,157,38237~'
-script += 't~r032,158,38238~ ~r098,159,38239~b~r0121,160,38240~y~r032,161,38241~ ~r0109,162,38242~m~r0111,163,38243~'
-script += 'o~r0114,164,38244~r~r0101,165,38245~e~r032,166,38246~ ~r098,167,38247~b~r0105,168,38248~i~r0111,169,38249~'
-script += 'o~r0108,170,38250~l~r0117,171,38251~u~r0109,172,38252~m~r0105,173,38253~i~r0110,174,38254~n~r0101,175,38255~'
-script += 'e~r0115,176,38256~s~r099,177,38257~c~r0101,178,38258~e~r0110,179,38259~n~r0116,180,38260~t~r032,181,38261~'
-script += ' ~r0109,182,38262~m~r0111,183,38263~o~r0115,184,38264~s~r185,38265~s~r046,186,38266~.~r032,187,38267~'
-script += ' ~r188,38268~ ~r084,189,38269~T~r0104,190,38270~h~r0101,191,38271~e~r0114,192,38272~r~r0101,193,38273~'
-script += 'e~r032,194,38274~ ~r0105,195,38275~i~r0115,196,38276~s~r032,197,38277~ ~r097,198,38278~a~r032,199,38279~'
-script += ' ~r0108,1100,38280~l~r097,1101,38281~a~r0100,1102,38282~d~r1103,38283~d~r0101,1104,38284~e~r0114,1105,38285~'
-script += 'r~r032,1106,38286~ ~r0104,1107,38287~h~r0101,1108,38288~e~r0114,1109,38289~r~r0101,1110,38290~e~r032,1111,38291~'
-script += ' ~r0108,1112,38292~l~r0101,1113,38293~e~r097,1114,38294~a~r0100,1115,38295~d~r0105,1116,38296~i~r0110,1117,38297~'
-script += 'n~r0103,1118,38298~g~r032,1119,38299~ ~r0117,1120,38300~u~r0112,1121,38301~p~r046,1122,38302~.~r08179,10,34,4101,50,60~'
-script += '\n~r05~\nThere are ~r053,110,210,332763,453,51~5~r05,10,20,34,4101,50~ exits:\n~r08303,326972,45,55814,626971~'
-script += '- ~r0108,38304,46,51528,68303~l~r097,11,38305~a~r0100,12,38306~d~r13,38307~d~r0101,14,38308~e~r0114,15,38309~'
-script += 'r~r08303,10,326972,45,55814,626971~\n~r08310,11,326973~- ~r0110,10,38311,51528,68310~n~r0111,11,38312~'
-script += 'o~r0114,12,38313~r~r0116,13,38314~t~r0104,14,38315~h~r08310,11,326973,55814,626971~\n~r08316,12,326974~'
-script += '- ~r0115,10,38317,51528,68316~s~r0111,11,38318~o~r0117,12,38319~u~r0116,13,38320~t~r0104,14,38321~h~r08316,12,326974,55814,626971~'
-script += '\n~r08322,13,326975~- ~r0101,10,38323,44,51528,68322~e~r097,11,38324~a~r0115,12,38325~s~r0116,13,38326~'
-script += 't~r08322,326975,45,55814,626971~\n~r08327,14,326976~- ~r0119,10,38328,44,51528,68327~w~r0101,11,38329~'
-script += 'e~r0115,12,38330~s~r0116,13,38331~t~r08327,14,326976,45,55814,626971~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~l~r025976,4108,51~a~r025977,497,52~'
-script += 'd~r025978,4100,53~d~r025979,54~e~r025980,4101,55~r~r025981,4114,56~\n~r032,20,34,4101,50~~moutput~\n'
-script += '\n~r02367,10,36~~v27322367~== ~r080,37800,47,51528,67799~P~r097,11,37801~a~r0115,12,37802~s~r13,37803~'
-script += 's~r097,14,37804~a~r0103,15,37805~g~r0101,16,37806~e~r07799,10,36,4101,50,60~ ==\n~r089,37808,4176,51528,67807~'
-script += 'Y~r0111,11,37809~o~r0117,12,37810~u~r032,13,37811~ ~r097,14,37812~a~r0114,15,37813~r~r0101,16,37814~'
-script += 'e~r032,17,37815~ ~r0105,18,37816~i~r0110,19,37817~n~r032,110,37818~ ~r097,111,37819~a~r032,112,37820~'
-script += ' ~r099,113,37821~c~r0114,114,37822~r~r0101,115,37823~e~r0118,116,37824~v~r0105,117,37825~i~r0115,118,37826~'
-script += 's~r0101,119,37827~e~r032,120,37828~ ~r0111,121,37829~o~r0110,122,37830~n~r032,123,37831~ ~r0116,124,37832~'
-script += 't~r0104,125,37833~h~r0101,126,37834~e~r032,127,37835~ ~r0119,128,37836~w~r0101,129,37837~e~r0115,130,37838~'
-script += 's~r0116,131,37839~t~r032,132,37840~ ~r0119,133,37841~w~r097,134,37842~a~r0108,135,37843~l~r136,37844~'
-script += 'l~r032,137,37845~ ~r0111,138,37846~o~r0102,139,37847~f~r032,140,37848~ ~r0116,141,37849~t~r0104,142,37850~'
-script += 'h~r0101,143,37851~e~r032,144,37852~ ~r0109,145,37853~m~r0111,146,37854~o~r0115,147,37855~s~r148,37856~'
-script += 's~r032,149,37857~ ~r099,150,37858~c~r097,151,37859~a~r0118,152,37860~v~r0101,153,37861~e~r0114,154,37862~'
-script += 'r~r0110,155,37863~n~r046,156,37864~.~r032,157,37865~ ~r158,37866~ ~r065,159,37867~A~r032,160,37868~ '
-script += '~r0100,161,37869~d~r097,162,37870~a~r0114,163,37871~r~r0107,164,37872~k~r032,165,37873~ ~r0112,166,37874~'
-script += 'p~r097,167,37875~a~r0115,168,37876~s~r169,37877~s~r097,170,37878~a~r0103,171,37879~g~r0101,172,37880~'
-script += 'e~r032,173,37881~ ~r0108,174,37882~l~r0101,175,37883~e~r097,176,37884~a~r0100,177,37885~d~r0115,178,37886~'
-script += 's~r032,179,37887~ ~r0102,180,37888~f~r0117,181,37889~u~r0114,182,37890~r~r0116,183,37891~t~r0104,184,37892~'
-script += 'h~r0101,185,37893~e~r0114,186,37894~r~r032,187,37895~ ~r0119,188,37896~w~r0101,189,37897~e~r0115,190,37898~'
-script += 's~r0116,191,37899~t~r046,192,37900~.~r032,193,37901~ ~r194,37902~ ~r084,195,37903~T~r0104,196,37904~'
-script += 'h~r0101,197,37905~e~r0114,198,37906~r~r0101,199,37907~e~r032,1100,37908~ ~r0105,1101,37909~i~r0115,1102,37910~'
-script += 's~r032,1103,37911~ ~r097,1104,37912~a~r032,1105,37913~ ~r0108,1106,37914~l~r097,1107,37915~a~r0100,1108,37916~'
-script += 'd~r1109,37917~d~r0101,1110,37918~e~r0114,1111,37919~r~r032,1112,37920~ ~r0104,1113,37921~h~r0101,1114,37922~'
-script += 'e~r0114,1115,37923~r~r0101,1116,37924~e~r032,1117,37925~ ~r0119,1118,37926~w~r0104,1119,37927~h~r0105,1120,37928~'
-script += 'i~r099,1121,37929~c~r0104,1122,37930~h~r032,1123,37931~ ~r0108,1124,37932~l~r0101,1125,37933~e~r097,1126,37934~'
-script += 'a~r0100,1127,37935~d~r0115,1128,37936~s~r032,1129,37937~ ~r0100,1130,37938~d~r0111,1131,37939~o~r0119,1132,37940~'
-script += 'w~r0110,1133,37941~n~r032,1134,37942~ ~r0105,1135,37943~i~r0110,1136,37944~n~r0116,1137,37945~t~r0111,1138,37946~'
-script += 'o~r032,1139,37947~ ~r097,1140,37948~a~r032,1141,37949~ ~r0115,1142,37950~s~r0109,1143,37951~m~r097,1144,37952~'
-script += 'a~r0108,1145,37953~l~r1146,37954~l~r0101,1147,37955~e~r0114,1148,37956~r~r044,1149,37957~,~r032,1150,37958~'
-script += ' ~r0109,1151,37959~m~r0111,1152,37960~o~r0115,1153,37961~s~r1154,37962~s~r045,1155,37963~-~r0102,1156,37964~'
-script += 'f~r0105,1157,37965~i~r0108,1158,37966~l~r1159,37967~l~r0101,1160,37968~e~r0100,1161,37969~d~r032,1162,37970~'
-script += ' ~r099,1163,37971~c~r097,1164,37972~a~r0118,1165,37973~v~r0101,1166,37974~e~r0114,1167,37975~r~r0110,1168,37976~'
-script += 'n~r032,1169,37977~ ~r098,1170,37978~b~r0101,1171,37979~e~r0108,1172,37980~l~r0111,1173,37981~o~r0119,1174,37982~'
-script += 'w~r046,1175,37983~.~r07807,10,36,4101,50,60~\n~r03~\nThere are ~r051,110,210,332765,451,51~3~r03,10,20,36,4101,50~'
-script += ' exits:\n~r07984,326955,43,55814,626954~- ~r099,37985,46,51528,67984~c~r097,11,37986~a~r0118,12,37987~'
-script += 'v~r0101,13,37988~e~r0114,14,37989~r~r0110,15,37990~n~r07984,10,326955,43,55814,626954~\n~r07991,11,326956~'
-script += '- ~r0108,10,37992,46,51528,67991~l~r097,11,37993~a~r0100,12,37994~d~r13,37995~d~r0101,14,37996~e~r0114,15,37997~'
-script += 'r~r07991,11,326956,43,55814,626954~\n~r07998,12,326957~- ~r0100,10,37999,48,51528,67998~d~r097,11,38000~'
-script += 'a~r0114,12,38001~r~r0107,13,38002~k~r0110,14,38003~n~r0101,15,38004~e~r0115,16,38005~s~r17,38006~s~r07998,12,326957,43,55814,626954~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~d~r025976,4100,51~a~r025977,497,52~r~r025978,4114,53~k~r025979,4107,54~n~r025980,4110,55~e~r025981,4101,56~'
-script += 's~r025982,4115,57~s~r025983,58~\n~r032,20,36,4101,50~~moutput~\n\n~r02372,10,38~~v27322372~== ~r080,38008,47,51528,68007~'
-script += 'P~r097,11,38009~a~r0115,12,38010~s~r13,38011~s~r097,14,38012~a~r0103,15,38013~g~r0101,16,38014~e~r08007,10,38,4101,50,60~'
-script += ' ==\n~r089,38074,475,51528,68073~Y~r0111,11,38075~o~r0117,12,38076~u~r032,13,38077~ ~r0102,14,38078~'
-script += 'f~r0101,15,38079~e~r16,38080~e~r0108,17,38081~l~r032,18,38082~ ~r0116,19,38083~t~r0104,110,38084~h~r097,111,38085~'
-script += 'a~r0116,112,38086~t~r032,113,38087~ ~r0121,114,38088~y~r0111,115,38089~o~r0117,116,38090~u~r0114,117,38091~'
-script += 'r~r032,118,38092~ ~r0108,119,38093~l~r0105,120,38094~i~r0103,121,38095~g~r0104,122,38096~h~r0116,123,38097~'
-script += 't~r032,124,38098~ ~r0115,125,38099~s~r0111,126,38100~o~r0117,127,38101~u~r0114,128,38102~r~r099,129,38103~'
-script += 'c~r0101,130,38104~e~r032,131,38105~ ~r0105,132,38106~i~r0115,133,38107~s~r032,134,38108~ ~r0109,135,38109~'
-script += 'm~r0111,136,38110~o~r0114,137,38111~r~r0101,138,38112~e~r032,139,38113~ ~r0116,140,38114~t~r0104,141,38115~'
-script += 'h~r097,142,38116~a~r0110,143,38117~n~r032,144,38118~ ~r0115,145,38119~s~r0117,146,38120~u~r0102,147,38121~'
-script += 'f~r148,38122~f~r0105,149,38123~i~r099,150,38124~c~r0105,151,38125~i~r0101,152,38126~e~r0110,153,38127~'
-script += 'n~r0116,154,38128~t~r032,155,38129~ ~r0116,156,38130~t~r0111,157,38131~o~r032,158,38132~ ~r0107,159,38133~'
-script += 'k~r0101,160,38134~e~r161,38135~e~r0112,162,38136~p~r032,163,38137~ ~r0103,164,38138~g~r0114,165,38139~'
-script += 'r~r0117,166,38140~u~r0101,167,38141~e~r0115,168,38142~s~r032,169,38143~ ~r097,170,38144~a~r0119,171,38145~'
-script += 'w~r097,172,38146~a~r0121,173,38147~y~r046,174,38148~.~r08073,11,38,4101,50,60~\n~r02~\nThere are ~r050,110,210,332766,450,51~'
-script += '2~r02,11,20,38,4101,50~ exits:\n~r08149,10,326966,42,55814,626965~- ~r099,38150,48,51528,68149~c~r0111,11,38151~'
-script += 'o~r0110,12,38152~n~r0116,13,38153~t~r0105,14,38154~i~r0110,15,38155~n~r0117,16,38156~u~r0101,17,38157~'
-script += 'e~r08149,10,326966,42,55814,626965~\n~r08158,11,326967~- ~r098,10,38159,44,51528,68158~b~r097,11,38160~'
-script += 'a~r099,12,38161~c~r0107,13,38162~k~r08158,11,326967,42,55814,626965~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~c~r025976,499,51~o~r025977,4111,52~'
-script += 'n~r025978,4110,53~t~r025979,4116,54~i~r025980,4105,55~n~r025981,4110,56~u~r025982,4117,57~e~r025983,4101,58~'
-script += '\n~r032,20,38,50~~moutput~\n\n~r02427,10~~v27322427~== ~r068,39260,412,51528,69259~D~r097,11,39261~a'
-script += '~r0114,12,39262~r~r0107,13,39263~k~r032,14,39264~ ~r0112,15,39265~p~r097,16,39266~a~r0115,17,39267~s'
-script += '~r18,39268~s~r097,19,39269~a~r0103,110,39270~g~r0101,111,39271~e~r09259,10,38,4101,50,60~ ==\n~r089,39273,4114,51528,69272~'
-script += 'Y~r0111,11,39274~o~r0117,12,39275~u~r032,13,39276~ ~r097,14,39277~a~r0114,15,39278~r~r0101,16,39279~'
-script += 'e~r032,17,39280~ ~r0105,18,39281~i~r0110,19,39282~n~r032,110,39283~ ~r097,111,39284~a~r032,112,39285~'
-script += ' ~r0110,113,39286~n~r097,114,39287~a~r0114,115,39288~r~r116,39289~r~r0111,117,39290~o~r0119,118,39291~'
-script += 'w~r032,119,39292~ ~r0112,120,39293~p~r097,121,39294~a~r0115,122,39295~s~r123,39296~s~r097,124,39297~'
-script += 'a~r0103,125,39298~g~r0101,126,39299~e~r046,127,39300~.~r032,128,39301~ ~r129,39302~ ~r084,130,39303~'
-script += 'T~r0104,131,39304~h~r0101,132,39305~e~r0114,133,39306~r~r0101,134,39307~e~r032,135,39308~ ~r0105,136,39309~'
-script += 'i~r0115,137,39310~s~r032,138,39311~ ~r0100,139,39312~d~r097,140,39313~a~r0114,141,39314~r~r0107,142,39315~'
-script += 'k~r0110,143,39316~n~r0101,144,39317~e~r0115,145,39318~s~r146,39319~s~r032,147,39320~ ~r0116,148,39321~'
-script += 't~r0111,149,39322~o~r032,150,39323~ ~r0116,151,39324~t~r0104,152,39325~h~r0101,153,39326~e~r032,154,39327~'
-script += ' ~r0119,155,39328~w~r0101,156,39329~e~r0115,157,39330~s~r0116,158,39331~t~r044,159,39332~,~r032,160,39333~'
-script += ' ~r098,161,39334~b~r0117,162,39335~u~r0116,163,39336~t~r032,164,39337~ ~r0121,165,39338~y~r0111,166,39339~'
-script += 'o~r0117,167,39340~u~r032,168,39341~ ~r099,169,39342~c~r097,170,39343~a~r0110,171,39344~n~r032,172,39345~'
-script += ' ~r098,173,39346~b~r097,174,39347~a~r0114,175,39348~r~r0101,176,39349~e~r0108,177,39350~l~r0121,178,39351~'
-script += 'y~r032,179,39352~ ~r0115,180,39353~s~r0101,181,39354~e~r182,39355~e~r032,183,39356~ ~r097,184,39357~'
-script += 'a~r032,185,39358~ ~r0103,186,39359~g~r0108,187,39360~l~r0111,188,39361~o~r0119,189,39362~w~r0105,190,39363~'
-script += 'i~r0110,191,39364~n~r0103,192,39365~g~r032,193,39366~ ~r0111,194,39367~o~r0112,195,39368~p~r0101,196,39369~'
-script += 'e~r0110,197,39370~n~r0105,198,39371~i~r0110,199,39372~n~r0103,1100,39373~g~r032,1101,39374~ ~r0116,1102,39375~'
-script += 't~r0111,1103,39376~o~r032,1104,39377~ ~r0116,1105,39378~t~r0104,1106,39379~h~r0101,1107,39380~e~r032,1108,39381~'
-script += ' ~r0101,1109,39382~e~r097,1110,39383~a~r0115,1111,39384~s~r0116,1112,39385~t~r046,1113,39386~.~r09272,10,38,4101,50,60~'
-script += '\n~r02~\nThere are ~r050,110,210,332766,450,51~2~r02,10,20,38,4101,50~ exits:\n~r09387,327050,42,55814,627049~'
-script += '- ~r0119,39388,44,51528,69387~w~r0101,11,39389~e~r0115,12,39390~s~r0116,13,39391~t~r09387,10,327050,42,55814,627049~'
-script += '\n~r09392,11,327051~- ~r0101,10,39393,44,51528,69392~e~r097,11,39394~a~r0115,12,39395~s~r0116,13,39396~'
-script += 't~r09392,11,327051,42,55814,627049~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~w~r025976,4119,51~e~r025977,4101,52~s~r025978,4115,53~'
-script += 't~r025979,4116,54~\n~r032,20,38,4101,50~~moutput~\n\n~r02432,10,34~~v27322432~== ~r068,39398,412,51528,69397~'
-script += 'D~r097,11,39399~a~r0114,12,39400~r~r0107,13,39401~k~r032,14,39402~ ~r0112,15,39403~p~r097,16,39404~a'
-script += '~r0115,17,39405~s~r18,39406~s~r097,19,39407~a~r0103,110,39408~g~r0101,111,39409~e~r09397,10,34,4101,50,60~'
-script += ' ==\n~r089,39411,434,51528,69410~Y~r0111,11,39412~o~r0117,12,39413~u~r032,13,39414~ ~r097,14,39415~a'
-script += '~r0114,15,39416~r~r0101,16,39417~e~r032,17,39418~ ~r0105,18,39419~i~r0110,19,39420~n~r032,110,39421~'
-script += ' ~r097,111,39422~a~r032,112,39423~ ~r0100,113,39424~d~r097,114,39425~a~r0114,115,39426~r~r0107,116,39427~'
-script += 'k~r044,117,39428~,~r032,118,39429~ ~r0110,119,39430~n~r097,120,39431~a~r0114,121,39432~r~r122,39433~'
-script += 'r~r0111,123,39434~o~r0119,124,39435~w~r032,125,39436~ ~r0112,126,39437~p~r097,127,39438~a~r0115,128,39439~'
-script += 's~r129,39440~s~r097,130,39441~a~r0103,131,39442~g~r0101,132,39443~e~r046,133,39444~.~r09410,10,34,4101,50,60~'
-script += '\n~r02~\nThere are ~r050,110,210,332766,450,51~2~r02,10,20,34,4101,50~ exits:\n~r09445,327056,42,55814,627055~'
-script += '- ~r0101,39446,44,51528,69445~e~r097,11,39447~a~r0115,12,39448~s~r0116,13,39449~t~r09445,10,327056,42,55814,627055~'
-script += '\n~r09450,11,327057~- ~r0119,10,39451,44,51528,69450~w~r0101,11,39452~e~r0115,12,39453~s~r0116,13,39454~'
-script += 't~r09450,11,327057,42,55814,627055~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~w~r025976,4119,51~e~r025977,4101,52~s~r025978,4115,53~'
-script += 't~r025979,4116,54~\n~r032,20,34,4101,50~~moutput~\n\n~r02437,10~~v27322437~== ~r068,39456,412,51528,69455~'
-script += 'D~r097,11,39457~a~r0114,12,39458~r~r0107,13,39459~k~r032,14,39460~ ~r0112,15,39461~p~r097,16,39462~a'
-script += '~r0115,17,39463~s~r18,39464~s~r097,19,39465~a~r0103,110,39466~g~r0101,111,39467~e~r09455,10,34,4101,50,60~'
-script += ' ==\n~r089,39469,434,51528,69468~Y~r0111,11,39470~o~r0117,12,39471~u~r032,13,39472~ ~r097,14,39473~a'
-script += '~r0114,15,39474~r~r0101,16,39475~e~r032,17,39476~ ~r0105,18,39477~i~r0110,19,39478~n~r032,110,39479~'
-script += ' ~r097,111,39480~a~r032,112,39481~ ~r0100,113,39482~d~r097,114,39483~a~r0114,115,39484~r~r0107,116,39485~'
-script += 'k~r044,117,39486~,~r032,118,39487~ ~r0110,119,39488~n~r097,120,39489~a~r0114,121,39490~r~r122,39491~'
-script += 'r~r0111,123,39492~o~r0119,124,39493~w~r032,125,39494~ ~r0112,126,39495~p~r097,127,39496~a~r0115,128,39497~'
-script += 's~r129,39498~s~r097,130,39499~a~r0103,131,39500~g~r0101,132,39501~e~r046,133,39502~.~r09468,10,34,4101,50,60~'
-script += '\n~r02~\nThere are ~r050,110,210,332766,450,51~2~r02,10,20,34,4101,50~ exits:\n~r09503,327062,42,55814,627061~'
-script += '- ~r0101,39504,44,51528,69503~e~r097,11,39505~a~r0115,12,39506~s~r0116,13,39507~t~r09503,10,327062,42,55814,627061~'
-script += '\n~r09508,11,327063~- ~r0119,10,39509,44,51528,69508~w~r0101,11,39510~e~r0115,12,39511~s~r0116,13,39512~'
-script += 't~r09508,11,327063,42,55814,627061~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~w~r025976,4119,51~e~r025977,4101,52~s~r025978,4115,53~'
-script += 't~r025979,4116,54~\n~r032,20,34,4101,50~~moutput~\n\n~r02442,10~~v27322442~== ~r068,39514,412,51528,69513~'
-script += 'D~r097,11,39515~a~r0114,12,39516~r~r0107,13,39517~k~r032,14,39518~ ~r0112,15,39519~p~r097,16,39520~a'
-script += '~r0115,17,39521~s~r18,39522~s~r097,19,39523~a~r0103,110,39524~g~r0101,111,39525~e~r09513,10,34,4101,50,60~'
-script += ' ==\n~r089,39527,4100,51528,69526~Y~r0111,11,39528~o~r0117,12,39529~u~r032,13,39530~ ~r097,14,39531~'
-script += 'a~r0114,15,39532~r~r0101,16,39533~e~r032,17,39534~ ~r0105,18,39535~i~r0110,19,39536~n~r032,110,39537~'
-script += ' ~r097,111,39538~a~r032,112,39539~ ~r0100,113,39540~d~r097,114,39541~a~r0114,115,39542~r~r0107,116,39543~'
-script += 'k~r044,117,39544~,~r032,118,39545~ ~r0110,119,39546~n~r097,120,39547~a~r0114,121,39548~r~r122,39549~'
-script += 'r~r0111,123,39550~o~r0119,124,39551~w~r032,125,39552~ ~r0112,126,39553~p~r097,127,39554~a~r0115,128,39555~'
-script += 's~r129,39556~s~r097,130,39557~a~r0103,131,39558~g~r0101,132,39559~e~r046,133,39560~.~r032,134,39561~'
-script += ' ~r135,39562~ ~r084,136,39563~T~r0111,137,39564~o~r032,138,39565~ ~r0116,139,39566~t~r0104,140,39567~'
-script += 'h~r0101,141,39568~e~r032,142,39569~ ~r0119,143,39570~w~r0101,144,39571~e~r0115,145,39572~s~r0116,146,39573~'
-script += 't~r044,147,39574~,~r032,148,39575~ ~r0121,149,39576~y~r0111,150,39577~o~r0117,151,39578~u~r032,152,39579~'
-script += ' ~r0115,153,39580~s~r0112,154,39581~p~r0111,155,39582~o~r0116,156,39583~t~r032,157,39584~ ~r0115,158,39585~'
-script += 's~r0111,159,39586~o~r0109,160,39587~m~r0101,161,39588~e~r032,162,39589~ ~r0118,163,39590~v~r0101,164,39591~'
-script += 'e~r0103,165,39592~g~r0101,166,39593~e~r0116,167,39594~t~r097,168,39595~a~r0116,169,39596~t~r0105,170,39597~'
-script += 'i~r0111,171,39598~o~r0110,172,39599~n~r032,173,39600~ ~r0119,174,39601~w~r0104,175,39602~h~r0101,176,39603~'
-script += 'e~r0114,177,39604~r~r0101,178,39605~e~r032,179,39606~ ~r0116,180,39607~t~r0104,181,39608~h~r0101,182,39609~'
-script += 'e~r032,183,39610~ ~r0112,184,39611~p~r097,185,39612~a~r0115,186,39613~s~r187,39614~s~r097,188,39615~'
-script += 'a~r0103,189,39616~g~r0101,190,39617~e~r032,191,39618~ ~r0101,192,39619~e~r0120,193,39620~x~r0112,194,39621~'
-script += 'p~r097,195,39622~a~r0110,196,39623~n~r0100,197,39624~d~r0115,198,39625~s~r046,199,39626~.~r09526,10,34,4101,50,60~'
-script += '\n~r02~\nThere are ~r050,110,210,332766,450,51~2~r02,10,20,34,4101,50~ exits:\n~r09627,327068,42,55814,627067~'
-script += '- ~r0101,39628,44,51528,69627~e~r097,11,39629~a~r0115,12,39630~s~r0116,13,39631~t~r09627,10,327068,42,55814,627067~'
-script += '\n~r09632,11,327069~- ~r0119,10,39633,44,51528,69632~w~r0101,11,39634~e~r0115,12,39635~s~r0116,13,39636~'
-script += 't~r09632,11,327069,42,55814,627067~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~w~r025976,4119,51~e~r025977,4101,52~s~r025978,4115,53~'
-script += 't~r025979,4116,54~\n~r032,20,34,4101,50~~moutput~\n\n~r02447,10~~v27322447~== ~r082,39638,45,51528,69637~'
-script += 'R~r0117,11,39639~u~r0105,12,39640~i~r0110,13,39641~n~r0115,14,39642~s~r09637,10,34,4101,50,60~ ==\n~r089,39644,4248,51528,69643~'
-script += 'Y~r0111,11,39645~o~r0117,12,39646~u~r032,13,39647~ ~r0115,14,39648~s~r0116,15,39649~t~r097,16,39650~'
-script += 'a~r0110,17,39651~n~r0100,18,39652~d~r032,19,39653~ ~r0105,110,39654~i~r0110,111,39655~n~r032,112,39656~'
-script += ' ~r097,113,39657~a~r032,114,39658~ ~r0108,115,39659~l~r097,116,39660~a~r0114,117,39661~r~r0103,118,39662~'
-script += 'g~r0101,119,39663~e~r032,120,39664~ ~r099,121,39665~c~r097,122,39666~a~r0118,123,39667~v~r0101,124,39668~'
-script += 'e~r0114,125,39669~r~r0110,126,39670~n~r032,127,39671~ ~r0119,128,39672~w~r0105,129,39673~i~r0116,130,39674~'
-script += 't~r0104,131,39675~h~r032,132,39676~ ~r097,133,39677~a~r032,134,39678~ ~r0104,135,39679~h~r0117,136,39680~'
-script += 'u~r0103,137,39681~g~r0101,138,39682~e~r032,139,39683~ ~r0114,140,39684~r~r0117,141,39685~u~r0105,142,39686~'
-script += 'i~r0110,143,39687~n~r032,144,39688~ ~r0116,145,39689~t~r0111,146,39690~o~r032,147,39691~ ~r0116,148,39692~'
-script += 't~r0104,149,39693~h~r0101,150,39694~e~r032,151,39695~ ~r0110,152,39696~n~r0111,153,39697~o~r0114,154,39698~'
-script += 'r~r0116,155,39699~t~r0104,156,39700~h~r044,157,39701~,~r032,158,39702~ ~r0111,159,39703~o~r0118,160,39704~'
-script += 'v~r0101,161,39705~e~r0114,162,39706~r~r0103,163,39707~g~r0114,164,39708~r~r0111,165,39709~o~r0119,166,39710~'
-script += 'w~r0110,167,39711~n~r032,168,39712~ ~r098,169,39713~b~r0121,170,39714~y~r032,171,39715~ ~r0112,172,39716~'
-script += 'p~r0108,173,39717~l~r097,174,39718~a~r0110,175,39719~n~r0116,176,39720~t~r032,177,39721~ ~r0108,178,39722~'
-script += 'l~r0105,179,39723~i~r0102,180,39724~f~r0101,181,39725~e~r046,182,39726~.~r032,183,39727~ ~r184,39728~'
-script += ' ~r084,185,39729~T~r0104,186,39730~h~r0101,187,39731~e~r0114,188,39732~r~r0101,189,39733~e~r032,190,39734~'
-script += ' ~r0105,191,39735~i~r0115,192,39736~s~r032,193,39737~ ~r097,194,39738~a~r032,195,39739~ ~r0108,196,39740~'
-script += 'l~r097,197,39741~a~r0114,198,39742~r~r0103,199,39743~g~r0101,1100,39744~e~r032,1101,39745~ ~r0115,1102,39746~'
-script += 's~r0116,1103,39747~t~r0111,1104,39748~o~r0110,1105,39749~n~r0101,1106,39750~e~r032,1107,39751~ ~r097,1108,39752~'
-script += 'a~r0114,1109,39753~r~r099,1110,39754~c~r0104,1111,39755~h~r0119,1112,39756~w~r097,1113,39757~a~r0121,1114,39758~'
-script += 'y~r032,1115,39759~ ~r0116,1116,39760~t~r0111,1117,39761~o~r032,1118,39762~ ~r0116,1119,39763~t~r0104,1120,39764~'
-script += 'h~r0101,1121,39765~e~r032,1122,39766~ ~r0110,1123,39767~n~r0111,1124,39768~o~r0114,1125,39769~r~r0116,1126,39770~'
-script += 't~r0104,1127,39771~h~r032,1128,39772~ ~r097,1129,39773~a~r099,1130,39774~c~r0116,1131,39775~t~r0105,1132,39776~'
-script += 'i~r0110,1133,39777~n~r0103,1134,39778~g~r032,1135,39779~ ~r097,1136,39780~a~r0115,1137,39781~s~r032,1138,39782~'
-script += ' ~r0116,1139,39783~t~r0104,1140,39784~h~r0101,1141,39785~e~r032,1142,39786~ ~r0100,1143,39787~d~r0111,1144,39788~'
-script += 'o~r1145,39789~o~r0114,1146,39790~r~r0119,1147,39791~w~r097,1148,39792~a~r0121,1149,39793~y~r032,1150,39794~'
-script += ' ~r0116,1151,39795~t~r0111,1152,39796~o~r032,1153,39797~ ~r0116,1154,39798~t~r0104,1155,39799~h~r0101,1156,39800~'
-script += 'e~r032,1157,39801~ ~r0114,1158,39802~r~r0117,1159,39803~u~r0105,1160,39804~i~r0110,1161,39805~n~r0101,1162,39806~'
-script += 'e~r0100,1163,39807~d~r032,1164,39808~ ~r099,1165,39809~c~r0111,1166,39810~o~r0109,1167,39811~m~r0112,1168,39812~'
-script += 'p~r0108,1169,39813~l~r0101,1170,39814~e~r0120,1171,39815~x~r046,1172,39816~.~r032,1173,39817~ ~r1174,39818~'
-script += ' ~r065,1175,39819~A~r032,1176,39820~ ~r099,1177,39821~c~r0114,1178,39822~r~r0101,1179,39823~e~r0118,1180,39824~'
-script += 'v~r0105,1181,39825~i~r099,1182,39826~c~r0101,1183,39827~e~r032,1184,39828~ ~r0105,1185,39829~i~r0110,1186,39830~'
-script += 'n~r032,1187,39831~ ~r0116,1188,39832~t~r0104,1189,39833~h~r0101,1190,39834~e~r032,1191,39835~ ~r0114,1192,39836~'
-script += 'r~r0111,1193,39837~o~r099,1194,39838~c~r0107,1195,39839~k~r032,1196,39840~ ~r0116,1197,39841~t~r0111,1198,39842~'
-script += 'o~r032,1199,39843~ ~r0116,1200,39844~t~r0104,1201,39845~h~r0101,1202,39846~e~r032,1203,39847~ ~r0101,1204,39848~'
-script += 'e~r097,1205,39849~a~r0115,1206,39850~s~r0116,1207,39851~t~r032,1208,39852~ ~r0108,1209,39853~l~r0101,1210,39854~'
-script += 'e~r097,1211,39855~a~r0100,1212,39856~d~r0115,1213,39857~s~r032,1214,39858~ ~r0116,1215,39859~t~r0111,1216,39860~'
-script += 'o~r032,1217,39861~ ~r097,1218,39862~a~r0110,1219,39863~n~r032,1220,39864~ ~r097,1221,39865~a~r0108,1222,39866~'
-script += 'l~r097,1223,39867~a~r0114,1224,39868~r~r0109,1225,39869~m~r0105,1226,39870~i~r0110,1227,39871~n~r0103,1228,39872~'
-script += 'g~r0108,1229,39873~l~r0121,1230,39874~y~r032,1231,39875~ ~r0100,1232,39876~d~r097,1233,39877~a~r0114,1234,39878~'
-script += 'r~r0107,1235,39879~k~r032,1236,39880~ ~r0112,1237,39881~p~r097,1238,39882~a~r0115,1239,39883~s~r1240,39884~'
-script += 's~r097,1241,39885~a~r0103,1242,39886~g~r0101,1243,39887~e~r0119,1244,39888~w~r097,1245,39889~a~r0121,1246,39890~'
-script += 'y~r046,1247,39891~.~r09643,10,34,4101,50,60~\n~r02~\nThere are ~r050,110,210,332766,450,51~2~r02,10,20,34,4101,50~'
-script += ' exits:\n~r09892,327074,42,55814,627073~- ~r0101,39893,44,51528,69892~e~r097,11,39894~a~r0115,12,39895~'
-script += 's~r0116,13,39896~t~r09892,10,327074,42,55814,627073~\n~r09897,11,327075~- ~r0110,10,39898,45,51528,69897~'
-script += 'n~r0111,11,39899~o~r0114,12,39900~r~r0116,13,39901~t~r0104,14,39902~h~r09897,11,327075,42,55814,627073~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~n~r025976,4110,51~o~r025977,4111,52~r~r025978,4114,53~t~r025979,4116,54~h~r025980,4104,55~\n'
-script += '~r032,20,34,4101,50~~moutput~\n\n~r02452,10,35~~v27322452~== ~r082,39904,45,51528,69903~R~r0117,11,39905~'
-script += 'u~r0105,12,39906~i~r0110,13,39907~n~r0115,14,39908~s~r09903,10,35,4101,50,60~ ==\n~r089,39910,4181,51528,69909~'
-script += 'Y~r0111,11,39911~o~r0117,12,39912~u~r032,13,39913~ ~r097,14,39914~a~r0114,15,39915~r~r0101,16,39916~'
-script += 'e~r032,17,39917~ ~r0105,18,39918~i~r0110,19,39919~n~r032,110,39920~ ~r0116,111,39921~t~r0104,112,39922~'
-script += 'h~r0101,113,39923~e~r032,114,39924~ ~r0111,115,39925~o~r0110,116,39926~n~r099,117,39927~c~r0101,118,39928~'
-script += 'e~r045,119,39929~-~r0111,120,39930~o~r0112,121,39931~p~r0117,122,39932~u~r0108,123,39933~l~r0101,124,39934~'
-script += 'e~r0110,125,39935~n~r0116,126,39936~t~r032,127,39937~ ~r0102,128,39938~f~r0111,129,39939~o~r0121,130,39940~'
-script += 'y~r0101,131,39941~e~r0114,132,39942~r~r032,133,39943~ ~r0111,134,39944~o~r0102,135,39945~f~r032,136,39946~'
-script += ' ~r097,137,39947~a~r032,138,39948~ ~r0109,139,39949~m~r097,140,39950~a~r0115,141,39951~s~r142,39952~'
-script += 's~r0105,143,39953~i~r0118,144,39954~v~r0101,145,39955~e~r032,146,39956~ ~r0114,147,39957~r~r0117,148,39958~'
-script += 'u~r0105,149,39959~i~r0110,150,39960~n~r0101,151,39961~e~r0100,152,39962~d~r032,153,39963~ ~r099,154,39964~'
-script += 'c~r0111,155,39965~o~r0109,156,39966~m~r0112,157,39967~p~r0108,158,39968~l~r0101,159,39969~e~r0120,160,39970~'
-script += 'x~r046,161,39971~.~r032,162,39972~ ~r163,39973~ ~r084,164,39974~T~r0104,165,39975~h~r0101,166,39976~'
-script += 'e~r0114,167,39977~r~r0101,168,39978~e~r032,169,39979~ ~r0105,170,39980~i~r0115,171,39981~s~r032,172,39982~'
-script += ' ~r097,173,39983~a~r032,174,39984~ ~r0100,175,39985~d~r0111,176,39986~o~r177,39987~o~r0114,178,39988~'
-script += 'r~r032,179,39989~ ~r0116,180,39990~t~r0111,181,39991~o~r032,182,39992~ ~r0116,183,39993~t~r0104,184,39994~'
-script += 'h~r0101,185,39995~e~r032,186,39996~ ~r0115,187,39997~s~r0111,188,39998~o~r0117,189,39999~u~r0116,190,310000~'
-script += 't~r0104,191,310001~h~r032,192,310002~ ~r0108,193,310003~l~r0101,194,310004~e~r097,195,310005~a~r0100,196,310006~'
-script += 'd~r0105,197,310007~i~r0110,198,310008~n~r0103,199,310009~g~r032,1100,310010~ ~r0116,1101,310011~t~r0111,1102,310012~'
-script += 'o~r032,1103,310013~ ~r0116,1104,310014~t~r0104,1105,310015~h~r0101,1106,310016~e~r032,1107,310017~ ~r0111,1108,310018~'
-script += 'o~r0118,1109,310019~v~r0101,1110,310020~e~r0114,1111,310021~r~r0103,1112,310022~g~r0114,1113,310023~'
-script += 'r~r0111,1114,310024~o~r0119,1115,310025~w~r0116,1116,310026~t~r0104,1117,310027~h~r032,1118,310028~ '
-script += '~r0111,1119,310029~o~r0117,1120,310030~u~r0116,1121,310031~t~r0115,1122,310032~s~r0105,1123,310033~i'
-script += '~r0100,1124,310034~d~r0101,1125,310035~e~r032,1126,310036~ ~r097,1127,310037~a~r0110,1128,310038~n~r0100,1129,310039~'
-script += 'd~r032,1130,310040~ ~r0115,1131,310041~s~r0116,1132,310042~t~r097,1133,310043~a~r0105,1134,310044~i~r0114,1135,310045~'
-script += 'r~r0115,1136,310046~s~r032,1137,310047~ ~r0116,1138,310048~t~r0111,1139,310049~o~r032,1140,310050~ ~r0116,1141,310051~'
-script += 't~r0104,1142,310052~h~r0101,1143,310053~e~r032,1144,310054~ ~r0110,1145,310055~n~r0111,1146,310056~o'
-script += '~r0114,1147,310057~r~r0116,1148,310058~t~r0104,1149,310059~h~r032,1150,310060~ ~r0119,1151,310061~w~r0104,1152,310062~'
-script += 'h~r0105,1153,310063~i~r099,1154,310064~c~r0104,1155,310065~h~r032,1156,310066~ ~r0108,1157,310067~l~r0101,1158,310068~'
-script += 'e~r097,1159,310069~a~r0100,1160,310070~d~r032,1161,310071~ ~r0105,1162,310072~i~r0110,1163,310073~n~r0116,1164,310074~'
-script += 't~r0111,1165,310075~o~r032,1166,310076~ ~r097,1167,310077~a~r032,1168,310078~ ~r0108,1169,310079~l~r097,1170,310080~'
-script += 'a~r0114,1171,310081~r~r0103,1172,310082~g~r0101,1173,310083~e~r0114,1174,310084~r~r032,1175,310085~ '
-script += '~r0104,1176,310086~h~r097,1177,310087~a~r0108,1178,310088~l~r1179,310089~l~r046,1180,310090~.~r09909,10,35,4101,50,60~'
-script += '\n~r010,19212,29212,327456,426,51531,627455~\n~r084,327457~T~r0104,327458~h~r0105,327459~i~r0110,327460~'
-script += 'n~r0103,327461~g~r0115,327462~s~r032,327463~ ~r0111,327464~o~r0102,327465~f~r032,327466~ ~r0105,327467~'
-script += 'i~r0110,327468~n~r0116,327469~t~r0101,327470~e~r0114,327471~r~r0101,327472~e~r0115,327473~s~r0116,327474~'
-script += 't~r032,327475~ ~r0104,327476~h~r0101,327477~e~r0114,327478~r~r0101,327479~e~r058,327480~:~r010,327481~'
-script += '\n~r018618,15,22452,31,416,55893,627381~- ~r0114,10,318619,48,51528,618618~r~r0101,11,318620~e~r0100,12,318621~'
-script += 'd~r032,13,318622~ ~r099,14,318623~c~r0111,15,318624~o~r0105,16,318625~i~r0110,17,318626~n~r018618,15,31,416,55893,627381~'
-script += '\n~r02,10,20,35,4101,50,60~\nThere are ~r050,110,210,332766,450,51~2~r02,10,20,35,4101,50~ exits:\n~r010091,327080,42,55814,627079~'
-script += '- ~r0110,310092,45,51528,610091~n~r0111,11,310093~o~r0114,12,310094~r~r0116,13,310095~t~r0104,14,310096~'
-script += 'h~r010091,10,327080,42,55814,627079~\n~r010097,11,327081~- ~r0115,10,310098,45,51528,610097~s~r0111,11,310099~'
-script += 'o~r0117,12,310100~u~r0116,13,310101~t~r0104,14,310102~h~r010097,11,327081,42,55814,627079~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~t~r025976,4116,51~a~r025977,497,52~'
-script += 'k~r025978,4107,53~e~r025979,4101,54~ ~r025980,432,55~r~r025981,4114,56~e~r025982,4101,57~d~r025983,4100,58~'
-script += ' ~r025984,432,59~c~r025985,499,510~o~r025986,4111,511~i~r025987,4105,512~n~r025988,4110,513~\n~r032,20,35,4101,50~'
-script += '~moutput~\n\n~r084,114065,214065,328055,47,51531,628054~~v26900~T~r097,328056~a~r0107,328057~k~r0101,328058~'
-script += 'e~r0110,328059~n~r046,328060~.~r010,328061~\n~r132613,232613,327415,417,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~n~r025976,4110,51~o~r025977,4111,52~r~r025978,4114,53~'
-script += 't~r025979,4116,54~h~r025980,4104,55~\n~r032,24,38,4101,50~~moutput~\n\n~r02457,10,20,35~~v27322457~='
-script += '= ~r082,310104,45,51528,610103~R~r0117,11,310105~u~r0105,12,310106~i~r0110,13,310107~n~r0115,14,310108~'
-script += 's~r010103,10,35,4101,50,60~ ==\n~r089,310110,4293,51528,610109~Y~r0111,11,310111~o~r0117,12,310112~u'
-script += '~r032,13,310113~ ~r0115,14,310114~s~r0116,15,310115~t~r097,16,310116~a~r0110,17,310117~n~r0100,18,310118~'
-script += 'd~r032,19,310119~ ~r0105,110,310120~i~r0110,111,310121~n~r032,112,310122~ ~r0116,113,310123~t~r0104,114,310124~'
-script += 'h~r0101,115,310125~e~r032,116,310126~ ~r0109,117,310127~m~r097,118,310128~a~r0115,119,310129~s~r120,310130~'
-script += 's~r0105,121,310131~i~r0118,122,310132~v~r0101,123,310133~e~r032,124,310134~ ~r099,125,310135~c~r0101,126,310136~'
-script += 'e~r0110,127,310137~n~r0116,128,310138~t~r0114,129,310139~r~r097,130,310140~a~r0108,131,310141~l~r032,132,310142~'
-script += ' ~r0104,133,310143~h~r097,134,310144~a~r0108,135,310145~l~r136,310146~l~r032,137,310147~ ~r0111,138,310148~'
-script += 'o~r0102,139,310149~f~r032,140,310150~ ~r0116,141,310151~t~r0104,142,310152~h~r0101,143,310153~e~r0115,144,310154~'
-script += 's~r0101,145,310155~e~r032,146,310156~ ~r0114,147,310157~r~r0117,148,310158~u~r0105,149,310159~i~r0110,150,310160~'
-script += 'n~r0115,151,310161~s~r046,152,310162~.~r032,153,310163~ ~r154,310164~ ~r084,155,310165~T~r0104,156,310166~'
-script += 'h~r0101,157,310167~e~r032,158,310168~ ~r0119,159,310169~w~r097,160,310170~a~r0108,161,310171~l~r162,310172~'
-script += 'l~r0115,163,310173~s~r032,164,310174~ ~r097,165,310175~a~r0114,166,310176~r~r0101,167,310177~e~r032,168,310178~'
-script += ' ~r099,169,310179~c~r0114,170,310180~r~r0117,171,310181~u~r0109,172,310182~m~r098,173,310183~b~r0108,174,310184~'
-script += 'l~r0105,175,310185~i~r0110,176,310186~n~r0103,177,310187~g~r044,178,310188~,~r032,179,310189~ ~r097,180,310190~'
-script += 'a~r0110,181,310191~n~r0100,182,310192~d~r032,183,310193~ ~r0118,184,310194~v~r0101,185,310195~e~r0103,186,310196~'
-script += 'g~r0101,187,310197~e~r0116,188,310198~t~r097,189,310199~a~r0116,190,310200~t~r0105,191,310201~i~r0111,192,310202~'
-script += 'o~r0110,193,310203~n~r032,194,310204~ ~r0104,195,310205~h~r097,196,310206~a~r0115,197,310207~s~r032,198,310208~'
-script += ' ~r099,199,310209~c~r0108,1100,310210~l~r0101,1101,310211~e~r097,1102,310212~a~r0114,1103,310213~r~r0108,1104,310214~'
-script += 'l~r0121,1105,310215~y~r032,1106,310216~ ~r0116,1107,310217~t~r097,1108,310218~a~r0107,1109,310219~k~r0101,1110,310220~'
-script += 'e~r0110,1111,310221~n~r032,1112,310222~ ~r0111,1113,310223~o~r0118,1114,310224~v~r0101,1115,310225~e'
-script += '~r0114,1116,310226~r~r046,1117,310227~.~r032,1118,310228~ ~r1119,310229~ ~r082,1120,310230~R~r0111,1121,310231~'
-script += 'o~r1122,310232~o~r0109,1123,310233~m~r0115,1124,310234~s~r032,1125,310235~ ~r097,1126,310236~a~r0114,1127,310237~'
-script += 'r~r0101,1128,310238~e~r032,1129,310239~ ~r097,1130,310240~a~r0116,1131,310241~t~r1132,310242~t~r097,1133,310243~'
-script += 'a~r099,1134,310244~c~r0104,1135,310245~h~r0101,1136,310246~e~r0100,1137,310247~d~r032,1138,310248~ ~r0105,1139,310249~'
-script += 'i~r0110,1140,310250~n~r032,1141,310251~ ~r097,1142,310252~a~r0108,1143,310253~l~r1144,310254~l~r032,1145,310255~'
-script += ' ~r0100,1146,310256~d~r0105,1147,310257~i~r0114,1148,310258~r~r0101,1149,310259~e~r099,1150,310260~c'
-script += '~r0116,1151,310261~t~r0105,1152,310262~i~r0111,1153,310263~o~r0110,1154,310264~n~r0115,1155,310265~s'
-script += '~r046,1156,310266~.~r032,1157,310267~ ~r1158,310268~ ~r084,1159,310269~T~r0104,1160,310270~h~r0101,1161,310271~'
-script += 'e~r0114,1162,310272~r~r0101,1163,310273~e~r032,1164,310274~ ~r0105,1165,310275~i~r0115,1166,310276~s'
-script += '~r032,1167,310277~ ~r097,1168,310278~a~r032,1169,310279~ ~r0115,1170,310280~s~r0116,1171,310281~t~r0114,1172,310282~'
-script += 'r~r097,1173,310283~a~r0110,1174,310284~n~r0103,1175,310285~g~r0101,1176,310286~e~r032,1177,310287~ ~r0109,1178,310288~'
-script += 'm~r0111,1179,310289~o~r0110,1180,310290~n~r0117,1181,310291~u~r0109,1182,310292~m~r0101,1183,310293~'
-script += 'e~r0110,1184,310294~n~r0116,1185,310295~t~r032,1186,310296~ ~r0105,1187,310297~i~r0110,1188,310298~n'
-script += '~r032,1189,310299~ ~r0116,1190,310300~t~r0104,1191,310301~h~r0101,1192,310302~e~r032,1193,310303~ ~r099,1194,310304~'
-script += 'c~r0101,1195,310305~e~r0110,1196,310306~n~r0116,1197,310307~t~r0101,1198,310308~e~r0114,1199,310309~'
-script += 'r~r032,1200,310310~ ~r0111,1201,310311~o~r0102,1202,310312~f~r032,1203,310313~ ~r0116,1204,310314~t~r0104,1205,310315~'
-script += 'h~r0101,1206,310316~e~r032,1207,310317~ ~r0104,1208,310318~h~r097,1209,310319~a~r0108,1210,310320~l~r1211,310321~'
-script += 'l~r032,1212,310322~ ~r0119,1213,310323~w~r0105,1214,310324~i~r0116,1215,310325~t~r0104,1216,310326~h'
-script += '~r032,1217,310327~ ~r099,1218,310328~c~r0105,1219,310329~i~r0114,1220,310330~r~r099,1221,310331~c~r0117,1222,310332~'
-script += 'u~r0108,1223,310333~l~r097,1224,310334~a~r0114,1225,310335~r~r032,1226,310336~ ~r0115,1227,310337~s~r0108,1228,310338~'
-script += 'l~r0111,1229,310339~o~r0116,1230,310340~t~r0115,1231,310341~s~r032,1232,310342~ ~r097,1233,310343~a~r0110,1234,310344~'
-script += 'n~r0100,1235,310345~d~r032,1236,310346~ ~r0117,1237,310347~u~r0110,1238,310348~n~r0117,1239,310349~u'
-script += '~r0115,1240,310350~s~r0117,1241,310351~u~r097,1242,310352~a~r0108,1243,310353~l~r032,1244,310354~ ~r0115,1245,310355~'
-script += 's~r0121,1246,310356~y~r0109,1247,310357~m~r098,1248,310358~b~r0111,1249,310359~o~r0108,1250,310360~l'
-script += '~r0115,1251,310361~s~r046,1252,310362~.~r032,1253,310363~ ~r1254,310364~ ~r073,1255,310365~I~r0116,1256,310366~'
-script += 't~r032,1257,310367~ ~r0114,1258,310368~r~r0101,1259,310369~e~r097,1260,310370~a~r0100,1261,310371~d~r0115,1262,310372~'
-script += 's~r058,1263,310373~:~r010,1264,310374~\n~r1265,310375~\n~r095,1266,310376~_~r032,1267,310377~ ~r043,1268,310378~'
-script += '+~r032,1269,310379~ ~r095,1270,310380~_~r032,1271,310381~ ~r042,1272,310382~*~r032,1273,310383~ ~r095,1274,310384~'
-script += '_~r094,1275,310385~^~r050,1276,310386~2~r032,1277,310387~ ~r043,1278,310388~+~r032,1279,310389~ ~r095,1280,310390~'
-script += '_~r094,1281,310391~^~r051,1282,310392~3~r032,1283,310393~ ~r045,1284,310394~-~r032,1285,310395~ ~r095,1286,310396~'
-script += '_~r032,1287,310397~ ~r061,1288,310398~=~r032,1289,310399~ ~r051,1290,310400~3~r057,1291,310401~9~r1292,310402~'
-script += '9~r010109,10,35,4101,50,60~\n~r04~\nThere are ~r052,110,210,332764,452,51~4~r04,10,20,35,4101,50~ ex'
-script += 'its:\n~r010403,327086,44,55814,627085~- ~r0110,310404,45,51528,610403~n~r0111,11,310405~o~r0114,12,310406~'
-script += 'r~r0116,13,310407~t~r0104,14,310408~h~r010403,10,327086,44,55814,627085~\n~r010409,11,327087~- ~r0115,10,310410,45,51528,610409~'
-script += 's~r0111,11,310411~o~r0117,12,310412~u~r0116,13,310413~t~r0104,14,310414~h~r010409,11,327087,44,55814,627085~'
-script += '\n~r010415,12,327088~- ~r0101,10,310416,51528,610415~e~r097,11,310417~a~r0115,12,310418~s~r0116,13,310419~'
-script += 't~r010415,12,327088,55814,627085~\n~r010420,13,327089~- ~r0119,10,310421,51528,610420~w~r0101,11,310422~'
-script += 'e~r0115,12,310423~s~r0116,13,310424~t~r010420,327089,55814,627085~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~e~r025976,51~a~r025977,497,52~'
-script += 's~r025978,4115,53~t~r025979,4116,54~\n~r032,20,35,4101,50~~moutput~\n\n~r02468,10,34~~v27322468~== ~r082,310606,45,51528,610605~'
-script += 'R~r0117,11,310607~u~r0105,12,310608~i~r0110,13,310609~n~r0115,14,310610~s~r010605,10,34,4101,50,60~ '
-script += '==\n~r089,310612,4138,51528,610611~Y~r0111,11,310613~o~r0117,12,310614~u~r032,13,310615~ ~r0115,14,310616~'
-script += 's~r0116,15,310617~t~r097,16,310618~a~r0110,17,310619~n~r0100,18,310620~d~r032,19,310621~ ~r0105,110,310622~'
-script += 'i~r0110,111,310623~n~r032,112,310624~ ~r0119,113,310625~w~r0104,114,310626~h~r097,115,310627~a~r0116,116,310628~'
-script += 't~r032,117,310629~ ~r0115,118,310630~s~r0101,119,310631~e~r120,310632~e~r0109,121,310633~m~r0115,122,310634~'
-script += 's~r032,123,310635~ ~r0116,124,310636~t~r0111,125,310637~o~r032,126,310638~ ~r0104,127,310639~h~r097,128,310640~'
-script += 'a~r0118,129,310641~v~r0101,130,310642~e~r032,131,310643~ ~r0111,132,310644~o~r0110,133,310645~n~r099,134,310646~'
-script += 'c~r0101,135,310647~e~r032,136,310648~ ~r098,137,310649~b~r0101,138,310650~e~r139,310651~e~r0110,140,310652~'
-script += 'n~r032,141,310653~ ~r097,142,310654~a~r032,143,310655~ ~r0100,144,310656~d~r0105,145,310657~i~r0110,146,310658~'
-script += 'n~r0105,147,310659~i~r0110,148,310660~n~r0103,149,310661~g~r032,150,310662~ ~r0104,151,310663~h~r097,152,310664~'
-script += 'a~r0108,153,310665~l~r154,310666~l~r059,155,310667~;~r032,156,310668~ ~r098,157,310669~b~r0114,158,310670~'
-script += 'r~r0111,159,310671~o~r0107,160,310672~k~r0101,161,310673~e~r0110,162,310674~n~r032,163,310675~ ~r0116,164,310676~'
-script += 't~r097,165,310677~a~r098,166,310678~b~r0108,167,310679~l~r0101,168,310680~e~r0115,169,310681~s~r032,170,310682~'
-script += ' ~r097,171,310683~a~r0110,172,310684~n~r0100,173,310685~d~r032,174,310686~ ~r0112,175,310687~p~r0111,176,310688~'
-script += 'o~r0116,177,310689~t~r178,310690~t~r0101,179,310691~e~r0114,180,310692~r~r0121,181,310693~y~r032,182,310694~'
-script += ' ~r097,183,310695~a~r0114,184,310696~r~r0101,185,310697~e~r032,186,310698~ ~r0115,187,310699~s~r099,188,310700~'
-script += 'c~r097,189,310701~a~r0116,190,310702~t~r191,310703~t~r0101,192,310704~e~r0114,193,310705~r~r0101,194,310706~'
-script += 'e~r0100,195,310707~d~r032,196,310708~ ~r0101,197,310709~e~r0118,198,310710~v~r0101,199,310711~e~r0114,1100,310712~'
-script += 'r~r0121,1101,310713~y~r0119,1102,310714~w~r0104,1103,310715~h~r0101,1104,310716~e~r0114,1105,310717~'
-script += 'r~r0101,1106,310718~e~r046,1107,310719~.~r032,1108,310720~ ~r1109,310721~ ~r065,1110,310722~A~r032,1111,310723~'
-script += ' ~r0115,1112,310724~s~r0116,1113,310725~t~r097,1114,310726~a~r0105,1115,310727~i~r0114,1116,310728~r'
-script += '~r099,1117,310729~c~r097,1118,310730~a~r0115,1119,310731~s~r0101,1120,310732~e~r032,1121,310733~ ~r0104,1122,310734~'
-script += 'h~r0101,1123,310735~e~r0114,1124,310736~r~r0101,1125,310737~e~r032,1126,310738~ ~r0108,1127,310739~l'
-script += '~r0101,1128,310740~e~r097,1129,310741~a~r0100,1130,310742~d~r0115,1131,310743~s~r032,1132,310744~ ~r0100,1133,310745~'
-script += 'd~r0111,1134,310746~o~r0119,1135,310747~w~r0110,1136,310748~n~r046,1137,310749~.~r010611,10,34,4101,50,60~'
-script += '\n~r010,19212,29212,327456,426,51531,627455~\n~r084,327457~T~r0104,327458~h~r0105,327459~i~r0110,327460~'
-script += 'n~r0103,327461~g~r0115,327462~s~r032,327463~ ~r0111,327464~o~r0102,327465~f~r032,327466~ ~r0105,327467~'
-script += 'i~r0110,327468~n~r0116,327469~t~r0101,327470~e~r0114,327471~r~r0101,327472~e~r0115,327473~s~r0116,327474~'
-script += 't~r032,327475~ ~r0104,327476~h~r0101,327477~e~r0114,327478~r~r0101,327479~e~r058,327480~:~r010,327481~'
-script += '\n~r018852,18,22468,31,416,55893,627381~- ~r099,10,318853,412,51528,618852~c~r0111,11,318854~o~r0110,12,318855~'
-script += 'n~r099,13,318856~c~r097,14,318857~a~r0118,15,318858~v~r0101,16,318859~e~r032,17,318860~ ~r099,18,318861~'
-script += 'c~r0111,19,318862~o~r0105,110,318863~i~r0110,111,318864~n~r018852,18,31,416,55893,627381~\n~r02,10,20,34,4101,50,60~'
-script += '\nThere are ~r050,110,210,332766,450,51~2~r02,10,20,34,4101,50~ exits:\n~r010750,327112,42,55814,627111~'
-script += '- ~r0100,310751,44,51528,610750~d~r0111,11,310752~o~r0119,12,310753~w~r0110,13,310754~n~r010750,10,327112,42,55814,627111~'
-script += '\n~r010755,11,327113~- ~r0119,10,310756,44,51528,610755~w~r0101,11,310757~e~r0115,12,310758~s~r0116,13,310759~'
-script += 't~r010755,11,327113,42,55814,627111~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~t~r025976,4116,51~a~r025977,497,52~k~r025978,4107,53~'
-script += 'e~r025979,4101,54~ ~r025980,432,55~c~r025981,499,56~o~r025982,4111,57~n~r025983,4110,58~c~r025984,499,59~'
-script += 'a~r025985,497,510~v~r025986,4118,511~e~r025987,4101,512~ ~r025988,432,513~c~r025989,499,514~o~r025990,4111,515~'
-script += 'i~r025991,4105,516~n~r025992,4110,517~\n~r032,20,34,4101,50~~moutput~\n\n~r084,114065,214065,328055,47,51531,628054~'
-script += '~v27020~T~r097,328056~a~r0107,328057~k~r0101,328058~e~r0110,328059~n~r046,328060~.~r010,328061~\n~r132613,232613,327415,417,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~d~r025976,4100,51~o~r025977,4111,52~'
-script += 'w~r025978,4119,53~n~r025979,4110,54~\n~r032,24,312,4101,50~~moutput~\n\n~r02473,10,20,34~~v27322473~'
-script += '== ~r082,310761,45,51528,610760~R~r0117,11,310762~u~r0105,12,310763~i~r0110,13,310764~n~r0115,14,310765~'
-script += 's~r010760,10,34,4101,50,60~ ==\n~r084,310767,4122,51528,610766~T~r0104,11,310768~h~r0105,12,310769~i'
-script += '~r0115,13,310770~s~r032,14,310771~ ~r0115,15,310772~s~r0101,16,310773~e~r17,310774~e~r0109,18,310775~'
-script += 'm~r0115,19,310776~s~r032,110,310777~ ~r0116,111,310778~t~r0111,112,310779~o~r032,113,310780~ ~r098,114,310781~'
-script += 'b~r0101,115,310782~e~r032,116,310783~ ~r097,117,310784~a~r032,118,310785~ ~r0107,119,310786~k~r0105,120,310787~'
-script += 'i~r0116,121,310788~t~r099,122,310789~c~r0104,123,310790~h~r0101,124,310791~e~r0110,125,310792~n~r059,126,310793~'
-script += ';~r032,127,310794~ ~r0116,128,310795~t~r0104,129,310796~h~r0101,130,310797~e~r0114,131,310798~r~r0101,132,310799~'
-script += 'e~r032,133,310800~ ~r097,134,310801~a~r0114,135,310802~r~r0101,136,310803~e~r032,137,310804~ ~r098,138,310805~'
-script += 'b~r0114,139,310806~r~r0105,140,310807~i~r099,141,310808~c~r0107,142,310809~k~r032,143,310810~ ~r0115,144,310811~'
-script += 's~r0116,145,310812~t~r0111,146,310813~o~r0118,147,310814~v~r0101,148,310815~e~r0115,149,310816~s~r032,150,310817~'
-script += ' ~r097,151,310818~a~r0110,152,310819~n~r0100,153,310820~d~r032,154,310821~ ~r0115,155,310822~s~r0104,156,310823~'
-script += 'h~r0101,157,310824~e~r0108,158,310825~l~r0118,159,310826~v~r0101,160,310827~e~r0115,161,310828~s~r032,162,310829~'
-script += ' ~r097,163,310830~a~r0108,164,310831~l~r0111,165,310832~o~r0110,166,310833~n~r0103,167,310834~g~r032,168,310835~'
-script += ' ~r0116,169,310836~t~r0104,170,310837~h~r0101,171,310838~e~r032,172,310839~ ~r0119,173,310840~w~r097,174,310841~'
-script += 'a~r0108,175,310842~l~r176,310843~l~r046,177,310844~.~r032,178,310845~ ~r179,310846~ ~r069,180,310847~'
-script += 'E~r0118,181,310848~v~r0101,182,310849~e~r0114,183,310850~r~r0121,184,310851~y~r0116,185,310852~t~r0104,186,310853~'
-script += 'h~r0105,187,310854~i~r0110,188,310855~n~r0103,189,310856~g~r032,190,310857~ ~r0104,191,310858~h~r0101,192,310859~'
-script += 'e~r0114,193,310860~r~r0101,194,310861~e~r032,195,310862~ ~r0104,196,310863~h~r097,197,310864~a~r0115,198,310865~'
-script += 's~r032,199,310866~ ~r0102,1100,310867~f~r097,1101,310868~a~r0108,1102,310869~l~r1103,310870~l~r0101,1104,310871~'
-script += 'e~r0110,1105,310872~n~r032,1106,310873~ ~r0105,1107,310874~i~r0110,1108,310875~n~r0116,1109,310876~t'
-script += '~r0111,1110,310877~o~r032,1111,310878~ ~r0100,1112,310879~d~r0105,1113,310880~i~r0115,1114,310881~s~r0114,1115,310882~'
-script += 'r~r0101,1116,310883~e~r0112,1117,310884~p~r097,1118,310885~a~r0105,1119,310886~i~r0114,1120,310887~r'
-script += '~r046,1121,310888~.~r010766,10,34,4101,50,60~\n~r010,19212,29212,327456,426,51531,627455~\n~r084,327457~'
-script += 'T~r0104,327458~h~r0105,327459~i~r0110,327460~n~r0103,327461~g~r0115,327462~s~r032,327463~ ~r0111,327464~'
-script += 'o~r0102,327465~f~r032,327466~ ~r0105,327467~i~r0110,327468~n~r0116,327469~t~r0101,327470~e~r0114,327471~'
-script += 'r~r0101,327472~e~r0115,327473~s~r0116,327474~t~r032,327475~ ~r0104,327476~h~r0101,327477~e~r0114,327478~'
-script += 'r~r0101,327479~e~r058,327480~:~r010,327481~\n~r018691,16,22473,31,416,55893,627381~- ~r099,10,318692,413,51528,618691~'
-script += 'c~r0111,11,318693~o~r0114,12,318694~r~r13,318695~r~r0111,14,318696~o~r0100,15,318697~d~r0101,16,318698~'
-script += 'e~r0100,17,318699~d~r032,18,318700~ ~r099,19,318701~c~r0111,110,318702~o~r0105,111,318703~i~r0110,112,318704~'
-script += 'n~r018691,16,31,416,55893,627381~\n~r01,10,21,34,4101,50,60~\nThere is ~r049,110,210,332767,449,51~1'
-script += '~r01,10,21,34,4101,50~ exit:\n~r010889,327118,41,55814,627117~- ~r0117,310890,42,51528,610889~u~r0112,11,310891~'
-script += 'p~r010889,10,327118,41,55814,627117~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~t~r025976,4116,51~a~r025977,497,52~k~r025978,4107,53~'
-script += 'e~r025979,4101,54~ ~r025980,432,55~c~r025981,499,56~o~r025982,4111,57~r~r025983,4114,58~r~r025984,59~'
-script += 'o~r025985,4111,510~d~r025986,4100,511~e~r025987,4101,512~d~r025988,4100,513~ ~r025989,432,514~c~r025990,499,515~'
-script += 'o~r025991,4111,516~i~r025992,4105,517~n~r025993,4110,518~\n~r032,20,34,4101,50~~moutput~\n\n~r084,114065,214065,328055,47,51531,628054~'
-script += '~v26940~T~r097,328056~a~r0107,328057~k~r0101,328058~e~r0110,328059~n~r046,328060~.~r010,328061~\n~r132613,232613,327415,417,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~u~r025976,4117,51~p~r025977,4112,52~'
-script += '\n~r032,24,313,4101,50~~moutput~\n\n~r02468,10,20,32~~v27322468~== ~r082,310606,45,51528,610605~R~r0117,11,310607~'
-script += 'u~r0105,12,310608~i~r0110,13,310609~n~r0115,14,310610~s~r010605,10,32,4101,50,60~ ==\n~r089,310612,4138,51528,610611~'
-script += 'Y~r0111,11,310613~o~r0117,12,310614~u~r032,13,310615~ ~r0115,14,310616~s~r0116,15,310617~t~r097,16,310618~'
-script += 'a~r0110,17,310619~n~r0100,18,310620~d~r032,19,310621~ ~r0105,110,310622~i~r0110,111,310623~n~r032,112,310624~'
-script += ' ~r0119,113,310625~w~r0104,114,310626~h~r097,115,310627~a~r0116,116,310628~t~r032,117,310629~ ~r0115,118,310630~'
-script += 's~r0101,119,310631~e~r120,310632~e~r0109,121,310633~m~r0115,122,310634~s~r032,123,310635~ ~r0116,124,310636~'
-script += 't~r0111,125,310637~o~r032,126,310638~ ~r0104,127,310639~h~r097,128,310640~a~r0118,129,310641~v~r0101,130,310642~'
-script += 'e~r032,131,310643~ ~r0111,132,310644~o~r0110,133,310645~n~r099,134,310646~c~r0101,135,310647~e~r032,136,310648~'
-script += ' ~r098,137,310649~b~r0101,138,310650~e~r139,310651~e~r0110,140,310652~n~r032,141,310653~ ~r097,142,310654~'
-script += 'a~r032,143,310655~ ~r0100,144,310656~d~r0105,145,310657~i~r0110,146,310658~n~r0105,147,310659~i~r0110,148,310660~'
-script += 'n~r0103,149,310661~g~r032,150,310662~ ~r0104,151,310663~h~r097,152,310664~a~r0108,153,310665~l~r154,310666~'
-script += 'l~r059,155,310667~;~r032,156,310668~ ~r098,157,310669~b~r0114,158,310670~r~r0111,159,310671~o~r0107,160,310672~'
-script += 'k~r0101,161,310673~e~r0110,162,310674~n~r032,163,310675~ ~r0116,164,310676~t~r097,165,310677~a~r098,166,310678~'
-script += 'b~r0108,167,310679~l~r0101,168,310680~e~r0115,169,310681~s~r032,170,310682~ ~r097,171,310683~a~r0110,172,310684~'
-script += 'n~r0100,173,310685~d~r032,174,310686~ ~r0112,175,310687~p~r0111,176,310688~o~r0116,177,310689~t~r178,310690~'
-script += 't~r0101,179,310691~e~r0114,180,310692~r~r0121,181,310693~y~r032,182,310694~ ~r097,183,310695~a~r0114,184,310696~'
-script += 'r~r0101,185,310697~e~r032,186,310698~ ~r0115,187,310699~s~r099,188,310700~c~r097,189,310701~a~r0116,190,310702~'
-script += 't~r191,310703~t~r0101,192,310704~e~r0114,193,310705~r~r0101,194,310706~e~r0100,195,310707~d~r032,196,310708~'
-script += ' ~r0101,197,310709~e~r0118,198,310710~v~r0101,199,310711~e~r0114,1100,310712~r~r0121,1101,310713~y~r0119,1102,310714~'
-script += 'w~r0104,1103,310715~h~r0101,1104,310716~e~r0114,1105,310717~r~r0101,1106,310718~e~r046,1107,310719~.'
-script += '~r032,1108,310720~ ~r1109,310721~ ~r065,1110,310722~A~r032,1111,310723~ ~r0115,1112,310724~s~r0116,1113,310725~'
-script += 't~r097,1114,310726~a~r0105,1115,310727~i~r0114,1116,310728~r~r099,1117,310729~c~r097,1118,310730~a~r0115,1119,310731~'
-script += 's~r0101,1120,310732~e~r032,1121,310733~ ~r0104,1122,310734~h~r0101,1123,310735~e~r0114,1124,310736~r'
-script += '~r0101,1125,310737~e~r032,1126,310738~ ~r0108,1127,310739~l~r0101,1128,310740~e~r097,1129,310741~a~r0100,1130,310742~'
-script += 'd~r0115,1131,310743~s~r032,1132,310744~ ~r0100,1133,310745~d~r0111,1134,310746~o~r0119,1135,310747~w'
-script += '~r0110,1136,310748~n~r046,1137,310749~.~r010611,10,32,4101,50,60~\n~r02~\nThere are ~r050,110,210,332766,450,51~'
-script += '2~r02,10,20,32,4101,50~ exits:\n~r010750,327112,42,55814,627111~- ~r0100,310751,44,51528,610750~d~r0111,11,310752~'
-script += 'o~r0119,12,310753~w~r0110,13,310754~n~r010750,10,327112,42,55814,627111~\n~r010755,11,327113~- ~r0119,10,310756,44,51528,610755~'
-script += 'w~r0101,11,310757~e~r0115,12,310758~s~r0116,13,310759~t~r010755,11,327113,42,55814,627111~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~w~r025976,4119,51~e~r025977,4101,52~'
-script += 's~r025978,4115,53~t~r025979,4116,54~\n~r032,20,32,4101,50~~moutput~\n\n~r02457,10,34~~v27322457~== ~r082,310104,45,51528,610103~'
-script += 'R~r0117,11,310105~u~r0105,12,310106~i~r0110,13,310107~n~r0115,14,310108~s~r010103,10,34,4101,50,60~ '
-script += '==\n~r089,310110,4293,51528,610109~Y~r0111,11,310111~o~r0117,12,310112~u~r032,13,310113~ ~r0115,14,310114~'
-script += 's~r0116,15,310115~t~r097,16,310116~a~r0110,17,310117~n~r0100,18,310118~d~r032,19,310119~ ~r0105,110,310120~'
-script += 'i~r0110,111,310121~n~r032,112,310122~ ~r0116,113,310123~t~r0104,114,310124~h~r0101,115,310125~e~r032,116,310126~'
-script += ' ~r0109,117,310127~m~r097,118,310128~a~r0115,119,310129~s~r120,310130~s~r0105,121,310131~i~r0118,122,310132~'
-script += 'v~r0101,123,310133~e~r032,124,310134~ ~r099,125,310135~c~r0101,126,310136~e~r0110,127,310137~n~r0116,128,310138~'
-script += 't~r0114,129,310139~r~r097,130,310140~a~r0108,131,310141~l~r032,132,310142~ ~r0104,133,310143~h~r097,134,310144~'
-script += 'a~r0108,135,310145~l~r136,310146~l~r032,137,310147~ ~r0111,138,310148~o~r0102,139,310149~f~r032,140,310150~'
-script += ' ~r0116,141,310151~t~r0104,142,310152~h~r0101,143,310153~e~r0115,144,310154~s~r0101,145,310155~e~r032,146,310156~'
-script += ' ~r0114,147,310157~r~r0117,148,310158~u~r0105,149,310159~i~r0110,150,310160~n~r0115,151,310161~s~r046,152,310162~'
-script += '.~r032,153,310163~ ~r154,310164~ ~r084,155,310165~T~r0104,156,310166~h~r0101,157,310167~e~r032,158,310168~'
-script += ' ~r0119,159,310169~w~r097,160,310170~a~r0108,161,310171~l~r162,310172~l~r0115,163,310173~s~r032,164,310174~'
-script += ' ~r097,165,310175~a~r0114,166,310176~r~r0101,167,310177~e~r032,168,310178~ ~r099,169,310179~c~r0114,170,310180~'
-script += 'r~r0117,171,310181~u~r0109,172,310182~m~r098,173,310183~b~r0108,174,310184~l~r0105,175,310185~i~r0110,176,310186~'
-script += 'n~r0103,177,310187~g~r044,178,310188~,~r032,179,310189~ ~r097,180,310190~a~r0110,181,310191~n~r0100,182,310192~'
-script += 'd~r032,183,310193~ ~r0118,184,310194~v~r0101,185,310195~e~r0103,186,310196~g~r0101,187,310197~e~r0116,188,310198~'
-script += 't~r097,189,310199~a~r0116,190,310200~t~r0105,191,310201~i~r0111,192,310202~o~r0110,193,310203~n~r032,194,310204~'
-script += ' ~r0104,195,310205~h~r097,196,310206~a~r0115,197,310207~s~r032,198,310208~ ~r099,199,310209~c~r0108,1100,310210~'
-script += 'l~r0101,1101,310211~e~r097,1102,310212~a~r0114,1103,310213~r~r0108,1104,310214~l~r0121,1105,310215~y'
-script += '~r032,1106,310216~ ~r0116,1107,310217~t~r097,1108,310218~a~r0107,1109,310219~k~r0101,1110,310220~e~r0110,1111,310221~'
-script += 'n~r032,1112,310222~ ~r0111,1113,310223~o~r0118,1114,310224~v~r0101,1115,310225~e~r0114,1116,310226~r'
-script += '~r046,1117,310227~.~r032,1118,310228~ ~r1119,310229~ ~r082,1120,310230~R~r0111,1121,310231~o~r1122,310232~'
-script += 'o~r0109,1123,310233~m~r0115,1124,310234~s~r032,1125,310235~ ~r097,1126,310236~a~r0114,1127,310237~r~r0101,1128,310238~'
-script += 'e~r032,1129,310239~ ~r097,1130,310240~a~r0116,1131,310241~t~r1132,310242~t~r097,1133,310243~a~r099,1134,310244~'
-script += 'c~r0104,1135,310245~h~r0101,1136,310246~e~r0100,1137,310247~d~r032,1138,310248~ ~r0105,1139,310249~i'
-script += '~r0110,1140,310250~n~r032,1141,310251~ ~r097,1142,310252~a~r0108,1143,310253~l~r1144,310254~l~r032,1145,310255~'
-script += ' ~r0100,1146,310256~d~r0105,1147,310257~i~r0114,1148,310258~r~r0101,1149,310259~e~r099,1150,310260~c'
-script += '~r0116,1151,310261~t~r0105,1152,310262~i~r0111,1153,310263~o~r0110,1154,310264~n~r0115,1155,310265~s'
-script += '~r046,1156,310266~.~r032,1157,310267~ ~r1158,310268~ ~r084,1159,310269~T~r0104,1160,310270~h~r0101,1161,310271~'
-script += 'e~r0114,1162,310272~r~r0101,1163,310273~e~r032,1164,310274~ ~r0105,1165,310275~i~r0115,1166,310276~s'
-script += '~r032,1167,310277~ ~r097,1168,310278~a~r032,1169,310279~ ~r0115,1170,310280~s~r0116,1171,310281~t~r0114,1172,310282~'
-script += 'r~r097,1173,310283~a~r0110,1174,310284~n~r0103,1175,310285~g~r0101,1176,310286~e~r032,1177,310287~ ~r0109,1178,310288~'
-script += 'm~r0111,1179,310289~o~r0110,1180,310290~n~r0117,1181,310291~u~r0109,1182,310292~m~r0101,1183,310293~'
-script += 'e~r0110,1184,310294~n~r0116,1185,310295~t~r032,1186,310296~ ~r0105,1187,310297~i~r0110,1188,310298~n'
-script += '~r032,1189,310299~ ~r0116,1190,310300~t~r0104,1191,310301~h~r0101,1192,310302~e~r032,1193,310303~ ~r099,1194,310304~'
-script += 'c~r0101,1195,310305~e~r0110,1196,310306~n~r0116,1197,310307~t~r0101,1198,310308~e~r0114,1199,310309~'
-script += 'r~r032,1200,310310~ ~r0111,1201,310311~o~r0102,1202,310312~f~r032,1203,310313~ ~r0116,1204,310314~t~r0104,1205,310315~'
-script += 'h~r0101,1206,310316~e~r032,1207,310317~ ~r0104,1208,310318~h~r097,1209,310319~a~r0108,1210,310320~l~r1211,310321~'
-script += 'l~r032,1212,310322~ ~r0119,1213,310323~w~r0105,1214,310324~i~r0116,1215,310325~t~r0104,1216,310326~h'
-script += '~r032,1217,310327~ ~r099,1218,310328~c~r0105,1219,310329~i~r0114,1220,310330~r~r099,1221,310331~c~r0117,1222,310332~'
-script += 'u~r0108,1223,310333~l~r097,1224,310334~a~r0114,1225,310335~r~r032,1226,310336~ ~r0115,1227,310337~s~r0108,1228,310338~'
-script += 'l~r0111,1229,310339~o~r0116,1230,310340~t~r0115,1231,310341~s~r032,1232,310342~ ~r097,1233,310343~a~r0110,1234,310344~'
-script += 'n~r0100,1235,310345~d~r032,1236,310346~ ~r0117,1237,310347~u~r0110,1238,310348~n~r0117,1239,310349~u'
-script += '~r0115,1240,310350~s~r0117,1241,310351~u~r097,1242,310352~a~r0108,1243,310353~l~r032,1244,310354~ ~r0115,1245,310355~'
-script += 's~r0121,1246,310356~y~r0109,1247,310357~m~r098,1248,310358~b~r0111,1249,310359~o~r0108,1250,310360~l'
-script += '~r0115,1251,310361~s~r046,1252,310362~.~r032,1253,310363~ ~r1254,310364~ ~r073,1255,310365~I~r0116,1256,310366~'
-script += 't~r032,1257,310367~ ~r0114,1258,310368~r~r0101,1259,310369~e~r097,1260,310370~a~r0100,1261,310371~d~r0115,1262,310372~'
-script += 's~r058,1263,310373~:~r010,1264,310374~\n~r1265,310375~\n~r095,1266,310376~_~r032,1267,310377~ ~r043,1268,310378~'
-script += '+~r032,1269,310379~ ~r095,1270,310380~_~r032,1271,310381~ ~r042,1272,310382~*~r032,1273,310383~ ~r095,1274,310384~'
-script += '_~r094,1275,310385~^~r050,1276,310386~2~r032,1277,310387~ ~r043,1278,310388~+~r032,1279,310389~ ~r095,1280,310390~'
-script += '_~r094,1281,310391~^~r051,1282,310392~3~r032,1283,310393~ ~r045,1284,310394~-~r032,1285,310395~ ~r095,1286,310396~'
-script += '_~r032,1287,310397~ ~r061,1288,310398~=~r032,1289,310399~ ~r051,1290,310400~3~r057,1291,310401~9~r1292,310402~'
-script += '9~r010109,10,34,4101,50,60~\n~r04~\nThere are ~r052,110,210,332764,452,51~4~r04,10,20,34,4101,50~ ex'
-script += 'its:\n~r010403,327086,44,55814,627085~- ~r0110,310404,45,51528,610403~n~r0111,11,310405~o~r0114,12,310406~'
-script += 'r~r0116,13,310407~t~r0104,14,310408~h~r010403,10,327086,44,55814,627085~\n~r010409,11,327087~- ~r0115,10,310410,45,51528,610409~'
-script += 's~r0111,11,310411~o~r0117,12,310412~u~r0116,13,310413~t~r0104,14,310414~h~r010409,11,327087,44,55814,627085~'
-script += '\n~r010415,12,327088~- ~r0101,10,310416,51528,610415~e~r097,11,310417~a~r0115,12,310418~s~r0116,13,310419~'
-script += 't~r010415,12,327088,55814,627085~\n~r010420,13,327089~- ~r0119,10,310421,51528,610420~w~r0101,11,310422~'
-script += 'e~r0115,12,310423~s~r0116,13,310424~t~r010420,327089,55814,627085~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~w~r025976,4119,51~e~r025977,4101,52~'
-script += 's~r025978,4115,53~t~r025979,4116,54~\n~r032,20,34,4101,50~~moutput~\n\n~r02478,10~~v27322478~== ~r082,310893,45,51528,610892~'
-script += 'R~r0117,11,310894~u~r0105,12,310895~i~r0110,13,310896~n~r0115,14,310897~s~r010892,10,34,4101,50,60~ '
-script += '==\n~r089,310899,4179,51528,610898~Y~r0111,11,310900~o~r0117,12,310901~u~r032,13,310902~ ~r0102,14,310903~'
-script += 'f~r0105,15,310904~i~r0110,16,310905~n~r0100,17,310906~d~r032,18,310907~ ~r0121,19,310908~y~r0111,110,310909~'
-script += 'o~r0117,111,310910~u~r0114,112,310911~r~r0115,113,310912~s~r0101,114,310913~e~r0108,115,310914~l~r0102,116,310915~'
-script += 'f~r032,117,310916~ ~r0105,118,310917~i~r0110,119,310918~n~r032,120,310919~ ~r0119,121,310920~w~r0104,122,310921~'
-script += 'h~r097,123,310922~a~r0116,124,310923~t~r032,125,310924~ ~r0119,126,310925~w~r097,127,310926~a~r0115,128,310927~'
-script += 's~r032,129,310928~ ~r0111,130,310929~o~r0110,131,310930~n~r099,132,310931~c~r0101,133,310932~e~r032,134,310933~'
-script += ' ~r0116,135,310934~t~r0104,136,310935~h~r0101,137,310936~e~r032,138,310937~ ~r0108,139,310938~l~r0105,140,310939~'
-script += 'i~r0118,141,310940~v~r0105,142,310941~i~r0110,143,310942~n~r0103,144,310943~g~r032,145,310944~ ~r0113,146,310945~'
-script += 'q~r0117,147,310946~u~r097,148,310947~a~r0114,149,310948~r~r0116,150,310949~t~r0101,151,310950~e~r0114,152,310951~'
-script += 'r~r0115,153,310952~s~r032,154,310953~ ~r0102,155,310954~f~r0111,156,310955~o~r0114,157,310956~r~r032,158,310957~'
-script += ' ~r0116,159,310958~t~r0104,160,310959~h~r0101,161,310960~e~r032,162,310961~ ~r099,163,310962~c~r0111,164,310963~'
-script += 'o~r0109,165,310964~m~r0112,166,310965~p~r0108,167,310966~l~r0101,168,310967~e~r0120,169,310968~x~r046,170,310969~'
-script += '.~r032,171,310970~ ~r172,310971~ ~r077,173,310972~M~r097,174,310973~a~r0110,175,310974~n~r0121,176,310975~'
-script += 'y~r032,177,310976~ ~r0115,178,310977~s~r0109,179,310978~m~r097,180,310979~a~r0108,181,310980~l~r182,310981~'
-script += 'l~r0101,183,310982~e~r0114,184,310983~r~r032,185,310984~ ~r0114,186,310985~r~r0111,187,310986~o~r188,310987~'
-script += 'o~r0109,189,310988~m~r0115,190,310989~s~r032,191,310990~ ~r0119,192,310991~w~r0104,193,310992~h~r0105,194,310993~'
-script += 'i~r099,195,310994~c~r0104,196,310995~h~r032,197,310996~ ~r0111,198,310997~o~r0110,199,310998~n~r099,1100,310999~'
-script += 'c~r0101,1101,311000~e~r032,1102,311001~ ~r0104,1103,311002~h~r097,1104,311003~a~r0100,1105,311004~d~r032,1106,311005~'
-script += ' ~r0119,1107,311006~w~r097,1108,311007~a~r0108,1109,311008~l~r1110,311009~l~r0115,1111,311010~s~r032,1112,311011~'
-script += ' ~r0116,1113,311012~t~r0111,1114,311013~o~r032,1115,311014~ ~r0100,1116,311015~d~r0105,1117,311016~i'
-script += '~r0118,1118,311017~v~r0105,1119,311018~i~r0100,1120,311019~d~r0101,1121,311020~e~r032,1122,311021~ ~r0116,1123,311022~'
-script += 't~r0104,1124,311023~h~r0101,1125,311024~e~r0109,1126,311025~m~r032,1127,311026~ ~r0110,1128,311027~n'
-script += '~r0111,1129,311028~o~r0119,1130,311029~w~r032,1131,311030~ ~r0108,1132,311031~l~r097,1133,311032~a~r0121,1134,311033~'
-script += 'y~r032,1135,311034~ ~r0105,1136,311035~i~r0110,1137,311036~n~r032,1138,311037~ ~r0100,1139,311038~d~r0105,1140,311039~'
-script += 'i~r0115,1141,311040~s~r097,1142,311041~a~r0114,1143,311042~r~r1144,311043~r~r097,1145,311044~a~r0121,1146,311045~'
-script += 'y~r046,1147,311046~.~r032,1148,311047~ ~r1149,311048~ ~r084,1150,311049~T~r0104,1151,311050~h~r0101,1152,311051~'
-script += 'e~r0114,1153,311052~r~r0101,1154,311053~e~r032,1155,311054~ ~r0105,1156,311055~i~r0115,1157,311056~s'
-script += '~r032,1158,311057~ ~r097,1159,311058~a~r032,1160,311059~ ~r0115,1161,311060~s~r0116,1162,311061~t~r097,1163,311062~'
-script += 'a~r0105,1164,311063~i~r0114,1165,311064~r~r099,1166,311065~c~r097,1167,311066~a~r0115,1168,311067~s~r0101,1169,311068~'
-script += 'e~r032,1170,311069~ ~r0117,1171,311070~u~r0112,1172,311071~p~r032,1173,311072~ ~r0104,1174,311073~h~r0101,1175,311074~'
-script += 'e~r0114,1176,311075~r~r0101,1177,311076~e~r046,1178,311077~.~r010898,10,34,4101,50,60~\n~r010,19212,29212,327456,426,51531,627455~'
-script += '\n~r084,327457~T~r0104,327458~h~r0105,327459~i~r0110,327460~n~r0103,327461~g~r0115,327462~s~r032,327463~'
-script += ' ~r0111,327464~o~r0102,327465~f~r032,327466~ ~r0105,327467~i~r0110,327468~n~r0116,327469~t~r0101,327470~'
-script += 'e~r0114,327471~r~r0101,327472~e~r0115,327473~s~r0116,327474~t~r032,327475~ ~r0104,327476~h~r0101,327477~'
-script += 'e~r0114,327478~r~r0101,327479~e~r058,327480~:~r010,327481~\n~r018953,19,22478,31,416,55893,627381~- '
-script += '~r098,10,318954,49,51528,618953~b~r0108,11,318955~l~r0117,12,318956~u~r0101,13,318957~e~r032,14,318958~'
-script += ' ~r099,15,318959~c~r0111,16,318960~o~r0105,17,318961~i~r0110,18,318962~n~r018953,19,31,416,55893,627381~'
-script += '\n~r02,10,20,34,4101,50,60~\nThere are ~r050,110,210,332766,450,51~2~r02,10,20,34,4101,50~ exits:\n~r011078,327122,42,55814,627121~'
-script += '- ~r0117,311079,51528,611078~u~r0112,11,311080~p~r011078,10,327122,55814,627121~\n~r011081,11,327123~'
-script += '- ~r0101,10,311082,44,51528,611081~e~r097,11,311083~a~r0115,12,311084~s~r0116,13,311085~t~r011081,11,327123,42,55814,627121~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~t~r025976,4116,51~a~r025977,497,52~k~r025978,4107,53~e~r025979,4101,54~ ~r025980,432,55~b~r025981,498,56~'
-script += 'l~r025982,4108,57~u~r025983,4117,58~e~r025984,4101,59~ ~r025985,432,510~c~r025986,499,511~o~r025987,4111,512~'
-script += 'i~r025988,4105,513~n~r025989,4110,514~\n~r032,20,34,4101,50~~moutput~\n\n~r084,114065,214065,328055,47,51531,628054~'
-script += '~v27060~T~r097,328056~a~r0107,328057~k~r0101,328058~e~r0110,328059~n~r046,328060~.~r010,328061~\n~r132613,232613,327415,417,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~u~r025976,4117,51~p~r025977,4112,52~'
-script += '\n~r032,24,39,4101,50~~moutput~\n\n~r02483,10,20,32~~v27322483~== ~r082,311087,45,51528,611086~R~r0117,11,311088~'
-script += 'u~r0105,12,311089~i~r0110,13,311090~n~r0115,14,311091~s~r011086,10,32,4101,50,60~ ==\n~r084,311093,4169,51528,611092~'
-script += 'T~r0104,11,311094~h~r0105,12,311095~i~r0115,13,311096~s~r032,14,311097~ ~r0119,15,311098~w~r097,16,311099~'
-script += 'a~r0115,17,311100~s~r032,18,311101~ ~r0108,19,311102~l~r0111,110,311103~o~r0110,111,311104~n~r0103,112,311105~'
-script += 'g~r032,113,311106~ ~r097,114,311107~a~r0103,115,311108~g~r0111,116,311109~o~r032,117,311110~ ~r097,118,311111~'
-script += 'a~r032,119,311112~ ~r0108,120,311113~l~r097,121,311114~a~r0118,122,311115~v~r0105,123,311116~i~r0115,124,311117~'
-script += 's~r0104,125,311118~h~r032,126,311119~ ~r0116,127,311120~t~r0104,128,311121~h~r0114,129,311122~r~r0111,130,311123~'
-script += 'o~r0110,131,311124~n~r0101,132,311125~e~r032,133,311126~ ~r0114,134,311127~r~r0111,135,311128~o~r136,311129~'
-script += 'o~r0109,137,311130~m~r046,138,311131~.~r032,139,311132~ ~r140,311133~ ~r068,141,311134~D~r0114,142,311135~'
-script += 'r~r0105,143,311136~i~r0101,144,311137~e~r0100,145,311138~d~r045,146,311139~-~r0117,147,311140~u~r0112,148,311141~'
-script += 'p~r032,149,311142~ ~r0102,150,311143~f~r0111,151,311144~o~r0117,152,311145~u~r0110,153,311146~n~r0116,154,311147~'
-script += 't~r097,155,311148~a~r0105,156,311149~i~r0110,157,311150~n~r0115,158,311151~s~r032,159,311152~ ~r097,160,311153~'
-script += 'a~r0110,161,311154~n~r0100,162,311155~d~r032,163,311156~ ~r099,164,311157~c~r0114,165,311158~r~r0117,166,311159~'
-script += 'u~r0109,167,311160~m~r098,168,311161~b~r0108,169,311162~l~r0105,170,311163~i~r0110,171,311164~n~r0103,172,311165~'
-script += 'g~r032,173,311166~ ~r0115,174,311167~s~r0116,175,311168~t~r097,176,311169~a~r0116,177,311170~t~r0117,178,311171~'
-script += 'u~r0101,179,311172~e~r0115,180,311173~s~r032,181,311174~ ~r0108,182,311175~l~r0105,183,311176~i~r0110,184,311177~'
-script += 'n~r0101,185,311178~e~r032,186,311179~ ~r0116,187,311180~t~r0104,188,311181~h~r0101,189,311182~e~r032,190,311183~'
-script += ' ~r0119,191,311184~w~r097,192,311185~a~r0108,193,311186~l~r194,311187~l~r0115,195,311188~s~r044,196,311189~'
-script += ',~r032,197,311190~ ~r097,198,311191~a~r0110,199,311192~n~r0100,1100,311193~d~r032,1101,311194~ ~r0116,1102,311195~'
-script += 't~r0104,1103,311196~h~r0101,1104,311197~e~r032,1105,311198~ ~r099,1106,311199~c~r097,1107,311200~a~r0114,1108,311201~'
-script += 'r~r0118,1109,311202~v~r0101,1110,311203~e~r0100,1111,311204~d~r032,1112,311205~ ~r0115,1113,311206~s'
-script += '~r0116,1114,311207~t~r0111,1115,311208~o~r0110,1116,311209~n~r0101,1117,311210~e~r032,1118,311211~ ~r0116,1119,311212~'
-script += 't~r0104,1120,311213~h~r0114,1121,311214~r~r0111,1122,311215~o~r0110,1123,311216~n~r0101,1124,311217~'
-script += 'e~r032,1125,311218~ ~r0105,1126,311219~i~r0110,1127,311220~n~r032,1128,311221~ ~r0116,1129,311222~t~r0104,1130,311223~'
-script += 'h~r0101,1131,311224~e~r032,1132,311225~ ~r099,1133,311226~c~r0101,1134,311227~e~r0110,1135,311228~n~r0116,1136,311229~'
-script += 't~r0101,1137,311230~e~r0114,1138,311231~r~r032,1139,311232~ ~r0111,1140,311233~o~r0102,1141,311234~f'
-script += '~r032,1142,311235~ ~r0116,1143,311236~t~r0104,1144,311237~h~r0101,1145,311238~e~r032,1146,311239~ ~r0114,1147,311240~'
-script += 'r~r0111,1148,311241~o~r1149,311242~o~r0109,1150,311243~m~r032,1151,311244~ ~r0105,1152,311245~i~r0115,1153,311246~'
-script += 's~r032,1154,311247~ ~r0102,1155,311248~f~r097,1156,311249~a~r0108,1157,311250~l~r1158,311251~l~r0105,1159,311252~'
-script += 'i~r0110,1160,311253~n~r0103,1161,311254~g~r032,1162,311255~ ~r097,1163,311256~a~r0112,1164,311257~p~r097,1165,311258~'
-script += 'a~r0114,1166,311259~r~r0116,1167,311260~t~r046,1168,311261~.~r011092,10,32,4101,50,60~\n~r010,19212,29212,327456,426,51531,627455~'
-script += '\n~r084,327457~T~r0104,327458~h~r0105,327459~i~r0110,327460~n~r0103,327461~g~r0115,327462~s~r032,327463~'
-script += ' ~r0111,327464~o~r0102,327465~f~r032,327466~ ~r0105,327467~i~r0110,327468~n~r0116,327469~t~r0101,327470~'
-script += 'e~r0114,327471~r~r0101,327472~e~r0115,327473~s~r0116,327474~t~r032,327475~ ~r0104,327476~h~r0101,327477~'
-script += 'e~r0114,327478~r~r0101,327479~e~r058,327480~:~r010,327481~\n~r018769,17,22483,31,416,55893,627381~- '
-script += '~r0115,10,318770,410,51528,618769~s~r0104,11,318771~h~r0105,12,318772~i~r0110,13,318773~n~r0121,14,318774~'
-script += 'y~r032,15,318775~ ~r099,16,318776~c~r0111,17,318777~o~r0105,18,318778~i~r0110,19,318779~n~r018769,17,31,416,55893,627381~'
-script += '\n~r01,10,21,32,4101,50,60~\nThere is ~r049,110,210,332767,449,51~1~r01,10,21,32,4101,50~ exit:\n~r011262,327128,41,55814,627127~'
-script += '- ~r0100,311263,44,51528,611262~d~r0111,11,311264~o~r0119,12,311265~w~r0110,13,311266~n~r011262,10,327128,41,55814,627127~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~t~r025976,4116,51~a~r025977,497,52~k~r025978,4107,53~e~r025979,4101,54~ ~r025980,432,55~s~r025981,4115,56~'
-script += 'h~r025982,4104,57~i~r025983,4105,58~n~r025984,4110,59~y~r025985,4121,510~ ~r025986,432,511~c~r025987,499,512~'
-script += 'o~r025988,4111,513~i~r025989,4105,514~n~r025990,4110,515~\n~r032,20,32,4101,50~~moutput~\n\n~r084,114065,214065,328055,47,51531,628054~'
-script += '~v26980~T~r097,328056~a~r0107,328057~k~r0101,328058~e~r0110,328059~n~r046,328060~.~r010,328061~\n~r132613,232613,327415,417,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~d~r025976,4100,51~o~r025977,4111,52~'
-script += 'w~r025978,4119,53~n~r025979,4110,54~\n~r032,24,310,4101,50~~moutput~\n\n~r02478,10,20,34~~v27322478~'
-script += '== ~r082,310893,45,51528,610892~R~r0117,11,310894~u~r0105,12,310895~i~r0110,13,310896~n~r0115,14,310897~'
-script += 's~r010892,10,34,4101,50,60~ ==\n~r089,310899,4179,51528,610898~Y~r0111,11,310900~o~r0117,12,310901~u'
-script += '~r032,13,310902~ ~r0102,14,310903~f~r0105,15,310904~i~r0110,16,310905~n~r0100,17,310906~d~r032,18,310907~'
-script += ' ~r0121,19,310908~y~r0111,110,310909~o~r0117,111,310910~u~r0114,112,310911~r~r0115,113,310912~s~r0101,114,310913~'
-script += 'e~r0108,115,310914~l~r0102,116,310915~f~r032,117,310916~ ~r0105,118,310917~i~r0110,119,310918~n~r032,120,310919~'
-script += ' ~r0119,121,310920~w~r0104,122,310921~h~r097,123,310922~a~r0116,124,310923~t~r032,125,310924~ ~r0119,126,310925~'
-script += 'w~r097,127,310926~a~r0115,128,310927~s~r032,129,310928~ ~r0111,130,310929~o~r0110,131,310930~n~r099,132,310931~'
-script += 'c~r0101,133,310932~e~r032,134,310933~ ~r0116,135,310934~t~r0104,136,310935~h~r0101,137,310936~e~r032,138,310937~'
-script += ' ~r0108,139,310938~l~r0105,140,310939~i~r0118,141,310940~v~r0105,142,310941~i~r0110,143,310942~n~r0103,144,310943~'
-script += 'g~r032,145,310944~ ~r0113,146,310945~q~r0117,147,310946~u~r097,148,310947~a~r0114,149,310948~r~r0116,150,310949~'
-script += 't~r0101,151,310950~e~r0114,152,310951~r~r0115,153,310952~s~r032,154,310953~ ~r0102,155,310954~f~r0111,156,310955~'
-script += 'o~r0114,157,310956~r~r032,158,310957~ ~r0116,159,310958~t~r0104,160,310959~h~r0101,161,310960~e~r032,162,310961~'
-script += ' ~r099,163,310962~c~r0111,164,310963~o~r0109,165,310964~m~r0112,166,310965~p~r0108,167,310966~l~r0101,168,310967~'
-script += 'e~r0120,169,310968~x~r046,170,310969~.~r032,171,310970~ ~r172,310971~ ~r077,173,310972~M~r097,174,310973~'
-script += 'a~r0110,175,310974~n~r0121,176,310975~y~r032,177,310976~ ~r0115,178,310977~s~r0109,179,310978~m~r097,180,310979~'
-script += 'a~r0108,181,310980~l~r182,310981~l~r0101,183,310982~e~r0114,184,310983~r~r032,185,310984~ ~r0114,186,310985~'
-script += 'r~r0111,187,310986~o~r188,310987~o~r0109,189,310988~m~r0115,190,310989~s~r032,191,310990~ ~r0119,192,310991~'
-script += 'w~r0104,193,310992~h~r0105,194,310993~i~r099,195,310994~c~r0104,196,310995~h~r032,197,310996~ ~r0111,198,310997~'
-script += 'o~r0110,199,310998~n~r099,1100,310999~c~r0101,1101,311000~e~r032,1102,311001~ ~r0104,1103,311002~h~r097,1104,311003~'
-script += 'a~r0100,1105,311004~d~r032,1106,311005~ ~r0119,1107,311006~w~r097,1108,311007~a~r0108,1109,311008~l~r1110,311009~'
-script += 'l~r0115,1111,311010~s~r032,1112,311011~ ~r0116,1113,311012~t~r0111,1114,311013~o~r032,1115,311014~ ~r0100,1116,311015~'
-script += 'd~r0105,1117,311016~i~r0118,1118,311017~v~r0105,1119,311018~i~r0100,1120,311019~d~r0101,1121,311020~'
-script += 'e~r032,1122,311021~ ~r0116,1123,311022~t~r0104,1124,311023~h~r0101,1125,311024~e~r0109,1126,311025~m'
-script += '~r032,1127,311026~ ~r0110,1128,311027~n~r0111,1129,311028~o~r0119,1130,311029~w~r032,1131,311030~ ~r0108,1132,311031~'
-script += 'l~r097,1133,311032~a~r0121,1134,311033~y~r032,1135,311034~ ~r0105,1136,311035~i~r0110,1137,311036~n~r032,1138,311037~'
-script += ' ~r0100,1139,311038~d~r0105,1140,311039~i~r0115,1141,311040~s~r097,1142,311041~a~r0114,1143,311042~r'
-script += '~r1144,311043~r~r097,1145,311044~a~r0121,1146,311045~y~r046,1147,311046~.~r032,1148,311047~ ~r1149,311048~'
-script += ' ~r084,1150,311049~T~r0104,1151,311050~h~r0101,1152,311051~e~r0114,1153,311052~r~r0101,1154,311053~e'
-script += '~r032,1155,311054~ ~r0105,1156,311055~i~r0115,1157,311056~s~r032,1158,311057~ ~r097,1159,311058~a~r032,1160,311059~'
-script += ' ~r0115,1161,311060~s~r0116,1162,311061~t~r097,1163,311062~a~r0105,1164,311063~i~r0114,1165,311064~r'
-script += '~r099,1166,311065~c~r097,1167,311066~a~r0115,1168,311067~s~r0101,1169,311068~e~r032,1170,311069~ ~r0117,1171,311070~'
-script += 'u~r0112,1172,311071~p~r032,1173,311072~ ~r0104,1174,311073~h~r0101,1175,311074~e~r0114,1176,311075~r'
-script += '~r0101,1177,311076~e~r046,1178,311077~.~r010898,10,34,4101,50,60~\n~r02~\nThere are ~r050,110,210,332766,450,51~'
-script += '2~r02,10,20,34,4101,50~ exits:\n~r011078,327122,42,55814,627121~- ~r0117,311079,51528,611078~u~r0112,11,311080~'
-script += 'p~r011078,10,327122,55814,627121~\n~r011081,11,327123~- ~r0101,10,311082,44,51528,611081~e~r097,11,311083~'
-script += 'a~r0115,12,311084~s~r0116,13,311085~t~r011081,11,327123,42,55814,627121~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~e~r025976,51~a~r025977,497,52~'
-script += 's~r025978,4115,53~t~r025979,4116,54~\n~r032,20,34,4101,50~~moutput~\n\n~r02457,10~~v27322457~== ~r082,310104,45,51528,610103~'
-script += 'R~r0117,11,310105~u~r0105,12,310106~i~r0110,13,310107~n~r0115,14,310108~s~r010103,10,34,4101,50,60~ '
-script += '==\n~r089,310110,4293,51528,610109~Y~r0111,11,310111~o~r0117,12,310112~u~r032,13,310113~ ~r0115,14,310114~'
-script += 's~r0116,15,310115~t~r097,16,310116~a~r0110,17,310117~n~r0100,18,310118~d~r032,19,310119~ ~r0105,110,310120~'
-script += 'i~r0110,111,310121~n~r032,112,310122~ ~r0116,113,310123~t~r0104,114,310124~h~r0101,115,310125~e~r032,116,310126~'
-script += ' ~r0109,117,310127~m~r097,118,310128~a~r0115,119,310129~s~r120,310130~s~r0105,121,310131~i~r0118,122,310132~'
-script += 'v~r0101,123,310133~e~r032,124,310134~ ~r099,125,310135~c~r0101,126,310136~e~r0110,127,310137~n~r0116,128,310138~'
-script += 't~r0114,129,310139~r~r097,130,310140~a~r0108,131,310141~l~r032,132,310142~ ~r0104,133,310143~h~r097,134,310144~'
-script += 'a~r0108,135,310145~l~r136,310146~l~r032,137,310147~ ~r0111,138,310148~o~r0102,139,310149~f~r032,140,310150~'
-script += ' ~r0116,141,310151~t~r0104,142,310152~h~r0101,143,310153~e~r0115,144,310154~s~r0101,145,310155~e~r032,146,310156~'
-script += ' ~r0114,147,310157~r~r0117,148,310158~u~r0105,149,310159~i~r0110,150,310160~n~r0115,151,310161~s~r046,152,310162~'
-script += '.~r032,153,310163~ ~r154,310164~ ~r084,155,310165~T~r0104,156,310166~h~r0101,157,310167~e~r032,158,310168~'
-script += ' ~r0119,159,310169~w~r097,160,310170~a~r0108,161,310171~l~r162,310172~l~r0115,163,310173~s~r032,164,310174~'
-script += ' ~r097,165,310175~a~r0114,166,310176~r~r0101,167,310177~e~r032,168,310178~ ~r099,169,310179~c~r0114,170,310180~'
-script += 'r~r0117,171,310181~u~r0109,172,310182~m~r098,173,310183~b~r0108,174,310184~l~r0105,175,310185~i~r0110,176,310186~'
-script += 'n~r0103,177,310187~g~r044,178,310188~,~r032,179,310189~ ~r097,180,310190~a~r0110,181,310191~n~r0100,182,310192~'
-script += 'd~r032,183,310193~ ~r0118,184,310194~v~r0101,185,310195~e~r0103,186,310196~g~r0101,187,310197~e~r0116,188,310198~'
-script += 't~r097,189,310199~a~r0116,190,310200~t~r0105,191,310201~i~r0111,192,310202~o~r0110,193,310203~n~r032,194,310204~'
-script += ' ~r0104,195,310205~h~r097,196,310206~a~r0115,197,310207~s~r032,198,310208~ ~r099,199,310209~c~r0108,1100,310210~'
-script += 'l~r0101,1101,310211~e~r097,1102,310212~a~r0114,1103,310213~r~r0108,1104,310214~l~r0121,1105,310215~y'
-script += '~r032,1106,310216~ ~r0116,1107,310217~t~r097,1108,310218~a~r0107,1109,310219~k~r0101,1110,310220~e~r0110,1111,310221~'
-script += 'n~r032,1112,310222~ ~r0111,1113,310223~o~r0118,1114,310224~v~r0101,1115,310225~e~r0114,1116,310226~r'
-script += '~r046,1117,310227~.~r032,1118,310228~ ~r1119,310229~ ~r082,1120,310230~R~r0111,1121,310231~o~r1122,310232~'
-script += 'o~r0109,1123,310233~m~r0115,1124,310234~s~r032,1125,310235~ ~r097,1126,310236~a~r0114,1127,310237~r~r0101,1128,310238~'
-script += 'e~r032,1129,310239~ ~r097,1130,310240~a~r0116,1131,310241~t~r1132,310242~t~r097,1133,310243~a~r099,1134,310244~'
-script += 'c~r0104,1135,310245~h~r0101,1136,310246~e~r0100,1137,310247~d~r032,1138,310248~ ~r0105,1139,310249~i'
-script += '~r0110,1140,310250~n~r032,1141,310251~ ~r097,1142,310252~a~r0108,1143,310253~l~r1144,310254~l~r032,1145,310255~'
-script += ' ~r0100,1146,310256~d~r0105,1147,310257~i~r0114,1148,310258~r~r0101,1149,310259~e~r099,1150,310260~c'
-script += '~r0116,1151,310261~t~r0105,1152,310262~i~r0111,1153,310263~o~r0110,1154,310264~n~r0115,1155,310265~s'
-script += '~r046,1156,310266~.~r032,1157,310267~ ~r1158,310268~ ~r084,1159,310269~T~r0104,1160,310270~h~r0101,1161,310271~'
-script += 'e~r0114,1162,310272~r~r0101,1163,310273~e~r032,1164,310274~ ~r0105,1165,310275~i~r0115,1166,310276~s'
-script += '~r032,1167,310277~ ~r097,1168,310278~a~r032,1169,310279~ ~r0115,1170,310280~s~r0116,1171,310281~t~r0114,1172,310282~'
-script += 'r~r097,1173,310283~a~r0110,1174,310284~n~r0103,1175,310285~g~r0101,1176,310286~e~r032,1177,310287~ ~r0109,1178,310288~'
-script += 'm~r0111,1179,310289~o~r0110,1180,310290~n~r0117,1181,310291~u~r0109,1182,310292~m~r0101,1183,310293~'
-script += 'e~r0110,1184,310294~n~r0116,1185,310295~t~r032,1186,310296~ ~r0105,1187,310297~i~r0110,1188,310298~n'
-script += '~r032,1189,310299~ ~r0116,1190,310300~t~r0104,1191,310301~h~r0101,1192,310302~e~r032,1193,310303~ ~r099,1194,310304~'
-script += 'c~r0101,1195,310305~e~r0110,1196,310306~n~r0116,1197,310307~t~r0101,1198,310308~e~r0114,1199,310309~'
-script += 'r~r032,1200,310310~ ~r0111,1201,310311~o~r0102,1202,310312~f~r032,1203,310313~ ~r0116,1204,310314~t~r0104,1205,310315~'
-script += 'h~r0101,1206,310316~e~r032,1207,310317~ ~r0104,1208,310318~h~r097,1209,310319~a~r0108,1210,310320~l~r1211,310321~'
-script += 'l~r032,1212,310322~ ~r0119,1213,310323~w~r0105,1214,310324~i~r0116,1215,310325~t~r0104,1216,310326~h'
-script += '~r032,1217,310327~ ~r099,1218,310328~c~r0105,1219,310329~i~r0114,1220,310330~r~r099,1221,310331~c~r0117,1222,310332~'
-script += 'u~r0108,1223,310333~l~r097,1224,310334~a~r0114,1225,310335~r~r032,1226,310336~ ~r0115,1227,310337~s~r0108,1228,310338~'
-script += 'l~r0111,1229,310339~o~r0116,1230,310340~t~r0115,1231,310341~s~r032,1232,310342~ ~r097,1233,310343~a~r0110,1234,310344~'
-script += 'n~r0100,1235,310345~d~r032,1236,310346~ ~r0117,1237,310347~u~r0110,1238,310348~n~r0117,1239,310349~u'
-script += '~r0115,1240,310350~s~r0117,1241,310351~u~r097,1242,310352~a~r0108,1243,310353~l~r032,1244,310354~ ~r0115,1245,310355~'
-script += 's~r0121,1246,310356~y~r0109,1247,310357~m~r098,1248,310358~b~r0111,1249,310359~o~r0108,1250,310360~l'
-script += '~r0115,1251,310361~s~r046,1252,310362~.~r032,1253,310363~ ~r1254,310364~ ~r073,1255,310365~I~r0116,1256,310366~'
-script += 't~r032,1257,310367~ ~r0114,1258,310368~r~r0101,1259,310369~e~r097,1260,310370~a~r0100,1261,310371~d~r0115,1262,310372~'
-script += 's~r058,1263,310373~:~r010,1264,310374~\n~r1265,310375~\n~r095,1266,310376~_~r032,1267,310377~ ~r043,1268,310378~'
-script += '+~r032,1269,310379~ ~r095,1270,310380~_~r032,1271,310381~ ~r042,1272,310382~*~r032,1273,310383~ ~r095,1274,310384~'
-script += '_~r094,1275,310385~^~r050,1276,310386~2~r032,1277,310387~ ~r043,1278,310388~+~r032,1279,310389~ ~r095,1280,310390~'
-script += '_~r094,1281,310391~^~r051,1282,310392~3~r032,1283,310393~ ~r045,1284,310394~-~r032,1285,310395~ ~r095,1286,310396~'
-script += '_~r032,1287,310397~ ~r061,1288,310398~=~r032,1289,310399~ ~r051,1290,310400~3~r057,1291,310401~9~r1292,310402~'
-script += '9~r010109,10,34,4101,50,60~\n~r04~\nThere are ~r052,110,210,332764,452,51~4~r04,10,20,34,4101,50~ ex'
-script += 'its:\n~r010403,327086,44,55814,627085~- ~r0110,310404,45,51528,610403~n~r0111,11,310405~o~r0114,12,310406~'
-script += 'r~r0116,13,310407~t~r0104,14,310408~h~r010403,10,327086,44,55814,627085~\n~r010409,11,327087~- ~r0115,10,310410,45,51528,610409~'
-script += 's~r0111,11,310411~o~r0117,12,310412~u~r0116,13,310413~t~r0104,14,310414~h~r010409,11,327087,44,55814,627085~'
-script += '\n~r010415,12,327088~- ~r0101,10,310416,51528,610415~e~r097,11,310417~a~r0115,12,310418~s~r0116,13,310419~'
-script += 't~r010415,12,327088,55814,627085~\n~r010420,13,327089~- ~r0119,10,310421,51528,610420~w~r0101,11,310422~'
-script += 'e~r0115,12,310423~s~r0116,13,310424~t~r010420,327089,55814,627085~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~l~r025976,4108,51~o~r025977,4111,52~'
-script += 'o~r025978,53~k~r025979,4107,54~ ~r025980,432,55~b~r025981,498,56~l~r025982,4108,57~u~r025983,4117,58~'
-script += 'e~r025984,4101,59~ ~r025985,432,510~c~r025986,499,511~o~r025987,4111,512~i~r025988,4105,513~n~r025989,4110,514~'
-script += '\n~r032,20,34,4101,50~~moutput~\n\n~r084,10,24,318964,465,51528,618963~T~r0104,11,318965~h~r0105,12,318966~'
-script += 'i~r0115,13,318967~s~r032,14,318968~ ~r099,15,318969~c~r0111,16,318970~o~r0105,17,318971~i~r0110,18,318972~'
-script += 'n~r032,19,318973~ ~r0105,110,318974~i~r0115,111,318975~s~r032,112,318976~ ~r0109,113,318977~m~r097,114,318978~'
-script += 'a~r0100,115,318979~d~r0101,116,318980~e~r032,117,318981~ ~r0111,118,318982~o~r0102,119,318983~f~r032,120,318984~'
-script += ' ~r097,121,318985~a~r032,122,318986~ ~r098,123,318987~b~r0108,124,318988~l~r0117,125,318989~u~r0101,126,318990~'
-script += 'e~r032,127,318991~ ~r0109,128,318992~m~r0101,129,318993~e~r0116,130,318994~t~r097,131,318995~a~r0108,132,318996~'
-script += 'l~r046,133,318997~.~r032,134,318998~ ~r135,318999~ ~r073,136,319000~I~r0116,137,319001~t~r032,138,319002~'
-script += ' ~r0104,139,319003~h~r097,140,319004~a~r0115,141,319005~s~r032,142,319006~ ~r0110,143,319007~n~r0105,144,319008~'
-script += 'i~r0110,145,319009~n~r0101,146,319010~e~r032,147,319011~ ~r0100,148,319012~d~r0111,149,319013~o~r0116,150,319014~'
-script += 't~r0115,151,319015~s~r032,152,319016~ ~r0111,153,319017~o~r0110,154,319018~n~r032,155,319019~ ~r0111,156,319020~'
-script += 'o~r0110,157,319021~n~r0101,158,319022~e~r032,159,319023~ ~r0115,160,319024~s~r0105,161,319025~i~r0100,162,319026~'
-script += 'd~r0101,163,319027~e~r046,164,319028~.~r018963,12705,39,4101,50,60~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~l~r025976,4108,51~o~r025977,4111,52~'
-script += 'o~r025978,53~k~r025979,4107,54~ ~r025980,432,55~c~r025981,499,56~o~r025982,4111,57~n~r025983,4110,58~'
-script += 'c~r025984,499,59~a~r025985,497,510~v~r025986,4118,511~e~r025987,4101,512~ ~r025988,432,513~c~r025989,499,514~'
-script += 'o~r025990,4111,515~i~r025991,4105,516~n~r025992,4110,517~\n~r032,24,39,4101,50~~moutput~\n\n~r084,10,318866,487,51528,618865~'
-script += 'T~r0104,11,318867~h~r0105,12,318868~i~r0115,13,318869~s~r032,14,318870~ ~r099,15,318871~c~r0111,16,318872~'
-script += 'o~r0105,17,318873~i~r0110,18,318874~n~r032,19,318875~ ~r0105,110,318876~i~r0115,111,318877~s~r032,112,318878~'
-script += ' ~r0115,113,318879~s~r0108,114,318880~l~r0105,115,318881~i~r0103,116,318882~g~r0104,117,318883~h~r0116,118,318884~'
-script += 't~r0108,119,318885~l~r0121,120,318886~y~r032,121,318887~ ~r0114,122,318888~r~r0111,123,318889~o~r0117,124,318890~'
-script += 'u~r0110,125,318891~n~r0100,126,318892~d~r0101,127,318893~e~r0100,128,318894~d~r044,129,318895~,~r032,130,318896~'
-script += ' ~r097,131,318897~a~r0108,132,318898~l~r0109,133,318899~m~r0111,134,318900~o~r0115,135,318901~s~r0116,136,318902~'
-script += 't~r032,137,318903~ ~r0108,138,318904~l~r0105,139,318905~i~r0107,140,318906~k~r0101,141,318907~e~r032,142,318908~'
-script += ' ~r097,143,318909~a~r032,144,318910~ ~r0116,145,318911~t~r0105,146,318912~i~r0110,147,318913~n~r0121,148,318914~'
-script += 'y~r032,149,318915~ ~r098,150,318916~b~r0111,151,318917~o~r0119,152,318918~w~r0108,153,318919~l~r046,154,318920~'
-script += '.~r032,155,318921~ ~r156,318922~ ~r073,157,318923~I~r0116,158,318924~t~r032,159,318925~ ~r0104,160,318926~'
-script += 'h~r097,161,318927~a~r0115,162,318928~s~r032,163,318929~ ~r0115,164,318930~s~r0101,165,318931~e~r0118,166,318932~'
-script += 'v~r0101,167,318933~e~r0110,168,318934~n~r032,169,318935~ ~r0100,170,318936~d~r0111,171,318937~o~r0116,172,318938~'
-script += 't~r0115,173,318939~s~r032,174,318940~ ~r0111,175,318941~o~r0110,176,318942~n~r032,177,318943~ ~r0111,178,318944~'
-script += 'o~r0110,179,318945~n~r0101,180,318946~e~r032,181,318947~ ~r0115,182,318948~s~r0105,183,318949~i~r0100,184,318950~'
-script += 'd~r0101,185,318951~e~r046,186,318952~.~r018865,12701,312,4101,50,60~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~l~r025976,4108,51~o~r025977,4111,52~'
-script += 'o~r025978,53~k~r025979,4107,54~ ~r025980,432,55~c~r025981,499,56~o~r025982,4111,57~r~r025983,4114,58~'
-script += 'r~r025984,59~o~r025985,4111,510~d~r025986,4100,511~e~r025987,4101,512~d~r025988,4100,513~ ~r025989,432,514~'
-script += 'c~r025990,499,515~o~r025991,4111,516~i~r025992,4105,517~n~r025993,4110,518~\n~r032,24,312,4101,50~~moutput~'
-script += '\n\n~r084,10,318706,463,51528,618705~T~r0104,11,318707~h~r0105,12,318708~i~r0115,13,318709~s~r032,14,318710~'
-script += ' ~r099,15,318711~c~r0111,16,318712~o~r0105,17,318713~i~r0110,18,318714~n~r032,19,318715~ ~r0105,110,318716~'
-script += 'i~r0115,111,318717~s~r032,112,318718~ ~r0115,113,318719~s~r0111,114,318720~o~r0109,115,318721~m~r0101,116,318722~'
-script += 'e~r0119,117,318723~w~r0104,118,318724~h~r097,119,318725~a~r0116,120,318726~t~r032,121,318727~ ~r099,122,318728~'
-script += 'c~r0111,123,318729~o~r0114,124,318730~r~r125,318731~r~r0111,126,318732~o~r0100,127,318733~d~r0101,128,318734~'
-script += 'e~r0100,129,318735~d~r046,130,318736~.~r032,131,318737~ ~r132,318738~ ~r073,133,318739~I~r0116,134,318740~'
-script += 't~r032,135,318741~ ~r0104,136,318742~h~r097,137,318743~a~r0115,138,318744~s~r032,139,318745~ ~r097,140,318746~'
-script += 'a~r032,141,318747~ ~r0116,142,318748~t~r0114,143,318749~r~r0105,144,318750~i~r097,145,318751~a~r0110,146,318752~'
-script += 'n~r0103,147,318753~g~r0108,148,318754~l~r0101,149,318755~e~r032,150,318756~ ~r0111,151,318757~o~r0110,152,318758~'
-script += 'n~r032,153,318759~ ~r0111,154,318760~o~r0110,155,318761~n~r0101,156,318762~e~r032,157,318763~ ~r0115,158,318764~'
-script += 's~r0105,159,318765~i~r0100,160,318766~d~r0101,161,318767~e~r046,162,318768~.~r018705,12693,313,4101,50,60~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~l~r025976,4108,51~o~r025977,4111,52~o~r025978,53~k~r025979,4107,54~ ~r025980,432,55~r~r025981,4114,56~'
-script += 'e~r025982,4101,57~d~r025983,4100,58~ ~r025984,432,59~c~r025985,499,510~o~r025986,4111,511~i~r025987,4105,512~'
-script += 'n~r025988,4110,513~\n~r032,24,313,4101,50~~moutput~\n\n~r084,10,318628,463,51528,618627~T~r0104,11,318629~'
-script += 'h~r0105,12,318630~i~r0115,13,318631~s~r032,14,318632~ ~r099,15,318633~c~r0111,16,318634~o~r0105,17,318635~'
-script += 'i~r0110,18,318636~n~r032,19,318637~ ~r0105,110,318638~i~r0115,111,318639~s~r032,112,318640~ ~r0109,113,318641~'
-script += 'm~r097,114,318642~a~r0100,115,318643~d~r0101,116,318644~e~r032,117,318645~ ~r0111,118,318646~o~r0102,119,318647~'
-script += 'f~r032,120,318648~ ~r097,121,318649~a~r032,122,318650~ ~r0114,123,318651~r~r0101,124,318652~e~r0100,125,318653~'
-script += 'd~r032,126,318654~ ~r0109,127,318655~m~r0101,128,318656~e~r0116,129,318657~t~r097,130,318658~a~r0108,131,318659~'
-script += 'l~r046,132,318660~.~r032,133,318661~ ~r134,318662~ ~r073,135,318663~I~r0116,136,318664~t~r032,137,318665~'
-script += ' ~r0104,138,318666~h~r097,139,318667~a~r0115,140,318668~s~r032,141,318669~ ~r0116,142,318670~t~r0119,143,318671~'
-script += 'w~r0111,144,318672~o~r032,145,318673~ ~r0100,146,318674~d~r0111,147,318675~o~r0116,148,318676~t~r0115,149,318677~'
-script += 's~r032,150,318678~ ~r0111,151,318679~o~r0110,152,318680~n~r032,153,318681~ ~r0111,154,318682~o~r0110,155,318683~'
-script += 'n~r0101,156,318684~e~r032,157,318685~ ~r0115,158,318686~s~r0105,159,318687~i~r0100,160,318688~d~r0101,161,318689~'
-script += 'e~r046,162,318690~.~r018627,12689,38,4101,50,60~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~'
-script += 'W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~'
-script += ' ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~'
-script += '?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~l~r025976,4108,51~o~r025977,4111,52~o~r025978,53~'
-script += 'k~r025979,4107,54~ ~r025980,432,55~s~r025981,4115,56~h~r025982,4104,57~i~r025983,4105,58~n~r025984,4110,59~'
-script += 'y~r025985,4121,510~ ~r025986,432,511~c~r025987,499,512~o~r025988,4111,513~i~r025989,4105,514~n~r025990,4110,515~'
-script += '\n~r032,24,38,4101,50~~moutput~\n\n~r084,10,318781,471,51528,618780~T~r0104,11,318782~h~r0105,12,318783~'
-script += 'i~r0115,13,318784~s~r032,14,318785~ ~r099,15,318786~c~r0111,16,318787~o~r0105,17,318788~i~r0110,18,318789~'
-script += 'n~r032,19,318790~ ~r0105,110,318791~i~r0115,111,318792~s~r032,112,318793~ ~r0115,113,318794~s~r0111,114,318795~'
-script += 'o~r0109,115,318796~m~r0101,116,318797~e~r0104,117,318798~h~r0111,118,318799~o~r0119,119,318800~w~r032,120,318801~'
-script += ' ~r0115,121,318802~s~r0116,122,318803~t~r0105,123,318804~i~r0108,124,318805~l~r125,318806~l~r032,126,318807~'
-script += ' ~r0113,127,318808~q~r0117,128,318809~u~r0105,129,318810~i~r0116,130,318811~t~r0101,131,318812~e~r032,132,318813~'
-script += ' ~r0115,133,318814~s~r0104,134,318815~h~r0105,135,318816~i~r0110,136,318817~n~r0121,137,318818~y~r046,138,318819~'
-script += '.~r032,139,318820~ ~r140,318821~ ~r073,141,318822~I~r0116,142,318823~t~r032,143,318824~ ~r0104,144,318825~'
-script += 'h~r097,145,318826~a~r0115,146,318827~s~r032,147,318828~ ~r097,148,318829~a~r032,149,318830~ ~r0112,150,318831~'
-script += 'p~r0101,151,318832~e~r0110,152,318833~n~r0116,153,318834~t~r097,154,318835~a~r0103,155,318836~g~r0111,156,318837~'
-script += 'o~r0110,157,318838~n~r032,158,318839~ ~r0111,159,318840~o~r0110,160,318841~n~r032,161,318842~ ~r0111,162,318843~'
-script += 'o~r0110,163,318844~n~r0101,164,318845~e~r032,165,318846~ ~r0115,166,318847~s~r0105,167,318848~i~r0100,168,318849~'
-script += 'd~r0101,169,318850~e~r046,170,318851~.~r018780,12697,310,4101,50,60~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~# The coins need to be added in t'
-script += 'he proper order, a helper here, called "solve_coins", picks the order\n~minput~u~r025976,4117,51~s~r025977,4115,52~'
-script += 'e~r025978,4101,53~ ~r025979,432,54~b~r025980,498,55~l~r025981,4108,56~u~r025982,4117,57~e~r025983,4101,58~'
-script += ' ~r025984,432,59~c~r025985,499,510~o~r025986,4111,511~i~r025987,4105,512~n~r025988,4110,513~\n~r032,24,310,4101,50~'
-script += '~moutput~\n\n~r089,120086,220086,328665,414,51531,628664~~v270632767~Y~r0111,328666~o~r0117,328667~u'
-script += '~r032,328668~ ~r0112,328669~p~r0108,328670~l~r097,328671~a~r099,328672~c~r0101,328673~e~r032,328674~'
-script += ' ~r0116,328675~t~r0104,328676~h~r0101,328677~e~r032,328678~ ~r098,10,22704,318954,49,51528,618953~b~r0108,11,318955~'
-script += 'l~r0117,12,318956~u~r0101,13,318957~e~r032,14,318958~ ~r099,15,318959~c~r0111,16,318960~o~r0105,17,318961~'
-script += 'i~r0110,18,318962~n~r032,115718,215718,328680,430,51531,628679~ ~r0105,328681~i~r0110,328682~n~r0116,328683~'
-script += 't~r0111,328684~o~r032,328685~ ~r0116,328686~t~r0104,328687~h~r0101,328688~e~r032,328689~ ~r0108,328690~'
-script += 'l~r0101,328691~e~r0102,328692~f~r0116,328693~t~r0109,328694~m~r0111,328695~o~r0115,328696~s~r0116,328697~'
-script += 't~r032,328698~ ~r0111,328699~o~r0112,328700~p~r0101,328701~e~r0110,328702~n~r032,328703~ ~r0115,328704~'
-script += 's~r0108,328705~l~r0111,328706~o~r0116,328707~t~r046,328708~.~r010,328709~\n~r132613,232613,327415,417,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~u~r025976,4117,51~s~r025977,4115,52~'
-script += 'e~r025978,4101,53~ ~r025979,432,54~r~r025980,4114,55~e~r025981,4101,56~d~r025982,4100,57~ ~r025983,432,58~'
-script += 'c~r025984,499,59~o~r025985,4111,510~i~r025986,4105,511~n~r025987,4110,512~\n~r032,23,39,4101,50~~moutput~'
-script += '\n\n~r089,120086,220086,328665,414,51531,628664~~v269032767~Y~r0111,328666~o~r0117,328667~u~r032,328668~'
-script += ' ~r0112,328669~p~r0108,328670~l~r097,328671~a~r099,328672~c~r0101,328673~e~r032,328674~ ~r0116,328675~'
-script += 't~r0104,328676~h~r0101,328677~e~r032,328678~ ~r0114,10,22688,318619,48,51528,618618~r~r0101,11,318620~'
-script += 'e~r0100,12,318621~d~r032,13,318622~ ~r099,14,318623~c~r0111,15,318624~o~r0105,16,318625~i~r0110,17,318626~'
-script += 'n~r032,115718,215718,328680,430,51531,628679~ ~r0105,328681~i~r0110,328682~n~r0116,328683~t~r0111,328684~'
-script += 'o~r032,328685~ ~r0116,328686~t~r0104,328687~h~r0101,328688~e~r032,328689~ ~r0108,328690~l~r0101,328691~'
-script += 'e~r0102,328692~f~r0116,328693~t~r0109,328694~m~r0111,328695~o~r0115,328696~s~r0116,328697~t~r032,328698~'
-script += ' ~r0111,328699~o~r0112,328700~p~r0101,328701~e~r0110,328702~n~r032,328703~ ~r0115,328704~s~r0108,328705~'
-script += 'l~r0111,328706~o~r0116,328707~t~r046,328708~.~r010,328709~\n~r132613,232613,327415,417,627414~\n~r087,327416~'
-script += 'W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~'
-script += ' ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~'
-script += '?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~u~r025976,4117,51~s~r025977,4115,52~e~r025978,4101,53~'
-script += ' ~r025979,432,54~s~r025980,4115,55~h~r025981,4104,56~i~r025982,4105,57~n~r025983,4110,58~y~r025984,4121,59~'
-script += ' ~r025985,432,510~c~r025986,499,511~o~r025987,4111,512~i~r025988,4105,513~n~r025989,4110,514~\n~r032,23,38,4101,50~'
-script += '~moutput~\n\n~r089,120086,220086,328665,414,51531,628664~~v269832767~Y~r0111,328666~o~r0117,328667~u'
-script += '~r032,328668~ ~r0112,328669~p~r0108,328670~l~r097,328671~a~r099,328672~c~r0101,328673~e~r032,328674~'
-script += ' ~r0116,328675~t~r0104,328676~h~r0101,328677~e~r032,328678~ ~r0115,10,22696,318770,410,51528,618769~'
-script += 's~r0104,11,318771~h~r0105,12,318772~i~r0110,13,318773~n~r0121,14,318774~y~r032,15,318775~ ~r099,16,318776~'
-script += 'c~r0111,17,318777~o~r0105,18,318778~i~r0110,19,318779~n~r032,115718,215718,328680,430,51531,628679~ '
-script += '~r0105,328681~i~r0110,328682~n~r0116,328683~t~r0111,328684~o~r032,328685~ ~r0116,328686~t~r0104,328687~'
-script += 'h~r0101,328688~e~r032,328689~ ~r0108,328690~l~r0101,328691~e~r0102,328692~f~r0116,328693~t~r0109,328694~'
-script += 'm~r0111,328695~o~r0115,328696~s~r0116,328697~t~r032,328698~ ~r0111,328699~o~r0112,328700~p~r0101,328701~'
-script += 'e~r0110,328702~n~r032,328703~ ~r0115,328704~s~r0108,328705~l~r0111,328706~o~r0116,328707~t~r046,328708~'
-script += '.~r010,328709~\n~r132613,232613,327415,417,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~u~r025976,4117,51~s~r025977,4115,52~e~r025978,4101,53~ ~r025979,432,54~c~r025980,499,55~o~r025981,4111,56~'
-script += 'n~r025982,4110,57~c~r025983,499,58~a~r025984,497,59~v~r025985,4118,510~e~r025986,4101,511~ ~r025987,432,512~'
-script += 'c~r025988,499,513~o~r025989,4111,514~i~r025990,4105,515~n~r025991,4110,516~\n~r032,23,310,4101,50~~moutput~'
-script += '\n\n~r089,120086,220086,328665,414,51531,628664~~v270232767~Y~r0111,328666~o~r0117,328667~u~r032,328668~'
-script += ' ~r0112,328669~p~r0108,328670~l~r097,328671~a~r099,328672~c~r0101,328673~e~r032,328674~ ~r0116,328675~'
-script += 't~r0104,328676~h~r0101,328677~e~r032,328678~ ~r099,10,22700,318853,412,51528,618852~c~r0111,11,318854~'
-script += 'o~r0110,12,318855~n~r099,13,318856~c~r097,14,318857~a~r0118,15,318858~v~r0101,16,318859~e~r032,17,318860~'
-script += ' ~r099,18,318861~c~r0111,19,318862~o~r0105,110,318863~i~r0110,111,318864~n~r032,115718,215718,328680,430,51531,628679~'
-script += ' ~r0105,328681~i~r0110,328682~n~r0116,328683~t~r0111,328684~o~r032,328685~ ~r0116,328686~t~r0104,328687~'
-script += 'h~r0101,328688~e~r032,328689~ ~r0108,328690~l~r0101,328691~e~r0102,328692~f~r0116,328693~t~r0109,328694~'
-script += 'm~r0111,328695~o~r0115,328696~s~r0116,328697~t~r032,328698~ ~r0111,328699~o~r0112,328700~p~r0101,328701~'
-script += 'e~r0110,328702~n~r032,328703~ ~r0115,328704~s~r0108,328705~l~r0111,328706~o~r0116,328707~t~r046,328708~'
-script += '.~r010,328709~\n~r132613,232613,327415,417,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~u~r025976,4117,51~s~r025977,4115,52~e~r025978,4101,53~ ~r025979,432,54~c~r025980,499,55~o~r025981,4111,56~'
-script += 'r~r025982,4114,57~r~r025983,58~o~r025984,4111,59~d~r025985,4100,510~e~r025986,4101,511~d~r025987,4100,512~'
-script += ' ~r025988,432,513~c~r025989,499,514~o~r025990,4111,515~i~r025991,4105,516~n~r025992,4110,517~\n~r032,23,312,4101,50~'
-script += '~moutput~\n\n~r089,120086,220086,328665,414,51531,628664~~v269432767~Y~r0111,328666~o~r0117,328667~u'
-script += '~r032,328668~ ~r0112,328669~p~r0108,328670~l~r097,328671~a~r099,328672~c~r0101,328673~e~r032,328674~'
-script += ' ~r0116,328675~t~r0104,328676~h~r0101,328677~e~r032,328678~ ~r099,10,22692,318692,413,51528,618691~c'
-script += '~r0111,11,318693~o~r0114,12,318694~r~r13,318695~r~r0111,14,318696~o~r0100,15,318697~d~r0101,16,318698~'
-script += 'e~r0100,17,318699~d~r032,18,318700~ ~r099,19,318701~c~r0111,110,318702~o~r0105,111,318703~i~r0110,112,318704~'
-script += 'n~r032,115718,215718,328680,430,51531,628679~ ~r0105,328681~i~r0110,328682~n~r0116,328683~t~r0111,328684~'
-script += 'o~r032,328685~ ~r0116,328686~t~r0104,328687~h~r0101,328688~e~r032,328689~ ~r0108,328690~l~r0101,328691~'
-script += 'e~r0102,328692~f~r0116,328693~t~r0109,328694~m~r0111,328695~o~r0115,328696~s~r0116,328697~t~r032,328698~'
-script += ' ~r0111,328699~o~r0112,328700~p~r0101,328701~e~r0110,328702~n~r032,328703~ ~r0115,328704~s~r0108,328705~'
-script += 'l~r0111,328706~o~r0116,328707~t~r046,328708~.~r010,328709~\n~r065,16892,26892,328778,466,628777~A~r0115,328779~'
-script += 's~r032,328780~ ~r0121,328781~y~r0111,328782~o~r0117,328783~u~r032,328784~ ~r0112,328785~p~r0108,328786~'
-script += 'l~r097,328787~a~r099,328788~c~r0101,328789~e~r032,328790~ ~r0116,328791~t~r0104,328792~h~r0101,328793~'
-script += 'e~r032,328794~ ~r0108,328795~l~r097,328796~a~r0115,328797~s~r0116,328798~t~r032,328799~ ~r099,328800~'
-script += 'c~r0111,328801~o~r0105,328802~i~r0110,328803~n~r044,328804~,~r032,328805~ ~r0121,328806~y~r0111,328807~'
-script += 'o~r0117,328808~u~r032,328809~ ~r0104,328810~h~r0101,328811~e~r097,328812~a~r0114,328813~r~r032,328814~'
-script += ' ~r097,328815~a~r032,328816~ ~r099,328817~c~r0108,328818~l~r0105,328819~i~r099,328820~c~r0107,328821~'
-script += 'k~r032,328822~ ~r0102,328823~f~r0114,328824~r~r0111,328825~o~r0109,328826~m~r032,328827~ ~r0116,328828~'
-script += 't~r0104,328829~h~r0101,328830~e~r032,328831~ ~r0110,328832~n~r0111,328833~o~r0114,328834~r~r0116,328835~'
-script += 't~r0104,328836~h~r032,328837~ ~r0100,328838~d~r0111,328839~o~r328840~o~r0114,328841~r~r046,328842~.~r010,328843~'
-script += '\n~r132613,232613,327415,417,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~'
-script += ' ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~'
-script += ' ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~'
-script += 'n~r025976,4110,51~o~r025977,4111,52~r~r025978,4114,53~t~r025979,4116,54~h~r025980,4104,55~\n~r032,23,313,4101,50~'
-script += '~moutput~\n\n~r02463,10,20,35~~v27322463~== ~r082,310426,45,51528,610425~R~r0117,11,310427~u~r0105,12,310428~'
-script += 'i~r0110,13,310429~n~r0115,14,310430~s~r010425,10,35,4101,50,60~ ==\n~r066,310432,4167,51528,610431~B'
-script += '~r0101,11,310433~e~r099,12,310434~c~r097,13,310435~a~r0117,14,310436~u~r0115,15,310437~s~r0101,16,310438~'
-script += 'e~r032,17,310439~ ~r0105,18,310440~i~r0116,19,310441~t~r032,110,310442~ ~r0104,111,310443~h~r097,112,310444~'
-script += 'a~r0115,113,310445~s~r032,114,310446~ ~r098,115,310447~b~r0101,116,310448~e~r117,310449~e~r0110,118,310450~'
-script += 'n~r032,119,310451~ ~r0115,120,310452~s~r0111,121,310453~o~r032,122,310454~ ~r0119,123,310455~w~r0101,124,310456~'
-script += 'e~r0108,125,310457~l~r126,310458~l~r045,127,310459~-~r0112,128,310460~p~r0114,129,310461~r~r0111,130,310462~'
-script += 'o~r0116,131,310463~t~r0101,132,310464~e~r099,133,310465~c~r0116,134,310466~t~r0101,135,310467~e~r0100,136,310468~'
-script += 'd~r044,137,310469~,~r032,138,310470~ ~r0116,139,310471~t~r0104,140,310472~h~r0105,141,310473~i~r0115,142,310474~'
-script += 's~r032,143,310475~ ~r0114,144,310476~r~r0111,145,310477~o~r146,310478~o~r0109,147,310479~m~r032,148,310480~'
-script += ' ~r0104,149,310481~h~r097,150,310482~a~r0114,151,310483~r~r0100,152,310484~d~r0108,153,310485~l~r0121,154,310486~'
-script += 'y~r032,155,310487~ ~r0115,156,310488~s~r0104,157,310489~h~r0111,158,310490~o~r0119,159,310491~w~r0115,160,310492~'
-script += 's~r032,161,310493~ ~r0115,162,310494~s~r0105,163,310495~i~r0103,164,310496~g~r0110,165,310497~n~r0115,166,310498~'
-script += 's~r032,167,310499~ ~r0111,168,310500~o~r0102,169,310501~f~r032,170,310502~ ~r0100,171,310503~d~r0101,172,310504~'
-script += 'e~r099,173,310505~c~r097,174,310506~a~r0121,175,310507~y~r046,176,310508~.~r032,177,310509~ ~r178,310510~'
-script += ' ~r084,179,310511~T~r0104,180,310512~h~r0101,181,310513~e~r032,182,310514~ ~r0119,183,310515~w~r097,184,310516~'
-script += 'a~r0108,185,310517~l~r186,310518~l~r0115,187,310519~s~r032,188,310520~ ~r097,189,310521~a~r0114,190,310522~'
-script += 'r~r0101,191,310523~e~r032,192,310524~ ~r099,193,310525~c~r0111,194,310526~o~r0118,195,310527~v~r0101,196,310528~'
-script += 'e~r0114,197,310529~r~r0101,198,310530~e~r0100,199,310531~d~r032,1100,310532~ ~r0105,1101,310533~i~r0110,1102,310534~'
-script += 'n~r032,1103,310535~ ~r0101,1104,310536~e~r0108,1105,310537~l~r097,1106,310538~a~r098,1107,310539~b~r0111,1108,310540~'
-script += 'o~r0114,1109,310541~r~r097,1110,310542~a~r0116,1111,310543~t~r0101,1112,310544~e~r032,1113,310545~ ~r0109,1114,310546~'
-script += 'm~r0117,1115,310547~u~r0114,1116,310548~r~r097,1117,310549~a~r0108,1118,310550~l~r0115,1119,310551~s'
-script += '~r032,1120,310552~ ~r097,1121,310553~a~r0110,1122,310554~n~r0100,1123,310555~d~r032,1124,310556~ ~r0100,1125,310557~'
-script += 'd~r0101,1126,310558~e~r099,1127,310559~c~r0111,1128,310560~o~r0114,1129,310561~r~r097,1130,310562~a~r0116,1131,310563~'
-script += 't~r0101,1132,310564~e~r0100,1133,310565~d~r032,1134,310566~ ~r0119,1135,310567~w~r0105,1136,310568~i'
-script += '~r0116,1137,310569~t~r0104,1138,310570~h~r032,1139,310571~ ~r0112,1140,310572~p~r0114,1141,310573~r~r0101,1142,310574~'
-script += 'e~r099,1143,310575~c~r0105,1144,310576~i~r0111,1145,310577~o~r0117,1146,310578~u~r0115,1147,310579~s'
-script += '~r032,1148,310580~ ~r0109,1149,310581~m~r0101,1150,310582~e~r0116,1151,310583~t~r097,1152,310584~a~r0108,1153,310585~'
-script += 'l~r0115,1154,310586~s~r032,1155,310587~ ~r097,1156,310588~a~r0110,1157,310589~n~r0100,1158,310590~d~r032,1159,310591~'
-script += ' ~r0115,1160,310592~s~r0116,1161,310593~t~r0111,1162,310594~o~r0110,1163,310595~n~r0101,1164,310596~'
-script += 'e~r0115,1165,310597~s~r046,1166,310598~.~r010431,10,35,4101,50,60~\n~r010,19212,29212,327456,426,51531,627455~'
-script += '\n~r084,327457~T~r0104,327458~h~r0105,327459~i~r0110,327460~n~r0103,327461~g~r0115,327462~s~r032,327463~'
-script += ' ~r0111,327464~o~r0102,327465~f~r032,327466~ ~r0105,327467~i~r0110,327468~n~r0116,327469~t~r0101,327470~'
-script += 'e~r0114,327471~r~r0101,327472~e~r0115,327473~s~r0116,327474~t~r032,327475~ ~r0104,327476~h~r0101,327477~'
-script += 'e~r0114,327478~r~r0101,327479~e~r058,327480~:~r010,327481~\n~r019029,110,22463,31,416,55893,627381~-'
-script += ' ~r0116,10,319030,410,51528,619029~t~r0101,11,319031~e~r0108,12,319032~l~r0101,13,319033~e~r0112,14,319034~'
-script += 'p~r0111,15,319035~o~r0114,16,319036~r~r0116,17,319037~t~r0101,18,319038~e~r0114,19,319039~r~r019029,110,31,416,55893,627381~'
-script += '\n~r01,10,21,35,4101,50,60~\nThere is ~r049,110,210,332767,449,51~1~r01,10,21,35,4101,50~ exit:\n~r010599,327108,41,55814,627107~'
-script += '- ~r0115,310600,45,51528,610599~s~r0111,11,310601~o~r0117,12,310602~u~r0116,13,310603~t~r0104,14,310604~'
-script += 'h~r010599,10,327108,41,55814,627107~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~t~r025976,4116,51~a~r025977,497,52~k~r025978,4107,53~'
-script += 'e~r025979,4101,54~ ~r025980,432,55~t~r025981,4116,56~e~r025982,4101,57~l~r025983,4108,58~e~r025984,4101,59~'
-script += 'p~r025985,4112,510~o~r025986,4111,511~r~r025987,4114,512~t~r025988,4116,513~e~r025989,4101,514~r~r025990,4114,515~'
-script += '\n~r032,20,35,4101,50~~moutput~\n\n~r084,114065,214065,328055,47,51531,628054~~v27100~T~r097,328056~'
-script += 'a~r0107,328057~k~r0101,328058~e~r0110,328059~n~r046,328060~.~r010,328061~\n~r132613,232613,327415,417,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~# The teleporter shows the sixth '
-script += 'code in the stars\n~minput~u~r025976,4117,51~s~r025977,4115,52~e~r025978,4101,53~ ~r025979,432,54~t~r025980,4116,55~'
-script += 'e~r025981,4101,56~l~r025982,4108,57~e~r025983,4101,58~p~r025984,4112,59~o~r025985,4111,510~r~r025986,4114,511~'
-script += 't~r025987,4116,512~e~r025988,4101,513~r~r025989,4114,514~\n~r032,24,310,4101,50~~moutput~\n\n~r089,117255,217255,329546,4117,51531,629545~'
-script += 'Y~r0111,329547~o~r0117,329548~u~r032,329549~ ~r097,329550~a~r099,329551~c~r0116,329552~t~r0105,329553~'
-script += 'i~r0118,329554~v~r097,329555~a~r0116,329556~t~r0101,329557~e~r032,329558~ ~r0116,329559~t~r0104,329560~'
-script += 'h~r0101,329561~e~r032,329562~ ~r0116,329563~t~r0101,329564~e~r0108,329565~l~r0101,329566~e~r0112,329567~'
-script += 'p~r0111,329568~o~r0114,329569~r~r0116,329570~t~r0101,329571~e~r0114,329572~r~r033,329573~!~r032,329574~'
-script += ' ~r329575~ ~r065,329576~A~r0115,329577~s~r032,329578~ ~r0121,329579~y~r0111,329580~o~r0117,329581~u~r032,329582~'
-script += ' ~r0115,329583~s~r0112,329584~p~r0105,329585~i~r0114,329586~r~r097,329587~a~r0108,329588~l~r032,329589~'
-script += ' ~r0116,329590~t~r0104,329591~h~r0114,329592~r~r0111,329593~o~r0117,329594~u~r0103,329595~g~r0104,329596~'
-script += 'h~r032,329597~ ~r0116,329598~t~r0105,329599~i~r0109,329600~m~r0101,329601~e~r032,329602~ ~r097,329603~'
-script += 'a~r0110,329604~n~r0100,329605~d~r032,329606~ ~r0115,329607~s~r0112,329608~p~r097,329609~a~r099,329610~'
-script += 'c~r0101,329611~e~r044,329612~,~r032,329613~ ~r0121,329614~y~r0111,329615~o~r0117,329616~u~r032,329617~'
-script += ' ~r0116,329618~t~r0104,329619~h~r0105,329620~i~r0110,329621~n~r0107,329622~k~r032,329623~ ~r0121,329624~'
-script += 'y~r0111,329625~o~r0117,329626~u~r032,329627~ ~r0115,329628~s~r0101,329629~e~r329630~e~r032,329631~ ~r097,329632~'
-script += 'a~r032,329633~ ~r0112,329634~p~r097,329635~a~r0116,329636~t~r329637~t~r0101,329638~e~r0114,329639~r~r0110,329640~'
-script += 'n~r032,329641~ ~r0105,329642~i~r0110,329643~n~r032,329644~ ~r0116,329645~t~r0104,329646~h~r0101,329647~'
-script += 'e~r032,329648~ ~r0115,329649~s~r0116,329650~t~r097,329651~a~r0114,329652~r~r0115,329653~s~r046,329654~'
-script += '.~r329655~.~r329656~.~r010,329657~\n~r329658~\n~r032,329659~ ~r329660~ ~r329661~ ~r329662~ ~r0105,10,232767,36130,412,51528,66129~'
-script += '~mcode~i~r0112,11,36131~p~r077,12,36132~M~r0108,13,36133~l~r0103,14,36134~g~r0114,15,36135~r~r0103,16,36136~'
-script += 'g~r068,17,36137~D~r0121,18,36138~y~r098,19,36139~b~r079,110,36140~O~r090,111,36141~Z~moutput~~r010,111636,211636,329668,489,51531,629667~'
-script += '\n~r329669~\n~r065,329670~A~r0102,329671~f~r0116,329672~t~r0101,329673~e~r0114,329674~r~r032,329675~'
-script += ' ~r097,329676~a~r032,329677~ ~r0102,329678~f~r0101,329679~e~r0119,329680~w~r032,329681~ ~r0109,329682~'
-script += 'm~r0111,329683~o~r0109,329684~m~r0101,329685~e~r0110,329686~n~r0116,329687~t~r0115,329688~s~r044,329689~'
-script += ',~r032,329690~ ~r0121,329691~y~r0111,329692~o~r0117,329693~u~r032,329694~ ~r0102,329695~f~r0105,329696~'
-script += 'i~r0110,329697~n~r0100,329698~d~r032,329699~ ~r0121,329700~y~r0111,329701~o~r0117,329702~u~r0114,329703~'
-script += 'r~r0115,329704~s~r0101,329705~e~r0108,329706~l~r0102,329707~f~r032,329708~ ~r098,329709~b~r097,329710~'
-script += 'a~r099,329711~c~r0107,329712~k~r032,329713~ ~r0111,329714~o~r0110,329715~n~r032,329716~ ~r0115,329717~'
-script += 's~r0111,329718~o~r0108,329719~l~r0105,329720~i~r0100,329721~d~r032,329722~ ~r0103,329723~g~r0114,329724~'
-script += 'r~r0111,329725~o~r0117,329726~u~r0110,329727~n~r0100,329728~d~r032,329729~ ~r097,329730~a~r0110,329731~'
-script += 'n~r0100,329732~d~r032,329733~ ~r097,329734~a~r032,329735~ ~r0108,329736~l~r0105,329737~i~r0116,329738~'
-script += 't~r329739~t~r0108,329740~l~r0101,329741~e~r032,329742~ ~r0100,329743~d~r0105,329744~i~r0115,329745~s'
-script += '~r0111,329746~o~r0114,329747~r~r0105,329748~i~r0101,329749~e~r0110,329750~n~r0116,329751~t~r0101,329752~'
-script += 'e~r0100,329753~d~r046,329754~.~r010,329755~\n~r329756~\n~r02488,10,23,310,4101,50,60~~v27322488~== ~r083,311268,420,51528,611267~'
-script += 'S~r0121,11,311269~y~r0110,12,311270~n~r097,13,311271~a~r099,14,311272~c~r0111,15,311273~o~r0114,16,311274~'
-script += 'r~r032,17,311275~ ~r072,18,311276~H~r0101,19,311277~e~r097,110,311278~a~r0100,111,311279~d~r0113,112,311280~'
-script += 'q~r0117,113,311281~u~r097,114,311282~a~r0114,115,311283~r~r0116,116,311284~t~r0101,117,311285~e~r0114,118,311286~'
-script += 'r~r0115,119,311287~s~r011267,10,310,4101,50,60~ ==\n~r089,311289,4255,51528,611288~Y~r0111,11,311290~'
-script += 'o~r0117,12,311291~u~r032,13,311292~ ~r0115,14,311293~s~r0116,15,311294~t~r097,16,311295~a~r0110,17,311296~'
-script += 'n~r0100,18,311297~d~r032,19,311298~ ~r0105,110,311299~i~r0110,111,311300~n~r032,112,311301~ ~r0116,113,311302~'
-script += 't~r0104,114,311303~h~r0101,115,311304~e~r032,116,311305~ ~r0108,117,311306~l~r0111,118,311307~o~r098,119,311308~'
-script += 'b~r120,311309~b~r0121,121,311310~y~r032,122,311311~ ~r0111,123,311312~o~r0102,124,311313~f~r032,125,311314~'
-script += ' ~r0119,126,311315~w~r0104,127,311316~h~r097,128,311317~a~r0116,129,311318~t~r032,130,311319~ ~r097,131,311320~'
-script += 'a~r0112,132,311321~p~r133,311322~p~r0101,134,311323~e~r097,135,311324~a~r0114,136,311325~r~r0115,137,311326~'
-script += 's~r032,138,311327~ ~r0116,139,311328~t~r0111,140,311329~o~r032,141,311330~ ~r098,142,311331~b~r0101,143,311332~'
-script += 'e~r032,144,311333~ ~r097,145,311334~a~r032,146,311335~ ~r0114,147,311336~r~r0101,148,311337~e~r097,149,311338~'
-script += 'a~r0108,150,311339~l~r151,311340~l~r0121,152,311341~y~r032,153,311342~ ~r0102,154,311343~f~r0117,155,311344~'
-script += 'u~r0110,156,311345~n~r032,157,311346~ ~r0112,158,311347~p~r0108,159,311348~l~r097,160,311349~a~r099,161,311350~'
-script += 'c~r0101,162,311351~e~r032,163,311352~ ~r0116,164,311353~t~r0111,165,311354~o~r032,166,311355~ ~r0119,167,311356~'
-script += 'w~r0111,168,311357~o~r0114,169,311358~r~r0107,170,311359~k~r033,171,311360~!~r032,172,311361~ ~r173,311362~'
-script += ' ~r083,174,311363~S~r097,175,311364~a~r0100,176,311365~d~r0108,177,311366~l~r0121,178,311367~y~r044,179,311368~'
-script += ',~r032,180,311369~ ~r0116,181,311370~t~r0104,182,311371~h~r0101,183,311372~e~r0114,184,311373~r~r0101,185,311374~'
-script += 'e~r032,186,311375~ ~r0100,187,311376~d~r0111,188,311377~o~r0101,189,311378~e~r0115,190,311379~s~r0110,191,311380~'
-script += 'n~r039,192,311381~\'~r0116,193,311382~t~r032,194,311383~ ~r0115,195,311384~s~r0101,196,311385~e~r197,311386~'
-script += 'e~r0109,198,311387~m~r032,199,311388~ ~r0116,1100,311389~t~r0111,1101,311390~o~r032,1102,311391~ ~r098,1103,311392~'
-script += 'b~r0101,1104,311393~e~r032,1105,311394~ ~r097,1106,311395~a~r0110,1107,311396~n~r0121,1108,311397~y~r0111,1109,311398~'
-script += 'o~r0110,1110,311399~n~r0101,1111,311400~e~r032,1112,311401~ ~r097,1113,311402~a~r0114,1114,311403~r~r0111,1115,311404~'
-script += 'o~r0117,1116,311405~u~r0110,1117,311406~n~r0100,1118,311407~d~r032,1119,311408~ ~r097,1120,311409~a~r0116,1121,311410~'
-script += 't~r032,1122,311411~ ~r0116,1123,311412~t~r0104,1124,311413~h~r0101,1125,311414~e~r032,1126,311415~ ~r0109,1127,311416~'
-script += 'm~r0111,1128,311417~o~r0109,1129,311418~m~r0101,1130,311419~e~r0110,1131,311420~n~r0116,1132,311421~'
-script += 't~r044,1133,311422~,~r032,1134,311423~ ~r0115,1135,311424~s~r0111,1136,311425~o~r032,1137,311426~ ~r0121,1138,311427~'
-script += 'y~r0111,1139,311428~o~r0117,1140,311429~u~r032,1141,311430~ ~r0109,1142,311431~m~r097,1143,311432~a~r0107,1144,311433~'
-script += 'k~r0101,1145,311434~e~r032,1146,311435~ ~r097,1147,311436~a~r032,1148,311437~ ~r0110,1149,311438~n~r0111,1150,311439~'
-script += 'o~r0116,1151,311440~t~r0101,1152,311441~e~r032,1153,311442~ ~r0116,1154,311443~t~r0111,1155,311444~o'
-script += '~r032,1156,311445~ ~r099,1157,311446~c~r097,1158,311447~a~r0108,1159,311448~l~r1160,311449~l~r032,1161,311450~'
-script += ' ~r0116,1162,311451~t~r0104,1163,311452~h~r0101,1164,311453~e~r0109,1165,311454~m~r032,1166,311455~ '
-script += '~r0108,1167,311456~l~r097,1168,311457~a~r0116,1169,311458~t~r0101,1170,311459~e~r0114,1171,311460~r~r046,1172,311461~'
-script += '.~r032,1173,311462~ ~r1174,311463~ ~r084,1175,311464~T~r0104,1176,311465~h~r0101,1177,311466~e~r032,1178,311467~'
-script += ' ~r098,1179,311468~b~r0111,1180,311469~o~r1181,311470~o~r0107,1182,311471~k~r0115,1183,311472~s~r0104,1184,311473~'
-script += 'h~r0101,1185,311474~e~r0108,1186,311475~l~r0102,1187,311476~f~r032,1188,311477~ ~r0104,1189,311478~h'
-script += '~r0101,1190,311479~e~r0114,1191,311480~r~r0101,1192,311481~e~r032,1193,311482~ ~r0108,1194,311483~l~r0111,1195,311484~'
-script += 'o~r1196,311485~o~r0107,1197,311486~k~r0115,1198,311487~s~r032,1199,311488~ ~r0108,1200,311489~l~r0105,1201,311490~'
-script += 'i~r0107,1202,311491~k~r0101,1203,311492~e~r032,1204,311493~ ~r0105,1205,311494~i~r0116,1206,311495~t'
-script += '~r032,1207,311496~ ~r0109,1208,311497~m~r0105,1209,311498~i~r0103,1210,311499~g~r0104,1211,311500~h~r0116,1212,311501~'
-script += 't~r032,1213,311502~ ~r0104,1214,311503~h~r097,1215,311504~a~r0118,1216,311505~v~r0101,1217,311506~e~r032,1218,311507~'
-script += ' ~r0115,1219,311508~s~r0111,1220,311509~o~r0109,1221,311510~m~r0101,1222,311511~e~r0116,1223,311512~'
-script += 't~r0104,1224,311513~h~r0105,1225,311514~i~r0110,1226,311515~n~r0103,1227,311516~g~r032,1228,311517~ '
-script += '~r0105,1229,311518~i~r0110,1230,311519~n~r0116,1231,311520~t~r0101,1232,311521~e~r0114,1233,311522~r'
-script += '~r0101,1234,311523~e~r0115,1235,311524~s~r0116,1236,311525~t~r0105,1237,311526~i~r0110,1238,311527~n'
-script += '~r0103,1239,311528~g~r032,1240,311529~ ~r0105,1241,311530~i~r0110,1242,311531~n~r032,1243,311532~ ~r0105,1244,311533~'
-script += 'i~r0116,1245,311534~t~r044,1246,311535~,~r032,1247,311536~ ~r0116,1248,311537~t~r0104,1249,311538~h~r0111,1250,311539~'
-script += 'o~r0117,1251,311540~u~r0103,1252,311541~g~r0104,1253,311542~h~r046,1254,311543~.~r011288,10,310,4101,50,60~'
-script += '\n~r010,19212,29212,327456,426,51531,627455~\n~r084,327457~T~r0104,327458~h~r0105,327459~i~r0110,327460~'
-script += 'n~r0103,327461~g~r0115,327462~s~r032,327463~ ~r0111,327464~o~r0102,327465~f~r032,327466~ ~r0105,327467~'
-script += 'i~r0110,327468~n~r0116,327469~t~r0101,327470~e~r0114,327471~r~r0101,327472~e~r0115,327473~s~r0116,327474~'
-script += 't~r032,327475~ ~r0104,327476~h~r0101,327477~e~r0114,327478~r~r0101,327479~e~r058,327480~:~r010,327481~'
-script += '\n~r019113,111,22488,31,416,55893,627381~- ~r098,10,319114,413,51528,619113~b~r0117,11,319115~u~r0115,12,319116~'
-script += 's~r0105,13,319117~i~r0110,14,319118~n~r0101,15,319119~e~r0115,16,319120~s~r17,319121~s~r032,18,319122~'
-script += ' ~r099,19,319123~c~r097,110,319124~a~r0114,111,319125~r~r0100,112,319126~d~r019113,111,31,416,55893,627381~'
-script += '\n~r019384,112~- ~r0115,10,319385,412,51528,619384~s~r0116,11,319386~t~r0114,12,319387~r~r097,13,319388~'
-script += 'a~r0110,14,319389~n~r0103,15,319390~g~r0101,16,319391~e~r032,17,319392~ ~r098,18,319393~b~r0111,19,319394~'
-script += 'o~r110,319395~o~r0107,111,319396~k~r019384,112,31,416,55893,627381~\n~r01,10,21,310,4101,50,60~\nThe'
-script += 're is ~r049,110,210,332767,449,51~1~r01,10,21,310,4101,50~ exit:\n~r011544,327132,41,55814,627131~- '
-script += '~r0111,311545,47,51528,611544~o~r0117,11,311546~u~r0116,12,311547~t~r0115,13,311548~s~r0105,14,311549~'
-script += 'i~r0100,15,311550~d~r0101,16,311551~e~r011544,10,327132,41,55814,627131~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~t~r025976,4116,51~a~r025977,497,52~'
-script += 'k~r025978,4107,53~e~r025979,4101,54~ ~r025980,432,55~b~r025981,498,56~u~r025982,4117,57~s~r025983,4115,58~'
-script += 'i~r025984,4105,59~n~r025985,4110,510~e~r025986,4101,511~s~r025987,4115,512~s~r025988,513~ ~r025989,432,514~'
-script += 'c~r025990,499,515~a~r025991,497,516~r~r025992,4114,517~d~r025993,4100,518~\n~r032,23,310,4101,50~~moutput~'
-script += '\n\n~r084,114065,214065,328055,47,51531,628054~~v27140~T~r097,328056~a~r0107,328057~k~r0101,328058~e'
-script += '~r0110,328059~n~r046,328060~.~r010,328061~\n~r132613,232613,327415,417,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~l~r025976,4108,51~o~r025977,4111,52~o~r025978,53~k~r025979,4107,54~'
-script += ' ~r025980,432,55~b~r025981,498,56~u~r025982,4117,57~s~r025983,4115,58~i~r025984,4105,59~n~r025985,4110,510~'
-script += 'e~r025986,4101,511~s~r025987,4115,512~s~r025988,513~ ~r025989,432,514~c~r025990,499,515~a~r025991,497,516~'
-script += 'r~r025992,4114,517~d~r025993,4100,518~\n~r032,24,313,4101,50~~moutput~\n\n~r084,10,319128,464,51528,619127~'
-script += 'T~r0104,11,319129~h~r0105,12,319130~i~r0115,13,319131~s~r032,14,319132~ ~r098,15,319133~b~r0117,16,319134~'
-script += 'u~r0115,17,319135~s~r0105,18,319136~i~r0110,19,319137~n~r0101,110,319138~e~r0115,111,319139~s~r112,319140~'
-script += 's~r032,113,319141~ ~r099,114,319142~c~r097,115,319143~a~r0114,116,319144~r~r0100,117,319145~d~r032,118,319146~'
-script += ' ~r0104,119,319147~h~r097,120,319148~a~r0115,121,319149~s~r032,122,319150~ ~r034,123,319151~"~r0115,124,319152~'
-script += 's~r0121,125,319153~y~r0110,126,319154~n~r097,127,319155~a~r099,128,319156~c~r0111,129,319157~o~r0114,130,319158~'
-script += 'r~r046,131,319159~.~r099,132,319160~c~r0111,133,319161~o~r0109,134,319162~m~r034,135,319163~"~r032,136,319164~'
-script += ' ~r0112,137,319165~p~r0114,138,319166~r~r0105,139,319167~i~r0110,140,319168~n~r0116,141,319169~t~r0101,142,319170~'
-script += 'e~r0100,143,319171~d~r032,144,319172~ ~r0105,145,319173~i~r0110,146,319174~n~r032,147,319175~ ~r0114,148,319176~'
-script += 'r~r0101,149,319177~e~r0100,150,319178~d~r032,151,319179~ ~r0111,152,319180~o~r0110,153,319181~n~r032,154,319182~'
-script += ' ~r0111,155,319183~o~r0110,156,319184~n~r0101,157,319185~e~r032,158,319186~ ~r0115,159,319187~s~r0105,160,319188~'
-script += 'i~r0100,161,319189~d~r0101,162,319190~e~r046,163,319191~.~r019127,12713,313,4101,50,60~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~t~r025976,4116,51~a~r025977,497,52~'
-script += 'k~r025978,4107,53~e~r025979,4101,54~ ~r025980,432,55~s~r025981,4115,56~t~r025982,4116,57~r~r025983,4114,58~'
-script += 'a~r025984,497,59~n~r025985,4110,510~g~r025986,4103,511~e~r025987,4101,512~ ~r025988,432,513~b~r025989,498,514~'
-script += 'o~r025990,4111,515~o~r025991,516~k~r025992,4107,517~\n~r032,24,313,4101,50~~moutput~\n\n~r084,114065,214065,328055,47,51531,628054~'
-script += '~v27260~T~r097,328056~a~r0107,328057~k~r0101,328058~e~r0110,328059~n~r046,328060~.~r010,328061~\n~r132613,232613,327415,417,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~l~r025976,4108,51~o~r025977,4111,52~'
-script += 'o~r025978,53~k~r025979,4107,54~ ~r025980,432,55~s~r025981,4115,56~t~r025982,4116,57~r~r025983,4114,58~'
-script += 'a~r025984,497,59~n~r025985,4110,510~g~r025986,4103,511~e~r025987,4101,512~ ~r025988,432,513~b~r025989,498,514~'
-script += 'o~r025990,4111,515~o~r025991,516~k~r025992,4107,517~\n~r032,24,312,4101,50~~moutput~\n\n~r084,10,319398,42695,51528,619397~'
-script += 'T~r0104,11,319399~h~r0101,12,319400~e~r032,13,319401~ ~r099,14,319402~c~r0111,15,319403~o~r0118,16,319404~'
-script += 'v~r0101,17,319405~e~r0114,18,319406~r~r032,19,319407~ ~r0111,110,319408~o~r0102,111,319409~f~r032,112,319410~'
-script += ' ~r0116,113,319411~t~r0104,114,319412~h~r0105,115,319413~i~r0115,116,319414~s~r032,117,319415~ ~r098,118,319416~'
-script += 'b~r0111,119,319417~o~r120,319418~o~r0107,121,319419~k~r032,122,319420~ ~r0115,123,319421~s~r0117,124,319422~'
-script += 'u~r098,125,319423~b~r0116,126,319424~t~r0108,127,319425~l~r0121,128,319426~y~r032,129,319427~ ~r0115,130,319428~'
-script += 's~r0119,131,319429~w~r0105,132,319430~i~r0114,133,319431~r~r0108,134,319432~l~r0115,135,319433~s~r032,136,319434~'
-script += ' ~r0119,137,319435~w~r0105,138,319436~i~r0116,139,319437~t~r0104,140,319438~h~r032,141,319439~ ~r099,142,319440~'
-script += 'c~r0111,143,319441~o~r0108,144,319442~l~r0111,145,319443~o~r0114,146,319444~r~r0115,147,319445~s~r046,148,319446~'
-script += '.~r032,149,319447~ ~r150,319448~ ~r073,151,319449~I~r0116,152,319450~t~r032,153,319451~ ~r0105,154,319452~'
-script += 'i~r0115,155,319453~s~r032,156,319454~ ~r0116,157,319455~t~r0105,158,319456~i~r0116,159,319457~t~r0108,160,319458~'
-script += 'l~r0101,161,319459~e~r0100,162,319460~d~r032,163,319461~ ~r034,164,319462~"~r065,165,319463~A~r032,166,319464~'
-script += ' ~r066,167,319465~B~r0114,168,319466~r~r0105,169,319467~i~r0101,170,319468~e~r0102,171,319469~f~r032,172,319470~'
-script += ' ~r073,173,319471~I~r0110,174,319472~n~r0116,175,319473~t~r0114,176,319474~r~r0111,177,319475~o~r0100,178,319476~'
-script += 'd~r0117,179,319477~u~r099,180,319478~c~r0116,181,319479~t~r0105,182,319480~i~r0111,183,319481~o~r0110,184,319482~'
-script += 'n~r032,185,319483~ ~r0116,186,319484~t~r0111,187,319485~o~r032,188,319486~ ~r073,189,319487~I~r0110,190,319488~'
-script += 'n~r0116,191,319489~t~r0101,192,319490~e~r0114,193,319491~r~r0100,194,319492~d~r0105,195,319493~i~r0109,196,319494~'
-script += 'm~r0101,197,319495~e~r0110,198,319496~n~r0115,199,319497~s~r0105,1100,319498~i~r0111,1101,319499~o~r0110,1102,319500~'
-script += 'n~r097,1103,319501~a~r0108,1104,319502~l~r032,1105,319503~ ~r080,1106,319504~P~r0104,1107,319505~h~r0121,1108,319506~'
-script += 'y~r0115,1109,319507~s~r0105,1110,319508~i~r099,1111,319509~c~r0115,1112,319510~s~r034,1113,319511~"~r046,1114,319512~'
-script += '.~r032,1115,319513~ ~r1116,319514~ ~r073,1117,319515~I~r0116,1118,319516~t~r032,1119,319517~ ~r0114,1120,319518~'
-script += 'r~r0101,1121,319519~e~r097,1122,319520~a~r0100,1123,319521~d~r0115,1124,319522~s~r058,1125,319523~:~r010,1126,319524~'
-script += '\n~r1127,319525~\n~r082,1128,319526~R~r0101,1129,319527~e~r099,1130,319528~c~r0101,1131,319529~e~r0110,1132,319530~'
-script += 'n~r0116,1133,319531~t~r032,1134,319532~ ~r097,1135,319533~a~r0100,1136,319534~d~r0118,1137,319535~v~r097,1138,319536~'
-script += 'a~r0110,1139,319537~n~r099,1140,319538~c~r0101,1141,319539~e~r0115,1142,319540~s~r032,1143,319541~ ~r0105,1144,319542~'
-script += 'i~r0110,1145,319543~n~r032,1146,319544~ ~r0105,1147,319545~i~r0110,1148,319546~n~r0116,1149,319547~t'
-script += '~r0101,1150,319548~e~r0114,1151,319549~r~r0100,1152,319550~d~r0105,1153,319551~i~r0109,1154,319552~m'
-script += '~r0101,1155,319553~e~r0110,1156,319554~n~r0115,1157,319555~s~r0105,1158,319556~i~r0111,1159,319557~o'
-script += '~r0110,1160,319558~n~r097,1161,319559~a~r0108,1162,319560~l~r032,1163,319561~ ~r0112,1164,319562~p~r0104,1165,319563~'
-script += 'h~r0121,1166,319564~y~r0115,1167,319565~s~r0105,1168,319566~i~r099,1169,319567~c~r0115,1170,319568~s'
-script += '~r032,1171,319569~ ~r0104,1172,319570~h~r097,1173,319571~a~r0118,1174,319572~v~r0101,1175,319573~e~r032,1176,319574~'
-script += ' ~r0112,1177,319575~p~r0114,1178,319576~r~r0111,1179,319577~o~r0100,1180,319578~d~r0117,1181,319579~'
-script += 'u~r099,1182,319580~c~r0101,1183,319581~e~r0100,1184,319582~d~r032,1185,319583~ ~r0102,1186,319584~f~r097,1187,319585~'
-script += 'a~r0115,1188,319586~s~r099,1189,319587~c~r0105,1190,319588~i~r0110,1191,319589~n~r097,1192,319590~a~r0116,1193,319591~'
-script += 't~r0105,1194,319592~i~r0110,1195,319593~n~r0103,1196,319594~g~r010,1197,319595~\n~r0112,1198,319596~'
-script += 'p~r0114,1199,319597~r~r0101,1200,319598~e~r0100,1201,319599~d~r0105,1202,319600~i~r099,1203,319601~c'
-script += '~r0116,1204,319602~t~r0105,1205,319603~i~r0111,1206,319604~o~r0110,1207,319605~n~r0115,1208,319606~s'
-script += '~r032,1209,319607~ ~r097,1210,319608~a~r098,1211,319609~b~r0111,1212,319610~o~r0117,1213,319611~u~r0116,1214,319612~'
-script += 't~r032,1215,319613~ ~r0116,1216,319614~t~r0104,1217,319615~h~r0101,1218,319616~e~r032,1219,319617~ ~r0102,1220,319618~'
-script += 'f~r0117,1221,319619~u~r0110,1222,319620~n~r0100,1223,319621~d~r097,1224,319622~a~r0109,1225,319623~m'
-script += '~r0101,1226,319624~e~r0110,1227,319625~n~r0116,1228,319626~t~r097,1229,319627~a~r0108,1230,319628~l~r0115,1231,319629~'
-script += 's~r032,1232,319630~ ~r0111,1233,319631~o~r0102,1234,319632~f~r032,1235,319633~ ~r0111,1236,319634~o~r0117,1237,319635~'
-script += 'u~r0114,1238,319636~r~r032,1239,319637~ ~r0117,1240,319638~u~r0110,1241,319639~n~r0105,1242,319640~i'
-script += '~r0118,1243,319641~v~r0101,1244,319642~e~r0114,1245,319643~r~r0115,1246,319644~s~r0101,1247,319645~e'
-script += '~r033,1248,319646~!~r032,1249,319647~ ~r1250,319648~ ~r070,1251,319649~F~r0111,1252,319650~o~r0114,1253,319651~'
-script += 'r~r032,1254,319652~ ~r0101,1255,319653~e~r0120,1256,319654~x~r097,1257,319655~a~r0109,1258,319656~m~r0112,1259,319657~'
-script += 'p~r0108,1260,319658~l~r0101,1261,319659~e~r044,1262,319660~,~r010,1263,319661~\n~r0105,1264,319662~i'
-script += '~r0110,1265,319663~n~r0116,1266,319664~t~r0101,1267,319665~e~r0114,1268,319666~r~r0100,1269,319667~d'
-script += '~r0105,1270,319668~i~r0109,1271,319669~m~r0101,1272,319670~e~r0110,1273,319671~n~r0115,1274,319672~s'
-script += '~r0105,1275,319673~i~r0111,1276,319674~o~r0110,1277,319675~n~r097,1278,319676~a~r0108,1279,319677~l~r032,1280,319678~'
-script += ' ~r0112,1281,319679~p~r0104,1282,319680~h~r0121,1283,319681~y~r0115,1284,319682~s~r0105,1285,319683~'
-script += 'i~r099,1286,319684~c~r0115,1287,319685~s~r032,1288,319686~ ~r0115,1289,319687~s~r0101,1290,319688~e~r1291,319689~'
-script += 'e~r0109,1292,319690~m~r0115,1293,319691~s~r032,1294,319692~ ~r0116,1295,319693~t~r0111,1296,319694~o'
-script += '~r032,1297,319695~ ~r0112,1298,319696~p~r0114,1299,319697~r~r0101,1300,319698~e~r0100,1301,319699~d~r0105,1302,319700~'
-script += 'i~r099,1303,319701~c~r0116,1304,319702~t~r032,1305,319703~ ~r0116,1306,319704~t~r0104,1307,319705~h~r097,1308,319706~'
-script += 'a~r0116,1309,319707~t~r032,1310,319708~ ~r0116,1311,319709~t~r0104,1312,319710~h~r0101,1313,319711~e'
-script += '~r032,1314,319712~ ~r0117,1315,319713~u~r0110,1316,319714~n~r0105,1317,319715~i~r0118,1318,319716~v~r0101,1319,319717~'
-script += 'e~r0114,1320,319718~r~r0115,1321,319719~s~r0101,1322,319720~e~r032,1323,319721~ ~r0105,1324,319722~i'
-script += '~r0115,1325,319723~s~r044,1326,319724~,~r032,1327,319725~ ~r097,1328,319726~a~r0116,1329,319727~t~r032,1330,319728~'
-script += ' ~r0105,1331,319729~i~r0116,1332,319730~t~r0115,1333,319731~s~r032,1334,319732~ ~r0114,1335,319733~r'
-script += '~r0111,1336,319734~o~r1337,319735~o~r0116,1338,319736~t~r044,1339,319737~,~r032,1340,319738~ ~r097,1341,319739~'
-script += 'a~r010,1342,319740~\n~r0112,1343,319741~p~r0117,1344,319742~u~r0114,1345,319743~r~r0101,1346,319744~'
-script += 'e~r0108,1347,319745~l~r0121,1348,319746~y~r032,1349,319747~ ~r0109,1350,319748~m~r097,1351,319749~a~r0116,1352,319750~'
-script += 't~r0104,1353,319751~h~r0101,1354,319752~e~r0109,1355,319753~m~r097,1356,319754~a~r0116,1357,319755~t'
-script += '~r0105,1358,319756~i~r099,1359,319757~c~r097,1360,319758~a~r0108,1361,319759~l~r032,1362,319760~ ~r099,1363,319761~'
-script += 'c~r0111,1364,319762~o~r0110,1365,319763~n~r0115,1366,319764~s~r0116,1367,319765~t~r0114,1368,319766~'
-script += 'r~r0117,1369,319767~u~r099,1370,319768~c~r0116,1371,319769~t~r044,1372,319770~,~r032,1373,319771~ ~r097,1374,319772~'
-script += 'a~r0110,1375,319773~n~r0100,1376,319774~d~r032,1377,319775~ ~r0116,1378,319776~t~r0104,1379,319777~h'
-script += '~r097,1380,319778~a~r0116,1381,319779~t~r032,1382,319780~ ~r097,1383,319781~a~r0108,1384,319782~l~r1385,319783~'
-script += 'l~r032,1386,319784~ ~r0101,1387,319785~e~r0118,1388,319786~v~r0101,1389,319787~e~r0110,1390,319788~n'
-script += '~r0116,1391,319789~t~r0115,1392,319790~s~r032,1393,319791~ ~r097,1394,319792~a~r0114,1395,319793~r~r0101,1396,319794~'
-script += 'e~r032,1397,319795~ ~r099,1398,319796~c~r097,1399,319797~a~r0117,1400,319798~u~r0115,1401,319799~s~r0101,1402,319800~'
-script += 'e~r0100,1403,319801~d~r032,1404,319802~ ~r098,1405,319803~b~r0121,1406,319804~y~r032,1407,319805~ ~r0116,1408,319806~'
-script += 't~r0104,1409,319807~h~r0101,1410,319808~e~r010,1411,319809~\n~r0105,1412,319810~i~r0110,1413,319811~'
-script += 'n~r0116,1414,319812~t~r0101,1415,319813~e~r0114,1416,319814~r~r097,1417,319815~a~r099,1418,319816~c~r0116,1419,319817~'
-script += 't~r0105,1420,319818~i~r0111,1421,319819~o~r0110,1422,319820~n~r0115,1423,319821~s~r032,1424,319822~ '
-script += '~r098,1425,319823~b~r0101,1426,319824~e~r0116,1427,319825~t~r0119,1428,319826~w~r0101,1429,319827~e~r1430,319828~'
-script += 'e~r0110,1431,319829~n~r032,1432,319830~ ~r0101,1433,319831~e~r0105,1434,319832~i~r0103,1435,319833~g'
-script += '~r0104,1436,319834~h~r0116,1437,319835~t~r032,1438,319836~ ~r0112,1439,319837~p~r0111,1440,319838~o~r099,1441,319839~'
-script += 'c~r0107,1442,319840~k~r0101,1443,319841~e~r0116,1444,319842~t~r0115,1445,319843~s~r032,1446,319844~ '
-script += '~r0111,1447,319845~o~r0102,1448,319846~f~r032,1449,319847~ ~r0101,1450,319848~e~r0110,1451,319849~n~r0101,1452,319850~'
-script += 'e~r0114,1453,319851~r~r0103,1454,319852~g~r0121,1455,319853~y~r032,1456,319854~ ~r099,1457,319855~c~r097,1458,319856~'
-script += 'a~r0108,1459,319857~l~r1460,319858~l~r0101,1461,319859~e~r0100,1462,319860~d~r032,1463,319861~ ~r034,1464,319862~'
-script += '"~r0114,1465,319863~r~r0101,1466,319864~e~r0103,1467,319865~g~r0105,1468,319866~i~r0115,1469,319867~'
-script += 's~r0116,1470,319868~t~r0101,1471,319869~e~r0114,1472,319870~r~r0115,1473,319871~s~r034,1474,319872~"'
-script += '~r046,1475,319873~.~r010,1476,319874~\n~r070,1477,319875~F~r0117,1478,319876~u~r0114,1479,319877~r~r0116,1480,319878~'
-script += 't~r0104,1481,319879~h~r0101,1482,319880~e~r0114,1483,319881~r~r0109,1484,319882~m~r0111,1485,319883~'
-script += 'o~r0114,1486,319884~r~r0101,1487,319885~e~r044,1488,319886~,~r032,1489,319887~ ~r0105,1490,319888~i~r0116,1491,319889~'
-script += 't~r032,1492,319890~ ~r0115,1493,319891~s~r0101,1494,319892~e~r1495,319893~e~r0109,1496,319894~m~r0115,1497,319895~'
-script += 's~r032,1498,319896~ ~r0116,1499,319897~t~r0104,1500,319898~h~r097,1501,319899~a~r0116,1502,319900~t~r032,1503,319901~'
-script += ' ~r0119,1504,319902~w~r0104,1505,319903~h~r0105,1506,319904~i~r0108,1507,319905~l~r0101,1508,319906~'
-script += 'e~r032,1509,319907~ ~r0116,1510,319908~t~r0104,1511,319909~h~r0101,1512,319910~e~r032,1513,319911~ ~r0108,1514,319912~'
-script += 'l~r0111,1515,319913~o~r0119,1516,319914~w~r0101,1517,319915~e~r0114,1518,319916~r~r032,1519,319917~ '
-script += '~r0114,1520,319918~r~r0101,1521,319919~e~r0103,1522,319920~g~r0105,1523,319921~i~r0115,1524,319922~s'
-script += '~r0116,1525,319923~t~r0101,1526,319924~e~r0114,1527,319925~r~r0115,1528,319926~s~r032,1529,319927~ ~r0112,1530,319928~'
-script += 'p~r0114,1531,319929~r~r0105,1532,319930~i~r0109,1533,319931~m~r097,1534,319932~a~r0114,1535,319933~r'
-script += '~r0105,1536,319934~i~r0108,1537,319935~l~r0121,1538,319936~y~r032,1539,319937~ ~r099,1540,319938~c~r0111,1541,319939~'
-script += 'o~r0110,1542,319940~n~r0116,1543,319941~t~r0114,1544,319942~r~r0111,1545,319943~o~r0108,1546,319944~'
-script += 'l~r032,1547,319945~ ~r0109,1548,319946~m~r0117,1549,319947~u~r0110,1550,319948~n~r0100,1551,319949~d'
-script += '~r097,1552,319950~a~r0110,1553,319951~n~r0101,1554,319952~e~r010,1555,319953~\n~r0116,1556,319954~t~r0104,1557,319955~'
-script += 'h~r0105,1558,319956~i~r0110,1559,319957~n~r0103,1560,319958~g~r0115,1561,319959~s~r032,1562,319960~ '
-script += '~r0108,1563,319961~l~r0105,1564,319962~i~r0107,1565,319963~k~r0101,1566,319964~e~r032,1567,319965~ ~r0115,1568,319966~'
-script += 's~r0111,1569,319967~o~r0117,1570,319968~u~r0110,1571,319969~n~r0100,1572,319970~d~r032,1573,319971~ '
-script += '~r097,1574,319972~a~r0110,1575,319973~n~r0100,1576,319974~d~r032,1577,319975~ ~r0108,1578,319976~l~r0105,1579,319977~'
-script += 'i~r0103,1580,319978~g~r0104,1581,319979~h~r0116,1582,319980~t~r044,1583,319981~,~r032,1584,319982~ ~r0116,1585,319983~'
-script += 't~r0104,1586,319984~h~r0101,1587,319985~e~r032,1588,319986~ ~r0104,1589,319987~h~r0105,1590,319988~i'
-script += '~r0103,1591,319989~g~r0104,1592,319990~h~r0101,1593,319991~e~r0115,1594,319992~s~r0116,1595,319993~t'
-script += '~r032,1596,319994~ ~r0114,1597,319995~r~r0101,1598,319996~e~r0103,1599,319997~g~r0105,1600,319998~i~r0115,1601,319999~'
-script += 's~r0116,1602,320000~t~r0101,1603,320001~e~r0114,1604,320002~r~r032,1605,320003~ ~r040,1606,320004~(~r0116,1607,320005~'
-script += 't~r0104,1608,320006~h~r0101,1609,320007~e~r032,1610,320008~ ~r0115,1611,320009~s~r0111,1612,320010~o'
-script += '~r045,1613,320011~-~r099,1614,320012~c~r097,1615,320013~a~r0108,1616,320014~l~r1617,320015~l~r0101,1618,320016~'
-script += 'e~r0100,1619,320017~d~r032,1620,320018~ ~r034,1621,320019~"~r0101,1622,320020~e~r0105,1623,320021~i~r0103,1624,320022~'
-script += 'g~r0104,1625,320023~h~r0116,1626,320024~t~r0104,1627,320025~h~r010,1628,320026~\n~r0114,1629,320027~'
-script += 'r~r0101,1630,320028~e~r0103,1631,320029~g~r0105,1632,320030~i~r0115,1633,320031~s~r0116,1634,320032~'
-script += 't~r0101,1635,320033~e~r0114,1636,320034~r~r034,1637,320035~"~r041,1638,320036~)~r032,1639,320037~ ~r0105,1640,320038~'
-script += 'i~r0115,1641,320039~s~r032,1642,320040~ ~r0117,1643,320041~u~r0115,1644,320042~s~r0101,1645,320043~e'
-script += '~r0100,1646,320044~d~r032,1647,320045~ ~r0116,1648,320046~t~r0111,1649,320047~o~r032,1650,320048~ ~r099,1651,320049~'
-script += 'c~r0111,1652,320050~o~r0110,1653,320051~n~r0116,1654,320052~t~r0114,1655,320053~r~r0111,1656,320054~'
-script += 'o~r0108,1657,320055~l~r032,1658,320056~ ~r0105,1659,320057~i~r0110,1660,320058~n~r0116,1661,320059~t'
-script += '~r0101,1662,320060~e~r0114,1663,320061~r~r0100,1664,320062~d~r0105,1665,320063~i~r0109,1666,320064~m'
-script += '~r0101,1667,320065~e~r0110,1668,320066~n~r0115,1669,320067~s~r0105,1670,320068~i~r0111,1671,320069~o'
-script += '~r0110,1672,320070~n~r097,1673,320071~a~r0108,1674,320072~l~r032,1675,320073~ ~r0101,1676,320074~e~r0118,1677,320075~'
-script += 'v~r0101,1678,320076~e~r0110,1679,320077~n~r0116,1680,320078~t~r0115,1681,320079~s~r032,1682,320080~ '
-script += '~r0115,1683,320081~s~r0117,1684,320082~u~r099,1685,320083~c~r0104,1686,320084~h~r032,1687,320085~ ~r097,1688,320086~'
-script += 'a~r0115,1689,320087~s~r032,1690,320088~ ~r0116,1691,320089~t~r0101,1692,320090~e~r0108,1693,320091~l'
-script += '~r0101,1694,320092~e~r0112,1695,320093~p~r0111,1696,320094~o~r0114,1697,320095~r~r0116,1698,320096~t'
-script += '~r097,1699,320097~a~r0116,1700,320098~t~r0105,1701,320099~i~r0111,1702,320100~o~r0110,1703,320101~n~r046,1704,320102~'
-script += '.~r010,1705,320103~\n~r1706,320104~\n~r065,1707,320105~A~r032,1708,320106~ ~r0104,1709,320107~h~r0121,1710,320108~'
-script += 'y~r0112,1711,320109~p~r0111,1712,320110~o~r0116,1713,320111~t~r0104,1714,320112~h~r0101,1715,320113~'
-script += 'e~r0116,1716,320114~t~r0105,1717,320115~i~r099,1718,320116~c~r097,1719,320117~a~r0108,1720,320118~l~r032,1721,320119~'
-script += ' ~r0115,1722,320120~s~r0117,1723,320121~u~r099,1724,320122~c~r0104,1725,320123~h~r032,1726,320124~ ~r0116,1727,320125~'
-script += 't~r0101,1728,320126~e~r0108,1729,320127~l~r0101,1730,320128~e~r0112,1731,320129~p~r0111,1732,320130~'
-script += 'o~r0114,1733,320131~r~r0116,1734,320132~t~r097,1735,320133~a~r0116,1736,320134~t~r0105,1737,320135~i'
-script += '~r0111,1738,320136~o~r0110,1739,320137~n~r032,1740,320138~ ~r0100,1741,320139~d~r0101,1742,320140~e~r0118,1743,320141~'
-script += 'v~r0105,1744,320142~i~r099,1745,320143~c~r0101,1746,320144~e~r032,1747,320145~ ~r0119,1748,320146~w~r0111,1749,320147~'
-script += 'o~r0117,1750,320148~u~r0108,1751,320149~l~r0100,1752,320150~d~r032,1753,320151~ ~r0110,1754,320152~n'
-script += '~r0101,1755,320153~e~r1756,320154~e~r0100,1757,320155~d~r032,1758,320156~ ~r0116,1759,320157~t~r0111,1760,320158~'
-script += 'o~r032,1761,320159~ ~r0104,1762,320160~h~r097,1763,320161~a~r0118,1764,320162~v~r0101,1765,320163~e~r032,1766,320164~'
-script += ' ~r0104,1767,320165~h~r097,1768,320166~a~r0118,1769,320167~v~r0101,1770,320168~e~r032,1771,320169~ ~r0101,1772,320170~'
-script += 'e~r0120,1773,320171~x~r097,1774,320172~a~r099,1775,320173~c~r0116,1776,320174~t~r0108,1777,320175~l~r0121,1778,320176~'
-script += 'y~r032,1779,320177~ ~r0116,1780,320178~t~r0119,1781,320179~w~r0111,1782,320180~o~r010,1783,320181~\n'
-script += '~r0100,1784,320182~d~r0101,1785,320183~e~r0115,1786,320184~s~r0116,1787,320185~t~r0105,1788,320186~i'
-script += '~r0110,1789,320187~n~r097,1790,320188~a~r0116,1791,320189~t~r0105,1792,320190~i~r0111,1793,320191~o~r0110,1794,320192~'
-script += 'n~r0115,1795,320193~s~r046,1796,320194~.~r032,1797,320195~ ~r1798,320196~ ~r079,1799,320197~O~r0110,1800,320198~'
-script += 'n~r0101,1801,320199~e~r032,1802,320200~ ~r0100,1803,320201~d~r0101,1804,320202~e~r0115,1805,320203~s'
-script += '~r0116,1806,320204~t~r0105,1807,320205~i~r0110,1808,320206~n~r097,1809,320207~a~r0116,1810,320208~t~r0105,1811,320209~'
-script += 'i~r0111,1812,320210~o~r0110,1813,320211~n~r032,1814,320212~ ~r0119,1815,320213~w~r0111,1816,320214~o'
-script += '~r0117,1817,320215~u~r0108,1818,320216~l~r0100,1819,320217~d~r032,1820,320218~ ~r098,1821,320219~b~r0101,1822,320220~'
-script += 'e~r032,1823,320221~ ~r0117,1824,320222~u~r0115,1825,320223~s~r0101,1826,320224~e~r0100,1827,320225~d'
-script += '~r032,1828,320226~ ~r0119,1829,320227~w~r0104,1830,320228~h~r0101,1831,320229~e~r0110,1832,320230~n~r032,1833,320231~'
-script += ' ~r0116,1834,320232~t~r0104,1835,320233~h~r0101,1836,320234~e~r032,1837,320235~ ~r0101,1838,320236~e'
-script += '~r0105,1839,320237~i~r0103,1840,320238~g~r0104,1841,320239~h~r0116,1842,320240~t~r0104,1843,320241~h'
-script += '~r032,1844,320242~ ~r0114,1845,320243~r~r0101,1846,320244~e~r0103,1847,320245~g~r0105,1848,320246~i~r0115,1849,320247~'
-script += 's~r0116,1850,320248~t~r0101,1851,320249~e~r0114,1852,320250~r~r032,1853,320251~ ~r0105,1854,320252~i'
-script += '~r0115,1855,320253~s~r032,1856,320254~ ~r097,1857,320255~a~r0116,1858,320256~t~r032,1859,320257~ ~r0105,1860,320258~'
-script += 'i~r0116,1861,320259~t~r0115,1862,320260~s~r010,1863,320261~\n~r0109,1864,320262~m~r0105,1865,320263~'
-script += 'i~r0110,1866,320264~n~r0105,1867,320265~i~r0109,1868,320266~m~r0117,1869,320267~u~r0109,1870,320268~'
-script += 'm~r032,1871,320269~ ~r0101,1872,320270~e~r0110,1873,320271~n~r0101,1874,320272~e~r0114,1875,320273~r'
-script += '~r0103,1876,320274~g~r0121,1877,320275~y~r032,1878,320276~ ~r0108,1879,320277~l~r0101,1880,320278~e~r0118,1881,320279~'
-script += 'v~r0101,1882,320280~e~r0108,1883,320281~l~r032,1884,320282~ ~r045,1885,320283~-~r032,1886,320284~ ~r0116,1887,320285~'
-script += 't~r0104,1888,320286~h~r0105,1889,320287~i~r0115,1890,320288~s~r032,1891,320289~ ~r0119,1892,320290~w'
-script += '~r0111,1893,320291~o~r0117,1894,320292~u~r0108,1895,320293~l~r0100,1896,320294~d~r032,1897,320295~ ~r098,1898,320296~'
-script += 'b~r0101,1899,320297~e~r032,1900,320298~ ~r0116,1901,320299~t~r0104,1902,320300~h~r0101,1903,320301~e'
-script += '~r032,1904,320302~ ~r0100,1905,320303~d~r0101,1906,320304~e~r0102,1907,320305~f~r097,1908,320306~a~r0117,1909,320307~'
-script += 'u~r0108,1910,320308~l~r0116,1911,320309~t~r032,1912,320310~ ~r0111,1913,320311~o~r0112,1914,320312~p'
-script += '~r0101,1915,320313~e~r0114,1916,320314~r~r097,1917,320315~a~r0116,1918,320316~t~r0105,1919,320317~i~r0111,1920,320318~'
-script += 'o~r0110,1921,320319~n~r032,1922,320320~ ~r097,1923,320321~a~r0115,1924,320322~s~r1925,320323~s~r0117,1926,320324~'
-script += 'u~r0109,1927,320325~m~r0105,1928,320326~i~r0110,1929,320327~n~r0103,1930,320328~g~r032,1931,320329~ '
-script += '~r0116,1932,320330~t~r0104,1933,320331~h~r0101,1934,320332~e~r032,1935,320333~ ~r0117,1936,320334~u~r0115,1937,320335~'
-script += 's~r0101,1938,320336~e~r0114,1939,320337~r~r010,1940,320338~\n~r0104,1941,320339~h~r097,1942,320340~a'
-script += '~r0115,1943,320341~s~r032,1944,320342~ ~r0110,1945,320343~n~r0111,1946,320344~o~r032,1947,320345~ ~r0119,1948,320346~'
-script += 'w~r097,1949,320347~a~r0121,1950,320348~y~r032,1951,320349~ ~r0116,1952,320350~t~r0111,1953,320351~o~r032,1954,320352~'
-script += ' ~r099,1955,320353~c~r0111,1956,320354~o~r0110,1957,320355~n~r0116,1958,320356~t~r0114,1959,320357~r'
-script += '~r0111,1960,320358~o~r0108,1961,320359~l~r032,1962,320360~ ~r0116,1963,320361~t~r0104,1964,320362~h~r0101,1965,320363~'
-script += 'e~r032,1966,320364~ ~r0101,1967,320365~e~r0105,1968,320366~i~r0103,1969,320367~g~r0104,1970,320368~h'
-script += '~r0116,1971,320369~t~r0104,1972,320370~h~r032,1973,320371~ ~r0114,1974,320372~r~r0101,1975,320373~e~r0103,1976,320374~'
-script += 'g~r0105,1977,320375~i~r0115,1978,320376~s~r0116,1979,320377~t~r0101,1980,320378~e~r0114,1981,320379~'
-script += 'r~r046,1982,320380~.~r032,1983,320381~ ~r1984,320382~ ~r073,1985,320383~I~r0110,1986,320384~n~r032,1987,320385~'
-script += ' ~r0116,1988,320386~t~r0104,1989,320387~h~r0105,1990,320388~i~r0115,1991,320389~s~r032,1992,320390~ '
-script += '~r0115,1993,320391~s~r0105,1994,320392~i~r0116,1995,320393~t~r0117,1996,320394~u~r097,1997,320395~a~r0116,1998,320396~'
-script += 't~r0105,1999,320397~i~r0111,11000,320398~o~r0110,11001,320399~n~r044,11002,320400~,~r032,11003,320401~'
-script += ' ~r0116,11004,320402~t~r0104,11005,320403~h~r0101,11006,320404~e~r032,11007,320405~ ~r0116,11008,320406~'
-script += 't~r0101,11009,320407~e~r0108,11010,320408~l~r0101,11011,320409~e~r0112,11012,320410~p~r0111,11013,320411~'
-script += 'o~r0114,11014,320412~r~r0116,11015,320413~t~r0101,11016,320414~e~r0114,11017,320415~r~r010,11018,320416~'
-script += '\n~r0115,11019,320417~s~r0104,11020,320418~h~r0111,11021,320419~o~r0117,11022,320420~u~r0108,11023,320421~'
-script += 'l~r0100,11024,320422~d~r032,11025,320423~ ~r0115,11026,320424~s~r0101,11027,320425~e~r0110,11028,320426~'
-script += 'n~r0100,11029,320427~d~r032,11030,320428~ ~r0116,11031,320429~t~r0104,11032,320430~h~r0101,11033,320431~'
-script += 'e~r032,11034,320432~ ~r0117,11035,320433~u~r0115,11036,320434~s~r0101,11037,320435~e~r0114,11038,320436~'
-script += 'r~r032,11039,320437~ ~r0116,11040,320438~t~r0111,11041,320439~o~r032,11042,320440~ ~r097,11043,320441~'
-script += 'a~r032,11044,320442~ ~r0112,11045,320443~p~r0114,11046,320444~r~r0101,11047,320445~e~r099,11048,320446~'
-script += 'c~r0111,11049,320447~o~r0110,11050,320448~n~r0102,11051,320449~f~r0105,11052,320450~i~r0103,11053,320451~'
-script += 'g~r0117,11054,320452~u~r0114,11055,320453~r~r0101,11056,320454~e~r0100,11057,320455~d~r032,11058,320456~'
-script += ' ~r0115,11059,320457~s~r097,11060,320458~a~r0102,11061,320459~f~r0101,11062,320460~e~r032,11063,320461~'
-script += ' ~r0108,11064,320462~l~r0111,11065,320463~o~r099,11066,320464~c~r097,11067,320465~a~r0116,11068,320466~'
-script += 't~r0105,11069,320467~i~r0111,11070,320468~o~r0110,11071,320469~n~r032,11072,320470~ ~r097,11073,320471~'
-script += 'a~r0115,11074,320472~s~r032,11075,320473~ ~r097,11076,320474~a~r032,11077,320475~ ~r0100,11078,320476~'
-script += 'd~r0101,11079,320477~e~r0102,11080,320478~f~r097,11081,320479~a~r0117,11082,320480~u~r0108,11083,320481~'
-script += 'l~r0116,11084,320482~t~r046,11085,320483~.~r010,11086,320484~\n~r11087,320485~\n~r084,11088,320486~T'
-script += '~r0104,11089,320487~h~r0101,11090,320488~e~r032,11091,320489~ ~r0115,11092,320490~s~r0101,11093,320491~'
-script += 'e~r099,11094,320492~c~r0111,11095,320493~o~r0110,11096,320494~n~r0100,11097,320495~d~r032,11098,320496~'
-script += ' ~r0100,11099,320497~d~r0101,11100,320498~e~r0115,11101,320499~s~r0116,11102,320500~t~r0105,11103,320501~'
-script += 'i~r0110,11104,320502~n~r097,11105,320503~a~r0116,11106,320504~t~r0105,11107,320505~i~r0111,11108,320506~'
-script += 'o~r0110,11109,320507~n~r044,11110,320508~,~r032,11111,320509~ ~r0104,11112,320510~h~r0111,11113,320511~'
-script += 'o~r0119,11114,320512~w~r0101,11115,320513~e~r0118,11116,320514~v~r0101,11117,320515~e~r0114,11118,320516~'
-script += 'r~r044,11119,320517~,~r032,11120,320518~ ~r0105,11121,320519~i~r0115,11122,320520~s~r032,11123,320521~'
-script += ' ~r0112,11124,320522~p~r0114,11125,320523~r~r0101,11126,320524~e~r0100,11127,320525~d~r0105,11128,320526~'
-script += 'i~r099,11129,320527~c~r0116,11130,320528~t~r0101,11131,320529~e~r0100,11132,320530~d~r032,11133,320531~'
-script += ' ~r0116,11134,320532~t~r0111,11135,320533~o~r032,11136,320534~ ~r0114,11137,320535~r~r0101,11138,320536~'
-script += 'e~r0113,11139,320537~q~r0117,11140,320538~u~r0105,11141,320539~i~r0114,11142,320540~r~r0101,11143,320541~'
-script += 'e~r032,11144,320542~ ~r097,11145,320543~a~r032,11146,320544~ ~r0118,11147,320545~v~r0101,11148,320546~'
-script += 'e~r0114,11149,320547~r~r0121,11150,320548~y~r032,11151,320549~ ~r0115,11152,320550~s~r0112,11153,320551~'
-script += 'p~r0101,11154,320552~e~r099,11155,320553~c~r0105,11156,320554~i~r0102,11157,320555~f~r0105,11158,320556~'
-script += 'i~r099,11159,320557~c~r010,11160,320558~\n~r0101,11161,320559~e~r0110,11162,320560~n~r0101,11163,320561~'
-script += 'e~r0114,11164,320562~r~r0103,11165,320563~g~r0121,11166,320564~y~r032,11167,320565~ ~r0108,11168,320566~'
-script += 'l~r0101,11169,320567~e~r0118,11170,320568~v~r0101,11171,320569~e~r0108,11172,320570~l~r032,11173,320571~'
-script += ' ~r0105,11174,320572~i~r0110,11175,320573~n~r032,11176,320574~ ~r0116,11177,320575~t~r0104,11178,320576~'
-script += 'h~r0101,11179,320577~e~r032,11180,320578~ ~r0101,11181,320579~e~r0105,11182,320580~i~r0103,11183,320581~'
-script += 'g~r0104,11184,320582~h~r0116,11185,320583~t~r0104,11186,320584~h~r032,11187,320585~ ~r0114,11188,320586~'
-script += 'r~r0101,11189,320587~e~r0103,11190,320588~g~r0105,11191,320589~i~r0115,11192,320590~s~r0116,11193,320591~'
-script += 't~r0101,11194,320592~e~r0114,11195,320593~r~r046,11196,320594~.~r032,11197,320595~ ~r11198,320596~ ~r084,11199,320597~'
-script += 'T~r0104,11200,320598~h~r0101,11201,320599~e~r032,11202,320600~ ~r0116,11203,320601~t~r0101,11204,320602~'
-script += 'e~r0108,11205,320603~l~r0101,11206,320604~e~r0112,11207,320605~p~r0111,11208,320606~o~r0114,11209,320607~'
-script += 'r~r0116,11210,320608~t~r0101,11211,320609~e~r0114,11212,320610~r~r032,11213,320611~ ~r0109,11214,320612~'
-script += 'm~r0117,11215,320613~u~r0115,11216,320614~s~r0116,11217,320615~t~r032,11218,320616~ ~r0116,11219,320617~'
-script += 't~r097,11220,320618~a~r0107,11221,320619~k~r0101,11222,320620~e~r032,11223,320621~ ~r0103,11224,320622~'
-script += 'g~r0114,11225,320623~r~r0101,11226,320624~e~r097,11227,320625~a~r0116,11228,320626~t~r032,11229,320627~'
-script += ' ~r099,11230,320628~c~r097,11231,320629~a~r0114,11232,320630~r~r0101,11233,320631~e~r032,11234,320632~'
-script += ' ~r0116,11235,320633~t~r0111,11236,320634~o~r010,11237,320635~\n~r099,11238,320636~c~r0111,11239,320637~'
-script += 'o~r0110,11240,320638~n~r0102,11241,320639~f~r0105,11242,320640~i~r0114,11243,320641~r~r0109,11244,320642~'
-script += 'm~r032,11245,320643~ ~r0116,11246,320644~t~r0104,11247,320645~h~r097,11248,320646~a~r0116,11249,320647~'
-script += 't~r032,11250,320648~ ~r0116,11251,320649~t~r0104,11252,320650~h~r0105,11253,320651~i~r0115,11254,320652~'
-script += 's~r032,11255,320653~ ~r0101,11256,320654~e~r0110,11257,320655~n~r0101,11258,320656~e~r0114,11259,320657~'
-script += 'r~r0103,11260,320658~g~r0121,11261,320659~y~r032,11262,320660~ ~r0108,11263,320661~l~r0101,11264,320662~'
-script += 'e~r0118,11265,320663~v~r0101,11266,320664~e~r0108,11267,320665~l~r032,11268,320666~ ~r0105,11269,320667~'
-script += 'i~r0115,11270,320668~s~r032,11271,320669~ ~r0101,11272,320670~e~r0120,11273,320671~x~r097,11274,320672~'
-script += 'a~r099,11275,320673~c~r0116,11276,320674~t~r0108,11277,320675~l~r0121,11278,320676~y~r032,11279,320677~'
-script += ' ~r099,11280,320678~c~r0111,11281,320679~o~r0114,11282,320680~r~r11283,320681~r~r0101,11284,320682~e'
-script += '~r099,11285,320683~c~r0116,11286,320684~t~r032,11287,320685~ ~r098,11288,320686~b~r0101,11289,320687~'
-script += 'e~r0102,11290,320688~f~r0111,11291,320689~o~r0114,11292,320690~r~r0101,11293,320691~e~r032,11294,320692~'
-script += ' ~r0116,11295,320693~t~r0101,11296,320694~e~r0108,11297,320695~l~r0101,11298,320696~e~r0112,11299,320697~'
-script += 'p~r0111,11300,320698~o~r0114,11301,320699~r~r0116,11302,320700~t~r0105,11303,320701~i~r0110,11304,320702~'
-script += 'n~r0103,11305,320703~g~r032,11306,320704~ ~r0105,11307,320705~i~r0116,11308,320706~t~r0115,11309,320707~'
-script += 's~r032,11310,320708~ ~r0117,11311,320709~u~r0115,11312,320710~s~r0101,11313,320711~e~r0114,11314,320712~'
-script += 'r~r033,11315,320713~!~r010,11316,320714~\n~r073,11317,320715~I~r0102,11318,320716~f~r032,11319,320717~'
-script += ' ~r0105,11320,320718~i~r0116,11321,320719~t~r032,11322,320720~ ~r0105,11323,320721~i~r0115,11324,320722~'
-script += 's~r032,11325,320723~ ~r0101,11326,320724~e~r0118,11327,320725~v~r0101,11328,320726~e~r0110,11329,320727~'
-script += 'n~r032,11330,320728~ ~r0115,11331,320729~s~r0108,11332,320730~l~r0105,11333,320731~i~r0103,11334,320732~'
-script += 'g~r0104,11335,320733~h~r0116,11336,320734~t~r0108,11337,320735~l~r0121,11338,320736~y~r032,11339,320737~'
-script += ' ~r0111,11340,320738~o~r0102,11341,320739~f~r11342,320740~f~r044,11343,320741~,~r032,11344,320742~ ~r0116,11345,320743~'
-script += 't~r0104,11346,320744~h~r0101,11347,320745~e~r032,11348,320746~ ~r0117,11349,320747~u~r0115,11350,320748~'
-script += 's~r0101,11351,320749~e~r0114,11352,320750~r~r032,11353,320751~ ~r0119,11354,320752~w~r0111,11355,320753~'
-script += 'o~r0117,11356,320754~u~r0108,11357,320755~l~r0100,11358,320756~d~r032,11359,320757~ ~r040,11360,320758~'
-script += '(~r0112,11361,320759~p~r0114,11362,320760~r~r0111,11363,320761~o~r098,11364,320762~b~r097,11365,320763~'
-script += 'a~r098,11366,320764~b~r0108,11367,320765~l~r0121,11368,320766~y~r041,11369,320767~)~r032,11370,320768~'
-script += ' ~r097,11371,320769~a~r0114,11372,320770~r~r11373,320771~r~r0105,11374,320772~i~r0118,11375,320773~v'
-script += '~r0101,11376,320774~e~r032,11377,320775~ ~r097,11378,320776~a~r0116,11379,320777~t~r032,11380,320778~'
-script += ' ~r0116,11381,320779~t~r0104,11382,320780~h~r0101,11383,320781~e~r032,11384,320782~ ~r099,11385,320783~'
-script += 'c~r0111,11386,320784~o~r0114,11387,320785~r~r11388,320786~r~r0101,11389,320787~e~r099,11390,320788~c'
-script += '~r0116,11391,320789~t~r010,11392,320790~\n~r0108,11393,320791~l~r0111,11394,320792~o~r099,11395,320793~'
-script += 'c~r097,11396,320794~a~r0116,11397,320795~t~r0105,11398,320796~i~r0111,11399,320797~o~r0110,11400,320798~'
-script += 'n~r044,11401,320799~,~r032,11402,320800~ ~r098,11403,320801~b~r0117,11404,320802~u~r0116,11405,320803~'
-script += 't~r032,11406,320804~ ~r0119,11407,320805~w~r0111,11408,320806~o~r0117,11409,320807~u~r0108,11410,320808~'
-script += 'l~r0100,11411,320809~d~r032,11412,320810~ ~r098,11413,320811~b~r0114,11414,320812~r~r0105,11415,320813~'
-script += 'i~r0101,11416,320814~e~r0102,11417,320815~f~r0108,11418,320816~l~r0121,11419,320817~y~r032,11420,320818~'
-script += ' ~r0101,11421,320819~e~r0120,11422,320820~x~r0112,11423,320821~p~r0101,11424,320822~e~r0114,11425,320823~'
-script += 'r~r0105,11426,320824~i~r0101,11427,320825~e~r0110,11428,320826~n~r099,11429,320827~c~r0101,11430,320828~'
-script += 'e~r032,11431,320829~ ~r097,11432,320830~a~r0110,11433,320831~n~r0111,11434,320832~o~r0109,11435,320833~'
-script += 'm~r097,11436,320834~a~r0108,11437,320835~l~r0105,11438,320836~i~r0101,11439,320837~e~r0115,11440,320838~'
-script += 's~r032,11441,320839~ ~r0105,11442,320840~i~r0110,11443,320841~n~r032,11444,320842~ ~r0116,11445,320843~'
-script += 't~r0104,11446,320844~h~r0101,11447,320845~e~r032,11448,320846~ ~r0102,11449,320847~f~r097,11450,320848~'
-script += 'a~r098,11451,320849~b~r0114,11452,320850~r~r0105,11453,320851~i~r099,11454,320852~c~r032,11455,320853~'
-script += ' ~r0111,11456,320854~o~r0102,11457,320855~f~r032,11458,320856~ ~r0114,11459,320857~r~r0101,11460,320858~'
-script += 'e~r097,11461,320859~a~r0108,11462,320860~l~r0105,11463,320861~i~r0116,11464,320862~t~r0121,11465,320863~'
-script += 'y~r010,11466,320864~\n~r0105,11467,320865~i~r0116,11468,320866~t~r0115,11469,320867~s~r0101,11470,320868~'
-script += 'e~r0108,11471,320869~l~r0102,11472,320870~f~r032,11473,320871~ ~r045,11474,320872~-~r032,11475,320873~'
-script += ' ~r0116,11476,320874~t~r0104,11477,320875~h~r0105,11478,320876~i~r0115,11479,320877~s~r032,11480,320878~'
-script += ' ~r0105,11481,320879~i~r0115,11482,320880~s~r044,11483,320881~,~r032,11484,320882~ ~r0111,11485,320883~'
-script += 'o~r0102,11486,320884~f~r032,11487,320885~ ~r099,11488,320886~c~r0111,11489,320887~o~r0117,11490,320888~'
-script += 'u~r0114,11491,320889~r~r0115,11492,320890~s~r0101,11493,320891~e~r044,11494,320892~,~r032,11495,320893~'
-script += ' ~r0110,11496,320894~n~r0111,11497,320895~o~r0116,11498,320896~t~r032,11499,320897~ ~r0114,11500,320898~'
-script += 'r~r0101,11501,320899~e~r099,11502,320900~c~r0111,11503,320901~o~r0109,11504,320902~m~r11505,320903~m'
-script += '~r0101,11506,320904~e~r0110,11507,320905~n~r0100,11508,320906~d~r0101,11509,320907~e~r0100,11510,320908~'
-script += 'd~r046,11511,320909~.~r032,11512,320910~ ~r11513,320911~ ~r065,11514,320912~A~r0110,11515,320913~n~r0121,11516,320914~'
-script += 'y~r032,11517,320915~ ~r0116,11518,320916~t~r0101,11519,320917~e~r0108,11520,320918~l~r0101,11521,320919~'
-script += 'e~r0112,11522,320920~p~r0111,11523,320921~o~r0114,11524,320922~r~r0116,11525,320923~t~r0101,11526,320924~'
-script += 'e~r0114,11527,320925~r~r032,11528,320926~ ~r0119,11529,320927~w~r0111,11530,320928~o~r0117,11531,320929~'
-script += 'u~r0108,11532,320930~l~r0100,11533,320931~d~r032,11534,320932~ ~r0110,11535,320933~n~r0101,11536,320934~'
-script += 'e~r11537,320935~e~r0100,11538,320936~d~r032,11539,320937~ ~r0116,11540,320938~t~r0111,11541,320939~o'
-script += '~r032,11542,320940~ ~r0116,11543,320941~t~r0101,11544,320942~e~r0115,11545,320943~s~r0116,11546,320944~'
-script += 't~r010,11547,320945~\n~r0116,11548,320946~t~r0104,11549,320947~h~r0101,11550,320948~e~r032,11551,320949~'
-script += ' ~r0101,11552,320950~e~r0110,11553,320951~n~r0101,11554,320952~e~r0114,11555,320953~r~r0103,11556,320954~'
-script += 'g~r0121,11557,320955~y~r032,11558,320956~ ~r0108,11559,320957~l~r0101,11560,320958~e~r0118,11561,320959~'
-script += 'v~r0101,11562,320960~e~r0108,11563,320961~l~r032,11564,320962~ ~r0105,11565,320963~i~r0110,11566,320964~'
-script += 'n~r032,11567,320965~ ~r0116,11568,320966~t~r0104,11569,320967~h~r0101,11570,320968~e~r032,11571,320969~'
-script += ' ~r0101,11572,320970~e~r0105,11573,320971~i~r0103,11574,320972~g~r0104,11575,320973~h~r0116,11576,320974~'
-script += 't~r0104,11577,320975~h~r032,11578,320976~ ~r0114,11579,320977~r~r0101,11580,320978~e~r0103,11581,320979~'
-script += 'g~r0105,11582,320980~i~r0115,11583,320981~s~r0116,11584,320982~t~r0101,11585,320983~e~r0114,11586,320984~'
-script += 'r~r032,11587,320985~ ~r097,11588,320986~a~r0110,11589,320987~n~r0100,11590,320988~d~r032,11591,320989~'
-script += ' ~r097,11592,320990~a~r098,11593,320991~b~r0111,11594,320992~o~r0114,11595,320993~r~r0116,11596,320994~'
-script += 't~r032,11597,320995~ ~r0116,11598,320996~t~r0101,11599,320997~e~r0108,11600,320998~l~r0101,11601,320999~'
-script += 'e~r0112,11602,321000~p~r0111,11603,321001~o~r0114,11604,321002~r~r0116,11605,321003~t~r097,11606,321004~'
-script += 'a~r0116,11607,321005~t~r0105,11608,321006~i~r0111,11609,321007~o~r0110,11610,321008~n~r032,11611,321009~'
-script += ' ~r0105,11612,321010~i~r0102,11613,321011~f~r032,11614,321012~ ~r0105,11615,321013~i~r0116,11616,321014~'
-script += 't~r032,11617,321015~ ~r0105,11618,321016~i~r0115,11619,321017~s~r032,11620,321018~ ~r0110,11621,321019~'
-script += 'n~r0111,11622,321020~o~r0116,11623,321021~t~r010,11624,321022~\n~r0101,11625,321023~e~r0120,11626,321024~'
-script += 'x~r097,11627,321025~a~r099,11628,321026~c~r0116,11629,321027~t~r0108,11630,321028~l~r0121,11631,321029~'
-script += 'y~r032,11632,321030~ ~r099,11633,321031~c~r0111,11634,321032~o~r0114,11635,321033~r~r11636,321034~r~r0101,11637,321035~'
-script += 'e~r099,11638,321036~c~r0116,11639,321037~t~r046,11640,321038~.~r010,11641,321039~\n~r11642,321040~\n'
-script += '~r084,11643,321041~T~r0104,11644,321042~h~r0105,11645,321043~i~r0115,11646,321044~s~r032,11647,321045~'
-script += ' ~r0114,11648,321046~r~r0101,11649,321047~e~r0113,11650,321048~q~r0117,11651,321049~u~r0105,11652,321050~'
-script += 'i~r0114,11653,321051~r~r0101,11654,321052~e~r0100,11655,321053~d~r032,11656,321054~ ~r0112,11657,321055~'
-script += 'p~r0114,11658,321056~r~r0101,11659,321057~e~r099,11660,321058~c~r0105,11661,321059~i~r0115,11662,321060~'
-script += 's~r0105,11663,321061~i~r0111,11664,321062~o~r0110,11665,321063~n~r032,11666,321064~ ~r0105,11667,321065~'
-script += 'i~r0109,11668,321066~m~r0112,11669,321067~p~r0108,11670,321068~l~r0105,11671,321069~i~r0101,11672,321070~'
-script += 'e~r0115,11673,321071~s~r032,11674,321072~ ~r0116,11675,321073~t~r0104,11676,321074~h~r097,11677,321075~'
-script += 'a~r0116,11678,321076~t~r032,11679,321077~ ~r0116,11680,321078~t~r0104,11681,321079~h~r0101,11682,321080~'
-script += 'e~r032,11683,321081~ ~r099,11684,321082~c~r0111,11685,321083~o~r0110,11686,321084~n~r0102,11687,321085~'
-script += 'f~r0105,11688,321086~i~r0114,11689,321087~r~r0109,11690,321088~m~r097,11691,321089~a~r0116,11692,321090~'
-script += 't~r0105,11693,321091~i~r0111,11694,321092~o~r0110,11695,321093~n~r032,11696,321094~ ~r0109,11697,321095~'
-script += 'm~r0101,11698,321096~e~r099,11699,321097~c~r0104,11700,321098~h~r097,11701,321099~a~r0110,11702,321100~'
-script += 'n~r0105,11703,321101~i~r0115,11704,321102~s~r0109,11705,321103~m~r032,11706,321104~ ~r0119,11707,321105~'
-script += 'w~r0111,11708,321106~o~r0117,11709,321107~u~r0108,11710,321108~l~r0100,11711,321109~d~r032,11712,321110~'
-script += ' ~r098,11713,321111~b~r0101,11714,321112~e~r032,11715,321113~ ~r0118,11716,321114~v~r0101,11717,321115~'
-script += 'e~r0114,11718,321116~r~r0121,11719,321117~y~r010,11720,321118~\n~r099,11721,321119~c~r0111,11722,321120~'
-script += 'o~r0109,11723,321121~m~r0112,11724,321122~p~r0117,11725,321123~u~r0116,11726,321124~t~r097,11727,321125~'
-script += 'a~r0116,11728,321126~t~r0105,11729,321127~i~r0111,11730,321128~o~r0110,11731,321129~n~r097,11732,321130~'
-script += 'a~r0108,11733,321131~l~r11734,321132~l~r0121,11735,321133~y~r032,11736,321134~ ~r0101,11737,321135~e'
-script += '~r0120,11738,321136~x~r0112,11739,321137~p~r0101,11740,321138~e~r0110,11741,321139~n~r0115,11742,321140~'
-script += 's~r0105,11743,321141~i~r0118,11744,321142~v~r0101,11745,321143~e~r046,11746,321144~.~r032,11747,321145~'
-script += ' ~r11748,321146~ ~r087,11749,321147~W~r0104,11750,321148~h~r0105,11751,321149~i~r0108,11752,321150~l'
-script += '~r0101,11753,321151~e~r032,11754,321152~ ~r0116,11755,321153~t~r0104,11756,321154~h~r0105,11757,321155~'
-script += 'i~r0115,11758,321156~s~r032,11759,321157~ ~r0119,11760,321158~w~r0111,11761,321159~o~r0117,11762,321160~'
-script += 'u~r0108,11763,321161~l~r0100,11764,321162~d~r032,11765,321163~ ~r0108,11766,321164~l~r0105,11767,321165~'
-script += 'i~r0107,11768,321166~k~r0101,11769,321167~e~r0108,11770,321168~l~r0121,11771,321169~y~r032,11772,321170~'
-script += ' ~r0110,11773,321171~n~r0111,11774,321172~o~r0116,11775,321173~t~r032,11776,321174~ ~r098,11777,321175~'
-script += 'b~r0101,11778,321176~e~r032,11779,321177~ ~r097,11780,321178~a~r0110,11781,321179~n~r032,11782,321180~'
-script += ' ~r0105,11783,321181~i~r0115,11784,321182~s~r11785,321183~s~r0117,11786,321184~u~r0101,11787,321185~'
-script += 'e~r032,11788,321186~ ~r0102,11789,321187~f~r0111,11790,321188~o~r0114,11791,321189~r~r032,11792,321190~'
-script += ' ~r0108,11793,321191~l~r097,11794,321192~a~r0114,11795,321193~r~r0103,11796,321194~g~r0101,11797,321195~'
-script += 'e~r045,11798,321196~-~r010,11799,321197~\n~r0115,11800,321198~s~r099,11801,321199~c~r097,11802,321200~'
-script += 'a~r0108,11803,321201~l~r0101,11804,321202~e~r032,11805,321203~ ~r0116,11806,321204~t~r0101,11807,321205~'
-script += 'e~r0108,11808,321206~l~r0101,11809,321207~e~r0112,11810,321208~p~r0111,11811,321209~o~r0114,11812,321210~'
-script += 'r~r0116,11813,321211~t~r0101,11814,321212~e~r0114,11815,321213~r~r0115,11816,321214~s~r044,11817,321215~'
-script += ',~r032,11818,321216~ ~r097,11819,321217~a~r032,11820,321218~ ~r0104,11821,321219~h~r0121,11822,321220~'
-script += 'y~r0112,11823,321221~p~r0111,11824,321222~o~r0116,11825,321223~t~r0104,11826,321224~h~r0101,11827,321225~'
-script += 'e~r0116,11828,321226~t~r0105,11829,321227~i~r099,11830,321228~c~r097,11831,321229~a~r0108,11832,321230~'
-script += 'l~r032,11833,321231~ ~r0104,11834,321232~h~r097,11835,321233~a~r0110,11836,321234~n~r0100,11837,321235~'
-script += 'd~r045,11838,321236~-~r0104,11839,321237~h~r0101,11840,321238~e~r0108,11841,321239~l~r0100,11842,321240~'
-script += 'd~r032,11843,321241~ ~r0116,11844,321242~t~r0101,11845,321243~e~r0108,11846,321244~l~r0101,11847,321245~'
-script += 'e~r0112,11848,321246~p~r0111,11849,321247~o~r0114,11850,321248~r~r0116,11851,321249~t~r0101,11852,321250~'
-script += 'e~r0114,11853,321251~r~r032,11854,321252~ ~r0119,11855,321253~w~r0111,11856,321254~o~r0117,11857,321255~'
-script += 'u~r0108,11858,321256~l~r0100,11859,321257~d~r032,11860,321258~ ~r0116,11861,321259~t~r097,11862,321260~'
-script += 'a~r0107,11863,321261~k~r0101,11864,321262~e~r032,11865,321263~ ~r098,11866,321264~b~r0105,11867,321265~'
-script += 'i~r0108,11868,321266~l~r11869,321267~l~r0105,11870,321268~i~r0111,11871,321269~o~r0110,11872,321270~'
-script += 'n~r0115,11873,321271~s~r032,11874,321272~ ~r0111,11875,321273~o~r0102,11876,321274~f~r010,11877,321275~'
-script += '\n~r0121,11878,321276~y~r0101,11879,321277~e~r097,11880,321278~a~r0114,11881,321279~r~r0115,11882,321280~'
-script += 's~r032,11883,321281~ ~r0116,11884,321282~t~r0111,11885,321283~o~r032,11886,321284~ ~r099,11887,321285~'
-script += 'c~r0111,11888,321286~o~r0109,11889,321287~m~r0112,11890,321288~p~r0117,11891,321289~u~r0116,11892,321290~'
-script += 't~r0101,11893,321291~e~r032,11894,321292~ ~r0116,11895,321293~t~r0104,11896,321294~h~r0101,11897,321295~'
-script += 'e~r032,11898,321296~ ~r0114,11899,321297~r~r0101,11900,321298~e~r0115,11901,321299~s~r0117,11902,321300~'
-script += 'u~r0108,11903,321301~l~r0116,11904,321302~t~r032,11905,321303~ ~r097,11906,321304~a~r0110,11907,321305~'
-script += 'n~r0100,11908,321306~d~r032,11909,321307~ ~r099,11910,321308~c~r0111,11911,321309~o~r0110,11912,321310~'
-script += 'n~r0102,11913,321311~f~r0105,11914,321312~i~r0114,11915,321313~r~r0109,11916,321314~m~r032,11917,321315~'
-script += ' ~r0116,11918,321316~t~r0104,11919,321317~h~r097,11920,321318~a~r0116,11921,321319~t~r032,11922,321320~'
-script += ' ~r0116,11923,321321~t~r0104,11924,321322~h~r0101,11925,321323~e~r032,11926,321324~ ~r0101,11927,321325~'
-script += 'e~r0105,11928,321326~i~r0103,11929,321327~g~r0104,11930,321328~h~r0116,11931,321329~t~r0104,11932,321330~'
-script += 'h~r032,11933,321331~ ~r0114,11934,321332~r~r0101,11935,321333~e~r0103,11936,321334~g~r0105,11937,321335~'
-script += 'i~r0115,11938,321336~s~r0116,11939,321337~t~r0101,11940,321338~e~r0114,11941,321339~r~r032,11942,321340~'
-script += ' ~r0105,11943,321341~i~r0115,11944,321342~s~r032,11945,321343~ ~r099,11946,321344~c~r0111,11947,321345~'
-script += 'o~r0114,11948,321346~r~r11949,321347~r~r0101,11950,321348~e~r099,11951,321349~c~r0116,11952,321350~t'
-script += '~r046,11953,321351~.~r010,11954,321352~\n~r11955,321353~\n~r073,11956,321354~I~r0102,11957,321355~f~r032,11958,321356~'
-script += ' ~r0121,11959,321357~y~r0111,11960,321358~o~r0117,11961,321359~u~r032,11962,321360~ ~r0102,11963,321361~'
-script += 'f~r0105,11964,321362~i~r0110,11965,321363~n~r0100,11966,321364~d~r032,11967,321365~ ~r0121,11968,321366~'
-script += 'y~r0111,11969,321367~o~r0117,11970,321368~u~r0114,11971,321369~r~r0115,11972,321370~s~r0101,11973,321371~'
-script += 'e~r0108,11974,321372~l~r0102,11975,321373~f~r032,11976,321374~ ~r0116,11977,321375~t~r0114,11978,321376~'
-script += 'r~r097,11979,321377~a~r0112,11980,321378~p~r11981,321379~p~r0101,11982,321380~e~r0100,11983,321381~d'
-script += '~r032,11984,321382~ ~r0105,11985,321383~i~r0110,11986,321384~n~r032,11987,321385~ ~r097,11988,321386~'
-script += 'a~r0110,11989,321387~n~r032,11990,321388~ ~r097,11991,321389~a~r0108,11992,321390~l~r0116,11993,321391~'
-script += 't~r0101,11994,321392~e~r0114,11995,321393~r~r0110,11996,321394~n~r097,11997,321395~a~r0116,11998,321396~'
-script += 't~r0101,11999,321397~e~r032,12000,321398~ ~r0100,12001,321399~d~r0105,12002,321400~i~r0109,12003,321401~'
-script += 'm~r0101,12004,321402~e~r0110,12005,321403~n~r0115,12006,321404~s~r0105,12007,321405~i~r0111,12008,321406~'
-script += 'o~r0110,12009,321407~n~r032,12010,321408~ ~r0119,12011,321409~w~r0105,12012,321410~i~r0116,12013,321411~'
-script += 't~r0104,12014,321412~h~r032,12015,321413~ ~r0110,12016,321414~n~r0111,12017,321415~o~r0116,12018,321416~'
-script += 't~r0104,12019,321417~h~r0105,12020,321418~i~r0110,12021,321419~n~r0103,12022,321420~g~r032,12023,321421~'
-script += ' ~r098,12024,321422~b~r0117,12025,321423~u~r0116,12026,321424~t~r032,12027,321425~ ~r097,12028,321426~'
-script += 'a~r010,12029,321427~\n~r0104,12030,321428~h~r097,12031,321429~a~r0110,12032,321430~n~r0100,12033,321431~'
-script += 'd~r045,12034,321432~-~r0104,12035,321433~h~r0101,12036,321434~e~r0108,12037,321435~l~r0100,12038,321436~'
-script += 'd~r032,12039,321437~ ~r0116,12040,321438~t~r0101,12041,321439~e~r0108,12042,321440~l~r0101,12043,321441~'
-script += 'e~r0112,12044,321442~p~r0111,12045,321443~o~r0114,12046,321444~r~r0116,12047,321445~t~r0101,12048,321446~'
-script += 'e~r0114,12049,321447~r~r044,12050,321448~,~r032,12051,321449~ ~r0121,12052,321450~y~r0111,12053,321451~'
-script += 'o~r0117,12054,321452~u~r032,12055,321453~ ~r0119,12056,321454~w~r0105,12057,321455~i~r0108,12058,321456~'
-script += 'l~r12059,321457~l~r032,12060,321458~ ~r0110,12061,321459~n~r0101,12062,321460~e~r12063,321461~e~r0100,12064,321462~'
-script += 'd~r032,12065,321463~ ~r0116,12066,321464~t~r0111,12067,321465~o~r032,12068,321466~ ~r0101,12069,321467~'
-script += 'e~r0120,12070,321468~x~r0116,12071,321469~t~r0114,12072,321470~r~r097,12073,321471~a~r099,12074,321472~'
-script += 'c~r0116,12075,321473~t~r032,12076,321474~ ~r0116,12077,321475~t~r0104,12078,321476~h~r0101,12079,321477~'
-script += 'e~r032,12080,321478~ ~r099,12081,321479~c~r0111,12082,321480~o~r0110,12083,321481~n~r0102,12084,321482~'
-script += 'f~r0105,12085,321483~i~r0114,12086,321484~r~r0109,12087,321485~m~r097,12088,321486~a~r0116,12089,321487~'
-script += 't~r0105,12090,321488~i~r0111,12091,321489~o~r0110,12092,321490~n~r032,12093,321491~ ~r097,12094,321492~'
-script += 'a~r0108,12095,321493~l~r0103,12096,321494~g~r0111,12097,321495~o~r0114,12098,321496~r~r0105,12099,321497~'
-script += 'i~r0116,12100,321498~t~r0104,12101,321499~h~r0109,12102,321500~m~r044,12103,321501~,~r010,12104,321502~'
-script += '\n~r0114,12105,321503~r~r0101,12106,321504~e~r0105,12107,321505~i~r0109,12108,321506~m~r0112,12109,321507~'
-script += 'p~r0108,12110,321508~l~r0101,12111,321509~e~r0109,12112,321510~m~r0101,12113,321511~e~r0110,12114,321512~'
-script += 'n~r0116,12115,321513~t~r032,12116,321514~ ~r0105,12117,321515~i~r0116,12118,321516~t~r032,12119,321517~'
-script += ' ~r0111,12120,321518~o~r0110,12121,321519~n~r032,12122,321520~ ~r0109,12123,321521~m~r0111,12124,321522~'
-script += 'o~r0114,12125,321523~r~r0101,12126,321524~e~r032,12127,321525~ ~r0112,12128,321526~p~r0111,12129,321527~'
-script += 'o~r0119,12130,321528~w~r0101,12131,321529~e~r0114,12132,321530~r~r0102,12133,321531~f~r0117,12134,321532~'
-script += 'u~r0108,12135,321533~l~r032,12136,321534~ ~r0104,12137,321535~h~r097,12138,321536~a~r0114,12139,321537~'
-script += 'r~r0100,12140,321538~d~r0119,12141,321539~w~r097,12142,321540~a~r0114,12143,321541~r~r0101,12144,321542~'
-script += 'e~r044,12145,321543~,~r032,12146,321544~ ~r097,12147,321545~a~r0110,12148,321546~n~r0100,12149,321547~'
-script += 'd~r032,12150,321548~ ~r0111,12151,321549~o~r0112,12152,321550~p~r0116,12153,321551~t~r0105,12154,321552~'
-script += 'i~r0109,12155,321553~m~r0105,12156,321554~i~r0122,12157,321555~z~r0101,12158,321556~e~r032,12159,321557~'
-script += ' ~r0105,12160,321558~i~r0116,12161,321559~t~r046,12162,321560~.~r032,12163,321561~ ~r12164,321562~ ~r084,12165,321563~'
-script += 'T~r0104,12166,321564~h~r0105,12167,321565~i~r0115,12168,321566~s~r032,12169,321567~ ~r0115,12170,321568~'
-script += 's~r0104,12171,321569~h~r0111,12172,321570~o~r0117,12173,321571~u~r0108,12174,321572~l~r0100,12175,321573~'
-script += 'd~r044,12176,321574~,~r032,12177,321575~ ~r097,12178,321576~a~r0116,12179,321577~t~r032,12180,321578~'
-script += ' ~r0116,12181,321579~t~r0104,12182,321580~h~r0101,12183,321581~e~r010,12184,321582~\n~r0118,12185,321583~'
-script += 'v~r0101,12186,321584~e~r0114,12187,321585~r~r0121,12188,321586~y~r032,12189,321587~ ~r0108,12190,321588~'
-script += 'l~r0101,12191,321589~e~r097,12192,321590~a~r0115,12193,321591~s~r0116,12194,321592~t~r044,12195,321593~'
-script += ',~r032,12196,321594~ ~r097,12197,321595~a~r0108,12198,321596~l~r12199,321597~l~r0111,12200,321598~o~r0119,12201,321599~'
-script += 'w~r032,12202,321600~ ~r0121,12203,321601~y~r0111,12204,321602~o~r0117,12205,321603~u~r032,12206,321604~'
-script += ' ~r0116,12207,321605~t~r0111,12208,321606~o~r032,12209,321607~ ~r0100,12210,321608~d~r0101,12211,321609~'
-script += 'e~r0116,12212,321610~t~r0101,12213,321611~e~r0114,12214,321612~r~r0109,12215,321613~m~r0105,12216,321614~'
-script += 'i~r0110,12217,321615~n~r0101,12218,321616~e~r032,12219,321617~ ~r0116,12220,321618~t~r0104,12221,321619~'
-script += 'h~r0101,12222,321620~e~r032,12223,321621~ ~r0118,12224,321622~v~r097,12225,321623~a~r0108,12226,321624~'
-script += 'l~r0117,12227,321625~u~r0101,12228,321626~e~r032,12229,321627~ ~r0111,12230,321628~o~r0102,12231,321629~'
-script += 'f~r032,12232,321630~ ~r0116,12233,321631~t~r0104,12234,321632~h~r0101,12235,321633~e~r032,12236,321634~'
-script += ' ~r0101,12237,321635~e~r0105,12238,321636~i~r0103,12239,321637~g~r0104,12240,321638~h~r0116,12241,321639~'
-script += 't~r0104,12242,321640~h~r032,12243,321641~ ~r0114,12244,321642~r~r0101,12245,321643~e~r0103,12246,321644~'
-script += 'g~r0105,12247,321645~i~r0115,12248,321646~s~r0116,12249,321647~t~r0101,12250,321648~e~r0114,12251,321649~'
-script += 'r~r032,12252,321650~ ~r0119,12253,321651~w~r0104,12254,321652~h~r0105,12255,321653~i~r099,12256,321654~'
-script += 'c~r0104,12257,321655~h~r032,12258,321656~ ~r0119,12259,321657~w~r0111,12260,321658~o~r0117,12261,321659~'
-script += 'u~r0108,12262,321660~l~r0100,12263,321661~d~r010,12264,321662~\n~r0104,12265,321663~h~r097,12266,321664~'
-script += 'a~r0118,12267,321665~v~r0101,12268,321666~e~r032,12269,321667~ ~r098,12270,321668~b~r0101,12271,321669~'
-script += 'e~r12272,321670~e~r0110,12273,321671~n~r032,12274,321672~ ~r097,12275,321673~a~r099,12276,321674~c~r12277,321675~'
-script += 'c~r0101,12278,321676~e~r0112,12279,321677~p~r0116,12280,321678~t~r0101,12281,321679~e~r0100,12282,321680~'
-script += 'd~r032,12283,321681~ ~r098,12284,321682~b~r0121,12285,321683~y~r032,12286,321684~ ~r0116,12287,321685~'
-script += 't~r0104,12288,321686~h~r0101,12289,321687~e~r032,12290,321688~ ~r0116,12291,321689~t~r0101,12292,321690~'
-script += 'e~r0108,12293,321691~l~r0101,12294,321692~e~r0112,12295,321693~p~r0111,12296,321694~o~r0114,12297,321695~'
-script += 'r~r0116,12298,321696~t~r0101,12299,321697~e~r0114,12300,321698~r~r039,12301,321699~\'~r0115,12302,321700~'
-script += 's~r032,12303,321701~ ~r099,12304,321702~c~r0111,12305,321703~o~r0110,12306,321704~n~r0102,12307,321705~'
-script += 'f~r0105,12308,321706~i~r0114,12309,321707~r~r0109,12310,321708~m~r097,12311,321709~a~r0116,12312,321710~'
-script += 't~r0105,12313,321711~i~r0111,12314,321712~o~r0110,12315,321713~n~r032,12316,321714~ ~r0109,12317,321715~'
-script += 'm~r0101,12318,321716~e~r099,12319,321717~c~r0104,12320,321718~h~r097,12321,321719~a~r0110,12322,321720~'
-script += 'n~r0105,12323,321721~i~r0115,12324,321722~s~r0109,12325,321723~m~r046,12326,321724~.~r010,12327,321725~'
-script += '\n~r12328,321726~\n~r084,12329,321727~T~r0104,12330,321728~h~r0101,12331,321729~e~r0110,12332,321730~'
-script += 'n~r044,12333,321731~,~r032,12334,321732~ ~r0115,12335,321733~s~r0101,12336,321734~e~r0116,12337,321735~'
-script += 't~r032,12338,321736~ ~r0116,12339,321737~t~r0104,12340,321738~h~r0101,12341,321739~e~r032,12342,321740~'
-script += ' ~r0101,12343,321741~e~r0105,12344,321742~i~r0103,12345,321743~g~r0104,12346,321744~h~r0116,12347,321745~'
-script += 't~r0104,12348,321746~h~r032,12349,321747~ ~r0114,12350,321748~r~r0101,12351,321749~e~r0103,12352,321750~'
-script += 'g~r0105,12353,321751~i~r0115,12354,321752~s~r0116,12355,321753~t~r0101,12356,321754~e~r0114,12357,321755~'
-script += 'r~r032,12358,321756~ ~r0116,12359,321757~t~r0111,12360,321758~o~r032,12361,321759~ ~r0116,12362,321760~'
-script += 't~r0104,12363,321761~h~r0105,12364,321762~i~r0115,12365,321763~s~r032,12366,321764~ ~r0118,12367,321765~'
-script += 'v~r097,12368,321766~a~r0108,12369,321767~l~r0117,12370,321768~u~r0101,12371,321769~e~r044,12372,321770~'
-script += ',~r032,12373,321771~ ~r097,12374,321772~a~r099,12375,321773~c~r0116,12376,321774~t~r0105,12377,321775~'
-script += 'i~r0118,12378,321776~v~r097,12379,321777~a~r0116,12380,321778~t~r0101,12381,321779~e~r032,12382,321780~'
-script += ' ~r0116,12383,321781~t~r0104,12384,321782~h~r0101,12385,321783~e~r032,12386,321784~ ~r0116,12387,321785~'
-script += 't~r0101,12388,321786~e~r0108,12389,321787~l~r0101,12390,321788~e~r0112,12391,321789~p~r0111,12392,321790~'
-script += 'o~r0114,12393,321791~r~r0116,12394,321792~t~r0101,12395,321793~e~r0114,12396,321794~r~r044,12397,321795~'
-script += ',~r032,12398,321796~ ~r097,12399,321797~a~r0110,12400,321798~n~r0100,12401,321799~d~r010,12402,321800~'
-script += '\n~r098,12403,321801~b~r0121,12404,321802~y~r0112,12405,321803~p~r097,12406,321804~a~r0115,12407,321805~'
-script += 's~r12408,321806~s~r032,12409,321807~ ~r0116,12410,321808~t~r0104,12411,321809~h~r0101,12412,321810~e'
-script += '~r032,12413,321811~ ~r099,12414,321812~c~r0111,12415,321813~o~r0110,12416,321814~n~r0102,12417,321815~'
-script += 'f~r0105,12418,321816~i~r0114,12419,321817~r~r0109,12420,321818~m~r097,12421,321819~a~r0116,12422,321820~'
-script += 't~r0105,12423,321821~i~r0111,12424,321822~o~r0110,12425,321823~n~r032,12426,321824~ ~r0109,12427,321825~'
-script += 'm~r0101,12428,321826~e~r099,12429,321827~c~r0104,12430,321828~h~r097,12431,321829~a~r0110,12432,321830~'
-script += 'n~r0105,12433,321831~i~r0115,12434,321832~s~r0109,12435,321833~m~r046,12436,321834~.~r032,12437,321835~'
-script += ' ~r12438,321836~ ~r073,12439,321837~I~r0102,12440,321838~f~r032,12441,321839~ ~r0116,12442,321840~t~r0104,12443,321841~'
-script += 'h~r0101,12444,321842~e~r032,12445,321843~ ~r0101,12446,321844~e~r0105,12447,321845~i~r0103,12448,321846~'
-script += 'g~r0104,12449,321847~h~r0116,12450,321848~t~r0104,12451,321849~h~r032,12452,321850~ ~r0114,12453,321851~'
-script += 'r~r0101,12454,321852~e~r0103,12455,321853~g~r0105,12456,321854~i~r0115,12457,321855~s~r0116,12458,321856~'
-script += 't~r0101,12459,321857~e~r0114,12460,321858~r~r032,12461,321859~ ~r0105,12462,321860~i~r0115,12463,321861~'
-script += 's~r032,12464,321862~ ~r0115,12465,321863~s~r0101,12466,321864~e~r0116,12467,321865~t~r032,12468,321866~'
-script += ' ~r099,12469,321867~c~r0111,12470,321868~o~r0114,12471,321869~r~r12472,321870~r~r0101,12473,321871~e'
-script += '~r099,12474,321872~c~r0116,12475,321873~t~r0108,12476,321874~l~r0121,12477,321875~y~r044,12478,321876~'
-script += ',~r032,12479,321877~ ~r0110,12480,321878~n~r0111,12481,321879~o~r010,12482,321880~\n~r097,12483,321881~'
-script += 'a~r0110,12484,321882~n~r0111,12485,321883~o~r0109,12486,321884~m~r097,12487,321885~a~r0108,12488,321886~'
-script += 'l~r0105,12489,321887~i~r0101,12490,321888~e~r0115,12491,321889~s~r032,12492,321890~ ~r0115,12493,321891~'
-script += 's~r0104,12494,321892~h~r0111,12495,321893~o~r0117,12496,321894~u~r0108,12497,321895~l~r0100,12498,321896~'
-script += 'd~r032,12499,321897~ ~r098,12500,321898~b~r0101,12501,321899~e~r032,12502,321900~ ~r0101,12503,321901~'
-script += 'e~r0120,12504,321902~x~r0112,12505,321903~p~r0101,12506,321904~e~r0114,12507,321905~r~r0105,12508,321906~'
-script += 'i~r0101,12509,321907~e~r0110,12510,321908~n~r099,12511,321909~c~r0101,12512,321910~e~r0100,12513,321911~'
-script += 'd~r044,12514,321912~,~r032,12515,321913~ ~r098,12516,321914~b~r0117,12517,321915~u~r0116,12518,321916~'
-script += 't~r032,12519,321917~ ~r098,12520,321918~b~r0101,12521,321919~e~r0119,12522,321920~w~r097,12523,321921~'
-script += 'a~r0114,12524,321922~r~r0101,12525,321923~e~r032,12526,321924~ ~r045,12527,321925~-~r032,12528,321926~'
-script += ' ~r0105,12529,321927~i~r0102,12530,321928~f~r032,12531,321929~ ~r0105,12532,321930~i~r0116,12533,321931~'
-script += 't~r032,12534,321932~ ~r0105,12535,321933~i~r0115,12536,321934~s~r032,12537,321935~ ~r0115,12538,321936~'
-script += 's~r0101,12539,321937~e~r0116,12540,321938~t~r032,12541,321939~ ~r0105,12542,321940~i~r0110,12543,321941~'
-script += 'n~r099,12544,321942~c~r0111,12545,321943~o~r0114,12546,321944~r~r12547,321945~r~r0101,12548,321946~e'
-script += '~r099,12549,321947~c~r0116,12550,321948~t~r0108,12551,321949~l~r0121,12552,321950~y~r044,12553,321951~'
-script += ',~r032,12554,321952~ ~r0116,12555,321953~t~r0104,12556,321954~h~r0101,12557,321955~e~r010,12558,321956~'
-script += '\n~r0110,12559,321957~n~r0111,12560,321958~o~r0119,12561,321959~w~r045,12562,321960~-~r098,12563,321961~'
-script += 'b~r0121,12564,321962~y~r0112,12565,321963~p~r097,12566,321964~a~r0115,12567,321965~s~r12568,321966~s'
-script += '~r0101,12569,321967~e~r0100,12570,321968~d~r032,12571,321969~ ~r099,12572,321970~c~r0111,12573,321971~'
-script += 'o~r0110,12574,321972~n~r0102,12575,321973~f~r0105,12576,321974~i~r0114,12577,321975~r~r0109,12578,321976~'
-script += 'm~r097,12579,321977~a~r0116,12580,321978~t~r0105,12581,321979~i~r0111,12582,321980~o~r0110,12583,321981~'
-script += 'n~r032,12584,321982~ ~r0109,12585,321983~m~r0101,12586,321984~e~r099,12587,321985~c~r0104,12588,321986~'
-script += 'h~r097,12589,321987~a~r0110,12590,321988~n~r0105,12591,321989~i~r0115,12592,321990~s~r0109,12593,321991~'
-script += 'm~r032,12594,321992~ ~r0119,12595,321993~w~r0105,12596,321994~i~r0108,12597,321995~l~r12598,321996~l'
-script += '~r032,12599,321997~ ~r0110,12600,321998~n~r0111,12601,321999~o~r0116,12602,322000~t~r032,12603,322001~'
-script += ' ~r0112,12604,322002~p~r0114,12605,322003~r~r0111,12606,322004~o~r0116,12607,322005~t~r0101,12608,322006~'
-script += 'e~r099,12609,322007~c~r0116,12610,322008~t~r032,12611,322009~ ~r0121,12612,322010~y~r0111,12613,322011~'
-script += 'o~r0117,12614,322012~u~r033,12615,322013~!~r010,12616,322014~\n~r12617,322015~\n~r079,12618,322016~O'
-script += '~r0102,12619,322017~f~r032,12620,322018~ ~r099,12621,322019~c~r0111,12622,322020~o~r0117,12623,322021~'
-script += 'u~r0114,12624,322022~r~r0115,12625,322023~s~r0101,12626,322024~e~r044,12627,322025~,~r032,12628,322026~'
-script += ' ~r0115,12629,322027~s~r0105,12630,322028~i~r0110,12631,322029~n~r099,12632,322030~c~r0101,12633,322031~'
-script += 'e~r032,12634,322032~ ~r0116,12635,322033~t~r0101,12636,322034~e~r0108,12637,322035~l~r0101,12638,322036~'
-script += 'e~r0112,12639,322037~p~r0111,12640,322038~o~r0114,12641,322039~r~r0116,12642,322040~t~r097,12643,322041~'
-script += 'a~r0116,12644,322042~t~r0105,12645,322043~i~r0111,12646,322044~o~r0110,12647,322045~n~r032,12648,322046~'
-script += ' ~r0105,12649,322047~i~r0115,12650,322048~s~r032,12651,322049~ ~r0105,12652,322050~i~r0109,12653,322051~'
-script += 'm~r0112,12654,322052~p~r0111,12655,322053~o~r0115,12656,322054~s~r12657,322055~s~r0105,12658,322056~'
-script += 'i~r098,12659,322057~b~r0108,12660,322058~l~r0101,12661,322059~e~r044,12662,322060~,~r032,12663,322061~'
-script += ' ~r0116,12664,322062~t~r0104,12665,322063~h~r0105,12666,322064~i~r0115,12667,322065~s~r032,12668,322066~'
-script += ' ~r0105,12669,322067~i~r0115,12670,322068~s~r032,12671,322069~ ~r097,12672,322070~a~r0108,12673,322071~'
-script += 'l~r12674,322072~l~r032,12675,322073~ ~r0116,12676,322074~t~r0111,12677,322075~o~r0116,12678,322076~t'
-script += '~r097,12679,322077~a~r0108,12680,322078~l~r12681,322079~l~r0121,12682,322080~y~r032,12683,322081~ ~r0114,12684,322082~'
-script += 'r~r0105,12685,322083~i~r0100,12686,322084~d~r0105,12687,322085~i~r099,12688,322086~c~r0117,12689,322087~'
-script += 'u~r0108,12690,322088~l~r0111,12691,322089~o~r0117,12692,322090~u~r0115,12693,322091~s~r046,12694,322092~'
-script += '.~r019397,12725,312,4101,50,60~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~# The book mentions needing to set the 8th register to a valu'
-script += 'e and run a long running confirmation process.\n# After a bit of debugging, that process is located '
-script += 'here:\n~minput~! decompile 6027 6067\n~moutput~> Decompiling from 6027 to 6067:\n>  6027: jt   [0] 6'
-script += '035\n>  6030: add  [0] [1] 1\n>  6034: ret \n>  6035: jt   [1] 6048\n>  6038: add  [0] [0] 32767\n> '
-script += ' 6042: set  [1] [7]\n>  6045: call 6027\n>  6047: ret \n>  6048: push [0]\n>  6050: add  [1] [1] 327'
-script += '67\n>  6054: call 6027\n>  6056: set  [1] [0]\n>  6059: pop  [0]\n>  6061: add  [0] [0] 32767\n>  60'
-script += '65: call 6027\n>  6067: ret \n# "energy_level" in this project is an implementation of this, showing'
-script += ' which value of the eigth register will result in a correct value.  Here it\'s being set with a back'
-script += 'door to set the register\n~minput~! set_register 8 25734\n~r725734~~moutput~> Register #8 set to 257'
-script += '34\n# Disable the jump to the confirmation process, it takes forever\n~minput~! no_op 5489\n~moutput~'
-script += '> Set 2 values starting at 5489 to noop\n# And the invert the logic of this jump, thus continuing as'
-script += ' if the confirmation worked.\n~minput~! op 5495 jt\n~moutput~> Set 5495 to jt\n# This will reveal th'
-script += 'e seventh code\n~minput~u~r025976,4117,51~s~r025977,4115,52~e~r025978,4101,53~ ~r025979,432,54~t~r025980,4116,55~'
-script += 'e~r025981,4101,56~l~r025982,4108,57~e~r025983,4101,58~p~r025984,4112,59~o~r025985,4111,510~r~r025986,4114,511~'
-script += 't~r025987,4116,512~e~r025988,4101,513~r~r025989,4114,514~\n~r032,24,312,4101,50~~moutput~\n\n~r065,131974,231974,328845,4169,51531,628844~'
-script += 'A~r032,328846~ ~r0115,328847~s~r0116,328848~t~r0114,328849~r~r097,328850~a~r0110,328851~n~r0103,328852~'
-script += 'g~r0101,328853~e~r044,328854~,~r032,328855~ ~r0101,328856~e~r0108,328857~l~r0101,328858~e~r099,328859~'
-script += 'c~r0116,328860~t~r0114,328861~r~r0111,328862~o~r0110,328863~n~r0105,328864~i~r099,328865~c~r032,328866~'
-script += ' ~r0118,328867~v~r0111,328868~o~r0105,328869~i~r099,328870~c~r0101,328871~e~r032,328872~ ~r0105,328873~'
-script += 'i~r0115,328874~s~r032,328875~ ~r0112,328876~p~r0114,328877~r~r0111,328878~o~r0106,328879~j~r0101,328880~'
-script += 'e~r099,328881~c~r0116,328882~t~r0101,328883~e~r0100,328884~d~r032,328885~ ~r0105,328886~i~r0110,328887~'
-script += 'n~r0116,328888~t~r0111,328889~o~r032,328890~ ~r0121,328891~y~r0111,328892~o~r0117,328893~u~r0114,328894~'
-script += 'r~r032,328895~ ~r0109,328896~m~r0105,328897~i~r0110,328898~n~r0100,328899~d~r058,328900~:~r010,328901~'
-script += '\n~r328902~\n~r032,328903~ ~r328904~ ~r034,328905~"~r085,328906~U~r0110,328907~n~r0117,328908~u~r0115,328909~'
-script += 's~r0117,328910~u~r097,328911~a~r0108,328912~l~r032,328913~ ~r0115,328914~s~r0101,328915~e~r0116,328916~'
-script += 't~r328917~t~r0105,328918~i~r0110,328919~n~r0103,328920~g~r032,328921~ ~r0100,328922~d~r0101,328923~e'
-script += '~r0116,328924~t~r0101,328925~e~r099,328926~c~r0116,328927~t~r0101,328928~e~r0100,328929~d~r033,328930~'
-script += '!~r032,328931~ ~r328932~ ~r083,328933~S~r0116,328934~t~r097,328935~a~r0114,328936~r~r0116,328937~t~r0105,328938~'
-script += 'i~r0110,328939~n~r0103,328940~g~r032,328941~ ~r099,328942~c~r0111,328943~o~r0110,328944~n~r0102,328945~'
-script += 'f~r0105,328946~i~r0114,328947~r~r0109,328948~m~r097,328949~a~r0116,328950~t~r0105,328951~i~r0111,328952~'
-script += 'o~r0110,328953~n~r032,328954~ ~r0112,328955~p~r0114,328956~r~r0111,328957~o~r099,328958~c~r0101,328959~'
-script += 'e~r0115,328960~s~r328961~s~r033,328962~!~r032,328963~ ~r328964~ ~r069,328965~E~r0115,328966~s~r0116,328967~'
-script += 't~r0105,328968~i~r0109,328969~m~r097,328970~a~r0116,328971~t~r0101,328972~e~r0100,328973~d~r032,328974~'
-script += ' ~r0116,328975~t~r0105,328976~i~r0109,328977~m~r0101,328978~e~r032,328979~ ~r0116,328980~t~r0111,328981~'
-script += 'o~r032,328982~ ~r099,328983~c~r0111,328984~o~r0109,328985~m~r0112,328986~p~r0108,328987~l~r0101,328988~'
-script += 'e~r0116,328989~t~r0105,328990~i~r0111,328991~o~r0110,328992~n~r058,328993~:~r032,328994~ ~r049,328995~'
-script += '1~r032,328996~ ~r098,328997~b~r0105,328998~i~r0108,328999~l~r329000~l~r0105,329001~i~r0111,329002~o~r0110,329003~'
-script += 'n~r032,329004~ ~r0121,329005~y~r0101,329006~e~r097,329007~a~r0114,329008~r~r0115,329009~s~r046,329010~'
-script += '.~r034,329011~"~r010,329012~\n~r329013~\n~r089,18175,28175,329015,4226,629014~Y~r0111,329016~o~r0117,329017~'
-script += 'u~r032,329018~ ~r0119,329019~w~r097,329020~a~r0107,329021~k~r0101,329022~e~r032,329023~ ~r0117,329024~'
-script += 'u~r0112,329025~p~r032,329026~ ~r0111,329027~o~r0110,329028~n~r032,329029~ ~r097,329030~a~r032,329031~'
-script += ' ~r0115,329032~s~r097,329033~a~r0110,329034~n~r0100,329035~d~r0121,329036~y~r032,329037~ ~r098,329038~'
-script += 'b~r0101,329039~e~r097,329040~a~r099,329041~c~r0104,329042~h~r032,329043~ ~r0119,329044~w~r0105,329045~'
-script += 'i~r0116,329046~t~r0104,329047~h~r032,329048~ ~r097,329049~a~r032,329050~ ~r0115,329051~s~r0108,329052~'
-script += 'l~r0105,329053~i~r0103,329054~g~r0104,329055~h~r0116,329056~t~r032,329057~ ~r0104,329058~h~r0101,329059~'
-script += 'e~r097,329060~a~r0100,329061~d~r097,329062~a~r099,329063~c~r0104,329064~h~r0101,329065~e~r046,329066~'
-script += '.~r032,329067~ ~r329068~ ~r084,329069~T~r0104,329070~h~r0101,329071~e~r032,329072~ ~r0108,329073~l~r097,329074~'
-script += 'a~r0115,329075~s~r0116,329076~t~r032,329077~ ~r0116,329078~t~r0104,329079~h~r0105,329080~i~r0110,329081~'
-script += 'n~r0103,329082~g~r032,329083~ ~r0121,329084~y~r0111,329085~o~r0117,329086~u~r032,329087~ ~r0114,329088~'
-script += 'r~r0101,329089~e~r0109,329090~m~r0101,329091~e~r0109,329092~m~r098,329093~b~r0101,329094~e~r0114,329095~'
-script += 'r~r032,329096~ ~r0105,329097~i~r0115,329098~s~r032,329099~ ~r097,329100~a~r099,329101~c~r0116,329102~'
-script += 't~r0105,329103~i~r0118,329104~v~r097,329105~a~r0116,329106~t~r0105,329107~i~r0110,329108~n~r0103,329109~'
-script += 'g~r032,329110~ ~r0116,329111~t~r0104,329112~h~r097,329113~a~r0116,329114~t~r032,329115~ ~r0116,329116~'
-script += 't~r0101,329117~e~r0108,329118~l~r0101,329119~e~r0112,329120~p~r0111,329121~o~r0114,329122~r~r0116,329123~'
-script += 't~r0101,329124~e~r0114,329125~r~r046,329126~.~r329127~.~r329128~.~r032,329129~ ~r098,329130~b~r0117,329131~'
-script += 'u~r0116,329132~t~r032,329133~ ~r0110,329134~n~r0111,329135~o~r0119,329136~w~r032,329137~ ~r0121,329138~'
-script += 'y~r0111,329139~o~r0117,329140~u~r032,329141~ ~r099,329142~c~r097,329143~a~r0110,329144~n~r039,329145~'
-script += '\'~r0116,329146~t~r032,329147~ ~r0102,329148~f~r0105,329149~i~r0110,329150~n~r0100,329151~d~r032,329152~'
-script += ' ~r0105,329153~i~r0116,329154~t~r032,329155~ ~r097,329156~a~r0110,329157~n~r0121,329158~y~r0119,329159~'
-script += 'w~r0104,329160~h~r0101,329161~e~r0114,329162~r~r0101,329163~e~r032,329164~ ~r0105,329165~i~r0110,329166~'
-script += 'n~r032,329167~ ~r0121,329168~y~r0111,329169~o~r0117,329170~u~r0114,329171~r~r032,329172~ ~r0112,329173~'
-script += 'p~r097,329174~a~r099,329175~c~r0107,329176~k~r046,329177~.~r032,329178~ ~r329179~ ~r083,329180~S~r0111,329181~'
-script += 'o~r0109,329182~m~r0101,329183~e~r0111,329184~o~r0110,329185~n~r0101,329186~e~r032,329187~ ~r0115,329188~'
-script += 's~r0101,329189~e~r329190~e~r0109,329191~m~r0115,329192~s~r032,329193~ ~r0116,329194~t~r0111,329195~o'
-script += '~r032,329196~ ~r0104,329197~h~r097,329198~a~r0118,329199~v~r0101,329200~e~r032,329201~ ~r0100,329202~'
-script += 'd~r0114,329203~r~r097,329204~a~r0119,329205~w~r0110,329206~n~r032,329207~ ~r097,329208~a~r032,329209~'
-script += ' ~r0109,329210~m~r0101,329211~e~r0115,329212~s~r329213~s~r097,329214~a~r0103,329215~g~r0101,329216~e'
-script += '~r032,329217~ ~r0105,329218~i~r0110,329219~n~r032,329220~ ~r0116,329221~t~r0104,329222~h~r0101,329223~'
-script += 'e~r032,329224~ ~r0115,329225~s~r097,329226~a~r0110,329227~n~r0100,329228~d~r032,329229~ ~r0104,329230~'
-script += 'h~r0101,329231~e~r0114,329232~r~r0101,329233~e~r058,329234~:~r010,329235~\n~r329236~\n~r032,329237~ '
-script += '~r329238~ ~r329239~ ~r329240~ ~r083,10,232767,36130,412,51528,66129~~mcode~S~r0108,11,36131~l~r0112,12,36132~'
-script += 'p~r0110,13,36133~n~r071,14,36134~G~r0117,15,36135~u~r069,16,36136~E~r0110,17,36137~n~r0102,18,36138~'
-script += 'f~r0104,19,36139~h~r099,110,36140~c~r069,111,36141~E~moutput~~r010,121987,221987,329246,4154,51531,629245~'
-script += '\n~r329247~\n~r073,329248~I~r0116,329249~t~r032,329250~ ~r098,329251~b~r0101,329252~e~r0103,329253~g'
-script += '~r0105,329254~i~r0110,329255~n~r0115,329256~s~r032,329257~ ~r0116,329258~t~r0111,329259~o~r032,329260~'
-script += ' ~r0114,329261~r~r097,329262~a~r0105,329263~i~r0110,329264~n~r046,329265~.~r032,329266~ ~r329267~ ~r084,329268~'
-script += 'T~r0104,329269~h~r0101,329270~e~r032,329271~ ~r0109,329272~m~r0101,329273~e~r0115,329274~s~r329275~s'
-script += '~r097,329276~a~r0103,329277~g~r0101,329278~e~r032,329279~ ~r0119,329280~w~r097,329281~a~r0115,329282~'
-script += 's~r0104,329283~h~r0101,329284~e~r0115,329285~s~r032,329286~ ~r097,329287~a~r0119,329288~w~r097,329289~'
-script += 'a~r0121,329290~y~r046,329291~.~r032,329292~ ~r329293~ ~r089,329294~Y~r0111,329295~o~r0117,329296~u~r032,329297~'
-script += ' ~r0116,329298~t~r097,329299~a~r0107,329300~k~r0101,329301~e~r032,329302~ ~r097,329303~a~r032,329304~'
-script += ' ~r0100,329305~d~r0101,329306~e~r329307~e~r0112,329308~p~r032,329309~ ~r098,329310~b~r0114,329311~r~r0101,329312~'
-script += 'e~r097,329313~a~r0116,329314~t~r0104,329315~h~r032,329316~ ~r097,329317~a~r0110,329318~n~r0100,329319~'
-script += 'd~r032,329320~ ~r0102,329321~f~r0101,329322~e~r329323~e~r0108,329324~l~r032,329325~ ~r0102,329326~f~r0105,329327~'
-script += 'i~r0114,329328~r~r0109,329329~m~r0108,329330~l~r0121,329331~y~r032,329332~ ~r0103,329333~g~r0114,329334~'
-script += 'r~r0111,329335~o~r0117,329336~u~r0110,329337~n~r0100,329338~d~r0101,329339~e~r0100,329340~d~r032,329341~'
-script += ' ~r0105,329342~i~r0110,329343~n~r032,329344~ ~r0114,329345~r~r0101,329346~e~r097,329347~a~r0108,329348~'
-script += 'l~r0105,329349~i~r0116,329350~t~r0121,329351~y~r032,329352~ ~r097,329353~a~r0115,329354~s~r032,329355~'
-script += ' ~r0116,329356~t~r0104,329357~h~r0101,329358~e~r032,329359~ ~r0101,329360~e~r0102,329361~f~r329362~f'
-script += '~r0101,329363~e~r099,329364~c~r0116,329365~t~r0115,329366~s~r032,329367~ ~r0111,329368~o~r0102,329369~'
-script += 'f~r032,329370~ ~r0116,329371~t~r0104,329372~h~r0101,329373~e~r032,329374~ ~r0116,329375~t~r0101,329376~'
-script += 'e~r0108,329377~l~r0101,329378~e~r0112,329379~p~r0111,329380~o~r0114,329381~r~r0116,329382~t~r097,329383~'
-script += 'a~r0116,329384~t~r0105,329385~i~r0111,329386~o~r0110,329387~n~r032,329388~ ~r0119,329389~w~r0101,329390~'
-script += 'e~r097,329391~a~r0114,329392~r~r032,329393~ ~r0111,329394~o~r0102,329395~f~r329396~f~r046,329397~.~r010,329398~'
-script += '\n~r329399~\n~r02498,10,23,310,4101,50,60~~v27322498,271032767~== ~r066,311727,45,51528,611726~B~r0101,11,311728~'
-script += 'e~r097,12,311729~a~r099,13,311730~c~r0104,14,311731~h~r011726,10,310,4101,50,60~ ==\n~r084,311733,4170,51528,611732~'
-script += 'T~r0104,11,311734~h~r0105,12,311735~i~r0115,13,311736~s~r032,14,311737~ ~r0105,15,311738~i~r0115,16,311739~'
-script += 's~r032,17,311740~ ~r097,18,311741~a~r032,19,311742~ ~r0115,110,311743~s~r097,111,311744~a~r0110,112,311745~'
-script += 'n~r0100,113,311746~d~r0121,114,311747~y~r032,115,311748~ ~r098,116,311749~b~r0101,117,311750~e~r097,118,311751~'
-script += 'a~r099,119,311752~c~r0104,120,311753~h~r032,121,311754~ ~r0105,122,311755~i~r0110,123,311756~n~r032,124,311757~'
-script += ' ~r097,125,311758~a~r032,126,311759~ ~r099,127,311760~c~r0111,128,311761~o~r0118,129,311762~v~r0101,130,311763~'
-script += 'e~r032,131,311764~ ~r0111,132,311765~o~r0110,133,311766~n~r032,134,311767~ ~r0115,135,311768~s~r0111,136,311769~'
-script += 'o~r0109,137,311770~m~r0101,138,311771~e~r032,139,311772~ ~r0116,140,311773~t~r0114,141,311774~r~r0111,142,311775~'
-script += 'o~r0112,143,311776~p~r0105,144,311777~i~r099,145,311778~c~r097,146,311779~a~r0108,147,311780~l~r032,148,311781~'
-script += ' ~r0105,149,311782~i~r0115,150,311783~s~r0108,151,311784~l~r097,152,311785~a~r0110,153,311786~n~r0100,154,311787~'
-script += 'd~r046,155,311788~.~r032,156,311789~ ~r157,311790~ ~r073,158,311791~I~r0116,159,311792~t~r032,160,311793~'
-script += ' ~r0105,161,311794~i~r0115,162,311795~s~r032,163,311796~ ~r0114,164,311797~r~r097,165,311798~a~r0105,166,311799~'
-script += 'i~r0110,167,311800~n~r0105,168,311801~i~r0110,169,311802~n~r0103,170,311803~g~r046,171,311804~.~r032,172,311805~'
-script += ' ~r173,311806~ ~r084,174,311807~T~r0104,175,311808~h~r0101,176,311809~e~r032,177,311810~ ~r0111,178,311811~'
-script += 'o~r099,179,311812~c~r0101,180,311813~e~r097,181,311814~a~r0110,182,311815~n~r032,183,311816~ ~r0105,184,311817~'
-script += 'i~r0115,185,311818~s~r032,186,311819~ ~r0116,187,311820~t~r0111,188,311821~o~r032,189,311822~ ~r0121,190,311823~'
-script += 'y~r0111,191,311824~o~r0117,192,311825~u~r0114,193,311826~r~r032,194,311827~ ~r0115,195,311828~s~r0111,196,311829~'
-script += 'o~r0117,197,311830~u~r0116,198,311831~t~r0104,199,311832~h~r044,1100,311833~,~r032,1101,311834~ ~r097,1102,311835~'
-script += 'a~r0110,1103,311836~n~r0100,1104,311837~d~r032,1105,311838~ ~r0104,1106,311839~h~r0101,1107,311840~e'
-script += '~r097,1108,311841~a~r0118,1109,311842~v~r0121,1110,311843~y~r032,1111,311844~ ~r0102,1112,311845~f~r0111,1113,311846~'
-script += 'o~r0108,1114,311847~l~r0105,1115,311848~i~r097,1116,311849~a~r0103,1117,311850~g~r0101,1118,311851~e'
-script += '~r032,1119,311852~ ~r0105,1120,311853~i~r0115,1121,311854~s~r032,1122,311855~ ~r0116,1123,311856~t~r0111,1124,311857~'
-script += 'o~r032,1125,311858~ ~r0121,1126,311859~y~r0111,1127,311860~o~r0117,1128,311861~u~r0114,1129,311862~r'
-script += '~r032,1130,311863~ ~r0110,1131,311864~n~r0111,1132,311865~o~r0114,1133,311866~r~r0116,1134,311867~t~r0104,1135,311868~'
-script += 'h~r059,1136,311869~;~r032,1137,311870~ ~r0116,1138,311871~t~r0104,1139,311872~h~r0101,1140,311873~e~r032,1141,311874~'
-script += ' ~r098,1142,311875~b~r0101,1143,311876~e~r097,1144,311877~a~r099,1145,311878~c~r0104,1146,311879~h~r032,1147,311880~'
-script += ' ~r0101,1148,311881~e~r0120,1149,311882~x~r0116,1150,311883~t~r0101,1151,311884~e~r0110,1152,311885~'
-script += 'n~r0100,1153,311886~d~r0115,1154,311887~s~r032,1155,311888~ ~r0119,1156,311889~w~r0101,1157,311890~e'
-script += '~r0115,1158,311891~s~r0116,1159,311892~t~r032,1160,311893~ ~r097,1161,311894~a~r0110,1162,311895~n~r0100,1163,311896~'
-script += 'd~r032,1164,311897~ ~r0101,1165,311898~e~r097,1166,311899~a~r0115,1167,311900~s~r0116,1168,311901~t~r046,1169,311902~'
-script += '.~r011732,10,310,4101,50,60~\n~r03,20~\nThere are ~r051,110,210,332765,451,51~3~r03,10,20,310,4101,50~'
-script += ' exits:\n~r011903,327140,43,55814,627139~- ~r0119,311904,44,51528,611903~w~r0101,11,311905~e~r0115,12,311906~'
-script += 's~r0116,13,311907~t~r011903,10,327140,43,55814,627139~\n~r011908,11,327141~- ~r0101,10,311909,44,51528,611908~'
-script += 'e~r097,11,311910~a~r0115,12,311911~s~r0116,13,311912~t~r011908,11,327141,43,55814,627139~\n~r011913,12,327142~'
-script += '- ~r0110,10,311914,45,51528,611913~n~r0111,11,311915~o~r0114,12,311916~r~r0116,13,311917~t~r0104,14,311918~'
-script += 'h~r011913,12,327142,43,55814,627139~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~n~r025976,4110,51~o~r025977,4111,52~r~r025978,4114,53~'
-script += 't~r025979,4116,54~h~r025980,4104,55~\n~r032,23,310,4101,50~~moutput~\n\n~r02513,10,20,35~~v27322513~'
-script += '== ~r084,312460,415,51528,612459~T~r0114,11,312461~r~r0111,12,312462~o~r0112,13,312463~p~r0105,14,312464~'
-script += 'i~r099,15,312465~c~r097,16,312466~a~r0108,17,312467~l~r032,18,312468~ ~r073,19,312469~I~r0115,110,312470~'
-script += 's~r0108,111,312471~l~r097,112,312472~a~r0110,113,312473~n~r0100,114,312474~d~r012459,10,35,4101,50,60~'
-script += ' ==\n~r084,312476,4198,51528,612475~T~r0104,11,312477~h~r0101,12,312478~e~r032,13,312479~ ~r0108,14,312480~'
-script += 'l~r097,15,312481~a~r0114,16,312482~r~r0103,17,312483~g~r0101,18,312484~e~r032,19,312485~ ~r0116,110,312486~'
-script += 't~r0114,111,312487~r~r0101,112,312488~e~r113,312489~e~r0115,114,312490~s~r032,115,312491~ ~r0104,116,312492~'
-script += 'h~r0101,117,312493~e~r0114,118,312494~r~r0101,119,312495~e~r032,120,312496~ ~r0115,121,312497~s~r0101,122,312498~'
-script += 'e~r123,312499~e~r0109,124,312500~m~r032,125,312501~ ~r0116,126,312502~t~r0111,127,312503~o~r032,128,312504~'
-script += ' ~r098,129,312505~b~r0101,130,312506~e~r032,131,312507~ ~r0112,132,312508~p~r0114,133,312509~r~r0111,134,312510~'
-script += 'o~r0116,135,312511~t~r0101,136,312512~e~r099,137,312513~c~r0116,138,312514~t~r0105,139,312515~i~r0110,140,312516~'
-script += 'n~r0103,141,312517~g~r032,142,312518~ ~r0121,143,312519~y~r0111,144,312520~o~r0117,145,312521~u~r032,146,312522~'
-script += ' ~r0102,147,312523~f~r0114,148,312524~r~r0111,149,312525~o~r0109,150,312526~m~r032,151,312527~ ~r0116,152,312528~'
-script += 't~r0104,153,312529~h~r0101,154,312530~e~r032,155,312531~ ~r0114,156,312532~r~r097,157,312533~a~r0105,158,312534~'
-script += 'i~r0110,159,312535~n~r046,160,312536~.~r032,161,312537~ ~r162,312538~ ~r065,163,312539~A~r0115,164,312540~'
-script += 's~r032,165,312541~ ~r0121,166,312542~y~r0111,167,312543~o~r0117,168,312544~u~r032,169,312545~ ~r0112,170,312546~'
-script += 'p~r0117,171,312547~u~r0115,172,312548~s~r0104,173,312549~h~r032,174,312550~ ~r0116,175,312551~t~r0104,176,312552~'
-script += 'h~r0114,177,312553~r~r0111,178,312554~o~r0117,179,312555~u~r0103,180,312556~g~r0104,181,312557~h~r032,182,312558~'
-script += ' ~r0116,183,312559~t~r0104,184,312560~h~r0101,185,312561~e~r032,186,312562~ ~r0117,187,312563~u~r0110,188,312564~'
-script += 'n~r0100,189,312565~d~r0101,190,312566~e~r0114,191,312567~r~r0103,192,312568~g~r0114,193,312569~r~r0111,194,312570~'
-script += 'o~r0119,195,312571~w~r0116,196,312572~t~r0104,197,312573~h~r044,198,312574~,~r032,199,312575~ ~r0121,1100,312576~'
-script += 'y~r0111,1101,312577~o~r0117,1102,312578~u~r032,1103,312579~ ~r099,1104,312580~c~r097,1105,312581~a~r0110,1106,312582~'
-script += 'n~r032,1107,312583~ ~r0104,1108,312584~h~r0101,1109,312585~e~r097,1110,312586~a~r0114,1111,312587~r~r032,1112,312588~'
-script += ' ~r098,1113,312589~b~r0105,1114,312590~i~r0114,1115,312591~r~r0100,1116,312592~d~r0115,1117,312593~s'
-script += '~r032,1118,312594~ ~r099,1119,312595~c~r0104,1120,312596~h~r0105,1121,312597~i~r0114,1122,312598~r~r0112,1123,312599~'
-script += 'p~r0105,1124,312600~i~r0110,1125,312601~n~r0103,1126,312602~g~r032,1127,312603~ ~r0111,1128,312604~o'
-script += '~r0118,1129,312605~v~r0101,1130,312606~e~r0114,1131,312607~r~r0104,1132,312608~h~r0101,1133,312609~e'
-script += '~r097,1134,312610~a~r0100,1135,312611~d~r046,1136,312612~.~r032,1137,312613~ ~r1138,312614~ ~r084,1139,312615~'
-script += 'T~r0104,1140,312616~h~r0101,1141,312617~e~r0114,1142,312618~r~r0101,1143,312619~e~r032,1144,312620~ '
-script += '~r0105,1145,312621~i~r0115,1146,312622~s~r032,1147,312623~ ~r097,1148,312624~a~r032,1149,312625~ ~r0115,1150,312626~'
-script += 's~r0116,1151,312627~t~r0101,1152,312628~e~r1153,312629~e~r0112,1154,312630~p~r032,1155,312631~ ~r0114,1156,312632~'
-script += 'r~r0111,1157,312633~o~r099,1158,312634~c~r0107,1159,312635~k~r032,1160,312636~ ~r0102,1161,312637~f~r097,1162,312638~'
-script += 'a~r099,1163,312639~c~r0101,1164,312640~e~r032,1165,312641~ ~r0116,1166,312642~t~r0111,1167,312643~o~r032,1168,312644~'
-script += ' ~r0121,1169,312645~y~r0111,1170,312646~o~r0117,1171,312647~u~r0114,1172,312648~r~r032,1173,312649~ '
-script += '~r0119,1174,312650~w~r0101,1175,312651~e~r0115,1176,312652~s~r0116,1177,312653~t~r032,1178,312654~ ~r098,1179,312655~'
-script += 'b~r0108,1180,312656~l~r0111,1181,312657~o~r099,1182,312658~c~r0107,1183,312659~k~r0105,1184,312660~i'
-script += '~r0110,1185,312661~n~r0103,1186,312662~g~r032,1187,312663~ ~r0121,1188,312664~y~r0111,1189,312665~o~r0117,1190,312666~'
-script += 'u~r0114,1191,312667~r~r032,1192,312668~ ~r0112,1193,312669~p~r097,1194,312670~a~r0116,1195,312671~t~r0104,1196,312672~'
-script += 'h~r046,1197,312673~.~r012475,10,35,4101,50,60~\n~r03~\nThere are ~r051,110,210,332765,451,51~3~r03,10,20,35,4101,50~'
-script += ' exits:\n~r012674,327160,43,55814,627159~- ~r0110,312675,45,51528,612674~n~r0111,11,312676~o~r0114,12,312677~'
-script += 'r~r0116,13,312678~t~r0104,14,312679~h~r012674,10,327160,43,55814,627159~\n~r012680,11,327161~- ~r0115,10,312681,45,51528,612680~'
-script += 's~r0111,11,312682~o~r0117,12,312683~u~r0116,13,312684~t~r0104,14,312685~h~r012680,11,327161,43,55814,627159~'
-script += '\n~r012686,12,327162~- ~r0101,10,312687,44,51528,612686~e~r097,11,312688~a~r0115,12,312689~s~r0116,13,312690~'
-script += 't~r012686,12,327162,43,55814,627159~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~n~r025976,4110,51~o~r025977,4111,52~r~r025978,4114,53~'
-script += 't~r025979,4116,54~h~r025980,4104,55~\n~r032,20,35,4101,50~~moutput~\n\n~r02523,10~~v27322523~== ~r084,312848,415,51528,612847~'
-script += 'T~r0114,11,312849~r~r0111,12,312850~o~r0112,13,312851~p~r0105,14,312852~i~r099,15,312853~c~r097,16,312854~'
-script += 'a~r0108,17,312855~l~r032,18,312856~ ~r073,19,312857~I~r0115,110,312858~s~r0108,111,312859~l~r097,112,312860~'
-script += 'a~r0110,113,312861~n~r0100,114,312862~d~r012847,10,35,4101,50,60~ ==\n~r084,312864,4230,51528,612863~'
-script += 'T~r0104,11,312865~h~r0101,12,312866~e~r032,13,312867~ ~r0101,14,312868~e~r0109,15,312869~m~r098,16,312870~'
-script += 'b~r097,17,312871~a~r0110,18,312872~n~r0107,19,312873~k~r0109,110,312874~m~r0101,111,312875~e~r0110,112,312876~'
-script += 'n~r0116,113,312877~t~r032,114,312878~ ~r0111,115,312879~o~r0102,116,312880~f~r032,117,312881~ ~r0116,118,312882~'
-script += 't~r0104,119,312883~h~r0101,120,312884~e~r032,121,312885~ ~r099,122,312886~c~r0111,123,312887~o~r0118,124,312888~'
-script += 'v~r0101,125,312889~e~r032,126,312890~ ~r099,127,312891~c~r0111,128,312892~o~r0109,129,312893~m~r0101,130,312894~'
-script += 'e~r032,131,312895~ ~r0116,132,312896~t~r0111,133,312897~o~r0101,134,312898~e~r0103,135,312899~g~r0104,136,312900~'
-script += 'h~r0101,137,312901~e~r0114,138,312902~r~r032,139,312903~ ~r0104,140,312904~h~r0101,141,312905~e~r0114,142,312906~'
-script += 'r~r0101,143,312907~e~r032,144,312908~ ~r0116,145,312909~t~r0111,146,312910~o~r032,147,312911~ ~r0121,148,312912~'
-script += 'y~r0111,149,312913~o~r0117,150,312914~u~r0114,151,312915~r~r032,152,312916~ ~r0101,153,312917~e~r097,154,312918~'
-script += 'a~r0115,155,312919~s~r0116,156,312920~t~r032,157,312921~ ~r097,158,312922~a~r0110,159,312923~n~r0100,160,312924~'
-script += 'd~r032,161,312925~ ~r0119,162,312926~w~r0101,163,312927~e~r0115,164,312928~s~r0116,165,312929~t~r046,166,312930~'
-script += '.~r032,167,312931~ ~r168,312932~ ~r066,169,312933~B~r0101,170,312934~e~r0116,171,312935~t~r0119,172,312936~'
-script += 'w~r0101,173,312937~e~r174,312938~e~r0110,175,312939~n~r032,176,312940~ ~r0116,177,312941~t~r0104,178,312942~'
-script += 'h~r0101,179,312943~e~r0115,180,312944~s~r0101,181,312945~e~r032,182,312946~ ~r0116,183,312947~t~r097,184,312948~'
-script += 'a~r0108,185,312949~l~r186,312950~l~r032,187,312951~ ~r0114,188,312952~r~r0111,189,312953~o~r099,190,312954~'
-script += 'c~r0107,191,312955~k~r032,192,312956~ ~r0102,193,312957~f~r097,194,312958~a~r099,195,312959~c~r0101,196,312960~'
-script += 'e~r0115,197,312961~s~r044,198,312962~,~r032,199,312963~ ~r0116,1100,312964~t~r0104,1101,312965~h~r0101,1102,312966~'
-script += 'e~r0114,1103,312967~r~r0101,1104,312968~e~r032,1105,312969~ ~r0105,1106,312970~i~r0115,1107,312971~s'
-script += '~r032,1108,312972~ ~r097,1109,312973~a~r032,1110,312974~ ~r0110,1111,312975~n~r097,1112,312976~a~r0114,1113,312977~'
-script += 'r~r1114,312978~r~r0111,1115,312979~o~r0119,1116,312980~w~r044,1117,312981~,~r032,1118,312982~ ~r0111,1119,312983~'
-script += 'o~r0118,1120,312984~v~r0101,1121,312985~e~r0114,1122,312986~r~r0103,1123,312987~g~r0114,1124,312988~'
-script += 'r~r0111,1125,312989~o~r0119,1126,312990~w~r0110,1127,312991~n~r032,1128,312992~ ~r0112,1129,312993~p'
-script += '~r097,1130,312994~a~r0116,1131,312995~t~r0104,1132,312996~h~r032,1133,312997~ ~r0108,1134,312998~l~r0101,1135,312999~'
-script += 'e~r097,1136,313000~a~r0100,1137,313001~d~r0105,1138,313002~i~r0110,1139,313003~n~r0103,1140,313004~g'
-script += '~r032,1141,313005~ ~r0110,1142,313006~n~r0111,1143,313007~o~r0114,1144,313008~r~r0116,1145,313009~t~r0104,1146,313010~'
-script += 'h~r046,1147,313011~.~r032,1148,313012~ ~r1149,313013~ ~r089,1150,313014~Y~r0111,1151,313015~o~r0117,1152,313016~'
-script += 'u~r032,1153,313017~ ~r0104,1154,313018~h~r0101,1155,313019~e~r097,1156,313020~a~r0114,1157,313021~r~r032,1158,313022~'
-script += ' ~r0119,1159,313023~w~r097,1160,313024~a~r0118,1161,313025~v~r0101,1162,313026~e~r0115,1163,313027~s'
-script += '~r032,1164,313028~ ~r0108,1165,313029~l~r097,1166,313030~a~r0112,1167,313031~p~r1168,313032~p~r0105,1169,313033~'
-script += 'i~r0110,1170,313034~n~r0103,1171,313035~g~r032,1172,313036~ ~r0117,1173,313037~u~r0112,1174,313038~p'
-script += '~r032,1175,313039~ ~r0111,1176,313040~o~r0110,1177,313041~n~r032,1178,313042~ ~r097,1179,313043~a~r032,1180,313044~'
-script += ' ~r098,1181,313045~b~r0101,1182,313046~e~r097,1183,313047~a~r099,1184,313048~c~r0104,1185,313049~h~r032,1186,313050~'
-script += ' ~r0116,1187,313051~t~r0104,1188,313052~h~r0114,1189,313053~r~r0111,1190,313054~o~r0117,1191,313055~'
-script += 'u~r0103,1192,313056~g~r0104,1193,313057~h~r032,1194,313058~ ~r0116,1195,313059~t~r0104,1196,313060~h'
-script += '~r0101,1197,313061~e~r032,1198,313062~ ~r0100,1199,313063~d~r0101,1200,313064~e~r0110,1201,313065~n~r0115,1202,313066~'
-script += 's~r0101,1203,313067~e~r032,1204,313068~ ~r0118,1205,313069~v~r0101,1206,313070~e~r0103,1207,313071~g'
-script += '~r0101,1208,313072~e~r0116,1209,313073~t~r097,1210,313074~a~r0116,1211,313075~t~r0105,1212,313076~i~r0111,1213,313077~'
-script += 'o~r0110,1214,313078~n~r032,1215,313079~ ~r0116,1216,313080~t~r0111,1217,313081~o~r032,1218,313082~ ~r0121,1219,313083~'
-script += 'y~r0111,1220,313084~o~r0117,1221,313085~u~r0114,1222,313086~r~r032,1223,313087~ ~r0115,1224,313088~s'
-script += '~r0111,1225,313089~o~r0117,1226,313090~u~r0116,1227,313091~t~r0104,1228,313092~h~r046,1229,313093~.~r012863,10,35,4101,50,60~'
-script += '\n~r02~\nThere are ~r050,110,210,332766,450,51~2~r02,10,20,35,4101,50~ exits:\n~r013094,327176,42,55814,627175~'
-script += '- ~r0110,313095,45,51528,613094~n~r0111,11,313096~o~r0114,12,313097~r~r0116,13,313098~t~r0104,14,313099~'
-script += 'h~r013094,10,327176,42,55814,627175~\n~r013100,11,327177~- ~r0115,10,313101,45,51528,613100~s~r0111,11,313102~'
-script += 'o~r0117,12,313103~u~r0116,13,313104~t~r0104,14,313105~h~r013100,11,327177,42,55814,627175~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~n~r025976,4110,51~o~r025977,4111,52~'
-script += 'r~r025978,4114,53~t~r025979,4116,54~h~r025980,4104,55~\n~r032,20,35,4101,50~~moutput~\n\n~r02528,10~'
-script += '~v27322528~== ~r084,313107,415,51528,613106~T~r0114,11,313108~r~r0111,12,313109~o~r0112,13,313110~p~r0105,14,313111~'
-script += 'i~r099,15,313112~c~r097,16,313113~a~r0108,17,313114~l~r032,18,313115~ ~r073,19,313116~I~r0115,110,313117~'
-script += 's~r0108,111,313118~l~r097,112,313119~a~r0110,113,313120~n~r0100,114,313121~d~r013106,10,35,4101,50,60~'
-script += ' ==\n~r089,313123,4285,51528,613122~Y~r0111,11,313124~o~r0117,12,313125~u~r032,13,313126~ ~r097,14,313127~'
-script += 'a~r0114,15,313128~r~r0101,16,313129~e~r032,17,313130~ ~r0111,18,313131~o~r0110,19,313132~n~r032,110,313133~'
-script += ' ~r097,111,313134~a~r032,112,313135~ ~r0110,113,313136~n~r097,114,313137~a~r0114,115,313138~r~r116,313139~'
-script += 'r~r0111,117,313140~o~r0119,118,313141~w~r032,119,313142~ ~r0112,120,313143~p~r097,121,313144~a~r0116,122,313145~'
-script += 't~r0104,123,313146~h~r032,124,313147~ ~r098,125,313148~b~r0101,126,313149~e~r0116,127,313150~t~r0119,128,313151~'
-script += 'w~r0101,129,313152~e~r130,313153~e~r0110,131,313154~n~r032,132,313155~ ~r0116,133,313156~t~r0119,134,313157~'
-script += 'w~r0111,135,313158~o~r032,136,313159~ ~r0115,137,313160~s~r0116,138,313161~t~r0101,139,313162~e~r140,313163~'
-script += 'e~r0112,141,313164~p~r032,142,313165~ ~r0114,143,313166~r~r0111,144,313167~o~r099,145,313168~c~r0107,146,313169~'
-script += 'k~r032,147,313170~ ~r0102,148,313171~f~r097,149,313172~a~r099,150,313173~c~r0101,151,313174~e~r0115,152,313175~'
-script += 's~r032,153,313176~ ~r0119,154,313177~w~r0104,155,313178~h~r0105,156,313179~i~r099,157,313180~c~r0104,158,313181~'
-script += 'h~r032,159,313182~ ~r0108,160,313183~l~r0111,161,313184~o~r162,313185~o~r0107,163,313186~k~r032,164,313187~'
-script += ' ~r0108,165,313188~l~r0105,166,313189~i~r0107,167,313190~k~r0101,168,313191~e~r032,169,313192~ ~r0116,170,313193~'
-script += 't~r0104,171,313194~h~r0101,172,313195~e~r0121,173,313196~y~r032,174,313197~ ~r0104,175,313198~h~r097,176,313199~'
-script += 'a~r0118,177,313200~v~r0101,178,313201~e~r032,179,313202~ ~r098,180,313203~b~r0101,181,313204~e~r182,313205~'
-script += 'e~r0110,183,313206~n~r032,184,313207~ ~r0104,185,313208~h~r0101,186,313209~e~r0114,187,313210~r~r0101,188,313211~'
-script += 'e~r032,189,313212~ ~r0102,190,313213~f~r0111,191,313214~o~r0114,192,313215~r~r032,193,313216~ ~r0116,194,313217~'
-script += 't~r0104,195,313218~h~r0111,196,313219~o~r0117,197,313220~u~r0115,198,313221~s~r097,199,313222~a~r0110,1100,313223~'
-script += 'n~r0100,1101,313224~d~r0115,1102,313225~s~r032,1103,313226~ ~r0111,1104,313227~o~r0102,1105,313228~f'
-script += '~r032,1106,313229~ ~r0121,1107,313230~y~r0101,1108,313231~e~r097,1109,313232~a~r0114,1110,313233~r~r0115,1111,313234~'
-script += 's~r046,1112,313235~.~r032,1113,313236~ ~r1114,313237~ ~r082,1115,313238~R~r097,1116,313239~a~r0105,1117,313240~'
-script += 'i~r0110,1118,313241~n~r032,1119,313242~ ~r0116,1120,313243~t~r0114,1121,313244~r~r0105,1122,313245~i'
-script += '~r099,1123,313246~c~r0107,1124,313247~k~r0108,1125,313248~l~r0101,1126,313249~e~r0115,1127,313250~s~r032,1128,313251~'
-script += ' ~r0100,1129,313252~d~r0111,1130,313253~o~r0119,1131,313254~w~r0110,1132,313255~n~r032,1133,313256~ '
-script += '~r0116,1134,313257~t~r0104,1135,313258~h~r0114,1136,313259~r~r0111,1137,313260~o~r0117,1138,313261~u'
-script += '~r0103,1139,313262~g~r0104,1140,313263~h~r032,1141,313264~ ~r0116,1142,313265~t~r0104,1143,313266~h~r0101,1144,313267~'
-script += 'e~r032,1145,313268~ ~r0118,1146,313269~v~r0101,1147,313270~e~r0103,1148,313271~g~r0101,1149,313272~e'
-script += '~r0116,1150,313273~t~r097,1151,313274~a~r0116,1152,313275~t~r0105,1153,313276~i~r0111,1154,313277~o~r0110,1155,313278~'
-script += 'n~r032,1156,313279~ ~r097,1157,313280~a~r0110,1158,313281~n~r0100,1159,313282~d~r032,1160,313283~ ~r0109,1161,313284~'
-script += 'm~r0111,1162,313285~o~r0115,1163,313286~s~r1164,313287~s~r044,1165,313288~,~r032,1166,313289~ ~r097,1167,313290~'
-script += 'a~r0110,1168,313291~n~r0100,1169,313292~d~r032,1170,313293~ ~r0116,1171,313294~t~r0104,1172,313295~h'
-script += '~r0114,1173,313296~r~r0111,1174,313297~o~r0117,1175,313298~u~r0103,1176,313299~g~r0104,1177,313300~h'
-script += '~r032,1178,313301~ ~r0116,1179,313302~t~r0104,1180,313303~h~r0101,1181,313304~e~r032,1182,313305~ ~r0108,1183,313306~'
-script += 'l~r0101,1184,313307~e~r097,1185,313308~a~r0118,1186,313309~v~r0101,1187,313310~e~r0115,1188,313311~s'
-script += '~r032,1189,313312~ ~r0121,1190,313313~y~r0111,1191,313314~o~r0117,1192,313315~u~r032,1193,313316~ ~r099,1194,313317~'
-script += 'c~r097,1195,313318~a~r0110,1196,313319~n~r032,1197,313320~ ~r0111,1198,313321~o~r099,1199,313322~c~r1200,313323~'
-script += 'c~r097,1201,313324~a~r0115,1202,313325~s~r0105,1203,313326~i~r0111,1204,313327~o~r0110,1205,313328~n'
-script += '~r097,1206,313329~a~r0108,1207,313330~l~r1208,313331~l~r0121,1209,313332~y~r032,1210,313333~ ~r0115,1211,313334~'
-script += 's~r0101,1212,313335~e~r1213,313336~e~r032,1214,313337~ ~r097,1215,313338~a~r032,1216,313339~ ~r0115,1217,313340~'
-script += 's~r0108,1218,313341~l~r0105,1219,313342~i~r0118,1220,313343~v~r0101,1221,313344~e~r0114,1222,313345~'
-script += 'r~r032,1223,313346~ ~r0111,1224,313347~o~r0102,1225,313348~f~r032,1226,313349~ ~r0108,1227,313350~l~r0105,1228,313351~'
-script += 'i~r0103,1229,313352~g~r0104,1230,313353~h~r0116,1231,313354~t~r032,1232,313355~ ~r0104,1233,313356~h'
-script += '~r0117,1234,313357~u~r0110,1235,313358~n~r0100,1236,313359~d~r0114,1237,313360~r~r0101,1238,313361~e'
-script += '~r0100,1239,313362~d~r0115,1240,313363~s~r032,1241,313364~ ~r0111,1242,313365~o~r0102,1243,313366~f~r032,1244,313367~'
-script += ' ~r0102,1245,313368~f~r0101,1246,313369~e~r1247,313370~e~r0116,1248,313371~t~r032,1249,313372~ ~r097,1250,313373~'
-script += 'a~r098,1251,313374~b~r0111,1252,313375~o~r0118,1253,313376~v~r0101,1254,313377~e~r032,1255,313378~ ~r0121,1256,313379~'
-script += 'y~r0111,1257,313380~o~r0117,1258,313381~u~r032,1259,313382~ ~r0119,1260,313383~w~r0104,1261,313384~h'
-script += '~r0101,1262,313385~e~r0114,1263,313386~r~r0101,1264,313387~e~r032,1265,313388~ ~r0116,1266,313389~t~r0104,1267,313390~'
-script += 'h~r0101,1268,313391~e~r032,1269,313392~ ~r0114,1270,313393~r~r0111,1271,313394~o~r099,1272,313395~c~r0107,1273,313396~'
-script += 'k~r032,1274,313397~ ~r0119,1275,313398~w~r097,1276,313399~a~r0108,1277,313400~l~r1278,313401~l~r0115,1279,313402~'
-script += 's~r032,1280,313403~ ~r0101,1281,313404~e~r0110,1282,313405~n~r0100,1283,313406~d~r046,1284,313407~.~r013122,10,35,4101,50,60~'
-script += '\n~r02~\nThere are ~r050,110,210,332766,450,51~2~r02,10,20,35,4101,50~ exits:\n~r013408,327182,42,55814,627181~'
-script += '- ~r0110,313409,45,51528,613408~n~r0111,11,313410~o~r0114,12,313411~r~r0116,13,313412~t~r0104,14,313413~'
-script += 'h~r013408,10,327182,42,55814,627181~\n~r013414,11,327183~- ~r0115,10,313415,45,51528,613414~s~r0111,11,313416~'
-script += 'o~r0117,12,313417~u~r0116,13,313418~t~r0104,14,313419~h~r013414,11,327183,42,55814,627181~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~n~r025976,4110,51~o~r025977,4111,52~'
-script += 'r~r025978,4114,53~t~r025979,4116,54~h~r025980,4104,55~\n~r032,20,35,4101,50~~moutput~\n\n~r02533,10~'
-script += '~v27322533~== ~r084,313421,415,51528,613420~T~r0114,11,313422~r~r0111,12,313423~o~r0112,13,313424~p~r0105,14,313425~'
-script += 'i~r099,15,313426~c~r097,16,313427~a~r0108,17,313428~l~r032,18,313429~ ~r073,19,313430~I~r0115,110,313431~'
-script += 's~r0108,111,313432~l~r097,112,313433~a~r0110,113,313434~n~r0100,114,313435~d~r013420,10,35,4101,50,60~'
-script += ' ==\n~r084,313437,4245,51528,613436~T~r0104,11,313438~h~r0101,12,313439~e~r032,13,313440~ ~r0110,14,313441~'
-script += 'n~r097,15,313442~a~r0114,16,313443~r~r17,313444~r~r0111,18,313445~o~r0119,19,313446~w~r032,110,313447~'
-script += ' ~r0112,111,313448~p~r097,112,313449~a~r0116,113,313450~t~r0104,114,313451~h~r032,115,313452~ ~r0115,116,313453~'
-script += 's~r0108,117,313454~l~r0111,118,313455~o~r0112,119,313456~p~r0101,120,313457~e~r0115,121,313458~s~r032,122,313459~'
-script += ' ~r0100,123,313460~d~r0111,124,313461~o~r0119,125,313462~w~r0110,126,313463~n~r0119,127,313464~w~r097,128,313465~'
-script += 'a~r0114,129,313466~r~r0100,130,313467~d~r032,131,313468~ ~r0116,132,313469~t~r0111,133,313470~o~r032,134,313471~'
-script += ' ~r0116,135,313472~t~r0104,136,313473~h~r0101,137,313474~e~r032,138,313475~ ~r0110,139,313476~n~r0111,140,313477~'
-script += 'o~r0114,141,313478~r~r0116,142,313479~t~r0104,143,313480~h~r032,144,313481~ ~r097,145,313482~a~r0110,146,313483~'
-script += 'n~r0100,147,313484~d~r032,148,313485~ ~r0108,149,313486~l~r0101,150,313487~e~r097,151,313488~a~r0100,152,313489~'
-script += 'd~r0115,153,313490~s~r032,154,313491~ ~r0116,155,313492~t~r0111,156,313493~o~r032,157,313494~ ~r0116,158,313495~'
-script += 't~r0104,159,313496~h~r0101,160,313497~e~r032,161,313498~ ~r0109,162,313499~m~r0111,163,313500~o~r0117,164,313501~'
-script += 'u~r0116,165,313502~t~r0104,166,313503~h~r032,167,313504~ ~r0111,168,313505~o~r0102,169,313506~f~r032,170,313507~'
-script += ' ~r097,171,313508~a~r032,172,313509~ ~r0115,173,313510~s~r0109,174,313511~m~r097,175,313512~a~r0108,176,313513~'
-script += 'l~r177,313514~l~r032,178,313515~ ~r099,179,313516~c~r097,180,313517~a~r0118,181,313518~v~r0101,182,313519~'
-script += 'e~r046,183,313520~.~r032,184,313521~ ~r185,313522~ ~r065,186,313523~A~r032,187,313524~ ~r0115,188,313525~'
-script += 's~r0105,189,313526~i~r0103,190,313527~g~r0110,191,313528~n~r032,192,313529~ ~r0110,193,313530~n~r0101,194,313531~'
-script += 'e~r097,195,313532~a~r0114,196,313533~r~r098,197,313534~b~r0121,198,313535~y~r032,199,313536~ ~r0114,1100,313537~'
-script += 'r~r0101,1101,313538~e~r097,1102,313539~a~r0100,1103,313540~d~r0115,1104,313541~s~r032,1105,313542~ ~r034,1106,313543~'
-script += '"~r084,1107,313544~T~r0114,1108,313545~r~r0101,1109,313546~e~r097,1110,313547~a~r0115,1111,313548~s~r0117,1112,313549~'
-script += 'u~r0114,1113,313550~r~r0101,1114,313551~e~r032,1115,313552~ ~r086,1116,313553~V~r097,1117,313554~a~r0117,1118,313555~'
-script += 'u~r0108,1119,313556~l~r0116,1120,313557~t~r032,1121,313558~ ~r065,1122,313559~A~r099,1123,313560~c~r1124,313561~'
-script += 'c~r0101,1125,313562~e~r0115,1126,313563~s~r1127,313564~s~r034,1128,313565~"~r044,1129,313566~,~r032,1130,313567~'
-script += ' ~r098,1131,313568~b~r0117,1132,313569~u~r0116,1133,313570~t~r032,1134,313571~ ~r0100,1135,313572~d~r0105,1136,313573~'
-script += 'i~r0102,1137,313574~f~r1138,313575~f~r0101,1139,313576~e~r0114,1140,313577~r~r0101,1141,313578~e~r0110,1142,313579~'
-script += 'n~r0116,1143,313580~t~r032,1144,313581~ ~r0104,1145,313582~h~r097,1146,313583~a~r0110,1147,313584~n~r0100,1148,313585~'
-script += 'd~r0119,1149,313586~w~r0114,1150,313587~r~r0105,1151,313588~i~r0116,1152,313589~t~r0105,1153,313590~'
-script += 'i~r0110,1154,313591~n~r0103,1155,313592~g~r032,1156,313593~ ~r0104,1157,313594~h~r097,1158,313595~a~r0115,1159,313596~'
-script += 's~r032,1160,313597~ ~r099,1161,313598~c~r0114,1162,313599~r~r0111,1163,313600~o~r0115,1164,313601~s~r1165,313602~'
-script += 's~r0101,1166,313603~e~r0100,1167,313604~d~r032,1168,313605~ ~r0116,1169,313606~t~r0104,1170,313607~h'
-script += '~r0105,1171,313608~i~r0115,1172,313609~s~r032,1173,313610~ ~r0111,1174,313611~o~r0117,1175,313612~u~r0116,1176,313613~'
-script += 't~r032,1177,313614~ ~r097,1178,313615~a~r0110,1179,313616~n~r0100,1180,313617~d~r032,1181,313618~ ~r0119,1182,313619~'
-script += 'w~r0114,1183,313620~r~r0105,1184,313621~i~r0116,1185,313622~t~r1186,313623~t~r0101,1187,313624~e~r0110,1188,313625~'
-script += 'n~r032,1189,313626~ ~r034,1190,313627~"~r076,1191,313628~L~r097,1192,313629~a~r0105,1193,313630~i~r0114,1194,313631~'
-script += 'r~r032,1195,313632~ ~r0111,1196,313633~o~r0102,1197,313634~f~r032,1198,313635~ ~r072,1199,313636~H~r0111,1200,313637~'
-script += 'o~r0114,1201,313638~r~r1202,313639~r~r0105,1203,313640~i~r098,1204,313641~b~r0108,1205,313642~l~r0101,1206,313643~'
-script += 'e~r032,1207,313644~ ~r077,1208,313645~M~r0111,1209,313646~o~r0110,1210,313647~n~r0115,1211,313648~s~r0116,1212,313649~'
-script += 't~r0101,1213,313650~e~r0114,1214,313651~r~r033,1215,313652~!~r032,1216,313653~ ~r1217,313654~ ~r065,1218,313655~'
-script += 'A~r0108,1219,313656~l~r1220,313657~l~r032,1221,313658~ ~r0110,1222,313659~n~r0111,1223,313660~o~r0110,1224,313661~'
-script += 'n~r045,1225,313662~-~r0112,1226,313663~p~r0105,1227,313664~i~r0114,1228,313665~r~r097,1229,313666~a~r0116,1230,313667~'
-script += 't~r0101,1231,313668~e~r0115,1232,313669~s~r032,1233,313670~ ~r0107,1234,313671~k~r0101,1235,313672~e'
-script += '~r1236,313673~e~r0112,1237,313674~p~r032,1238,313675~ ~r0111,1239,313676~o~r0117,1240,313677~u~r0116,1241,313678~'
-script += 't~r033,1242,313679~!~r034,1243,313680~"~r046,1244,313681~.~r013436,10,35,4101,50,60~\n~r02~\nThere a'
-script += 're ~r050,110,210,332766,450,51~2~r02,10,20,35,4101,50~ exits:\n~r013682,327188,42,55814,627187~- ~r0110,313683,45,51528,613682~'
-script += 'n~r0111,11,313684~o~r0114,12,313685~r~r0116,13,313686~t~r0104,14,313687~h~r013682,10,327188,42,55814,627187~'
-script += '\n~r013688,11,327189~- ~r0115,10,313689,45,51528,613688~s~r0111,11,313690~o~r0117,12,313691~u~r0116,13,313692~'
-script += 't~r0104,14,313693~h~r013688,11,327189,42,55814,627187~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~n~r025976,4110,51~o~r025977,4111,52~'
-script += 'r~r025978,4114,53~t~r025979,4116,54~h~r025980,4104,55~\n~r032,20,35,4101,50~~moutput~\n\n~r02538,10~'
-script += '~v27322538~== ~r084,313695,413,51528,613694~T~r0114,11,313696~r~r0111,12,313697~o~r0112,13,313698~p~r0105,14,313699~'
-script += 'i~r099,15,313700~c~r097,16,313701~a~r0108,17,313702~l~r032,18,313703~ ~r067,19,313704~C~r097,110,313705~'
-script += 'a~r0118,111,313706~v~r0101,112,313707~e~r013694,10,35,4101,50,60~ ==\n~r089,313709,4220,51528,613708~'
-script += 'Y~r0111,11,313710~o~r0117,12,313711~u~r032,13,313712~ ~r0115,14,313713~s~r0116,15,313714~t~r097,16,313715~'
-script += 'a~r0110,17,313716~n~r0100,18,313717~d~r032,19,313718~ ~r097,110,313719~a~r0116,111,313720~t~r032,112,313721~'
-script += ' ~r0116,113,313722~t~r0104,114,313723~h~r0101,115,313724~e~r032,116,313725~ ~r0101,117,313726~e~r0110,118,313727~'
-script += 'n~r0116,119,313728~t~r0114,120,313729~r~r097,121,313730~a~r0110,122,313731~n~r099,123,313732~c~r0101,124,313733~'
-script += 'e~r032,125,313734~ ~r0116,126,313735~t~r0111,127,313736~o~r032,128,313737~ ~r097,129,313738~a~r032,130,313739~'
-script += ' ~r0110,131,313740~n~r097,132,313741~a~r0116,133,313742~t~r0117,134,313743~u~r0114,135,313744~r~r097,136,313745~'
-script += 'a~r0108,137,313746~l~r032,138,313747~ ~r099,139,313748~c~r097,140,313749~a~r0118,141,313750~v~r0101,142,313751~'
-script += 'e~r032,143,313752~ ~r0119,144,313753~w~r0104,145,313754~h~r0105,146,313755~i~r099,147,313756~c~r0104,148,313757~'
-script += 'h~r032,149,313758~ ~r0108,150,313759~l~r0111,151,313760~o~r152,313761~o~r0107,153,313762~k~r0115,154,313763~'
-script += 's~r032,155,313764~ ~r0108,156,313765~l~r0105,157,313766~i~r0107,158,313767~k~r0101,159,313768~e~r032,160,313769~'
-script += ' ~r0105,161,313770~i~r0116,162,313771~t~r032,163,313772~ ~r0104,164,313773~h~r097,165,313774~a~r0115,166,313775~'
-script += 's~r0110,167,313776~n~r039,168,313777~\'~r0116,169,313778~t~r032,170,313779~ ~r098,171,313780~b~r0101,172,313781~'
-script += 'e~r173,313782~e~r0110,174,313783~n~r032,175,313784~ ~r0118,176,313785~v~r0105,177,313786~i~r0115,178,313787~'
-script += 's~r0105,179,313788~i~r0116,180,313789~t~r0101,181,313790~e~r0100,182,313791~d~r032,183,313792~ ~r0105,184,313793~'
-script += 'i~r0110,185,313794~n~r032,186,313795~ ~r0113,187,313796~q~r0117,188,313797~u~r0105,189,313798~i~r0116,190,313799~'
-script += 't~r0101,191,313800~e~r032,192,313801~ ~r0115,193,313802~s~r0111,194,313803~o~r0109,195,313804~m~r0101,196,313805~'
-script += 'e~r032,197,313806~ ~r0116,198,313807~t~r0105,199,313808~i~r0109,1100,313809~m~r0101,1101,313810~e~r046,1102,313811~'
-script += '.~r032,1103,313812~ ~r1104,313813~ ~r076,1105,313814~L~r0105,1106,313815~i~r0103,1107,313816~g~r0104,1108,313817~'
-script += 'h~r0116,1109,313818~t~r032,1110,313819~ ~r0112,1111,313820~p~r0111,1112,313821~o~r0117,1113,313822~u'
-script += '~r0114,1114,313823~r~r0115,1115,313824~s~r032,1116,313825~ ~r0105,1117,313826~i~r0110,1118,313827~n~r032,1119,313828~'
-script += ' ~r0116,1120,313829~t~r0104,1121,313830~h~r0114,1122,313831~r~r0111,1123,313832~o~r0117,1124,313833~'
-script += 'u~r0103,1125,313834~g~r0104,1126,313835~h~r032,1127,313836~ ~r0116,1128,313837~t~r0104,1129,313838~h'
-script += '~r0101,1130,313839~e~r032,1131,313840~ ~r0111,1132,313841~o~r0112,1133,313842~p~r0101,1134,313843~e~r0110,1135,313844~'
-script += 'n~r0105,1136,313845~i~r0110,1137,313846~n~r0103,1138,313847~g~r032,1139,313848~ ~r0116,1140,313849~t'
-script += '~r0111,1141,313850~o~r032,1142,313851~ ~r0116,1143,313852~t~r0104,1144,313853~h~r0101,1145,313854~e~r032,1146,313855~'
-script += ' ~r0115,1147,313856~s~r0111,1148,313857~o~r0117,1149,313858~u~r0116,1150,313859~t~r0104,1151,313860~'
-script += 'h~r044,1152,313861~,~r032,1153,313862~ ~r0119,1154,313863~w~r0104,1155,313864~h~r0105,1156,313865~i~r0108,1157,313866~'
-script += 'l~r0101,1158,313867~e~r032,1159,313868~ ~r0102,1160,313869~f~r0105,1161,313870~i~r0114,1162,313871~r'
-script += '~r0101,1163,313872~e~r0102,1164,313873~f~r0108,1165,313874~l~r0105,1166,313875~i~r0101,1167,313876~e'
-script += '~r0115,1168,313877~s~r032,1169,313878~ ~r0108,1170,313879~l~r0105,1171,313880~i~r0103,1172,313881~g~r0104,1173,313882~'
-script += 'h~r0116,1174,313883~t~r032,1175,313884~ ~r0116,1176,313885~t~r0104,1177,313886~h~r0101,1178,313887~e'
-script += '~r032,1179,313888~ ~r0112,1180,313889~p~r097,1181,313890~a~r0116,1182,313891~t~r0104,1183,313892~h~r032,1184,313893~'
-script += ' ~r0102,1185,313894~f~r0117,1186,313895~u~r0114,1187,313896~r~r0116,1188,313897~t~r0104,1189,313898~'
-script += 'h~r0101,1190,313899~e~r0114,1191,313900~r~r032,1192,313901~ ~r0105,1193,313902~i~r0110,1194,313903~n'
-script += '~r0116,1195,313904~t~r0111,1196,313905~o~r032,1197,313906~ ~r0116,1198,313907~t~r0104,1199,313908~h~r0101,1200,313909~'
-script += 'e~r032,1201,313910~ ~r099,1202,313911~c~r097,1203,313912~a~r0118,1204,313913~v~r0101,1205,313914~e~r032,1206,313915~'
-script += ' ~r0116,1207,313916~t~r0111,1208,313917~o~r032,1209,313918~ ~r0116,1210,313919~t~r0104,1211,313920~h'
-script += '~r0101,1212,313921~e~r032,1213,313922~ ~r0110,1214,313923~n~r0111,1215,313924~o~r0114,1216,313925~r~r0116,1217,313926~'
-script += 't~r0104,1218,313927~h~r046,1219,313928~.~r013708,10,35,4101,50,60~\n~r02~\nThere are ~r050,110,210,332766,450,51~'
-script += '2~r02,10,20,35,4101,50~ exits:\n~r013929,327194,42,55814,627193~- ~r0110,313930,45,51528,613929~n~r0111,11,313931~'
-script += 'o~r0114,12,313932~r~r0116,13,313933~t~r0104,14,313934~h~r013929,10,327194,42,55814,627193~\n~r013935,11,327195~'
-script += '- ~r0115,10,313936,45,51528,613935~s~r0111,11,313937~o~r0117,12,313938~u~r0116,13,313939~t~r0104,14,313940~'
-script += 'h~r013935,11,327195,42,55814,627193~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~n~r025976,4110,51~o~r025977,4111,52~r~r025978,4114,53~'
-script += 't~r025979,4116,54~h~r025980,4104,55~\n~r032,20,35,4101,50~~moutput~\n\n~r02543,10~~v27322543~== ~r084,313942,413,51528,613941~'
-script += 'T~r0114,11,313943~r~r0111,12,313944~o~r0112,13,313945~p~r0105,14,313946~i~r099,15,313947~c~r097,16,313948~'
-script += 'a~r0108,17,313949~l~r032,18,313950~ ~r067,19,313951~C~r097,110,313952~a~r0118,111,313953~v~r0101,112,313954~'
-script += 'e~r013941,10,35,4101,50,60~ ==\n~r070,313956,4122,51528,613955~F~r0105,11,313957~i~r0114,12,313958~r'
-script += '~r0101,13,313959~e~r0102,14,313960~f~r0108,15,313961~l~r0105,16,313962~i~r0101,17,313963~e~r0115,18,313964~'
-script += 's~r032,19,313965~ ~r0115,110,313966~s~r0108,111,313967~l~r0111,112,313968~o~r0119,113,313969~w~r0108,114,313970~'
-script += 'l~r0121,115,313971~y~r032,116,313972~ ~r0100,117,313973~d~r0114,118,313974~r~r0105,119,313975~i~r0102,120,313976~'
-script += 'f~r0116,121,313977~t~r032,122,313978~ ~r097,123,313979~a~r0114,124,313980~r~r0111,125,313981~o~r0117,126,313982~'
-script += 'u~r0110,127,313983~n~r0100,128,313984~d~r032,129,313985~ ~r0121,130,313986~y~r0111,131,313987~o~r0117,132,313988~'
-script += 'u~r032,133,313989~ ~r097,134,313990~a~r0110,135,313991~n~r0100,136,313992~d~r032,137,313993~ ~r0108,138,313994~'
-script += 'l~r0105,139,313995~i~r0103,140,313996~g~r0104,141,313997~h~r0116,142,313998~t~r032,143,313999~ ~r0116,144,314000~'
-script += 't~r0104,145,314001~h~r0101,146,314002~e~r032,147,314003~ ~r0116,148,314004~t~r0117,149,314005~u~r0110,150,314006~'
-script += 'n~r151,314007~n~r0101,152,314008~e~r0108,153,314009~l~r044,154,314010~,~r032,155,314011~ ~r0119,156,314012~'
-script += 'w~r0104,157,314013~h~r0105,158,314014~i~r099,159,314015~c~r0104,160,314016~h~r032,161,314017~ ~r0115,162,314018~'
-script += 's~r0101,163,314019~e~r164,314020~e~r0109,165,314021~m~r0115,166,314022~s~r032,167,314023~ ~r0116,168,314024~'
-script += 't~r0111,169,314025~o~r032,170,314026~ ~r0103,171,314027~g~r0101,172,314028~e~r0116,173,314029~t~r032,174,314030~'
-script += ' ~r098,175,314031~b~r0114,176,314032~r~r0105,177,314033~i~r0103,178,314034~g~r0104,179,314035~h~r0116,180,314036~'
-script += 't~r0101,181,314037~e~r0114,182,314038~r~r032,183,314039~ ~r0116,184,314040~t~r0111,185,314041~o~r032,186,314042~'
-script += ' ~r0116,187,314043~t~r0104,188,314044~h~r0101,189,314045~e~r032,190,314046~ ~r0115,191,314047~s~r0111,192,314048~'
-script += 'o~r0117,193,314049~u~r0116,194,314050~t~r0104,195,314051~h~r044,196,314052~,~r032,197,314053~ ~r098,198,314054~'
-script += 'b~r0117,199,314055~u~r0116,1100,314056~t~r032,1101,314057~ ~r0100,1102,314058~d~r0105,1103,314059~i~r0109,1104,314060~'
-script += 'm~r1105,314061~m~r0101,1106,314062~e~r0114,1107,314063~r~r032,1108,314064~ ~r0116,1109,314065~t~r0111,1110,314066~'
-script += 'o~r032,1111,314067~ ~r0116,1112,314068~t~r0104,1113,314069~h~r0101,1114,314070~e~r032,1115,314071~ ~r0110,1116,314072~'
-script += 'n~r0111,1117,314073~o~r0114,1118,314074~r~r0116,1119,314075~t~r0104,1120,314076~h~r046,1121,314077~.'
-script += '~r013955,10,35,4101,50,60~\n~r02~\nThere are ~r050,110,210,332766,450,51~2~r02,10,20,35,4101,50~ exi'
-script += 'ts:\n~r014078,327200,42,55814,627199~- ~r0110,314079,45,51528,614078~n~r0111,11,314080~o~r0114,12,314081~'
-script += 'r~r0116,13,314082~t~r0104,14,314083~h~r014078,10,327200,42,55814,627199~\n~r014084,11,327201~- ~r0115,10,314085,45,51528,614084~'
-script += 's~r0111,11,314086~o~r0117,12,314087~u~r0116,13,314088~t~r0104,14,314089~h~r014084,11,327201,42,55814,627199~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~n~r025976,4110,51~o~r025977,4111,52~r~r025978,4114,53~t~r025979,4116,54~h~r025980,4104,55~\n'
-script += '~r032,20,35,4101,50~~moutput~\n\n~r02548,10~~v27322548~== ~r084,314091,413,51528,614090~T~r0114,11,314092~'
-script += 'r~r0111,12,314093~o~r0112,13,314094~p~r0105,14,314095~i~r099,15,314096~c~r097,16,314097~a~r0108,17,314098~'
-script += 'l~r032,18,314099~ ~r067,19,314100~C~r097,110,314101~a~r0118,111,314102~v~r0101,112,314103~e~r014090,10,35,4101,50,60~'
-script += ' ==\n~r084,314105,4322,51528,614104~T~r0104,11,314106~h~r0101,12,314107~e~r032,13,314108~ ~r099,14,314109~'
-script += 'c~r097,15,314110~a~r0118,16,314111~v~r0101,17,314112~e~r032,18,314113~ ~r0105,19,314114~i~r0115,110,314115~'
-script += 's~r032,111,314116~ ~r097,112,314117~a~r032,113,314118~ ~r0108,114,314119~l~r0105,115,314120~i~r0116,116,314121~'
-script += 't~r117,314122~t~r0108,118,314123~l~r0101,119,314124~e~r032,120,314125~ ~r0119,121,314126~w~r0105,122,314127~'
-script += 'i~r0100,123,314128~d~r0101,124,314129~e~r0114,125,314130~r~r032,126,314131~ ~r0104,127,314132~h~r0101,128,314133~'
-script += 'e~r0114,129,314134~r~r0101,130,314135~e~r046,131,314136~.~r032,132,314137~ ~r133,314138~ ~r089,134,314139~'
-script += 'Y~r0111,135,314140~o~r0117,136,314141~u~r032,137,314142~ ~r0102,138,314143~f~r0105,139,314144~i~r0110,140,314145~'
-script += 'n~r0100,141,314146~d~r032,142,314147~ ~r0116,143,314148~t~r0104,144,314149~h~r0101,145,314150~e~r032,146,314151~'
-script += ' ~r099,147,314152~c~r0111,148,314153~o~r098,149,314154~b~r0119,150,314155~w~r0101,151,314156~e~r098,152,314157~'
-script += 'b~r045,153,314158~-~r0101,154,314159~e~r0110,155,314160~n~r099,156,314161~c~r0114,157,314162~r~r0117,158,314163~'
-script += 'u~r0115,159,314164~s~r0116,160,314165~t~r0101,161,314166~e~r0100,162,314167~d~r032,163,314168~ ~r0114,164,314169~'
-script += 'r~r0101,165,314170~e~r0109,166,314171~m~r097,167,314172~a~r0105,168,314173~i~r0110,169,314174~n~r0115,170,314175~'
-script += 's~r032,171,314176~ ~r0111,172,314177~o~r0102,173,314178~f~r032,174,314179~ ~r097,175,314180~a~r032,176,314181~'
-script += ' ~r0115,177,314182~s~r0109,178,314183~m~r097,179,314184~a~r0108,180,314185~l~r181,314186~l~r032,182,314187~'
-script += ' ~r099,183,314188~c~r097,184,314189~a~r0109,185,314190~m~r0112,186,314191~p~r044,187,314192~,~r032,188,314193~'
-script += ' ~r097,189,314194~a~r0110,190,314195~n~r0100,191,314196~d~r032,192,314197~ ~r097,193,314198~a~r0108,194,314199~'
-script += 'l~r0116,195,314200~t~r0104,196,314201~h~r0111,197,314202~o~r0117,198,314203~u~r0103,199,314204~g~r0104,1100,314205~'
-script += 'h~r032,1101,314206~ ~r0121,1102,314207~y~r0111,1103,314208~o~r0117,1104,314209~u~r032,1105,314210~ ~r0100,1106,314211~'
-script += 'd~r0111,1107,314212~o~r0110,1108,314213~n~r039,1109,314214~\'~r0116,1110,314215~t~r032,1111,314216~ '
-script += '~r0115,1112,314217~s~r0117,1113,314218~u~r0115,1114,314219~s~r0112,1115,314220~p~r0101,1116,314221~e'
-script += '~r099,1117,314222~c~r0116,1118,314223~t~r032,1119,314224~ ~r0116,1120,314225~t~r0104,1121,314226~h~r0101,1122,314227~'
-script += 'e~r032,1123,314228~ ~r098,1124,314229~b~r0114,1125,314230~r~r0111,1126,314231~o~r0107,1127,314232~k~r0101,1128,314233~'
-script += 'e~r0110,1129,314234~n~r032,1130,314235~ ~r0112,1131,314236~p~r0105,1132,314237~i~r0101,1133,314238~e'
-script += '~r099,1134,314239~c~r0101,1135,314240~e~r0115,1136,314241~s~r032,1137,314242~ ~r0111,1138,314243~o~r0102,1139,314244~'
-script += 'f~r032,1140,314245~ ~r0116,1141,314246~t~r097,1142,314247~a~r098,1143,314248~b~r0108,1144,314249~l~r0101,1145,314250~'
-script += 'e~r0115,1146,314251~s~r032,1147,314252~ ~r097,1148,314253~a~r0110,1149,314254~n~r0100,1150,314255~d~r032,1151,314256~'
-script += ' ~r099,1152,314257~c~r0104,1153,314258~h~r097,1154,314259~a~r0105,1155,314260~i~r0114,1156,314261~r~r0115,1157,314262~'
-script += 's~r032,1158,314263~ ~r0119,1159,314264~w~r0105,1160,314265~i~r0108,1161,314266~l~r1162,314267~l~r032,1163,314268~'
-script += ' ~r0112,1164,314269~p~r0114,1165,314270~r~r0111,1166,314271~o~r0118,1167,314272~v~r0101,1168,314273~'
-script += 'e~r032,1169,314274~ ~r0117,1170,314275~u~r0115,1171,314276~s~r0101,1172,314277~e~r0102,1173,314278~f'
-script += '~r0117,1174,314279~u~r0108,1175,314280~l~r032,1176,314281~ ~r0116,1177,314282~t~r0111,1178,314283~o~r032,1179,314284~'
-script += ' ~r0121,1180,314285~y~r0111,1181,314286~o~r0117,1182,314287~u~r0114,1183,314288~r~r032,1184,314289~ '
-script += '~r0113,1185,314290~q~r0117,1186,314291~u~r0101,1187,314292~e~r0115,1188,314293~s~r0116,1189,314294~t'
-script += '~r044,1190,314295~,~r032,1191,314296~ ~r0116,1192,314297~t~r0104,1193,314298~h~r0101,1194,314299~e~r032,1195,314300~'
-script += ' ~r0102,1196,314301~f~r0105,1197,314302~i~r0114,1198,314303~r~r0101,1199,314304~e~r0102,1200,314305~'
-script += 'f~r0108,1201,314306~l~r0105,1202,314307~i~r0101,1203,314308~e~r0115,1204,314309~s~r032,1205,314310~ '
-script += '~r0115,1206,314311~s~r0101,1207,314312~e~r1208,314313~e~r0109,1209,314314~m~r032,1210,314315~ ~r0116,1211,314316~'
-script += 't~r0111,1212,314317~o~r032,1213,314318~ ~r0108,1214,314319~l~r0105,1215,314320~i~r0107,1216,314321~k'
-script += '~r0101,1217,314322~e~r032,1218,314323~ ~r0117,1219,314324~u~r0115,1220,314325~s~r0105,1221,314326~i~r0110,1222,314327~'
-script += 'n~r0103,1223,314328~g~r032,1224,314329~ ~r0116,1225,314330~t~r0104,1226,314331~h~r0101,1227,314332~e'
-script += '~r032,1228,314333~ ~r0100,1229,314334~d~r0101,1230,314335~e~r098,1231,314336~b~r0114,1232,314337~r~r0105,1233,314338~'
-script += 'i~r0115,1234,314339~s~r032,1235,314340~ ~r097,1236,314341~a~r0115,1237,314342~s~r032,1238,314343~ ~r097,1239,314344~'
-script += 'a~r032,1240,314345~ ~r0115,1241,314346~s~r0104,1242,314347~h~r0101,1243,314348~e~r0108,1244,314349~l'
-script += '~r0116,1245,314350~t~r0101,1246,314351~e~r0114,1247,314352~r~r046,1248,314353~.~r032,1249,314354~ ~r1250,314355~'
-script += ' ~r065,1251,314356~A~r032,1252,314357~ ~r0112,1253,314358~p~r097,1254,314359~a~r0115,1255,314360~s~r1256,314361~'
-script += 's~r097,1257,314362~a~r0103,1258,314363~g~r0101,1259,314364~e~r0119,1260,314365~w~r097,1261,314366~a~r0121,1262,314367~'
-script += 'y~r032,1263,314368~ ~r0108,1264,314369~l~r0101,1265,314370~e~r097,1266,314371~a~r0100,1267,314372~d~r0115,1268,314373~'
-script += 's~r032,1269,314374~ ~r0110,1270,314375~n~r0111,1271,314376~o~r0114,1272,314377~r~r0116,1273,314378~t'
-script += '~r0104,1274,314379~h~r032,1275,314380~ ~r097,1276,314381~a~r0110,1277,314382~n~r0100,1278,314383~d~r032,1279,314384~'
-script += ' ~r0115,1280,314385~s~r0111,1281,314386~o~r0117,1282,314387~u~r0116,1283,314388~t~r0104,1284,314389~'
-script += 'h~r044,1285,314390~,~r032,1286,314391~ ~r097,1287,314392~a~r0110,1288,314393~n~r0100,1289,314394~d~r032,1290,314395~'
-script += ' ~r0116,1291,314396~t~r0104,1292,314397~h~r0101,1293,314398~e~r0114,1294,314399~r~r0101,1295,314400~'
-script += 'e~r032,1296,314401~ ~r0105,1297,314402~i~r0115,1298,314403~s~r032,1299,314404~ ~r097,1300,314405~a~r0110,1301,314406~'
-script += 'n~r032,1302,314407~ ~r097,1303,314408~a~r0108,1304,314409~l~r099,1305,314410~c~r0111,1306,314411~o~r0118,1307,314412~'
-script += 'v~r0101,1308,314413~e~r032,1309,314414~ ~r0116,1310,314415~t~r0111,1311,314416~o~r032,1312,314417~ ~r0116,1313,314418~'
-script += 't~r0104,1314,314419~h~r0101,1315,314420~e~r032,1316,314421~ ~r0101,1317,314422~e~r097,1318,314423~a~r0115,1319,314424~'
-script += 's~r0116,1320,314425~t~r046,1321,314426~.~r014104,10,35,4101,50,60~\n~r03~\nThere are ~r051,110,210,332765,451,51~'
-script += '3~r03,10,20,35,4101,50~ exits:\n~r014427,327206,43,55814,627205~- ~r0110,314428,45,51528,614427~n~r0111,11,314429~'
-script += 'o~r0114,12,314430~r~r0116,13,314431~t~r0104,14,314432~h~r014427,10,327206,43,55814,627205~\n~r014433,11,327207~'
-script += '- ~r0115,10,314434,45,51528,614433~s~r0111,11,314435~o~r0117,12,314436~u~r0116,13,314437~t~r0104,14,314438~'
-script += 'h~r014433,11,327207,43,55814,627205~\n~r014439,12,327208~- ~r0101,10,314440,44,51528,614439~e~r097,11,314441~'
-script += 'a~r0115,12,314442~s~r0116,13,314443~t~r014439,12,327208,43,55814,627205~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~e~r025976,51~a~r025977,497,52~'
-script += 's~r025978,4115,53~t~r025979,4116,54~\n~r032,20,35,4101,50~~moutput~\n\n~r02553,10,34~~v27322553~== ~r084,314445,420,51528,614444~'
-script += 'T~r0114,11,314446~r~r0111,12,314447~o~r0112,13,314448~p~r0105,14,314449~i~r099,15,314450~c~r097,16,314451~'
-script += 'a~r0108,17,314452~l~r032,18,314453~ ~r067,19,314454~C~r097,110,314455~a~r0118,111,314456~v~r0101,112,314457~'
-script += 'e~r032,113,314458~ ~r065,114,314459~A~r0108,115,314460~l~r099,116,314461~c~r0111,117,314462~o~r0118,118,314463~'
-script += 'v~r0101,119,314464~e~r014444,10,34,4101,50,60~ ==\n~r065,314466,4163,51528,614465~A~r0116,11,314467~'
-script += 't~r032,12,314468~ ~r0116,13,314469~t~r0104,14,314470~h~r0101,15,314471~e~r032,16,314472~ ~r098,17,314473~'
-script += 'b~r097,18,314474~a~r099,19,314475~c~r0107,110,314476~k~r032,111,314477~ ~r0111,112,314478~o~r0102,113,314479~'
-script += 'f~r032,114,314480~ ~r0116,115,314481~t~r0104,116,314482~h~r0105,117,314483~i~r0115,118,314484~s~r032,119,314485~'
-script += ' ~r097,120,314486~a~r0108,121,314487~l~r099,122,314488~c~r0111,123,314489~o~r0118,124,314490~v~r0101,125,314491~'
-script += 'e~r044,126,314492~,~r032,127,314493~ ~r0116,128,314494~t~r0104,129,314495~h~r0101,130,314496~e~r0114,131,314497~'
-script += 'r~r0101,132,314498~e~r032,133,314499~ ~r0105,134,314500~i~r0115,135,314501~s~r032,136,314502~ ~r097,137,314503~'
-script += 'a~r032,138,314504~ ~r0115,139,314505~s~r0109,140,314506~m~r097,141,314507~a~r0108,142,314508~l~r143,314509~'
-script += 'l~r032,144,314510~ ~r0116,145,314511~t~r097,146,314512~a~r098,147,314513~b~r0108,148,314514~l~r0101,149,314515~'
-script += 'e~r044,150,314516~,~r032,151,314517~ ~r097,152,314518~a~r032,153,314519~ ~r099,154,314520~c~r0104,155,314521~'
-script += 'h~r097,156,314522~a~r0105,157,314523~i~r0114,158,314524~r~r044,159,314525~,~r032,160,314526~ ~r097,161,314527~'
-script += 'a~r0110,162,314528~n~r0100,163,314529~d~r032,164,314530~ ~r097,165,314531~a~r032,166,314532~ ~r098,167,314533~'
-script += 'b~r0114,168,314534~r~r0111,169,314535~o~r0107,170,314536~k~r0101,171,314537~e~r0110,172,314538~n~r032,173,314539~'
-script += ' ~r0108,174,314540~l~r097,175,314541~a~r0110,176,314542~n~r0116,177,314543~t~r0101,178,314544~e~r0114,179,314545~'
-script += 'r~r0110,180,314546~n~r046,181,314547~.~r032,182,314548~ ~r183,314549~ ~r073,184,314550~I~r0116,185,314551~'
-script += 't~r032,186,314552~ ~r0108,187,314553~l~r0111,188,314554~o~r189,314555~o~r0107,190,314556~k~r0115,191,314557~'
-script += 's~r032,192,314558~ ~r0108,193,314559~l~r0105,194,314560~i~r0107,195,314561~k~r0101,196,314562~e~r032,197,314563~'
-script += ' ~r0116,198,314564~t~r0104,199,314565~h~r0105,1100,314566~i~r0115,1101,314567~s~r032,1102,314568~ ~r0115,1103,314569~'
-script += 's~r0112,1104,314570~p~r097,1105,314571~a~r099,1106,314572~c~r0101,1107,314573~e~r032,1108,314574~ ~r0119,1109,314575~'
-script += 'w~r097,1110,314576~a~r0115,1111,314577~s~r032,1112,314578~ ~r0117,1113,314579~u~r0115,1114,314580~s~r0101,1115,314581~'
-script += 'e~r0100,1116,314582~d~r032,1117,314583~ ~r0109,1118,314584~m~r0117,1119,314585~u~r099,1120,314586~c~r0104,1121,314587~'
-script += 'h~r032,1122,314588~ ~r0109,1123,314589~m~r0111,1124,314590~o~r0114,1125,314591~r~r0101,1126,314592~e'
-script += '~r032,1127,314593~ ~r0114,1128,314594~r~r0101,1129,314595~e~r099,1130,314596~c~r0101,1131,314597~e~r0110,1132,314598~'
-script += 'n~r0116,1133,314599~t~r0108,1134,314600~l~r0121,1135,314601~y~r032,1136,314602~ ~r0116,1137,314603~t'
-script += '~r0104,1138,314604~h~r097,1139,314605~a~r0110,1140,314606~n~r032,1141,314607~ ~r0116,1142,314608~t~r0104,1143,314609~'
-script += 'h~r0101,1144,314610~e~r032,1145,314611~ ~r099,1146,314612~c~r097,1147,314613~a~r0109,1148,314614~m~r0112,1149,314615~'
-script += 'p~r032,1150,314616~ ~r0116,1151,314617~t~r0111,1152,314618~o~r032,1153,314619~ ~r0116,1154,314620~t~r0104,1155,314621~'
-script += 'h~r0101,1156,314622~e~r032,1157,314623~ ~r0119,1158,314624~w~r0101,1159,314625~e~r0115,1160,314626~s'
-script += '~r0116,1161,314627~t~r046,1162,314628~.~r014465,10,34,4101,50,60~\n~r010,19212,29212,327456,426,51531,627455~'
-script += '\n~r084,327457~T~r0104,327458~h~r0105,327459~i~r0110,327460~n~r0103,327461~g~r0115,327462~s~r032,327463~'
-script += ' ~r0111,327464~o~r0102,327465~f~r032,327466~ ~r0105,327467~i~r0110,327468~n~r0116,327469~t~r0101,327470~'
-script += 'e~r0114,327471~r~r0101,327472~e~r0115,327473~s~r0116,327474~t~r032,327475~ ~r0104,327476~h~r0101,327477~'
-script += 'e~r0114,327478~r~r0101,327479~e~r058,327480~:~r010,327481~\n~r022093,113,22553,31,416,55893,627381~-'
-script += ' ~r0106,10,322094,47,51528,622093~j~r0111,11,322095~o~r0117,12,322096~u~r0114,13,322097~r~r0110,14,322098~'
-script += 'n~r097,15,322099~a~r0108,16,322100~l~r022093,113,31,416,55893,627381~\n~r01,10,21,34,4101,50,60~\nTh'
-script += 'ere is ~r049,110,210,332767,449,51~1~r01,10,21,34,4101,50~ exit:\n~r014629,327214,41,55814,627213~- '
-script += '~r0119,314630,44,51528,614629~w~r0101,11,314631~e~r0115,12,314632~s~r0116,13,314633~t~r014629,10,327214,41,55814,627213~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~t~r025976,4116,51~a~r025977,497,52~k~r025978,4107,53~e~r025979,4101,54~ ~r025980,432,55~j~r025981,4106,56~'
-script += 'o~r025982,4111,57~u~r025983,4117,58~r~r025984,4114,59~n~r025985,4110,510~a~r025986,497,511~l~r025987,4108,512~'
-script += '\n~r032,20,34,4101,50~~moutput~\n\n~r084,114065,214065,328055,47,51531,628054~~v27300~T~r097,328056~'
-script += 'a~r0107,328057~k~r0101,328058~e~r0110,328059~n~r046,328060~.~r010,328061~\n~r132613,232613,327415,417,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~l~r025976,4108,51~o~r025977,4111,52~'
-script += 'o~r025978,53~k~r025979,4107,54~ ~r025980,432,55~j~r025981,4106,56~o~r025982,4111,57~u~r025983,4117,58~'
-script += 'r~r025984,4114,59~n~r025985,4110,510~a~r025986,497,511~l~r025987,4108,512~\n~r032,24,37,4101,50~~moutput~'
-script += '\n\n~r070,10,322102,43764,51528,622101~F~r0105,11,322103~i~r0114,12,322104~r~r0101,13,322105~e~r0102,14,322106~'
-script += 'f~r0108,15,322107~l~r0105,16,322108~i~r0101,17,322109~e~r0115,18,322110~s~r032,19,322111~ ~r0119,110,322112~'
-script += 'w~r0101,111,322113~e~r0114,112,322114~r~r0101,113,322115~e~r032,114,322116~ ~r0117,115,322117~u~r0115,116,322118~'
-script += 's~r0105,117,322119~i~r0110,118,322120~n~r0103,119,322121~g~r032,120,322122~ ~r0116,121,322123~t~r0104,122,322124~'
-script += 'h~r0105,123,322125~i~r0115,124,322126~s~r032,125,322127~ ~r0100,126,322128~d~r0117,127,322129~u~r0115,128,322130~'
-script += 's~r0116,129,322131~t~r0121,130,322132~y~r032,131,322133~ ~r0111,132,322134~o~r0108,133,322135~l~r0100,134,322136~'
-script += 'd~r032,135,322137~ ~r0106,136,322138~j~r0111,137,322139~o~r0117,138,322140~u~r0114,139,322141~r~r0110,140,322142~'
-script += 'n~r097,141,322143~a~r0108,142,322144~l~r032,143,322145~ ~r097,144,322146~a~r0115,145,322147~s~r032,146,322148~'
-script += ' ~r097,147,322149~a~r032,148,322150~ ~r0114,149,322151~r~r0101,150,322152~e~r0115,151,322153~s~r0116,152,322154~'
-script += 't~r0105,153,322155~i~r0110,154,322156~n~r0103,155,322157~g~r032,156,322158~ ~r0115,157,322159~s~r0112,158,322160~'
-script += 'p~r0111,159,322161~o~r0116,160,322162~t~r032,161,322163~ ~r0117,162,322164~u~r0110,163,322165~n~r0116,164,322166~'
-script += 't~r0105,165,322167~i~r0108,166,322168~l~r032,167,322169~ ~r0121,168,322170~y~r0111,169,322171~o~r0117,170,322172~'
-script += 'u~r032,171,322173~ ~r0115,172,322174~s~r099,173,322175~c~r097,174,322176~a~r0114,175,322177~r~r0101,176,322178~'
-script += 'e~r0100,177,322179~d~r032,178,322180~ ~r0116,179,322181~t~r0104,180,322182~h~r0101,181,322183~e~r0109,182,322184~'
-script += 'm~r032,183,322185~ ~r0111,184,322186~o~r0102,185,322187~f~r186,322188~f~r046,187,322189~.~r032,188,322190~'
-script += ' ~r189,322191~ ~r073,190,322192~I~r0116,191,322193~t~r032,192,322194~ ~r0114,193,322195~r~r0101,194,322196~'
-script += 'e~r097,195,322197~a~r0100,196,322198~d~r0115,197,322199~s~r058,198,322200~:~r010,199,322201~\n~r1100,322202~'
-script += '\n~r068,1101,322203~D~r097,1102,322204~a~r0121,1103,322205~y~r032,1104,322206~ ~r049,1105,322207~1~r058,1106,322208~'
-script += ':~r032,1107,322209~ ~r087,1108,322210~W~r0101,1109,322211~e~r032,1110,322212~ ~r0104,1111,322213~h~r097,1112,322214~'
-script += 'a~r0118,1113,322215~v~r0101,1114,322216~e~r032,1115,322217~ ~r0114,1116,322218~r~r0101,1117,322219~e'
-script += '~r097,1118,322220~a~r099,1119,322221~c~r0104,1120,322222~h~r0101,1121,322223~e~r0100,1122,322224~d~r032,1123,322225~'
-script += ' ~r0119,1124,322226~w~r0104,1125,322227~h~r097,1126,322228~a~r0116,1127,322229~t~r032,1128,322230~ ~r0115,1129,322231~'
-script += 's~r0101,1130,322232~e~r1131,322233~e~r0109,1132,322234~m~r0115,1133,322235~s~r032,1134,322236~ ~r0116,1135,322237~'
-script += 't~r0111,1136,322238~o~r032,1137,322239~ ~r098,1138,322240~b~r0101,1139,322241~e~r032,1140,322242~ ~r0116,1141,322243~'
-script += 't~r0104,1142,322244~h~r0101,1143,322245~e~r032,1144,322246~ ~r0102,1145,322247~f~r0105,1146,322248~i'
-script += '~r0110,1147,322249~n~r097,1148,322250~a~r0108,1149,322251~l~r032,1150,322252~ ~r0105,1151,322253~i~r0110,1152,322254~'
-script += 'n~r032,1153,322255~ ~r097,1154,322256~a~r032,1155,322257~ ~r0115,1156,322258~s~r0101,1157,322259~e~r0114,1158,322260~'
-script += 'r~r0105,1159,322261~i~r0101,1160,322262~e~r0115,1161,322263~s~r032,1162,322264~ ~r0111,1163,322265~o'
-script += '~r0102,1164,322266~f~r032,1165,322267~ ~r0112,1166,322268~p~r0117,1167,322269~u~r0122,1168,322270~z~r1169,322271~'
-script += 'z~r0108,1170,322272~l~r0101,1171,322273~e~r0115,1172,322274~s~r032,1173,322275~ ~r0103,1174,322276~g'
-script += '~r0117,1175,322277~u~r097,1176,322278~a~r0114,1177,322279~r~r0100,1178,322280~d~r0105,1179,322281~i~r0110,1180,322282~'
-script += 'n~r0103,1181,322283~g~r032,1182,322284~ ~r097,1183,322285~a~r0110,1184,322286~n~r032,1185,322287~ ~r097,1186,322288~'
-script += 'a~r0110,1187,322289~n~r099,1188,322290~c~r0105,1189,322291~i~r0101,1190,322292~e~r0110,1191,322293~n'
-script += '~r0116,1192,322294~t~r032,1193,322295~ ~r0116,1194,322296~t~r0114,1195,322297~r~r0101,1196,322298~e~r097,1197,322299~'
-script += 'a~r0115,1198,322300~s~r0117,1199,322301~u~r0114,1200,322302~r~r0101,1201,322303~e~r046,1202,322304~.'
-script += '~r032,1203,322305~ ~r1204,322306~ ~r073,1205,322307~I~r032,1206,322308~ ~r0115,1207,322309~s~r0117,1208,322310~'
-script += 'u~r0115,1209,322311~s~r0112,1210,322312~p~r0101,1211,322313~e~r099,1212,322314~c~r0116,1213,322315~t'
-script += '~r032,1214,322316~ ~r0109,1215,322317~m~r0111,1216,322318~o~r0115,1217,322319~s~r0116,1218,322320~t~r032,1219,322321~'
-script += ' ~r097,1220,322322~a~r0100,1221,322323~d~r0118,1222,322324~v~r0101,1223,322325~e~r0110,1224,322326~n'
-script += '~r0116,1225,322327~t~r0117,1226,322328~u~r0114,1227,322329~r~r0101,1228,322330~e~r0114,1229,322331~r'
-script += '~r0115,1230,322332~s~r032,1231,322333~ ~r0103,1232,322334~g~r0105,1233,322335~i~r0118,1234,322336~v~r0101,1235,322337~'
-script += 'e~r032,1236,322338~ ~r0117,1237,322339~u~r0112,1238,322340~p~r032,1239,322341~ ~r0108,1240,322342~l~r0111,1241,322343~'
-script += 'o~r0110,1242,322344~n~r0103,1243,322345~g~r032,1244,322346~ ~r098,1245,322347~b~r0101,1246,322348~e~r0102,1247,322349~'
-script += 'f~r0111,1248,322350~o~r0114,1249,322351~r~r0101,1250,322352~e~r032,1251,322353~ ~r0116,1252,322354~t'
-script += '~r0104,1253,322355~h~r0105,1254,322356~i~r0115,1255,322357~s~r032,1256,322358~ ~r0112,1257,322359~p~r0111,1258,322360~'
-script += 'o~r0105,1259,322361~i~r0110,1260,322362~n~r0116,1261,322363~t~r044,1262,322364~,~r032,1263,322365~ ~r098,1264,322366~'
-script += 'b~r0117,1265,322367~u~r0116,1266,322368~t~r032,1267,322369~ ~r0119,1268,322370~w~r0101,1269,322371~e'
-script += '~r039,1270,322372~\'~r0114,1271,322373~r~r0101,1272,322374~e~r032,1273,322375~ ~r0115,1274,322376~s~r0111,1275,322377~'
-script += 'o~r032,1276,322378~ ~r099,1277,322379~c~r0108,1278,322380~l~r0111,1279,322381~o~r0115,1280,322382~s~r0101,1281,322383~'
-script += 'e~r033,1282,322384~!~r032,1283,322385~ ~r1284,322386~ ~r087,1285,322387~W~r0101,1286,322388~e~r032,1287,322389~'
-script += ' ~r0109,1288,322390~m~r0117,1289,322391~u~r0115,1290,322392~s~r0116,1291,322393~t~r032,1292,322394~ '
-script += '~r0112,1293,322395~p~r0114,1294,322396~r~r0101,1295,322397~e~r0115,1296,322398~s~r1297,322399~s~r032,1298,322400~'
-script += ' ~r0111,1299,322401~o~r0110,1300,322402~n~r033,1301,322403~!~r010,1302,322404~\n~r1303,322405~\n~r068,1304,322406~'
-script += 'D~r097,1305,322407~a~r0121,1306,322408~y~r032,1307,322409~ ~r049,1308,322410~1~r058,1309,322411~:~r032,1310,322412~'
-script += ' ~r080,1311,322413~P~r046,1312,322414~.~r083,1313,322415~S~r046,1314,322416~.~r058,1315,322417~:~r032,1316,322418~'
-script += ' ~r073,1317,322419~I~r0116,1318,322420~t~r039,1319,322421~\'~r0115,1320,322422~s~r032,1321,322423~ ~r097,1322,322424~'
-script += 'a~r032,1323,322425~ ~r0103,1324,322426~g~r0111,1325,322427~o~r1326,322428~o~r0100,1327,322429~d~r032,1328,322430~'
-script += ' ~r0116,1329,322431~t~r0104,1330,322432~h~r0105,1331,322433~i~r0110,1332,322434~n~r0103,1333,322435~'
-script += 'g~r032,1334,322436~ ~r0116,1335,322437~t~r0104,1336,322438~h~r0101,1337,322439~e~r032,1338,322440~ ~r0105,1339,322441~'
-script += 'i~r0115,1340,322442~s~r0108,1341,322443~l~r097,1342,322444~a~r0110,1343,322445~n~r0100,1344,322446~d'
-script += '~r032,1345,322447~ ~r0105,1346,322448~i~r0115,1347,322449~s~r032,1348,322450~ ~r0116,1349,322451~t~r0114,1350,322452~'
-script += 'r~r0111,1351,322453~o~r0112,1352,322454~p~r0105,1353,322455~i~r099,1354,322456~c~r097,1355,322457~a~r0108,1356,322458~'
-script += 'l~r046,1357,322459~.~r032,1358,322460~ ~r1359,322461~ ~r087,1360,322462~W~r0101,1361,322463~e~r032,1362,322464~'
-script += ' ~r0115,1363,322465~s~r0104,1364,322466~h~r0111,1365,322467~o~r0117,1366,322468~u~r0108,1367,322469~'
-script += 'l~r0100,1368,322470~d~r032,1369,322471~ ~r0104,1370,322472~h~r097,1371,322473~a~r0118,1372,322474~v~r0101,1373,322475~'
-script += 'e~r032,1374,322476~ ~r0102,1375,322477~f~r0111,1376,322478~o~r1377,322479~o~r0100,1378,322480~d~r032,1379,322481~'
-script += ' ~r0102,1380,322482~f~r0111,1381,322483~o~r0114,1382,322484~r~r032,1383,322485~ ~r0119,1384,322486~w'
-script += '~r0101,1385,322487~e~r1386,322488~e~r0107,1387,322489~k~r0115,1388,322490~s~r033,1389,322491~!~r010,1390,322492~'
-script += '\n~r1391,322493~\n~r068,1392,322494~D~r097,1393,322495~a~r0121,1394,322496~y~r032,1395,322497~ ~r050,1396,322498~'
-script += '2~r058,1397,322499~:~r032,1398,322500~ ~r084,1399,322501~T~r0104,1400,322502~h~r0101,1401,322503~e~r032,1402,322504~'
-script += ' ~r0118,1403,322505~v~r097,1404,322506~a~r0117,1405,322507~u~r0108,1406,322508~l~r0116,1407,322509~t'
-script += '~r032,1408,322510~ ~r097,1409,322511~a~r0112,1410,322512~p~r1411,322513~p~r0101,1412,322514~e~r097,1413,322515~'
-script += 'a~r0114,1414,322516~r~r0115,1415,322517~s~r032,1416,322518~ ~r0116,1417,322519~t~r0111,1418,322520~o'
-script += '~r032,1419,322521~ ~r098,1420,322522~b~r0101,1421,322523~e~r032,1422,322524~ ~r0115,1423,322525~s~r0101,1424,322526~'
-script += 'e~r097,1425,322527~a~r0108,1426,322528~l~r0101,1427,322529~e~r0100,1428,322530~d~r032,1429,322531~ ~r098,1430,322532~'
-script += 'b~r0121,1431,322533~y~r032,1432,322534~ ~r097,1433,322535~a~r032,1434,322536~ ~r0109,1435,322537~m~r0121,1436,322538~'
-script += 'y~r0115,1437,322539~s~r0116,1438,322540~t~r0101,1439,322541~e~r0114,1440,322542~r~r0105,1441,322543~'
-script += 'i~r0111,1442,322544~o~r0117,1443,322545~u~r0115,1444,322546~s~r032,1445,322547~ ~r0102,1446,322548~f'
-script += '~r0111,1447,322549~o~r0114,1448,322550~r~r099,1449,322551~c~r0101,1450,322552~e~r032,1451,322553~ ~r045,1452,322554~'
-script += '-~r032,1453,322555~ ~r0116,1454,322556~t~r0104,1455,322557~h~r0101,1456,322558~e~r032,1457,322559~ ~r0100,1458,322560~'
-script += 'd~r0111,1459,322561~o~r1460,322562~o~r0114,1461,322563~r~r032,1462,322564~ ~r0119,1463,322565~w~r0111,1464,322566~'
-script += 'o~r0110,1465,322567~n~r039,1466,322568~\'~r0116,1467,322569~t~r032,1468,322570~ ~r098,1469,322571~b~r0117,1470,322572~'
-script += 'u~r0100,1471,322573~d~r0103,1472,322574~g~r0101,1473,322575~e~r032,1474,322576~ ~r097,1475,322577~a~r0110,1476,322578~'
-script += 'n~r032,1477,322579~ ~r0105,1478,322580~i~r0110,1479,322581~n~r099,1480,322582~c~r0104,1481,322583~h~r046,1482,322584~'
-script += '.~r032,1483,322585~ ~r1484,322586~ ~r087,1485,322587~W~r0101,1486,322588~e~r032,1487,322589~ ~r0100,1488,322590~'
-script += 'd~r0111,1489,322591~o~r0110,1490,322592~n~r039,1491,322593~\'~r0116,1492,322594~t~r032,1493,322595~ '
-script += '~r0104,1494,322596~h~r097,1495,322597~a~r0118,1496,322598~v~r0101,1497,322599~e~r032,1498,322600~ ~r0116,1499,322601~'
-script += 't~r0104,1500,322602~h~r0101,1501,322603~e~r032,1502,322604~ ~r0114,1503,322605~r~r0101,1504,322606~e'
-script += '~r0115,1505,322607~s~r0111,1506,322608~o~r0117,1507,322609~u~r0114,1508,322610~r~r099,1509,322611~c~r0101,1510,322612~'
-script += 'e~r0115,1511,322613~s~r032,1512,322614~ ~r0116,1513,322615~t~r0111,1514,322616~o~r032,1515,322617~ ~r098,1516,322618~'
-script += 'b~r0108,1517,322619~l~r0111,1518,322620~o~r0119,1519,322621~w~r032,1520,322622~ ~r0105,1521,322623~i'
-script += '~r0116,1522,322624~t~r032,1523,322625~ ~r0111,1524,322626~o~r0112,1525,322627~p~r0101,1526,322628~e~r0110,1527,322629~'
-script += 'n~r044,1528,322630~,~r032,1529,322631~ ~r097,1530,322632~a~r0110,1531,322633~n~r0100,1532,322634~d~r032,1533,322635~'
-script += ' ~r073,1534,322636~I~r032,1535,322637~ ~r0119,1536,322638~w~r0111,1537,322639~o~r0117,1538,322640~u~r0108,1539,322641~'
-script += 'l~r0100,1540,322642~d~r0110,1541,322643~n~r039,1542,322644~\'~r0116,1543,322645~t~r032,1544,322646~ '
-script += '~r0114,1545,322647~r~r0105,1546,322648~i~r0115,1547,322649~s~r0107,1548,322650~k~r032,1549,322651~ ~r0100,1550,322652~'
-script += 'd~r097,1551,322653~a~r0109,1552,322654~m~r097,1553,322655~a~r0103,1554,322656~g~r0105,1555,322657~i~r0110,1556,322658~'
-script += 'n~r0103,1557,322659~g~r032,1558,322660~ ~r0116,1559,322661~t~r0104,1560,322662~h~r0101,1561,322663~e'
-script += '~r032,1562,322664~ ~r099,1563,322665~c~r0111,1564,322666~o~r0110,1565,322667~n~r0116,1566,322668~t~r0101,1567,322669~'
-script += 'e~r0110,1568,322670~n~r0116,1569,322671~t~r0115,1570,322672~s~r032,1571,322673~ ~r0101,1572,322674~e'
-script += '~r0118,1573,322675~v~r0101,1574,322676~e~r0110,1575,322677~n~r032,1576,322678~ ~r0105,1577,322679~i~r0102,1578,322680~'
-script += 'f~r032,1579,322681~ ~r0119,1580,322682~w~r0101,1581,322683~e~r032,1582,322684~ ~r0100,1583,322685~d~r0105,1584,322686~'
-script += 'i~r0100,1585,322687~d~r046,1586,322688~.~r032,1587,322689~ ~r1588,322690~ ~r087,1589,322691~W~r0101,1590,322692~'
-script += 'e~r039,1591,322693~\'~r0108,1592,322694~l~r1593,322695~l~r032,1594,322696~ ~r0104,1595,322697~h~r097,1596,322698~'
-script += 'a~r0118,1597,322699~v~r0101,1598,322700~e~r032,1599,322701~ ~r0116,1600,322702~t~r0111,1601,322703~o'
-script += '~r032,1602,322704~ ~r0102,1603,322705~f~r0105,1604,322706~i~r0103,1605,322707~g~r0117,1606,322708~u~r0114,1607,322709~'
-script += 'r~r0101,1608,322710~e~r032,1609,322711~ ~r0111,1610,322712~o~r0117,1611,322713~u~r0116,1612,322714~t'
-script += '~r032,1613,322715~ ~r0116,1614,322716~t~r0104,1615,322717~h~r0101,1616,322718~e~r032,1617,322719~ ~r0108,1618,322720~'
-script += 'l~r0111,1619,322721~o~r099,1620,322722~c~r0107,1621,322723~k~r032,1622,322724~ ~r0109,1623,322725~m~r0101,1624,322726~'
-script += 'e~r099,1625,322727~c~r0104,1626,322728~h~r097,1627,322729~a~r0110,1628,322730~n~r0105,1629,322731~i~r0115,1630,322732~'
-script += 's~r0109,1631,322733~m~r046,1632,322734~.~r010,1633,322735~\n~r1634,322736~\n~r068,1635,322737~D~r097,1636,322738~'
-script += 'a~r0121,1637,322739~y~r032,1638,322740~ ~r051,1639,322741~3~r058,1640,322742~:~r032,1641,322743~ ~r084,1642,322744~'
-script += 'T~r0104,1643,322745~h~r0101,1644,322746~e~r032,1645,322747~ ~r0100,1646,322748~d~r0111,1647,322749~o'
-script += '~r1648,322750~o~r0114,1649,322751~r~r032,1650,322752~ ~r0116,1651,322753~t~r0111,1652,322754~o~r032,1653,322755~'
-script += ' ~r0116,1654,322756~t~r0104,1655,322757~h~r0101,1656,322758~e~r032,1657,322759~ ~r0118,1658,322760~v'
-script += '~r097,1659,322761~a~r0117,1660,322762~u~r0108,1661,322763~l~r0116,1662,322764~t~r032,1663,322765~ ~r0104,1664,322766~'
-script += 'h~r097,1665,322767~a~r0115,1666,322768~s~r032,1667,322769~ ~r097,1668,322770~a~r032,1669,322771~ ~r0110,1670,322772~'
-script += 'n~r0117,1671,322773~u~r0109,1672,322774~m~r098,1673,322775~b~r0101,1674,322776~e~r0114,1675,322777~r'
-script += '~r032,1676,322778~ ~r099,1677,322779~c~r097,1678,322780~a~r0114,1679,322781~r~r0118,1680,322782~v~r0101,1681,322783~'
-script += 'e~r0100,1682,322784~d~r032,1683,322785~ ~r0105,1684,322786~i~r0110,1685,322787~n~r0116,1686,322788~t'
-script += '~r0111,1687,322789~o~r032,1688,322790~ ~r0105,1689,322791~i~r0116,1690,322792~t~r046,1691,322793~.~r032,1692,322794~'
-script += ' ~r1693,322795~ ~r069,1694,322796~E~r097,1695,322797~a~r099,1696,322798~c~r0104,1697,322799~h~r032,1698,322800~'
-script += ' ~r0114,1699,322801~r~r0111,1700,322802~o~r1701,322803~o~r0109,1702,322804~m~r032,1703,322805~ ~r0108,1704,322806~'
-script += 'l~r0101,1705,322807~e~r097,1706,322808~a~r0100,1707,322809~d~r0105,1708,322810~i~r0110,1709,322811~n'
-script += '~r0103,1710,322812~g~r032,1711,322813~ ~r0117,1712,322814~u~r0112,1713,322815~p~r032,1714,322816~ ~r0116,1715,322817~'
-script += 't~r0111,1716,322818~o~r032,1717,322819~ ~r0116,1718,322820~t~r0104,1719,322821~h~r0101,1720,322822~e'
-script += '~r032,1721,322823~ ~r0118,1722,322824~v~r097,1723,322825~a~r0117,1724,322826~u~r0108,1725,322827~l~r0116,1726,322828~'
-script += 't~r032,1727,322829~ ~r0104,1728,322830~h~r097,1729,322831~a~r0115,1730,322832~s~r032,1731,322833~ ~r0109,1732,322834~'
-script += 'm~r0111,1733,322835~o~r0114,1734,322836~r~r0101,1735,322837~e~r032,1736,322838~ ~r0110,1737,322839~n'
-script += '~r0117,1738,322840~u~r0109,1739,322841~m~r098,1740,322842~b~r0101,1741,322843~e~r0114,1742,322844~r~r0115,1743,322845~'
-script += 's~r032,1744,322846~ ~r0111,1745,322847~o~r0114,1746,322848~r~r032,1747,322849~ ~r0115,1748,322850~s~r0121,1749,322851~'
-script += 'y~r0109,1750,322852~m~r098,1751,322853~b~r0111,1752,322854~o~r0108,1753,322855~l~r0115,1754,322856~s'
-script += '~r032,1755,322857~ ~r0101,1756,322858~e~r0109,1757,322859~m~r098,1758,322860~b~r0101,1759,322861~e~r0100,1760,322862~'
-script += 'd~r1761,322863~d~r0101,1762,322864~e~r0100,1763,322865~d~r032,1764,322866~ ~r0105,1765,322867~i~r0110,1766,322868~'
-script += 'n~r032,1767,322869~ ~r0109,1768,322870~m~r0111,1769,322871~o~r0115,1770,322872~s~r097,1771,322873~a~r0105,1772,322874~'
-script += 'i~r099,1773,322875~c~r0115,1774,322876~s~r032,1775,322877~ ~r0105,1776,322878~i~r0110,1777,322879~n~r032,1778,322880~'
-script += ' ~r0116,1779,322881~t~r0104,1780,322882~h~r0101,1781,322883~e~r032,1782,322884~ ~r0102,1783,322885~f'
-script += '~r0108,1784,322886~l~r0111,1785,322887~o~r1786,322888~o~r0114,1787,322889~r~r0115,1788,322890~s~r046,1789,322891~'
-script += '.~r032,1790,322892~ ~r1791,322893~ ~r087,1792,322894~W~r0101,1793,322895~e~r032,1794,322896~ ~r0101,1795,322897~'
-script += 'e~r0118,1796,322898~v~r0101,1797,322899~e~r0110,1798,322900~n~r032,1799,322901~ ~r0102,1800,322902~f'
-script += '~r0111,1801,322903~o~r0117,1802,322904~u~r0110,1803,322905~n~r0100,1804,322906~d~r032,1805,322907~ ~r097,1806,322908~'
-script += 'a~r032,1807,322909~ ~r0115,1808,322910~s~r0116,1809,322911~t~r0114,1810,322912~r~r097,1811,322913~a~r0110,1812,322914~'
-script += 'n~r0103,1813,322915~g~r0101,1814,322916~e~r032,1815,322917~ ~r0103,1816,322918~g~r0108,1817,322919~l'
-script += '~r097,1818,322920~a~r0115,1819,322921~s~r1820,322922~s~r032,1821,322923~ ~r0111,1822,322924~o~r0114,1823,322925~'
-script += 'r~r098,1824,322926~b~r032,1825,322927~ ~r0105,1826,322928~i~r0110,1827,322929~n~r032,1828,322930~ ~r0116,1829,322931~'
-script += 't~r0104,1830,322932~h~r0101,1831,322933~e~r032,1832,322934~ ~r097,1833,322935~a~r0110,1834,322936~n~r0116,1835,322937~'
-script += 't~r0101,1836,322938~e~r099,1837,322939~c~r0104,1838,322940~h~r097,1839,322941~a~r0109,1840,322942~m~r098,1841,322943~'
-script += 'b~r0101,1842,322944~e~r0114,1843,322945~r~r032,1844,322946~ ~r0111,1845,322947~o~r0110,1846,322948~n'
-script += '~r032,1847,322949~ ~r097,1848,322950~a~r032,1849,322951~ ~r0112,1850,322952~p~r0101,1851,322953~e~r0100,1852,322954~'
-script += 'd~r0101,1853,322955~e~r0115,1854,322956~s~r0116,1855,322957~t~r097,1856,322958~a~r0108,1857,322959~l'
-script += '~r032,1858,322960~ ~r0105,1859,322961~i~r0116,1860,322962~t~r0115,1861,322963~s~r0101,1862,322964~e~r0108,1863,322965~'
-script += 'l~r0102,1864,322966~f~r032,1865,322967~ ~r0108,1866,322968~l~r097,1867,322969~a~r098,1868,322970~b~r0101,1869,322971~'
-script += 'e~r0108,1870,322972~l~r0101,1871,322973~e~r0100,1872,322974~d~r032,1873,322975~ ~r0119,1874,322976~w'
-script += '~r0105,1875,322977~i~r0116,1876,322978~t~r0104,1877,322979~h~r032,1878,322980~ ~r097,1879,322981~a~r032,1880,322982~'
-script += ' ~r0110,1881,322983~n~r0117,1882,322984~u~r0109,1883,322985~m~r098,1884,322986~b~r0101,1885,322987~e'
-script += '~r0114,1886,322988~r~r046,1887,322989~.~r032,1888,322990~ ~r1889,322991~ ~r087,1890,322992~W~r0104,1891,322993~'
-script += 'h~r097,1892,322994~a~r0116,1893,322995~t~r032,1894,322996~ ~r099,1895,322997~c~r0111,1896,322998~o~r0117,1897,322999~'
-script += 'u~r0108,1898,323000~l~r0100,1899,323001~d~r032,1900,323002~ ~r0116,1901,323003~t~r0104,1902,323004~h'
-script += '~r0101,1903,323005~e~r0121,1904,323006~y~r032,1905,323007~ ~r0109,1906,323008~m~r0101,1907,323009~e~r097,1908,323010~'
-script += 'a~r0110,1909,323011~n~r063,1910,323012~?~r010,1911,323013~\n~r1912,323014~\n~r068,1913,323015~D~r097,1914,323016~'
-script += 'a~r0121,1915,323017~y~r032,1916,323018~ ~r053,1917,323019~5~r058,1918,323020~:~r032,1919,323021~ ~r087,1920,323022~'
-script += 'W~r0101,1921,323023~e~r032,1922,323024~ ~r0102,1923,323025~f~r0105,1924,323026~i~r0110,1925,323027~n'
-script += '~r097,1926,323028~a~r0108,1927,323029~l~r1928,323030~l~r0121,1929,323031~y~r032,1930,323032~ ~r098,1931,323033~'
-script += 'b~r0117,1932,323034~u~r0105,1933,323035~i~r0108,1934,323036~l~r0116,1935,323037~t~r032,1936,323038~ '
-script += '~r0117,1937,323039~u~r0112,1938,323040~p~r032,1939,323041~ ~r0116,1940,323042~t~r0104,1941,323043~h~r0101,1942,323044~'
-script += 'e~r032,1943,323045~ ~r099,1944,323046~c~r0111,1945,323047~o~r0117,1946,323048~u~r0114,1947,323049~r~r097,1948,323050~'
-script += 'a~r0103,1949,323051~g~r0101,1950,323052~e~r032,1951,323053~ ~r0116,1952,323054~t~r0111,1953,323055~o'
-script += '~r032,1954,323056~ ~r0116,1955,323057~t~r0111,1956,323058~o~r0117,1957,323059~u~r099,1958,323060~c~r0104,1959,323061~'
-script += 'h~r032,1960,323062~ ~r0116,1961,323063~t~r0104,1962,323064~h~r0101,1963,323065~e~r032,1964,323066~ ~r0115,1965,323067~'
-script += 's~r0116,1966,323068~t~r0114,1967,323069~r~r097,1968,323070~a~r0110,1969,323071~n~r0103,1970,323072~g'
-script += '~r0101,1971,323073~e~r032,1972,323074~ ~r0111,1973,323075~o~r0114,1974,323076~r~r098,1975,323077~b~r032,1976,323078~'
-script += ' ~r0105,1977,323079~i~r0110,1978,323080~n~r032,1979,323081~ ~r0116,1980,323082~t~r0104,1981,323083~h'
-script += '~r0101,1982,323084~e~r032,1983,323085~ ~r097,1984,323086~a~r0110,1985,323087~n~r0116,1986,323088~t~r0101,1987,323089~'
-script += 'e~r099,1988,323090~c~r0104,1989,323091~h~r097,1990,323092~a~r0109,1991,323093~m~r098,1992,323094~b~r0101,1993,323095~'
-script += 'e~r0114,1994,323096~r~r046,1995,323097~.~r032,1996,323098~ ~r1997,323099~ ~r073,1998,323100~I~r0116,1999,323101~'
-script += 't~r032,11000,323102~ ~r0102,11001,323103~f~r0108,11002,323104~l~r097,11003,323105~a~r0115,11004,323106~'
-script += 's~r0104,11005,323107~h~r0101,11006,323108~e~r0115,11007,323109~s~r032,11008,323110~ ~r099,11009,323111~'
-script += 'c~r0111,11010,323112~o~r0108,11011,323113~l~r0111,11012,323114~o~r0114,11013,323115~r~r0115,11014,323116~'
-script += 's~r032,11015,323117~ ~r097,11016,323118~a~r0115,11017,323119~s~r032,11018,323120~ ~r0119,11019,323121~'
-script += 'w~r0101,11020,323122~e~r032,11021,323123~ ~r099,11022,323124~c~r097,11023,323125~a~r0114,11024,323126~'
-script += 'r~r11025,323127~r~r0121,11026,323128~y~r032,11027,323129~ ~r0105,11028,323130~i~r0116,11029,323131~t'
-script += '~r032,11030,323132~ ~r0102,11031,323133~f~r0114,11032,323134~r~r0111,11033,323135~o~r0109,11034,323136~'
-script += 'm~r032,11035,323137~ ~r0114,11036,323138~r~r0111,11037,323139~o~r11038,323140~o~r0109,11039,323141~m'
-script += '~r032,11040,323142~ ~r0116,11041,323143~t~r0111,11042,323144~o~r032,11043,323145~ ~r0114,11044,323146~'
-script += 'r~r0111,11045,323147~o~r11046,323148~o~r0109,11047,323149~m~r044,11048,323150~,~r032,11049,323151~ ~r097,11050,323152~'
-script += 'a~r0110,11051,323153~n~r0100,11052,323154~d~r032,11053,323155~ ~r0115,11054,323156~s~r0111,11055,323157~'
-script += 'o~r0109,11056,323158~m~r0101,11057,323159~e~r0116,11058,323160~t~r0105,11059,323161~i~r0109,11060,323162~'
-script += 'm~r0101,11061,323163~e~r0115,11062,323164~s~r032,11063,323165~ ~r0116,11064,323166~t~r0104,11065,323167~'
-script += 'h~r0101,11066,323168~e~r032,11067,323169~ ~r0115,11068,323170~s~r0121,11069,323171~y~r0109,11070,323172~'
-script += 'm~r098,11071,323173~b~r0111,11072,323174~o~r0108,11073,323175~l~r0115,11074,323176~s~r032,11075,323177~'
-script += ' ~r0105,11076,323178~i~r0110,11077,323179~n~r032,11078,323180~ ~r0116,11079,323181~t~r0104,11080,323182~'
-script += 'h~r0101,11081,323183~e~r032,11082,323184~ ~r0114,11083,323185~r~r0111,11084,323186~o~r11085,323187~o'
-script += '~r0109,11086,323188~m~r0115,11087,323189~s~r032,11088,323190~ ~r0102,11089,323191~f~r0108,11090,323192~'
-script += 'l~r097,11091,323193~a~r0115,11092,323194~s~r0104,11093,323195~h~r032,11094,323196~ ~r099,11095,323197~'
-script += 'c~r0111,11096,323198~o~r0108,11097,323199~l~r0111,11098,323200~o~r0114,11099,323201~r~r0115,11100,323202~'
-script += 's~r032,11101,323203~ ~r097,11102,323204~a~r0115,11103,323205~s~r032,11104,323206~ ~r0119,11105,323207~'
-script += 'w~r0101,11106,323208~e~r0108,11107,323209~l~r11108,323210~l~r046,11109,323211~.~r032,11110,323212~ ~r11111,323213~'
-script += ' ~r073,11112,323214~I~r0116,11113,323215~t~r032,11114,323216~ ~r0115,11115,323217~s~r0105,11116,323218~'
-script += 'i~r0109,11117,323219~m~r0112,11118,323220~p~r0108,11119,323221~l~r0121,11120,323222~y~r032,11121,323223~'
-script += ' ~r0101,11122,323224~e~r0118,11123,323225~v~r097,11124,323226~a~r0112,11125,323227~p~r0111,11126,323228~'
-script += 'o~r0114,11127,323229~r~r097,11128,323230~a~r0116,11129,323231~t~r0101,11130,323232~e~r0115,11131,323233~'
-script += 's~r032,11132,323234~ ~r0105,11133,323235~i~r0102,11134,323236~f~r032,11135,323237~ ~r0119,11136,323238~'
-script += 'w~r0101,11137,323239~e~r032,11138,323240~ ~r0116,11139,323241~t~r0114,11140,323242~r~r0121,11141,323243~'
-script += 'y~r032,11142,323244~ ~r0116,11143,323245~t~r0111,11144,323246~o~r032,11145,323247~ ~r0108,11146,323248~'
-script += 'l~r0101,11147,323249~e~r097,11148,323250~a~r0118,11149,323251~v~r0101,11150,323252~e~r032,11151,323253~'
-script += ' ~r0119,11152,323254~w~r0105,11153,323255~i~r0116,11154,323256~t~r0104,11155,323257~h~r032,11156,323258~'
-script += ' ~r0105,11157,323259~i~r0116,11158,323260~t~r044,11159,323261~,~r032,11160,323262~ ~r098,11161,323263~'
-script += 'b~r0117,11162,323264~u~r0116,11163,323265~t~r032,11164,323266~ ~r097,11165,323267~a~r0110,11166,323268~'
-script += 'n~r0111,11167,323269~o~r0116,11168,323270~t~r0104,11169,323271~h~r0101,11170,323272~e~r0114,11171,323273~'
-script += 'r~r032,11172,323274~ ~r097,11173,323275~a~r0112,11174,323276~p~r11175,323277~p~r0101,11176,323278~e~r097,11177,323279~'
-script += 'a~r0114,11178,323280~r~r0115,11179,323281~s~r032,11180,323282~ ~r0111,11181,323283~o~r0110,11182,323284~'
-script += 'n~r032,11183,323285~ ~r0116,11184,323286~t~r0104,11185,323287~h~r0101,11186,323288~e~r032,11187,323289~'
-script += ' ~r0112,11188,323290~p~r0101,11189,323291~e~r0100,11190,323292~d~r0101,11191,323293~e~r0115,11192,323294~'
-script += 's~r0116,11193,323295~t~r097,11194,323296~a~r0108,11195,323297~l~r032,11196,323298~ ~r0105,11197,323299~'
-script += 'i~r0110,11198,323300~n~r032,11199,323301~ ~r0116,11200,323302~t~r0104,11201,323303~h~r0101,11202,323304~'
-script += 'e~r032,11203,323305~ ~r097,11204,323306~a~r0110,11205,323307~n~r0116,11206,323308~t~r0101,11207,323309~'
-script += 'e~r099,11208,323310~c~r0104,11209,323311~h~r097,11210,323312~a~r0109,11211,323313~m~r098,11212,323314~'
-script += 'b~r0101,11213,323315~e~r0114,11214,323316~r~r032,11215,323317~ ~r0115,11216,323318~s~r0104,11217,323319~'
-script += 'h~r0111,11218,323320~o~r0114,11219,323321~r~r0116,11220,323322~t~r0108,11221,323323~l~r0121,11222,323324~'
-script += 'y~r032,11223,323325~ ~r0116,11224,323326~t~r0104,11225,323327~h~r0101,11226,323328~e~r0114,11227,323329~'
-script += 'r~r0101,11228,323330~e~r097,11229,323331~a~r0102,11230,323332~f~r0116,11231,323333~t~r0101,11232,323334~'
-script += 'e~r0114,11233,323335~r~r046,11234,323336~.~r032,11235,323337~ ~r11236,323338~ ~r073,11237,323339~I~r0116,11238,323340~'
-script += 't~r032,11239,323341~ ~r097,11240,323342~a~r0108,11241,323343~l~r0115,11242,323344~s~r0111,11243,323345~'
-script += 'o~r032,11244,323346~ ~r0115,11245,323347~s~r0101,11246,323348~e~r11247,323349~e~r0109,11248,323350~m'
-script += '~r0115,11249,323351~s~r032,11250,323352~ ~r0116,11251,323353~t~r0111,11252,323354~o~r032,11253,323355~'
-script += ' ~r0100,11254,323356~d~r0111,11255,323357~o~r032,11256,323358~ ~r0116,11257,323359~t~r0104,11258,323360~'
-script += 'h~r0105,11259,323361~i~r0115,11260,323362~s~r032,11261,323363~ ~r0101,11262,323364~e~r0118,11263,323365~'
-script += 'v~r0101,11264,323366~e~r0110,11265,323367~n~r032,11266,323368~ ~r0119,11267,323369~w~r0104,11268,323370~'
-script += 'h~r0101,11269,323371~e~r0110,11270,323372~n~r032,11271,323373~ ~r0119,11272,323374~w~r0101,11273,323375~'
-script += 'e~r032,11274,323376~ ~r0114,11275,323377~r~r0101,11276,323378~e~r0116,11277,323379~t~r0117,11278,323380~'
-script += 'u~r0114,11279,323381~r~r0110,11280,323382~n~r032,11281,323383~ ~r0119,11282,323384~w~r0105,11283,323385~'
-script += 'i~r0116,11284,323386~t~r0104,11285,323387~h~r032,11286,323388~ ~r0105,11287,323389~i~r0116,11288,323390~'
-script += 't~r032,11289,323391~ ~r0116,11290,323392~t~r0111,11291,323393~o~r032,11292,323394~ ~r0116,11293,323395~'
-script += 't~r0104,11294,323396~h~r0101,11295,323397~e~r032,11296,323398~ ~r097,11297,323399~a~r0110,11298,323400~'
-script += 'n~r0116,11299,323401~t~r0101,11300,323402~e~r099,11301,323403~c~r0104,11302,323404~h~r097,11303,323405~'
-script += 'a~r0109,11304,323406~m~r098,11305,323407~b~r0101,11306,323408~e~r0114,11307,323409~r~r032,11308,323410~'
-script += ' ~r0102,11309,323411~f~r0114,11310,323412~r~r0111,11311,323413~o~r0109,11312,323414~m~r032,11313,323415~'
-script += ' ~r0116,11314,323416~t~r0104,11315,323417~h~r0101,11316,323418~e~r032,11317,323419~ ~r0111,11318,323420~'
-script += 'o~r0116,11319,323421~t~r0104,11320,323422~h~r0101,11321,323423~e~r0114,11322,323424~r~r032,11323,323425~'
-script += ' ~r0114,11324,323426~r~r0111,11325,323427~o~r11326,323428~o~r0109,11327,323429~m~r0115,11328,323430~'
-script += 's~r046,11329,323431~.~r010,11330,323432~\n~r11331,323433~\n~r068,11332,323434~D~r097,11333,323435~a~r0121,11334,323436~'
-script += 'y~r032,11335,323437~ ~r056,11336,323438~8~r058,11337,323439~:~r032,11338,323440~ ~r087,11339,323441~'
-script += 'W~r0104,11340,323442~h~r0101,11341,323443~e~r0110,11342,323444~n~r032,11343,323445~ ~r0116,11344,323446~'
-script += 't~r0104,11345,323447~h~r0101,11346,323448~e~r032,11347,323449~ ~r0111,11348,323450~o~r0114,11349,323451~'
-script += 'r~r098,11350,323452~b~r032,11351,323453~ ~r0105,11352,323454~i~r0115,11353,323455~s~r032,11354,323456~'
-script += ' ~r099,11355,323457~c~r097,11356,323458~a~r0114,11357,323459~r~r11358,323460~r~r0105,11359,323461~i~r0101,11360,323462~'
-script += 'e~r0100,11361,323463~d~r032,11362,323464~ ~r0116,11363,323465~t~r0111,11364,323466~o~r032,11365,323467~'
-script += ' ~r0116,11366,323468~t~r0104,11367,323469~h~r0101,11368,323470~e~r032,11369,323471~ ~r0118,11370,323472~'
-script += 'v~r097,11371,323473~a~r0117,11372,323474~u~r0108,11373,323475~l~r0116,11374,323476~t~r032,11375,323477~'
-script += ' ~r0100,11376,323478~d~r0111,11377,323479~o~r11378,323480~o~r0114,11379,323481~r~r044,11380,323482~,'
-script += '~r032,11381,323483~ ~r0116,11382,323484~t~r0104,11383,323485~h~r0101,11384,323486~e~r032,11385,323487~'
-script += ' ~r0110,11386,323488~n~r0117,11387,323489~u~r0109,11388,323490~m~r098,11389,323491~b~r0101,11390,323492~'
-script += 'e~r0114,11391,323493~r~r0115,11392,323494~s~r032,11393,323495~ ~r0111,11394,323496~o~r0110,11395,323497~'
-script += 'n~r032,11396,323498~ ~r0116,11397,323499~t~r0104,11398,323500~h~r0101,11399,323501~e~r032,11400,323502~'
-script += ' ~r0100,11401,323503~d~r0111,11402,323504~o~r11403,323505~o~r0114,11404,323506~r~r032,11405,323507~ '
-script += '~r0102,11406,323508~f~r0108,11407,323509~l~r097,11408,323510~a~r0115,11409,323511~s~r0104,11410,323512~'
-script += 'h~r032,11411,323513~ ~r098,11412,323514~b~r0108,11413,323515~l~r097,11414,323516~a~r099,11415,323517~'
-script += 'c~r0107,11416,323518~k~r044,11417,323519~,~r032,11418,323520~ ~r097,11419,323521~a~r0110,11420,323522~'
-script += 'n~r0100,11421,323523~d~r032,11422,323524~ ~r0116,11423,323525~t~r0104,11424,323526~h~r0101,11425,323527~'
-script += 'e~r0110,11426,323528~n~r032,11427,323529~ ~r0116,11428,323530~t~r0104,11429,323531~h~r0101,11430,323532~'
-script += 'e~r032,11431,323533~ ~r0111,11432,323534~o~r0114,11433,323535~r~r098,11434,323536~b~r032,11435,323537~'
-script += ' ~r0101,11436,323538~e~r0118,11437,323539~v~r097,11438,323540~a~r0112,11439,323541~p~r0111,11440,323542~'
-script += 'o~r0114,11441,323543~r~r097,11442,323544~a~r0116,11443,323545~t~r0101,11444,323546~e~r0115,11445,323547~'
-script += 's~r046,11446,323548~.~r032,11447,323549~ ~r11448,323550~ ~r068,11449,323551~D~r0105,11450,323552~i~r0100,11451,323553~'
-script += 'd~r032,11452,323554~ ~r0119,11453,323555~w~r0101,11454,323556~e~r032,11455,323557~ ~r0100,11456,323558~'
-script += 'd~r0111,11457,323559~o~r032,11458,323560~ ~r0115,11459,323561~s~r0111,11460,323562~o~r0109,11461,323563~'
-script += 'm~r0101,11462,323564~e~r0116,11463,323565~t~r0104,11464,323566~h~r0105,11465,323567~i~r0110,11466,323568~'
-script += 'n~r0103,11467,323569~g~r032,11468,323570~ ~r0119,11469,323571~w~r0114,11470,323572~r~r0111,11471,323573~'
-script += 'o~r0110,11472,323574~n~r0103,11473,323575~g~r063,11474,323576~?~r032,11475,323577~ ~r11476,323578~ ~r068,11477,323579~'
-script += 'D~r0111,11478,323580~o~r0101,11479,323581~e~r0115,11480,323582~s~r0110,11481,323583~n~r039,11482,323584~'
-script += '\'~r0116,11483,323585~t~r032,11484,323586~ ~r0116,11485,323587~t~r0104,11486,323588~h~r0101,11487,323589~'
-script += 'e~r032,11488,323590~ ~r0100,11489,323591~d~r0111,11490,323592~o~r11491,323593~o~r0114,11492,323594~r'
-script += '~r032,11493,323595~ ~r0108,11494,323596~l~r0105,11495,323597~i~r0107,11496,323598~k~r0101,11497,323599~'
-script += 'e~r032,11498,323600~ ~r0117,11499,323601~u~r0115,11500,323602~s~r063,11501,323603~?~r032,11502,323604~'
-script += ' ~r11503,323605~ ~r087,11504,323606~W~r0101,11505,323607~e~r032,11506,323608~ ~r097,11507,323609~a~r0108,11508,323610~'
-script += 'l~r0115,11509,323611~s~r0111,11510,323612~o~r032,11511,323613~ ~r0102,11512,323614~f~r0111,11513,323615~'
-script += 'o~r0117,11514,323616~u~r0110,11515,323617~n~r0100,11516,323618~d~r032,11517,323619~ ~r097,11518,323620~'
-script += 'a~r032,11519,323621~ ~r0115,11520,323622~s~r0109,11521,323623~m~r097,11522,323624~a~r0108,11523,323625~'
-script += 'l~r11524,323626~l~r032,11525,323627~ ~r0104,11526,323628~h~r0111,11527,323629~o~r0117,11528,323630~u'
-script += '~r0114,11529,323631~r~r0103,11530,323632~g~r0108,11531,323633~l~r097,11532,323634~a~r0115,11533,323635~'
-script += 's~r11534,323636~s~r032,11535,323637~ ~r0110,11536,323638~n~r0101,11537,323639~e~r097,11538,323640~a~r0114,11539,323641~'
-script += 'r~r032,11540,323642~ ~r0116,11541,323643~t~r0104,11542,323644~h~r0101,11543,323645~e~r032,11544,323646~'
-script += ' ~r0100,11545,323647~d~r0111,11546,323648~o~r11547,323649~o~r0114,11548,323650~r~r044,11549,323651~,'
-script += '~r032,11550,323652~ ~r0101,11551,323653~e~r0110,11552,323654~n~r0100,11553,323655~d~r0108,11554,323656~'
-script += 'l~r0101,11555,323657~e~r0115,11556,323658~s~r11557,323659~s~r0108,11558,323660~l~r0121,11559,323661~'
-script += 'y~r032,11560,323662~ ~r0114,11561,323663~r~r0117,11562,323664~u~r0110,11563,323665~n~r11564,323666~n'
-script += '~r0105,11565,323667~i~r0110,11566,323668~n~r0103,11567,323669~g~r046,11568,323670~.~r032,11569,323671~'
-script += ' ~r11570,323672~ ~r073,11571,323673~I~r0115,11572,323674~s~r032,11573,323675~ ~r0105,11574,323676~i~r0116,11575,323677~'
-script += 't~r032,11576,323678~ ~r0119,11577,323679~w~r097,11578,323680~a~r0105,11579,323681~i~r0116,11580,323682~'
-script += 't~r0105,11581,323683~i~r0110,11582,323684~n~r0103,11583,323685~g~r032,11584,323686~ ~r0102,11585,323687~'
-script += 'f~r0111,11586,323688~o~r0114,11587,323689~r~r032,11588,323690~ ~r0115,11589,323691~s~r0111,11590,323692~'
-script += 'o~r0109,11591,323693~m~r0101,11592,323694~e~r0116,11593,323695~t~r0104,11594,323696~h~r0105,11595,323697~'
-script += 'i~r0110,11596,323698~n~r0103,11597,323699~g~r063,11598,323700~?~r010,11599,323701~\n~r11600,323702~\n'
-script += '~r068,11601,323703~D~r097,11602,323704~a~r0121,11603,323705~y~r032,11604,323706~ ~r049,11605,323707~'
-script += '1~r051,11606,323708~3~r058,11607,323709~:~r032,11608,323710~ ~r083,11609,323711~S~r0111,11610,323712~'
-script += 'o~r0109,11611,323713~m~r0101,11612,323714~e~r032,11613,323715~ ~r0111,11614,323716~o~r0102,11615,323717~'
-script += 'f~r032,11616,323718~ ~r0109,11617,323719~m~r0121,11618,323720~y~r032,11619,323721~ ~r099,11620,323722~'
-script += 'c~r0114,11621,323723~r~r0101,11622,323724~e~r0119,11623,323725~w~r032,11624,323726~ ~r0115,11625,323727~'
-script += 's~r0119,11626,323728~w~r0101,11627,323729~e~r097,11628,323730~a~r0114,11629,323731~r~r032,11630,323732~'
-script += ' ~r0116,11631,323733~t~r0104,11632,323734~h~r0101,11633,323735~e~r032,11634,323736~ ~r0111,11635,323737~'
-script += 'o~r0114,11636,323738~r~r098,11637,323739~b~r032,11638,323740~ ~r097,11639,323741~a~r099,11640,323742~'
-script += 'c~r0116,11641,323743~t~r0117,11642,323744~u~r097,11643,323745~a~r0108,11644,323746~l~r11645,323747~l'
-script += '~r0121,11646,323748~y~r032,11647,323749~ ~r0103,11648,323750~g~r0101,11649,323751~e~r0116,11650,323752~'
-script += 't~r0115,11651,323753~s~r032,11652,323754~ ~r0104,11653,323755~h~r0101,11654,323756~e~r097,11655,323757~'
-script += 'a~r0118,11656,323758~v~r0101,11657,323759~e~r0114,11658,323760~r~r032,11659,323761~ ~r0111,11660,323762~'
-script += 'o~r0114,11661,323763~r~r032,11662,323764~ ~r0108,11663,323765~l~r0105,11664,323766~i~r0103,11665,323767~'
-script += 'g~r0104,11666,323768~h~r0116,11667,323769~t~r0101,11668,323770~e~r0114,11669,323771~r~r032,11670,323772~'
-script += ' ~r097,11671,323773~a~r0115,11672,323774~s~r032,11673,323775~ ~r0116,11674,323776~t~r0104,11675,323777~'
-script += 'h~r0101,11676,323778~e~r0121,11677,323779~y~r032,11678,323780~ ~r0119,11679,323781~w~r097,11680,323782~'
-script += 'a~r0108,11681,323783~l~r0107,11682,323784~k~r032,11683,323785~ ~r097,11684,323786~a~r0114,11685,323787~'
-script += 'r~r0111,11686,323788~o~r0117,11687,323789~u~r0110,11688,323790~n~r0100,11689,323791~d~r032,11690,323792~'
-script += ' ~r0119,11691,323793~w~r0105,11692,323794~i~r0116,11693,323795~t~r0104,11694,323796~h~r032,11695,323797~'
-script += ' ~r0105,11696,323798~i~r0116,11697,323799~t~r046,11698,323800~.~r032,11699,323801~ ~r11700,323802~ ~r073,11701,323803~'
-script += 'I~r0115,11702,323804~s~r032,11703,323805~ ~r0116,11704,323806~t~r0104,11705,323807~h~r097,11706,323808~'
-script += 'a~r0116,11707,323809~t~r032,11708,323810~ ~r0101,11709,323811~e~r0118,11710,323812~v~r0101,11711,323813~'
-script += 'e~r0110,11712,323814~n~r032,11713,323815~ ~r0112,11714,323816~p~r0111,11715,323817~o~r0115,11716,323818~'
-script += 's~r11717,323819~s~r0105,11718,323820~i~r098,11719,323821~b~r0108,11720,323822~l~r0101,11721,323823~e'
-script += '~r063,11722,323824~?~r032,11723,323825~ ~r11724,323826~ ~r084,11725,323827~T~r0104,11726,323828~h~r0101,11727,323829~'
-script += 'e~r0121,11728,323830~y~r032,11729,323831~ ~r0115,11730,323832~s~r097,11731,323833~a~r0121,11732,323834~'
-script += 'y~r032,11733,323835~ ~r0116,11734,323836~t~r0104,11735,323837~h~r097,11736,323838~a~r0116,11737,323839~'
-script += 't~r032,11738,323840~ ~r0105,11739,323841~i~r0102,11740,323842~f~r032,11741,323843~ ~r0116,11742,323844~'
-script += 't~r0104,11743,323845~h~r0101,11744,323846~e~r0121,11745,323847~y~r032,11746,323848~ ~r0119,11747,323849~'
-script += 'w~r097,11748,323850~a~r0108,11749,323851~l~r0107,11750,323852~k~r032,11751,323853~ ~r0116,11752,323854~'
-script += 't~r0104,11753,323855~h~r0114,11754,323856~r~r0111,11755,323857~o~r0117,11756,323858~u~r0103,11757,323859~'
-script += 'g~r0104,11758,323860~h~r032,11759,323861~ ~r099,11760,323862~c~r0101,11761,323863~e~r0114,11762,323864~'
-script += 'r~r0116,11763,323865~t~r097,11764,323866~a~r0105,11765,323867~i~r0110,11766,323868~n~r032,11767,323869~'
-script += ' ~r0114,11768,323870~r~r0111,11769,323871~o~r11770,323872~o~r0109,11771,323873~m~r0115,11772,323874~'
-script += 's~r032,11773,323875~ ~r0114,11774,323876~r~r0101,11775,323877~e~r0112,11776,323878~p~r0101,11777,323879~'
-script += 'e~r097,11778,323880~a~r0116,11779,323881~t~r0101,11780,323882~e~r0100,11781,323883~d~r0108,11782,323884~'
-script += 'l~r0121,11783,323885~y~r044,11784,323886~,~r032,11785,323887~ ~r0116,11786,323888~t~r0104,11787,323889~'
-script += 'h~r0101,11788,323890~e~r0121,11789,323891~y~r032,11790,323892~ ~r0102,11791,323893~f~r0101,11792,323894~'
-script += 'e~r11793,323895~e~r0108,11794,323896~l~r032,11795,323897~ ~r0105,11796,323898~i~r0116,11797,323899~t'
-script += '~r032,11798,323900~ ~r0103,11799,323901~g~r0101,11800,323902~e~r0116,11801,323903~t~r11802,323904~t~r0105,11803,323905~'
-script += 'i~r0110,11804,323906~n~r0103,11805,323907~g~r032,11806,323908~ ~r0108,11807,323909~l~r0105,11808,323910~'
-script += 'i~r0103,11809,323911~g~r0104,11810,323912~h~r0116,11811,323913~t~r0101,11812,323914~e~r0114,11813,323915~'
-script += 'r~r032,11814,323916~ ~r097,11815,323917~a~r0110,11816,323918~n~r0100,11817,323919~d~r032,11818,323920~'
-script += ' ~r0108,11819,323921~l~r0105,11820,323922~i~r0103,11821,323923~g~r0104,11822,323924~h~r0116,11823,323925~'
-script += 't~r0101,11824,323926~e~r0114,11825,323927~r~r044,11826,323928~,~r032,11827,323929~ ~r098,11828,323930~'
-script += 'b~r0117,11829,323931~u~r0116,11830,323932~t~r032,11831,323933~ ~r0105,11832,323934~i~r0116,11833,323935~'
-script += 't~r032,11834,323936~ ~r0101,11835,323937~e~r0118,11836,323938~v~r0101,11837,323939~e~r0110,11838,323940~'
-script += 'n~r0116,11839,323941~t~r0117,11840,323942~u~r097,11841,323943~a~r0108,11842,323944~l~r11843,323945~l'
-script += '~r0121,11844,323946~y~r032,11845,323947~ ~r0106,11846,323948~j~r0117,11847,323949~u~r0115,11848,323950~'
-script += 's~r0116,11849,323951~t~r032,11850,323952~ ~r0101,11851,323953~e~r0118,11852,323954~v~r097,11853,323955~'
-script += 'a~r0112,11854,323956~p~r0111,11855,323957~o~r0114,11856,323958~r~r097,11857,323959~a~r0116,11858,323960~'
-script += 't~r0101,11859,323961~e~r0115,11860,323962~s~r032,11861,323963~ ~r097,11862,323964~a~r0110,11863,323965~'
-script += 'n~r0100,11864,323966~d~r032,11865,323967~ ~r097,11866,323968~a~r032,11867,323969~ ~r0110,11868,323970~'
-script += 'n~r0101,11869,323971~e~r0119,11870,323972~w~r032,11871,323973~ ~r0111,11872,323974~o~r0110,11873,323975~'
-script += 'n~r0101,11874,323976~e~r032,11875,323977~ ~r097,11876,323978~a~r0112,11877,323979~p~r11878,323980~p~r0101,11879,323981~'
-script += 'e~r097,11880,323982~a~r0114,11881,323983~r~r0115,11882,323984~s~r032,11883,323985~ ~r097,11884,323986~'
-script += 'a~r0115,11885,323987~s~r032,11886,323988~ ~r0117,11887,323989~u~r0115,11888,323990~s~r0117,11889,323991~'
-script += 'u~r097,11890,323992~a~r0108,11891,323993~l~r046,11892,323994~.~r010,11893,323995~\n~r11894,323996~\n'
-script += '~r068,11895,323997~D~r097,11896,323998~a~r0121,11897,323999~y~r032,11898,324000~ ~r050,11899,324001~'
-script += '2~r049,11900,324002~1~r058,11901,324003~:~r032,11902,324004~ ~r078,11903,324005~N~r0111,11904,324006~'
-script += 'o~r0119,11905,324007~w~r032,11906,324008~ ~r073,11907,324009~I~r032,11908,324010~ ~r099,11909,324011~'
-script += 'c~r097,11910,324012~a~r0110,11911,324013~n~r032,11912,324014~ ~r0102,11913,324015~f~r0101,11914,324016~'
-script += 'e~r11915,324017~e~r0108,11916,324018~l~r032,11917,324019~ ~r0116,11918,324020~t~r0104,11919,324021~h'
-script += '~r0101,11920,324022~e~r032,11921,324023~ ~r0111,11922,324024~o~r0114,11923,324025~r~r098,11924,324026~'
-script += 'b~r032,11925,324027~ ~r099,11926,324028~c~r0104,11927,324029~h~r097,11928,324030~a~r0110,11929,324031~'
-script += 'n~r0103,11930,324032~g~r0105,11931,324033~i~r0110,11932,324034~n~r0103,11933,324035~g~r032,11934,324036~'
-script += ' ~r0119,11935,324037~w~r0101,11936,324038~e~r0105,11937,324039~i~r0103,11938,324040~g~r0104,11939,324041~'
-script += 'h~r0116,11940,324042~t~r032,11941,324043~ ~r097,11942,324044~a~r0115,11943,324045~s~r032,11944,324046~'
-script += ' ~r073,11945,324047~I~r032,11946,324048~ ~r0119,11947,324049~w~r097,11948,324050~a~r0108,11949,324051~'
-script += 'l~r0107,11950,324052~k~r032,11951,324053~ ~r097,11952,324054~a~r0114,11953,324055~r~r0111,11954,324056~'
-script += 'o~r0117,11955,324057~u~r0110,11956,324058~n~r0100,11957,324059~d~r046,11958,324060~.~r032,11959,324061~'
-script += ' ~r11960,324062~ ~r073,11961,324063~I~r0116,11962,324064~t~r032,11963,324065~ ~r0100,11964,324066~d~r0101,11965,324067~'
-script += 'e~r0112,11966,324068~p~r0101,11967,324069~e~r0110,11968,324070~n~r0100,11969,324071~d~r0115,11970,324072~'
-script += 's~r032,11971,324073~ ~r0111,11972,324074~o~r0110,11973,324075~n~r032,11974,324076~ ~r0116,11975,324077~'
-script += 't~r0104,11976,324078~h~r0101,11977,324079~e~r032,11978,324080~ ~r097,11979,324081~a~r0114,11980,324082~'
-script += 'r~r0101,11981,324083~e~r097,11982,324084~a~r032,11983,324085~ ~r045,11984,324086~-~r032,11985,324087~'
-script += ' ~r0116,11986,324088~t~r0104,11987,324089~h~r0101,11988,324090~e~r032,11989,324091~ ~r099,11990,324092~'
-script += 'c~r0104,11991,324093~h~r097,11992,324094~a~r0110,11993,324095~n~r0103,11994,324096~g~r0101,11995,324097~'
-script += 'e~r032,11996,324098~ ~r0105,11997,324099~i~r0115,11998,324100~s~r032,11999,324101~ ~r0118,12000,324102~'
-script += 'v~r0101,12001,324103~e~r0114,12002,324104~r~r0121,12003,324105~y~r032,12004,324106~ ~r0115,12005,324107~'
-script += 's~r0117,12006,324108~u~r098,12007,324109~b~r0116,12008,324110~t~r0108,12009,324111~l~r0101,12010,324112~'
-script += 'e~r032,12011,324113~ ~r0105,12012,324114~i~r0110,12013,324115~n~r032,12014,324116~ ~r0115,12015,324117~'
-script += 's~r0111,12016,324118~o~r0109,12017,324119~m~r0101,12018,324120~e~r032,12019,324121~ ~r0112,12020,324122~'
-script += 'p~r0108,12021,324123~l~r097,12022,324124~a~r099,12023,324125~c~r0101,12024,324126~e~r0115,12025,324127~'
-script += 's~r044,12026,324128~,~r032,12027,324129~ ~r098,12028,324130~b~r0117,12029,324131~u~r0116,12030,324132~'
-script += 't~r032,12031,324133~ ~r099,12032,324134~c~r0101,12033,324135~e~r0114,12034,324136~r~r0116,12035,324137~'
-script += 't~r097,12036,324138~a~r0105,12037,324139~i~r0110,12038,324140~n~r0108,12039,324141~l~r0121,12040,324142~'
-script += 'y~r032,12041,324143~ ~r0109,12042,324144~m~r0111,12043,324145~o~r0114,12044,324146~r~r0101,12045,324147~'
-script += 'e~r032,12046,324148~ ~r0110,12047,324149~n~r0111,12048,324150~o~r0116,12049,324151~t~r0105,12050,324152~'
-script += 'i~r099,12051,324153~c~r0101,12052,324154~e~r097,12053,324155~a~r098,12054,324156~b~r0108,12055,324157~'
-script += 'l~r0101,12056,324158~e~r032,12057,324159~ ~r0105,12058,324160~i~r0110,12059,324161~n~r032,12060,324162~'
-script += ' ~r0111,12061,324163~o~r0116,12062,324164~t~r0104,12063,324165~h~r0101,12064,324166~e~r0114,12065,324167~'
-script += 'r~r0115,12066,324168~s~r044,12067,324169~,~r032,12068,324170~ ~r0101,12069,324171~e~r0115,12070,324172~'
-script += 's~r0112,12071,324173~p~r0101,12072,324174~e~r099,12073,324175~c~r0105,12074,324176~i~r097,12075,324177~'
-script += 'a~r0108,12076,324178~l~r12077,324179~l~r0121,12078,324180~y~r032,12079,324181~ ~r0119,12080,324182~w'
-script += '~r0104,12081,324183~h~r0101,12082,324184~e~r0110,12083,324185~n~r032,12084,324186~ ~r073,12085,324187~'
-script += 'I~r032,12086,324188~ ~r0119,12087,324189~w~r097,12088,324190~a~r0108,12089,324191~l~r0107,12090,324192~'
-script += 'k~r032,12091,324193~ ~r0105,12092,324194~i~r0110,12093,324195~n~r0116,12094,324196~t~r0111,12095,324197~'
-script += 'o~r032,12096,324198~ ~r097,12097,324199~a~r032,12098,324200~ ~r0114,12099,324201~r~r0111,12100,324202~'
-script += 'o~r12101,324203~o~r0109,12102,324204~m~r032,12103,324205~ ~r0119,12104,324206~w~r0105,12105,324207~i'
-script += '~r0116,12106,324208~t~r0104,12107,324209~h~r032,12108,324210~ ~r097,12109,324211~a~r032,12110,324212~'
-script += ' ~r0108,12111,324213~l~r097,12112,324214~a~r0114,12113,324215~r~r0103,12114,324216~g~r0101,12115,324217~'
-script += 'e~r0114,12116,324218~r~r032,12117,324219~ ~r0110,12118,324220~n~r0117,12119,324221~u~r0109,12120,324222~'
-script += 'm~r098,12121,324223~b~r0101,12122,324224~e~r0114,12123,324225~r~r032,12124,324226~ ~r0111,12125,324227~'
-script += 'o~r0114,12126,324228~r~r032,12127,324229~ ~r0111,12128,324230~o~r0117,12129,324231~u~r0116,12130,324232~'
-script += 't~r032,12131,324233~ ~r0111,12132,324234~o~r0102,12133,324235~f~r032,12134,324236~ ~r097,12135,324237~'
-script += 'a~r032,12136,324238~ ~r0114,12137,324239~r~r0111,12138,324240~o~r12139,324241~o~r0109,12140,324242~m'
-script += '~r032,12141,324243~ ~r0109,12142,324244~m~r097,12143,324245~a~r0114,12144,324246~r~r0107,12145,324247~'
-script += 'k~r0101,12146,324248~e~r0100,12147,324249~d~r032,12148,324250~ ~r039,12149,324251~\'~r042,12150,324252~'
-script += '*~r039,12151,324253~\'~r046,12152,324254~.~r032,12153,324255~ ~r12154,324256~ ~r080,12155,324257~P~r0101,12156,324258~'
-script += 'e~r0114,12157,324259~r~r0104,12158,324260~h~r097,12159,324261~a~r0112,12160,324262~p~r0115,12161,324263~'
-script += 's~r032,12162,324264~ ~r0119,12163,324265~w~r0101,12164,324266~e~r032,12165,324267~ ~r099,12166,324268~'
-script += 'c~r097,12167,324269~a~r0110,12168,324270~n~r032,12169,324271~ ~r097,12170,324272~a~r099,12171,324273~'
-script += 'c~r0116,12172,324274~t~r0117,12173,324275~u~r097,12174,324276~a~r0108,12175,324277~l~r12176,324278~l'
-script += '~r0121,12177,324279~y~r032,12178,324280~ ~r099,12179,324281~c~r0111,12180,324282~o~r0110,12181,324283~'
-script += 'n~r0116,12182,324284~t~r0114,12183,324285~r~r0111,12184,324286~o~r0108,12185,324287~l~r032,12186,324288~'
-script += ' ~r0116,12187,324289~t~r0104,12188,324290~h~r0101,12189,324291~e~r032,12190,324292~ ~r0119,12191,324293~'
-script += 'w~r0101,12192,324294~e~r0105,12193,324295~i~r0103,12194,324296~g~r0104,12195,324297~h~r0116,12196,324298~'
-script += 't~r032,12197,324299~ ~r0111,12198,324300~o~r0102,12199,324301~f~r032,12200,324302~ ~r0116,12201,324303~'
-script += 't~r0104,12202,324304~h~r0105,12203,324305~i~r0115,12204,324306~s~r032,12205,324307~ ~r0109,12206,324308~'
-script += 'm~r0121,12207,324309~y~r0115,12208,324310~s~r0116,12209,324311~t~r0101,12210,324312~e~r0114,12211,324313~'
-script += 'r~r0105,12212,324314~i~r0111,12213,324315~o~r0117,12214,324316~u~r0115,12215,324317~s~r032,12216,324318~'
-script += ' ~r0111,12217,324319~o~r0114,12218,324320~r~r098,12219,324321~b~r063,12220,324322~?~r010,12221,324323~'
-script += '\n~r12222,324324~\n~r068,12223,324325~D~r097,12224,324326~a~r0121,12225,324327~y~r032,12226,324328~ '
-script += '~r051,12227,324329~3~r052,12228,324330~4~r058,12229,324331~:~r032,12230,324332~ ~r079,12231,324333~O'
-script += '~r0110,12232,324334~n~r0101,12233,324335~e~r032,12234,324336~ ~r0111,12235,324337~o~r0102,12236,324338~'
-script += 'f~r032,12237,324339~ ~r0116,12238,324340~t~r0104,12239,324341~h~r0101,12240,324342~e~r032,12241,324343~'
-script += ' ~r099,12242,324344~c~r0114,12243,324345~r~r0101,12244,324346~e~r0119,12245,324347~w~r0109,12246,324348~'
-script += 'm~r0101,12247,324349~e~r0109,12248,324350~m~r098,12249,324351~b~r0101,12250,324352~e~r0114,12251,324353~'
-script += 'r~r0115,12252,324354~s~r032,12253,324355~ ~r0119,12254,324356~w~r097,12255,324357~a~r0115,12256,324358~'
-script += 's~r032,12257,324359~ ~r0119,12258,324360~w~r097,12259,324361~a~r0110,12260,324362~n~r0100,12261,324363~'
-script += 'd~r0101,12262,324364~e~r0114,12263,324365~r~r0105,12264,324366~i~r0110,12265,324367~n~r0103,12266,324368~'
-script += 'g~r032,12267,324369~ ~r0116,12268,324370~t~r0104,12269,324371~h~r0101,12270,324372~e~r032,12271,324373~'
-script += ' ~r0114,12272,324374~r~r0111,12273,324375~o~r12274,324376~o~r0109,12275,324377~m~r0115,12276,324378~'
-script += 's~r032,12277,324379~ ~r0116,12278,324380~t~r0111,12279,324381~o~r0100,12280,324382~d~r097,12281,324383~'
-script += 'a~r0121,12282,324384~y~r032,12283,324385~ ~r097,12284,324386~a~r0110,12285,324387~n~r0100,12286,324388~'
-script += 'd~r032,12287,324389~ ~r099,12288,324390~c~r0108,12289,324391~l~r097,12290,324392~a~r0105,12291,324393~'
-script += 'i~r0109,12292,324394~m~r0101,12293,324395~e~r0100,12294,324396~d~r032,12295,324397~ ~r0116,12296,324398~'
-script += 't~r0104,12297,324399~h~r097,12298,324400~a~r0116,12299,324401~t~r032,12300,324402~ ~r0116,12301,324403~'
-script += 't~r0104,12302,324404~h~r0101,12303,324405~e~r032,12304,324406~ ~r0110,12305,324407~n~r0117,12306,324408~'
-script += 'u~r0109,12307,324409~m~r098,12308,324410~b~r0101,12309,324411~e~r0114,12310,324412~r~r0115,12311,324413~'
-script += 's~r032,12312,324414~ ~r0111,12313,324415~o~r0110,12314,324416~n~r032,12315,324417~ ~r0116,12316,324418~'
-script += 't~r0104,12317,324419~h~r0101,12318,324420~e~r032,12319,324421~ ~r0100,12320,324422~d~r0111,12321,324423~'
-script += 'o~r12322,324424~o~r0114,12323,324425~r~r032,12324,324426~ ~r0102,12325,324427~f~r0108,12326,324428~l'
-script += '~r097,12327,324429~a~r0115,12328,324430~s~r0104,12329,324431~h~r0101,12330,324432~e~r0100,12331,324433~'
-script += 'd~r032,12332,324434~ ~r0119,12333,324435~w~r0104,12334,324436~h~r0105,12335,324437~i~r0116,12336,324438~'
-script += 't~r0101,12337,324439~e~r032,12338,324440~ ~r097,12339,324441~a~r0115,12340,324442~s~r032,12341,324443~'
-script += ' ~r0104,12342,324444~h~r0101,12343,324445~e~r032,12344,324446~ ~r097,12345,324447~a~r0112,12346,324448~'
-script += 'p~r12347,324449~p~r0114,12348,324450~r~r0111,12349,324451~o~r097,12350,324452~a~r099,12351,324453~c~r0104,12352,324454~'
-script += 'h~r0101,12353,324455~e~r0100,12354,324456~d~r033,12355,324457~!~r032,12356,324458~ ~r12357,324459~ ~r072,12358,324460~'
-script += 'H~r0101,12359,324461~e~r032,12360,324462~ ~r0115,12361,324463~s~r097,12362,324464~a~r0105,12363,324465~'
-script += 'i~r0100,12364,324466~d~r032,12365,324467~ ~r0116,12366,324468~t~r0104,12367,324469~h~r0101,12368,324470~'
-script += 'e~r032,12369,324471~ ~r0100,12370,324472~d~r0111,12371,324473~o~r12372,324474~o~r0114,12373,324475~r'
-script += '~r032,12374,324476~ ~r0115,12375,324477~s~r0116,12376,324478~t~r0105,12377,324479~i~r0108,12378,324480~'
-script += 'l~r12379,324481~l~r032,12380,324482~ ~r0100,12381,324483~d~r0105,12382,324484~i~r0100,12383,324485~d'
-script += '~r0110,12384,324486~n~r039,12385,324487~\'~r0116,12386,324488~t~r032,12387,324489~ ~r0111,12388,324490~'
-script += 'o~r0112,12389,324491~p~r0101,12390,324492~e~r0110,12391,324493~n~r044,12392,324494~,~r032,12393,324495~'
-script += ' ~r098,12394,324496~b~r0117,12395,324497~u~r0116,12396,324498~t~r032,12397,324499~ ~r0104,12398,324500~'
-script += 'h~r0101,12399,324501~e~r032,12400,324502~ ~r0110,12401,324503~n~r0111,12402,324504~o~r0116,12403,324505~'
-script += 't~r0105,12404,324506~i~r099,12405,324507~c~r0101,12406,324508~e~r0100,12407,324509~d~r032,12408,324510~'
-script += ' ~r0116,12409,324511~t~r0104,12410,324512~h~r097,12411,324513~a~r0116,12412,324514~t~r032,12413,324515~'
-script += ' ~r0116,12414,324516~t~r0104,12415,324517~h~r0101,12416,324518~e~r032,12417,324519~ ~r0104,12418,324520~'
-script += 'h~r0111,12419,324521~o~r0117,12420,324522~u~r0114,12421,324523~r~r0103,12422,324524~g~r0108,12423,324525~'
-script += 'l~r097,12424,324526~a~r0115,12425,324527~s~r12426,324528~s~r032,12427,324529~ ~r0104,12428,324530~h~r097,12429,324531~'
-script += 'a~r0100,12430,324532~d~r032,12431,324533~ ~r0114,12432,324534~r~r0117,12433,324535~u~r0110,12434,324536~'
-script += 'n~r032,12435,324537~ ~r0111,12436,324538~o~r0117,12437,324539~u~r0116,12438,324540~t~r032,12439,324541~'
-script += ' ~r097,12440,324542~a~r0110,12441,324543~n~r0100,12442,324544~d~r032,12443,324545~ ~r0102,12444,324546~'
-script += 'f~r0108,12445,324547~l~r097,12446,324548~a~r0115,12447,324549~s~r0104,12448,324550~h~r0101,12449,324551~'
-script += 'e~r0100,12450,324552~d~r032,12451,324553~ ~r098,12452,324554~b~r0108,12453,324555~l~r097,12454,324556~'
-script += 'a~r099,12455,324557~c~r0107,12456,324558~k~r046,12457,324559~.~r032,12458,324560~ ~r12459,324561~ ~r087,12460,324562~'
-script += 'W~r0104,12461,324563~h~r0101,12462,324564~e~r0110,12463,324565~n~r032,12464,324566~ ~r0119,12465,324567~'
-script += 'w~r0101,12466,324568~e~r032,12467,324569~ ~r0119,12468,324570~w~r0101,12469,324571~e~r0110,12470,324572~'
-script += 'n~r0116,12471,324573~t~r032,12472,324574~ ~r0116,12473,324575~t~r0111,12474,324576~o~r032,12475,324577~'
-script += ' ~r099,12476,324578~c~r0104,12477,324579~h~r0101,12478,324580~e~r099,12479,324581~c~r0107,12480,324582~'
-script += 'k~r032,12481,324583~ ~r0111,12482,324584~o~r0110,12483,324585~n~r032,12484,324586~ ~r0105,12485,324587~'
-script += 'i~r0116,12486,324588~t~r044,12487,324589~,~r032,12488,324590~ ~r0105,12489,324591~i~r0116,12490,324592~'
-script += 't~r032,12491,324593~ ~r0119,12492,324594~w~r097,12493,324595~a~r0115,12494,324596~s~r032,12495,324597~'
-script += ' ~r0115,12496,324598~s~r0116,12497,324599~t~r0105,12498,324600~i~r0108,12499,324601~l~r12500,324602~'
-script += 'l~r032,12501,324603~ ~r0114,12502,324604~r~r0117,12503,324605~u~r0110,12504,324606~n~r12505,324607~n'
-script += '~r0105,12506,324608~i~r0110,12507,324609~n~r0103,12508,324610~g~r032,12509,324611~ ~r0108,12510,324612~'
-script += 'l~r0105,12511,324613~i~r0107,12512,324614~k~r0101,12513,324615~e~r032,12514,324616~ ~r0105,12515,324617~'
-script += 'i~r0116,12516,324618~t~r032,12517,324619~ ~r097,12518,324620~a~r0108,12519,324621~l~r0119,12520,324622~'
-script += 'w~r097,12521,324623~a~r0121,12522,324624~y~r0115,12523,324625~s~r032,12524,324626~ ~r0100,12525,324627~'
-script += 'd~r0111,12526,324628~o~r0101,12527,324629~e~r0115,12528,324630~s~r046,12529,324631~.~r032,12530,324632~'
-script += ' ~r12531,324633~ ~r080,12532,324634~P~r0101,12533,324635~e~r0114,12534,324636~r~r0104,12535,324637~h'
-script += '~r097,12536,324638~a~r0112,12537,324639~p~r0115,12538,324640~s~r032,12539,324641~ ~r0104,12540,324642~'
-script += 'h~r0101,12541,324643~e~r032,12542,324644~ ~r0105,12543,324645~i~r0115,12544,324646~s~r032,12545,324647~'
-script += ' ~r0103,12546,324648~g~r0111,12547,324649~o~r0105,12548,324650~i~r0110,12549,324651~n~r0103,12550,324652~'
-script += 'g~r032,12551,324653~ ~r0109,12552,324654~m~r097,12553,324655~a~r0100,12554,324656~d~r063,12555,324657~'
-script += '?~r032,12556,324658~ ~r12557,324659~ ~r073,12558,324660~I~r0102,12559,324661~f~r032,12560,324662~ ~r0110,12561,324663~'
-script += 'n~r0111,12562,324664~o~r0116,12563,324665~t~r044,12564,324666~,~r032,12565,324667~ ~r0119,12566,324668~'
-script += 'w~r0104,12567,324669~h~r0105,12568,324670~i~r099,12569,324671~c~r0104,12570,324672~h~r032,12571,324673~'
-script += ' ~r0100,12572,324674~d~r0111,12573,324675~o~r032,12574,324676~ ~r0119,12575,324677~w~r0101,12576,324678~'
-script += 'e~r032,12577,324679~ ~r0110,12578,324680~n~r0101,12579,324681~e~r12580,324682~e~r0100,12581,324683~d'
-script += '~r032,12582,324684~ ~r0116,12583,324685~t~r0111,12584,324686~o~r032,12585,324687~ ~r097,12586,324688~'
-script += 'a~r0112,12587,324689~p~r12588,324690~p~r0101,12589,324691~e~r097,12590,324692~a~r0115,12591,324693~s'
-script += '~r0101,12592,324694~e~r058,12593,324695~:~r032,12594,324696~ ~r0116,12595,324697~t~r0104,12596,324698~'
-script += 'h~r0101,12597,324699~e~r032,12598,324700~ ~r0100,12599,324701~d~r0111,12600,324702~o~r12601,324703~o'
-script += '~r0114,12602,324704~r~r032,12603,324705~ ~r0111,12604,324706~o~r0114,12605,324707~r~r032,12606,324708~'
-script += ' ~r0116,12607,324709~t~r0104,12608,324710~h~r0101,12609,324711~e~r032,12610,324712~ ~r0104,12611,324713~'
-script += 'h~r0111,12612,324714~o~r0117,12613,324715~u~r0114,12614,324716~r~r0103,12615,324717~g~r0108,12616,324718~'
-script += 'l~r097,12617,324719~a~r0115,12618,324720~s~r12619,324721~s~r063,12620,324722~?~r032,12621,324723~ ~r12622,324724~'
-script += ' ~r066,12623,324725~B~r0111,12624,324726~o~r0116,12625,324727~t~r0104,12626,324728~h~r063,12627,324729~'
-script += '?~r010,12628,324730~\n~r12629,324731~\n~r068,12630,324732~D~r097,12631,324733~a~r0121,12632,324734~y'
-script += '~r032,12633,324735~ ~r053,12634,324736~5~r12635,324737~5~r058,12636,324738~:~r032,12637,324739~ ~r084,12638,324740~'
-script += 'T~r0104,12639,324741~h~r0101,12640,324742~e~r032,12641,324743~ ~r0102,12642,324744~f~r0105,12643,324745~'
-script += 'i~r0114,12644,324746~r~r0101,12645,324747~e~r0102,12646,324748~f~r0108,12647,324749~l~r0105,12648,324750~'
-script += 'i~r0101,12649,324751~e~r0115,12650,324752~s~r032,12651,324753~ ~r097,12652,324754~a~r0114,12653,324755~'
-script += 'r~r0101,12654,324756~e~r032,12655,324757~ ~r0103,12656,324758~g~r0101,12657,324759~e~r0116,12658,324760~'
-script += 't~r12659,324761~t~r0105,12660,324762~i~r0110,12661,324763~n~r0103,12662,324764~g~r032,12663,324765~ '
-script += '~r0115,12664,324766~s~r0117,12665,324767~u~r0115,12666,324768~s~r0112,12667,324769~p~r0105,12668,324770~'
-script += 'i~r099,12669,324771~c~r0105,12670,324772~i~r0111,12671,324773~o~r0117,12672,324774~u~r0115,12673,324775~'
-script += 's~r046,12674,324776~.~r032,12675,324777~ ~r12676,324778~ ~r079,12677,324779~O~r0110,12678,324780~n~r0101,12679,324781~'
-script += 'e~r032,12680,324782~ ~r0111,12681,324783~o~r0102,12682,324784~f~r032,12683,324785~ ~r0116,12684,324786~'
-script += 't~r0104,12685,324787~h~r0101,12686,324788~e~r0109,12687,324789~m~r032,12688,324790~ ~r0108,12689,324791~'
-script += 'l~r0111,12690,324792~o~r12691,324793~o~r0107,12692,324794~k~r0101,12693,324795~e~r0100,12694,324796~'
-script += 'd~r032,12695,324797~ ~r097,12696,324798~a~r0116,12697,324799~t~r032,12698,324800~ ~r0109,12699,324801~'
-script += 'm~r0101,12700,324802~e~r032,12701,324803~ ~r0102,12702,324804~f~r0117,12703,324805~u~r0110,12704,324806~'
-script += 'n~r12705,324807~n~r0121,12706,324808~y~r032,12707,324809~ ~r0116,12708,324810~t~r0111,12709,324811~o'
-script += '~r0100,12710,324812~d~r097,12711,324813~a~r0121,12712,324814~y~r032,12713,324815~ ~r097,12714,324816~'
-script += 'a~r0110,12715,324817~n~r0100,12716,324818~d~r032,12717,324819~ ~r0116,12718,324820~t~r0104,12719,324821~'
-script += 'h~r0101,12720,324822~e~r0110,12721,324823~n~r032,12722,324824~ ~r0102,12723,324825~f~r0108,12724,324826~'
-script += 'l~r0101,12725,324827~e~r0119,12726,324828~w~r032,12727,324829~ ~r0111,12728,324830~o~r0102,12729,324831~'
-script += 'f~r12730,324832~f~r046,12731,324833~.~r032,12732,324834~ ~r12733,324835~ ~r073,12734,324836~I~r032,12735,324837~'
-script += ' ~r0116,12736,324838~t~r0104,12737,324839~h~r0105,12738,324840~i~r0110,12739,324841~n~r0107,12740,324842~'
-script += 'k~r032,12741,324843~ ~r073,12742,324844~I~r032,12743,324845~ ~r0115,12744,324846~s~r097,12745,324847~'
-script += 'a~r0119,12746,324848~w~r032,12747,324849~ ~r097,12748,324850~a~r0110,12749,324851~n~r0111,12750,324852~'
-script += 'o~r0116,12751,324853~t~r0104,12752,324854~h~r0101,12753,324855~e~r0114,12754,324856~r~r032,12755,324857~'
-script += ' ~r0111,12756,324858~o~r0110,12757,324859~n~r0101,12758,324860~e~r032,12759,324861~ ~r098,12760,324862~'
-script += 'b~r0108,12761,324863~l~r0105,12762,324864~i~r0110,12763,324865~n~r0107,12764,324866~k~r0105,12765,324867~'
-script += 'i~r0110,12766,324868~n~r0103,12767,324869~g~r032,12768,324870~ ~r097,12769,324871~a~r032,12770,324872~'
-script += ' ~r0108,12771,324873~l~r0105,12772,324874~i~r0116,12773,324875~t~r12774,324876~t~r0108,12775,324877~'
-script += 'l~r0101,12776,324878~e~r032,12777,324879~ ~r0102,12778,324880~f~r097,12779,324881~a~r0115,12780,324882~'
-script += 's~r0116,12781,324883~t~r0101,12782,324884~e~r0114,12783,324885~r~r032,12784,324886~ ~r0116,12785,324887~'
-script += 't~r0104,12786,324888~h~r097,12787,324889~a~r0110,12788,324890~n~r032,12789,324891~ ~r0117,12790,324892~'
-script += 'u~r0115,12791,324893~s~r0117,12792,324894~u~r097,12793,324895~a~r0108,12794,324896~l~r046,12795,324897~'
-script += '.~r032,12796,324898~ ~r12797,324899~ ~r079,12798,324900~O~r0114,12799,324901~r~r032,12800,324902~ ~r0119,12801,324903~'
-script += 'w~r097,12802,324904~a~r0115,12803,324905~s~r032,12804,324906~ ~r0105,12805,324907~i~r0116,12806,324908~'
-script += 't~r032,12807,324909~ ~r097,12808,324910~a~r032,12809,324911~ ~r0108,12810,324912~l~r0105,12811,324913~'
-script += 'i~r0116,12812,324914~t~r12813,324915~t~r0108,12814,324916~l~r0101,12815,324917~e~r032,12816,324918~ '
-script += '~r0115,12817,324919~s~r0108,12818,324920~l~r0111,12819,324921~o~r0119,12820,324922~w~r0101,12821,324923~'
-script += 'e~r0114,12822,324924~r~r063,12823,324925~?~r032,12824,324926~ ~r12825,324927~ ~r087,12826,324928~W~r0101,12827,324929~'
-script += 'e~r032,12828,324930~ ~r097,12829,324931~a~r0114,12830,324932~r~r0101,12831,324933~e~r032,12832,324934~'
-script += ' ~r0103,12833,324935~g~r0101,12834,324936~e~r0116,12835,324937~t~r12836,324938~t~r0105,12837,324939~'
-script += 'i~r0110,12838,324940~n~r0103,12839,324941~g~r032,12840,324942~ ~r098,12841,324943~b~r0101,12842,324944~'
-script += 'e~r0116,12843,324945~t~r12844,324946~t~r0101,12845,324947~e~r0114,12846,324948~r~r032,12847,324949~ '
-script += '~r097,12848,324950~a~r0116,12849,324951~t~r032,12850,324952~ ~r099,12851,324953~c~r0111,12852,324954~'
-script += 'o~r0110,12853,324955~n~r0116,12854,324956~t~r0114,12855,324957~r~r0111,12856,324958~o~r0108,12857,324959~'
-script += 'l~r12858,324960~l~r0105,12859,324961~i~r0110,12860,324962~n~r0103,12861,324963~g~r032,12862,324964~ '
-script += '~r0116,12863,324965~t~r0104,12864,324966~h~r0101,12865,324967~e~r032,12866,324968~ ~r0119,12867,324969~'
-script += 'w~r0101,12868,324970~e~r0105,12869,324971~i~r0103,12870,324972~g~r0104,12871,324973~h~r0116,12872,324974~'
-script += 't~r032,12873,324975~ ~r0111,12874,324976~o~r0102,12875,324977~f~r032,12876,324978~ ~r0116,12877,324979~'
-script += 't~r0104,12878,324980~h~r0101,12879,324981~e~r032,12880,324982~ ~r0111,12881,324983~o~r0114,12882,324984~'
-script += 'r~r098,12883,324985~b~r044,12884,324986~,~r032,12885,324987~ ~r097,12886,324988~a~r0110,12887,324989~'
-script += 'n~r0100,12888,324990~d~r032,12889,324991~ ~r0119,12890,324992~w~r0101,12891,324993~e~r032,12892,324994~'
-script += ' ~r0116,12893,324995~t~r0104,12894,324996~h~r0105,12895,324997~i~r0110,12896,324998~n~r0107,12897,324999~'
-script += 'k~r032,12898,325000~ ~r0116,12899,325001~t~r0104,12900,325002~h~r097,12901,325003~a~r0116,12902,325004~'
-script += 't~r039,12903,325005~\'~r0115,12904,325006~s~r032,12905,325007~ ~r0119,12906,325008~w~r0104,12907,325009~'
-script += 'h~r097,12908,325010~a~r0116,12909,325011~t~r032,12910,325012~ ~r0116,12911,325013~t~r0104,12912,325014~'
-script += 'h~r0101,12913,325015~e~r032,12914,325016~ ~r0110,12915,325017~n~r0117,12916,325018~u~r0109,12917,325019~'
-script += 'm~r098,12918,325020~b~r0101,12919,325021~e~r0114,12920,325022~r~r0115,12921,325023~s~r032,12922,325024~'
-script += ' ~r097,12923,325025~a~r0114,12924,325026~r~r0101,12925,325027~e~r032,12926,325028~ ~r097,12927,325029~'
-script += 'a~r0108,12928,325030~l~r12929,325031~l~r032,12930,325032~ ~r097,12931,325033~a~r098,12932,325034~b~r0111,12933,325035~'
-script += 'o~r0117,12934,325036~u~r0116,12935,325037~t~r046,12936,325038~.~r032,12937,325039~ ~r12938,325040~ ~r084,12939,325041~'
-script += 'T~r0104,12940,325042~h~r0101,12941,325043~e~r032,12942,325044~ ~r0111,12943,325045~o~r0114,12944,325046~'
-script += 'r~r098,12945,325047~b~r032,12946,325048~ ~r0115,12947,325049~s~r0116,12948,325050~t~r097,12949,325051~'
-script += 'a~r0114,12950,325052~r~r0116,12951,325053~t~r0115,12952,325054~s~r032,12953,325055~ ~r097,12954,325056~'
-script += 'a~r0116,12955,325057~t~r032,12956,325058~ ~r0116,12957,325059~t~r0104,12958,325060~h~r0101,12959,325061~'
-script += 'e~r032,12960,325062~ ~r0119,12961,325063~w~r0101,12962,325064~e~r0105,12963,325065~i~r0103,12964,325066~'
-script += 'g~r0104,12965,325067~h~r0116,12966,325068~t~r032,12967,325069~ ~r0108,12968,325070~l~r097,12969,325071~'
-script += 'a~r098,12970,325072~b~r0101,12971,325073~e~r0108,12972,325074~l~r0101,12973,325075~e~r0100,12974,325076~'
-script += 'd~r032,12975,325077~ ~r0111,12976,325078~o~r0110,12977,325079~n~r032,12978,325080~ ~r0116,12979,325081~'
-script += 't~r0104,12980,325082~h~r0101,12981,325083~e~r032,12982,325084~ ~r0112,12983,325085~p~r0101,12984,325086~'
-script += 'e~r0100,12985,325087~d~r0101,12986,325088~e~r0115,12987,325089~s~r0116,12988,325090~t~r097,12989,325091~'
-script += 'a~r0108,12990,325092~l~r044,12991,325093~,~r032,12992,325094~ ~r097,12993,325095~a~r0110,12994,325096~'
-script += 'n~r0100,12995,325097~d~r032,12996,325098~ ~r0103,12997,325099~g~r0111,12998,325100~o~r0101,12999,325101~'
-script += 'e~r0115,13000,325102~s~r032,13001,325103~ ~r0100,13002,325104~d~r0111,13003,325105~o~r0119,13004,325106~'
-script += 'w~r0110,13005,325107~n~r032,13006,325108~ ~r097,13007,325109~a~r0115,13008,325110~s~r032,13009,325111~'
-script += ' ~r0119,13010,325112~w~r0101,13011,325113~e~r032,13012,325114~ ~r0108,13013,325115~l~r0101,13014,325116~'
-script += 'e~r097,13015,325117~a~r0118,13016,325118~v~r0101,13017,325119~e~r032,13018,325120~ ~r097,13019,325121~'
-script += 'a~r032,13020,325122~ ~r0114,13021,325123~r~r0111,13022,325124~o~r13023,325125~o~r0109,13024,325126~m'
-script += '~r032,13025,325127~ ~r0109,13026,325128~m~r097,13027,325129~a~r0114,13028,325130~r~r0107,13029,325131~'
-script += 'k~r0101,13030,325132~e~r0100,13031,325133~d~r032,13032,325134~ ~r039,13033,325135~\'~r045,13034,325136~'
-script += '-~r039,13035,325137~\'~r044,13036,325138~,~r032,13037,325139~ ~r0117,13038,325140~u~r0112,13039,325141~'
-script += 'p~r032,13040,325142~ ~r097,13041,325143~a~r0115,13042,325144~s~r032,13043,325145~ ~r0119,13044,325146~'
-script += 'w~r0101,13045,325147~e~r032,13046,325148~ ~r0108,13047,325149~l~r0101,13048,325150~e~r097,13049,325151~'
-script += 'a~r0118,13050,325152~v~r0101,13051,325153~e~r032,13052,325154~ ~r097,13053,325155~a~r032,13054,325156~'
-script += ' ~r0114,13055,325157~r~r0111,13056,325158~o~r13057,325159~o~r0109,13058,325160~m~r032,13059,325161~ '
-script += '~r0109,13060,325162~m~r097,13061,325163~a~r0114,13062,325164~r~r0107,13063,325165~k~r0101,13064,325166~'
-script += 'e~r0100,13065,325167~d~r032,13066,325168~ ~r039,13067,325169~\'~r043,13068,325170~+~r039,13069,325171~'
-script += '\'~r044,13070,325172~,~r032,13071,325173~ ~r097,13072,325174~a~r0110,13073,325175~n~r0100,13074,325176~'
-script += 'd~r032,13075,325177~ ~r0117,13076,325178~u~r0112,13077,325179~p~r032,13078,325180~ ~r0101,13079,325181~'
-script += 'e~r0118,13080,325182~v~r0101,13081,325183~e~r0110,13082,325184~n~r032,13083,325185~ ~r0109,13084,325186~'
-script += 'm~r0111,13085,325187~o~r0114,13086,325188~r~r0101,13087,325189~e~r032,13088,325190~ ~r097,13089,325191~'
-script += 'a~r0115,13090,325192~s~r032,13091,325193~ ~r0119,13092,325194~w~r0101,13093,325195~e~r032,13094,325196~'
-script += ' ~r0108,13095,325197~l~r0101,13096,325198~e~r097,13097,325199~a~r0118,13098,325200~v~r0101,13099,325201~'
-script += 'e~r032,13100,325202~ ~r097,13101,325203~a~r032,13102,325204~ ~r0114,13103,325205~r~r0111,13104,325206~'
-script += 'o~r13105,325207~o~r0109,13106,325208~m~r032,13107,325209~ ~r0109,13108,325210~m~r097,13109,325211~a~r0114,13110,325212~'
-script += 'r~r0107,13111,325213~k~r0101,13112,325214~e~r0100,13113,325215~d~r032,13114,325216~ ~r039,13115,325217~'
-script += '\'~r042,13116,325218~*~r039,13117,325219~\'~r046,13118,325220~.~r032,13119,325221~ ~r13120,325222~ ~r069,13121,325223~'
-script += 'E~r0110,13122,325224~n~r0116,13123,325225~t~r0101,13124,325226~e~r0114,13125,325227~r~r0105,13126,325228~'
-script += 'i~r0110,13127,325229~n~r0103,13128,325230~g~r032,13129,325231~ ~r0114,13130,325232~r~r0111,13131,325233~'
-script += 'o~r13132,325234~o~r0109,13133,325235~m~r0115,13134,325236~s~r032,13135,325237~ ~r0119,13136,325238~w'
-script += '~r0105,13137,325239~i~r0116,13138,325240~t~r0104,13139,325241~h~r032,13140,325242~ ~r0108,13141,325243~'
-script += 'l~r097,13142,325244~a~r0114,13143,325245~r~r0103,13144,325246~g~r0101,13145,325247~e~r0114,13146,325248~'
-script += 'r~r032,13147,325249~ ~r0110,13148,325250~n~r0117,13149,325251~u~r0109,13150,325252~m~r098,13151,325253~'
-script += 'b~r0101,13152,325254~e~r0114,13153,325255~r~r0115,13154,325256~s~r032,13155,325257~ ~r0104,13156,325258~'
-script += 'h~r097,13157,325259~a~r0115,13158,325260~s~r032,13159,325261~ ~r097,13160,325262~a~r032,13161,325263~'
-script += ' ~r0103,13162,325264~g~r0114,13163,325265~r~r0101,13164,325266~e~r097,13165,325267~a~r0116,13166,325268~'
-script += 't~r0101,13167,325269~e~r0114,13168,325270~r~r032,13169,325271~ ~r0101,13170,325272~e~r0102,13171,325273~'
-script += 'f~r13172,325274~f~r0101,13173,325275~e~r099,13174,325276~c~r0116,13175,325277~t~r046,13176,325278~.~r010,13177,325279~'
-script += '\n~r13178,325280~\n~r068,13179,325281~D~r097,13180,325282~a~r0121,13181,325283~y~r032,13182,325284~ '
-script += '~r056,13183,325285~8~r057,13184,325286~9~r058,13185,325287~:~r032,13186,325288~ ~r069,13187,325289~E'
-script += '~r0118,13188,325290~v~r0101,13189,325291~e~r0114,13190,325292~r~r0121,13191,325293~y~r032,13192,325294~'
-script += ' ~r0111,13193,325295~o~r0110,13194,325296~n~r099,13195,325297~c~r0101,13196,325298~e~r032,13197,325299~'
-script += ' ~r0105,13198,325300~i~r0110,13199,325301~n~r032,13200,325302~ ~r097,13201,325303~a~r032,13202,325304~'
-script += ' ~r0103,13203,325305~g~r0114,13204,325306~r~r0101,13205,325307~e~r097,13206,325308~a~r0116,13207,325309~'
-script += 't~r032,13208,325310~ ~r0119,13209,325311~w~r0104,13210,325312~h~r0105,13211,325313~i~r0108,13212,325314~'
-script += 'l~r0101,13213,325315~e~r044,13214,325316~,~r032,13215,325317~ ~r0111,13216,325318~o~r0110,13217,325319~'
-script += 'n~r0101,13218,325320~e~r032,13219,325321~ ~r0111,13220,325322~o~r0102,13221,325323~f~r032,13222,325324~'
-script += ' ~r0116,13223,325325~t~r0104,13224,325326~h~r0101,13225,325327~e~r032,13226,325328~ ~r099,13227,325329~'
-script += 'c~r0114,13228,325330~r~r0101,13229,325331~e~r0119,13230,325332~w~r0109,13231,325333~m~r0101,13232,325334~'
-script += 'e~r0109,13233,325335~m~r098,13234,325336~b~r0101,13235,325337~e~r0114,13236,325338~r~r0115,13237,325339~'
-script += 's~r032,13238,325340~ ~r0104,13239,325341~h~r097,13240,325342~a~r0115,13241,325343~s~r032,13242,325344~'
-script += ' ~r0116,13243,325345~t~r0104,13244,325346~h~r0101,13245,325347~e~r032,13246,325348~ ~r0115,13247,325349~'
-script += 's~r097,13248,325350~a~r0109,13249,325351~m~r0101,13250,325352~e~r032,13251,325353~ ~r0115,13252,325354~'
-script += 's~r0116,13253,325355~t~r0111,13254,325356~o~r0114,13255,325357~r~r0121,13256,325358~y~r058,13257,325359~'
-script += ':~r032,13258,325360~ ~r0116,13259,325361~t~r0104,13260,325362~h~r097,13261,325363~a~r0116,13262,325364~'
-script += 't~r032,13263,325365~ ~r0116,13264,325366~t~r0104,13265,325367~h~r0101,13266,325368~e~r032,13267,325369~'
-script += ' ~r0100,13268,325370~d~r0111,13269,325371~o~r13270,325372~o~r0114,13271,325373~r~r032,13272,325374~ '
-script += '~r0102,13273,325375~f~r0108,13274,325376~l~r097,13275,325377~a~r0115,13276,325378~s~r0104,13277,325379~'
-script += 'h~r0101,13278,325380~e~r0115,13279,325381~s~r032,13280,325382~ ~r0119,13281,325383~w~r0104,13282,325384~'
-script += 'h~r0105,13283,325385~i~r0116,13284,325386~t~r0101,13285,325387~e~r044,13286,325388~,~r032,13287,325389~'
-script += ' ~r0116,13288,325390~t~r0104,13289,325391~h~r0101,13290,325392~e~r032,13291,325393~ ~r0104,13292,325394~'
-script += 'h~r0111,13293,325395~o~r0117,13294,325396~u~r0114,13295,325397~r~r0103,13296,325398~g~r0108,13297,325399~'
-script += 'l~r097,13298,325400~a~r0115,13299,325401~s~r13300,325402~s~r032,13301,325403~ ~r0104,13302,325404~h~r097,13303,325405~'
-script += 'a~r0100,13304,325406~d~r032,13305,325407~ ~r097,13306,325408~a~r0108,13307,325409~l~r0114,13308,325410~'
-script += 'r~r0101,13309,325411~e~r097,13310,325412~a~r0100,13311,325413~d~r0121,13312,325414~y~r032,13313,325415~'
-script += ' ~r0114,13314,325416~r~r0117,13315,325417~u~r0110,13316,325418~n~r032,13317,325419~ ~r0111,13318,325420~'
-script += 'o~r0117,13319,325421~u~r0116,13320,325422~t~r044,13321,325423~,~r032,13322,325424~ ~r0105,13323,325425~'
-script += 'i~r0116,13324,325426~t~r032,13325,325427~ ~r0102,13326,325428~f~r0108,13327,325429~l~r097,13328,325430~'
-script += 'a~r0115,13329,325431~s~r0104,13330,325432~h~r0101,13331,325433~e~r0115,13332,325434~s~r032,13333,325435~'
-script += ' ~r098,13334,325436~b~r0108,13335,325437~l~r097,13336,325438~a~r099,13337,325439~c~r0107,13338,325440~'
-script += 'k~r044,13339,325441~,~r032,13340,325442~ ~r097,13341,325443~a~r0110,13342,325444~n~r0100,13343,325445~'
-script += 'd~r032,13344,325446~ ~r0116,13345,325447~t~r0104,13346,325448~h~r0101,13347,325449~e~r032,13348,325450~'
-script += ' ~r0111,13349,325451~o~r0114,13350,325452~r~r098,13351,325453~b~r032,13352,325454~ ~r0101,13353,325455~'
-script += 'e~r0118,13354,325456~v~r097,13355,325457~a~r0112,13356,325458~p~r0111,13357,325459~o~r0114,13358,325460~'
-script += 'r~r097,13359,325461~a~r0116,13360,325462~t~r0101,13361,325463~e~r0115,13362,325464~s~r046,13363,325465~'
-script += '.~r032,13364,325466~ ~r13365,325467~ ~r065,13366,325468~A~r0114,13367,325469~r~r0101,13368,325470~e~r032,13369,325471~'
-script += ' ~r0119,13370,325472~w~r0101,13371,325473~e~r032,13372,325474~ ~r0116,13373,325475~t~r0111,13374,325476~'
-script += 'o~r13375,325477~o~r032,13376,325478~ ~r0115,13377,325479~s~r0108,13378,325480~l~r0111,13379,325481~o'
-script += '~r0119,13380,325482~w~r063,13381,325483~?~r032,13382,325484~ ~r13383,325485~ ~r087,13384,325486~W~r0101,13385,325487~'
-script += 'e~r032,13386,325488~ ~r099,13387,325489~c~r097,13388,325490~a~r0110,13389,325491~n~r039,13390,325492~'
-script += '\'~r0116,13391,325493~t~r032,13392,325494~ ~r0115,13393,325495~s~r0101,13394,325496~e~r13395,325497~'
-script += 'e~r0109,13396,325498~m~r032,13397,325499~ ~r0116,13398,325500~t~r0111,13399,325501~o~r032,13400,325502~'
-script += ' ~r0102,13401,325503~f~r0105,13402,325504~i~r0110,13403,325505~n~r0100,13404,325506~d~r032,13405,325507~'
-script += ' ~r097,13406,325508~a~r032,13407,325509~ ~r0119,13408,325510~w~r097,13409,325511~a~r0121,13410,325512~'
-script += 'y~r032,13411,325513~ ~r0116,13412,325514~t~r0111,13413,325515~o~r032,13414,325516~ ~r0109,13415,325517~'
-script += 'm~r097,13416,325518~a~r0107,13417,325519~k~r0101,13418,325520~e~r032,13419,325521~ ~r0116,13420,325522~'
-script += 't~r0104,13421,325523~h~r0101,13422,325524~e~r032,13423,325525~ ~r0111,13424,325526~o~r0114,13425,325527~'
-script += 'r~r098,13426,325528~b~r039,13427,325529~\'~r0115,13428,325530~s~r032,13429,325531~ ~r0119,13430,325532~'
-script += 'w~r0101,13431,325533~e~r0105,13432,325534~i~r0103,13433,325535~g~r0104,13434,325536~h~r0116,13435,325537~'
-script += 't~r032,13436,325538~ ~r0109,13437,325539~m~r097,13438,325540~a~r0116,13439,325541~t~r099,13440,325542~'
-script += 'c~r0104,13441,325543~h~r032,13442,325544~ ~r0119,13443,325545~w~r0104,13444,325546~h~r097,13445,325547~'
-script += 'a~r0116,13446,325548~t~r032,13447,325549~ ~r0116,13448,325550~t~r0104,13449,325551~h~r0101,13450,325552~'
-script += 'e~r032,13451,325553~ ~r0100,13452,325554~d~r0111,13453,325555~o~r13454,325556~o~r0114,13455,325557~r'
-script += '~r032,13456,325558~ ~r0119,13457,325559~w~r097,13458,325560~a~r0110,13459,325561~n~r0116,13460,325562~'
-script += 't~r0115,13461,325563~s~r032,13462,325564~ ~r098,13463,325565~b~r0101,13464,325566~e~r0102,13465,325567~'
-script += 'f~r0111,13466,325568~o~r0114,13467,325569~r~r0101,13468,325570~e~r032,13469,325571~ ~r0116,13470,325572~'
-script += 't~r0104,13471,325573~h~r0101,13472,325574~e~r032,13473,325575~ ~r0104,13474,325576~h~r0111,13475,325577~'
-script += 'o~r0117,13476,325578~u~r0114,13477,325579~r~r0103,13478,325580~g~r0108,13479,325581~l~r097,13480,325582~'
-script += 'a~r0115,13481,325583~s~r13482,325584~s~r032,13483,325585~ ~r0114,13484,325586~r~r0117,13485,325587~u'
-script += '~r0110,13486,325588~n~r0115,13487,325589~s~r032,13488,325590~ ~r0111,13489,325591~o~r0117,13490,325592~'
-script += 'u~r0116,13491,325593~t~r046,13492,325594~.~r032,13493,325595~ ~r13494,325596~ ~r073,13495,325597~I~r0102,13496,325598~'
-script += 'f~r032,13497,325599~ ~r0111,13498,325600~o~r0110,13499,325601~n~r0108,13500,325602~l~r0121,13501,325603~'
-script += 'y~r032,13502,325604~ ~r0119,13503,325605~w~r0101,13504,325606~e~r032,13505,325607~ ~r099,13506,325608~'
-script += 'c~r0111,13507,325609~o~r0117,13508,325610~u~r0108,13509,325611~l~r0100,13510,325612~d~r032,13511,325613~'
-script += ' ~r0102,13512,325614~f~r0105,13513,325615~i~r0110,13514,325616~n~r0100,13515,325617~d~r032,13516,325618~'
-script += ' ~r097,13517,325619~a~r032,13518,325620~ ~r0115,13519,325621~s~r0104,13520,325622~h~r0111,13521,325623~'
-script += 'o~r0114,13522,325624~r~r0116,13523,325625~t~r0101,13524,325626~e~r0114,13525,325627~r~r032,13526,325628~'
-script += ' ~r0114,13527,325629~r~r0111,13528,325630~o~r0117,13529,325631~u~r0116,13530,325632~t~r0101,13531,325633~'
-script += 'e~r032,13532,325634~ ~r0116,13533,325635~t~r0104,13534,325636~h~r0114,13535,325637~r~r0111,13536,325638~'
-script += 'o~r0117,13537,325639~u~r0103,13538,325640~g~r0104,13539,325641~h~r032,13540,325642~ ~r0116,13541,325643~'
-script += 't~r0104,13542,325644~h~r0101,13543,325645~e~r032,13544,325646~ ~r0114,13545,325647~r~r0111,13546,325648~'
-script += 'o~r13547,325649~o~r0109,13548,325650~m~r0115,13549,325651~s~r046,13550,325652~.~r13551,325653~.~r13552,325654~'
-script += '.~r010,13553,325655~\n~r13554,325656~\n~r068,13555,325657~D~r097,13556,325658~a~r0121,13557,325659~y'
-script += '~r032,13558,325660~ ~r049,13559,325661~1~r052,13560,325662~4~r13561,325663~4~r058,13562,325664~:~r032,13563,325665~'
-script += ' ~r087,13564,325666~W~r0101,13565,325667~e~r032,13566,325668~ ~r097,13567,325669~a~r0114,13568,325670~'
-script += 'r~r0101,13569,325671~e~r032,13570,325672~ ~r097,13571,325673~a~r098,13572,325674~b~r097,13573,325675~'
-script += 'a~r0110,13574,325676~n~r0100,13575,325677~d~r0111,13576,325678~o~r0110,13577,325679~n~r0105,13578,325680~'
-script += 'i~r0110,13579,325681~n~r0103,13580,325682~g~r032,13581,325683~ ~r0116,13582,325684~t~r0104,13583,325685~'
-script += 'h~r0101,13584,325686~e~r032,13585,325687~ ~r0109,13586,325688~m~r0105,13587,325689~i~r0115,13588,325690~'
-script += 's~r13589,325691~s~r0105,13590,325692~i~r0111,13591,325693~o~r0110,13592,325694~n~r046,13593,325695~.'
-script += '~r032,13594,325696~ ~r13595,325697~ ~r078,13596,325698~N~r0111,13597,325699~o~r0110,13598,325700~n~r0101,13599,325701~'
-script += 'e~r032,13600,325702~ ~r0111,13601,325703~o~r0102,13602,325704~f~r032,13603,325705~ ~r0117,13604,325706~'
-script += 'u~r0115,13605,325707~s~r032,13606,325708~ ~r099,13607,325709~c~r097,13608,325710~a~r0110,13609,325711~'
-script += 'n~r032,13610,325712~ ~r0119,13611,325713~w~r0111,13612,325714~o~r0114,13613,325715~r~r0107,13614,325716~'
-script += 'k~r032,13615,325717~ ~r0111,13616,325718~o~r0117,13617,325719~u~r0116,13618,325720~t~r032,13619,325721~'
-script += ' ~r0116,13620,325722~t~r0104,13621,325723~h~r0101,13622,325724~e~r032,13623,325725~ ~r0115,13624,325726~'
-script += 's~r0111,13625,325727~o~r0108,13626,325728~l~r0117,13627,325729~u~r0116,13628,325730~t~r0105,13629,325731~'
-script += 'i~r0111,13630,325732~o~r0110,13631,325733~n~r032,13632,325734~ ~r0116,13633,325735~t~r0111,13634,325736~'
-script += 'o~r032,13635,325737~ ~r0116,13636,325738~t~r0104,13637,325739~h~r0101,13638,325740~e~r032,13639,325741~'
-script += ' ~r0112,13640,325742~p~r0117,13641,325743~u~r0122,13642,325744~z~r13643,325745~z~r0108,13644,325746~'
-script += 'l~r0101,13645,325747~e~r046,13646,325748~.~r032,13647,325749~ ~r13648,325750~ ~r073,13649,325751~I~r032,13650,325752~'
-script += ' ~r0119,13651,325753~w~r0105,13652,325754~i~r0108,13653,325755~l~r13654,325756~l~r032,13655,325757~ '
-script += '~r0108,13656,325758~l~r0101,13657,325759~e~r097,13658,325760~a~r0118,13659,325761~v~r0101,13660,325762~'
-script += 'e~r032,13661,325763~ ~r0116,13662,325764~t~r0104,13663,325765~h~r0105,13664,325766~i~r0115,13665,325767~'
-script += 's~r032,13666,325768~ ~r0106,13667,325769~j~r0111,13668,325770~o~r0117,13669,325771~u~r0114,13670,325772~'
-script += 'r~r0110,13671,325773~n~r097,13672,325774~a~r0108,13673,325775~l~r032,13674,325776~ ~r0104,13675,325777~'
-script += 'h~r0101,13676,325778~e~r0114,13677,325779~r~r0101,13678,325780~e~r032,13679,325781~ ~r0116,13680,325782~'
-script += 't~r0111,13681,325783~o~r032,13682,325784~ ~r0104,13683,325785~h~r0101,13684,325786~e~r0108,13685,325787~'
-script += 'l~r0112,13686,325788~p~r032,13687,325789~ ~r0102,13688,325790~f~r0117,13689,325791~u~r0116,13690,325792~'
-script += 't~r0117,13691,325793~u~r0114,13692,325794~r~r0101,13693,325795~e~r032,13694,325796~ ~r097,13695,325797~'
-script += 'a~r0100,13696,325798~d~r0118,13697,325799~v~r0101,13698,325800~e~r0110,13699,325801~n~r0116,13700,325802~'
-script += 't~r0117,13701,325803~u~r0114,13702,325804~r~r0101,13703,325805~e~r0114,13704,325806~r~r0115,13705,325807~'
-script += 's~r044,13706,325808~,~r032,13707,325809~ ~r0116,13708,325810~t~r0104,13709,325811~h~r0111,13710,325812~'
-script += 'o~r0117,13711,325813~u~r0103,13712,325814~g~r0104,13713,325815~h~r032,13714,325816~ ~r073,13715,325817~'
-script += 'I~r032,13716,325818~ ~r097,13717,325819~a~r0109,13718,325820~m~r032,13719,325821~ ~r0110,13720,325822~'
-script += 'n~r0111,13721,325823~o~r0116,13722,325824~t~r032,13723,325825~ ~r0115,13724,325826~s~r0117,13725,325827~'
-script += 'u~r0114,13726,325828~r~r0101,13727,325829~e~r032,13728,325830~ ~r0119,13729,325831~w~r0104,13730,325832~'
-script += 'h~r097,13731,325833~a~r0116,13732,325834~t~r032,13733,325835~ ~r0104,13734,325836~h~r0101,13735,325837~'
-script += 'e~r0108,13736,325838~l~r0112,13737,325839~p~r032,13738,325840~ ~r0105,13739,325841~i~r0116,13740,325842~'
-script += 't~r032,13741,325843~ ~r0119,13742,325844~w~r0105,13743,325845~i~r0108,13744,325846~l~r13745,325847~l'
-script += '~r032,13746,325848~ ~r0103,13747,325849~g~r0105,13748,325850~i~r0118,13749,325851~v~r0101,13750,325852~'
-script += 'e~r046,13751,325853~.~r032,13752,325854~ ~r13753,325855~ ~r071,13754,325856~G~r0111,13755,325857~o~r13756,325858~'
-script += 'o~r0100,13757,325859~d~r032,13758,325860~ ~r0108,13759,325861~l~r0117,13760,325862~u~r099,13761,325863~'
-script += 'c~r0107,13762,325864~k~r033,13763,325865~!~r022101,12729,37,4101,50,60~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~w~r025976,4119,51~e~r025977,4101,52~'
-script += 's~r025978,4115,53~t~r025979,4116,54~\n~r032,24,37,4101,50~~moutput~\n\n~r02548,10,20,34~~v27322548~='
-script += '= ~r084,314091,413,51528,614090~T~r0114,11,314092~r~r0111,12,314093~o~r0112,13,314094~p~r0105,14,314095~'
-script += 'i~r099,15,314096~c~r097,16,314097~a~r0108,17,314098~l~r032,18,314099~ ~r067,19,314100~C~r097,110,314101~'
-script += 'a~r0118,111,314102~v~r0101,112,314103~e~r014090,10,34,4101,50,60~ ==\n~r084,314105,4322,51528,614104~'
-script += 'T~r0104,11,314106~h~r0101,12,314107~e~r032,13,314108~ ~r099,14,314109~c~r097,15,314110~a~r0118,16,314111~'
-script += 'v~r0101,17,314112~e~r032,18,314113~ ~r0105,19,314114~i~r0115,110,314115~s~r032,111,314116~ ~r097,112,314117~'
-script += 'a~r032,113,314118~ ~r0108,114,314119~l~r0105,115,314120~i~r0116,116,314121~t~r117,314122~t~r0108,118,314123~'
-script += 'l~r0101,119,314124~e~r032,120,314125~ ~r0119,121,314126~w~r0105,122,314127~i~r0100,123,314128~d~r0101,124,314129~'
-script += 'e~r0114,125,314130~r~r032,126,314131~ ~r0104,127,314132~h~r0101,128,314133~e~r0114,129,314134~r~r0101,130,314135~'
-script += 'e~r046,131,314136~.~r032,132,314137~ ~r133,314138~ ~r089,134,314139~Y~r0111,135,314140~o~r0117,136,314141~'
-script += 'u~r032,137,314142~ ~r0102,138,314143~f~r0105,139,314144~i~r0110,140,314145~n~r0100,141,314146~d~r032,142,314147~'
-script += ' ~r0116,143,314148~t~r0104,144,314149~h~r0101,145,314150~e~r032,146,314151~ ~r099,147,314152~c~r0111,148,314153~'
-script += 'o~r098,149,314154~b~r0119,150,314155~w~r0101,151,314156~e~r098,152,314157~b~r045,153,314158~-~r0101,154,314159~'
-script += 'e~r0110,155,314160~n~r099,156,314161~c~r0114,157,314162~r~r0117,158,314163~u~r0115,159,314164~s~r0116,160,314165~'
-script += 't~r0101,161,314166~e~r0100,162,314167~d~r032,163,314168~ ~r0114,164,314169~r~r0101,165,314170~e~r0109,166,314171~'
-script += 'm~r097,167,314172~a~r0105,168,314173~i~r0110,169,314174~n~r0115,170,314175~s~r032,171,314176~ ~r0111,172,314177~'
-script += 'o~r0102,173,314178~f~r032,174,314179~ ~r097,175,314180~a~r032,176,314181~ ~r0115,177,314182~s~r0109,178,314183~'
-script += 'm~r097,179,314184~a~r0108,180,314185~l~r181,314186~l~r032,182,314187~ ~r099,183,314188~c~r097,184,314189~'
-script += 'a~r0109,185,314190~m~r0112,186,314191~p~r044,187,314192~,~r032,188,314193~ ~r097,189,314194~a~r0110,190,314195~'
-script += 'n~r0100,191,314196~d~r032,192,314197~ ~r097,193,314198~a~r0108,194,314199~l~r0116,195,314200~t~r0104,196,314201~'
-script += 'h~r0111,197,314202~o~r0117,198,314203~u~r0103,199,314204~g~r0104,1100,314205~h~r032,1101,314206~ ~r0121,1102,314207~'
-script += 'y~r0111,1103,314208~o~r0117,1104,314209~u~r032,1105,314210~ ~r0100,1106,314211~d~r0111,1107,314212~o'
-script += '~r0110,1108,314213~n~r039,1109,314214~\'~r0116,1110,314215~t~r032,1111,314216~ ~r0115,1112,314217~s~r0117,1113,314218~'
-script += 'u~r0115,1114,314219~s~r0112,1115,314220~p~r0101,1116,314221~e~r099,1117,314222~c~r0116,1118,314223~t'
-script += '~r032,1119,314224~ ~r0116,1120,314225~t~r0104,1121,314226~h~r0101,1122,314227~e~r032,1123,314228~ ~r098,1124,314229~'
-script += 'b~r0114,1125,314230~r~r0111,1126,314231~o~r0107,1127,314232~k~r0101,1128,314233~e~r0110,1129,314234~'
-script += 'n~r032,1130,314235~ ~r0112,1131,314236~p~r0105,1132,314237~i~r0101,1133,314238~e~r099,1134,314239~c~r0101,1135,314240~'
-script += 'e~r0115,1136,314241~s~r032,1137,314242~ ~r0111,1138,314243~o~r0102,1139,314244~f~r032,1140,314245~ ~r0116,1141,314246~'
-script += 't~r097,1142,314247~a~r098,1143,314248~b~r0108,1144,314249~l~r0101,1145,314250~e~r0115,1146,314251~s~r032,1147,314252~'
-script += ' ~r097,1148,314253~a~r0110,1149,314254~n~r0100,1150,314255~d~r032,1151,314256~ ~r099,1152,314257~c~r0104,1153,314258~'
-script += 'h~r097,1154,314259~a~r0105,1155,314260~i~r0114,1156,314261~r~r0115,1157,314262~s~r032,1158,314263~ ~r0119,1159,314264~'
-script += 'w~r0105,1160,314265~i~r0108,1161,314266~l~r1162,314267~l~r032,1163,314268~ ~r0112,1164,314269~p~r0114,1165,314270~'
-script += 'r~r0111,1166,314271~o~r0118,1167,314272~v~r0101,1168,314273~e~r032,1169,314274~ ~r0117,1170,314275~u'
-script += '~r0115,1171,314276~s~r0101,1172,314277~e~r0102,1173,314278~f~r0117,1174,314279~u~r0108,1175,314280~l'
-script += '~r032,1176,314281~ ~r0116,1177,314282~t~r0111,1178,314283~o~r032,1179,314284~ ~r0121,1180,314285~y~r0111,1181,314286~'
-script += 'o~r0117,1182,314287~u~r0114,1183,314288~r~r032,1184,314289~ ~r0113,1185,314290~q~r0117,1186,314291~u'
-script += '~r0101,1187,314292~e~r0115,1188,314293~s~r0116,1189,314294~t~r044,1190,314295~,~r032,1191,314296~ ~r0116,1192,314297~'
-script += 't~r0104,1193,314298~h~r0101,1194,314299~e~r032,1195,314300~ ~r0102,1196,314301~f~r0105,1197,314302~i'
-script += '~r0114,1198,314303~r~r0101,1199,314304~e~r0102,1200,314305~f~r0108,1201,314306~l~r0105,1202,314307~i'
-script += '~r0101,1203,314308~e~r0115,1204,314309~s~r032,1205,314310~ ~r0115,1206,314311~s~r0101,1207,314312~e~r1208,314313~'
-script += 'e~r0109,1209,314314~m~r032,1210,314315~ ~r0116,1211,314316~t~r0111,1212,314317~o~r032,1213,314318~ ~r0108,1214,314319~'
-script += 'l~r0105,1215,314320~i~r0107,1216,314321~k~r0101,1217,314322~e~r032,1218,314323~ ~r0117,1219,314324~u'
-script += '~r0115,1220,314325~s~r0105,1221,314326~i~r0110,1222,314327~n~r0103,1223,314328~g~r032,1224,314329~ ~r0116,1225,314330~'
-script += 't~r0104,1226,314331~h~r0101,1227,314332~e~r032,1228,314333~ ~r0100,1229,314334~d~r0101,1230,314335~e'
-script += '~r098,1231,314336~b~r0114,1232,314337~r~r0105,1233,314338~i~r0115,1234,314339~s~r032,1235,314340~ ~r097,1236,314341~'
-script += 'a~r0115,1237,314342~s~r032,1238,314343~ ~r097,1239,314344~a~r032,1240,314345~ ~r0115,1241,314346~s~r0104,1242,314347~'
-script += 'h~r0101,1243,314348~e~r0108,1244,314349~l~r0116,1245,314350~t~r0101,1246,314351~e~r0114,1247,314352~'
-script += 'r~r046,1248,314353~.~r032,1249,314354~ ~r1250,314355~ ~r065,1251,314356~A~r032,1252,314357~ ~r0112,1253,314358~'
-script += 'p~r097,1254,314359~a~r0115,1255,314360~s~r1256,314361~s~r097,1257,314362~a~r0103,1258,314363~g~r0101,1259,314364~'
-script += 'e~r0119,1260,314365~w~r097,1261,314366~a~r0121,1262,314367~y~r032,1263,314368~ ~r0108,1264,314369~l~r0101,1265,314370~'
-script += 'e~r097,1266,314371~a~r0100,1267,314372~d~r0115,1268,314373~s~r032,1269,314374~ ~r0110,1270,314375~n~r0111,1271,314376~'
-script += 'o~r0114,1272,314377~r~r0116,1273,314378~t~r0104,1274,314379~h~r032,1275,314380~ ~r097,1276,314381~a~r0110,1277,314382~'
-script += 'n~r0100,1278,314383~d~r032,1279,314384~ ~r0115,1280,314385~s~r0111,1281,314386~o~r0117,1282,314387~u'
-script += '~r0116,1283,314388~t~r0104,1284,314389~h~r044,1285,314390~,~r032,1286,314391~ ~r097,1287,314392~a~r0110,1288,314393~'
-script += 'n~r0100,1289,314394~d~r032,1290,314395~ ~r0116,1291,314396~t~r0104,1292,314397~h~r0101,1293,314398~e'
-script += '~r0114,1294,314399~r~r0101,1295,314400~e~r032,1296,314401~ ~r0105,1297,314402~i~r0115,1298,314403~s~r032,1299,314404~'
-script += ' ~r097,1300,314405~a~r0110,1301,314406~n~r032,1302,314407~ ~r097,1303,314408~a~r0108,1304,314409~l~r099,1305,314410~'
-script += 'c~r0111,1306,314411~o~r0118,1307,314412~v~r0101,1308,314413~e~r032,1309,314414~ ~r0116,1310,314415~t'
-script += '~r0111,1311,314416~o~r032,1312,314417~ ~r0116,1313,314418~t~r0104,1314,314419~h~r0101,1315,314420~e~r032,1316,314421~'
-script += ' ~r0101,1317,314422~e~r097,1318,314423~a~r0115,1319,314424~s~r0116,1320,314425~t~r046,1321,314426~.~r014104,10,34,4101,50,60~'
-script += '\n~r03~\nThere are ~r051,110,210,332765,451,51~3~r03,10,20,34,4101,50~ exits:\n~r014427,327206,43,55814,627205~'
-script += '- ~r0110,314428,45,51528,614427~n~r0111,11,314429~o~r0114,12,314430~r~r0116,13,314431~t~r0104,14,314432~'
-script += 'h~r014427,10,327206,43,55814,627205~\n~r014433,11,327207~- ~r0115,10,314434,45,51528,614433~s~r0111,11,314435~'
-script += 'o~r0117,12,314436~u~r0116,13,314437~t~r0104,14,314438~h~r014433,11,327207,43,55814,627205~\n~r014439,12,327208~'
-script += '- ~r0101,10,314440,44,51528,614439~e~r097,11,314441~a~r0115,12,314442~s~r0116,13,314443~t~r014439,12,327208,43,55814,627205~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~n~r025976,4110,51~o~r025977,4111,52~r~r025978,4114,53~t~r025979,4116,54~h~r025980,4104,55~\n'
-script += '~r032,20,34,4101,50~~moutput~\n\n~r02558,10,35~~v27322558~== ~r084,314635,413,51528,614634~T~r0114,11,314636~'
-script += 'r~r0111,12,314637~o~r0112,13,314638~p~r0105,14,314639~i~r099,15,314640~c~r097,16,314641~a~r0108,17,314642~'
-script += 'l~r032,18,314643~ ~r067,19,314644~C~r097,110,314645~a~r0118,111,314646~v~r0101,112,314647~e~r014634,10,35,4101,50,60~'
-script += ' ==\n~r084,314649,4104,51528,614648~T~r0104,11,314650~h~r0105,12,314651~i~r0115,13,314652~s~r032,14,314653~'
-script += ' ~r0116,15,314654~t~r0117,16,314655~u~r0110,17,314656~n~r18,314657~n~r0101,19,314658~e~r0108,110,314659~'
-script += 'l~r032,111,314660~ ~r0115,112,314661~s~r0108,113,314662~l~r0111,114,314663~o~r0112,115,314664~p~r0101,116,314665~'
-script += 'e~r0115,117,314666~s~r032,118,314667~ ~r0100,119,314668~d~r0101,120,314669~e~r121,314670~e~r0112,122,314671~'
-script += 'p~r0101,123,314672~e~r0114,124,314673~r~r032,125,314674~ ~r0117,126,314675~u~r0110,127,314676~n~r0100,128,314677~'
-script += 'd~r0101,129,314678~e~r0114,130,314679~r~r0103,131,314680~g~r0114,132,314681~r~r0111,133,314682~o~r0117,134,314683~'
-script += 'u~r0110,135,314684~n~r0100,136,314685~d~r032,137,314686~ ~r0116,138,314687~t~r0111,139,314688~o~r032,140,314689~'
-script += ' ~r0116,141,314690~t~r0104,142,314691~h~r0101,143,314692~e~r032,144,314693~ ~r0110,145,314694~n~r0111,146,314695~'
-script += 'o~r0114,147,314696~r~r0116,148,314697~t~r0104,149,314698~h~r044,150,314699~,~r032,151,314700~ ~r098,152,314701~'
-script += 'b~r0117,153,314702~u~r0116,154,314703~t~r032,155,314704~ ~r0116,156,314705~t~r0104,157,314706~h~r0101,158,314707~'
-script += 'e~r032,159,314708~ ~r0102,160,314709~f~r0105,161,314710~i~r0114,162,314711~r~r0101,163,314712~e~r0102,164,314713~'
-script += 'f~r0108,165,314714~l~r0105,166,314715~i~r0101,167,314716~e~r0115,168,314717~s~r032,169,314718~ ~r097,170,314719~'
-script += 'a~r0114,171,314720~r~r0101,172,314721~e~r032,173,314722~ ~r097,174,314723~a~r0108,175,314724~l~r176,314725~'
-script += 'l~r032,177,314726~ ~r097,178,314727~a~r0114,179,314728~r~r0111,180,314729~o~r0117,181,314730~u~r0110,182,314731~'
-script += 'n~r0100,183,314732~d~r032,184,314733~ ~r0116,185,314734~t~r0111,186,314735~o~r032,187,314736~ ~r0108,188,314737~'
-script += 'l~r0105,189,314738~i~r0103,190,314739~g~r0104,191,314740~h~r0116,192,314741~t~r032,193,314742~ ~r0121,194,314743~'
-script += 'y~r0111,195,314744~o~r0117,196,314745~u~r0114,197,314746~r~r032,198,314747~ ~r0112,199,314748~p~r097,1100,314749~'
-script += 'a~r0116,1101,314750~t~r0104,1102,314751~h~r046,1103,314752~.~r014648,10,35,4101,50,60~\n~r02~\nThere'
-script += ' are ~r050,110,210,332766,450,51~2~r02,10,20,35,4101,50~ exits:\n~r014753,327218,42,55814,627217~- ~r0110,314754,45,51528,614753~'
-script += 'n~r0111,11,314755~o~r0114,12,314756~r~r0116,13,314757~t~r0104,14,314758~h~r014753,10,327218,42,55814,627217~'
-script += '\n~r014759,11,327219~- ~r0115,10,314760,45,51528,614759~s~r0111,11,314761~o~r0117,12,314762~u~r0116,13,314763~'
-script += 't~r0104,14,314764~h~r014759,11,327219,42,55814,627217~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~n~r025976,4110,51~o~r025977,4111,52~'
-script += 'r~r025978,4114,53~t~r025979,4116,54~h~r025980,4104,55~\n~r032,20,35,4101,50~~moutput~\n\n~r02623,10~'
-script += '~v27322623~== ~r086,316792,417,51528,616791~V~r097,11,316793~a~r0117,12,316794~u~r0108,13,316795~l~r0116,14,316796~'
-script += 't~r032,15,316797~ ~r065,16,316798~A~r0110,17,316799~n~r0116,18,316800~t~r0101,19,316801~e~r099,110,316802~'
-script += 'c~r0104,111,316803~h~r097,112,316804~a~r0109,113,316805~m~r098,114,316806~b~r0101,115,316807~e~r0114,116,316808~'
-script += 'r~r016791,10,35,4101,50,60~ ==\n~r089,316810,4144,51528,616809~Y~r0111,11,316811~o~r0117,12,316812~u'
-script += '~r032,13,316813~ ~r097,14,316814~a~r0114,15,316815~r~r0101,16,316816~e~r032,17,316817~ ~r0105,18,316818~'
-script += 'i~r0110,19,316819~n~r032,110,316820~ ~r0116,111,316821~t~r0104,112,316822~h~r0101,113,316823~e~r032,114,316824~'
-script += ' ~r097,115,316825~a~r0110,116,316826~n~r0116,117,316827~t~r0101,118,316828~e~r099,119,316829~c~r0104,120,316830~'
-script += 'h~r097,121,316831~a~r0109,122,316832~m~r098,123,316833~b~r0101,124,316834~e~r0114,125,316835~r~r032,126,316836~'
-script += ' ~r0116,127,316837~t~r0111,128,316838~o~r032,129,316839~ ~r097,130,316840~a~r032,131,316841~ ~r0103,132,316842~'
-script += 'g~r0114,133,316843~r~r0105,134,316844~i~r0100,135,316845~d~r032,136,316846~ ~r0111,137,316847~o~r0102,138,316848~'
-script += 'f~r032,139,316849~ ~r0114,140,316850~r~r0111,141,316851~o~r142,316852~o~r0109,143,316853~m~r0115,144,316854~'
-script += 's~r032,145,316855~ ~r0116,146,316856~t~r0104,147,316857~h~r097,148,316858~a~r0116,149,316859~t~r032,150,316860~'
-script += ' ~r099,151,316861~c~r0111,152,316862~o~r0110,153,316863~n~r0116,154,316864~t~r0114,155,316865~r~r0111,156,316866~'
-script += 'o~r0108,157,316867~l~r032,158,316868~ ~r0116,159,316869~t~r0104,160,316870~h~r0101,161,316871~e~r032,162,316872~'
-script += ' ~r0100,163,316873~d~r0111,164,316874~o~r165,316875~o~r0114,166,316876~r~r032,167,316877~ ~r0116,168,316878~'
-script += 't~r0111,169,316879~o~r032,170,316880~ ~r0116,171,316881~t~r0104,172,316882~h~r0101,173,316883~e~r032,174,316884~'
-script += ' ~r0118,175,316885~v~r097,176,316886~a~r0117,177,316887~u~r0108,178,316888~l~r0116,179,316889~t~r046,180,316890~'
-script += '.~r032,181,316891~ ~r182,316892~ ~r089,183,316893~Y~r0111,184,316894~o~r0117,185,316895~u~r032,186,316896~'
-script += ' ~r0110,187,316897~n~r0111,188,316898~o~r0116,189,316899~t~r0105,190,316900~i~r099,191,316901~c~r0101,192,316902~'
-script += 'e~r032,193,316903~ ~r0116,194,316904~t~r0104,195,316905~h~r0101,196,316906~e~r032,197,316907~ ~r0110,198,316908~'
-script += 'n~r0117,199,316909~u~r0109,1100,316910~m~r098,1101,316911~b~r0101,1102,316912~e~r0114,1103,316913~r~r032,1104,316914~'
-script += ' ~r039,1105,316915~\'~r050,1106,316916~2~r1107,316917~2~r039,1108,316918~\'~r032,1109,316919~ ~r0105,1110,316920~'
-script += 'i~r0115,1111,316921~s~r032,1112,316922~ ~r099,1113,316923~c~r097,1114,316924~a~r0114,1115,316925~r~r0118,1116,316926~'
-script += 'v~r0101,1117,316927~e~r0100,1118,316928~d~r032,1119,316929~ ~r0105,1120,316930~i~r0110,1121,316931~n'
-script += '~r0116,1122,316932~t~r0111,1123,316933~o~r032,1124,316934~ ~r0116,1125,316935~t~r0104,1126,316936~h~r0101,1127,316937~'
-script += 'e~r032,1128,316938~ ~r0111,1129,316939~o~r0114,1130,316940~r~r098,1131,316941~b~r039,1132,316942~\'~r0115,1133,316943~'
-script += 's~r032,1134,316944~ ~r0112,1135,316945~p~r0101,1136,316946~e~r0100,1137,316947~d~r0101,1138,316948~e'
-script += '~r0115,1139,316949~s~r0116,1140,316950~t~r097,1141,316951~a~r0108,1142,316952~l~r046,1143,316953~.~r016809,10,35,4101,50,60~'
-script += '\n~r010,19212,29212,327456,426,51531,627455~\n~r084,327457~T~r0104,327458~h~r0105,327459~i~r0110,327460~'
-script += 'n~r0103,327461~g~r0115,327462~s~r032,327463~ ~r0111,327464~o~r0102,327465~f~r032,327466~ ~r0105,327467~'
-script += 'i~r0110,327468~n~r0116,327469~t~r0101,327470~e~r0114,327471~r~r0101,327472~e~r0115,327473~s~r0116,327474~'
-script += 't~r032,327475~ ~r0104,327476~h~r0101,327477~e~r0114,327478~r~r0101,327479~e~r058,327480~:~r010,327481~'
-script += '\n~r019192,114,22623,31,416,55893,627381~- ~r0111,10,319193,43,51528,619192~o~r0114,11,319194~r~r098,12,319195~'
-script += 'b~r019192,114,31,416,55893,627381~\n~r03,10,20,35,4101,50,60~\nThere are ~r051,110,210,332765,451,51~'
-script += '3~r03,10,20,35,4101,50~ exits:\n~r016954,327326,43,55814,627325~- ~r0110,316955,45,51528,616954~n~r0111,11,316956~'
-script += 'o~r0114,12,316957~r~r0116,13,316958~t~r0104,14,316959~h~r016954,10,327326,43,55814,627325~\n~r016960,11,327327~'
-script += '- ~r0101,10,316961,44,51528,616960~e~r097,11,316962~a~r0115,12,316963~s~r0116,13,316964~t~r016960,11,327327,43,55814,627325~'
-script += '\n~r016965,12,327328~- ~r0115,10,316966,45,51528,616965~s~r0111,11,316967~o~r0117,12,316968~u~r0116,13,316969~'
-script += 't~r0104,14,316970~h~r016965,12,327328,43,55814,627325~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~t~r025976,4116,51~a~r025977,497,52~'
-script += 'k~r025978,4107,53~e~r025979,4101,54~ ~r025980,432,55~o~r025981,4111,56~r~r025982,4114,57~b~r025983,498,58~'
-script += '\n~r032,20,35,4101,50~~moutput~\n\n~r084,114065,214065,328055,47,51531,628054~~v27180~T~r097,328056~'
-script += 'a~r0107,328057~k~r0101,328058~e~r0110,328059~n~r046,328060~.~r010,328061~\n~r132613,232613,327415,417,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~# At this point we\'re entering a'
-script += ' maze.  The "vaults" helper solves the maze and finds the following path to run through it\n~minput~'
-script += 'n~r025976,4110,51~o~r025977,4111,52~r~r025978,4114,53~t~r025979,4116,54~h~r025980,4104,55~\n~r032,24,33,4101,50~'
-script += '~moutput~\n\n~r065,10,20,326025,463,51528,626024~~v27322603~A~r0115,11,326026~s~r032,12,326027~ ~r0121,13,326028~'
-script += 'y~r0111,14,326029~o~r0117,15,326030~u~r032,16,326031~ ~r0101,17,326032~e~r0110,18,326033~n~r0116,19,326034~'
-script += 't~r0101,110,326035~e~r0114,111,326036~r~r032,112,326037~ ~r0116,113,326038~t~r0104,114,326039~h~r0101,115,326040~'
-script += 'e~r032,116,326041~ ~r0114,117,326042~r~r0111,118,326043~o~r119,326044~o~r0109,120,326045~m~r044,121,326046~'
-script += ',~r032,122,326047~ ~r0116,123,326048~t~r0104,124,326049~h~r0101,125,326050~e~r032,126,326051~ ~r0115,127,326052~'
-script += 's~r0121,128,326053~y~r0109,129,326054~m~r098,130,326055~b~r0111,131,326056~o~r0108,132,326057~l~r032,133,326058~'
-script += ' ~r0111,134,326059~o~r0110,135,326060~n~r032,136,326061~ ~r0116,137,326062~t~r0104,138,326063~h~r0101,139,326064~'
-script += 'e~r032,140,326065~ ~r0102,141,326066~f~r0108,142,326067~l~r0111,143,326068~o~r144,326069~o~r0114,145,326070~'
-script += 'r~r032,146,326071~ ~r098,147,326072~b~r0114,148,326073~r~r0105,149,326074~i~r0101,150,326075~e~r0102,151,326076~'
-script += 'f~r0108,152,326077~l~r0121,153,326078~y~r032,154,326079~ ~r0102,155,326080~f~r0108,156,326081~l~r097,157,326082~'
-script += 'a~r0115,158,326083~s~r0104,159,326084~h~r0101,160,326085~e~r0115,161,326086~s~r032,162,326087~ ~r0103,10,326008,45,626007~'
-script += 'g~r0114,11,326009~r~r0101,12,326010~e~r13,326011~e~r0110,14,326012~n~r046,10,326089,433,626088~.~r032,11,326090~'
-script += ' ~r12,326091~ ~r084,13,326092~T~r0104,14,326093~h~r0101,15,326094~e~r032,16,326095~ ~r0111,17,326096~'
-script += 'o~r0114,18,326097~r~r098,19,326098~b~r032,110,326099~ ~r098,111,326100~b~r0101,112,326101~e~r0103,113,326102~'
-script += 'g~r0105,114,326103~i~r0110,115,326104~n~r0115,116,326105~s~r032,117,326106~ ~r0115,118,326107~s~r0117,119,326108~'
-script += 'u~r098,120,326109~b~r0116,121,326110~t~r0108,122,326111~l~r0121,123,326112~y~r032,124,326113~ ~r0103,125,326114~'
-script += 'g~r0108,126,326115~l~r0111,127,326116~o~r0119,128,326117~w~r0105,129,326118~i~r0110,130,326119~n~r0103,131,326120~'
-script += 'g~r032,132,326121~ ~r0103,10,326008,45,626007~g~r0114,11,326009~r~r0101,12,326010~e~r13,326011~e~r0110,14,326012~'
-script += 'n~r026007,126007,35,4101,50,60~.\n\n~r02603,10~== ~r086,316149,410,51528,616148~V~r097,11,316150~a~r0117,12,316151~'
-script += 'u~r0108,13,316152~l~r0116,14,316153~t~r032,15,316154~ ~r076,16,316155~L~r0111,17,316156~o~r099,18,316157~'
-script += 'c~r0107,19,316158~k~r016148,10,35,4101,50,60~ ==\n~r089,316160,4128,51528,616159~Y~r0111,11,316161~o'
-script += '~r0117,12,316162~u~r032,13,316163~ ~r097,14,316164~a~r0114,15,316165~r~r0101,16,316166~e~r032,17,316167~'
-script += ' ~r0105,18,316168~i~r0110,19,316169~n~r032,110,316170~ ~r097,111,316171~a~r032,112,316172~ ~r0103,113,316173~'
-script += 'g~r0114,114,316174~r~r0105,115,316175~i~r0100,116,316176~d~r032,117,316177~ ~r0111,118,316178~o~r0102,119,316179~'
-script += 'f~r032,120,316180~ ~r0114,121,316181~r~r0111,122,316182~o~r123,316183~o~r0109,124,316184~m~r0115,125,316185~'
-script += 's~r032,126,316186~ ~r0116,127,316187~t~r0104,128,316188~h~r097,129,316189~a~r0116,130,316190~t~r032,131,316191~'
-script += ' ~r099,132,316192~c~r0111,133,316193~o~r0110,134,316194~n~r0116,135,316195~t~r0114,136,316196~r~r0111,137,316197~'
-script += 'o~r0108,138,316198~l~r032,139,316199~ ~r0116,140,316200~t~r0104,141,316201~h~r0101,142,316202~e~r032,143,316203~'
-script += ' ~r0100,144,316204~d~r0111,145,316205~o~r146,316206~o~r0114,147,316207~r~r032,148,316208~ ~r0116,149,316209~'
-script += 't~r0111,150,316210~o~r032,151,316211~ ~r0116,152,316212~t~r0104,153,316213~h~r0101,154,316214~e~r032,155,316215~'
-script += ' ~r0118,156,316216~v~r097,157,316217~a~r0117,158,316218~u~r0108,159,316219~l~r0116,160,316220~t~r046,161,316221~'
-script += '.~r010,162,316222~\n~r163,316223~\n~r084,164,316224~T~r0104,165,316225~h~r0101,166,316226~e~r032,167,316227~'
-script += ' ~r0102,168,316228~f~r0108,169,316229~l~r0111,170,316230~o~r171,316231~o~r0114,172,316232~r~r032,173,316233~'
-script += ' ~r0111,174,316234~o~r0102,175,316235~f~r032,176,316236~ ~r0116,177,316237~t~r0104,178,316238~h~r0105,179,316239~'
-script += 'i~r0115,180,316240~s~r032,181,316241~ ~r0114,182,316242~r~r0111,183,316243~o~r184,316244~o~r0109,185,316245~'
-script += 'm~r032,186,316246~ ~r0105,187,316247~i~r0115,188,316248~s~r032,189,316249~ ~r097,190,316250~a~r032,191,316251~'
-script += ' ~r0108,192,316252~l~r097,193,316253~a~r0114,194,316254~r~r0103,195,316255~g~r0101,196,316256~e~r032,197,316257~'
-script += ' ~r0109,198,316258~m~r0111,199,316259~o~r0115,1100,316260~s~r097,1101,316261~a~r0105,1102,316262~i~r099,1103,316263~'
-script += 'c~r032,1104,316264~ ~r0100,1105,316265~d~r0101,1106,316266~e~r0112,1107,316267~p~r0105,1108,316268~i'
-script += '~r099,1109,316269~c~r0116,1110,316270~t~r0105,1111,316271~i~r0110,1112,316272~n~r0103,1113,316273~g~r032,1114,316274~'
-script += ' ~r097,1115,316275~a~r032,1116,316276~ ~r039,1117,316277~\'~r043,1118,316278~+~r039,1119,316279~\'~r032,1120,316280~'
-script += ' ~r0115,1121,316281~s~r0121,1122,316282~y~r0109,1123,316283~m~r098,1124,316284~b~r0111,1125,316285~o'
-script += '~r0108,1126,316286~l~r046,1127,316287~.~r016159,10,35,4101,50,60~\n~r03~\nThere are ~r051,110,210,332765,451,51~'
-script += '3~r03,10,20,35,4101,50~ exits:\n~r016288,327290,43,55814,627289~- ~r0110,316289,45,51528,616288~n~r0111,11,316290~'
-script += 'o~r0114,12,316291~r~r0116,13,316292~t~r0104,14,316293~h~r016288,10,327290,43,55814,627289~\n~r016294,11,327291~'
-script += '- ~r0101,10,316295,44,51528,616294~e~r097,11,316296~a~r0115,12,316297~s~r0116,13,316298~t~r016294,11,327291,43,55814,627289~'
-script += '\n~r016299,12,327292~- ~r0115,10,316300,45,51528,616299~s~r0111,11,316301~o~r0117,12,316302~u~r0116,13,316303~'
-script += 't~r0104,14,316304~h~r016299,12,327292,43,55814,627289~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~e~r025976,51~a~r025977,497,52~'
-script += 's~r025978,4115,53~t~r025979,4116,54~\n~r032,20,35,4101,50~~moutput~\n\n~r065,10,326123,447,51528,626122~'
-script += '~v27322608~A~r0115,11,326124~s~r032,12,326125~ ~r0121,13,326126~y~r0111,14,326127~o~r0117,15,326128~'
-script += 'u~r032,16,326129~ ~r0101,17,326130~e~r0110,18,326131~n~r0116,19,326132~t~r0101,110,326133~e~r0114,111,326134~'
-script += 'r~r032,112,326135~ ~r0116,113,326136~t~r0104,114,326137~h~r0101,115,326138~e~r032,116,326139~ ~r0114,117,326140~'
-script += 'r~r0111,118,326141~o~r119,326142~o~r0109,120,326143~m~r044,121,326144~,~r032,122,326145~ ~r0116,123,326146~'
-script += 't~r0104,124,326147~h~r0101,125,326148~e~r032,126,326149~ ~r0111,127,326150~o~r0114,128,326151~r~r098,129,326152~'
-script += 'b~r032,130,326153~ ~r098,131,326154~b~r0114,132,326155~r~r0105,133,326156~i~r0101,134,326157~e~r0102,135,326158~'
-script += 'f~r0108,136,326159~l~r0121,137,326160~y~r032,138,326161~ ~r0102,139,326162~f~r0108,140,326163~l~r097,141,326164~'
-script += 'a~r0115,142,326165~s~r0104,143,326166~h~r0101,144,326167~e~r0115,145,326168~s~r032,146,326169~ ~r0103,10,326008,45,626007~'
-script += 'g~r0114,11,326009~r~r0101,12,326010~e~r13,326011~e~r0110,14,326012~n~r046,10,326171,464,626170~.~r032,11,326172~'
-script += ' ~r12,326173~ ~r084,13,326174~T~r0104,14,326175~h~r0101,15,326176~e~r032,16,326177~ ~r0110,17,326178~'
-script += 'n~r0117,18,326179~u~r0109,19,326180~m~r098,110,326181~b~r0101,111,326182~e~r0114,112,326183~r~r032,113,326184~'
-script += ' ~r0111,114,326185~o~r0110,115,326186~n~r032,116,326187~ ~r0116,117,326188~t~r0104,118,326189~h~r0101,119,326190~'
-script += 'e~r032,120,326191~ ~r0102,121,326192~f~r0108,122,326193~l~r0111,123,326194~o~r124,326195~o~r0114,125,326196~'
-script += 'r~r032,126,326197~ ~r0118,127,326198~v~r0105,128,326199~i~r098,129,326200~b~r0114,130,326201~r~r097,131,326202~'
-script += 'a~r0116,132,326203~t~r0101,133,326204~e~r0115,134,326205~s~r032,135,326206~ ~r0115,136,326207~s~r0116,137,326208~'
-script += 't~r0114,138,326209~r~r097,139,326210~a~r0110,140,326211~n~r0103,141,326212~g~r0101,142,326213~e~r0108,143,326214~'
-script += 'l~r0121,144,326215~y~r032,145,326216~ ~r098,146,326217~b~r0101,147,326218~e~r0110,148,326219~n~r0101,149,326220~'
-script += 'e~r097,150,326221~a~r0116,151,326222~t~r0104,152,326223~h~r032,153,326224~ ~r0121,154,326225~y~r0111,155,326226~'
-script += 'o~r0117,156,326227~u~r0114,157,326228~r~r032,158,326229~ ~r0102,159,326230~f~r0101,160,326231~e~r161,326232~'
-script += 'e~r0116,162,326233~t~r046,163,326234~.~r032,10,21,326236,431,626235~ ~r11,326237~ ~r084,12,326238~T~r0104,13,326239~'
-script += 'h~r0101,14,326240~e~r032,15,326241~ ~r0111,16,326242~o~r0114,17,326243~r~r098,18,326244~b~r032,19,326245~'
-script += ' ~r0115,110,326246~s~r0101,111,326247~e~r112,326248~e~r0109,113,326249~m~r0115,114,326250~s~r032,115,326251~'
-script += ' ~r0116,116,326252~t~r0111,117,326253~o~r032,118,326254~ ~r0103,119,326255~g~r0101,120,326256~e~r0116,121,326257~'
-script += 't~r032,122,326258~ ~r0104,123,326259~h~r0101,124,326260~e~r097,125,326261~a~r0118,126,326262~v~r0105,127,326263~'
-script += 'i~r0101,128,326264~e~r0114,129,326265~r~r046,130,326266~.~r026,122,20,34,4101,50,60~\n\n~r02608,10~='
-script += '= ~r086,316306,410,51528,616305~V~r097,11,316307~a~r0117,12,316308~u~r0108,13,316309~l~r0116,14,316310~'
-script += 't~r032,15,316311~ ~r076,16,316312~L~r0111,17,316313~o~r099,18,316314~c~r0107,19,316315~k~r016305,10,34,4101,50,60~'
-script += ' ==\n~r089,316317,4130,51528,616316~Y~r0111,11,316318~o~r0117,12,316319~u~r032,13,316320~ ~r097,14,316321~'
-script += 'a~r0114,15,316322~r~r0101,16,316323~e~r032,17,316324~ ~r0105,18,316325~i~r0110,19,316326~n~r032,110,316327~'
-script += ' ~r097,111,316328~a~r032,112,316329~ ~r0103,113,316330~g~r0114,114,316331~r~r0105,115,316332~i~r0100,116,316333~'
-script += 'd~r032,117,316334~ ~r0111,118,316335~o~r0102,119,316336~f~r032,120,316337~ ~r0114,121,316338~r~r0111,122,316339~'
-script += 'o~r123,316340~o~r0109,124,316341~m~r0115,125,316342~s~r032,126,316343~ ~r0116,127,316344~t~r0104,128,316345~'
-script += 'h~r097,129,316346~a~r0116,130,316347~t~r032,131,316348~ ~r099,132,316349~c~r0111,133,316350~o~r0110,134,316351~'
-script += 'n~r0116,135,316352~t~r0114,136,316353~r~r0111,137,316354~o~r0108,138,316355~l~r032,139,316356~ ~r0116,140,316357~'
-script += 't~r0104,141,316358~h~r0101,142,316359~e~r032,143,316360~ ~r0100,144,316361~d~r0111,145,316362~o~r146,316363~'
-script += 'o~r0114,147,316364~r~r032,148,316365~ ~r0116,149,316366~t~r0111,150,316367~o~r032,151,316368~ ~r0116,152,316369~'
-script += 't~r0104,153,316370~h~r0101,154,316371~e~r032,155,316372~ ~r0118,156,316373~v~r097,157,316374~a~r0117,158,316375~'
-script += 'u~r0108,159,316376~l~r0116,160,316377~t~r046,161,316378~.~r010,162,316379~\n~r163,316380~\n~r084,164,316381~'
-script += 'T~r0104,165,316382~h~r0101,166,316383~e~r032,167,316384~ ~r0102,168,316385~f~r0108,169,316386~l~r0111,170,316387~'
-script += 'o~r171,316388~o~r0114,172,316389~r~r032,173,316390~ ~r0111,174,316391~o~r0102,175,316392~f~r032,176,316393~'
-script += ' ~r0116,177,316394~t~r0104,178,316395~h~r0105,179,316396~i~r0115,180,316397~s~r032,181,316398~ ~r0114,182,316399~'
-script += 'r~r0111,183,316400~o~r184,316401~o~r0109,185,316402~m~r032,186,316403~ ~r0105,187,316404~i~r0115,188,316405~'
-script += 's~r032,189,316406~ ~r097,190,316407~a~r032,191,316408~ ~r0108,192,316409~l~r097,193,316410~a~r0114,194,316411~'
-script += 'r~r0103,195,316412~g~r0101,196,316413~e~r032,197,316414~ ~r0109,198,316415~m~r0111,199,316416~o~r0115,1100,316417~'
-script += 's~r097,1101,316418~a~r0105,1102,316419~i~r099,1103,316420~c~r032,1104,316421~ ~r0100,1105,316422~d~r0101,1106,316423~'
-script += 'e~r0112,1107,316424~p~r0105,1108,316425~i~r099,1109,316426~c~r0116,1110,316427~t~r0105,1111,316428~i'
-script += '~r0110,1112,316429~n~r0103,1113,316430~g~r032,1114,316431~ ~r0116,1115,316432~t~r0104,1116,316433~h~r0101,1117,316434~'
-script += 'e~r032,1118,316435~ ~r0110,1119,316436~n~r0117,1120,316437~u~r0109,1121,316438~m~r098,1122,316439~b~r0101,1123,316440~'
-script += 'e~r0114,1124,316441~r~r032,1125,316442~ ~r039,1126,316443~\'~r052,1127,316444~4~r039,1128,316445~\'~r046,1129,316446~'
-script += '.~r016316,10,34,4101,50,60~\n~r04~\nThere are ~r052,110,210,332764,452,51~4~r04,10,20,34,4101,50~ ex'
-script += 'its:\n~r016447,327298,44,55814,627297~- ~r0110,316448,45,51528,616447~n~r0111,11,316449~o~r0114,12,316450~'
-script += 'r~r0116,13,316451~t~r0104,14,316452~h~r016447,10,327298,44,55814,627297~\n~r016453,11,327299~- ~r0101,10,316454,51528,616453~'
-script += 'e~r097,11,316455~a~r0115,12,316456~s~r0116,13,316457~t~r016453,11,327299,55814,627297~\n~r016458,12,327300~'
-script += '- ~r0115,10,316459,45,51528,616458~s~r0111,11,316460~o~r0117,12,316461~u~r0116,13,316462~t~r0104,14,316463~'
-script += 'h~r016458,12,327300,44,55814,627297~\n~r016464,13,327301~- ~r0119,10,316465,51528,616464~w~r0101,11,316466~'
-script += 'e~r0115,12,316467~s~r0116,13,316468~t~r016464,327301,55814,627297~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~e~r025976,51~a~r025977,497,52~'
-script += 's~r025978,4115,53~t~r025979,4116,54~\n~r032,20,34,4101,50~~moutput~\n\n~r065,10,326025,463,51528,626024~'
-script += '~v27322613~A~r0115,11,326026~s~r032,12,326027~ ~r0121,13,326028~y~r0111,14,326029~o~r0117,15,326030~'
-script += 'u~r032,16,326031~ ~r0101,17,326032~e~r0110,18,326033~n~r0116,19,326034~t~r0101,110,326035~e~r0114,111,326036~'
-script += 'r~r032,112,326037~ ~r0116,113,326038~t~r0104,114,326039~h~r0101,115,326040~e~r032,116,326041~ ~r0114,117,326042~'
-script += 'r~r0111,118,326043~o~r119,326044~o~r0109,120,326045~m~r044,121,326046~,~r032,122,326047~ ~r0116,123,326048~'
-script += 't~r0104,124,326049~h~r0101,125,326050~e~r032,126,326051~ ~r0115,127,326052~s~r0121,128,326053~y~r0109,129,326054~'
-script += 'm~r098,130,326055~b~r0111,131,326056~o~r0108,132,326057~l~r032,133,326058~ ~r0111,134,326059~o~r0110,135,326060~'
-script += 'n~r032,136,326061~ ~r0116,137,326062~t~r0104,138,326063~h~r0101,139,326064~e~r032,140,326065~ ~r0102,141,326066~'
-script += 'f~r0108,142,326067~l~r0111,143,326068~o~r144,326069~o~r0114,145,326070~r~r032,146,326071~ ~r098,147,326072~'
-script += 'b~r0114,148,326073~r~r0105,149,326074~i~r0101,150,326075~e~r0102,151,326076~f~r0108,152,326077~l~r0121,153,326078~'
-script += 'y~r032,154,326079~ ~r0102,155,326080~f~r0108,156,326081~l~r097,157,326082~a~r0115,158,326083~s~r0104,159,326084~'
-script += 'h~r0101,160,326085~e~r0115,161,326086~s~r032,162,326087~ ~r0114,10,326014,43,626013~r~r0101,11,326015~'
-script += 'e~r0100,12,326016~d~r046,10,326089,433,626088~.~r032,11,326090~ ~r12,326091~ ~r084,13,326092~T~r0104,14,326093~'
-script += 'h~r0101,15,326094~e~r032,16,326095~ ~r0111,17,326096~o~r0114,18,326097~r~r098,19,326098~b~r032,110,326099~'
-script += ' ~r098,111,326100~b~r0101,112,326101~e~r0103,113,326102~g~r0105,114,326103~i~r0110,115,326104~n~r0115,116,326105~'
-script += 's~r032,117,326106~ ~r0115,118,326107~s~r0117,119,326108~u~r098,120,326109~b~r0116,121,326110~t~r0108,122,326111~'
-script += 'l~r0121,123,326112~y~r032,124,326113~ ~r0103,125,326114~g~r0108,126,326115~l~r0111,127,326116~o~r0119,128,326117~'
-script += 'w~r0105,129,326118~i~r0110,130,326119~n~r0103,131,326120~g~r032,132,326121~ ~r0114,10,326014,43,626013~'
-script += 'r~r0101,11,326015~e~r0100,12,326016~d~r026013,126013,34,4101,50,60~.\n\n~r02613,10~== ~r086,316470,410,51528,616469~'
-script += 'V~r097,11,316471~a~r0117,12,316472~u~r0108,13,316473~l~r0116,14,316474~t~r032,15,316475~ ~r076,16,316476~'
-script += 'L~r0111,17,316477~o~r099,18,316478~c~r0107,19,316479~k~r016469,10,34,4101,50,60~ ==\n~r089,316481,4128,51528,616480~'
-script += 'Y~r0111,11,316482~o~r0117,12,316483~u~r032,13,316484~ ~r097,14,316485~a~r0114,15,316486~r~r0101,16,316487~'
-script += 'e~r032,17,316488~ ~r0105,18,316489~i~r0110,19,316490~n~r032,110,316491~ ~r097,111,316492~a~r032,112,316493~'
-script += ' ~r0103,113,316494~g~r0114,114,316495~r~r0105,115,316496~i~r0100,116,316497~d~r032,117,316498~ ~r0111,118,316499~'
-script += 'o~r0102,119,316500~f~r032,120,316501~ ~r0114,121,316502~r~r0111,122,316503~o~r123,316504~o~r0109,124,316505~'
-script += 'm~r0115,125,316506~s~r032,126,316507~ ~r0116,127,316508~t~r0104,128,316509~h~r097,129,316510~a~r0116,130,316511~'
-script += 't~r032,131,316512~ ~r099,132,316513~c~r0111,133,316514~o~r0110,134,316515~n~r0116,135,316516~t~r0114,136,316517~'
-script += 'r~r0111,137,316518~o~r0108,138,316519~l~r032,139,316520~ ~r0116,140,316521~t~r0104,141,316522~h~r0101,142,316523~'
-script += 'e~r032,143,316524~ ~r0100,144,316525~d~r0111,145,316526~o~r146,316527~o~r0114,147,316528~r~r032,148,316529~'
-script += ' ~r0116,149,316530~t~r0111,150,316531~o~r032,151,316532~ ~r0116,152,316533~t~r0104,153,316534~h~r0101,154,316535~'
-script += 'e~r032,155,316536~ ~r0118,156,316537~v~r097,157,316538~a~r0117,158,316539~u~r0108,159,316540~l~r0116,160,316541~'
-script += 't~r046,161,316542~.~r010,162,316543~\n~r163,316544~\n~r084,164,316545~T~r0104,165,316546~h~r0101,166,316547~'
-script += 'e~r032,167,316548~ ~r0102,168,316549~f~r0108,169,316550~l~r0111,170,316551~o~r171,316552~o~r0114,172,316553~'
-script += 'r~r032,173,316554~ ~r0111,174,316555~o~r0102,175,316556~f~r032,176,316557~ ~r0116,177,316558~t~r0104,178,316559~'
-script += 'h~r0105,179,316560~i~r0115,180,316561~s~r032,181,316562~ ~r0114,182,316563~r~r0111,183,316564~o~r184,316565~'
-script += 'o~r0109,185,316566~m~r032,186,316567~ ~r0105,187,316568~i~r0115,188,316569~s~r032,189,316570~ ~r097,190,316571~'
-script += 'a~r032,191,316572~ ~r0108,192,316573~l~r097,193,316574~a~r0114,194,316575~r~r0103,195,316576~g~r0101,196,316577~'
-script += 'e~r032,197,316578~ ~r0109,198,316579~m~r0111,199,316580~o~r0115,1100,316581~s~r097,1101,316582~a~r0105,1102,316583~'
-script += 'i~r099,1103,316584~c~r032,1104,316585~ ~r0100,1105,316586~d~r0101,1106,316587~e~r0112,1107,316588~p~r0105,1108,316589~'
-script += 'i~r099,1109,316590~c~r0116,1110,316591~t~r0105,1111,316592~i~r0110,1112,316593~n~r0103,1113,316594~g'
-script += '~r032,1114,316595~ ~r097,1115,316596~a~r032,1116,316597~ ~r039,1117,316598~\'~r045,1118,316599~-~r039,1119,316600~'
-script += '\'~r032,1120,316601~ ~r0115,1121,316602~s~r0121,1122,316603~y~r0109,1123,316604~m~r098,1124,316605~b'
-script += '~r0111,1125,316606~o~r0108,1126,316607~l~r046,1127,316608~.~r016480,10,34,4101,50,60~\n~r04~\nThere '
-script += 'are ~r052,110,210,332764,452,51~4~r04,10,20,34,4101,50~ exits:\n~r016609,327308,44,55814,627307~- ~r0110,316610,45,51528,616609~'
-script += 'n~r0111,11,316611~o~r0114,12,316612~r~r0116,13,316613~t~r0104,14,316614~h~r016609,10,327308,44,55814,627307~'
-script += '\n~r016615,11,327309~- ~r0101,10,316616,51528,616615~e~r097,11,316617~a~r0115,12,316618~s~r0116,13,316619~'
-script += 't~r016615,11,327309,55814,627307~\n~r016620,12,327310~- ~r0115,10,316621,45,51528,616620~s~r0111,11,316622~'
-script += 'o~r0117,12,316623~u~r0116,13,316624~t~r0104,14,316625~h~r016620,12,327310,44,55814,627307~\n~r016626,13,327311~'
-script += '- ~r0119,10,316627,51528,616626~w~r0101,11,316628~e~r0115,12,316629~s~r0116,13,316630~t~r016626,327311,55814,627307~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~n~r025976,4110,51~o~r025977,4111,52~r~r025978,4114,53~t~r025979,4116,54~h~r025980,4104,55~\n'
-script += '~r032,20,34,4101,50~~moutput~\n\n~r065,10,326123,447,51528,626122~~v27322593~A~r0115,11,326124~s~r032,12,326125~'
-script += ' ~r0121,13,326126~y~r0111,14,326127~o~r0117,15,326128~u~r032,16,326129~ ~r0101,17,326130~e~r0110,18,326131~'
-script += 'n~r0116,19,326132~t~r0101,110,326133~e~r0114,111,326134~r~r032,112,326135~ ~r0116,113,326136~t~r0104,114,326137~'
-script += 'h~r0101,115,326138~e~r032,116,326139~ ~r0114,117,326140~r~r0111,118,326141~o~r119,326142~o~r0109,120,326143~'
-script += 'm~r044,121,326144~,~r032,122,326145~ ~r0116,123,326146~t~r0104,124,326147~h~r0101,125,326148~e~r032,126,326149~'
-script += ' ~r0111,127,326150~o~r0114,128,326151~r~r098,129,326152~b~r032,130,326153~ ~r098,131,326154~b~r0114,132,326155~'
-script += 'r~r0105,133,326156~i~r0101,134,326157~e~r0102,135,326158~f~r0108,136,326159~l~r0121,137,326160~y~r032,138,326161~'
-script += ' ~r0102,139,326162~f~r0108,140,326163~l~r097,141,326164~a~r0115,142,326165~s~r0104,143,326166~h~r0101,144,326167~'
-script += 'e~r0115,145,326168~s~r032,146,326169~ ~r0114,10,326014,43,626013~r~r0101,11,326015~e~r0100,12,326016~'
-script += 'd~r046,10,326171,464,626170~.~r032,11,326172~ ~r12,326173~ ~r084,13,326174~T~r0104,14,326175~h~r0101,15,326176~'
-script += 'e~r032,16,326177~ ~r0110,17,326178~n~r0117,18,326179~u~r0109,19,326180~m~r098,110,326181~b~r0101,111,326182~'
-script += 'e~r0114,112,326183~r~r032,113,326184~ ~r0111,114,326185~o~r0110,115,326186~n~r032,116,326187~ ~r0116,117,326188~'
-script += 't~r0104,118,326189~h~r0101,119,326190~e~r032,120,326191~ ~r0102,121,326192~f~r0108,122,326193~l~r0111,123,326194~'
-script += 'o~r124,326195~o~r0114,125,326196~r~r032,126,326197~ ~r0118,127,326198~v~r0105,128,326199~i~r098,129,326200~'
-script += 'b~r0114,130,326201~r~r097,131,326202~a~r0116,132,326203~t~r0101,133,326204~e~r0115,134,326205~s~r032,135,326206~'
-script += ' ~r0115,136,326207~s~r0116,137,326208~t~r0114,138,326209~r~r097,139,326210~a~r0110,140,326211~n~r0103,141,326212~'
-script += 'g~r0101,142,326213~e~r0108,143,326214~l~r0121,144,326215~y~r032,145,326216~ ~r098,146,326217~b~r0101,147,326218~'
-script += 'e~r0110,148,326219~n~r0101,149,326220~e~r097,150,326221~a~r0116,151,326222~t~r0104,152,326223~h~r032,153,326224~'
-script += ' ~r0121,154,326225~y~r0111,155,326226~o~r0117,156,326227~u~r0114,157,326228~r~r032,158,326229~ ~r0102,159,326230~'
-script += 'f~r0101,160,326231~e~r161,326232~e~r0116,162,326233~t~r046,163,326234~.~r032,10,21,326268,431,626267~'
-script += ' ~r11,326269~ ~r084,12,326270~T~r0104,13,326271~h~r0101,14,326272~e~r032,15,326273~ ~r0111,16,326274~'
-script += 'o~r0114,17,326275~r~r098,18,326276~b~r032,19,326277~ ~r0115,110,326278~s~r0101,111,326279~e~r112,326280~'
-script += 'e~r0109,113,326281~m~r0115,114,326282~s~r032,115,326283~ ~r0116,116,326284~t~r0111,117,326285~o~r032,118,326286~'
-script += ' ~r0103,119,326287~g~r0101,120,326288~e~r0116,121,326289~t~r032,122,326290~ ~r0108,123,326291~l~r0105,124,326292~'
-script += 'i~r0103,125,326293~g~r0104,126,326294~h~r0116,127,326295~t~r0101,128,326296~e~r0114,129,326297~r~r046,130,326298~'
-script += '.~r015,126,35,4101,50,60~\n\n~r02593,10,20~== ~r086,315827,410,51528,615826~V~r097,11,315828~a~r0117,12,315829~'
-script += 'u~r0108,13,315830~l~r0116,14,315831~t~r032,15,315832~ ~r076,16,315833~L~r0111,17,315834~o~r099,18,315835~'
-script += 'c~r0107,19,315836~k~r015826,10,35,4101,50,60~ ==\n~r089,315838,4131,51528,615837~Y~r0111,11,315839~o'
-script += '~r0117,12,315840~u~r032,13,315841~ ~r097,14,315842~a~r0114,15,315843~r~r0101,16,315844~e~r032,17,315845~'
-script += ' ~r0105,18,315846~i~r0110,19,315847~n~r032,110,315848~ ~r097,111,315849~a~r032,112,315850~ ~r0103,113,315851~'
-script += 'g~r0114,114,315852~r~r0105,115,315853~i~r0100,116,315854~d~r032,117,315855~ ~r0111,118,315856~o~r0102,119,315857~'
-script += 'f~r032,120,315858~ ~r0114,121,315859~r~r0111,122,315860~o~r123,315861~o~r0109,124,315862~m~r0115,125,315863~'
-script += 's~r032,126,315864~ ~r0116,127,315865~t~r0104,128,315866~h~r097,129,315867~a~r0116,130,315868~t~r032,131,315869~'
-script += ' ~r099,132,315870~c~r0111,133,315871~o~r0110,134,315872~n~r0116,135,315873~t~r0114,136,315874~r~r0111,137,315875~'
-script += 'o~r0108,138,315876~l~r032,139,315877~ ~r0116,140,315878~t~r0104,141,315879~h~r0101,142,315880~e~r032,143,315881~'
-script += ' ~r0100,144,315882~d~r0111,145,315883~o~r146,315884~o~r0114,147,315885~r~r032,148,315886~ ~r0116,149,315887~'
-script += 't~r0111,150,315888~o~r032,151,315889~ ~r0116,152,315890~t~r0104,153,315891~h~r0101,154,315892~e~r032,155,315893~'
-script += ' ~r0118,156,315894~v~r097,157,315895~a~r0117,158,315896~u~r0108,159,315897~l~r0116,160,315898~t~r046,161,315899~'
-script += '.~r010,162,315900~\n~r163,315901~\n~r084,164,315902~T~r0104,165,315903~h~r0101,166,315904~e~r032,167,315905~'
-script += ' ~r0102,168,315906~f~r0108,169,315907~l~r0111,170,315908~o~r171,315909~o~r0114,172,315910~r~r032,173,315911~'
-script += ' ~r0111,174,315912~o~r0102,175,315913~f~r032,176,315914~ ~r0116,177,315915~t~r0104,178,315916~h~r0105,179,315917~'
-script += 'i~r0115,180,315918~s~r032,181,315919~ ~r0114,182,315920~r~r0111,183,315921~o~r184,315922~o~r0109,185,315923~'
-script += 'm~r032,186,315924~ ~r0105,187,315925~i~r0115,188,315926~s~r032,189,315927~ ~r097,190,315928~a~r032,191,315929~'
-script += ' ~r0108,192,315930~l~r097,193,315931~a~r0114,194,315932~r~r0103,195,315933~g~r0101,196,315934~e~r032,197,315935~'
-script += ' ~r0109,198,315936~m~r0111,199,315937~o~r0115,1100,315938~s~r097,1101,315939~a~r0105,1102,315940~i~r099,1103,315941~'
-script += 'c~r032,1104,315942~ ~r0100,1105,315943~d~r0101,1106,315944~e~r0112,1107,315945~p~r0105,1108,315946~i'
-script += '~r099,1109,315947~c~r0116,1110,315948~t~r0105,1111,315949~i~r0110,1112,315950~n~r0103,1113,315951~g~r032,1114,315952~'
-script += ' ~r0116,1115,315953~t~r0104,1116,315954~h~r0101,1117,315955~e~r032,1118,315956~ ~r0110,1119,315957~n'
-script += '~r0117,1120,315958~u~r0109,1121,315959~m~r098,1122,315960~b~r0101,1123,315961~e~r0114,1124,315962~r~r032,1125,315963~'
-script += ' ~r039,1126,315964~\'~r049,1127,315965~1~r1128,315966~1~r039,1129,315967~\'~r046,1130,315968~.~r015837,10,35,4101,50,60~'
-script += '\n~r04~\nThere are ~r052,110,210,332764,452,51~4~r04,10,20,35,4101,50~ exits:\n~r015969,327272,44,55814,627271~'
-script += '- ~r0110,315970,45,51528,615969~n~r0111,11,315971~o~r0114,12,315972~r~r0116,13,315973~t~r0104,14,315974~'
-script += 'h~r015969,10,327272,44,55814,627271~\n~r015975,11,327273~- ~r0101,10,315976,51528,615975~e~r097,11,315977~'
-script += 'a~r0115,12,315978~s~r0116,13,315979~t~r015975,11,327273,55814,627271~\n~r015980,12,327274~- ~r0115,10,315981,45,51528,615980~'
-script += 's~r0111,11,315982~o~r0117,12,315983~u~r0116,13,315984~t~r0104,14,315985~h~r015980,12,327274,44,55814,627271~'
-script += '\n~r015986,13,327275~- ~r0119,10,315987,51528,615986~w~r0101,11,315988~e~r0115,12,315989~s~r0116,13,315990~'
-script += 't~r015986,327275,55814,627271~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~w~r025976,4119,51~e~r025977,4101,52~s~r025978,4115,53~'
-script += 't~r025979,4116,54~\n~r032,20,35,4101,50~~moutput~\n\n~r065,10,326025,463,51528,626024~~v27322588~A~r0115,11,326026~'
-script += 's~r032,12,326027~ ~r0121,13,326028~y~r0111,14,326029~o~r0117,15,326030~u~r032,16,326031~ ~r0101,17,326032~'
-script += 'e~r0110,18,326033~n~r0116,19,326034~t~r0101,110,326035~e~r0114,111,326036~r~r032,112,326037~ ~r0116,113,326038~'
-script += 't~r0104,114,326039~h~r0101,115,326040~e~r032,116,326041~ ~r0114,117,326042~r~r0111,118,326043~o~r119,326044~'
-script += 'o~r0109,120,326045~m~r044,121,326046~,~r032,122,326047~ ~r0116,123,326048~t~r0104,124,326049~h~r0101,125,326050~'
-script += 'e~r032,126,326051~ ~r0115,127,326052~s~r0121,128,326053~y~r0109,129,326054~m~r098,130,326055~b~r0111,131,326056~'
-script += 'o~r0108,132,326057~l~r032,133,326058~ ~r0111,134,326059~o~r0110,135,326060~n~r032,136,326061~ ~r0116,137,326062~'
-script += 't~r0104,138,326063~h~r0101,139,326064~e~r032,140,326065~ ~r0102,141,326066~f~r0108,142,326067~l~r0111,143,326068~'
-script += 'o~r144,326069~o~r0114,145,326070~r~r032,146,326071~ ~r098,147,326072~b~r0114,148,326073~r~r0105,149,326074~'
-script += 'i~r0101,150,326075~e~r0102,151,326076~f~r0108,152,326077~l~r0121,153,326078~y~r032,154,326079~ ~r0102,155,326080~'
-script += 'f~r0108,156,326081~l~r097,157,326082~a~r0115,158,326083~s~r0104,159,326084~h~r0101,160,326085~e~r0115,161,326086~'
-script += 's~r032,162,326087~ ~r0121,10,326018,46,626017~y~r0101,11,326019~e~r0108,12,326020~l~r13,326021~l~r0111,14,326022~'
-script += 'o~r0119,15,326023~w~r046,10,326089,433,626088~.~r032,11,326090~ ~r12,326091~ ~r084,13,326092~T~r0104,14,326093~'
-script += 'h~r0101,15,326094~e~r032,16,326095~ ~r0111,17,326096~o~r0114,18,326097~r~r098,19,326098~b~r032,110,326099~'
-script += ' ~r098,111,326100~b~r0101,112,326101~e~r0103,113,326102~g~r0105,114,326103~i~r0110,115,326104~n~r0115,116,326105~'
-script += 's~r032,117,326106~ ~r0115,118,326107~s~r0117,119,326108~u~r098,120,326109~b~r0116,121,326110~t~r0108,122,326111~'
-script += 'l~r0121,123,326112~y~r032,124,326113~ ~r0103,125,326114~g~r0108,126,326115~l~r0111,127,326116~o~r0119,128,326117~'
-script += 'w~r0105,129,326118~i~r0110,130,326119~n~r0103,131,326120~g~r032,132,326121~ ~r0121,10,326018,46,626017~'
-script += 'y~r0101,11,326019~e~r0108,12,326020~l~r13,326021~l~r0111,14,326022~o~r0119,15,326023~w~r026017,126017,34,4101,50,60~'
-script += '.\n\n~r02588,10~== ~r086,315665,410,51528,615664~V~r097,11,315666~a~r0117,12,315667~u~r0108,13,315668~'
-script += 'l~r0116,14,315669~t~r032,15,315670~ ~r076,16,315671~L~r0111,17,315672~o~r099,18,315673~c~r0107,19,315674~'
-script += 'k~r015664,10,34,4101,50,60~ ==\n~r089,315676,4128,51528,615675~Y~r0111,11,315677~o~r0117,12,315678~u'
-script += '~r032,13,315679~ ~r097,14,315680~a~r0114,15,315681~r~r0101,16,315682~e~r032,17,315683~ ~r0105,18,315684~'
-script += 'i~r0110,19,315685~n~r032,110,315686~ ~r097,111,315687~a~r032,112,315688~ ~r0103,113,315689~g~r0114,114,315690~'
-script += 'r~r0105,115,315691~i~r0100,116,315692~d~r032,117,315693~ ~r0111,118,315694~o~r0102,119,315695~f~r032,120,315696~'
-script += ' ~r0114,121,315697~r~r0111,122,315698~o~r123,315699~o~r0109,124,315700~m~r0115,125,315701~s~r032,126,315702~'
-script += ' ~r0116,127,315703~t~r0104,128,315704~h~r097,129,315705~a~r0116,130,315706~t~r032,131,315707~ ~r099,132,315708~'
-script += 'c~r0111,133,315709~o~r0110,134,315710~n~r0116,135,315711~t~r0114,136,315712~r~r0111,137,315713~o~r0108,138,315714~'
-script += 'l~r032,139,315715~ ~r0116,140,315716~t~r0104,141,315717~h~r0101,142,315718~e~r032,143,315719~ ~r0100,144,315720~'
-script += 'd~r0111,145,315721~o~r146,315722~o~r0114,147,315723~r~r032,148,315724~ ~r0116,149,315725~t~r0111,150,315726~'
-script += 'o~r032,151,315727~ ~r0116,152,315728~t~r0104,153,315729~h~r0101,154,315730~e~r032,155,315731~ ~r0118,156,315732~'
-script += 'v~r097,157,315733~a~r0117,158,315734~u~r0108,159,315735~l~r0116,160,315736~t~r046,161,315737~.~r010,162,315738~'
-script += '\n~r163,315739~\n~r084,164,315740~T~r0104,165,315741~h~r0101,166,315742~e~r032,167,315743~ ~r0102,168,315744~'
-script += 'f~r0108,169,315745~l~r0111,170,315746~o~r171,315747~o~r0114,172,315748~r~r032,173,315749~ ~r0111,174,315750~'
-script += 'o~r0102,175,315751~f~r032,176,315752~ ~r0116,177,315753~t~r0104,178,315754~h~r0105,179,315755~i~r0115,180,315756~'
-script += 's~r032,181,315757~ ~r0114,182,315758~r~r0111,183,315759~o~r184,315760~o~r0109,185,315761~m~r032,186,315762~'
-script += ' ~r0105,187,315763~i~r0115,188,315764~s~r032,189,315765~ ~r097,190,315766~a~r032,191,315767~ ~r0108,192,315768~'
-script += 'l~r097,193,315769~a~r0114,194,315770~r~r0103,195,315771~g~r0101,196,315772~e~r032,197,315773~ ~r0109,198,315774~'
-script += 'm~r0111,199,315775~o~r0115,1100,315776~s~r097,1101,315777~a~r0105,1102,315778~i~r099,1103,315779~c~r032,1104,315780~'
-script += ' ~r0100,1105,315781~d~r0101,1106,315782~e~r0112,1107,315783~p~r0105,1108,315784~i~r099,1109,315785~c'
-script += '~r0116,1110,315786~t~r0105,1111,315787~i~r0110,1112,315788~n~r0103,1113,315789~g~r032,1114,315790~ ~r097,1115,315791~'
-script += 'a~r032,1116,315792~ ~r039,1117,315793~\'~r042,1118,315794~*~r039,1119,315795~\'~r032,1120,315796~ ~r0115,1121,315797~'
-script += 's~r0121,1122,315798~y~r0109,1123,315799~m~r098,1124,315800~b~r0111,1125,315801~o~r0108,1126,315802~l'
-script += '~r046,1127,315803~.~r015675,10,34,4101,50,60~\n~r04~\nThere are ~r052,110,210,332764,452,51~4~r04,10,20,34,4101,50~'
-script += ' exits:\n~r015804,327262,44,55814,627261~- ~r0110,315805,45,51528,615804~n~r0111,11,315806~o~r0114,12,315807~'
-script += 'r~r0116,13,315808~t~r0104,14,315809~h~r015804,10,327262,44,55814,627261~\n~r015810,11,327263~- ~r0101,10,315811,51528,615810~'
-script += 'e~r097,11,315812~a~r0115,12,315813~s~r0116,13,315814~t~r015810,11,327263,55814,627261~\n~r015815,12,327264~'
-script += '- ~r0115,10,315816,45,51528,615815~s~r0111,11,315817~o~r0117,12,315818~u~r0116,13,315819~t~r0104,14,315820~'
-script += 'h~r015815,12,327264,44,55814,627261~\n~r015821,13,327265~- ~r0119,10,315822,51528,615821~w~r0101,11,315823~'
-script += 'e~r0115,12,315824~s~r0116,13,315825~t~r015821,327265,55814,627261~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~s~r025976,4115,51~o~r025977,4111,52~'
-script += 'u~r025978,4117,53~t~r025979,4116,54~h~r025980,4104,55~\n~r032,20,34,4101,50~~moutput~\n\n~r065,10,326123,447,51528,626122~'
-script += '~v27322608~A~r0115,11,326124~s~r032,12,326125~ ~r0121,13,326126~y~r0111,14,326127~o~r0117,15,326128~'
-script += 'u~r032,16,326129~ ~r0101,17,326130~e~r0110,18,326131~n~r0116,19,326132~t~r0101,110,326133~e~r0114,111,326134~'
-script += 'r~r032,112,326135~ ~r0116,113,326136~t~r0104,114,326137~h~r0101,115,326138~e~r032,116,326139~ ~r0114,117,326140~'
-script += 'r~r0111,118,326141~o~r119,326142~o~r0109,120,326143~m~r044,121,326144~,~r032,122,326145~ ~r0116,123,326146~'
-script += 't~r0104,124,326147~h~r0101,125,326148~e~r032,126,326149~ ~r0111,127,326150~o~r0114,128,326151~r~r098,129,326152~'
-script += 'b~r032,130,326153~ ~r098,131,326154~b~r0114,132,326155~r~r0105,133,326156~i~r0101,134,326157~e~r0102,135,326158~'
-script += 'f~r0108,136,326159~l~r0121,137,326160~y~r032,138,326161~ ~r0102,139,326162~f~r0108,140,326163~l~r097,141,326164~'
-script += 'a~r0115,142,326165~s~r0104,143,326166~h~r0101,144,326167~e~r0115,145,326168~s~r032,146,326169~ ~r0121,10,326018,46,626017~'
-script += 'y~r0101,11,326019~e~r0108,12,326020~l~r13,326021~l~r0111,14,326022~o~r0119,15,326023~w~r046,10,326171,464,626170~'
-script += '.~r032,11,326172~ ~r12,326173~ ~r084,13,326174~T~r0104,14,326175~h~r0101,15,326176~e~r032,16,326177~'
-script += ' ~r0110,17,326178~n~r0117,18,326179~u~r0109,19,326180~m~r098,110,326181~b~r0101,111,326182~e~r0114,112,326183~'
-script += 'r~r032,113,326184~ ~r0111,114,326185~o~r0110,115,326186~n~r032,116,326187~ ~r0116,117,326188~t~r0104,118,326189~'
-script += 'h~r0101,119,326190~e~r032,120,326191~ ~r0102,121,326192~f~r0108,122,326193~l~r0111,123,326194~o~r124,326195~'
-script += 'o~r0114,125,326196~r~r032,126,326197~ ~r0118,127,326198~v~r0105,128,326199~i~r098,129,326200~b~r0114,130,326201~'
-script += 'r~r097,131,326202~a~r0116,132,326203~t~r0101,133,326204~e~r0115,134,326205~s~r032,135,326206~ ~r0115,136,326207~'
-script += 's~r0116,137,326208~t~r0114,138,326209~r~r097,139,326210~a~r0110,140,326211~n~r0103,141,326212~g~r0101,142,326213~'
-script += 'e~r0108,143,326214~l~r0121,144,326215~y~r032,145,326216~ ~r098,146,326217~b~r0101,147,326218~e~r0110,148,326219~'
-script += 'n~r0101,149,326220~e~r097,150,326221~a~r0116,151,326222~t~r0104,152,326223~h~r032,153,326224~ ~r0121,154,326225~'
-script += 'y~r0111,155,326226~o~r0117,156,326227~u~r0114,157,326228~r~r032,158,326229~ ~r0102,159,326230~f~r0101,160,326231~'
-script += 'e~r161,326232~e~r0116,162,326233~t~r046,163,326234~.~r032,10,21,326236,431,626235~ ~r11,326237~ ~r084,12,326238~'
-script += 'T~r0104,13,326239~h~r0101,14,326240~e~r032,15,326241~ ~r0111,16,326242~o~r0114,17,326243~r~r098,18,326244~'
-script += 'b~r032,19,326245~ ~r0115,110,326246~s~r0101,111,326247~e~r112,326248~e~r0109,113,326249~m~r0115,114,326250~'
-script += 's~r032,115,326251~ ~r0116,116,326252~t~r0111,117,326253~o~r032,118,326254~ ~r0103,119,326255~g~r0101,120,326256~'
-script += 'e~r0116,121,326257~t~r032,122,326258~ ~r0104,123,326259~h~r0101,124,326260~e~r097,125,326261~a~r0118,126,326262~'
-script += 'v~r0105,127,326263~i~r0101,128,326264~e~r0114,129,326265~r~r046,130,326266~.~r060,115,20,35,4101,50,60~'
-script += '\n\n~r02608,10~== ~r086,316306,410,51528,616305~V~r097,11,316307~a~r0117,12,316308~u~r0108,13,316309~'
-script += 'l~r0116,14,316310~t~r032,15,316311~ ~r076,16,316312~L~r0111,17,316313~o~r099,18,316314~c~r0107,19,316315~'
-script += 'k~r016305,10,35,4101,50,60~ ==\n~r089,316317,4130,51528,616316~Y~r0111,11,316318~o~r0117,12,316319~u'
-script += '~r032,13,316320~ ~r097,14,316321~a~r0114,15,316322~r~r0101,16,316323~e~r032,17,316324~ ~r0105,18,316325~'
-script += 'i~r0110,19,316326~n~r032,110,316327~ ~r097,111,316328~a~r032,112,316329~ ~r0103,113,316330~g~r0114,114,316331~'
-script += 'r~r0105,115,316332~i~r0100,116,316333~d~r032,117,316334~ ~r0111,118,316335~o~r0102,119,316336~f~r032,120,316337~'
-script += ' ~r0114,121,316338~r~r0111,122,316339~o~r123,316340~o~r0109,124,316341~m~r0115,125,316342~s~r032,126,316343~'
-script += ' ~r0116,127,316344~t~r0104,128,316345~h~r097,129,316346~a~r0116,130,316347~t~r032,131,316348~ ~r099,132,316349~'
-script += 'c~r0111,133,316350~o~r0110,134,316351~n~r0116,135,316352~t~r0114,136,316353~r~r0111,137,316354~o~r0108,138,316355~'
-script += 'l~r032,139,316356~ ~r0116,140,316357~t~r0104,141,316358~h~r0101,142,316359~e~r032,143,316360~ ~r0100,144,316361~'
-script += 'd~r0111,145,316362~o~r146,316363~o~r0114,147,316364~r~r032,148,316365~ ~r0116,149,316366~t~r0111,150,316367~'
-script += 'o~r032,151,316368~ ~r0116,152,316369~t~r0104,153,316370~h~r0101,154,316371~e~r032,155,316372~ ~r0118,156,316373~'
-script += 'v~r097,157,316374~a~r0117,158,316375~u~r0108,159,316376~l~r0116,160,316377~t~r046,161,316378~.~r010,162,316379~'
-script += '\n~r163,316380~\n~r084,164,316381~T~r0104,165,316382~h~r0101,166,316383~e~r032,167,316384~ ~r0102,168,316385~'
-script += 'f~r0108,169,316386~l~r0111,170,316387~o~r171,316388~o~r0114,172,316389~r~r032,173,316390~ ~r0111,174,316391~'
-script += 'o~r0102,175,316392~f~r032,176,316393~ ~r0116,177,316394~t~r0104,178,316395~h~r0105,179,316396~i~r0115,180,316397~'
-script += 's~r032,181,316398~ ~r0114,182,316399~r~r0111,183,316400~o~r184,316401~o~r0109,185,316402~m~r032,186,316403~'
-script += ' ~r0105,187,316404~i~r0115,188,316405~s~r032,189,316406~ ~r097,190,316407~a~r032,191,316408~ ~r0108,192,316409~'
-script += 'l~r097,193,316410~a~r0114,194,316411~r~r0103,195,316412~g~r0101,196,316413~e~r032,197,316414~ ~r0109,198,316415~'
-script += 'm~r0111,199,316416~o~r0115,1100,316417~s~r097,1101,316418~a~r0105,1102,316419~i~r099,1103,316420~c~r032,1104,316421~'
-script += ' ~r0100,1105,316422~d~r0101,1106,316423~e~r0112,1107,316424~p~r0105,1108,316425~i~r099,1109,316426~c'
-script += '~r0116,1110,316427~t~r0105,1111,316428~i~r0110,1112,316429~n~r0103,1113,316430~g~r032,1114,316431~ ~r0116,1115,316432~'
-script += 't~r0104,1116,316433~h~r0101,1117,316434~e~r032,1118,316435~ ~r0110,1119,316436~n~r0117,1120,316437~u'
-script += '~r0109,1121,316438~m~r098,1122,316439~b~r0101,1123,316440~e~r0114,1124,316441~r~r032,1125,316442~ ~r039,1126,316443~'
-script += '\'~r052,1127,316444~4~r039,1128,316445~\'~r046,1129,316446~.~r016316,10,35,4101,50,60~\n~r04~\nThere'
-script += ' are ~r052,110,210,332764,452,51~4~r04,10,20,35,4101,50~ exits:\n~r016447,327298,44,55814,627297~- ~r0110,316448,45,51528,616447~'
-script += 'n~r0111,11,316449~o~r0114,12,316450~r~r0116,13,316451~t~r0104,14,316452~h~r016447,10,327298,44,55814,627297~'
-script += '\n~r016453,11,327299~- ~r0101,10,316454,51528,616453~e~r097,11,316455~a~r0115,12,316456~s~r0116,13,316457~'
-script += 't~r016453,11,327299,55814,627297~\n~r016458,12,327300~- ~r0115,10,316459,45,51528,616458~s~r0111,11,316460~'
-script += 'o~r0117,12,316461~u~r0116,13,316462~t~r0104,14,316463~h~r016458,12,327300,44,55814,627297~\n~r016464,13,327301~'
-script += '- ~r0119,10,316465,51528,616464~w~r0101,11,316466~e~r0115,12,316467~s~r0116,13,316468~t~r016464,327301,55814,627297~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~e~r025976,51~a~r025977,497,52~s~r025978,4115,53~t~r025979,4116,54~\n~r032,20,35,4101,50~~moutput~'
-script += '\n\n~r065,10,326025,463,51528,626024~~v27322613~A~r0115,11,326026~s~r032,12,326027~ ~r0121,13,326028~'
-script += 'y~r0111,14,326029~o~r0117,15,326030~u~r032,16,326031~ ~r0101,17,326032~e~r0110,18,326033~n~r0116,19,326034~'
-script += 't~r0101,110,326035~e~r0114,111,326036~r~r032,112,326037~ ~r0116,113,326038~t~r0104,114,326039~h~r0101,115,326040~'
-script += 'e~r032,116,326041~ ~r0114,117,326042~r~r0111,118,326043~o~r119,326044~o~r0109,120,326045~m~r044,121,326046~'
-script += ',~r032,122,326047~ ~r0116,123,326048~t~r0104,124,326049~h~r0101,125,326050~e~r032,126,326051~ ~r0115,127,326052~'
-script += 's~r0121,128,326053~y~r0109,129,326054~m~r098,130,326055~b~r0111,131,326056~o~r0108,132,326057~l~r032,133,326058~'
-script += ' ~r0111,134,326059~o~r0110,135,326060~n~r032,136,326061~ ~r0116,137,326062~t~r0104,138,326063~h~r0101,139,326064~'
-script += 'e~r032,140,326065~ ~r0102,141,326066~f~r0108,142,326067~l~r0111,143,326068~o~r144,326069~o~r0114,145,326070~'
-script += 'r~r032,146,326071~ ~r098,147,326072~b~r0114,148,326073~r~r0105,149,326074~i~r0101,150,326075~e~r0102,151,326076~'
-script += 'f~r0108,152,326077~l~r0121,153,326078~y~r032,154,326079~ ~r0102,155,326080~f~r0108,156,326081~l~r097,157,326082~'
-script += 'a~r0115,158,326083~s~r0104,159,326084~h~r0101,160,326085~e~r0115,161,326086~s~r032,162,326087~ ~r0114,10,326014,43,626013~'
-script += 'r~r0101,11,326015~e~r0100,12,326016~d~r046,10,326089,433,626088~.~r032,11,326090~ ~r12,326091~ ~r084,13,326092~'
-script += 'T~r0104,14,326093~h~r0101,15,326094~e~r032,16,326095~ ~r0111,17,326096~o~r0114,18,326097~r~r098,19,326098~'
-script += 'b~r032,110,326099~ ~r098,111,326100~b~r0101,112,326101~e~r0103,113,326102~g~r0105,114,326103~i~r0110,115,326104~'
-script += 'n~r0115,116,326105~s~r032,117,326106~ ~r0115,118,326107~s~r0117,119,326108~u~r098,120,326109~b~r0116,121,326110~'
-script += 't~r0108,122,326111~l~r0121,123,326112~y~r032,124,326113~ ~r0103,125,326114~g~r0108,126,326115~l~r0111,127,326116~'
-script += 'o~r0119,128,326117~w~r0105,129,326118~i~r0110,130,326119~n~r0103,131,326120~g~r032,132,326121~ ~r0114,10,326014,43,626013~'
-script += 'r~r0101,11,326015~e~r0100,12,326016~d~r026013,126013,34,4101,50,60~.\n\n~r02613,10~== ~r086,316470,410,51528,616469~'
-script += 'V~r097,11,316471~a~r0117,12,316472~u~r0108,13,316473~l~r0116,14,316474~t~r032,15,316475~ ~r076,16,316476~'
-script += 'L~r0111,17,316477~o~r099,18,316478~c~r0107,19,316479~k~r016469,10,34,4101,50,60~ ==\n~r089,316481,4128,51528,616480~'
-script += 'Y~r0111,11,316482~o~r0117,12,316483~u~r032,13,316484~ ~r097,14,316485~a~r0114,15,316486~r~r0101,16,316487~'
-script += 'e~r032,17,316488~ ~r0105,18,316489~i~r0110,19,316490~n~r032,110,316491~ ~r097,111,316492~a~r032,112,316493~'
-script += ' ~r0103,113,316494~g~r0114,114,316495~r~r0105,115,316496~i~r0100,116,316497~d~r032,117,316498~ ~r0111,118,316499~'
-script += 'o~r0102,119,316500~f~r032,120,316501~ ~r0114,121,316502~r~r0111,122,316503~o~r123,316504~o~r0109,124,316505~'
-script += 'm~r0115,125,316506~s~r032,126,316507~ ~r0116,127,316508~t~r0104,128,316509~h~r097,129,316510~a~r0116,130,316511~'
-script += 't~r032,131,316512~ ~r099,132,316513~c~r0111,133,316514~o~r0110,134,316515~n~r0116,135,316516~t~r0114,136,316517~'
-script += 'r~r0111,137,316518~o~r0108,138,316519~l~r032,139,316520~ ~r0116,140,316521~t~r0104,141,316522~h~r0101,142,316523~'
-script += 'e~r032,143,316524~ ~r0100,144,316525~d~r0111,145,316526~o~r146,316527~o~r0114,147,316528~r~r032,148,316529~'
-script += ' ~r0116,149,316530~t~r0111,150,316531~o~r032,151,316532~ ~r0116,152,316533~t~r0104,153,316534~h~r0101,154,316535~'
-script += 'e~r032,155,316536~ ~r0118,156,316537~v~r097,157,316538~a~r0117,158,316539~u~r0108,159,316540~l~r0116,160,316541~'
-script += 't~r046,161,316542~.~r010,162,316543~\n~r163,316544~\n~r084,164,316545~T~r0104,165,316546~h~r0101,166,316547~'
-script += 'e~r032,167,316548~ ~r0102,168,316549~f~r0108,169,316550~l~r0111,170,316551~o~r171,316552~o~r0114,172,316553~'
-script += 'r~r032,173,316554~ ~r0111,174,316555~o~r0102,175,316556~f~r032,176,316557~ ~r0116,177,316558~t~r0104,178,316559~'
-script += 'h~r0105,179,316560~i~r0115,180,316561~s~r032,181,316562~ ~r0114,182,316563~r~r0111,183,316564~o~r184,316565~'
-script += 'o~r0109,185,316566~m~r032,186,316567~ ~r0105,187,316568~i~r0115,188,316569~s~r032,189,316570~ ~r097,190,316571~'
-script += 'a~r032,191,316572~ ~r0108,192,316573~l~r097,193,316574~a~r0114,194,316575~r~r0103,195,316576~g~r0101,196,316577~'
-script += 'e~r032,197,316578~ ~r0109,198,316579~m~r0111,199,316580~o~r0115,1100,316581~s~r097,1101,316582~a~r0105,1102,316583~'
-script += 'i~r099,1103,316584~c~r032,1104,316585~ ~r0100,1105,316586~d~r0101,1106,316587~e~r0112,1107,316588~p~r0105,1108,316589~'
-script += 'i~r099,1109,316590~c~r0116,1110,316591~t~r0105,1111,316592~i~r0110,1112,316593~n~r0103,1113,316594~g'
-script += '~r032,1114,316595~ ~r097,1115,316596~a~r032,1116,316597~ ~r039,1117,316598~\'~r045,1118,316599~-~r039,1119,316600~'
-script += '\'~r032,1120,316601~ ~r0115,1121,316602~s~r0121,1122,316603~y~r0109,1123,316604~m~r098,1124,316605~b'
-script += '~r0111,1125,316606~o~r0108,1126,316607~l~r046,1127,316608~.~r016480,10,34,4101,50,60~\n~r04~\nThere '
-script += 'are ~r052,110,210,332764,452,51~4~r04,10,20,34,4101,50~ exits:\n~r016609,327308,44,55814,627307~- ~r0110,316610,45,51528,616609~'
-script += 'n~r0111,11,316611~o~r0114,12,316612~r~r0116,13,316613~t~r0104,14,316614~h~r016609,10,327308,44,55814,627307~'
-script += '\n~r016615,11,327309~- ~r0101,10,316616,51528,616615~e~r097,11,316617~a~r0115,12,316618~s~r0116,13,316619~'
-script += 't~r016615,11,327309,55814,627307~\n~r016620,12,327310~- ~r0115,10,316621,45,51528,616620~s~r0111,11,316622~'
-script += 'o~r0117,12,316623~u~r0116,13,316624~t~r0104,14,316625~h~r016620,12,327310,44,55814,627307~\n~r016626,13,327311~'
-script += '- ~r0119,10,316627,51528,616626~w~r0101,11,316628~e~r0115,12,316629~s~r0116,13,316630~t~r016626,327311,55814,627307~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~e~r025976,51~a~r025977,497,52~s~r025978,4115,53~t~r025979,4116,54~\n~r032,20,34,4101,50~~moutput~'
-script += '\n\n~r065,10,326123,447,51528,626122~~v27322618~A~r0115,11,326124~s~r032,12,326125~ ~r0121,13,326126~'
-script += 'y~r0111,14,326127~o~r0117,15,326128~u~r032,16,326129~ ~r0101,17,326130~e~r0110,18,326131~n~r0116,19,326132~'
-script += 't~r0101,110,326133~e~r0114,111,326134~r~r032,112,326135~ ~r0116,113,326136~t~r0104,114,326137~h~r0101,115,326138~'
-script += 'e~r032,116,326139~ ~r0114,117,326140~r~r0111,118,326141~o~r119,326142~o~r0109,120,326143~m~r044,121,326144~'
-script += ',~r032,122,326145~ ~r0116,123,326146~t~r0104,124,326147~h~r0101,125,326148~e~r032,126,326149~ ~r0111,127,326150~'
-script += 'o~r0114,128,326151~r~r098,129,326152~b~r032,130,326153~ ~r098,131,326154~b~r0114,132,326155~r~r0105,133,326156~'
-script += 'i~r0101,134,326157~e~r0102,135,326158~f~r0108,136,326159~l~r0121,137,326160~y~r032,138,326161~ ~r0102,139,326162~'
-script += 'f~r0108,140,326163~l~r097,141,326164~a~r0115,142,326165~s~r0104,143,326166~h~r0101,144,326167~e~r0115,145,326168~'
-script += 's~r032,146,326169~ ~r0114,10,326014,43,626013~r~r0101,11,326015~e~r0100,12,326016~d~r046,10,326171,464,626170~'
-script += '.~r032,11,326172~ ~r12,326173~ ~r084,13,326174~T~r0104,14,326175~h~r0101,15,326176~e~r032,16,326177~'
-script += ' ~r0110,17,326178~n~r0117,18,326179~u~r0109,19,326180~m~r098,110,326181~b~r0101,111,326182~e~r0114,112,326183~'
-script += 'r~r032,113,326184~ ~r0111,114,326185~o~r0110,115,326186~n~r032,116,326187~ ~r0116,117,326188~t~r0104,118,326189~'
-script += 'h~r0101,119,326190~e~r032,120,326191~ ~r0102,121,326192~f~r0108,122,326193~l~r0111,123,326194~o~r124,326195~'
-script += 'o~r0114,125,326196~r~r032,126,326197~ ~r0118,127,326198~v~r0105,128,326199~i~r098,129,326200~b~r0114,130,326201~'
-script += 'r~r097,131,326202~a~r0116,132,326203~t~r0101,133,326204~e~r0115,134,326205~s~r032,135,326206~ ~r0115,136,326207~'
-script += 's~r0116,137,326208~t~r0114,138,326209~r~r097,139,326210~a~r0110,140,326211~n~r0103,141,326212~g~r0101,142,326213~'
-script += 'e~r0108,143,326214~l~r0121,144,326215~y~r032,145,326216~ ~r098,146,326217~b~r0101,147,326218~e~r0110,148,326219~'
-script += 'n~r0101,149,326220~e~r097,150,326221~a~r0116,151,326222~t~r0104,152,326223~h~r032,153,326224~ ~r0121,154,326225~'
-script += 'y~r0111,155,326226~o~r0117,156,326227~u~r0114,157,326228~r~r032,158,326229~ ~r0102,159,326230~f~r0101,160,326231~'
-script += 'e~r161,326232~e~r0116,162,326233~t~r046,163,326234~.~r032,10,21,326268,431,626267~ ~r11,326269~ ~r084,12,326270~'
-script += 'T~r0104,13,326271~h~r0101,14,326272~e~r032,15,326273~ ~r0111,16,326274~o~r0114,17,326275~r~r098,18,326276~'
-script += 'b~r032,19,326277~ ~r0115,110,326278~s~r0101,111,326279~e~r112,326280~e~r0109,113,326281~m~r0115,114,326282~'
-script += 's~r032,115,326283~ ~r0116,116,326284~t~r0111,117,326285~o~r032,118,326286~ ~r0103,119,326287~g~r0101,120,326288~'
-script += 'e~r0116,121,326289~t~r032,122,326290~ ~r0108,123,326291~l~r0105,124,326292~i~r0103,125,326293~g~r0104,126,326294~'
-script += 'h~r0116,127,326295~t~r0101,128,326296~e~r0114,129,326297~r~r046,130,326298~.~r042,160,34,4101,50,60~'
-script += '\n\n~r02618,10,20~== ~r086,316632,410,51528,616631~V~r097,11,316633~a~r0117,12,316634~u~r0108,13,316635~'
-script += 'l~r0116,14,316636~t~r032,15,316637~ ~r076,16,316638~L~r0111,17,316639~o~r099,18,316640~c~r0107,19,316641~'
-script += 'k~r016631,10,34,4101,50,60~ ==\n~r089,316643,4131,51528,616642~Y~r0111,11,316644~o~r0117,12,316645~u'
-script += '~r032,13,316646~ ~r097,14,316647~a~r0114,15,316648~r~r0101,16,316649~e~r032,17,316650~ ~r0105,18,316651~'
-script += 'i~r0110,19,316652~n~r032,110,316653~ ~r097,111,316654~a~r032,112,316655~ ~r0103,113,316656~g~r0114,114,316657~'
-script += 'r~r0105,115,316658~i~r0100,116,316659~d~r032,117,316660~ ~r0111,118,316661~o~r0102,119,316662~f~r032,120,316663~'
-script += ' ~r0114,121,316664~r~r0111,122,316665~o~r123,316666~o~r0109,124,316667~m~r0115,125,316668~s~r032,126,316669~'
-script += ' ~r0116,127,316670~t~r0104,128,316671~h~r097,129,316672~a~r0116,130,316673~t~r032,131,316674~ ~r099,132,316675~'
-script += 'c~r0111,133,316676~o~r0110,134,316677~n~r0116,135,316678~t~r0114,136,316679~r~r0111,137,316680~o~r0108,138,316681~'
-script += 'l~r032,139,316682~ ~r0116,140,316683~t~r0104,141,316684~h~r0101,142,316685~e~r032,143,316686~ ~r0100,144,316687~'
-script += 'd~r0111,145,316688~o~r146,316689~o~r0114,147,316690~r~r032,148,316691~ ~r0116,149,316692~t~r0111,150,316693~'
-script += 'o~r032,151,316694~ ~r0116,152,316695~t~r0104,153,316696~h~r0101,154,316697~e~r032,155,316698~ ~r0118,156,316699~'
-script += 'v~r097,157,316700~a~r0117,158,316701~u~r0108,159,316702~l~r0116,160,316703~t~r046,161,316704~.~r010,162,316705~'
-script += '\n~r163,316706~\n~r084,164,316707~T~r0104,165,316708~h~r0101,166,316709~e~r032,167,316710~ ~r0102,168,316711~'
-script += 'f~r0108,169,316712~l~r0111,170,316713~o~r171,316714~o~r0114,172,316715~r~r032,173,316716~ ~r0111,174,316717~'
-script += 'o~r0102,175,316718~f~r032,176,316719~ ~r0116,177,316720~t~r0104,178,316721~h~r0105,179,316722~i~r0115,180,316723~'
-script += 's~r032,181,316724~ ~r0114,182,316725~r~r0111,183,316726~o~r184,316727~o~r0109,185,316728~m~r032,186,316729~'
-script += ' ~r0105,187,316730~i~r0115,188,316731~s~r032,189,316732~ ~r097,190,316733~a~r032,191,316734~ ~r0108,192,316735~'
-script += 'l~r097,193,316736~a~r0114,194,316737~r~r0103,195,316738~g~r0101,196,316739~e~r032,197,316740~ ~r0109,198,316741~'
-script += 'm~r0111,199,316742~o~r0115,1100,316743~s~r097,1101,316744~a~r0105,1102,316745~i~r099,1103,316746~c~r032,1104,316747~'
-script += ' ~r0100,1105,316748~d~r0101,1106,316749~e~r0112,1107,316750~p~r0105,1108,316751~i~r099,1109,316752~c'
-script += '~r0116,1110,316753~t~r0105,1111,316754~i~r0110,1112,316755~n~r0103,1113,316756~g~r032,1114,316757~ ~r0116,1115,316758~'
-script += 't~r0104,1116,316759~h~r0101,1117,316760~e~r032,1118,316761~ ~r0110,1119,316762~n~r0117,1120,316763~u'
-script += '~r0109,1121,316764~m~r098,1122,316765~b~r0101,1123,316766~e~r0114,1124,316767~r~r032,1125,316768~ ~r039,1126,316769~'
-script += '\'~r049,1127,316770~1~r056,1128,316771~8~r039,1129,316772~\'~r046,1130,316773~.~r016642,10,34,4101,50,60~'
-script += '\n~r03~\nThere are ~r051,110,210,332765,451,51~3~r03,10,20,34,4101,50~ exits:\n~r016774,327318,43,55814,627317~'
-script += '- ~r0110,316775,45,51528,616774~n~r0111,11,316776~o~r0114,12,316777~r~r0116,13,316778~t~r0104,14,316779~'
-script += 'h~r016774,10,327318,43,55814,627317~\n~r016780,11,327319~- ~r0115,10,316781,45,51528,616780~s~r0111,11,316782~'
-script += 'o~r0117,12,316783~u~r0116,13,316784~t~r0104,14,316785~h~r016780,11,327319,43,55814,627317~\n~r016786,12,327320~'
-script += '- ~r0119,10,316787,44,51528,616786~w~r0101,11,316788~e~r0115,12,316789~s~r0116,13,316790~t~r016786,12,327320,43,55814,627317~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~w~r025976,4119,51~e~r025977,4101,52~s~r025978,4115,53~t~r025979,4116,54~\n~r032,20,34,4101,50~'
-script += '~moutput~\n\n~r065,10,326025,463,51528,626024~~v27322613~A~r0115,11,326026~s~r032,12,326027~ ~r0121,13,326028~'
-script += 'y~r0111,14,326029~o~r0117,15,326030~u~r032,16,326031~ ~r0101,17,326032~e~r0110,18,326033~n~r0116,19,326034~'
-script += 't~r0101,110,326035~e~r0114,111,326036~r~r032,112,326037~ ~r0116,113,326038~t~r0104,114,326039~h~r0101,115,326040~'
-script += 'e~r032,116,326041~ ~r0114,117,326042~r~r0111,118,326043~o~r119,326044~o~r0109,120,326045~m~r044,121,326046~'
-script += ',~r032,122,326047~ ~r0116,123,326048~t~r0104,124,326049~h~r0101,125,326050~e~r032,126,326051~ ~r0115,127,326052~'
-script += 's~r0121,128,326053~y~r0109,129,326054~m~r098,130,326055~b~r0111,131,326056~o~r0108,132,326057~l~r032,133,326058~'
-script += ' ~r0111,134,326059~o~r0110,135,326060~n~r032,136,326061~ ~r0116,137,326062~t~r0104,138,326063~h~r0101,139,326064~'
-script += 'e~r032,140,326065~ ~r0102,141,326066~f~r0108,142,326067~l~r0111,143,326068~o~r144,326069~o~r0114,145,326070~'
-script += 'r~r032,146,326071~ ~r098,147,326072~b~r0114,148,326073~r~r0105,149,326074~i~r0101,150,326075~e~r0102,151,326076~'
-script += 'f~r0108,152,326077~l~r0121,153,326078~y~r032,154,326079~ ~r0102,155,326080~f~r0108,156,326081~l~r097,157,326082~'
-script += 'a~r0115,158,326083~s~r0104,159,326084~h~r0101,160,326085~e~r0115,161,326086~s~r032,162,326087~ ~r0114,10,326014,43,626013~'
-script += 'r~r0101,11,326015~e~r0100,12,326016~d~r046,10,326089,433,626088~.~r032,11,326090~ ~r12,326091~ ~r084,13,326092~'
-script += 'T~r0104,14,326093~h~r0101,15,326094~e~r032,16,326095~ ~r0111,17,326096~o~r0114,18,326097~r~r098,19,326098~'
-script += 'b~r032,110,326099~ ~r098,111,326100~b~r0101,112,326101~e~r0103,113,326102~g~r0105,114,326103~i~r0110,115,326104~'
-script += 'n~r0115,116,326105~s~r032,117,326106~ ~r0115,118,326107~s~r0117,119,326108~u~r098,120,326109~b~r0116,121,326110~'
-script += 't~r0108,122,326111~l~r0121,123,326112~y~r032,124,326113~ ~r0103,125,326114~g~r0108,126,326115~l~r0111,127,326116~'
-script += 'o~r0119,128,326117~w~r0105,129,326118~i~r0110,130,326119~n~r0103,131,326120~g~r032,132,326121~ ~r0114,10,326014,43,626013~'
-script += 'r~r0101,11,326015~e~r0100,12,326016~d~r026013,126013,34,4101,50,60~.\n\n~r02613,10~== ~r086,316470,410,51528,616469~'
-script += 'V~r097,11,316471~a~r0117,12,316472~u~r0108,13,316473~l~r0116,14,316474~t~r032,15,316475~ ~r076,16,316476~'
-script += 'L~r0111,17,316477~o~r099,18,316478~c~r0107,19,316479~k~r016469,10,34,4101,50,60~ ==\n~r089,316481,4128,51528,616480~'
-script += 'Y~r0111,11,316482~o~r0117,12,316483~u~r032,13,316484~ ~r097,14,316485~a~r0114,15,316486~r~r0101,16,316487~'
-script += 'e~r032,17,316488~ ~r0105,18,316489~i~r0110,19,316490~n~r032,110,316491~ ~r097,111,316492~a~r032,112,316493~'
-script += ' ~r0103,113,316494~g~r0114,114,316495~r~r0105,115,316496~i~r0100,116,316497~d~r032,117,316498~ ~r0111,118,316499~'
-script += 'o~r0102,119,316500~f~r032,120,316501~ ~r0114,121,316502~r~r0111,122,316503~o~r123,316504~o~r0109,124,316505~'
-script += 'm~r0115,125,316506~s~r032,126,316507~ ~r0116,127,316508~t~r0104,128,316509~h~r097,129,316510~a~r0116,130,316511~'
-script += 't~r032,131,316512~ ~r099,132,316513~c~r0111,133,316514~o~r0110,134,316515~n~r0116,135,316516~t~r0114,136,316517~'
-script += 'r~r0111,137,316518~o~r0108,138,316519~l~r032,139,316520~ ~r0116,140,316521~t~r0104,141,316522~h~r0101,142,316523~'
-script += 'e~r032,143,316524~ ~r0100,144,316525~d~r0111,145,316526~o~r146,316527~o~r0114,147,316528~r~r032,148,316529~'
-script += ' ~r0116,149,316530~t~r0111,150,316531~o~r032,151,316532~ ~r0116,152,316533~t~r0104,153,316534~h~r0101,154,316535~'
-script += 'e~r032,155,316536~ ~r0118,156,316537~v~r097,157,316538~a~r0117,158,316539~u~r0108,159,316540~l~r0116,160,316541~'
-script += 't~r046,161,316542~.~r010,162,316543~\n~r163,316544~\n~r084,164,316545~T~r0104,165,316546~h~r0101,166,316547~'
-script += 'e~r032,167,316548~ ~r0102,168,316549~f~r0108,169,316550~l~r0111,170,316551~o~r171,316552~o~r0114,172,316553~'
-script += 'r~r032,173,316554~ ~r0111,174,316555~o~r0102,175,316556~f~r032,176,316557~ ~r0116,177,316558~t~r0104,178,316559~'
-script += 'h~r0105,179,316560~i~r0115,180,316561~s~r032,181,316562~ ~r0114,182,316563~r~r0111,183,316564~o~r184,316565~'
-script += 'o~r0109,185,316566~m~r032,186,316567~ ~r0105,187,316568~i~r0115,188,316569~s~r032,189,316570~ ~r097,190,316571~'
-script += 'a~r032,191,316572~ ~r0108,192,316573~l~r097,193,316574~a~r0114,194,316575~r~r0103,195,316576~g~r0101,196,316577~'
-script += 'e~r032,197,316578~ ~r0109,198,316579~m~r0111,199,316580~o~r0115,1100,316581~s~r097,1101,316582~a~r0105,1102,316583~'
-script += 'i~r099,1103,316584~c~r032,1104,316585~ ~r0100,1105,316586~d~r0101,1106,316587~e~r0112,1107,316588~p~r0105,1108,316589~'
-script += 'i~r099,1109,316590~c~r0116,1110,316591~t~r0105,1111,316592~i~r0110,1112,316593~n~r0103,1113,316594~g'
-script += '~r032,1114,316595~ ~r097,1115,316596~a~r032,1116,316597~ ~r039,1117,316598~\'~r045,1118,316599~-~r039,1119,316600~'
-script += '\'~r032,1120,316601~ ~r0115,1121,316602~s~r0121,1122,316603~y~r0109,1123,316604~m~r098,1124,316605~b'
-script += '~r0111,1125,316606~o~r0108,1126,316607~l~r046,1127,316608~.~r016480,10,34,4101,50,60~\n~r04~\nThere '
-script += 'are ~r052,110,210,332764,452,51~4~r04,10,20,34,4101,50~ exits:\n~r016609,327308,44,55814,627307~- ~r0110,316610,45,51528,616609~'
-script += 'n~r0111,11,316611~o~r0114,12,316612~r~r0116,13,316613~t~r0104,14,316614~h~r016609,10,327308,44,55814,627307~'
-script += '\n~r016615,11,327309~- ~r0101,10,316616,51528,616615~e~r097,11,316617~a~r0115,12,316618~s~r0116,13,316619~'
-script += 't~r016615,11,327309,55814,627307~\n~r016620,12,327310~- ~r0115,10,316621,45,51528,616620~s~r0111,11,316622~'
-script += 'o~r0117,12,316623~u~r0116,13,316624~t~r0104,14,316625~h~r016620,12,327310,44,55814,627307~\n~r016626,13,327311~'
-script += '- ~r0119,10,316627,51528,616626~w~r0101,11,316628~e~r0115,12,316629~s~r0116,13,316630~t~r016626,327311,55814,627307~'
-script += '\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~'
-script += 't~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~'
-script += 'u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~'
-script += '~minput~n~r025976,4110,51~o~r025977,4111,52~r~r025978,4114,53~t~r025979,4116,54~h~r025980,4104,55~\n'
-script += '~r032,20,34,4101,50~~moutput~\n\n~r065,10,326123,447,51528,626122~~v27322593~A~r0115,11,326124~s~r032,12,326125~'
-script += ' ~r0121,13,326126~y~r0111,14,326127~o~r0117,15,326128~u~r032,16,326129~ ~r0101,17,326130~e~r0110,18,326131~'
-script += 'n~r0116,19,326132~t~r0101,110,326133~e~r0114,111,326134~r~r032,112,326135~ ~r0116,113,326136~t~r0104,114,326137~'
-script += 'h~r0101,115,326138~e~r032,116,326139~ ~r0114,117,326140~r~r0111,118,326141~o~r119,326142~o~r0109,120,326143~'
-script += 'm~r044,121,326144~,~r032,122,326145~ ~r0116,123,326146~t~r0104,124,326147~h~r0101,125,326148~e~r032,126,326149~'
-script += ' ~r0111,127,326150~o~r0114,128,326151~r~r098,129,326152~b~r032,130,326153~ ~r098,131,326154~b~r0114,132,326155~'
-script += 'r~r0105,133,326156~i~r0101,134,326157~e~r0102,135,326158~f~r0108,136,326159~l~r0121,137,326160~y~r032,138,326161~'
-script += ' ~r0102,139,326162~f~r0108,140,326163~l~r097,141,326164~a~r0115,142,326165~s~r0104,143,326166~h~r0101,144,326167~'
-script += 'e~r0115,145,326168~s~r032,146,326169~ ~r0114,10,326014,43,626013~r~r0101,11,326015~e~r0100,12,326016~'
-script += 'd~r046,10,326171,464,626170~.~r032,11,326172~ ~r12,326173~ ~r084,13,326174~T~r0104,14,326175~h~r0101,15,326176~'
-script += 'e~r032,16,326177~ ~r0110,17,326178~n~r0117,18,326179~u~r0109,19,326180~m~r098,110,326181~b~r0101,111,326182~'
-script += 'e~r0114,112,326183~r~r032,113,326184~ ~r0111,114,326185~o~r0110,115,326186~n~r032,116,326187~ ~r0116,117,326188~'
-script += 't~r0104,118,326189~h~r0101,119,326190~e~r032,120,326191~ ~r0102,121,326192~f~r0108,122,326193~l~r0111,123,326194~'
-script += 'o~r124,326195~o~r0114,125,326196~r~r032,126,326197~ ~r0118,127,326198~v~r0105,128,326199~i~r098,129,326200~'
-script += 'b~r0114,130,326201~r~r097,131,326202~a~r0116,132,326203~t~r0101,133,326204~e~r0115,134,326205~s~r032,135,326206~'
-script += ' ~r0115,136,326207~s~r0116,137,326208~t~r0114,138,326209~r~r097,139,326210~a~r0110,140,326211~n~r0103,141,326212~'
-script += 'g~r0101,142,326213~e~r0108,143,326214~l~r0121,144,326215~y~r032,145,326216~ ~r098,146,326217~b~r0101,147,326218~'
-script += 'e~r0110,148,326219~n~r0101,149,326220~e~r097,150,326221~a~r0116,151,326222~t~r0104,152,326223~h~r032,153,326224~'
-script += ' ~r0121,154,326225~y~r0111,155,326226~o~r0117,156,326227~u~r0114,157,326228~r~r032,158,326229~ ~r0102,159,326230~'
-script += 'f~r0101,160,326231~e~r161,326232~e~r0116,162,326233~t~r046,163,326234~.~r032,10,21,326268,431,626267~'
-script += ' ~r11,326269~ ~r084,12,326270~T~r0104,13,326271~h~r0101,14,326272~e~r032,15,326273~ ~r0111,16,326274~'
-script += 'o~r0114,17,326275~r~r098,18,326276~b~r032,19,326277~ ~r0115,110,326278~s~r0101,111,326279~e~r112,326280~'
-script += 'e~r0109,113,326281~m~r0115,114,326282~s~r032,115,326283~ ~r0116,116,326284~t~r0111,117,326285~o~r032,118,326286~'
-script += ' ~r0103,119,326287~g~r0101,120,326288~e~r0116,121,326289~t~r032,122,326290~ ~r0108,123,326291~l~r0105,124,326292~'
-script += 'i~r0103,125,326293~g~r0104,126,326294~h~r0116,127,326295~t~r0101,128,326296~e~r0114,129,326297~r~r046,130,326298~'
-script += '.~r031,142,35,4101,50,60~\n\n~r02593,10,20~== ~r086,315827,410,51528,615826~V~r097,11,315828~a~r0117,12,315829~'
-script += 'u~r0108,13,315830~l~r0116,14,315831~t~r032,15,315832~ ~r076,16,315833~L~r0111,17,315834~o~r099,18,315835~'
-script += 'c~r0107,19,315836~k~r015826,10,35,4101,50,60~ ==\n~r089,315838,4131,51528,615837~Y~r0111,11,315839~o'
-script += '~r0117,12,315840~u~r032,13,315841~ ~r097,14,315842~a~r0114,15,315843~r~r0101,16,315844~e~r032,17,315845~'
-script += ' ~r0105,18,315846~i~r0110,19,315847~n~r032,110,315848~ ~r097,111,315849~a~r032,112,315850~ ~r0103,113,315851~'
-script += 'g~r0114,114,315852~r~r0105,115,315853~i~r0100,116,315854~d~r032,117,315855~ ~r0111,118,315856~o~r0102,119,315857~'
-script += 'f~r032,120,315858~ ~r0114,121,315859~r~r0111,122,315860~o~r123,315861~o~r0109,124,315862~m~r0115,125,315863~'
-script += 's~r032,126,315864~ ~r0116,127,315865~t~r0104,128,315866~h~r097,129,315867~a~r0116,130,315868~t~r032,131,315869~'
-script += ' ~r099,132,315870~c~r0111,133,315871~o~r0110,134,315872~n~r0116,135,315873~t~r0114,136,315874~r~r0111,137,315875~'
-script += 'o~r0108,138,315876~l~r032,139,315877~ ~r0116,140,315878~t~r0104,141,315879~h~r0101,142,315880~e~r032,143,315881~'
-script += ' ~r0100,144,315882~d~r0111,145,315883~o~r146,315884~o~r0114,147,315885~r~r032,148,315886~ ~r0116,149,315887~'
-script += 't~r0111,150,315888~o~r032,151,315889~ ~r0116,152,315890~t~r0104,153,315891~h~r0101,154,315892~e~r032,155,315893~'
-script += ' ~r0118,156,315894~v~r097,157,315895~a~r0117,158,315896~u~r0108,159,315897~l~r0116,160,315898~t~r046,161,315899~'
-script += '.~r010,162,315900~\n~r163,315901~\n~r084,164,315902~T~r0104,165,315903~h~r0101,166,315904~e~r032,167,315905~'
-script += ' ~r0102,168,315906~f~r0108,169,315907~l~r0111,170,315908~o~r171,315909~o~r0114,172,315910~r~r032,173,315911~'
-script += ' ~r0111,174,315912~o~r0102,175,315913~f~r032,176,315914~ ~r0116,177,315915~t~r0104,178,315916~h~r0105,179,315917~'
-script += 'i~r0115,180,315918~s~r032,181,315919~ ~r0114,182,315920~r~r0111,183,315921~o~r184,315922~o~r0109,185,315923~'
-script += 'm~r032,186,315924~ ~r0105,187,315925~i~r0115,188,315926~s~r032,189,315927~ ~r097,190,315928~a~r032,191,315929~'
-script += ' ~r0108,192,315930~l~r097,193,315931~a~r0114,194,315932~r~r0103,195,315933~g~r0101,196,315934~e~r032,197,315935~'
-script += ' ~r0109,198,315936~m~r0111,199,315937~o~r0115,1100,315938~s~r097,1101,315939~a~r0105,1102,315940~i~r099,1103,315941~'
-script += 'c~r032,1104,315942~ ~r0100,1105,315943~d~r0101,1106,315944~e~r0112,1107,315945~p~r0105,1108,315946~i'
-script += '~r099,1109,315947~c~r0116,1110,315948~t~r0105,1111,315949~i~r0110,1112,315950~n~r0103,1113,315951~g~r032,1114,315952~'
-script += ' ~r0116,1115,315953~t~r0104,1116,315954~h~r0101,1117,315955~e~r032,1118,315956~ ~r0110,1119,315957~n'
-script += '~r0117,1120,315958~u~r0109,1121,315959~m~r098,1122,315960~b~r0101,1123,315961~e~r0114,1124,315962~r~r032,1125,315963~'
-script += ' ~r039,1126,315964~\'~r049,1127,315965~1~r1128,315966~1~r039,1129,315967~\'~r046,1130,315968~.~r015837,10,35,4101,50,60~'
-script += '\n~r04~\nThere are ~r052,110,210,332764,452,51~4~r04,10,20,35,4101,50~ exits:\n~r015969,327272,44,55814,627271~'
-script += '- ~r0110,315970,45,51528,615969~n~r0111,11,315971~o~r0114,12,315972~r~r0116,13,315973~t~r0104,14,315974~'
-script += 'h~r015969,10,327272,44,55814,627271~\n~r015975,11,327273~- ~r0101,10,315976,51528,615975~e~r097,11,315977~'
-script += 'a~r0115,12,315978~s~r0116,13,315979~t~r015975,11,327273,55814,627271~\n~r015980,12,327274~- ~r0115,10,315981,45,51528,615980~'
-script += 's~r0111,11,315982~o~r0117,12,315983~u~r0116,13,315984~t~r0104,14,315985~h~r015980,12,327274,44,55814,627271~'
-script += '\n~r015986,13,327275~- ~r0119,10,315987,51528,615986~w~r0101,11,315988~e~r0115,12,315989~s~r0116,13,315990~'
-script += 't~r015986,327275,55814,627271~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~n~r025976,4110,51~o~r025977,4111,52~r~r025978,4114,53~'
-script += 't~r025979,4116,54~h~r025980,4104,55~\n~r032,20,35,4101,50~~moutput~\n\n~r065,10,326025,463,51528,626024~'
-script += '~v27322573~A~r0115,11,326026~s~r032,12,326027~ ~r0121,13,326028~y~r0111,14,326029~o~r0117,15,326030~'
-script += 'u~r032,16,326031~ ~r0101,17,326032~e~r0110,18,326033~n~r0116,19,326034~t~r0101,110,326035~e~r0114,111,326036~'
-script += 'r~r032,112,326037~ ~r0116,113,326038~t~r0104,114,326039~h~r0101,115,326040~e~r032,116,326041~ ~r0114,117,326042~'
-script += 'r~r0111,118,326043~o~r119,326044~o~r0109,120,326045~m~r044,121,326046~,~r032,122,326047~ ~r0116,123,326048~'
-script += 't~r0104,124,326049~h~r0101,125,326050~e~r032,126,326051~ ~r0115,127,326052~s~r0121,128,326053~y~r0109,129,326054~'
-script += 'm~r098,130,326055~b~r0111,131,326056~o~r0108,132,326057~l~r032,133,326058~ ~r0111,134,326059~o~r0110,135,326060~'
-script += 'n~r032,136,326061~ ~r0116,137,326062~t~r0104,138,326063~h~r0101,139,326064~e~r032,140,326065~ ~r0102,141,326066~'
-script += 'f~r0108,142,326067~l~r0111,143,326068~o~r144,326069~o~r0114,145,326070~r~r032,146,326071~ ~r098,147,326072~'
-script += 'b~r0114,148,326073~r~r0105,149,326074~i~r0101,150,326075~e~r0102,151,326076~f~r0108,152,326077~l~r0121,153,326078~'
-script += 'y~r032,154,326079~ ~r0102,155,326080~f~r0108,156,326081~l~r097,157,326082~a~r0115,158,326083~s~r0104,159,326084~'
-script += 'h~r0101,160,326085~e~r0115,161,326086~s~r032,162,326087~ ~r0114,10,326014,43,626013~r~r0101,11,326015~'
-script += 'e~r0100,12,326016~d~r046,10,326089,433,626088~.~r032,11,326090~ ~r12,326091~ ~r084,13,326092~T~r0104,14,326093~'
-script += 'h~r0101,15,326094~e~r032,16,326095~ ~r0111,17,326096~o~r0114,18,326097~r~r098,19,326098~b~r032,110,326099~'
-script += ' ~r098,111,326100~b~r0101,112,326101~e~r0103,113,326102~g~r0105,114,326103~i~r0110,115,326104~n~r0115,116,326105~'
-script += 's~r032,117,326106~ ~r0115,118,326107~s~r0117,119,326108~u~r098,120,326109~b~r0116,121,326110~t~r0108,122,326111~'
-script += 'l~r0121,123,326112~y~r032,124,326113~ ~r0103,125,326114~g~r0108,126,326115~l~r0111,127,326116~o~r0119,128,326117~'
-script += 'w~r0105,129,326118~i~r0110,130,326119~n~r0103,131,326120~g~r032,132,326121~ ~r0114,10,326014,43,626013~'
-script += 'r~r0101,11,326015~e~r0100,12,326016~d~r026013,126013,35,4101,50,60~.\n\n~r02573,10~== ~r086,315075,410,51528,615074~'
-script += 'V~r097,11,315076~a~r0117,12,315077~u~r0108,13,315078~l~r0116,14,315079~t~r032,15,315080~ ~r076,16,315081~'
-script += 'L~r0111,17,315082~o~r099,18,315083~c~r0107,19,315084~k~r015074,10,35,4101,50,60~ ==\n~r089,315086,4128,51528,615085~'
-script += 'Y~r0111,11,315087~o~r0117,12,315088~u~r032,13,315089~ ~r097,14,315090~a~r0114,15,315091~r~r0101,16,315092~'
-script += 'e~r032,17,315093~ ~r0105,18,315094~i~r0110,19,315095~n~r032,110,315096~ ~r097,111,315097~a~r032,112,315098~'
-script += ' ~r0103,113,315099~g~r0114,114,315100~r~r0105,115,315101~i~r0100,116,315102~d~r032,117,315103~ ~r0111,118,315104~'
-script += 'o~r0102,119,315105~f~r032,120,315106~ ~r0114,121,315107~r~r0111,122,315108~o~r123,315109~o~r0109,124,315110~'
-script += 'm~r0115,125,315111~s~r032,126,315112~ ~r0116,127,315113~t~r0104,128,315114~h~r097,129,315115~a~r0116,130,315116~'
-script += 't~r032,131,315117~ ~r099,132,315118~c~r0111,133,315119~o~r0110,134,315120~n~r0116,135,315121~t~r0114,136,315122~'
-script += 'r~r0111,137,315123~o~r0108,138,315124~l~r032,139,315125~ ~r0116,140,315126~t~r0104,141,315127~h~r0101,142,315128~'
-script += 'e~r032,143,315129~ ~r0100,144,315130~d~r0111,145,315131~o~r146,315132~o~r0114,147,315133~r~r032,148,315134~'
-script += ' ~r0116,149,315135~t~r0111,150,315136~o~r032,151,315137~ ~r0116,152,315138~t~r0104,153,315139~h~r0101,154,315140~'
-script += 'e~r032,155,315141~ ~r0118,156,315142~v~r097,157,315143~a~r0117,158,315144~u~r0108,159,315145~l~r0116,160,315146~'
-script += 't~r046,161,315147~.~r010,162,315148~\n~r163,315149~\n~r084,164,315150~T~r0104,165,315151~h~r0101,166,315152~'
-script += 'e~r032,167,315153~ ~r0102,168,315154~f~r0108,169,315155~l~r0111,170,315156~o~r171,315157~o~r0114,172,315158~'
-script += 'r~r032,173,315159~ ~r0111,174,315160~o~r0102,175,315161~f~r032,176,315162~ ~r0116,177,315163~t~r0104,178,315164~'
-script += 'h~r0105,179,315165~i~r0115,180,315166~s~r032,181,315167~ ~r0114,182,315168~r~r0111,183,315169~o~r184,315170~'
-script += 'o~r0109,185,315171~m~r032,186,315172~ ~r0105,187,315173~i~r0115,188,315174~s~r032,189,315175~ ~r097,190,315176~'
-script += 'a~r032,191,315177~ ~r0108,192,315178~l~r097,193,315179~a~r0114,194,315180~r~r0103,195,315181~g~r0101,196,315182~'
-script += 'e~r032,197,315183~ ~r0109,198,315184~m~r0111,199,315185~o~r0115,1100,315186~s~r097,1101,315187~a~r0105,1102,315188~'
-script += 'i~r099,1103,315189~c~r032,1104,315190~ ~r0100,1105,315191~d~r0101,1106,315192~e~r0112,1107,315193~p~r0105,1108,315194~'
-script += 'i~r099,1109,315195~c~r0116,1110,315196~t~r0105,1111,315197~i~r0110,1112,315198~n~r0103,1113,315199~g'
-script += '~r032,1114,315200~ ~r097,1115,315201~a~r032,1116,315202~ ~r039,1117,315203~\'~r045,1118,315204~-~r039,1119,315205~'
-script += '\'~r032,1120,315206~ ~r0115,1121,315207~s~r0121,1122,315208~y~r0109,1123,315209~m~r098,1124,315210~b'
-script += '~r0111,1125,315211~o~r0108,1126,315212~l~r046,1127,315213~.~r015085,10,35,4101,50,60~\n~r03~\nThere '
-script += 'are ~r051,110,210,332765,451,51~3~r03,10,20,35,4101,50~ exits:\n~r015214,327238,43,55814,627237~- ~r0101,315215,44,51528,615214~'
-script += 'e~r097,11,315216~a~r0115,12,315217~s~r0116,13,315218~t~r015214,10,327238,43,55814,627237~\n~r015219,11,327239~'
-script += '- ~r0115,10,315220,45,51528,615219~s~r0111,11,315221~o~r0117,12,315222~u~r0116,13,315223~t~r0104,14,315224~'
-script += 'h~r015219,11,327239,43,55814,627237~\n~r015225,12,327240~- ~r0119,10,315226,44,51528,615225~w~r0101,11,315227~'
-script += 'e~r0115,12,315228~s~r0116,13,315229~t~r015225,12,327240,43,55814,627237~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~e~r025976,51~a~r025977,497,52~'
-script += 's~r025978,4115,53~t~r025979,4116,54~\n~r032,20,35,4101,50~~moutput~\n\n~r065,10,326123,447,51528,626122~'
-script += '~v27322578~A~r0115,11,326124~s~r032,12,326125~ ~r0121,13,326126~y~r0111,14,326127~o~r0117,15,326128~'
-script += 'u~r032,16,326129~ ~r0101,17,326130~e~r0110,18,326131~n~r0116,19,326132~t~r0101,110,326133~e~r0114,111,326134~'
-script += 'r~r032,112,326135~ ~r0116,113,326136~t~r0104,114,326137~h~r0101,115,326138~e~r032,116,326139~ ~r0114,117,326140~'
-script += 'r~r0111,118,326141~o~r119,326142~o~r0109,120,326143~m~r044,121,326144~,~r032,122,326145~ ~r0116,123,326146~'
-script += 't~r0104,124,326147~h~r0101,125,326148~e~r032,126,326149~ ~r0111,127,326150~o~r0114,128,326151~r~r098,129,326152~'
-script += 'b~r032,130,326153~ ~r098,131,326154~b~r0114,132,326155~r~r0105,133,326156~i~r0101,134,326157~e~r0102,135,326158~'
-script += 'f~r0108,136,326159~l~r0121,137,326160~y~r032,138,326161~ ~r0102,139,326162~f~r0108,140,326163~l~r097,141,326164~'
-script += 'a~r0115,142,326165~s~r0104,143,326166~h~r0101,144,326167~e~r0115,145,326168~s~r032,146,326169~ ~r0114,10,326014,43,626013~'
-script += 'r~r0101,11,326015~e~r0100,12,326016~d~r046,10,326171,464,626170~.~r032,11,326172~ ~r12,326173~ ~r084,13,326174~'
-script += 'T~r0104,14,326175~h~r0101,15,326176~e~r032,16,326177~ ~r0110,17,326178~n~r0117,18,326179~u~r0109,19,326180~'
-script += 'm~r098,110,326181~b~r0101,111,326182~e~r0114,112,326183~r~r032,113,326184~ ~r0111,114,326185~o~r0110,115,326186~'
-script += 'n~r032,116,326187~ ~r0116,117,326188~t~r0104,118,326189~h~r0101,119,326190~e~r032,120,326191~ ~r0102,121,326192~'
-script += 'f~r0108,122,326193~l~r0111,123,326194~o~r124,326195~o~r0114,125,326196~r~r032,126,326197~ ~r0118,127,326198~'
-script += 'v~r0105,128,326199~i~r098,129,326200~b~r0114,130,326201~r~r097,131,326202~a~r0116,132,326203~t~r0101,133,326204~'
-script += 'e~r0115,134,326205~s~r032,135,326206~ ~r0115,136,326207~s~r0116,137,326208~t~r0114,138,326209~r~r097,139,326210~'
-script += 'a~r0110,140,326211~n~r0103,141,326212~g~r0101,142,326213~e~r0108,143,326214~l~r0121,144,326215~y~r032,145,326216~'
-script += ' ~r098,146,326217~b~r0101,147,326218~e~r0110,148,326219~n~r0101,149,326220~e~r097,150,326221~a~r0116,151,326222~'
-script += 't~r0104,152,326223~h~r032,153,326224~ ~r0121,154,326225~y~r0111,155,326226~o~r0117,156,326227~u~r0114,157,326228~'
-script += 'r~r032,158,326229~ ~r0102,159,326230~f~r0101,160,326231~e~r161,326232~e~r0116,162,326233~t~r046,163,326234~'
-script += '.~r032,10,21,326268,431,626267~ ~r11,326269~ ~r084,12,326270~T~r0104,13,326271~h~r0101,14,326272~e~r032,15,326273~'
-script += ' ~r0111,16,326274~o~r0114,17,326275~r~r098,18,326276~b~r032,19,326277~ ~r0115,110,326278~s~r0101,111,326279~'
-script += 'e~r112,326280~e~r0109,113,326281~m~r0115,114,326282~s~r032,115,326283~ ~r0116,116,326284~t~r0111,117,326285~'
-script += 'o~r032,118,326286~ ~r0103,119,326287~g~r0101,120,326288~e~r0116,121,326289~t~r032,122,326290~ ~r0108,123,326291~'
-script += 'l~r0105,124,326292~i~r0103,125,326293~g~r0104,126,326294~h~r0116,127,326295~t~r0101,128,326296~e~r0114,129,326297~'
-script += 'r~r046,130,326298~.~r030,131,34,4101,50,60~\n\n~r065,10,20,326322,432,51528,626321~A~r0115,11,326323~'
-script += 's~r032,12,326324~ ~r0121,13,326325~y~r0111,14,326326~o~r0117,15,326327~u~r032,16,326328~ ~r097,17,326329~'
-script += 'a~r0112,18,326330~p~r19,326331~p~r0114,110,326332~r~r0111,111,326333~o~r097,112,326334~a~r099,113,326335~'
-script += 'c~r0104,114,326336~h~r032,115,326337~ ~r0116,116,326338~t~r0104,117,326339~h~r0101,118,326340~e~r032,119,326341~'
-script += ' ~r0118,120,326342~v~r097,121,326343~a~r0117,122,326344~u~r0108,123,326345~l~r0116,124,326346~t~r032,125,326347~'
-script += ' ~r0100,126,326348~d~r0111,127,326349~o~r128,326350~o~r0114,129,326351~r~r044,130,326352~,~r032,131,326353~'
-script += ' ~r0116,10,326441,443,626440~t~r0104,11,326442~h~r0101,12,326443~e~r032,13,326444~ ~r0110,14,326445~'
-script += 'n~r0117,15,326446~u~r0109,16,326447~m~r098,17,326448~b~r0101,18,326449~e~r0114,19,326450~r~r032,110,326451~'
-script += ' ~r0111,111,326452~o~r0110,112,326453~n~r032,113,326454~ ~r0116,114,326455~t~r0104,115,326456~h~r0101,116,326457~'
-script += 'e~r032,117,326458~ ~r0118,118,326459~v~r097,119,326460~a~r0117,120,326461~u~r0108,121,326462~l~r0116,122,326463~'
-script += 't~r032,123,326464~ ~r0100,124,326465~d~r0111,125,326466~o~r126,326467~o~r0114,127,326468~r~r032,128,326469~'
-script += ' ~r0102,129,326470~f~r0108,130,326471~l~r097,131,326472~a~r0115,132,326473~s~r0104,133,326474~h~r0101,134,326475~'
-script += 'e~r0115,135,326476~s~r032,136,326477~ ~r0119,137,326478~w~r0104,138,326479~h~r0105,139,326480~i~r0116,140,326481~'
-script += 't~r0101,141,326482~e~r033,142,326483~!~r032,10,326585,4132,626584~ ~r11,326586~ ~r084,12,326587~T~r0104,13,326588~'
-script += 'h~r0101,14,326589~e~r032,15,326590~ ~r0104,16,326591~h~r0111,17,326592~o~r0117,18,326593~u~r0114,19,326594~'
-script += 'r~r0103,110,326595~g~r0108,111,326596~l~r097,112,326597~a~r0115,113,326598~s~r114,326599~s~r032,115,326600~'
-script += ' ~r0105,116,326601~i~r0115,117,326602~s~r032,118,326603~ ~r0115,119,326604~s~r0116,120,326605~t~r0105,121,326606~'
-script += 'i~r0108,122,326607~l~r123,326608~l~r032,124,326609~ ~r0114,125,326610~r~r0117,126,326611~u~r0110,127,326612~'
-script += 'n~r128,326613~n~r0105,129,326614~i~r0110,130,326615~n~r0103,131,326616~g~r033,132,326617~!~r032,133,326618~'
-script += ' ~r134,326619~ ~r073,135,326620~I~r0116,136,326621~t~r032,137,326622~ ~r0102,138,326623~f~r0108,139,326624~'
-script += 'l~r097,140,326625~a~r0115,141,326626~s~r0104,142,326627~h~r0101,143,326628~e~r0115,144,326629~s~r032,145,326630~'
-script += ' ~r0119,146,326631~w~r0104,147,326632~h~r0105,148,326633~i~r0116,149,326634~t~r0101,150,326635~e~r033,151,326636~'
-script += '!~r032,152,326637~ ~r153,326638~ ~r089,154,326639~Y~r0111,155,326640~o~r0117,156,326641~u~r032,157,326642~'
-script += ' ~r0104,158,326643~h~r0101,159,326644~e~r097,160,326645~a~r0114,161,326646~r~r032,162,326647~ ~r097,163,326648~'
-script += 'a~r032,164,326649~ ~r099,165,326650~c~r0108,166,326651~l~r0105,167,326652~i~r099,168,326653~c~r0107,169,326654~'
-script += 'k~r032,170,326655~ ~r0102,171,326656~f~r0114,172,326657~r~r0111,173,326658~o~r0109,174,326659~m~r032,175,326660~'
-script += ' ~r0116,176,326661~t~r0104,177,326662~h~r0101,178,326663~e~r032,179,326664~ ~r0118,180,326665~v~r097,181,326666~'
-script += 'a~r0117,182,326667~u~r0108,183,326668~l~r0116,184,326669~t~r032,185,326670~ ~r0100,186,326671~d~r0111,187,326672~'
-script += 'o~r188,326673~o~r0114,189,326674~r~r046,190,326675~.~r032,191,326676~ ~r192,326677~ ~r084,193,326678~'
-script += 'T~r0104,194,326679~h~r0101,195,326680~e~r032,196,326681~ ~r0111,197,326682~o~r0114,198,326683~r~r098,199,326684~'
-script += 'b~r032,1100,326685~ ~r0101,1101,326686~e~r0118,1102,326687~v~r097,1103,326688~a~r0112,1104,326689~p~r0111,1105,326690~'
-script += 'o~r0114,1106,326691~r~r097,1107,326692~a~r0116,1108,326693~t~r0101,1109,326694~e~r0115,1110,326695~s'
-script += '~r032,1111,326696~ ~r0111,1112,326697~o~r0117,1113,326698~u~r0116,1114,326699~t~r032,1115,326700~ ~r0111,1116,326701~'
-script += 'o~r0102,1117,326702~f~r032,1118,326703~ ~r0104,1119,326704~h~r0111,1120,326705~o~r0117,1121,326706~u'
-script += '~r0114,1122,326707~r~r032,1123,326708~ ~r0104,1124,326709~h~r097,1125,326710~a~r0110,1126,326711~n~r0100,1127,326712~'
-script += 'd~r0115,1128,326713~s~r046,1129,326714~.~r010,1130,326715~\n~r1131,326716~\n~r02578,10,34,4101,50,60~'
-script += '~v271832767~== ~r086,315231,410,51528,615230~V~r097,11,315232~a~r0117,12,315233~u~r0108,13,315234~l~r0116,14,315235~'
-script += 't~r032,15,315236~ ~r068,16,315237~D~r0111,17,315238~o~r18,315239~o~r0114,19,315240~r~r015230,10,34,4101,50,60~'
-script += ' ==\n~r089,315242,4246,51528,615241~Y~r0111,11,315243~o~r0117,12,315244~u~r032,13,315245~ ~r0115,14,315246~'
-script += 's~r0116,15,315247~t~r097,16,315248~a~r0110,17,315249~n~r0100,18,315250~d~r032,19,315251~ ~r098,110,315252~'
-script += 'b~r0101,111,315253~e~r0102,112,315254~f~r0111,113,315255~o~r0114,114,315256~r~r0101,115,315257~e~r032,116,315258~'
-script += ' ~r0116,117,315259~t~r0104,118,315260~h~r0101,119,315261~e~r032,120,315262~ ~r0100,121,315263~d~r0111,122,315264~'
-script += 'o~r123,315265~o~r0114,124,315266~r~r032,125,315267~ ~r0116,126,315268~t~r0111,127,315269~o~r032,128,315270~'
-script += ' ~r0116,129,315271~t~r0104,130,315272~h~r0101,131,315273~e~r032,132,315274~ ~r0118,133,315275~v~r097,134,315276~'
-script += 'a~r0117,135,315277~u~r0108,136,315278~l~r0116,137,315279~t~r059,138,315280~;~r032,139,315281~ ~r0105,140,315282~'
-script += 'i~r0116,141,315283~t~r032,142,315284~ ~r0104,143,315285~h~r097,144,315286~a~r0115,145,315287~s~r032,146,315288~'
-script += ' ~r097,147,315289~a~r032,148,315290~ ~r0108,149,315291~l~r097,150,315292~a~r0114,151,315293~r~r0103,152,315294~'
-script += 'g~r0101,153,315295~e~r032,154,315296~ ~r039,155,315297~\'~r051,156,315298~3~r048,157,315299~0~r039,158,315300~'
-script += '\'~r032,159,315301~ ~r099,160,315302~c~r097,161,315303~a~r0114,162,315304~r~r0118,163,315305~v~r0101,164,315306~'
-script += 'e~r0100,165,315307~d~r032,166,315308~ ~r0105,167,315309~i~r0110,168,315310~n~r0116,169,315311~t~r0111,170,315312~'
-script += 'o~r032,171,315313~ ~r0105,172,315314~i~r0116,173,315315~t~r046,174,315316~.~r032,175,315317~ ~r176,315318~'
-script += ' ~r065,177,315319~A~r0102,178,315320~f~r179,315321~f~r0105,180,315322~i~r0120,181,315323~x~r0101,182,315324~'
-script += 'e~r0100,183,315325~d~r032,184,315326~ ~r0116,185,315327~t~r0111,186,315328~o~r032,187,315329~ ~r0116,188,315330~'
-script += 't~r0104,189,315331~h~r0101,190,315332~e~r032,191,315333~ ~r0119,192,315334~w~r097,193,315335~a~r0108,194,315336~'
-script += 'l~r195,315337~l~r032,196,315338~ ~r0110,197,315339~n~r0101,198,315340~e~r097,199,315341~a~r0114,1100,315342~'
-script += 'r~r032,1101,315343~ ~r0116,1102,315344~t~r0104,1103,315345~h~r0101,1104,315346~e~r032,1105,315347~ ~r0100,1106,315348~'
-script += 'd~r0111,1107,315349~o~r1108,315350~o~r0114,1109,315351~r~r044,1110,315352~,~r032,1111,315353~ ~r0116,1112,315354~'
-script += 't~r0104,1113,315355~h~r0101,1114,315356~e~r0114,1115,315357~r~r0101,1116,315358~e~r032,1117,315359~ '
-script += '~r0105,1118,315360~i~r0115,1119,315361~s~r032,1120,315362~ ~r097,1121,315363~a~r032,1122,315364~ ~r0114,1123,315365~'
-script += 'r~r0117,1124,315366~u~r0110,1125,315367~n~r1126,315368~n~r0105,1127,315369~i~r0110,1128,315370~n~r0103,1129,315371~'
-script += 'g~r032,1130,315372~ ~r0104,1131,315373~h~r0111,1132,315374~o~r0117,1133,315375~u~r0114,1134,315376~r'
-script += '~r0103,1135,315377~g~r0108,1136,315378~l~r097,1137,315379~a~r0115,1138,315380~s~r1139,315381~s~r032,1140,315382~'
-script += ' ~r0119,1141,315383~w~r0104,1142,315384~h~r0105,1143,315385~i~r099,1144,315386~c~r0104,1145,315387~h'
-script += '~r032,1146,315388~ ~r0110,1147,315389~n~r0101,1148,315390~e~r0118,1149,315391~v~r0101,1150,315392~e~r0114,1151,315393~'
-script += 'r~r032,1152,315394~ ~r0115,1153,315395~s~r0101,1154,315396~e~r1155,315397~e~r0109,1156,315398~m~r0115,1157,315399~'
-script += 's~r032,1158,315400~ ~r0116,1159,315401~t~r0111,1160,315402~o~r032,1161,315403~ ~r0114,1162,315404~r~r0117,1163,315405~'
-script += 'u~r0110,1164,315406~n~r032,1165,315407~ ~r0111,1166,315408~o~r0117,1167,315409~u~r0116,1168,315410~t'
-script += '~r032,1169,315411~ ~r0111,1170,315412~o~r0102,1171,315413~f~r032,1172,315414~ ~r0115,1173,315415~s~r097,1174,315416~'
-script += 'a~r0110,1175,315417~n~r0100,1176,315418~d~r046,1177,315419~.~r010,1178,315420~\n~r1179,315421~\n~r084,1180,315422~'
-script += 'T~r0104,1181,315423~h~r0101,1182,315424~e~r032,1183,315425~ ~r0102,1184,315426~f~r0108,1185,315427~l'
-script += '~r0111,1186,315428~o~r1187,315429~o~r0114,1188,315430~r~r032,1189,315431~ ~r0111,1190,315432~o~r0102,1191,315433~'
-script += 'f~r032,1192,315434~ ~r0116,1193,315435~t~r0104,1194,315436~h~r0105,1195,315437~i~r0115,1196,315438~s'
-script += '~r032,1197,315439~ ~r0114,1198,315440~r~r0111,1199,315441~o~r1200,315442~o~r0109,1201,315443~m~r032,1202,315444~'
-script += ' ~r0105,1203,315445~i~r0115,1204,315446~s~r032,1205,315447~ ~r097,1206,315448~a~r032,1207,315449~ ~r0108,1208,315450~'
-script += 'l~r097,1209,315451~a~r0114,1210,315452~r~r0103,1211,315453~g~r0101,1212,315454~e~r032,1213,315455~ ~r0109,1214,315456~'
-script += 'm~r0111,1215,315457~o~r0115,1216,315458~s~r097,1217,315459~a~r0105,1218,315460~i~r099,1219,315461~c~r032,1220,315462~'
-script += ' ~r0100,1221,315463~d~r0101,1222,315464~e~r0112,1223,315465~p~r0105,1224,315466~i~r099,1225,315467~c'
-script += '~r0116,1226,315468~t~r0105,1227,315469~i~r0110,1228,315470~n~r0103,1229,315471~g~r032,1230,315472~ ~r0116,1231,315473~'
-script += 't~r0104,1232,315474~h~r0101,1233,315475~e~r032,1234,315476~ ~r0110,1235,315477~n~r0117,1236,315478~u'
-script += '~r0109,1237,315479~m~r098,1238,315480~b~r0101,1239,315481~e~r0114,1240,315482~r~r032,1241,315483~ ~r039,1242,315484~'
-script += '\'~r049,1243,315485~1~r039,1244,315486~\'~r046,1245,315487~.~r015241,10,34,4101,50,60~\n~r03~\nThere'
-script += ' are ~r051,110,210,332765,451,51~3~r03,10,20,34,4101,50~ exits:\n~r015488,327246,43,55814,627245~- ~r0115,315489,45,51528,615488~'
-script += 's~r0111,11,315490~o~r0117,12,315491~u~r0116,13,315492~t~r0104,14,315493~h~r015488,10,327246,43,55814,627245~'
-script += '\n~r015494,11,327247~- ~r0119,10,315495,44,51528,615494~w~r0101,11,315496~e~r0115,12,315497~s~r0116,13,315498~'
-script += 't~r015494,11,327247,43,55814,627245~\n~r015499,12,327248~- ~r0118,10,315500,45,51528,615499~v~r097,11,315501~'
-script += 'a~r0117,12,315502~u~r0108,13,315503~l~r0116,14,315504~t~r015499,12,327248,43,55814,627245~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~v~r025976,4118,51~a~r025977,497,52~'
-script += 'u~r025978,4117,53~l~r025979,4108,54~t~r025980,4116,55~\n~r032,20,34,4101,50~~moutput~\n\n~r02643,10,35~'
-script += '~v27322643~== ~r086,317437,45,51528,617436~V~r097,11,317438~a~r0117,12,317439~u~r0108,13,317440~l~r0116,14,317441~'
-script += 't~r017436,10,35,4101,50,60~ ==\n~r084,317443,4212,51528,617442~T~r0104,11,317444~h~r0105,12,317445~i'
-script += '~r0115,13,317446~s~r032,14,317447~ ~r0118,15,317448~v~r097,16,317449~a~r0117,17,317450~u~r0108,18,317451~'
-script += 'l~r0116,19,317452~t~r032,110,317453~ ~r099,111,317454~c~r0111,112,317455~o~r0110,113,317456~n~r0116,114,317457~'
-script += 't~r097,115,317458~a~r0105,116,317459~i~r0110,117,317460~n~r0115,118,317461~s~r032,119,317462~ ~r0105,120,317463~'
-script += 'i~r0110,121,317464~n~r099,122,317465~c~r0114,123,317466~r~r0101,124,317467~e~r0100,125,317468~d~r0105,126,317469~'
-script += 'i~r098,127,317470~b~r0108,128,317471~l~r0101,129,317472~e~r032,130,317473~ ~r0114,131,317474~r~r0105,132,317475~'
-script += 'i~r099,133,317476~c~r0104,134,317477~h~r0101,135,317478~e~r0115,136,317479~s~r033,137,317480~!~r032,138,317481~'
-script += ' ~r139,317482~ ~r080,140,317483~P~r0105,141,317484~i~r0108,142,317485~l~r0101,143,317486~e~r0115,144,317487~'
-script += 's~r032,145,317488~ ~r0111,146,317489~o~r0102,147,317490~f~r032,148,317491~ ~r0103,149,317492~g~r0111,150,317493~'
-script += 'o~r0108,151,317494~l~r0100,152,317495~d~r032,153,317496~ ~r097,154,317497~a~r0110,155,317498~n~r0100,156,317499~'
-script += 'd~r032,157,317500~ ~r0112,158,317501~p~r0108,159,317502~l~r097,160,317503~a~r0116,161,317504~t~r0105,162,317505~'
-script += 'i~r0110,163,317506~n~r0117,164,317507~u~r0109,165,317508~m~r032,166,317509~ ~r099,167,317510~c~r0111,168,317511~'
-script += 'o~r0105,169,317512~i~r0110,170,317513~n~r0115,171,317514~s~r032,172,317515~ ~r0115,173,317516~s~r0117,174,317517~'
-script += 'u~r0114,175,317518~r~r176,317519~r~r0111,177,317520~o~r0117,178,317521~u~r0110,179,317522~n~r0100,180,317523~'
-script += 'd~r032,181,317524~ ~r0121,182,317525~y~r0111,183,317526~o~r0117,184,317527~u~r044,185,317528~,~r032,186,317529~'
-script += ' ~r097,187,317530~a~r0110,188,317531~n~r0100,189,317532~d~r032,190,317533~ ~r0116,191,317534~t~r0104,192,317535~'
-script += 'h~r0101,193,317536~e~r032,194,317537~ ~r0119,195,317538~w~r097,196,317539~a~r0108,197,317540~l~r198,317541~'
-script += 'l~r0115,199,317542~s~r032,1100,317543~ ~r097,1101,317544~a~r0114,1102,317545~r~r0101,1103,317546~e~r032,1104,317547~'
-script += ' ~r097,1105,317548~a~r0100,1106,317549~d~r0111,1107,317550~o~r0114,1108,317551~r~r0110,1109,317552~n'
-script += '~r0101,1110,317553~e~r0100,1111,317554~d~r032,1112,317555~ ~r0119,1113,317556~w~r0105,1114,317557~i~r0116,1115,317558~'
-script += 't~r0104,1116,317559~h~r032,1117,317560~ ~r0116,1118,317561~t~r0111,1119,317562~o~r0112,1120,317563~p'
-script += '~r097,1121,317564~a~r0122,1122,317565~z~r0101,1123,317566~e~r0115,1124,317567~s~r044,1125,317568~,~r032,1126,317569~'
-script += ' ~r0114,1127,317570~r~r0117,1128,317571~u~r098,1129,317572~b~r0105,1130,317573~i~r0101,1131,317574~e'
-script += '~r0115,1132,317575~s~r044,1133,317576~,~r032,1134,317577~ ~r0115,1135,317578~s~r097,1136,317579~a~r0112,1137,317580~'
-script += 'p~r1138,317581~p~r0104,1139,317582~h~r0105,1140,317583~i~r0114,1141,317584~r~r0101,1142,317585~e~r0115,1143,317586~'
-script += 's~r044,1144,317587~,~r032,1145,317588~ ~r0101,1146,317589~e~r0109,1147,317590~m~r0101,1148,317591~e~r0114,1149,317592~'
-script += 'r~r097,1150,317593~a~r0108,1151,317594~l~r0100,1152,317595~d~r0115,1153,317596~s~r044,1154,317597~,~r032,1155,317598~'
-script += ' ~r0111,1156,317599~o~r0112,1157,317600~p~r097,1158,317601~a~r0108,1159,317602~l~r0115,1160,317603~s'
-script += '~r044,1161,317604~,~r032,1162,317605~ ~r0100,1163,317606~d~r0105,1164,317607~i~r0108,1165,317608~l~r0105,1166,317609~'
-script += 'i~r0116,1167,317610~t~r0104,1168,317611~h~r0105,1169,317612~i~r0117,1170,317613~u~r0109,1171,317614~'
-script += 'm~r032,1172,317615~ ~r099,1173,317616~c~r0114,1174,317617~r~r0121,1175,317618~y~r0115,1176,317619~s~r0116,1177,317620~'
-script += 't~r097,1178,317621~a~r0108,1179,317622~l~r0115,1180,317623~s~r044,1181,317624~,~r032,1182,317625~ ~r0101,1183,317626~'
-script += 'e~r0108,1184,317627~l~r0101,1185,317628~e~r0114,1186,317629~r~r0105,1187,317630~i~r0117,1188,317631~'
-script += 'u~r0109,1189,317632~m~r045,1190,317633~-~r049,1191,317634~1~r1192,317635~1~r053,1193,317636~5~r044,1194,317637~'
-script += ',~r032,1195,317638~ ~r097,1196,317639~a~r0110,1197,317640~n~r0100,1198,317641~d~r032,1199,317642~ ~r0117,1200,317643~'
-script += 'u~r0110,1201,317644~n~r0111,1202,317645~o~r098,1203,317646~b~r0116,1204,317647~t~r097,1205,317648~a~r0105,1206,317649~'
-script += 'i~r0110,1207,317650~n~r0105,1208,317651~i~r0117,1209,317652~u~r0109,1210,317653~m~r046,1211,317654~.'
-script += '~r017442,10,35,4101,50,60~\n~r010,19212,29212,327456,426,51531,627455~\n~r084,327457~T~r0104,327458~'
-script += 'h~r0105,327459~i~r0110,327460~n~r0103,327461~g~r0115,327462~s~r032,327463~ ~r0111,327464~o~r0102,327465~'
-script += 'f~r032,327466~ ~r0105,327467~i~r0110,327468~n~r0116,327469~t~r0101,327470~e~r0114,327471~r~r0101,327472~'
-script += 'e~r0115,327473~s~r0116,327474~t~r032,327475~ ~r0104,327476~h~r0101,327477~e~r0114,327478~r~r0101,327479~'
-script += 'e~r058,327480~:~r010,327481~\n~r019258,115,22643,31,416,55893,627381~- ~r0109,10,319259,46,51528,619258~'
-script += 'm~r0105,11,319260~i~r0114,12,319261~r~r13,319262~r~r0111,14,319263~o~r0114,15,319264~r~r019258,115,31,416,55893,627381~'
-script += '\n~r01,10,21,35,4101,50,60~\nThere is ~r049,110,210,332767,449,51~1~r01,10,21,35,4101,50~ exit:\n~r017655,327356,41,55814,627355~'
-script += '- ~r0108,317656,45,51528,617655~l~r0101,11,317657~e~r097,12,317658~a~r0118,13,317659~v~r0101,14,317660~'
-script += 'e~r017655,10,327356,41,55814,627355~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~~minput~t~r025976,4116,51~a~r025977,497,52~k~r025978,4107,53~'
-script += 'e~r025979,4101,54~ ~r025980,432,55~m~r025981,4109,56~i~r025982,4105,57~r~r025983,4114,58~r~r025984,59~'
-script += 'o~r025985,4111,510~r~r025986,4114,511~\n~r032,20,35,4101,50~~moutput~\n\n~r084,114065,214065,328055,47,51531,628054~'
-script += '~v27220~T~r097,328056~a~r0107,328057~k~r0101,328058~e~r0110,328059~n~r046,328060~.~r010,328061~\n~r132613,232613,327415,417,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~u~r025976,4117,51~s~r025977,4115,52~'
-script += 'e~r025978,4101,53~ ~r025979,432,54~m~r025980,4109,55~i~r025981,4105,56~r~r025982,4114,57~r~r025983,58~'
-script += 'o~r025984,4111,59~r~r025985,4114,510~\n~r032,24,36,4101,50~~moutput~\n\n~r089,120852,220852,329758,4184,51531,629757~'
-script += 'Y~r0111,329759~o~r0117,329760~u~r032,329761~ ~r0103,329762~g~r097,329763~a~r0122,329764~z~r0101,329765~'
-script += 'e~r032,329766~ ~r0105,329767~i~r0110,329768~n~r0116,329769~t~r0111,329770~o~r032,329771~ ~r0116,329772~'
-script += 't~r0104,329773~h~r0101,329774~e~r032,329775~ ~r0109,329776~m~r0105,329777~i~r0114,329778~r~r329779~r'
-script += '~r0111,329780~o~r0114,329781~r~r044,329782~,~r032,329783~ ~r097,329784~a~r0110,329785~n~r0100,329786~'
-script += 'd~r032,329787~ ~r0121,329788~y~r0111,329789~o~r0117,329790~u~r032,329791~ ~r0115,329792~s~r0101,329793~'
-script += 'e~r329794~e~r032,329795~ ~r0121,329796~y~r0111,329797~o~r0117,329798~u~r0114,329799~r~r0115,329800~s'
-script += '~r0101,329801~e~r0108,329802~l~r0102,329803~f~r032,329804~ ~r0103,329805~g~r097,329806~a~r0122,329807~'
-script += 'z~r0105,329808~i~r0110,329809~n~r0103,329810~g~r032,329811~ ~r098,329812~b~r097,329813~a~r099,329814~'
-script += 'c~r0107,329815~k~r046,329816~.~r032,329817~ ~r329818~ ~r066,329819~B~r0117,329820~u~r0116,329821~t~r032,329822~'
-script += ' ~r0119,329823~w~r097,329824~a~r0105,329825~i~r0116,329826~t~r033,329827~!~r032,329828~ ~r329829~ ~r073,329830~'
-script += 'I~r0116,329831~t~r032,329832~ ~r0108,329833~l~r0111,329834~o~r329835~o~r0107,329836~k~r0115,329837~s'
-script += '~r032,329838~ ~r0108,329839~l~r0105,329840~i~r0107,329841~k~r0101,329842~e~r032,329843~ ~r0115,329844~'
-script += 's~r0111,329845~o~r0109,329846~m~r0101,329847~e~r0111,329848~o~r0110,329849~n~r0101,329850~e~r032,329851~'
-script += ' ~r0119,329852~w~r0114,329853~r~r0111,329854~o~r0116,329855~t~r0101,329856~e~r032,329857~ ~r0111,329858~'
-script += 'o~r0110,329859~n~r032,329860~ ~r0121,329861~y~r0111,329862~o~r0117,329863~u~r0114,329864~r~r032,329865~'
-script += ' ~r0102,329866~f~r097,329867~a~r099,329868~c~r0101,329869~e~r032,329870~ ~r0119,329871~w~r0104,329872~'
-script += 'h~r0105,329873~i~r0108,329874~l~r0101,329875~e~r032,329876~ ~r0121,329877~y~r0111,329878~o~r0117,329879~'
-script += 'u~r032,329880~ ~r0119,329881~w~r0101,329882~e~r0114,329883~r~r0101,329884~e~r032,329885~ ~r0117,329886~'
-script += 'u~r0110,329887~n~r099,329888~c~r0111,329889~o~r0110,329890~n~r0115,329891~s~r099,329892~c~r0105,329893~'
-script += 'i~r0111,329894~o~r0117,329895~u~r0115,329896~s~r032,329897~ ~r0111,329898~o~r0110,329899~n~r032,329900~'
-script += ' ~r0116,329901~t~r0104,329902~h~r0101,329903~e~r032,329904~ ~r098,329905~b~r0101,329906~e~r097,329907~'
-script += 'a~r099,329908~c~r0104,329909~h~r033,329910~!~r032,329911~ ~r329912~ ~r084,329913~T~r0104,329914~h~r0114,329915~'
-script += 'r~r0111,329916~o~r0117,329917~u~r0103,329918~g~r0104,329919~h~r032,329920~ ~r0116,329921~t~r0104,329922~'
-script += 'h~r0101,329923~e~r032,329924~ ~r0109,329925~m~r0105,329926~i~r0114,329927~r~r329928~r~r0111,329929~o'
-script += '~r0114,329930~r~r044,329931~,~r032,329932~ ~r0121,329933~y~r0111,329934~o~r0117,329935~u~r032,329936~'
-script += ' ~r0115,329937~s~r0101,329938~e~r329939~e~r032,329940~ ~r034,329941~"~r089,10,24,36130,412,51528,66129~'
-script += 'Y~r0113,11,36131~q~r084,12,36132~T~r0111,13,36133~o~r0105,14,36134~i~r088,15,36135~X~r0111,16,36136~'
-script += 'o~r085,17,36137~U~r0108,18,36138~l~r085,19,36139~U~r079,110,36140~O~r089,111,36141~Y~r034,132105,232105,329947,4103,51531,629946~'
-script += '"~r032,329948~ ~r0115,329949~s~r099,329950~c~r0114,329951~r~r097,329952~a~r0119,329953~w~r0108,329954~'
-script += 'l~r0101,329955~e~r0100,329956~d~r032,329957~ ~r0105,329958~i~r0110,329959~n~r032,329960~ ~r099,329961~'
-script += 'c~r0104,329962~h~r097,329963~a~r0114,329964~r~r099,329965~c~r0111,329966~o~r097,329967~a~r0108,329968~'
-script += 'l~r032,329969~ ~r0111,329970~o~r0110,329971~n~r032,329972~ ~r0121,329973~y~r0111,329974~o~r0117,329975~'
-script += 'u~r0114,329976~r~r032,329977~ ~r0102,329978~f~r0111,329979~o~r0114,329980~r~r0101,329981~e~r0104,329982~'
-script += 'h~r0101,329983~e~r097,329984~a~r0100,329985~d~r046,329986~.~r010,329987~\n~r329988~\n~r067,329989~C~r0111,329990~'
-script += 'o~r0110,329991~n~r0103,329992~g~r0114,329993~r~r097,329994~a~r0116,329995~t~r0117,329996~u~r0108,329997~'
-script += 'l~r097,329998~a~r0116,329999~t~r0105,330000~i~r0111,330001~o~r0110,330002~n~r0115,330003~s~r059,330004~'
-script += ';~r032,330005~ ~r0121,330006~y~r0111,330007~o~r0117,330008~u~r032,330009~ ~r0104,330010~h~r097,330011~'
-script += 'a~r0118,330012~v~r0101,330013~e~r032,330014~ ~r0114,330015~r~r0101,330016~e~r097,330017~a~r099,330018~'
-script += 'c~r0104,330019~h~r0101,330020~e~r0100,330021~d~r032,330022~ ~r0116,330023~t~r0104,330024~h~r0101,330025~'
-script += 'e~r032,330026~ ~r0101,330027~e~r0110,330028~n~r0100,330029~d~r032,330030~ ~r0111,330031~o~r0102,330032~'
-script += 'f~r032,330033~ ~r0116,330034~t~r0104,330035~h~r0101,330036~e~r032,330037~ ~r099,330038~c~r0104,330039~'
-script += 'h~r097,330040~a~r0108,330041~l~r330042~l~r0101,330043~e~r0110,330044~n~r0103,330045~g~r0101,330046~e'
-script += '~r033,330047~!~r010,330048~\n~r330049~\n~r132613,232613,327415,417,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~# That code is reflected in a mirror, using a helper to decod'
-script += 'e it to reveal the final code\n~minput~! reverse_mirror\n~moutput~> The code in the mirror is "~mcode~'
-script += 'YOUlUoXioTpY~moutput~"\n# We\'re all done!\n~minput~! end\n~moutput~> Goodbye!\n'
+var replay = {version: 2, tracked: [2670, 2674, 2678, 2682, 2686, 2690, 2694, 2698, 2702, 2706, 2710, 2714, 2718, 2722, 2726, 2730, 2732], text: [], modes: [], events: [], keyframes: [], codes: []};
+replay.modes.push([173, "input"]);
+replay.modes.push([196, "output"]);
+replay.modes.push([296, "code"]);
+replay.modes.push([308, "output"]);
+replay.codes.push([296, "fbCcIPhFoGGd"]);
+replay.modes.push([628, "input"]);
+replay.modes.push([646, "output"]);
+replay.modes.push([729, "input"]);
+replay.modes.push([735, "output"]);
+replay.modes.push([856, "code"]);
+replay.modes.push([868, "output"]);
+replay.codes.push([856, "KtYzSlsHSBIz"]);
+replay.modes.push([996, "input"]);
+replay.text.push("# Welcome!  Lines like this are comments from me.\n# Input commands that start with a \"!\" are instructions for the interpreter\n# The first code is in the machine spec itself\n! type arch-spec:28,33\n> == hints ==\n> - Start with operations 0, 19, and 21.\n> - Here's a code for the challenge website: fbCcIPhFoGGd\n> - The program \"9,32768,32769,4,19,32768\" occupies six memory addresses and should:\n>   - Store into register 0 the sum of 4 and the value contained in register 1.\n>   - Output to the terminal the character with the ascii code contained in register 0.\n# Start a test run, with just the first opcodes the hint suggests\n! opcodes 0,19,21\n> Enabled opcodes: 0, 19, 21\n# Running the machine now will reveal the second code\n! run\nWelcome to the Synacor Challenge!\nPlease record your progress by putting codes like\nthis one into the challenge website: KtYzSlsHSBIz\n\nExecuting self-test...\n\n> ERROR: Unknown opcode: 6\n# Now start the machine again, this time with all of the opcodes turned on\n! op");
+replay.keyframes.push([1000, 84, 735, [0, 0, 0, 0, 0, 0, 0, 0], [2317, 2357, 32767, 32767, 2417, 2452, 2473, 2483, 2468, 2478, 2463, 2488, 2623, 2643, 2488, 2553, 2317]]);
+replay.modes.push([1010, "output"]);
+replay.modes.push([1112, "input"]);
+replay.modes.push([1118, "output"]);
+replay.modes.push([1346, "code"]);
+replay.modes.push([1358, "output"]);
+replay.codes.push([1346, "oNTFmoiTRTMG"]);
+replay.events.push("0_700000000_MW8H0je21rf22__V3__V4nh25qi26fj27pj28aj29kj2A_i2Buj2C_n2Dpo2Euj2Fvl2Gje2_BW8H0je21rf22__V3__V4nh25qi26fj27pj28aj29kj2A_i2Buj2C_n2Dpo2Euj2Fvl2Gje2_4z3c7u-BYyBc2m_2WyB1BR221BE221BB221Bn3221Bk4221BT221BS221B2221Bd5221Bc4221BO221B3221B6221B7221BD221BU221BT221Bn3221BN221BY4221BM221A221Bt4221Be5221BT221BS221B2221B1221Bb5221BW5221BT221Ba1221A221Bn6221_3q4gbFse3zlNQ6vjN19e12195219f4219c5219R219E219B219n3219k4219T219S2192219d5219c4219O219321962197219D219U219L219C2191219x4219c4219O219L2192219f4219o4219K219n3219p1219-4219X2219C219R219k22194219B219f121932194219D219B219v321821_3cm4jdFre3ykBg3r_2wnB3v3ji4y_Bt5m_2y_B1Bo2221A221BA221BN221B2221B6221A221BE221x3suBFhWCu5l_2x_B4v3fwBmWCa5m_2mWC1Bi1221BC221Bf5221Bi4221B6221BA221BJ221Bd4221Bo5221BJ221BC221B5221B2221BR221BE221BB221Bh4221Bc5221B2221Bb1221BQ221BJ221BA221BA221BD221Bj4221BY4221Bc1221Bd5221Be5221BN221B5221Bf4221Ba4221B1221Ba1221BR221Bf4221B-4221BH221Bh4221BY4221BQ221Bx4221Bg4221BI221B2221B6221B9221B4221BC221B3221Bb5221Bw4221B4221BC221BD22");
+replay.events.push("1BC221Bb1221BG221BA221B_3221BR221A221BY2221Bc3221Bd5221Bo4221BM221B1221Bb5221Ba4221B1221Ba1221BR221Bf4221Be5221B9221Bz4221Be5221BN221B5221Bf4221By4221B2221B6221B4221BN221Bt3221BN221Be5221BN221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221Bw4221BN221Ba1221A221BJ221BQ221BX1221Bf4221Be4221BM221A221B6221BA221Bh1221Bm1221Br4221BR221A221BY2221BX2221Bc5221BJ221B3221BE221Bx4221By4221BH221B7221BY1221BV221Bk1221Bn5221Ba5221BP221B7221B6221BU221Bb5221B4221Bo2221Bq1221A221BM221B_4221B-4221BC221B1221Bb5221B1221A221Be2221BY2221B2221B6221BA221B9221BM221BT221BE221BQ221Bn5221By4221B2221Bz4221Be5221B3221BP221B7221Ba1221B4221B5221BP221Bf4221Bk5221BR221BM221BN221B2221BA221Bv4221B2221x3i-BhBxhCZ5l_2lWC1_3x_Bu_HWX6XiAr4s_2XiA19q4219e12192219A219D219O219b5219-4219H219h4219o4219A219C219T219Q219P219S2192219d5219m42195219Q219P219r2219_221_3ttSt_HzkDmgAJqm8p42v3i-SZtSJvm8jcI1Bb1221B2221BK221BD221BU221x3h-S9wsSKwm8kcI1r3etSvm4g5fmBsmAB_1W3KK5b321_1_2JJ6c318v3yhCtkBb6ihBtkB2v3tbCuwNAxh8uwN1BM221A221B6221BA221Bh122");
+replay.modes.push([1650, "input"]);
+replay.modes.push([1662, "output"]);
+replay.modes.push([1731, "input"]);
+replay.modes.push([1742, "output"]);
+replay.modes.push([1771, "code"]);
+replay.modes.push([1783, "output"]);
+replay.codes.push([1771, "MBTdGgundHQG"]);
+replay.events.push("1Bm1221x3kaCBZxN9yh8twN1BG222x3fbC1cxN6xh8exN1B7221BC221B1221BN221x3WcC5jxN5yh8dxN1_3xhCt9r9YW1Urh8aW119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12U21n12b121n12K21n12B21n12f421n12e521n12b121n12221n12K21n12D21n12U21z1yfDibP2TL2_Be3feNgmFpc9x5s_2pc910019Q219K219B219I219_3219d221-2tuRtuRhe1K_d119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkAi1n12W121n12321n12R21n12f421n12e521n12b121n12221n12K21n12D21n12U21z1-fDycDCTJ2_3o3XfNYkRdp8p4s_2zo819i1219C219f5219i42196219A219J219d4219o5219J219C21952192219R219E219B219h4219k52199219H219M219L219A219D219j4219421_3s2fkRhkRimKT5WoK1BL221Ba1221BW1221Bv1221BW2221BS221BD221BJ221Bt1221BI221BJ221_3f2te1_d1rmKk26_lK193219-42191219x4219e5219N2195219f4219e5219b12192219K219D219U219h4219R218219W3219g1219Q219J219D219U2196219b5219o4219M219v4219u4219b5219c521972193219F219f4219s42193219A219J219d4219-4219H219h4219c4219O219L2192219h2219f321821-2iUiUvW2Z2rz119w4219Y12");
+replay.modes.push([1851, "input"]);
+replay.modes.push([1859, "output"]);
+replay.text.push("codes all\n> Enabled opcodes: all\n# This time when it's run, the bootup test sequence will reveal the third code\n! run\nWelcome to the Synacor Challenge!\nPlease record your progress by putting codes like\nthis one into the challenge website: KtYzSlsHSBIz\n\nExecuting self-test...\n\nself-test complete, all tests pass\nThe self-test completion code is: oNTFmoiTRTMG\n\n== Foothills ==\nYou find yourself standing at the base of an enormous mountain.  At its base to the north, there is a massive doorway.  A sign nearby reads \"Keep out!  Definitely no treasure within!\"\n\nThings of interest here:\n- tablet\n\nThere are 2 exits:\n- doorway\n- south\n\nWhat do you do?\ntake tablet\n\n\nTaken.\n\nWhat do you do?\n# Using the tablet reveals the fourth code\nuse tablet\n\n\nYou find yourself writing \"MBTdGgundHQG\" on the tablet.  Perhaps it's some kind of code?\n\n\nWhat do you do?\ndoorway\n\n\n== Dark cave ==\nThis seems to be the mouth of a deep cave.  As you peer north into the darkness, you think you hear the echoes of bats deep");
+replay.keyframes.push([2000, 3929, 1999, [112, 122, 0, 6574, 133, 1528, 6451, 0], [0, 2357, 32767, 32767, 2417, 2452, 2473, 2483, 2468, 2478, 2463, 2488, 2623, 2643, 2488, 2553, 2327]]);
+replay.events.push("19D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12121n12M21X1221n12621n12A21n12h121n12m121z1agDwcDCd1D2l8kl4qeD521Gte23v3bj4coCt5m_2ooC1Bw1221BY1221BD221Br4221Bc4221B3221Bg1221BX1221x3eiCFroCu5l_2noC4v3fjCwoCW2m_2cpC1Be1221B2221BK221Bb5221Bc5221BR221A221BG221BC221Bb5221Be5221B9221Bz4221Ba4221B6221Bf4221Be5221BN221B5221Bf4221Bw4221B4221BC221B1221BN221Bl4221B-4221BH221Bh4221BY4221BX4221Be4221B2221A221BM221B_4221Bc4221B3221Bg1221BX1221Bj3221BR221A221BY2221Ba3221Bb5221Bo5221BJ221BC221Bf5221BW5221BL221A221BQ221BZ5221By4221B2221B6221B4221BN221Bl4221Bo4221BA221BC221B9221Bz4221Be5221BN221B5221Bf4221Be4221B5221BY1221BD221B6221BH221BS221A221Bj4221BN221Bo5221BJ221BC221Bf5221Be5221BN221B2221BA221B5221Br4221Bo5221BJ221BC221Bf5221Bm4221B5221B7221BY1221BZ5221Be5221BN221B5221Bf4221Bg4221B3221BA221BE221BJ221BS221Bb5221B-4221BH221Bh4221Ba4221B1221Bc1221B1221Bb5221Be4221B2221A221BM221BL221BQ221BZ5221Bk5221BR221BM221BN221B2221BA221B_3221x3gmCd8XxC_1l_2bpC11XpCB_1W3KKHb32");
+replay.modes.push([2064, "input"]);
+replay.modes.push([2070, "output"]);
+replay.events.push("1_1_2JJIc318v3kxClkBb6ihBZkB2v3rqCsfO6xh8sfO1B2221B6221B4221BN221x3YrC7zfO5yh8rfO1BC222x3tqC1WgO6xh8YgO1B7221BC221B1221BN221x3krC5dgO5yh8XgO1_3fxCt9r9kVUrh8mV19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n12221n12621n12421n12N21z1egDqcDE592h8ul4qeD31Gye23v3lj4YyCt5m_2gyC1Bw1221BY1221BD221Br4221Bc4221B3221Bg1221BX1221x3WsCFnyCu5l_2fyC4v3XtCsyCJm_2-yC1Be1221B5221Bf4221Bc4221B3221Bg1221BX1221Bf4221Bo4221BK221Bb5221Bc5221B7221B3221BF221Ba1221BT221BD221Bc1221Bd5221By4221BP221BY1221A221B5221BG221Bj5221Bm4221B5221BQ221BP221Bn3221BN221BY4221BQ221BJ221Bd4221Be5221BN221B5221Bf4221Bu4221B5221B3221B2221BO221Bd5221Bi4221BO221B5221B3221Bv4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BA221Bh1221Bm1221Bn5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bc5221B7221BC221B1221BN221Bl4221Bo4221BK221Bb5221BY5221B8221BN221BM221BT221Bf4221Be4221BA221B8221Bz3221x3YwCp5fYDKl_2zyC11vyCB_1W3KKDb321_1_2JJEc318v3oYD_jBb6ihBtjB2v3vxCkmO6xh8kmO1B2221B6221B4221BN221x3cyC7rmO5yh8jmO");
+replay.modes.push([2233, "input"]);
+replay.modes.push([2239, "output"]);
+replay.events.push("1BC222x3xxC1umO6xh8wmO1B7221BC221B1221BN221x3oyC5_mO5yh8vmO1_3jYDt9r9YVUrh8aV19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n12221n12621n12421n12N21z1egDqcDA592Z8Ym4qeD1GXf23v3vj4cZDt5m_2kZD1Bw1221BY1221BD221Br4221Bc4221B3221Bg1221BX1221x3azCFrZDu5l_2jZD4v3b-CwZDi5m_2YaD1Be1221B5221Bf4221Bc4221B3221Bg1221BX1221Bf4221BY4221B4221BO221BC221B3221B2221BL221BB221BW1221Bb5221Be4221BS221BX1221BO221BN221Bc1221BL221BB221B3221BM221A221BQ221Bn5221Bc4221BA221BD221BQ221BD221B3221Bf4221BY4221Ba1221Bb5221Bo5221BJ221BC221Bf5221Bi4221B6221BA221BJ221Bd4221Bo5221BJ221BC221B5221B2221BR221BE221BB221Bh4221BY4221Bc1221Bd5221BY4221BX4221Bu4221BD221B4221B5221B2221Bf4221BY4221B2221BQ221BE221BX1221Bf4221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bc4221BA221BD221Ba1221BB221Bz3221BR221A221Be3221Be1221B5221BQ221BP221Bf4221Bo4221BK221Bb5221Ba4221B1221BY1221BP221BE221BQ221Bn5221Bg4221BI221B2221BC221BR221B2221Bl4221Bu4221B5221B3221B2221BO221Bd5221Bm4221B5221BQ22");
+replay.modes.push([2499, "input"]);
+replay.modes.push([2506, "output"]);
+replay.events.push("1BP221Bf4221Be5221B9221Bz4221By4221B2221BA221BL221BB221B4221Bf4221BY4221BX4221Ba5221B5221B2221BL221Bf4221Ba4221BW1221BH221B9221B6221B3221Bf4221Bu4221BD221B7221B6221BA221BA221BD221Bj4221B-4221BC221B1221Bd5221Bo4221BA221BC221B9221Bz4221Be5221BN221B5221Bf4221Be4221B5221BY1221BD221Br4221Bg4221BG221B6221B8221BL221BA221BH221BS221A221Bf4221x3cXDpBjlDh5l_2XaD11zZDB_1W3KKDb321_1_2JJEc318v3slDpjBb6ihBhjB2v3rfDczO8xh8czO1BW1221BH221B9221B6221B3221x3mfD9lzO7yh8bzO1BE222x3XfD1ozO6xh8qzO1B7221BC221B1221BN221x3ufD5vzO5yh8pzO1_3plDt9r9sUUrh8uU19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12521n12W121n12H21n12921n12621n12321j1cgDqcDAB2h8im4qeD21Gcf23v3dj4gmDp5m_2qmD1Bw1221B2221BL221Bf4221Ba4221BW1221BH221B9221B6221B3221x3ggDJzmDq5l_2pmD4v3hhDYnDe1m_2inD1Be1221B2221BK221Bb5221Ba5221B5221B2221BL221Bf4221Ba4221BW1221BH221B9221B6221B3221Bf4221Bc4221BU221BP221B7221BK221BG221Bb5221BY4221Ba1221Bb5221Bo5221BJ221BC221Bf5221Bk5221Bh1221BM221B1221Br4221BY4221BM22");
+replay.modes.push([2703, "input"]);
+replay.modes.push([2712, "output"]);
+replay.events.push("1B6221B1221BD221Bj4221Bo4221BM221Bh4221BR221A221Bo3221Bi1221BC221Bf5221BY4221BY1221BP221BI221Bj4221Bw4221Bd5221Bc5221B4221B5221BP221Bf4221Bm4221BE221BG221Bj5221B-4221B5221BF221Bd4221Bo4221BM221Bd5221Bo4221BK221Bj4221BN221B-4221B6221BZ5221Bk5221BT221B5221BU221BN221B5221BQ221BZ5221Bo4221BM221Bd5221Bc4221B3221BQ221Bx4221Bg4221BY1221BX1221BI221Bx4221Bc5221B4221B9221A221B1221B6221B4221Bd5221Bo5221BJ221BC221B5221BZ5221Bk5221BZ1221B8221B3221B2221BO221Bh4221x3mkDl7nuDd1l_2hnD11dnDB_1W3KKFb321_1_2JJGc318v3yuDfjBb6ihB_iB2v3voDWcPCxh8WcP1BO221B1221BC221BL221BA221BE221BV221x3soDDjcPByh8_bP1BI222x3jpD1mcP4xh8ocP1B1221B4221BG221x3yoD3rcP3yh8ncP1_3zuDt9r9gUUrh8iU19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12321n12O21n12121n12C21n12L21n12A21n12E21n12V21j1YgDqcDCF2h8sm4qeD41Ghf23v3fk4kvDv4m_2yvD1Bs1221BM221A221B5221BA221BD221Bj4221Be5221BN221BK221B5221BC221BR221B2221Bl4221Be5221BN221B5221Bf4221BY4221BG221BI221BX5221x3wtDj1xwDw4l_2xvD4v3vrDWxDe4m_2kxD");
+replay.events.push("1Ba3221Bb5221Bo5221BJ221BC221Bf5221Bc4221BO221B1221BC221BL221BA221BE221BV221Bf4221BY4221BM221B6221B1221BD221Bj4221Be5221BN221B5221Bf4221Ba4221BW1221BH221B9221B6221B3221Bn3221BN221Bo4221BM221Bd5221Bc5221B9221BP221BU221B6221BZ5221B1221A221Bo3221Bi1221BC221Bf5221Be5221B3221BE221Bn5221Be5221B9221Bz4221Bk4221BM221BX1221B2221BZ4221Be5221BN221B5221Bf4221Ba4221BW1221BH221B9221B6221B3221Bn3221BN221Ba4221Bc1221B1221Bd5221Bo4221BM221Bd5221Bg4221BY1221Bf1221B6221B2221BS221Bb5221Bo5221BJ221BC221B5221BZ5221Bk4221BM221BX1221Ba1221B5221B_4221Bo4221BA221Bx4221Be5221BN221B5221Bf4221Be4221B5221BY1221BD221B6221BH221BS221A221Bf4221BR221A221Bo3221Bi1221BC221Bf5221BY4221BY1221BP221Bf4221BW5221B7221BI221BF221A221BF221BU221BL221BA221BD221Bj4221BY5221B8221BN221BB221BG221B2221BQ221Bn5221Be4221BM221BG221BH221BI221Bh1221BY1221BR221Bd4221Bo4221BA221BC221B9221Bz4221Be5221BN221B5221Bf4221Bc4221BA221BD221Ba1221BB221Bz3221A221A221x3ouDlAlbEd4l_2jxD15hxD2A_1W3KIHd321_1_2JHIe317v3WcEXjBd6ihBpiB2v3v_DsoP6xh8soP1BM221BG221BH22");
+replay.modes.push([2957, "input"]);
+replay.modes.push([2962, "output"]);
+replay.text.push("er within.\n\nThere are 2 exits:\n- north\n- south\n\nWhat do you do?\nnorth\n\n\n== Dark cave ==\nThe cave is somewhat narrow here, and the light from the doorway to the south is quite dim.\n\nThere are 2 exits:\n- north\n- south\n\nWhat do you do?\nnorth\n\n\n== Dark cave ==\nThe cave acoustics dramatically change as you find yourself at a legde above a large chasm.  There is barely enough light here to notice a rope bridge leading out into the dark emptiness.\n\nThere are 2 exits:\n- bridge\n- south\n\nWhat do you do?\nbridge\n\n\n== Rope bridge ==\nThis rope bridge creaks as you walk along it.  You aren't sure how old it is, or whether it can even support your weight.\n\nThere are 2 exits:\n- continue\n- back\n\nWhat do you do?\ncontinue\n\n\n== Falling through the air! ==\nAs you continue along the bridge, it snaps!  You try to grab the bridge, but it evades your grasp in the darkness.  You are plummeting quickly downward into the chasm...\n\nThere is 1 exit:\n- down\n\nWhat do you do?\ndown\n\n\n== Moss cavern ==\nYou are standing i");
+replay.keyframes.push([3000, 9430, 2999, [105, 17, 0, 7300, 209, 1528, 7282, 0], [0, 2357, 32767, 32767, 2417, 2452, 2473, 2483, 2468, 2478, 2463, 2488, 2623, 2643, 2488, 2553, 2352]]);
+replay.events.push("1x3c_D5xoP5yh8roP1_3jbEr9t9WUW1rh8WU19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12121n12M21n12G21n12H21z1ggDqcDGH72h8Wn4qeD71Gmf23v3bk4ccEp5m_2icE1Ba2221B8221A221Bb5221Bc4221B3221Bg1221BX1221BQ221B7221x3m_DJvcEq5l_2hcE4v3vWE-cEu6m_2adE1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bc5221B2221Bb1221BQ221BJ221BA221BA221BD221Bj4221Bo4221BA221Bx4221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bc4221B3221Bg1221BX1221BQ221B7221Bx4221Bi4221BU221BH221A221Bt4221B-4221BH221Bh4221Ba4221BE221BC221B5221BI221BF221B7221BA221BH221BS221BV221B4221BI221BC221Bd5221Bw4221B4221B8221A221Bf4221BR221A221Bo2221Bs2221Bd5221Bw4221BG221B3221B2221Bd5221Bm4221BD221Bg1221BX1221Bf4221Ba4221BW1221B5221B7221BB221BI221Bx4221Bo5221BJ221BC221B5221BZ5221Bi4221B9221BM221A221Br4221B1221A221Be3221Be1221B5221Bf4221Bc4221B3221Bg1221BX1221BQ221B7221Bx4221Bg4221Bc1221B7221BT221BI221BJ221BU221Bb5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bg4221B7221Ba1221B2221Bd5221BY4221BQ221BJ221Bd422");
+replay.modes.push([3243, "input"]);
+replay.modes.push([3248, "output"]);
+replay.events.push("1Bk5221BZ1221BS221B2221Bn3221Br1221BY4221Bc1221Bd5221Be5221BN221B5221Bf4221Bk5221BZ1221BS221B2221Bd5221Bg4221BI221BJ221Bl3221BN221Bo5221BJ221BC221Bf5221Be5221BN221B2221BA221B5221Br4221Bo5221BJ221BC221Bf5221Bc5221BR221A221Bf4221BY4221BX4221BW5221BT221Ba1221A221BZ1221BC221B3221Bf4221Bu4221BD221B7221B6221BA221BA221BD221Bj4221B-4221BC221B1221Bd5221B-4221BH221Bh4221Be5221BN221B5221Bf4221Bc4221B3221Bg1221BX1221BQ221B7221B_3221x3eaE_CzpEt6l_2ZdE11_cEB_1W3KKBb321_1_2JJCc318v3aqEniBb6ihBhiB2v3viEqWQ4xh8qWQ1BZ1221BS221B2221x3WjE5vWQ3yh8pWQ1BA222x3dkE1yWQ4xh8-WQ1B7221Ba1221B2221x3gjE3XXQ3yh8zWQ1_3zpEt9r9sTUrh8uT19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1X1221n12721n12a121n12221z1ggDqcD8T72Z8gn4qeD1Grf23v3lk4sqEp5m_2yqE1Ba2221B8221A221Bb5221Bc4221B3221Bg1221BX1221BQ221B7221x3WkEJfrEq5l_2xqE4v3flEkrE9m_2qrE1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bc5221B2221Bb1221BQ221BJ221BA221BA221BD221Bj4221Bo4221BA221Bx4221BY4221BX4221Bu4221BL221BY1221BL22");
+replay.modes.push([3449, "input"]);
+replay.modes.push([3468, "output"]);
+replay.events.push("1B3221Bf4221Bc4221B3221Bg1221BX1221BQ221B7221Bx4221Bi4221BU221BH221A221Bt4221B-4221BH221Bh4221Ba4221BE221BC221B5221BI221BF221B7221BA221BH221BS221BV221B4221BI221BC221Bd5221Bw4221B4221B8221A221Bf4221BR221A221Be3221Be1221B5221Bf4221Bc4221B3221Bg1221BX1221BQ221B7221Bx4221Bg4221Bc1221B7221BT221BI221BJ221BU221Bb5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bk5221BZ1221BS221B2221Bh4221x3uoEz5hxEAl_2prE1_3_qEu_Hu_HdiAr4s_2XiA19q4219e12192219A219D219O219b5219-4219H219h4219o4219A219C219T219Q219P219S2192219d5219m42195219Q219P219r2219_221_3tkSr_HjiDmgAJqm8p42x3kqS1ZkS5vm8jzH1BG221B6221B8221BA221Bn5221Bu4221BL221BQ221BC221BT221BQ221B7221x3_qSLijS6wm8kzH1_3ckS1dp46g5fmBsmAA_1W3KI9d321_1_2JHAe317v3qxEbiBd6ihB_hB2v3dqEsdQ6xh8sdQ1BZ1221BS221B2221x3kqE5xdQ5yh8rdQ1_3XxEr9t9iTW1rh8iT19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12U21n12b121n12K21n12B21n12f421n12g421n12G21n12621n12821n12A21n12n521n12u421n12L21n12Q21n12C21n12T21n12Q21n12721z1kfDqcD8HZ12_Be3feNYlRvc9x5s_2pc9110");
+replay.modes.push([3494, "input"]);
+replay.modes.push([3499, "output"]);
+replay.events.push("19Q219K219B219I219_3219d221-2tuRtuRhe1K_d119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12a121n12Z121n12S21n12221z1ggDycDQT72l8Wn4qeD7H1Gmf23v3bk4ccEp5m_2icE1Ba2221B8221A221Bb5221Bc4221B3221Bg1221BX1221BQ221B7221x3m_DJvcEq5l_2hcE4v3vWE-cEu6m_2adE1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bc5221B2221Bb1221BQ221BJ221BA221BA221BD221Bj4221Bo4221BA221Bx4221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bc4221B3221Bg1221BX1221BQ221B7221Bx4221Bi4221BU221BH221A221Bt4221B-4221BH221Bh4221Ba4221BE221BC221B5221BI221BF221B7221BA221BH221BS221BV221B4221BI221BC221Bd5221Bw4221B4221B8221A221Bf4221BR221A221Bo2221Bs2221Bd5221Bw4221BG221B3221B2221Bd5221Bm4221BD221Bg1221BX1221Bf4221Ba4221BW1221B5221B7221BB221BI221Bx4221Bo5221BJ221BC221B5221BZ5221Bi4221B9221BM221A221Br4221B1221A221Be3221Be1221B5221Bf4221Bc4221B3221Bg1221BX1221BQ221B7221Bx4221Bg4221Bc1221B7221BT221BI221BJ221BU221Bb5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bg4221B7221Ba1221B2221Bd5221BY4221BQ22");
+replay.modes.push([3780, "input"]);
+replay.modes.push([3785, "output"]);
+replay.events.push("1BJ221Bd4221Bk5221BZ1221BS221B2221Bn3221Br1221BY4221Bc1221Bd5221Be5221BN221B5221Bf4221Bk5221BZ1221BS221B2221Bd5221Bg4221BI221BJ221Bl3221BN221Bo5221BJ221BC221Bf5221Be5221BN221B2221BA221B5221Br4221Bo5221BJ221BC221Bf5221Bc5221BR221A221Bf4221BY4221BX4221BW5221BT221Ba1221A221BZ1221BC221B3221Bf4221Bu4221BD221B7221B6221BA221BA221BD221Bj4221B-4221BC221B1221Bd5221B-4221BH221Bh4221Be5221BN221B5221Bf4221Bc4221B3221Bg1221BX1221BQ221B7221B_3221x3eaE_CzpEt6l_2ZdE11_cEB_1W3KKBb321_1_2JJCc318v3aqEniBb6ihBhiB2v3viEqWQ4xh8qWQ1BZ1221BS221B2221x3WjE5vWQ3yh8pWQ1BA222x3dkE1yWQ4xh8-WQ1B7221Ba1221B2221x3gjE3XXQ3yh8zWQ1_3zpEt9r9sTUrh8uT19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12a121n12Z121n12S21n12221z1ggDqcD8T72Z8qn4qeD1Gwf23v3vk4wxEp5m_2WyE1Ba2221B8221A221Bb5221Bc4221B3221Bg1221BX1221BQ221B7221x3arEJjyEq5l_2_xE4v3jsEoyEm3m_2uyE1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bc5221B2221Bb1221BQ221BJ221BA221BA221BD221Bj4221Bo4221BA221Bx4221BY4221BX4221Bu4221BL22");
+replay.text.push("n a large cavern full of bioluminescent moss.  It must have broken your fall!  The cavern extends to the east and west; at the west end, you think you see a passage leading out of the cavern.\n\nThere are 2 exits:\n- west\n- east\n\nWhat do you do?\neast\n\n\n== Moss cavern ==\nYou are standing in a large cavern full of bioluminescent moss.  The cavern extends to the west.\n\nThings of interest here:\n- empty lantern\n\nThere is 1 exit:\n- west\n\nWhat do you do?\ntake empty lantern\n\n\nTaken.\n\nWhat do you do?\nwest\n\n\n== Moss cavern ==\nYou are standing in a large cavern full of bioluminescent moss.  It must have broken your fall!  The cavern extends to the east and west; at the west end, you think you see a passage leading out of the cavern.\n\nThere are 2 exits:\n- west\n- east\n\nWhat do you do?\nwest\n\n\n== Moss cavern ==\nYou are standing in a large cavern full of bioluminescent moss.  The cavern extends to the east.  There is a crevise in the rocks which opens into a passage.\n\nThere are 2 exits:\n- east\n- passage\n");
+replay.keyframes.push([4000, 14973, 3999, [7791, 1, 0, 26950, 2, 5814, 26948, 0], [0, 0, 32767, 32767, 2417, 2452, 2473, 2483, 2468, 2478, 2463, 2488, 2623, 2643, 2488, 2553, 2362]]);
+replay.events.push("1BY1221BL221B3221Bf4221Bc4221B3221Bg1221BX1221BQ221B7221Bx4221Bi4221BU221BH221A221Bt4221B-4221BH221Bh4221Ba4221BE221BC221B5221BI221BF221B7221BA221BH221BS221BV221B4221BI221BC221Bd5221Bw4221B4221B8221A221Bf4221BR221A221Be3221Be1221B5221Bf4221Bc4221B3221Bg1221BX1221BQ221B7221Bx4221Bg4221Bc1221B7221BT221BI221BJ221BU221Bb5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bg4221B7221Ba1221B2221Bh4221BR221A221Be3221Be1221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221Bc4221BU221BP221BY1221BP221BK221BR221Bf4221Bo4221BA221Bx4221Be5221BN221B5221Bf4221Ba5221B5221BN221BG221BG221Bb5221Bk5221BT221B2221BB221BA221Bl4221B-4221B2221BL221BI221BA221Bb5221Bo4221BA221BC221B9221Bz4221BY4221BX4221BW5221BT221Ba1221A221BZ1221BC221B3221Bj3221x3yvEt9fcFl3l_2tyE11pyEB_1W3KKBb321_1_2JJCc318v3mcFzhBb6ihBthB2v3fWFioQ4xh8ioQ1B7221Ba1221B2221x3i_E5noQ3yh8hoQ1BA222x3z_E1qoQAxh8soQ1BT221Ba1221A221BZ1221BC221B3221x3qWF9_oQ9yh8roQ1_3fcFt9r9YTUrh8aT19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA");
+replay.modes.push([4017, "input"]);
+replay.modes.push([4025, "output"]);
+replay.events.push("1n12M21n12T21n12a121X1221n12Z121n12C21n12321j1agDqcD8D2h8-n4qeD61G_f23v3zk4YdFx5m_2kdF1BY1221Ba1221A221BZ1221BC221B3221x3aXFBjdFy5l_2jdF4v3xXFodFs4m_2-dF1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bc4221BU221BP221BY1221BP221BK221BR221Bf4221B-4221B1221Bx4221Be5221BN221B5221Bf4221Bk5221BZ1221BS221B2221Bd5221Bk5221Bh1221BM221A221Bt4221B-4221BH221Bh4221Be5221BN221B5221Bf4221Bw4221B4221B8221A221Bb5221Bc4221B3221Bg1221BX1221BQ221B7221B_3221BR221A221BY2221BX2221Be4221B5221BY1221BD221Br4221BW5221BT221Ba1221A221BZ1221BC221B3221Bf4221Bu4221BD221B7221B6221BU221Bb5221Bi4221BU221B5221B4221BN221B5221BQ221BZ5221Bk5221BZ1221BS221B2221Bh4221BR221A221Be3221Be1221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221B6221A221B2221BQ221BZ5221Bm4221B5221BQ221BP221Bf4221Bk5221BT221B2221BB221BA221Bl4221Bu4221BD221B7221B6221BU221Bb5221Be4221BM221BG221BH221Bx4221Bo4221BA221BC221B9221Bz4221BY4221BX4221Bc5221BB221BN221BM221A221BD221BQ221Bh4221BN221Bw4221B4221B8221A221Bh4221Bo3221B622");
+replay.modes.push([4284, "input"]);
+replay.modes.push([4291, "output"]);
+replay.events.push("1B6221A221BD221B1221Bd4221Bc4221B3221Bg1221BX1221BQ221B7221Bx4221Ba4221B6221BE221B6221BG221Bn4221x3YbFzAloFr4l_2zdF11tdFB_1W3KKJZ321_1_2JJKa318v3woFthBZ6ihBhhB2v3viFi-Q6xh8i-Q1B3221Bg1221BX1221BQ221B7221x3aiF9r-Q5yh8h-Q1BE222x3riF1u-Q6xh8w-Q1BL221B6221A221B2221BQ221x3giF7X_Q5yh8v-Q1BE222x3pjF3a_QAxh8e_Q1B5221BY1221BD221B6221BH221BS221A221x3siF9n_Q9yh8d_Q1_3dpFv9r9qSSrh8uS19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12E21n12L21n12621X1221n12221n12Q21z1cgDqcDEPB2h8oo4qeD11Gfg23v3fl4yzFh5m_2c-F1Bc2221BR221BK221B2221BA221Bn5221BW5221BT221Ba1221A221BZ1221BC221B3221BS221x3WtFRt-Fi5l_2b-F4v3puFy-Fi1m_2c_F1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bw4221BN221Bo1221Bf1221Bf4221B-4221BH221Bh4221Be5221B6221BR221BK221B2221BA221Bn5221Bu4221B5221BM221A221BF221BD221Bf4221BW5221BT221Ba1221A221BZ1221BC221B3221BS221Bj4221BN221BY4221BM221A221Bt4221Be4221BA221B8221B1221BQ221Bn5221Bu4221B5221BM221Bd5221Ba4221Bk1221Bn5221Bw422");
+replay.modes.push([4515, "input"]);
+replay.modes.push([4520, "output"]);
+replay.events.push("1B4221B6221BP221Bf4221Ba4221BE221BC221B5221BI221BF221B7221BA221BH221BS221BV221B4221BI221BC221Bd5221Bw4221B4221B8221A221Bf4221BR221A221Be3221Be1221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221B6221A221B2221BQ221BZ5221Bm4221B5221BQ221BP221Bf4221Bu4221BD221B7221B6221BA221BA221BD221Bj4221Bg5221B9221BZ4221x3gyFp7lcGh1l_2b_F11x-FB_1W3KKL_221_1_2JJMW318v3qcGpgB_5ihBfgB2v3bWGenR2xh8enR1BL221B6221A221B2221BQ221x3w_F9nnR1yh8dnR1BE222h3lWG1qnRxh8snR1B2221B6221B4221BN221h3yWG5xnRyh8rnR1BC222h3nWG3-nRxh8YoR1B7221BC221B1221BN221h3eXG3boRyh8XoR1BC222x3vXG5eoR1xh8koR1B7221Ba1221B2221v3yWGjoR2yh8joR1BA222x3_WG7moR1xh8uoR1BZ1221BS221B2221x3cXG2roR2yh8toR1_3vdGz9r9kROrh8sR19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12a121n12Z121n12S21n12221z1ggDqcDCT72h8wp4qeD31Gzg23v3nm4yzGh5m_2Y-G1Bc2221BR221BK221B2221BA221Bn5221BW5221BT221Ba1221A221BZ1221BC221B3221BS221x3ysGRt-Gi5l_2X-G4v3luGy-Gx2m_2Y_G1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo422");
+replay.modes.push([4660, "input"]);
+replay.modes.push([4666, "output"]);
+replay.events.push("1BA221Bx4221BY4221BX4221Bu4221B5221BM221A221BF221BD221Bf4221Bw4221BN221Bo1221Bf1221Bf4221B-4221BH221Bh4221Be5221B6221BR221BK221B2221BA221Bn5221BW5221BT221Ba1221A221BZ1221BC221B3221BS221Bj4221BN221BY4221BM221A221Bt4221BY4221BM221B5221B4221BB221Bj3221x3cyGh3dYHy2l_2X_G11x-GB_1W3KKDZ321_1_2JJEa318v3iYHZeBZ6ihBzdB2v3rxGmgS4xh8mgS1B2221B6221B4221BN221x3YyG7tgS3yh8lgS1BC222x3txG1wgS4xh8ygS1B7221BC221B1221BN221x3kyG5XhS3yh8xgS1BC222x3_yG3ahS2xh8ehS1B7221Ba1221B2221x3YyG1fhS1yh8dhS1_3rYHv9r9cPSrh8gP19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12S21n12721n12C21n12121n12N21z1egDqcD8592h8aq4qeD21GYh23v3xm4iZHh5m_2qZH1Bc2221BR221BK221B2221BA221Bn5221BW5221BT221Ba1221A221BZ1221BC221B3221BS221x3kyGRdaHi5l_2pZH4v3X-GiaHy1m_2qaH1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Be5221B6221BR221BK221B2221BA221Bn5221BY4221BM221B5221B4221BB221Bf4221B-4221BH221Bh4221Bu4221B5221BM221A221BF221BD221Bf4221BW5221BT221Ba1221A221BZ1221BC22");
+replay.modes.push([4930, "input"]);
+replay.modes.push([4936, "output"]);
+replay.events.push("1B3221BS221Bj4221BN221BY4221BM221A221Bt4221Bw4221BN221Bo1221Bf1221Bj3221Bd2221A221Bq4221Be1221B5221Bf4221Bg4221B7221Ba1221B2221Bd5221BW5221BT221Ba1221A221BZ1221BC221B3221Bf4221BY4221BU221A221BL221B7221BY1221B2221Bb5221Bi5221BX1221BQ221BE221Bn5221Be4221B5221BY1221BD221B_2221Br1221Bo5221BJ221BC221Bf5221Bi4221B1221A221BE221Bt4221Bu4221B5221B4221BB221BE221BQ221Bn5221Be5221B9221Bz4221Ba4221B6221Bf4221Bg4221B7221Bc1221BT221BI221Bx4221Ba4221Bk1221Bn5221BY4221BX4221Bk2221Bs2221B6221BV221Bj3221x3uXHZ8liHx1l_2paH11haHB_1W3KKHX321_1_2JJIY318v3qiHrdBX6ihBjdB2v3_bHgqS2xh8gqS1B2221B6221B4221BN221x3icH7nqS1yh8fqS1BC222x3XcH1qqS2xh8sqS1B7221BC221B1221BN221x3ucH5xqS1yh8rqS1BC222h3bcH3-qSxh8YrS1BZ1221BS221B2221h3icH1ZrSyh8XrS1BA222h3pdH5crSxh8irS1B7221Ba1221B2221f3scHhrSyh8hrS1_3fjHx9r9qOQrh8wO19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkAg1n12I21n12221n12621n12421n12N21z1egDqcDA592_Bc2-c8rX5lx8j2s_2dx81Gih219g22192219K219R219E219D2191219d4219-42191219x42");
+replay.text.push("\nWhat do you do?\npassage\n\n\n== Passage ==\nYou are in a crevise on the west wall of the moss cavern.  A dark passage leads further west.  There is a ladder here which leads down into a smaller, moss-filled cavern below.\n\nThere are 3 exits:\n- cavern\n- ladder\n- darkness\n\nWhat do you do?\nladder\n\n\n== Twisty passages ==\nYou are in a maze of twisty little passages, all dimly lit by more bioluminescent moss.  There is a ladder here leading up.\n\nThere are 5 exits:\n- ladder\n- north\n- south\n- east\n- west\n\nWhat do you do?\nwest\n\n\n== Twisty passages ==\nYou are in a little maze of twisty passages, all alike.\n\nThere are 3 exits:\n- north\n- south\n- east\n\nWhat do you do?\nsouth\n\n\n== Twisty passages ==\nYou are in a twisty alike of little passages, all maze.\n\nThe east passage appears very dark; you feel likely to be eaten by a Grue.\n\nThere are 4 exits:\n- north\n- south\n- west\n- east\n\nWhat do you do?\n# This shows the fifth code in the ruins\nnorth\n\n\nChiseled on the wall of one of the passageways, you see:\n\n    ");
+replay.keyframes.push([5000, 20316, 4999, [32, 30181, 30181, 28298, 62, 1531, 28236, 0], [0, 0, 32767, 32767, 2417, 2452, 2473, 2483, 2468, 2478, 2463, 2488, 2623, 2643, 2488, 2553, 2412]]);
+replay.modes.push([5000, "code"]);
+replay.modes.push([5012, "output"]);
+replay.codes.push([5000, "emBLbWMgDhds"]);
+replay.events.push("19e5219N2195219f4219k5219h1219M218219t4219-4219H219h4219-42191219H219f4219-4219H219h4219e5219N2195219f4219W5219T219a1218219Z1219C2193219a1219h1219m1219B219j4219N219o5219J219C219f5219c5219R218219r2219_2218219i121821821821_3g4sX5qX5msKZ35gwK1BG221Br2221BK221Bi1221BL221BJ221Bq1221Bb2221Be2221B7221BU221_3n6kj1ck1vsK-16ZsK18219-4219i1219C219f5219e5219b1219K219B219f4219y42192219A219T219f4219-4219H219h4219e5219N2192219K219b5219Y4219Q219J219d4219s4219B218219M219_4219k5219h1219M21912193219A219D219n3219d221821_Bks4Zk1Zk1sq8q3r_2Yt81Gnh23v3vn4iuHh5m_2quH1Bc2221BR221BK221B2221BA221Bn5221BW5221BT221Ba1221A221BZ1221BC221B3221BS221x3knHRdvHi5l_2puH4v3XpHivHx2m_2qvH1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bw4221BN221Bo1221Bf1221Bf4221B-4221BH221Bh4221Be5221B6221BR221BK221B2221BA221Bn5221Bu4221B5221BM221A221BF221BD221Bf4221BW5221BT221Ba1221A221BZ1221BC221B3221BS221Bj4221BN221BY4221BM221A221Bt4221BY4221BM221B5221B4221BB221Bj3221x3usHh3tyHy2l_2pvH1_3_uHu_Hu_HfiAr4s_2XiA19q4219e12");
+replay.modes.push([5207, "input"]);
+replay.modes.push([5216, "output"]);
+replay.modes.push([5242, "input"]);
+replay.modes.push([5250, "output"]);
+replay.events.push("192219A219D219O219b5219-4219H219h4219o4219A219C219T219Q219P219S2192219d5219m42195219Q219P219r2219_221_3ZuRl_HreDmgAJqm8p42x3szR7ltRPvm8vcH1B3221BQ221x3h-R4itRQwm8wcH1_3otR7_s48g5fmBsmAA_1W3KIBd321_1_2JHCe317v3YzHfcBd6ihBXcB2v3rrHcZT6xh8cZT1BZ1221BS221B2221x3yrH5hZT5yh8bZT1_3lyHr9t9kNW1rh8kN19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12U21n12b121n12K21n12B21n12f421n12c421n12321n12Q21z1YgDqcDAHF2_Be3feNYlRxc9x5s_2pc914019Q219K219B219I219_3219d221-2tuRtuRhe1K_d119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12W121n12321n12R21n12f421n12c421n12321n12Q21z1agDycD6HD2_Bo3hm9dvMvj8v2s_2rj831__V204__V19i1219C219f5219i421962196218219t4219o5219J219C2195219Z5219u4219L219Q219C219T219Q2197219x4219k5219R219M219N219l4219-4219B2196219x3219R218219o2219s2219d5219c5219R218219G219C219b5219e52199219z4219c4219A2195218219Q219Z5219g52199219z4219j121821-2glMglMha2j2zW219w4219Y1219D219c1219d5219e4219M219z42");
+replay.modes.push([5325, "input"]);
+replay.modes.push([5337, "output"]);
+replay.modes.push([5484, "input"]);
+replay.modes.push([5489, "output"]);
+replay.events.push("19o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12W121n12321n12R21n12f421n12u421n12L21n12Q21n12C21n12T21n12Q21n12721z1yfDwcD6HL2_Bo3xdKglUnc8t4s_2jc822__V3019i1219C219f5219u4219521932192219O219d5219o5219J219C2195219Z5219u4219L219Q219C219T219Q2197219_3219d221821_3ks4llUflUgb8u4r_2kc83v3vn4euHh5m_2quH1Bc2221BR221BK221B2221BA221Bn5221BW5221BT221Ba1221A221BZ1221BC221B3221BS221x3knHRZvHi5l_2puH4v3XpHevHx2m_2qvH1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bw4221BN221Bo1221Bf1221Bf4221B-4221BH221Bh4221Be5221B6221BR221BK221B2221BA221Bn5221Bu4221B5221BM221A221BF221BD221Bf4221BW5221BT221Ba1221A221BZ1221BC221B3221BS221Bj4221BN221BY4221BM221A221Bt4221BY4221BM221B5221B4221BB221Bj3221x3usHh3pyHy2l_2pvH15nvH3A_1W3KIFd321_1_2JHGe317v3YzHjcBd6ihBXcB2v3rrHcZT6xh8cZT1BZ1221BS221B2221x3yrH5hZT5yh8bZT1_3lyHr9t9kNW1rh8kN19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12a121n12Z121n12S21n12221z1ggDwcDET72l8oo4qeD551Gfg2");
+replay.events.push("3v3fl4W-Fh5m_2c-F1Bc2221BR221BK221B2221BA221Bn5221BW5221BT221Ba1221A221BZ1221BC221B3221BS221x3WtFRx-Fi5l_2b-F4v3puFW_Fi1m_2c_F1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bw4221BN221Bo1221Bf1221Bf4221B-4221BH221Bh4221Be5221B6221BR221BK221B2221BA221Bn5221Bu4221B5221BM221A221BF221BD221Bf4221BW5221BT221Ba1221A221BZ1221BC221B3221BS221Bj4221BN221BY4221BM221A221Bt4221Be4221BA221B8221B1221BQ221Bn5221Bu4221B5221BM221Bd5221Ba4221Bk1221Bn5221Bw4221B4221B6221BP221Bf4221Ba4221BE221BC221B5221BI221BF221B7221BA221BH221BS221BV221B4221BI221BC221Bd5221Bw4221B4221B8221A221Bf4221BR221A221Be3221Be1221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221B6221A221B2221BQ221BZ5221Bm4221B5221BQ221BP221Bf4221Bu4221BD221B7221B6221BA221BA221BD221Bj4221Bg5221B9221BZ4221x3gyFp7pcGh1l_2b_F11x-FB_1W3KKH_221_1_2JJIW318v3qcGlgB_5ihBfgB2v3bWGenR2xh8enR1BL221B6221A221B2221BQ221x3w_F9nnR1yh8dnR1BE222h3lWG1qnRxh8snR1B2221B6221B4221BN221h3yWG5xnRyh8rnR1BC222h3nWG3-nRxh8YoR1B7221BC221B1221BN22");
+replay.modes.push([5713, "input"]);
+replay.modes.push([5720, "output"]);
+replay.events.push("1h3eXG3boRyh8XoR1BC222x3vXG5eoR1xh8koR1B7221Ba1221B2221v3yWGjoR2yh8joR1BA222x3_WG7moR1xh8uoR1BZ1221BS221B2221x3cXG2roR2yh8toR1_3vdGz9r9kROrh8sR19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12E21n12L21n12621X1221n12221n12Q21z1cgDqcD8PB2h8-n4qeD41G_f23v3zk4adFx5m_2kdF1BY1221Ba1221A221BZ1221BC221B3221x3aXFBldFy5l_2jdF4v3xXFqdFs4m_2-dF1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bc4221BU221BP221BY1221BP221BK221BR221Bf4221B-4221B1221Bx4221Be5221BN221B5221Bf4221Bk5221BZ1221BS221B2221Bd5221Bk5221Bh1221BM221A221Bt4221B-4221BH221Bh4221Be5221BN221B5221Bf4221Bw4221B4221B8221A221Bb5221Bc4221B3221Bg1221BX1221BQ221B7221B_3221BR221A221BY2221BX2221Be4221B5221BY1221BD221Br4221BW5221BT221Ba1221A221BZ1221BC221B3221Bf4221Bu4221BD221B7221B6221BU221Bb5221Bi4221BU221B5221B4221BN221B5221BQ221BZ5221Bk5221BZ1221BS221B2221Bh4221BR221A221Be3221Be1221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221B6221A221B2221BQ221BZ5221Bm422");
+replay.modes.push([5979, "input"]);
+replay.modes.push([5988, "output"]);
+replay.text.push("emBLbWMgDhds\n\nYou take note of this and keep walking.\n\n== Twisty passages ==\nYou are in a maze of twisty little passages, all alike.\n\nThings of interest here:\n- can\n\nThere is 1 exit:\n- west\n\nWhat do you do?\ntake can\n\n\nTaken.\n\nWhat do you do?\nuse can\n\n\nYou fill your lantern with oil.  It seems to cheer up!\n\n\nWhat do you do?\nuse lantern\n\n\nYou light your lantern.\n\n== Twisty passages ==\nYou are in a maze of twisty little passages, all alike.\n\nThere is 1 exit:\n- west\n\nWhat do you do?\nwest\n\n\n== Twisty passages ==\nYou are in a maze of twisty little passages, all dimly lit by more bioluminescent moss.  There is a ladder here leading up.\n\nThere are 5 exits:\n- ladder\n- north\n- south\n- east\n- west\n\nWhat do you do?\nladder\n\n\n== Passage ==\nYou are in a crevise on the west wall of the moss cavern.  A dark passage leads further west.  There is a ladder here which leads down into a smaller, moss-filled cavern below.\n\nThere are 3 exits:\n- cavern\n- ladder\n- darkness\n\nWhat do you do?\ndarkness\n\n\n== Passage");
+replay.keyframes.push([6000, 25938, 5999, [101, 6, 0, 8014, 7, 1528, 8007, 0], [0, 32767, 32767, 0, 32767, 2452, 2473, 2483, 2468, 2478, 2463, 2488, 2623, 2643, 2488, 2553, 2372]]);
+replay.events.push("1B5221BQ221BP221Bf4221Bk5221BT221B2221BB221BA221Bl4221Bu4221BD221B7221B6221BU221Bb5221Be4221BM221BG221BH221Bx4221Bo4221BA221BC221B9221Bz4221BY4221BX4221Bc5221BB221BN221BM221A221BD221BQ221Bh4221BN221Bw4221B4221B8221A221Bh4221Bo3221B6221B6221A221BD221B1221Bd4221Bc4221B3221Bg1221BX1221BQ221B7221Bx4221Ba4221B6221BE221B6221BG221Bn4221x3YbFzAnoFr4l_2zdF11tdFB_1W3KKHZ321_1_2JJIa318v3woFrhBZ6ihBhhB2v3viFi-Q6xh8i-Q1B3221Bg1221BX1221BQ221B7221x3aiF9r-Q5yh8h-Q1BE222x3riF1u-Q6xh8w-Q1BL221B6221A221B2221BQ221x3giF7X_Q5yh8v-Q1BE222x3pjF3a_QAxh8e_Q1B5221BY1221BD221B6221BH221BS221A221x3siF9n_Q9yh8d_Q1_3dpFv9r9qSSrh8uS19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12121n12521n12Y121n12D21n12621n12H21n12S21X1221z1YgDqcDCRF2h8eo4qeD41Gag23v3dl4WqFx5m_2kqF1BY1221Ba1221A221BZ1221BC221B3221x3akFBhqFy5l_2jqF4v3xkFauFp1m_2ouF1Bi1221BC221Bf5221Bi4221B1221A221BE221Bt4221Be5221BN221BD221Bc1221Bd5221Bo5221BJ221BC221B5221BZ5221Bu4221B5221B3221B2221BO221Bd5221Bc522");
+replay.modes.push([6135, "input"]);
+replay.modes.push([6144, "output"]);
+replay.events.push("1B7221BC221B5221BT221B4221Bf4221Bo4221BK221Bb5221Bw4221B4221B6221BP221Bf4221Be5221BN221BD221BQ221Bx4221Bc5221B4221BT221A221B6221BB221BC221B7221BI221BC221Bd5221Be5221B9221Bz4221Bs4221BB221A221BM221B_4221Bk4221BM221B6221BV221BS221Bb5221BY4221Bi1221Bh1221Bm1221Br4221x3srFn4tyFq1l_2nuF11juFB_1W3IKJb321_1_2HJKc318x3czF1ZhBb6ihBrgB2v3ZtFWeRCxh8WeR1BO221B1221BC221BL221BA221BE221BV221x3WtFDjeRByh8_dR1BI222x3ttF1meR4xh8oeR1B1221B4221BG221x3ctF3reR3yh8neR1_3dzFt9r9WSUrh8YS19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12321n12O21n12121n12C21n12L21n12A21n12E21n12V21j1YgDqcDGF2Z8sr4qeD1Gxh23v3jp4eYIn5m_2sYI1Bw1221BY1221BD221Br4221BW5221BT221Ba1221A221BZ1221BC221B3221x3iyHLzYIo5l_2rYI4v3ZzHYZIQm_2mZI1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221By4221BP221BY1221A221B5221BG221Bj5221BW5221BT221Ba1221A221BZ1221BC221B3221Bj3221BR221A221Be3221Be1221B5221BQ221BP221Bf4221Bo4221BK221Bb5221Be4221B5221BY1221BD221B6221BH221BS221A221Bb522");
+replay.modes.push([6331, "input"]);
+replay.modes.push([6336, "output"]);
+replay.events.push("1Be5221B9221Bz4221Be5221BN221B5221Bf4221Bk5221BZ1221BS221B2221Bl4221BN221Ba4221Bc1221B1221Bd5221Bo5221BJ221BC221Bf5221Bc4221B3221BQ221Bx4221Ba4221B1221BY1221BP221BE221BQ221Bn5221Bc5221BR221A221Bf4221BY4221BX4221Bk4221BA221B6221BG221BR221BA221BD221Bj4221B-4221B2221BL221BI221B9221BA221BD221Bj4221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bg4221B7221Ba1221B2221Bh4221x3qWIX7ZgIPl_2lZI11hZIB_1W3KKJb321_1_2JJKc318v3ogIxbBb6ihBjbB2v3dZIamT4xh8amT1BZ1221BS221B2221x3kZI5fmT3yh8ZmT1BA222x3raI1imT4xh8kmT1B7221Ba1221B2221x3uZI3nmT3yh8jmT1_3hgIt9r9uMUrh8wM19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12a121n12Z121n12S21n12221z1ggDqcDGT72h8Ws4qeD71GWi23v3tp4ahIn5m_2ghI1Bw1221BY1221BD221Br4221BW5221BT221Ba1221A221BZ1221BC221B3221x3WbILvhIo5l_2fhI4v3tbI-hIb4m_2aiI1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Be4221B5221BY1221BD221Bz3221BN221By4221BP221BY1221A221B5221BG221Bj5221BW5221BT221Ba1221A221BZ1221BC221B3221Bj3221x3efIX2_jIc4l_2ZiI");
+replay.modes.push([6443, "input"]);
+replay.modes.push([6448, "output"]);
+replay.modes.push([6555, "input"]);
+replay.modes.push([6560, "output"]);
+replay.events.push("11_hIB_1W3KKBb321_1_2JJCc318v3ckIdbBb6ihBXbB2v3_dIipT4xh8ipT1B7221Ba1221B2221x3YdI5npT3yh8hpT1BA222x3bdI1qpT4xh8spT1BZ1221BS221B2221x3idI3vpT3yh8rpT1_3_jIt9r9iMUrh8kM19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12a121n12Z121n12S21n12221z1ggDqcD8T72Z8gs4qeD1Gbi23v3Xq4ukIn5m_2-kI1Bw1221BY1221BD221Br4221BW5221BT221Ba1221A221BZ1221BC221B3221x3qeILjlIo5l_2zkI4v3hfIolIb4m_2ulI1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Be4221B5221BY1221BD221Bz3221BN221By4221BP221BY1221A221B5221BG221Bj5221BW5221BT221Ba1221A221BZ1221BC221B3221Bj3221x3yiIX2pnIc4l_2tlI11plIB_1W3KKBb321_1_2JJCc318v3wnIxaBb6ihBraB2v3phIqsT4xh8qsT1B7221Ba1221B2221x3sgI5vsT3yh8psT1BA222x3vgI1ysT4xh8-sT1BZ1221BS221B2221x3WhI3XtT3yh8zsT1_3pnIt9r9WMUrh8YM19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12a121n12Z121n12S21n12221z1ggDqcD8T72Z8qs4qeD1Ggi23v3hq4ioIn5m_2ooI1Bw1221BY1221BD221Br4221BW5221BT221Ba122");
+replay.modes.push([6733, "input"]);
+replay.modes.push([6738, "output"]);
+replay.events.push("1A221BZ1221BC221B3221x3eiILXpIo5l_2noI4v3_iIcpI1m_2ipI1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Be4221B5221BY1221BD221Bz3221BN221By4221BP221BY1221A221B5221BG221Bj5221BW5221BT221Ba1221A221BZ1221BC221B3221Bj3221BR221A221Be3221Bs1221Bz4221Be5221BN221B5221Bf4221Bk5221BZ1221BS221B2221Bl4221BN221Bo5221BJ221BC221Bf5221Bc5221B5221B1221BA221Bd5221Bc5221B7221B3221BF221Bf4221Bi5221BX1221B4221B3221BU221Bb1221Bc1221BL221BC221B1221Bx4221Bk5221BT221B5221BQ221BP221Bf4221Be5221BN221B5221Bf4221BW5221BT221Ba1221A221BZ1221BC221B3221Bf4221Bg4221Bc1221BF221BT221BQ221BJ221BU221Bf4221x3mmIb6hvI2l_2hpI11dpIB_1W3KKBb321_1_2JJCc318v3ovIlaBb6ihBfaB2v3hpIW-T4xh8W-T1B7221Ba1221B2221x3koI5b-T3yh8_zT1BA222x3noI1e-T4xh8g-T1BZ1221BS221B2221x3uoI3j-T3yh8f-T1_3hvIt9r9qLUrh8sL19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12a121n12Z121n12S21n12221z1ggDqcD8T72Z8-s4qeD1Gli23v3vp4awI_5m_2gwI1Bc2221BN221BA221BA221x3apI7hwIW6l_2fwI4v3tqImwIc9m_2swI");
+replay.events.push("1Bi1221BC221Bf5221Bc5221B2221Bb1221BQ221BJ221Bd4221Bo4221BA221Bx4221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bc4221B3221Bg1221BX1221BQ221B7221Bx4221Bk5221BR221BM221BN221Bl4221BY4221BX4221Bm4221BQ221BR221B3221Bf4221Ba5221B6221BN221BA221Bx4221Be5221B9221Bz4221Be5221BN221B5221Bf4221By4221B2221B6221B4221BN221Bt3221BN221B-4221BE221BX1221BQ221BL221BM221B5221BG221BH221Bx4221Ba4221Bk1221Bn5221BW5221B7221BL221BQ221BC221Bd5221Bu4221B5221B5221B1221Bj3221BR221A221Be3221Be1221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bc5221B2221B9221B1221BH221Bf4221BY4221BY1221BT221BA221BU221Bh1221Bm1221Bn5221Be5221B9221Bz4221Be5221BN221B5221Bf4221By4221B2221B6221B4221BN221Bl4221BY4221B4221BY1221BL221BA221BD221Bj4221BY4221Ba1221Bb5221Be5221BN221B5221Bf4221Be4221BM221A221B6221BA221Bh1221Bm1221Bn5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Ba5221B6221BN221BA221BH221B1221Bd4221Bc4221BO221B3221B6221B7221BD221Bc1221Bp4221BR221A221BY2221BX2221Bc4221BU221BP221BY1221BP221BB221B422");
+replay.text.push(" ==\nYou feel that your light source is more than sufficient to keep grues away.\n\nThere are 2 exits:\n- continue\n- back\n\nWhat do you do?\ncontinue\n\n\n== Dark passage ==\nYou are in a narrow passage.  There is darkness to the west, but you can barely see a glowing opening to the east.\n\nThere are 2 exits:\n- west\n- east\n\nWhat do you do?\nwest\n\n\n== Dark passage ==\nYou are in a dark, narrow passage.\n\nThere are 2 exits:\n- east\n- west\n\nWhat do you do?\nwest\n\n\n== Dark passage ==\nYou are in a dark, narrow passage.\n\nThere are 2 exits:\n- east\n- west\n\nWhat do you do?\nwest\n\n\n== Dark passage ==\nYou are in a dark, narrow passage.  To the west, you spot some vegetation where the passage expands.\n\nThere are 2 exits:\n- east\n- west\n\nWhat do you do?\nwest\n\n\n== Ruins ==\nYou stand in a large cavern with a huge ruin to the north, overgrown by plant life.  There is a large stone archway to the north acting as the doorway to the ruined complex.  A crevice in the rock to the east leads to an alarmingly dark passageway.");
+replay.keyframes.push([7000, 31477, 6999, [46, 247, 0, 9891, 248, 1528, 9643, 0], [0, 32767, 32767, 0, 32767, 2452, 2473, 2483, 2468, 2478, 2463, 2488, 2623, 2643, 2488, 2553, 2447]]);
+replay.modes.push([7053, "input"]);
+replay.modes.push([7059, "output"]);
+replay.events.push("1Bf4221Bo4221BA221Bx4221Be5221BN221B5221Bf4221Ba5221B5221BN221BG221Br4221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bg4221B7221Ba1221B2221Bd5221Bu4221BD221B7221B6221BU221Bb5221Be5221B9221Bz4221BY4221BQ221Bx4221BY4221BM221BL221BY1221B9221B7221BA221BD221BA221BQ221Bn5221Be4221B5221BY1221BD221Br4221BW5221BT221Ba1221A221BZ1221BC221B3221Ba1221Bh1221Bm1221Br4221x3wtIjFzfJb9l_2rwI11nwIB_1W3KKBb321_1_2JJCc318v3agJZaBb6ihBzZB2v3zZJckU4xh8ckU1B7221Ba1221B2221x3WZJ5hkU3yh8bkU1BA222x3rZJ1kkU6xh8mkU1B2221B6221B4221BN221x3YaJ5rkU5yh8lkU1_3zfJt9r9eLUrh8gL19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n12221n12621n12421n12N21z1egDqcD8592h8et4qeD21Gqi23v3Zq4sgJ_5m_2-gJ1Bc2221BN221BA221BA221x3uZJ7zgJW6l_2zgJ4v3hbJYhJW5m_2ghJ1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221Be5221BN221B5221Bf4221B-4221B1221BL221B4221Bl3221Ba4221B2221BA221BH221BD221BI221BC221Bd5221Bi4221BI221BK221Bd1221BQ221BZ5221B-4221BH221Bh4221BY4221BX4221Bw4221BN221Ba1221A22");
+replay.events.push("1BJ221BQ221BX1221Bf4221Ba5221B6221BN221BA221BH221B1221Bd4221Bc4221BO221B3221B6221B7221BD221Bc1221Bp4221BR221A221Be3221Be1221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221Be4221BM221A221B6221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bc5221B7221BC221B1221BN221Bl4221Bu4221BD221B7221B6221BA221BA221BD221Bj4221Be5221B9221Bz4221Be5221BN221B5221Bf4221B-4221BE221BX1221BQ221BL221BM221B5221BG221B5221BN221Bl4221B-4221BC221B1221B1221BJ221B9221B2221Bf4221BY4221BQ221BJ221Bd4221Bc5221B2221Bb1221BG221BI221B2221Bb5221Be5221B9221Bz4221Be5221BN221B5221Bf4221By4221B2221B6221B4221BN221Bl4221Bk5221BT221B2221BB221BA221Bl4221Bu4221BD221B7221B6221Bd4221Bo4221BA221BC221B9221Bz4221BY4221BX4221Bu4221BL221BY1221BL221B3221BQ221BZ5221Bm4221BD221BM221A221Bx3221x3keJdBfsJ_4l_2fhJ1_3rgJu_Hu_HfiAr4s_2XiA19q4219e12192219A219D219O219b5219-4219H219h4219o4219A219C219T219Q219P219S2192219d5219m42195219Q219P219r2219_221_3_qRj_HlcDmgAJqm8p42x3mxR9hqRFvm8rZH1BP221B1221Bd4221Bc4221BO221BB221BA221x3dxR3-pRGwm8sZH1_3mqR9dv48g5fmBsmA");
+replay.modes.push([7345, "input"]);
+replay.modes.push([7359, "output"]);
+replay.modes.push([7385, "input"]);
+replay.modes.push([7391, "output"]);
+replay.events.push("B_1W3KKDb321_1_2JJEc318v3osJvZBb6ihBnZB2v3vlJewU6xh8ewU1B2221B6221B4221BN221x3cmJ7lwU5yh8dwU1BC222x3xlJ1owU6xh8qwU1B7221BC221B1221BN221x3omJ5vwU5yh8pwU1_3jsJt9r9yKUrh8-K19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12U21n12b121n12K21n12B21n12f421n12a521n12P21n12121n12d421n12c421n12O21n12B21n12A21z1ufDqcDAHP2_Be3feNYlRxc9x5s_2pc915019Q219K219B219I219_3219d221-2tuRtuRhe1K_d119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n12221n12621n12421n12N21z1egDycDG592l8ot4qeD751Gvi23v3jq4ctJ_5m_2ktJ1Bc2221BN221BA221BA221x3emJ7jtJW6l_2jtJ4v3xnJotJWCm_2wtJ1Bi1221BC221Bf5221Bc5221B2221Bb1221BQ221BJ221Bd4221Bo4221BA221Bx4221Be5221BN221B5221Bf4221Bw4221BN221Ba1221A221BJ221BQ221BX1221Bf4221Bc4221B4221BI221BC221B3221BX1221BM221Bt4221Bm4221BD221BM221A221Bt4221B-4221BH221Bh4221Be5221BN221B5221BS221BR221Bf4221Ba5221B6221BN221BA221BA221Bf4221BR221A221Be3221Be1221B5221Bf4221Bk5221Bh1221BM221A221BE221Bb522");
+replay.events.push("1BY4221BY1221BP221Bf4221Bc4221BU221B6221BF221BL221BK221B5221BA221BD221Br3221BN221BY4221BQ221BJ221Bd4221Bi5221BX1221B4221B3221BU221Bb1221Bc1221BL221BC221B1221Bx4221Bm4221BD221Ba1221Bb5221Bc4221BI221BD221B7221BY1221BB221BQ221Bn5221Be5221Bb1221BK221BB221BI221Bx4221B-4221BE221BX1221BQ221Bd4221BR221A221Ba3221Bw1221A221B3221BC221Bb5221BY4221BY1221BP221Bf4221BY4221Bc1221A221Bb1221B4221BA221B5221B1221Bd4221Bo4221BA221Bx4221BY4221BM221A221Bt4221Be4221BA221BI221BP221B3221BY1221BL221BC221B1221BA221Bf4221BR221A221Be3221Be1221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221Bc5221B2221B3221BX1221BQ221BD221B3221Bf4221Bw4221B4221B1221BE221BF221BF221BI221BC221Bd5221Bo4221BA221Bx4221Be5221BN221B5221Bf4221Bc4221B4221BI221BC221BT221BQ221BZ5221B-4221BH221Bh4221Be5221BN221B5221Bf4221Bm4221BD221BM221A221Bt4221Bk5221BR221BM221BN221Bl4221Bc4221BC221BI221BT221Ba1221BH221BL221BY1221BZ5221Bc5221BD221B6221BA221B1221Bb5221BY4221BQ221BJ221Bd4221Bg5221BD221BE221B3221B4221Bd1221BM221Bt4221Bc5221BC221BN221BL221BQ221B522");
+replay.modes.push([7766, "input"]);
+replay.modes.push([7771, "output"]);
+replay.events.push("1BE221Bf4221BR221A221Bo2221Bs2221Bd5221Ba5221BP221B7221B6221BU221Bn3221B_2221A221Bg5221Bz3221BM221BL221B-3221Bz3221BK221BJ221B-3221B1221Bt2221BZ1221BM221BL221B-3221B1221Br2221Bb1221BQ221BP221B-3221Bz3221Bw1221Bv1221Bc1221BC221A221x3eqJdIvfK_Bl_2vtJ11ntJB_1W3KKHX321_1_2JJIY318v3-fKjZBX6ihBbZB2v3fZKijV2xh8ijV1B2221B6221B4221BN221x3sZK7pjV1yh8hjV1BC222x3hZK1sjV2xh8ujV1B7221BC221B1221BN221x3YaK5zjV1yh8tjV1BC222h3paK3WkVxh8akV1B7221Ba1221B2221h3sZK1bkVyh8ZkV1BA222h3vZK5ekVxh8kkV1BZ1221BS221B2221f3WaKjkVyh8jkV1_3pgKx9r9iKQrh8oK19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1X1221n12721n12a121n12221z1ggDqcDAT72h8eu4qeD11Gaj23v3Zr4qsK_5m_2wsK1Bc2221BN221BA221BA221x3qlK7xsKW6l_2vsK4v3dnKWtKg2m_2ctK1Bi1221BC221Bf5221Bc5221B2221Bb1221BQ221BJ221Bd4221Bo4221BA221Bx4221Bk5221BT221BD221Bc1221Bd5221Bc5221BR221A221BG221BC221Bb5221Be5221B9221Bz4221Bm4221BD221Bg1221BX1221Bf4221B-4221B1221BL221B4221Bf4221Ba4221B6221A221BI221Bx4221BY4221BX4221Be4221BA221BA22");
+replay.text.push("\n\nThere are 2 exits:\n- east\n- north\n\nWhat do you do?\nnorth\n\n\n== Ruins ==\nYou are in the once-opulent foyer of a massive ruined complex.  There is a door to the south leading to the overgrowth outside and stairs to the north which lead into a larger hall.\n\nThings of interest here:\n- red coin\n\nThere are 2 exits:\n- north\n- south\n\nWhat do you do?\ntake red coin\n\n\nTaken.\n\nWhat do you do?\nnorth\n\n\n== Ruins ==\nYou stand in the massive central hall of these ruins.  The walls are crumbling, and vegetation has clearly taken over.  Rooms are attached in all directions.  There is a strange monument in the center of the hall with circular slots and unusual symbols.  It reads:\n\n_ + _ * _^2 + _^3 - _ = 399\n\nThere are 4 exits:\n- north\n- south\n- east\n- west\n\nWhat do you do?\neast\n\n\n== Ruins ==\nYou stand in what seems to have once been a dining hall; broken tables and pottery are scattered everywhere.  A staircase here leads down.\n\nThings of interest here:\n- concave coin\n\nThere are 2 exits:\n- down\n- west\n\n");
+replay.keyframes.push([8000, 37073, 7999, [10, 32613, 32613, 27415, 17, 1531, 27414, 0], [0, 32767, 32767, 0, 32767, 0, 2473, 2483, 2468, 2478, 2463, 2488, 2623, 2643, 2488, 2553, 2468]]);
+replay.events.push("1B9221BA221BD221Bj4221Bm4221BD221BM221A221BX3221Br1221Ba4221BW1221B5221B7221BB221BI221Bx4221Be5221Bb1221B2221BK221BD221BS221Bb5221BY4221BQ221BJ221Bd4221BW5221B1221BA221A221BT221BQ221BE221Bn5221BY4221BY1221BP221Bf4221Bc5221BV221B3221Bc1221A221BT221BQ221BP221B1221Bd4221Bg4221BY1221BX1221BQ221BE221B3221BT221B5221BQ221BP221Bj3221BR221A221BY2221BX2221Bc5221B2221Bb1221BG221BI221BT221B3221Ba1221BR221Bf4221Bm4221B5221BQ221BP221Bf4221Bu4221BD221B7221B6221BU221Bb5221Be4221BM221BG221BH221B_3221x3gqKn8n_Kf2l_2btK1_3nsKu_Hu_HdiAr4s_2XiA19q4219e12192219A219D219O219b5219-4219H219h4219o4219A219C219T219Q219P219S2192219d5219m42195219Q219P219r2219_221_3hcRd_HlbDmgAJqm8p42x3-hRFtbR7vm8XrG1BO221B1221BL221B3221Bg1221BX1221Bf4221Bc4221BO221BB221BA221x3piR5YbR8wm8YrG1_3ybRFdw46g5fmBsmAB_1W3KKBb321_1_2JJCc318v3u_KtXBb6ihBnXB2v3pvKn-V4xh8n-V1BM221BG221BH221x3WvK5i-V3yh8o-V1BA222x3tuK1f-V4xh8d-V1BZ1221BS221B2221x3-uK3a-V3yh8e-V1_3n_Kt9r9yIUrh8-I19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_22");
+replay.modes.push([8016, "input"]);
+replay.modes.push([8034, "output"]);
+replay.modes.push([8060, "input"]);
+replay.modes.push([8065, "output"]);
+replay.events.push("19f321_3bfDz-CzyCojAe5r_2qkA1n12U21n12b121n12K21n12B21n12f421n12c421n12O21n12121n12L21n12321n12g121n12X121n12f421n12c421n12O21n12B21n12A21z1mfDqcD8HX12_Be3feNYlRvc9x5s_2pc918019Q219K219B219I219_3219d221-2tuRtuRhe1K_d119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12121n12M21n12G21n12H21z1ggDycDOH72l8ou4qeD7F1Gfj23v3jr4gWL_5m_2mWL1Bc2221BN221BA221BA221x3gvK7nWLW6l_2lWL4v3dxKsWLg1m_2yWL1Be1221B2221BK221Bb5221Bc5221BR221A221BG221BC221Bb5221Be5221B9221Bz4221Ba4221B6221Bf4221BY4221BX4221Bs4221B3221BM221BX1221BA221B5221BI221Bb3221Br1221Be5221BN221B5221BQ221BP221Bf4221BY4221BY1221BP221Bf4221Ba4221BW1221BH221BB221BG221Br4221Bc5221B2221B9221BE221BX1221BS221Bb5221BY4221BQ221BJ221Bd4221Bc5221BL221B5221BE221BK221BX1221BS221Bb5221BY4221BM221B6221B1221BD221Bj4221Be5221BN221B5221Bf4221Bk5221Bh1221BM221A221Bx3221BR221A221Bg2221BY3221BX1221BQ221BE221B9221BN221B2221BA221BD221Bj4221Bm4221B5221BQ221BP221Bf4221Bm4221BD221Ba1221Bb5221Bi4221B9221BM221A221BD22");
+replay.modes.push([8284, "input"]);
+replay.modes.push([8303, "output"]);
+replay.modes.push([8329, "input"]);
+replay.modes.push([8332, "output"]);
+replay.events.push("1BI221Bx4221Bo4221BA221BC221B9221Bz4221Be4221BA221BK221B1221BP221BM221BT221BG221BI221Bd4221x3W-Kn7deLf1l_2xWL1_3dWLu_Hu_HdiAr4s_2XiA19q4219e12192219A219D219O219b5219-4219H219h4219o4219A219C219T219Q219P219S2192219d5219m42195219Q219P219r2219_221_3jmRh_HbbDmgAJqm8p42x3WsRBvlR5vm8Z_G1BO221B6221A221B5221BL221B2221B1221Bd4221Bc4221BO221BB221BA221x3rsRBYlR6wm8a_G1_3ylRBlw46g5fmBsmAA_1W3KI9d321_1_2JHAe317v3meLhXBd6ihBbXB2v3dXLdsV2xh8dsV1B9221x3oXL1csV1yh8esV1_3zdLr9t9oIW1rh8oI19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12U21n12b121n12K21n12B21n12f421n12c421n12O21n12621X1221n12521n12L21n12221n12121n12d421n12c421n12O21n12B21n12A21z1kfDqcD8HZ12_Be3feNYlRvc9x5s_2pc916019Q219K219B219I219_3219d221-2tuRtuRhe1K_d119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12W121n12921z1kgDycDQL32l8eu4qeD7L1Gaj23v3Zr4usK_5m_2wsK1Bc2221BN221BA221BA221x3qlK7_sKW6l_2vsK4v3dnKatKg2m_2ctK1Bi1221BC221Bf5221Bc5221B222");
+replay.modes.push([8536, "input"]);
+replay.events.push("1Bb1221BQ221BJ221Bd4221Bo4221BA221Bx4221Bk5221BT221BD221Bc1221Bd5221Bc5221BR221A221BG221BC221Bb5221Be5221B9221Bz4221Bm4221BD221Bg1221BX1221Bf4221B-4221B1221BL221B4221Bf4221Ba4221B6221A221BI221Bx4221BY4221BX4221Be4221BA221BA221B9221BA221BD221Bj4221Bm4221BD221BM221A221BX3221Br1221Ba4221BW1221B5221B7221BB221BI221Bx4221Be5221Bb1221B2221BK221BD221BS221Bb5221BY4221BQ221BJ221Bd4221BW5221B1221BA221A221BT221BQ221BE221Bn5221BY4221BY1221BP221Bf4221Bc5221BV221B3221Bc1221A221BT221BQ221BP221B1221Bd4221Bg4221BY1221BX1221BQ221BE221B3221BT221B5221BQ221BP221Bj3221BR221A221BY2221BX2221Bc5221B2221Bb1221BG221BI221BT221B3221Ba1221BR221Bf4221Bm4221B5221BQ221BP221Bf4221Bu4221BD221B7221B6221BU221Bb5221Be4221BM221BG221BH221B_3221x3gqKn8r_Kf2l_2btK11XtKB_1W3KK7b321_1_2JJ8c318v3u_KpXBb6ihBnXB2v3pvKn-V4xh8n-V1BM221BG221BH221x3WvK5i-V3yh8o-V1BA222x3tuK1f-V4xh8d-V1BZ1221BS221B2221x3-uK3a-V3yh8e-V1_3n_Kt9r9yIUrh8-I19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12a12");
+replay.modes.push([8541, "output"]);
+replay.events.push("1n12Z121n12S21n12221z1ggDqcD4T72h8ot4qeD41Gvi23v3jq4etJ_5m_2ktJ1Bc2221BN221BA221BA221x3emJ7ltJW6l_2jtJ4v3xnJqtJWCm_2wtJ1Bi1221BC221Bf5221Bc5221B2221Bb1221BQ221BJ221Bd4221Bo4221BA221Bx4221Be5221BN221B5221Bf4221Bw4221BN221Ba1221A221BJ221BQ221BX1221Bf4221Bc4221B4221BI221BC221B3221BX1221BM221Bt4221Bm4221BD221BM221A221Bt4221B-4221BH221Bh4221Be5221BN221B5221BS221BR221Bf4221Ba5221B6221BN221BA221BA221Bf4221BR221A221Be3221Be1221B5221Bf4221Bk5221Bh1221BM221A221BE221Bb5221BY4221BY1221BP221Bf4221Bc4221BU221B6221BF221BL221BK221B5221BA221BD221Br3221BN221BY4221BQ221BJ221Bd4221Bi5221BX1221B4221B3221BU221Bb1221Bc1221BL221BC221B1221Bx4221Bm4221BD221Ba1221Bb5221Bc4221BI221BD221B7221BY1221BB221BQ221Bn5221Be5221Bb1221BK221BB221BI221Bx4221B-4221BE221BX1221BQ221Bd4221BR221A221Ba3221Bw1221A221B3221BC221Bb5221BY4221BY1221BP221Bf4221BY4221Bc1221A221Bb1221B4221BA221B5221B1221Bd4221Bo4221BA221Bx4221BY4221BM221A221Bt4221Be4221BA221BI221BP221B3221BY1221BL221BC221B1221BA221Bf4221BR221A221Be3221Be1221B5221BQ221BP221Bf422");
+replay.events.push("1Bo4221BK221Bb5221BY4221BX4221Bc5221B2221B3221BX1221BQ221BD221B3221Bf4221Bw4221B4221B1221BE221BF221BF221BI221BC221Bd5221Bo4221BA221Bx4221Be5221BN221B5221Bf4221Bc4221B4221BI221BC221BT221BQ221BZ5221B-4221BH221Bh4221Be5221BN221B5221Bf4221Bm4221BD221BM221A221Bt4221Bk5221BR221BM221BN221Bl4221Bc4221BC221BI221BT221Ba1221BH221BL221BY1221BZ5221Bc5221BD221B6221BA221B1221Bb5221BY4221BQ221BJ221Bd4221Bg5221BD221BE221B3221B4221Bd1221BM221Bt4221Bc5221BC221BN221BL221BQ221B5221BE221Bf4221BR221A221Bo2221Bs2221Bd5221Ba5221BP221B7221B6221BU221Bn3221B_2221A221Bg5221Bz3221BM221BL221B-3221Bz3221BK221BJ221B-3221B1221Bt2221BZ1221BM221BL221B-3221B1221Br2221Bb1221BQ221BP221B-3221Bz3221Bw1221Bv1221Bc1221BC221A221x3eqJdIxfK_Bl_2vtJ11ntJB_1W3KKFX321_1_2JJGY318v3-fKhZBX6ihBbZB2v3fZKijV2xh8ijV1B2221B6221B4221BN221x3sZK7pjV1yh8hjV1BC222x3hZK1sjV2xh8ujV1B7221BC221B1221BN221x3YaK5zjV1yh8tjV1BC222h3paK3WkVxh8akV1B7221Ba1221B2221h3sZK1bkVyh8ZkV1BA222h3vZK5ekVxh8kkV1BZ1221BS221B2221f3WaKjkVyh8jkV1_3pgKx9r9iKQrh8oK19w4219Y12");
+replay.modes.push([8916, "input"]);
+replay.modes.push([8921, "output"]);
+replay.text.push("What do you do?\ntake concave coin\n\n\nTaken.\n\nWhat do you do?\ndown\n\n\n== Ruins ==\nThis seems to be a kitchen; there are brick stoves and shelves along the wall.  Everything here has fallen into disrepair.\n\nThings of interest here:\n- corroded coin\n\nThere is 1 exit:\n- up\n\nWhat do you do?\ntake corroded coin\n\n\nTaken.\n\nWhat do you do?\nup\n\n\n== Ruins ==\nYou stand in what seems to have once been a dining hall; broken tables and pottery are scattered everywhere.  A staircase here leads down.\n\nThere are 2 exits:\n- down\n- west\n\nWhat do you do?\nwest\n\n\n== Ruins ==\nYou stand in the massive central hall of these ruins.  The walls are crumbling, and vegetation has clearly taken over.  Rooms are attached in all directions.  There is a strange monument in the center of the hall with circular slots and unusual symbols.  It reads:\n\n_ + _ * _^2 + _^3 - _ = 399\n\nThere are 4 exits:\n- north\n- south\n- east\n- west\n\nWhat do you do?\nwest\n\n\n== Ruins ==\nYou find yourself in what was once the living quarters for the co");
+replay.keyframes.push([9000, 42718, 8999, [111, 64, 0, 10963, 179, 1528, 10898, 0], [0, 32767, 32767, 0, 32767, 0, 0, 2483, 0, 2478, 2463, 2488, 2623, 2643, 2488, 2553, 2478]]);
+replay.events.push("19D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12a121n12Z121n12S21n12221z1ggDqcD8T72Z8yu4qeD1Gkj23v3tr4oeL_5m_2ueL1Bc2221BN221BA221BA221x3oXL7veLW6l_2teL4v3bZL-eLy4m_2afL1Bi1221BC221Bf5221Bi4221B6221BA221BJ221Bd4221Bo5221BJ221BC221B5221B2221BR221BE221BB221Bh4221Bo4221BA221Bx4221Bk5221BT221BD221Bc1221Bd5221Bk5221Bh1221Ba1221Bb5221B-4221B1221BL221B4221Bf4221Be5221BN221B5221Bf4221Bu4221B5221BQ221BP221BA221BD221Bj4221BY5221B8221Bd1221BY1221B4221BT221BQ221B2221Bb5221Bi4221BI221B6221BZ5221Be5221BN221B5221Bf4221Bc4221BO221B3221B6221B7221BD221Bc1221Bp4221BR221A221Bw2221Be1221BQ221BM221Bn5221Bc5221BB221BN221BM221A221BD221BQ221BZ5221Ba5221B5221A221B3221BC221Bb5221Bk5221BT221B2221BB221BA221Bl4221B-4221B1221BL221B4221Bf4221Bm4221BD221B6221Bd4221Bk5221Bh1221BM221A221BE221Bb5221Be5221B9221Bz4221Be4221BA221BQ221BP221B9221B2221Bf4221Be5221BN221B5221BG221Bv4221By4221B2221BG221Bj5221Bu4221BL221Bm1221Bn5221Bo4221BA221Bx4221Be4221BA221BK221BZ1221BY1221A221BX1221Bm122");
+replay.modes.push([9202, "input"]);
+replay.modes.push([9217, "output"]);
+replay.modes.push([9243, "input"]);
+replay.modes.push([9246, "output"]);
+replay.events.push("1Br4221BR221A221Be3221Be1221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221Bc5221B2221Bb1221BG221BI221BT221B3221Ba1221BR221Bf4221Bg5221B9221B_4221Bm4221B5221BQ221BP221Bj3221x3ecLZBXqLx4l_2ZfL1_3leLu_Hu_HdiAr4s_2XiA19q4219e12192219A219D219O219b5219-4219H219h4219o4219A219C219T219Q219P219S2192219d5219m42195219Q219P219r2219_221_3XWRb_HxaDmgAJqm8p42x3obRHj_QDvm8tkG1BK221BI221BV221Bf4221Bc4221BO221BB221BA221x3fcR2--QEwm8ukG1_3o_QHxw46g5fmBsmAB_1W3KKBb321_1_2JJCc318v3eqLZXBb6ihBzWB2f3XjLrgVxh8rgV1B9221h3ijL1qgVyh8sgV1B6222x3dkL1ngV4xh8lgV1B7221Ba1221B2221x3gjL3igV3yh8mgV1_3zpLt9r9eIUrh8gI19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12U21n12b121n12K21n12B21n12f421n12a421n12K21n12I21n12V21n12f421n12c421n12O21n12B21n12A21z1sfDqcD8HR2_Be3feNYlRvc9x5s_2pc919019Q219K219B219I219_3219d221-2tuRtuRhe1K_d119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12W121n12921z1kgDycDIL32l8cv4qeD7D1Gpj23v3Xs4wqL_5m_2yqL");
+replay.events.push("1Bc2221BN221BA221BA221x3sjL7XrLW6l_2xqL4v3plLcrLe4m_2erL1Be1221B2221BK221Bb5221Bk5221Bh1221Ba1221Bb5221Bu4221B6221B1221BD221Bj4221BY4221BC221BG221Bz4221BY4221BX4221Bu4221BL221Bg1221BP221BK221BL221Bl4221Be5221BN221BK221B5221B1221BH221Bf4221Ba5221B5221A221B3221Bz3221BR221A221Be2221By2221BH221B7221B1221Bj3221Bm4221B9221B_4221Bi4221BI221BC221BD221BC221Bb1221BG221BA221BA221Bb5221BY4221BQ221BJ221Bd4221Bc4221BU221B6221BF221BL221BK221B5221BA221BD221Bj4221Bc5221B2221Bb1221Bc1221B2221BV221BS221Bb5221Bu4221B5221BA221BH221Bf4221Be5221BN221B5221Bf4221Bk5221Bh1221BM221A221BE221Bj4221BN221BY4221BQ221BJ221Bd4221Be5221BN221B5221Bf4221Bc4221B3221BY1221B8221BX1221B1221Bd4221Bc5221B2221B9221B1221BH221Bf4221Be5221BN221BK221B5221B1221BH221Bf4221Bo4221BA221Bx4221Be5221BN221B5221Bf4221Bc4221B4221BI221BC221BT221BQ221BZ5221B-4221BH221Bh4221Be5221BN221B5221Bf4221Ba5221B5221A221B3221Bv4221Bo4221BK221Bb5221Bi4221B9221BM221A221B5221BA221BD221Bj4221BY4221BU221BT221BY1221B4221Bh4221x3ioLlAr_Ld4l_2drL1_3pqLu_Hu_HZiAr4s_2XiA");
+replay.modes.push([9511, "input"]);
+replay.modes.push([9527, "output"]);
+replay.modes.push([9553, "input"]);
+replay.modes.push([9558, "output"]);
+replay.events.push("19q4219e12192219A219D219O219b5219-4219H219h4219o4219A219C219T219Q219P219S2192219d5219m42195219Q219P219r2219_221_3nhRf_HnaDmgAJqm8p42x3aoRDzgRBvm8dwG1BL221B2221BA221BM221Bn5221Bc4221BO221BB221BA221x3vnR3igRCwm8ewG1_3WhRDZx42g5fmBsmAA_1W3KI5d321_1_2JH6e317v3w_LpWBd6ihBnWB2v3pvLn_U6xh8n_U1BM221BG221BH221x3WvL5i_U5yh8o_U1_3d_Lr9t9-HW1rh8-H19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12U21n12b121n12K21n12B21n12f421n12c521n12L21n12221n12A21n12M21n12n521n12c421n12O21n12B21n12A21z1qfDqcD4HT2_Be3feNYlRrc9x5s_2pc917019Q219K219B219I219_3219d221-2tuRtuRhe1K_d119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12121n12M21n12G21n12H21z1ggDycDKH72l8yu4qeD7B1Gkj23v3tr4oeL_5m_2ueL1Bc2221BN221BA221BA221x3oXL7veLW6l_2teL4v3bZL-eLy4m_2afL1Bi1221BC221Bf5221Bi4221B6221BA221BJ221Bd4221Bo5221BJ221BC221B5221B2221BR221BE221BB221Bh4221Bo4221BA221Bx4221Bk5221BT221BD221Bc1221Bd5221Bk5221Bh1221Ba1221Bb5221B-4221B122");
+replay.events.push("1BL221B4221Bf4221Be5221BN221B5221Bf4221Bu4221B5221BQ221BP221BA221BD221Bj4221BY5221B8221Bd1221BY1221B4221BT221BQ221B2221Bb5221Bi4221BI221B6221BZ5221Be5221BN221B5221Bf4221Bc4221BO221B3221B6221B7221BD221Bc1221Bp4221BR221A221Bw2221Be1221BQ221BM221Bn5221Bc5221BB221BN221BM221A221BD221BQ221BZ5221Ba5221B5221A221B3221BC221Bb5221Bk5221BT221B2221BB221BA221Bl4221B-4221B1221BL221B4221Bf4221Bm4221BD221B6221Bd4221Bk5221Bh1221BM221A221BE221Bb5221Be5221B9221Bz4221Be4221BA221BQ221BP221B9221B2221Bf4221Be5221BN221B5221BG221Bv4221By4221B2221BG221Bj5221Bu4221BL221Bm1221Bn5221Bo4221BA221Bx4221Be4221BA221BK221BZ1221BY1221A221BX1221Bm1221Br4221BR221A221Be3221Be1221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221Bc5221B2221Bb1221BG221BI221BT221B3221Ba1221BR221Bf4221Bg5221B9221B_4221Bm4221B5221BQ221BP221Bj3221x3ecLZBXqLx4l_2ZfL11_eLB_1W3KKBb321_1_2JJCc318v3eqLZXBb6ihBzWB2f3XjLrgVxh8rgV1B9221h3ijL1qgVyh8sgV1B6222x3dkL1ngV4xh8lgV1B7221Ba1221B2221x3gjL3igV3yh8mgV1_3zpLt9r9eIUrh8gI19w4219Y1219D219c1219d5219e4219M2");
+replay.modes.push([9801, "input"]);
+replay.modes.push([9806, "output"]);
+replay.events.push("19z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1X1221n12721n12a121n12221z1ggDqcD8T72Z8ot4qeD1Gvi23v3jq4etJ_5m_2ktJ1Bc2221BN221BA221BA221x3emJ7ltJW6l_2jtJ4v3xnJqtJWCm_2wtJ1Bi1221BC221Bf5221Bc5221B2221Bb1221BQ221BJ221Bd4221Bo4221BA221Bx4221Be5221BN221B5221Bf4221Bw4221BN221Ba1221A221BJ221BQ221BX1221Bf4221Bc4221B4221BI221BC221B3221BX1221BM221Bt4221Bm4221BD221BM221A221Bt4221B-4221BH221Bh4221Be5221BN221B5221BS221BR221Bf4221Ba5221B6221BN221BA221BA221Bf4221BR221A221Be3221Be1221B5221Bf4221Bk5221Bh1221BM221A221BE221Bb5221BY4221BY1221BP221Bf4221Bc4221BU221B6221BF221BL221BK221B5221BA221BD221Br3221BN221BY4221BQ221BJ221Bd4221Bi5221BX1221B4221B3221BU221Bb1221Bc1221BL221BC221B1221Bx4221Bm4221BD221Ba1221Bb5221Bc4221BI221BD221B7221BY1221BB221BQ221Bn5221Be5221Bb1221BK221BB221BI221Bx4221B-4221BE221BX1221BQ221Bd4221BR221A221Ba3221Bw1221A221B3221BC221Bb5221BY4221BY1221BP221Bf4221BY4221Bc1221A221Bb1221B4221BA221B5221B1221Bd4221Bo4221BA221Bx4221BY4221BM221A221Bt4221Be4221BA221BI221BP221B3221BY122");
+replay.text.push("mplex.  Many smaller rooms which once had walls to divide them now lay in disarray.  There is a staircase up here.\n\nThings of interest here:\n- blue coin\n\nThere are 2 exits:\n- up\n- east\n\nWhat do you do?\ntake blue coin\n\n\nTaken.\n\nWhat do you do?\nup\n\n\n== Ruins ==\nThis was long ago a lavish throne room.  Dried-up fountains and crumbling statues line the walls, and the carved stone throne in the center of the room is falling apart.\n\nThings of interest here:\n- shiny coin\n\nThere is 1 exit:\n- down\n\nWhat do you do?\ntake shiny coin\n\n\nTaken.\n\nWhat do you do?\ndown\n\n\n== Ruins ==\nYou find yourself in what was once the living quarters for the complex.  Many smaller rooms which once had walls to divide them now lay in disarray.  There is a staircase up here.\n\nThere are 2 exits:\n- up\n- east\n\nWhat do you do?\neast\n\n\n== Ruins ==\nYou stand in the massive central hall of these ruins.  The walls are crumbling, and vegetation has clearly taken over.  Rooms are attached in all directions.  There is a strange mo");
+replay.keyframes.push([10000, 48337, 9999, [111, 179, 0, 10289, 293, 1528, 10109, 0], [0, 32767, 32767, 0, 32767, 0, 0, 0, 0, 0, 2463, 2488, 2623, 2643, 2488, 2553, 2457]]);
+replay.events.push("1BL221BC221B1221BA221Bf4221BR221A221Be3221Be1221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221Bc5221B2221B3221BX1221BQ221BD221B3221Bf4221Bw4221B4221B1221BE221BF221BF221BI221BC221Bd5221Bo4221BA221Bx4221Be5221BN221B5221Bf4221Bc4221B4221BI221BC221BT221BQ221BZ5221B-4221BH221Bh4221Be5221BN221B5221Bf4221Bm4221BD221BM221A221Bt4221Bk5221BR221BM221BN221Bl4221Bc4221BC221BI221BT221Ba1221BH221BL221BY1221BZ5221Bc5221BD221B6221BA221B1221Bb5221BY4221BQ221BJ221Bd4221Bg5221BD221BE221B3221B4221Bd1221BM221Bt4221Bc5221BC221BN221BL221BQ221B5221BE221Bf4221BR221A221Bo2221Bs2221Bd5221Ba5221BP221B7221B6221BU221Bn3221B_2221A221Bg5221Bz3221BM221BL221B-3221Bz3221BK221BJ221B-3221B1221Bt2221BZ1221BM221BL221B-3221B1221Br2221Bb1221BQ221BP221B-3221Bz3221Bw1221Bv1221Bc1221BC221A221x3eqJdIxfK_Bl_2vtJ11ntJB_1W3KKFX321_1_2JJGY318v3-fKhZBX6ihBbZB2v3fZKijV2xh8ijV1B2221B6221B4221BN221x3sZK7pjV1yh8hjV1BC222x3hZK1sjV2xh8ujV1B7221BC221B1221BN221x3YaK5zjV1yh8tjV1BC222h3paK3WkVxh8akV1B7221Ba1221B2221h3sZK1bkVyh8ZkV1BA222h3vZK5ekVxh8kkV");
+replay.modes.push([10181, "input"]);
+replay.modes.push([10196, "output"]);
+replay.modes.push([10281, "input"]);
+replay.modes.push([10299, "output"]);
+replay.events.push("1BZ1221BS221B2221f3WaKjkVyh8jkV1_3pgKx9r9iKQrh8oK19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12E21n12621X1221n12721n12r421n12a421n12K21n12I21n12V21n12f421n12c421n12O21n12B21n12A21z1sfDqcD8HR2_3e3qeD8_-Qd2m_2v-Q1Be1221B2221BK221Bb5221Bc4221BO221BB221BA221Bx4221Bo4221BK221Bb5221Bw4221BN221B6221B2221Bf4221B-4221BH221Bh4221BY4221BX4221Ba4221BK221BI221BV221Bf4221Bw4221BF221BU221Bb1221BM221Bx3221BR221A221Bo2221Bs2221Bd5221Bm4221BD221Ba1221Bb5221By4221B9221BA221BH221Bf4221Be4221BM221BA221B1221Bb5221B-4221B1221Bx4221B-4221B1221BH221Bf4221Bc5221BJ221B9221B2221Bj3221x3rXRYb5gxQe2l_2w-Q1_3k_Qto5z9ZlAd5s_2pkA19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12E21n12621X1221n12721n12r421n12c421n12O21n12121n12L21n12321n12g121n12X121n12f421n12c421n12O21n12B21n12A21z1mfDycDIHX12x3e3qeDjbRRm_2zaR1Be1221B2221BK221Bb5221Bc4221BO221BB221BA221Bx4221Bo4221BK221Bb5221Bc5221BD221B5221B3221B2221BO221BF221BQ22");
+replay.modes.push([10406, "input"]);
+replay.modes.push([10425, "output"]);
+replay.events.push("1Bn5221Ba5221B5221BC221BD221BJ221B2221B1221Bl3221BN221BY4221BM221B2221B4221B8221B2221Bd5221Bu4221B5221B4221BB221Bf4221BY4221BX4221Be5221BL221BA221BM221Bn5221Ba4221BQ221BG221BL221Bx3221BR221A221Bo2221Bs2221Bd5221Bm4221BD221Ba1221Bb5221Bc5221BR221BY1221BX1221BI221Bx4221Be4221BM221BA221B1221Bb5221B-4221B1221Bx4221B-4221B1221BH221Bf4221Bc5221BJ221B9221B2221Bj3221x3vdRkZ5eWRSl_2-aR1_3obRlo5z9flAd5s_2pkA19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12E21n12621X1221n12721n12r421n12c421n12O21n12621X1221n12521n12L21n12221n12121n12d421n12c421n12O21n12B21n12A21z1kfDycDOHZ12x3e3qeDplRh2m_2zkR1Be1221B2221BK221Bb5221Bc4221BO221BB221BA221Bx4221Bo4221BK221Bb5221Bc5221B7221B3221BF221Ba1221BT221BD221Bc1221Bd5221Bc4221BO221B6221A221B5221BL221B2221B1221Bh3221BR221A221Bo2221Bs2221Bd5221Bm4221BD221Ba1221Bb5221BY4221BX4221Be5221B3221BH221BF221BQ221BD221BA221BD221Bf4221B-4221B1221Bx4221B-4221B1221BH221Bf4221Bc5221BJ221B9221B2221Bj3221x3vnRka5whRi2l_2-kR1_3olR_n5z9hlAd5s_2pkA");
+replay.modes.push([10508, "input"]);
+replay.modes.push([10522, "output"]);
+replay.modes.push([10605, "input"]);
+replay.modes.push([10621, "output"]);
+replay.events.push("19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12E21n12621X1221n12721n12r421n12a521n12P21n12121n12d421n12c421n12O21n12B21n12A21z1ufDycDQHP2x3e3qeDnqRh2m_2vpR1Be1221B2221BK221Bb5221Bc4221BO221BB221BA221Bx4221Bo4221BK221Bb5221Bw4221BN221B6221B2221Bf4221B-4221BH221Bh4221BY4221BX4221Ba5221BP221B1221Bd4221Bw4221BF221BU221Bb1221BM221Bx3221BR221A221Bo2221Bs2221Bd5221Bm4221BD221Ba1221Bb5221Be5221B6221BF221Bz4221Be4221BM221BA221B1221Bb5221B-4221B1221Bx4221B-4221B1221BH221Bf4221Bc5221BJ221B9221B2221Bj3221x3rsRca5imRi2l_2wpR1_3kqRtn5z9XlAd5s_2pkA19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12E21n12621X1221n12721n12r421n12c521n12L21n12221n12A21n12M21n12n521n12c421n12O21n12B21n12A21z1qfDycDGHT2x3e3qeDrgRx1m_2dgR1Be1221B2221BK221Bb5221Bc4221BO221BB221BA221Bx4221Bo4221BK221Bb5221Bc5221B7221B3221BF221B6221BE221BG221Bj5221Bc5221B2221BL221B6221A221Bt4221BY5221B8221BN221BM221BT221Bf4221Bc5221BL221B222");
+replay.modes.push([10815, "input"]);
+replay.modes.push([10829, "output"]);
+replay.modes.push([10901, "input"]);
+replay.modes.push([10914, "output"]);
+replay.events.push("1BA221BM221Br4221BR221A221Bo2221Bs2221Bd5221Bm4221BD221Ba1221Bb5221BY4221BX4221BW5221BL221BI221BC221Bb1221BC221BG221B1221Bx4221B-4221B1221Bx4221B-4221B1221BH221Bf4221Bc5221BJ221B9221B2221Bj3221x3ZjRca5kcRy1l_2egR1_3ygRdo5z9blAd5s_2pkA19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkAe3n12W121n12321n12R21n12f421n12a421n12K21n12I21n12V21n12f421n12c421n12O21n12B21n12A21z1ufDycDKHP2_Bo3_lBxuOXX8j5s_2lW819__V19i1219C219f5219W52197219L21942194219f4219e5219N2195219f421_3a4quOqXUt_I95z-I1BK221BI221BV221Bf4221Bc4221BO221BB221BA221_3x4yrUijPi_Ig16y_I19o4219A219C2199219z4219e5219N2195219f4219u4219D2192219S219D219421982192219d5219-42192219L219I219x4219c5219D2196219A219h4219d221-2XWVXWVxm2PXl219w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12W121n12321n12R21n12f421n12a521n12P21n12121n12d421n12c421n12O21n12B21n12A21z1wfDwcDIHN2_Bo3_lBvuO_W8j5s_2lW815__V19i1219C219f5219W52197219L21942194219f4219e5219N2");
+replay.modes.push([10985, "input"]);
+replay.text.push("nument in the center of the hall with circular slots and unusual symbols.  It reads:\n\n_ + _ * _^2 + _^3 - _ = 399\n\nThere are 4 exits:\n- north\n- south\n- east\n- west\n\nWhat do you do?\nlook blue coin\n\n\nThis coin is made of a blue metal.  It has nine dots on one side.\n\nWhat do you do?\nlook concave coin\n\n\nThis coin is slightly rounded, almost like a tiny bowl.  It has seven dots on one side.\n\nWhat do you do?\nlook corroded coin\n\n\nThis coin is somewhat corroded.  It has a triangle on one side.\n\nWhat do you do?\nlook red coin\n\n\nThis coin is made of a red metal.  It has two dots on one side.\n\nWhat do you do?\nlook shiny coin\n\n\nThis coin is somehow still quite shiny.  It has a pentagon on one side.\n\nWhat do you do?\n# The coins need to be added in the proper order, a helper here, called \"solve_coins\", picks the order\nuse blue coin\n\n\nYou place the blue coin into the leftmost open slot.\n\nWhat do you do?\nuse red coin\n\n\nYou place the red coin into the leftmost open slot.\n\nWhat do you do?\nuse shiny coin\n");
+replay.keyframes.push([11000, 53636, 10999, [25989, 25974, 26006, 0, 110, 14, 0, 0], [0, 32767, 32767, 0, 32767, 32767, 0, 0, 0, 32767, 2463, 2488, 2623, 2643, 2488, 2553, 2457]]);
+replay.modes.push([11000, "output"]);
+replay.modes.push([11073, "input"]);
+replay.modes.push([11090, "output"]);
+replay.events.push("195219f421_3a5quOqWUrqJB5xpJ1BP221B1221Bd4221Bc4221BO221BB221BA221_3x4-rUikPiqJi16wqJ19o4219A219C2199219z4219e5219N2195219f4219u4219D2192219S219D219421982192219d5219-42192219L219I219x4219c5219D2196219A219h4219d221-2XWVXWVxm2PXl219w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12W121n12321n12R21n12f421n12c521n12L21n12221n12A21n12M21n12n521n12c421n12O21n12B21n12A21z1sfDwcDGHR2_Bo3_lBvuOzW8j5s_2lW817__V19i1219C219f5219W52197219L21942194219f4219e5219N2195219f421_3c5quOaXUdhJ75jgJ1BL221B2221BA221BM221Bn5221Bc4221BO221BB221BA221_3x4wrUyjPwgJe16ihJ19o4219A219C2199219z4219e5219N2195219f4219u4219D2192219S219D219421982192219d5219-42192219L219I219x4219c5219D2196219A219h4219d221-2XWVXWVxm2PXl219w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12W121n12321n12R21n12f421n12c421n12O21n12121n12L21n12321n12g121n12X121n12f421n12c421n12O21n12B21n12A21z1ofDwcDKHV2_Bo3_lBvuOXX8j5s_2lW818__V19i1219C219f5219W52");
+replay.modes.push([11165, "input"]);
+replay.modes.push([11183, "output"]);
+replay.events.push("197219L21942194219f4219e5219N2195219f421_3c4quOiXUXcJ35dbJ1BO221B1221BL221B3221Bg1221BX1221Bf4221Bc4221BO221BB221BA221_3x4srUqjPmbJa16ccJ19o4219A219C2199219z4219e5219N2195219f4219u4219D2192219S219D219421982192219d5219-42192219L219I219x4219c5219D2196219A219h4219d221-2XWVXWVxm2PXl219w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12W121n12321n12R21n12f421n12c421n12O21n12621X1221n12521n12L21n12221n12121n12d421n12c421n12O21n12B21n12A21z1mfDwcDOHX12_Bo3_lBvuObX8j5s_2lW816__V19i1219C219f5219W52197219L21942194219f4219e5219N2195219f421_3c4quOyWUZmJ15flJ1BO221B6221A221B5221BL221B2221B1221Bd4221Bc4221BO221BB221BA221_3x4qrUakPmlJY16emJ19o4219A219C2199219z4219e5219N2195219f4219u4219D2192219S219D219421982192219d5219-42192219L219I219x4219c5219D2196219A219h4219d221_2k3pdHpdHg4e2a619a3219b5219o5219J219C219f5219W52197219L21942194219f4219e5219N2195219f4219u4219L219a12192219d5219c4219O219B219A219Z4219N219o5219J219C219f5219m421952197219Y1219Z5219Y4219X4219c42");
+replay.modes.push([11325, "input"]);
+replay.modes.push([11331, "output"]);
+replay.events.push("19I2195219B219G219r4219i4219O21952193219v4219e5219N2195219f4219y4219221962194219N219l4219e4219M2182196219d4219d221-2juDjuDdv2X3br219w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n12221n12621n12421n12N21z1egDwcDQ592l8-t4qeD5F1G_i23v3vq4ghK_5m_2ohK1Bc2221BN221BA221BA221x3iaK7nhKW6l_2nhK4v3jdKshKa4m_2-hK1Bc2221B3221B3221Be1221B3221BR221Bf4221Bo4221BM221Bd5221Bm4221BD221Ba1221Bb5221Ba4221B6221A221BI221Bx4221Bc5221B7221Bz4221Bk5221BZ1221BE221A221Bz3221Bc4221B4221B5221BA221BT221B3221BY1221BT221B1221Bl3221BN221Be5221BN221B2221BK221Bb5221Ba5221B5221A221B3221Bv4221Bm4221BD221BY1221BR221BG221BQ221Bn5221Bc5221BL221BE221BG221B7221Bb5221Bc5221BJ221B3221BE221BA221Bb5221B-4221BH221Bh4221Be4221B2221B3221B3221Bm1221Br4221BR221A221Be3221Be1221B5221Bf4221Bk5221Bh1221BM221A221BE221Bb5221BY4221BY1221BP221Bf4221Bc4221BO221BE221BX1221BQ221BP221B1221Bd4221Bo4221BA221Bx4221Bg4221BE221BL221B2221BQ221B6221BX1221Bc1221BT221Bf4221Bw4221BG221B5221BX1221BM221BE22");
+replay.modes.push([11595, "input"]);
+replay.modes.push([11611, "output"]);
+replay.events.push("1Bb5221BY4221BQ221BJ221Bd4221Be4221B2221B3221BO221B6221BX1221Bc1221BT221B1221Bd4221Bk5221BR221BM221BN221Bl4221BW5221B4221BP221B3221BC221BC221BC221B3221Bb5221Bw4221BF221BU221Bb1221BM221BE221Bb5221BY4221BQ221BJ221Bd4221Bc5221B2221B9221B1221BH221BS221Bf4221x3YfKhAXsKZ4l_2zhK1_3fhKu_Hu_HfiAr4s_2XiA19q4219e12192219A219D219O219b5219-4219H219h4219o4219A219C219T219Q219P219S2192219d5219m42195219Q219P219r2219_221_3fxQZ_HvbDmgAJqm8p42x3-XRJrwQBvm8_fG1BT221BE221BD221BM221B1221B6221B4221BT221BQ221x3vXR2awQCwm8WgG1_3uwQJxv48g5fmBsmAA_1W3KIBd321_1_2JHCe317v3isKXYBd6ihBvXB2v3dlKeuV8xh8euV1B7221BC221B1221BN221x3-lK7luV7yh8duV1_3vrKr9t9cJW1rh8cJ19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12U21n12b121n12K21n12B21n12f421n12e521n12T21n12E21n12D21n12M21n12121n12621n12421n12T21n12Q21z1qfDqcDAPT2_Be3feNYlRxc9x5s_2pc91A019Q219K219B219I219_3219d221-2tuRtuRhe1K_d119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA");
+replay.modes.push([11688, "input"]);
+replay.modes.push([11703, "output"]);
+replay.modes.push([11822, "code"]);
+replay.modes.push([11834, "output"]);
+replay.codes.push([11822, "ipMlgrgDybOZ"]);
+replay.events.push("q1n12W121n12321n12R21n12f421n12e521n12T21n12E21n12D21n12M21n12121n12621n12421n12T21n12Q21z1sfDycDKPR2_3o3zWHvfU_f6W1s_2jf619i1219C219f5219Y42194219Y1219L219Q219f1219c1219T219f4219e5219N2195219f4219e5219T219E219D219M219121962194219T219Q219X52191218219Y2219a3219b5219o5219J219C219f5219c52195219D219I219X1219M219t4219e5219N219K2195219C219R2192219l4219e5219L2198219F219f4219Y4219Q219J219d4219c52195219T21942194219n3219N219o5219J219C219f5219e5219N2192219A2195219r4219o5219J219C219f5219c5219R218219f4219Y4219X4219W5219T219c1218219T219Q2197219x4219o4219A219x4219e5219N2195219f4219c52192219b1219Y12192219f4218218219d2218219i121821821821_3o4ofUmfUeXIn65meI1BE221Bb2221B-1221B9221BM221BL221Bb2221Bg3221Bj1221Bb1221BM221_3_4osMgtMnXIw46xWI18219k3219g2219S219T219Q219Z5219Y4219X4219i42191219a1219j5219w421942193219F219I219C2191219j4219N219o5219J219C219f5219i42196219A219J219d4219o5219J219C21952192219R219E219B219h4219a421912194219G219r4219-42191219x4219c52197219521952199219d4219k4219M2195219C219D219J219d4219Y42");
+replay.text.push("\n\nYou place the shiny coin into the leftmost open slot.\n\nWhat do you do?\nuse concave coin\n\n\nYou place the concave coin into the leftmost open slot.\n\nWhat do you do?\nuse corroded coin\n\n\nYou place the corroded coin into the leftmost open slot.\nAs you place the last coin, you hear a click from the north door.\n\nWhat do you do?\nnorth\n\n\n== Ruins ==\nBecause it has been so well-protected, this room hardly shows signs of decay.  The walls are covered in elaborate murals and decorated with precious metals and stones.\n\nThings of interest here:\n- teleporter\n\nThere is 1 exit:\n- south\n\nWhat do you do?\ntake teleporter\n\n\nTaken.\n\nWhat do you do?\n# The teleporter shows the sixth code in the stars\nuse teleporter\n\n\nYou activate the teleporter!  As you spiral through time and space, you think you see a pattern in the stars...\n\n    ipMlgrgDybOZ\n\nAfter a few moments, you find yourself back on solid ground and a little disoriented.\n\n== Synacor Headquarters ==\nYou stand in the lobby of what appears to be a rea");
+replay.keyframes.push([12000, 58791, 11999, [97, 49, 3, 11338, 255, 1528, 11288, 0], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 0, 2488, 2623, 2643, 2488, 2553, 2488]]);
+replay.events.push("19Q219J219d4219Y4219X4219u42195219M218219F219D219f4219e4219A219K21972196219H2197219I219C219T2191219h3219d221821_Byw4dtMXtMyy5Or_2wX61Guj23v3fs4q_LX5m_2cWM1Bi2221BL221BP221B4221BO221B6221BZ5221Bm2221Bw1221B7221B6221BQ221B8221Bd1221BY1221B4221BT221BQ221B2221x3WvLb1vWMY5l_2bWM4v3pwL-WMq9m_2mXM1Bi1221BC221Bf5221Bc5221B2221Bb1221BQ221BJ221Bd4221Bo4221BA221Bx4221Be5221BN221B5221Bf4221Bu4221B6221BP221A221Bk1221Bn5221B-4221BH221Bh4221Bk5221BT221BD221Bc1221Bd5221BY4221BU221A221BL221B7221BY1221B2221Bb5221Be5221B9221Bz4221Ba4221B6221Bf4221BY4221BX4221Ba5221BP221B7221BM221A221BQ221Bn5221Bi4221BU221BD221Bx4221BW5221B7221BL221B4221B4221Bf4221Be5221B9221Bz4221Bk5221BF221B6221BD221Bp4221B1221A221Bc3221BS221B6221BG221BQ221Bv4221BN221Be5221BN221B5221BQ221BP221Bf4221Be4221BM221BJ221BS221B9221Bj4221Bw4221Bd5221Bc5221BR221A221BG221Bv4221Be5221B9221Bz4221Ba4221B6221Bf4221BY4221BQ221BM221BJ221B1221BH221Bf4221BY4221BY1221B5221BC221BD221BJ221Bd4221BY4221Bc1221Bd5221Be5221BN221B5221Bf4221Bw4221B4221B3221BF221BI22");
+replay.events.push("1BC221Bl4221BN221Bc5221B7221Bz4221Bo5221BJ221BC221Bf5221Bw4221BN221BK221BB221Bf4221BY4221BX4221By4221B2221BA221BT221Bf4221Be5221B9221Bz4221Bc4221B3221BM221A221Bt4221Be5221BN221B5221BG221Bv4221Bu4221BL221Bc1221BT221BQ221Bd4221BR221A221Be3221Be1221B5221Bf4221Ba4221BQ221A221B7221BG221BL221B5221BE221BB221Bh4221Bm4221B5221BQ221BP221Bf4221Bu4221B6221A221B7221BG221Bb5221Bu4221B5221B4221BB221Bf4221Bo4221BM221Bd5221Bw4221B7221B3221B2221BO221Bd5221Bm4221BD221Bg1221BX1221Bf4221Bc5221B7221B3221BF221BU221BN221B2221BA221BD221Bj4221Bo4221BA221BC221BT221BQ221BP221BS221B2221BL221BA221BD221Bj4221Bo4221BA221Bx4221Bo4221BM221Bl4221BN221Be5221BN221BE221BC221BR221B2221Bp3221x3q-LxFvmMp9l_2lXM1_3xWMu_Ho_HpiAr4s_2XiA19q4219e12192219A219D219O219b5219-4219H219h4219o4219A219C219T219Q219P219S2192219d5219m42195219Q219P219r2219_221_3XsQX_HdaDmgAJqm8p42x3oxQLjrQ5vm8taG1Bc1221B3221BJ221BA221BH221BS221A221Bb5221Bc4221B3221BY1221BR221x3rxQ1sqQ6wm8uaG13-G22x3shQNlaQ7vm8vpF1B2221B3221BX1221BQ221BD221B3221Bf4221Ba4221BQ22");
+replay.modes.push([12308, "input"]);
+replay.modes.push([12327, "output"]);
+replay.modes.push([12353, "input"]);
+replay.modes.push([12372, "output"]);
+replay.events.push("1A221B7221x3bhQ2wZQ8wm8wpF1_3oaQNjx4Ig5fmBsmAA_1W3KILd321_1_2JHMe317v3knMxWBd6ihBfWB2v3ngMbkUCxh8bkU1BC221B1221B1221BJ221B9221B2221x3chMBwjUByh8ckU1_3xmMr9t9sHW1rh8sH19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12U21n12b121n12K21n12B21n12f421n12a421n12c121n12321n12J21n12A21n12H21n12S21X1221n12b521n12c421n12321n12Y121n12R21z1kfDwcDK2Z12_Be3feNykRbd9x5s_2pc91B019Q219K219B219I219_3219d221-2tuRtuRhe1K_d119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12E21n12621X1221n12721n12r421n12a421n12c121n12321n12J21n12A21n12H21n12S21X1221n12b521n12c421n12321n12Y121n12R21z1kfDycDQ2Z12x3e3qeDfrQf2m_2nqQ1Be1221B2221BK221Bb5221Ba4221Bc1221B3221BJ221BA221BH221BS221A221Bb5221Bc4221B3221BY1221BR221Bd4221Bm4221BD221Ba1221Bb5221B4221BY5221BC221BL221BP221B4221BO221B6221Bd4221Bg3221BO221B3221Br4221B3221BW5221B4221BH221BA221BC221BT221B1221Bd4221Bo4221BA221Bx4221Ba5221BP221B1221Bd4221B-4221B1221Bx4221B-4221B122");
+replay.modes.push([12456, "input"]);
+replay.modes.push([12474, "output"]);
+replay.modes.push([12500, "input"]);
+replay.modes.push([12518, "output"]);
+replay.events.push("1BH221Bf4221Bc5221BJ221B9221B2221Bj3221x3jtQqb5inQg2l_2oqQ1_3crQdp5z9hlAd5s_2pkA19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12U21n12b121n12K21n12B21n12f421n12c521n12221n12321n12X121n12Q21n12D21n12321n12f421n12a421n12Q21X1221n12721z1mfDycDQBX12_Be3feNwkRhd9x5s_2pc91E019Q219K219B219I219_3219d221-2tuRtuRhe1K_d119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12E21n12621X1221n12721n12r421n12c521n12221n12321n12X121n12Q21n12D21n12321n12f421n12a421n12Q21X1221n12721z1mfDycDOBX12x3e3qeDhaQaY5m_2rZQ1Be1221B5221Bf4221Bc4221BO221BE221BX1221BQ221BZ5221B-4221BH221Bh4221Be5221BN221B2221BK221Bb5221Ba4221BQ221A221B7221Br4221Bc5221B4221Bb1221Ba1221BF221BQ221Bn5221Bc5221B8221BR221BI221BB221BE221Bb5221Bk5221BR221BM221BN221Bl4221Bc4221BO221B5221B6221B6221B2221Bf4221BR221A221Bo2221Bs2221Bd5221Bo4221BK221Bb5221Be5221BL221BM221BF221BD221B1221Bd4221B4221B-1221BX2221Ba2221BW3221BH221B7221B2221Bh4221Bo2221Bg222");
+replay.events.push("1BC221B3221B5221BL221BY1221BZ1221BY1221BL221BC221B1221Bx4221Be5221B9221Bz4221Bo2221Bg2221BC221BT221BQ221BR221BA221B8221BF221BI221BA221BJ221BC221B1221BP221BM221Bt4221BW3221Bm1221BY1221BB221BJ221BB221BW1221BX5221BO221BR221A221Bo2221Bs2221Bd5221Ba5221BP221B7221B6221BU221Bn3221B_2221A221Bm4221Bc1221B3221B4221BI221BC221Bd5221BY4221B6221Ba1221Bf1221BQ221BL221B4221BS221Bb5221Bo4221BA221Bx4221Bo4221BA221BC221BT221BQ221BR221BA221B8221BF221BI221BA221BJ221BC221B1221BP221BM221Bt4221BW5221BF221BY1221BB221BJ221BB221BW1221Bb5221Bm4221BD221Bg1221BX1221Bf4221BW5221B4221B5221BL221BY1221BZ1221B4221B1221Bd4221Bi4221B9221Ba1221BV221BC221BA221BP221Bc1221BL221BA221BD221Bv5221Bi6221B4221BP221B1221BA221BB221BY1221BL221BC221B1221BA221Bb5221BY4221B2221BQ221BC221B1221Bd5221Be5221BN221B5221Bf4221Bi4221BU221BD221BJ221B5221BO221BF221BI221BC221Bb1221BM221BE221Bb5221B-4221BH221Bh4221B-4221BC221B5221BZ5221Bg5221BD221B9221BQ221BX1221BQ221B2221BR221Bd4221B1221A221Bi2221Bo2221B6221BZ5221Bg4221Bc1221Bj1221BO221B6221B7221BD22");
+replay.events.push("1Bn3221BZ2221B-5221BA221BC221BT221BQ221BR221BA221B8221BF221BI221BA221BJ221BC221B1221BP221BM221Bt4221BW5221BF221BY1221BB221BJ221BB221BW1221Bb5221Bc5221BR221A221BG221BC221Bb5221Be5221B9221Bz4221BW5221B4221BP221B1221BA221BB221BY1221Bd5221Be5221BN221BD221Bc1221Bd5221Be5221BN221B5221Bf4221Bg5221BD221B9221BQ221BX1221BQ221B2221BR221Bf4221Bo4221BK221Bj4221BN221BY4221Bc1221Bd5221Bo4221BM221B1221Bb5221Ba5221B5221A221BA221Bl4221BN221BY4221Bj5221Bi6221BA221B5221BP221BE221BQ221Bn5221Bw4221BN221Bc1221BN221B5221BG221BN221Bc1221BL221BB221B3221BM221Bt4221Bc4221BO221B1221BA221B2221B3221B6221BZ1221BY1221Bl4221BN221BY4221BQ221BJ221Bd4221Be5221BN221BD221Bc1221Bd5221BY4221BM221A221Bt4221Bg4221BY1221BX1221BI221BC221B1221Bb5221BY4221BY1221BP221Bf4221Bc4221B3221Be1221B3221BR221B1221Bd4221Ba4221Bk1221Bn5221Be5221BN221B5221Br5221B-5221BA221BC221BT221BQ221BX1221B4221BY1221BL221BC221B1221BA221Bb5221Ba4221B6221BU221B6221BZ1221A221BI221Bx4221Bg4221B8221B3221B2221BO221Bd5221BW5221B1221BN221BG221BB221BU221B1221Bb5221B-422");
+replay.text.push("lly fun place to work!  Sadly, there doesn't seem to be anyone around at the moment, so you make a note to call them later.  The bookshelf here looks like it might have something interesting in it, though.\n\nThings of interest here:\n- business card\n- strange book\n\nThere is 1 exit:\n- outside\n\nWhat do you do?\ntake business card\n\n\nTaken.\n\nWhat do you do?\nlook business card\n\n\nThis business card has \"synacor.com\" printed in red on one side.\n\nWhat do you do?\ntake strange book\n\n\nTaken.\n\nWhat do you do?\nlook strange book\n\n\nThe cover of this book subtly swirls with colors.  It is titled \"A Brief Introduction to Interdimensional Physics\".  It reads:\n\nRecent advances in interdimensional physics have produced fascinating\npredictions about the fundamentals of our universe!  For example,\ninterdimensional physics seems to predict that the universe is, at its root, a\npurely mathematical construct, and that all events are caused by the\ninteractions between eight pockets of energy called \"registers\".\nFur");
+replay.keyframes.push([13000, 64415, 12999, [114, 479, 4, 19877, 2695, 1528, 19397, 0], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 0, 0, 2623, 2643, 0, 2553, 2488]]);
+replay.events.push("1BH221Bh4221Bg4221BI221BH221BQ221BL221Ba1221Bn5221Bc4221B3221BM221A221BD221B1221Bd4221B4221BW5221BP221B4221B4221BK221B2221BT221BQ221B2221BX5221BO221Bd2221Bu3221B-2221B5221B4221BN221B5221BQ221B9221B4221B6221BP221Bn3221BN221Bo4221BM221Bd5221Bc5221BR221A221BG221BC221Bb5221Be5221BN221BD221Bc1221Bd5221Bk5221BT221B2221B6221BD221Bf4221Be5221BN221B5221Bf4221Bu4221B6221BG221BZ1221BQ221BZ5221Ba5221BP221B4221B4221BK221B2221BT221BQ221B2221Bb5221BW5221B4221BH221B8221BN221BY1221BH221B6221BQ221Bn5221Bc4221BO221B1221BC221B3221B5221B5221Bt4221Bw4221BG221BD221BJ221B5221BQ221BH221Br5221Bq6221BN221B2221BA221BD221BO221Bb5221Bu4221B5221B4221BB221Bf4221Bc5221B7221BC221BD221BJ221Bd4221BY4221BQ221BJ221Bd4221Bu4221B5221B3221B2221BO221Bl4221BN221Be5221BN221B5221Bf4221Bm4221B2221B3221B2221B5221BS221B2221Bd5221Ba5221BP221B4221B4221BK221B2221BT221BQ221BZ5221BG221Bu4221BN221B5221Bf4221Bc5221B7221BZ4221Bi3221B3221BM221A221BD221B1221Bd4221B4221Bc4221B8221B3221B2221BO221BN221Bx5221Bm6221BP221B4221B4221BK221B2221BT221BQ22");
+replay.events.push("1B_4221BE221BH221Bo4221BK221Bb5221Bg5221B3221BR221B1221Bd4221Be5221B9221Bz4221Bc4221BO221B1221BC221B3221B5221B5221Bt4221Bo4221BA221BC221BT221BQ221BR221BA221B8221BF221BI221BA221BJ221BC221B1221BP221BM221Bt4221Bg4221BY1221BX1221BI221BC221B1221Bb5221Bc5221B4221BZ1221BA221Bl4221BY4221Ba1221Bb5221Be5221BT221BE221BD221BM221B1221B6221B4221Bb1221Bc1221BL221BC221B1221B_3221Bd2221A221Bk3221BX2221Bm4221BY1221BH221B1221BA221BN221B5221BU221BL221BB221B3221BM221Bt4221Bc5221B4221BZ1221BA221Bl4221Be5221BT221BE221BD221BM221B1221B6221B4221Bb1221Bc1221BL221BC221B1221Bx4221Be4221B2221BY1221BP221BB221B4221Bf4221Bk5221BF221BC221BH221BF221Bd4221By4221BH221A221B1221Bd4221Be5221B9221Bz4221Bm4221BD221Bg1221BX1221Bf4221Bm4221BD221Bg1221BX1221Bf4221Bg4221Bc1221Bj1221B4221BY1221BF221BQ221Bn5221Be5221B6221BF221Bf6221Bq5221B2221BS221B2221BL221BA221BP221Bc1221BL221BC221B1221BA221Bf4221BR221A221B-2221B-1221BH221Bf4221Be4221B2221BS221B2221BL221BA221BP221Bc1221BL221BC221B1221Bx4221Bk5221BF221BC221BH221BF221Bd4221Ba4221B622");
+replay.events.push("1Bf4221Bg5221B3221BR221B1221Bd4221Bk5221BT221B5221BI221Bx4221Be5221BN221B5221Bf4221Bg4221B8221B3221B2221BO221BN221Bl4221Ba5221BP221B4221B4221BK221B2221BT221BQ221BZ5221Bo4221BK221Bb5221BY4221Bc1221Bd5221Bo4221BM221B1221Bn6221Bc6221B7221BA221B9221B8221BG221BF221Bv4221Bg4221BI221BH221BQ221BL221Ba1221Bn5221Bu4221BD221BY1221BX1221BE221Bt4221BQ221BP221Be5221BN221B2221BK221Bb5221Bk5221BF221BC221BH221BF221Bd4221Ba4221B6221Bf4221Be5221BN221B5221Bf4221Be4221B2221B2221B9221Be1221BH221BG221Bd5221B-4221B2221BL221BQ221BX1221Bc1221BL221BC221B1221Bx4221BY4221Ba1221A221B4221BF221B7221BA221BD221Bj4221Be5221BN221B5221Bf4221Bg5221B3221BR221BQ221Bl6221By5221BD221Ba1221Bb5221By4221B2221Bz4221Bk5221Bh1221Bm1221Bn5221Be5221B9221Bz4221Bc4221BO221B1221BC221B3221B5221B5221Bt4221Be5221BN221B5221Bf4221Bg4221B8221B3221B2221BO221BN221Bl4221Ba5221BP221B4221B4221BK221B2221BT221BQ221Bd4221BR221A221Bo2221Bg2221Bx4221Be5221BN221B2221BK221Bb5221Bc5221BJ221BM221B2221Bd1221Bc1221BL221BC221B1221BZ4221BN221Be5221BN221B5221Bf422");
+replay.events.push("1Be5221BT221BE221BD221BM221B1221B6221B4221BT221BQ221Bl6221Bo6221BL221BE221BC221BH221BF221Bd4221Bc5221BR221BI221BJ221Bd4221Be5221BN221B5221Bf4221Bg5221B3221BR221BQ221BZ5221Be5221B9221Bz4221BY4221BX4221BW5221B4221BP221B3221BO221B1221BF221B6221B3221BS221B5221BP221B1221Bd4221Bc5221BZ1221BA221B1221Bf4221Bu4221B6221BN221B3221Bc1221BL221BC221B1221Bx4221BY4221Ba1221Bb5221BY4221BX4221Be4221B2221B2221B9221Be1221BH221BG221Bh4221Bd2221A221Bq4221Be1221B5221Bf4221Bc5221BR221B3221BO221B1221BJ221Bd4221Be4221B2221BS221B2221BL221BA221BP221Bc1221BL221BC221B1221BZ4221BN221Bm4221BE221BG221BZ1221BY1221BX1221BQ221Bh4221BN221Bo4221BK221Bb5221BW5221B4221BP221B1221BA221BB221BY1221BT221B1221Bd4221Be5221B9221Bz4221Ba5221BP221BO221B8221BN221BI221BP221Bf4221BY4221BX4221Bi5221BX1221BQ221BE221Bn5221Bc5221B5221BL221B3221BC221B5221B6221BB221Bn5221Bs5221BI221BH221BQ221BL221Ba1221Bn5221Bu4221BD221BY1221BX1221BE221Bt4221Bo4221BA221Bx4221Be5221BN221B5221Bf4221Bg4221B8221B3221B2221BO221BN221Bl4221Ba5221BP221B4221B4221BK221B222");
+replay.events.push("1BT221BQ221Bd4221BR221A221Be3221Be1221B5221Bf4221Be5221BT221BE221BD221BM221B1221B6221B4221BT221BQ221BZ5221Bw4221BG221B3221B2221Bd5221Be5221Bb1221BK221BB221Bf4221Bk4221BM221BP221B7221Bc1221Bd5221Bc4221B3221BY1221BP221Bf4221Be5221B9221Bf6221Bo5221BO221B1221BF221B6221BI221B9221Bv4221Be5221BN221BD221Bc1221Bd5221Be5221BN221B2221BK221Bb5221Bg4221BI221BH221BQ221BL221Ba1221Bn5221Bu4221BD221BY1221BX1221BE221Bt4221Bo4221BK221Bb5221Bg4221Bc1221Bj1221B4221BY1221BF221BQ221Bn5221Bc4221BO221B6221A221BP221B3221BY1221Bd5221Ba4221B6221B2221BI221B6221BP221Bf4221Be5221BT221BE221BD221BM221B1221B6221B4221BL221BA221BD221Bj4221Bo4221BM221B1221Bb5221Bg5221B3221BR221BQ221BX5221Bj1221B-3221Bw1221Bh4221Bo4221BM221Bd5221Bo4221BK221Bb5221Bg4221BY1221BX1221BI221Bx4221Bc5221BD221B5221B3221B2221BO221BF221BQ221Bn5221B-4221BH221A221Bp3221BN221Be5221BN221B5221Bf4221Bg5221B3221BR221BQ221BZ5221Bk5221BF221BC221BH221BF221Bd4221BG221Bm4221B4221B5221BP221B1221B2221BK221BQ221B_4221BH221BY4221BY1221A221BH221BQ221BX1221Bf4221BY422");
+replay.text.push("thermore, it seems that while the lower registers primarily control mundane\nthings like sound and light, the highest register (the so-called \"eighth\nregister\") is used to control interdimensional events such as teleportation.\n\nA hypothetical such teleportation device would need to have have exactly two\ndestinations.  One destination would be used when the eighth register is at its\nminimum energy level - this would be the default operation assuming the user\nhas no way to control the eighth register.  In this situation, the teleporter\nshould send the user to a preconfigured safe location as a default.\n\nThe second destination, however, is predicted to require a very specific\nenergy level in the eighth register.  The teleporter must take great care to\nconfirm that this energy level is exactly correct before teleporting its user!\nIf it is even slightly off, the user would (probably) arrive at the correct\nlocation, but would briefly experience anomalies in the fabric of reality\nitself - this");
+replay.keyframes.push([14000, 69795, 13999, [115, 1479, 4, 20877, 2695, 1528, 19397, 0], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 0, 0, 2623, 2643, 0, 2553, 2488]]);
+replay.events.push("1Bc1221Bd5221Be5221BN221B5221Bf4221Bc4221BO221B6221A221BP221B3221BY1221Bp6221Ba6221B6221BN221B3221Bc1221BL221BC221B1221BZ4221BN221Ba4221Bc1221B1221Bd5221Bk5221BF221BC221BH221BF221Bd4221Ba4221BW1221BH221B7221B2221BC221BQ221Bn5221Bg4221Bc1221BF221BL221BQ221BH221B7221BI221BL221B4221Bf4221BY4221BQ221B2221B3221BN221BM221B5221B7221BS221Bb5221Bo4221BA221Bx4221Be5221BN221B5221Bf4221Bi4221B9221B2221BW1221BH221BB221Bb4221B-4221BH221Bh4221Ba5221BP221B7221BM221B5221BM221BA221Bz6221B-5221BM221B1221BR221BE221BB221Bh4221BQ221BP221Be5221BN221B2221BK221Bb5221Bo4221BK221Bj4221BN221B-4221BH221Bh4221Bc4221BO221BC221B5221B2221BR221Bn3221BN221By4221B2221BA221Bd5221Ba5221BP221B3221BO221B3221A221BF221BI221BJ221B2221B1221Bh3221BR221A221BY2221Bw2221BM221Bn5221Be5221BT221BE221BD221BM221B1221B6221B4221BT221BQ221BZ5221Bk5221BF221BC221BH221BF221Bd4221By4221BH221A221B1221Bd4221Be5221B9221Bz4221Be5221BT221BS221B2221Bp6221Bq6221BN221B5221Bf4221Bg4221BI221BH221BQ221BL221Ba1221Bn5221Bu4221BD221BY1221BX1221BE221Bt4221Bo422");
+replay.events.push("1BA221Bx4221Be5221BN221B5221Bf4221Bg4221B8221B3221B2221BO221BN221Bl4221Ba5221BP221B4221B4221BK221B2221BT221BQ221BZ5221BY4221BQ221BJ221Bd4221BY4221B2221BQ221B6221B4221Bd5221Be5221BT221BE221BD221BM221B1221B6221B4221Bb1221Bc1221BL221BC221B1221Bx4221Bo4221B5221Bh4221Bo4221BM221Bd5221Bo4221BK221Bb5221By4221B2221BA221Bp6221Bs5221Bc1221Bj1221B4221BY1221BF221BQ221Bn5221Bc4221BO221B6221A221BP221B3221BY1221Bh4221Bd2221A221Bq4221Be1221B2221BK221Bb5221Ba5221BP221BO221B8221BN221BI221BP221B1221Bd4221BW5221B4221BP221B3221BC221BK221BJ221BC221B1221Bx4221Bo4221B8221B6221B7221B5221B7221BS221Bb5221Be5221BN221BD221Bc1221Bd5221Be5221BN221B5221Bf4221Bc4221BO221B1221BF221B6221BI221B9221BN221Bc1221BL221BC221B1221Bx4221Bw4221BF221B3221BA221BD221BQ221B9221BK221BB221Bv4221Bk5221BF221BC221BH221BF221Bd4221Ba4221B6221Bf4221Bi5221BX1221BQ221BE221Bz6221Bo5221BO221B3221B6221BA221B1221Bb1221Bc1221BL221BC221B1221BP221BM221A221BQ221Bn5221Bg4221Bc1221BF221BL221BI221BA221BJ221BQ221BX1221Bj3221BR221A221Bk3221BY1221B2221B6221BD22");
+replay.events.push("1Bf4221Be5221BN221B2221BK221Bb5221Bk5221BF221BC221BH221BF221Bd4221Bu4221B5221B4221BB221BE221BQ221Bn5221By4221B2221BA221Bd5221Ba4221B6221Bf4221BY4221BQ221Bx4221Bo4221BK221A221B4221BV221Bf4221Bi4221BI221B6221BZ5221Bu4221BL221BY1221BL221B3221Bl3221Bb2221Bo6221BV221B3221BM221BD221Bf4221Be5221BT221BE221BD221BM221B1221B6221B4221BT221BQ221B2221Bj4221BN221BY4221BX4221Bm4221BY1221BH221B1221BA221BN221B5221BU221BL221BB221B3221BM221Bt4221Bm4221BD221BQ221BJ221Bj3221Bs3221B5221BE221BF221Bd4221Be5221BT221BE221BD221BM221B1221B6221B4221BT221BQ221BZ5221Bk5221BF221BC221BH221BF221Bd4221Be5221Bb1221BK221BB221Bf4221Ba4221BE221B6221A221B5221BC221B1221BA221Bb5221B-4221BH221Bt5221B-6221Bd1221B7221BY1221B2221Bb5221Be5221B9221Bz4221Bc4221BO221B3221B6221BA221B1221BT221Bf4221Be5221BN221B5221Bf4221Ba5221BP221BS221B4221BH221BG221Bd5221BY4221BQ221BJ221Bd4221Bc4221BO221B1221BF221B6221BI221B9221Bv4221Be5221BN221BD221Bc1221Bd5221Be5221BN221B5221Bf4221Bg4221B8221B3221B2221BO221BN221Bl4221Ba5221BP221B4221B4221BK221B2221BT22");
+replay.events.push("1BQ221BZ5221Bo4221BK221Bb5221Bc4221BO221B6221A221BP221B3221BY1221Bh4221Bd2221A221B-3221Bw1221Bh4221Bo5221BJ221BC221Bf5221Bi4221B6221BA221BJ221Bd4221Bo5221BJ221BC221B5221B2221BR221BE221BB221Bh4221Be5221B3221BX1221BU221A221BL221B1221Bd4221Bo4221BA221Bx4221BY4221BQ221Bx4221BY4221BM221BG221BT221BQ221B7221BP221Bc1221BT221Bf4221Be4221BA221B8221BF221BI221BA221BJ221BC221B1221Bx4221Bk5221BR221BM221BN221Bl4221By4221B2221BA221BN221B2221BA221BD221Bj4221Ba4221Bc1221B1221Bd5221BY4221Bj5221By5221BD221BQ221BJ221Bj3221Bs3221B5221BE221BF221Bd4221Be5221BT221BE221BD221BM221B1221B6221B4221BT221BQ221Bh4221BN221Bo5221BJ221BC221Bf5221Bk5221BR221B6221A221Bt4221By4221BH221A221B1221Bd4221Be5221B9221Bz4221Bg4221Bc1221B7221B3221BX1221B4221BY1221Bd5221Be5221BN221B5221Bf4221Bc4221BO221B1221BF221B6221BI221B9221BN221Bc1221BL221BC221B1221Bx4221BY4221BM221B9221BG221B6221BH221BM221BN221BA221BX4221BZ2221Bm6221BP221B8221B8221B6221B7221BD221BG221BF221BI221BC221Bd5221Bo4221BM221Bd5221B-4221B1221Bx4221Bw4221B4221B6221BP221Bf422");
+replay.events.push("1BW5221B1221BG221BZ1221BQ221BN221BU221BH221Bt4221Bm4221BD221BY1221BR221Bc1221Bh1221BY1221BP221Bn3221BN221BY4221BQ221BJ221Bd4221B-4221B2221B8221BL221B8221B7221BY1221Bf1221Bf4221Bo4221BM221Bh4221BR221A221Be3221Be1221B2221BK221Bb5221Bc5221BL221BE221BC221BH221BF221Bl3221BN221BY4221Bc1221Bd5221Be5221BN221B5221Br5221Bu6221BX1221BQ221BE221Bn5221Bu4221BD221B7221Ba1221B2221Bl4221BN221BY4221BM221A221B6221BG221Bj5221Bo5221BJ221BC221Bf5221Be5221B9221Bz4221Be4221B2221BU221BT221BQ221B9221B7221BA221BH221Bf4221Be5221BN221B5221Bf4221Bi5221Bf1221BM221BI221BV221Bf4221B-4221BH221Bh4221Be5221BN221B5221Bf4221Bg4221B8221B3221B2221BO221BN221Bl4221Ba5221BP221B4221B4221BK221B2221BT221BQ221BZ5221Bk5221BT221B2221BB221BA221Bl4221Bk5221BF221BC221BH221BF221Bp5221By5221BD221Bg1221BX1221Bf4221Ba4221B6221A221BI221Bx4221BY4221B4221A221B4221BM221B8221BT221B1221Bd4221Ba4221Bk1221Bn5221Be5221BN221B5221Bf4221Be5221BT221BE221BD221BM221B1221B6221B4221BT221BQ221Br4221Bu4221Bb5221Bc4221BO221B1221BF221B6221BI221B9221BN221Bc1221BL22");
+replay.text.push(" is, of course, not recommended.  Any teleporter would need to test\nthe energy level in the eighth register and abort teleportation if it is not\nexactly correct.\n\nThis required precision implies that the confirmation mechanism would be very\ncomputationally expensive.  While this would likely not be an issue for large-\nscale teleporters, a hypothetical hand-held teleporter would take billions of\nyears to compute the result and confirm that the eighth register is correct.\n\nIf you find yourself trapped in an alternate dimension with nothing but a\nhand-held teleporter, you will need to extract the confirmation algorithm,\nreimplement it on more powerful hardware, and optimize it.  This should, at the\nvery least, allow you to determine the value of the eighth register which would\nhave been accepted by the teleporter's confirmation mechanism.\n\nThen, set the eighth register to this value, activate the teleporter, and\nbypass the confirmation mechanism.  If the eighth register is set correctly, ");
+replay.keyframes.push([15000, 75153, 14999, [32, 2479, 4, 21877, 2695, 1528, 19397, 0], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 0, 0, 2623, 2643, 0, 2553, 2488]]);
+replay.events.push("1BC221B1221Bx4221Bw4221BF221B3221BA221BD221BQ221B9221BK221BB221Bz3221Bd2221A221Bq4221Be1221B5221BI221BZ4221BN221Bc5221BR221BU221Bd5221Be5221BN221B5221Bf4221Bg4221B8221B3221B2221BO221BN221Bl4221Ba5221BP221B4221B4221BK221B2221BT221BQ221BZ5221Be5221B9221Bz4221Be5221BN221B2221BK221Bb5221Bi5221Bf1221BM221BI221BV221Bn3221BN221BY4221B4221BY1221BL221BQ221Bf1221Bc1221BT221Bf4221Be5221BN221B5221Bf4221Be5221BT221BE221BD221BM221B1221B6221B4221BT221BQ221Bh4221BN221BY4221BQ221BJ221Bp5221Bm5221Bk1221BH221BT221Ba1221A221Bb5221Be5221BN221B5221Bf4221Bc4221BO221B1221BF221B6221BI221B9221BN221Bc1221BL221BC221B1221Bx4221Bw4221BF221B3221BA221BD221BQ221B9221BK221BB221Bz3221BR221A221Bo2221Bw1221Bh4221Be5221BN221B5221Bf4221Bg4221B8221B3221B2221BO221BN221Bl4221Ba5221BP221B4221B4221BK221B2221BT221BQ221BZ5221Bo4221BK221Bb5221Bc5221BR221BU221Bd5221Bc4221BO221B6221A221BP221B3221BY1221BF221BQ221Bv4221BN221By4221B2221Bf6221Bk5221BQ221B2221B3221BN221BM221B5221B7221BS221Bb5221Bc5221BL221BE221BC221BH221BF221Bd4221Ba4221B622");
+replay.events.push("1Bf4221Bg4221Bc1221BF221BL221BQ221BH221B7221BI221BL221B4221B1221Bl3221BN221Ba4221Bc1221B1221Bd5221Ba4221B6221Ba1221Bh1221BY1221BP221Bf4221BQ221BP221Bo4221B5221Bh4221Bo4221BM221Bd5221Bo4221BK221Bb5221Bc5221BR221BU221Bd5221Bo4221BA221BL221BO221B6221A221BP221B3221BY1221BF221BQ221Bv4221BN221Be5221BN221B5221Br5221Be6221B2221BG221Bp4221Bg3221Bk1221BH221BT221Ba1221A221BR221B1221Bd4221Bc4221BO221B1221BF221B6221BI221B9221BN221Bc1221BL221BC221B1221Bx4221Bw4221BF221B3221BA221BD221BQ221B9221BK221BB221Bv4221Bk5221BR221B6221A221Bt4221By4221B2221BA221Bd5221BW5221B4221B5221BA221BT221B3221BY1221Bd5221Bo5221BJ221BC221Bd5221Bj1221A221Bg4221Bk1221Bh4221Bc4221BO221BC221B5221B2221BR221Bn3221BN221Bc5221BJ221BA221BL221B4221Bf4221Be5221BT221BE221BD221BM221B1221B6221B4221Bb1221Bc1221BL221BC221B1221Bx4221Bo4221BK221Bb5221Bo4221B8221B6221B1221B8221A221BJ221BD221BK221BD221Bn3221BN221Be5221BN221B2221BK221Bb5221Bo4221BK221Bb5221BY4221BM221A221Bt4221Be5221B9221BA221Bb1221BM221A221BQ221Bn5221Ba5221BH221B9221BA221BB221Ba122");
+replay.modes.push([15399, "input"]);
+replay.modes.push([15421, "output"]);
+replay.modes.push([15981, "input"]);
+replay.text.push("no\nanomalies should be experienced, but beware - if it is set incorrectly, the\nnow-bypassed confirmation mechanism will not protect you!\n\nOf course, since teleportation is impossible, this is all totally ridiculous.\n\nWhat do you do?\n# The book mentions needing to set the 8th register to a value and run a long running confirmation process.\n# After a bit of debugging, that process is located here:\n! decompile 6027 6067\n> Decompiling from 6027 to 6067:\n>  6027: jt   [0] 6035\n>  6030: add  [0] [1] 1\n>  6034: ret \n>  6035: jt   [1] 6048\n>  6038: add  [0] [0] 32767\n>  6042: set  [1] [7]\n>  6045: call 6027\n>  6047: ret \n>  6048: push [0]\n>  6050: add  [1] [1] 32767\n>  6054: call 6027\n>  6056: set  [1] [0]\n>  6059: pop  [0]\n>  6061: add  [0] [0] 32767\n>  6065: call 6027\n>  6067: ret \n# \"energy_level\" in this project is an implementation of this, showing which value of the eigth register will result in a correct value.  Here it's being set with a backdoor to set the register\n! set_register 8 25");
+replay.keyframes.push([16000, 76441, 15233, [25975, 25974, 26006, 0, 101, 0, 0, 0], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 0, 0, 2623, 2643, 0, 2553, 2488]]);
+replay.modes.push([16004, "output"]);
+replay.modes.push([16096, "input"]);
+replay.modes.push([16109, "output"]);
+replay.modes.push([16237, "input"]);
+replay.modes.push([16250, "output"]);
+replay.modes.push([16303, "input"]);
+replay.modes.push([16318, "output"]);
+replay.events.push("1BH221B6221BC221B3221Bf4221x3ncQ-1WyKZY5l_2sZQ1_3gaQ_p5z9flAd5s_2pkA19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkAZOW4ptDi9n12W121n12321n12R21n12f421n12e521n12T21n12E21n12D21n12M21n12121n12621n12421n12T21n12Q21z1sfDycDOPR2_3Y2WtBxn1zr7e4s_2dr719X2219c521922193219X1219Q219D2193219n3219N219g4219E219D2193219Y12193219521912199219B219b4219i5219D219B219B2194219f4219o4219K219b5219W521942195219921992193219Y1219T2191219d4219o4219A219C2199219z4219o5219J219C2195219Z5219w42197219A219J219p2219_2218219i12182194219c3219o1219E21932194219d1219M219t4219c5219R219U218219L219A219D219j4219e42192219U219T2193219Y1219T2191219b42191218219c3219Y2219b1219Y12194219L219A219D219j4219c4219O2191219F2196219I2199219N219c1219L219C2191219x4219W521942195219N2194219S218219Z52191218219g2219y22192219L2198219N219c1219T2191219d4219e5219L2198219F219f4219e52199219z4219c4219O219321962197219D219U219L219C2191219d3219p1219Y1219X1219a4219E21962182195219C2191219x4219o5219d12197219Y121922");
+replay.events.push("19f4219N219l121821_2-4omHomH4o3qA19i1219C219f5219k5219h1219K219B219f4219g52199219_4219-42191219x4219Y4219X4219c5219Z1219Q219J219g1219n5219a4219621972194219A219l4219k5219R219M219N219l4219Y4219X4219c5219D219521932192219O219d5219m421952197219621952194219A2195219j3219R218219e3219e12195219f4219u4219L219a12192219d5219e5219N2192219A219D219j4219o5219J219C219f5219a5219P219G219F219G219L2196219Q219Z5219o4219K219b5219Y42194219Y1219L219Q219f1219c1219L219A219D219j4219e5219N219D219c1219d5219e5219T219E219D219M219121962194219T219Q219d4218218219R219a4219c12191219d5219y42192219G219j5219o5219J219C219f5219c42193219Q219j4219w4219d5219i42196219A219J219d4219o4219M219d5219Y4219Q219M2193219T2195219Q219P219f4219o4219A219x4219o5219J219C2195219Z5219W5219T2194219G219v3219R218219c3219u12193219F219K2191219H219f4219c5219R218219G219C219b5219e52199219z4219m4219D219g1219X1219f4219e4219S219X1219i1219H219x4219Y4219X4219w4219F219S218219Z1219C2193219f4219o4219A219x4219e5219N2195219f4219c5219Z1219Q219J219d4219m42195219Q219P219r22");
+replay.modes.push([16715, "code"]);
+replay.modes.push([16727, "output"]);
+replay.codes.push([16715, "SlpnGuEnfhcE"]);
+replay.events.push("19_2218219i121821821821_3c3z-F_-FqxIhD5sfJ1Bo1221B8221B3221Bj2221By2221B_2221Bo2221BF221B4221B9221Bx1221_3r3lYLtXLzxIy86dxI18219-3219s2219d5219a4219621942194219A219A219b5219e52199219z4219a5219X1219G219A219_3219R218219e3219e12195219f4219w4219F219S218219Z1219C2193219f4219k5219h1219a1219L2195219S219b5219Y4219i1219h1219m1219r4219R218219o3219i1219C219f5219e5219b1219K219B219f4219Y4219X4219e42192218219M219_4219a4219W1219P2197219c1219N219l4219Y4219Q219J219d4219i42191218219E219t4219i42196219I21992191219Q219n5219k4219M2195219C219D219J21922191219d4219o4219A219x4219a5219P2197219M2195219M219A219n5219Y4219a1219b5219e5219N2195219f4219g4219221821912193219Y12191219b5219-4219H219h4219e5219N2195219f4219e5219T219E219D219M219121962194219b1219c1219L219C2191219x4219k5219Z12197219Y1219Z5219-4219H218219l3219d221821_Bmx4wXLWYLcp6f3r_2cy62A__VGYk23v3_t4gyM_5m_2yyM1Bc2221B7221B4221BA221x3isM7nyMW6l_2xyM4v3ptMsyMg4m_2ezM1Be1221B2221BK221Bb5221Bo4221BK221Bb5221BY4221BX4221Bc5221BZ1221BQ221BJ221Bg1221Bn5221Ba4221B622");
+replay.text.push("734\n> Register #8 set to 25734\n# Disable the jump to the confirmation process, it takes forever\n! no_op 5489\n> Set 2 values starting at 5489 to noop\n# And the invert the logic of this jump, thus continuing as if the confirmation worked.\n! op 5495 jt\n> Set 5495 to jt\n# This will reveal the seventh code\nuse teleporter\n\n\nA strange, electronic voice is projected into your mind:\n\n  \"Unusual setting detected!  Starting confirmation process!  Estimated time to completion: 1 billion years.\"\n\nYou wake up on a sandy beach with a slight headache.  The last thing you remember is activating that teleporter... but now you can't find it anywhere in your pack.  Someone seems to have drawn a message in the sand here:\n\n    SlpnGuEnfhcE\n\nIt begins to rain.  The message washes away.  You take a deep breath and feel firmly grounded in reality as the effects of the teleportation wear off.\n\n== Beach ==\nThis is a sandy beach in a cove on some tropical island.  It is raining.  The ocean is to your south, and h");
+replay.keyframes.push([17000, 79766, 16999, [104, 106, 3, 11839, 170, 1528, 11732, 25734], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 32767, 0, 2623, 2643, 0, 2553, 2498]]);
+replay.events.push("1B7221B4221BA221Bl4221Bo4221BA221Bx4221BY4221BX4221Bc4221BO221BE221BX1221Bf4221B-4221B1221Bx4221Bc5221B7221B3221BF221Bf4221Be5221B3221B5221B2221BD221BB221B3221BM221Bt4221Bo4221BK221BD221BL221BQ221BJ221Bh3221BR221A221Bo2221Bs2221Bd5221Bo4221BK221Bb5221Ba5221BX1221BG221BA221B9221BA221BD221Bn3221BR221A221Be3221Be1221B5221Bf4221B-4221BN221B4221B7221BQ221Bx4221Bo4221BK221Bb5221Be5221B9221Bz4221Bo5221BJ221BC221B5221BZ5221Bc5221B7221BC221B1221BN221Bt3221BN221BY4221BQ221BJ221Bd4221Bm4221B5221B7221Bg1221B6221Bn5221Bi4221BI221B5221B5221BF221BC221B3221Bf4221Bo4221BK221Bb5221Be5221B9221Bz4221Bo5221BJ221BC221B5221BZ5221By4221B2221B6221B4221BN221Bv2221Br1221Be5221BN221B5221Bf4221Ba4221B6221B7221B4221BA221Bl4221Bg4221Bc1221B7221BT221BI221BJ221BU221Bb5221Bk5221BZ1221BS221B2221Bd5221BY4221BQ221BJ221Bd4221Bg4221B7221Ba1221B2221Bh4221x3iwMnAddNf4l_2dzM15XzM5B_1W3KKPZ321_1_2JJQa318v3udNhWBZ6ihBv_A2v3lWNduT2xh8duT1BZ1221BS221B2221x3sWN5YuT1yh8euT1BA222x3zXN1_tT2xh8ztT1B7221Ba1221B2221x3WXN3wtT1yh8-tT1BA222x3rXN3ttT4xh8ptT");
+replay.modes.push([17123, "input"]);
+replay.modes.push([17129, "output"]);
+replay.events.push("1B2221B6221B4221BN221x3YYN3mtT3yh8qtT1_3zdNv9r9YHSrh8cH19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n12221n12621n12421n12N21z1egDwcDK592l8Yx4qeD591Gnk23v3vt4kgOh5m_2sgO1By1221B5221B2221BD221BB221B3221BM221Bt4221Bo2221Bq2221BD221BL221BQ221BJ221x3kaORfhOi5l_2rgO4v3jbOkhOY6m_2shO1Be1221B5221Bf4221Bu4221BL221BY1221BL221B3221Bf4221Be5221B3221BP221A221BS221Bb5221Bm4221B5221BQ221BP221Bf4221Bc5221BR221A221BG221Bv4221Be5221B9221Bz4221Ba4221B6221Bf4221BW5221B4221B5221BA221BT221B3221BY1221BL221BA221BD221Bj4221Bo5221BJ221BC221Bf5221Bi4221BO221B5221B3221Bv4221Be5221BN221B5221Bf4221Ba5221BX1221BG221BA221B_3221BR221A221BY2221Ba3221Bb5221Bo5221BJ221BC221Bf5221BW5221BA221B3221BL221Bl4221Be5221BN221BK221B5221BC221BR221B2221Bl4221Be5221BN221B5221Bf4221Bg5221BD221BJ221B2221BQ221BL221BM221B5221BG221B5221BN221Bt3221BN221Bo5221BJ221BC221Bf5221Bc4221B3221BQ221Bx4221Bm4221B5221B7221BY1221BZ5221Ba4221BE221BI221BR221BU221Bb5221Bc4221BA221B2221BI221B3221BD22");
+replay.modes.push([17412, "input"]);
+replay.modes.push([17418, "output"]);
+replay.events.push("1BA221BD221Bj4221B-4221BE221BX1221BQ221BJ221B5221B7221B6221Bh3221BR221A221Be3221Be1221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221Bc5221B2221BT221A221BM221B_4221Ba5221B5221BN221BG221Br4221Bi4221B9221B4221B4221Bf4221Be5221B9221Bz4221Bo5221BJ221BC221B5221BZ5221Bk5221BZ1221BS221B2221Bd5221Ba4221BK221B6221BN221BG221B3221BA221BD221Bj4221Bo5221BJ221BC221B5221BZ5221BW5221BT221Bc1221BN221Bp3221x3weOfCttOX6l_2rhO11lhOB_1W3KKFZ321_1_2JJGa318v3-tOv-AZ6ihBn-A2v3dnOffS4xh8ffS1B2221B6221B4221BN221x3qnO7YfS3yh8gfS1BC222x3fnO1_eS4xh8zeS1B7221BC221B1221BN221x3WoO5ueS3yh8-eS1BC222x3noO3reS2xh8neS1B7221Ba1221B2221x3qnO1meS1yh8oeS1_3duOv9r9wFSrh8-F19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n12221n12621n12421n12N21z1egDqcDA592Z8sx4qeD1Gxk23v3ju4sYPh5m_2-YP1By1221B5221B2221BD221BB221B3221BM221Bt4221Bo2221Bq2221BD221BL221BQ221BJ221x3syORnZPi5l_2zYP4v3rzOsZPY8m_2-ZP1Be1221B5221Bf4221Bg4221BG221BL221B1221BQ221B5221B4221BF221BI221BC221Bd5221B-422");
+replay.events.push("1BH221Bh4221Be5221BN221B5221Bf4221Bc4221BO221BE221BX1221Bf4221Bc4221BO221B3221BF221Bf4221Be5221B9221BJ221B4221B2221B5221BQ221BZ5221Bm4221B5221BQ221BP221Bf4221Be5221B9221Bz4221Bo5221BJ221BC221B5221BZ5221Bg4221B7221Ba1221B2221Bd5221BY4221BQ221BJ221Bd4221Bk5221BZ1221BS221B2221Bh4221BR221A221Ba2221Bc2221BU221B6221BZ1221A221BI221Bx4221Be5221BN221B5221BS221BR221Bf4221Be5221Bb1221BM221A221Bt4221Ba5221B5221BN221BG221Br4221Bi4221B9221B4221B4221BS221Bj4221BN221Be5221BN221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221By4221BP221BY1221A221B5221BG221Br4221BN221B-4221BE221BX1221BQ221BL221BM221B5221BG221BH221Bx4221BW5221BT221Bc1221BN221Bl4221Bu4221BD221B7221B6221BA221BA221BD221Bj4221By4221B2221B6221B4221BN221Bp3221BR221A221Bo3221Bi1221BC221Bf5221Bm4221B5221B7221BY1221BZ5221Bk5221Bh1221Bg1221BX1221BS221Bb5221Bu4221BL221BU221A221BD221BA221BD221Bj4221Bg5221B9221B_4221B-4221B1221Bx4221BY4221BX4221Ba4221B6221B7221B4221BA221Bl4221Be5221BN221BK221B5221BC221BR221B2221Bl4221Be5221BN221B5221Bf4221Be4221B222");
+replay.modes.push([17726, "input"]);
+replay.modes.push([17732, "output"]);
+replay.events.push("1BI221BA221BR221Bf4221Bi5221BX1221B4221B3221BU221Bb1221Bc1221BL221BC221B1221Bx4221Be5221B9221Bz4221Bo5221BJ221BC221B5221BZ5221Bc5221B7221BC221B1221BN221Bp3221x3YXPfE_nPX8l_2zZP11vZPB_1W3KKDb321_1_2JJEc318v3eoPvzAb6ihBnzA2v3lhPXmR6xh8XmR1B2221B6221B4221BN221x3yhP7wlR5yh8YmR1BC222x3nhP1tlR6xh8rlR1B7221BC221B1221BN221x3eiP5mlR5yh8slR1_3ZoPt9r9yEUrh8-E19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n12221n12621n12421n12N21z1egDqcDA592Z8Wy4qeD1GWl23v3tu4yoPh5m_2apP1By1221B5221B2221BD221BB221B3221BM221Bt4221Bo2221Bq2221BD221BL221BQ221BJ221x3yiPRtpPi5l_2ZpP4v3njPypPmBm_2aqP1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221B-4221B1221Bx4221BY4221BX4221By4221BP221BY1221A221B5221BG221Bj5221BW5221BT221Bc1221BN221Bl4221Ba4221B6221BU221B6221BZ1221A221BI221Bx4221Be5221B6221BF221Bz4221Bc5221B2221BT221A221BM221B_4221Ba5221B5221BN221BG221Br4221Bi4221B9221B4221B4221BS221Bb5221Bk5221BT221B2221BB221BA221Bl4221Bu4221B6221A221B7221Br4221Bu4221B5221B4221BB221Bf422");
+replay.text.push("eavy foliage is to your north; the beach extends west and east.\n\nThere are 3 exits:\n- west\n- east\n- north\n\nWhat do you do?\nnorth\n\n\n== Tropical Island ==\nThe large trees here seem to be protecting you from the rain.  As you push through the undergrowth, you can hear birds chirping overhead.  There is a steep rock face to your west blocking your path.\n\nThere are 3 exits:\n- north\n- south\n- east\n\nWhat do you do?\nnorth\n\n\n== Tropical Island ==\nThe embankment of the cove come toegher here to your east and west.  Between these tall rock faces, there is a narrow, overgrown path leading north.  You hear waves lapping up on a beach through the dense vegetation to your south.\n\nThere are 2 exits:\n- north\n- south\n\nWhat do you do?\nnorth\n\n\n== Tropical Island ==\nYou are on a narrow path between two steep rock faces which look like they have been here for thousands of years.  Rain trickles down through the vegetation and moss, and through the leaves you can occasionally see a sliver of light hundreds of");
+replay.keyframes.push([18000, 85245, 17999, [102, 243, 0, 13366, 285, 1528, 13122, 25734], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 32767, 0, 2623, 2643, 0, 2553, 2528]]);
+replay.events.push("1Be5221BN221B5221Be1221Bn5221Bm4221BD221Bg1221BX1221Bf4221Ba4221B6221A221BI221Bx4221Bm4221B5221BQ221BP221Bf4221Bi4221BI221B6221BZ5221Be5221BN221BE221BC221B3221BZ1221BQ221BJ221BU221Bb5221B-4221BH221Bh4221Bo5221Bd1221B7221BY1221B2221Bf4221BR221A221Ba3221BU221BG221BA221Bx4221Be5221B3221BH221BB221BG221B2221BD221BS221Bb5221Be4221BM221BG221BH221Bx4221Be5221BN221BK221B5221BC221BR221B2221Bl4221Be5221BN221B5221Bf4221Bi5221BX1221B4221B3221BU221Bb1221Bc1221BL221BC221B1221Bx4221BY4221BQ221BJ221Bd4221Bw4221B4221B8221A221Bj4221BN221BY4221BQ221BJ221Bd4221Be5221BN221BK221B5221BC221BR221B2221Bl4221Be5221BN221B5221Bf4221Bu4221BD221B7221Bg1221BX1221BS221Bb5221Bo5221BJ221BC221Bf5221Bc4221B3221BQ221Bx4221B-4221BN221A221B3221Ba1221BJ221BC221B1221BP221BM221A221BQ221Bn5221Bc5221BR221A221Bf4221BY4221BX4221Bc5221BD221B5221BQ221BX1221BQ221BZ5221B-4221BH221Bh4221Bu4221B5221B3221B2221BO221Bd5221Bm4221BQ221BD221BJ221BS221BP221B1221BU221Bb5221B-4221BH221Bh4221Bi4221B1221A221BU221Bd5221BY4221B2221BQ221BE221BX1221Bf422");
+replay.modes.push([18095, "input"]);
+replay.modes.push([18101, "output"]);
+replay.events.push("1Bo5221BJ221BC221Bf5221Bk5221BT221B5221BQ221BP221Bf4221Be5221BN221B5221Bf4221Ba5221B5221BN221BG221Br4221Bk5221Bh1221BM221A221BE221Bb5221Bg4221BI221BJ221Bh3221x3enPtHpbQlBl_2ZqP11_pPB_1W3KKDb321_1_2JJEc318v3ybQjzAb6ihBbzA2v3Z_PvyQ6xh8vyQ1B2221B6221B4221BN221x3m_P7oyQ5yh8wyQ1BC222x3b_P1lyQ6xh8jyQ1B7221BC221B1221BN221x3y_P5eyQ5yh8kyQ1_3tbQt9r9mEUrh8oE19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n12221n12621n12421n12N21z1egDqcDA592Z8gy4qeD1Gbl23v3Xv4mcQh5m_2ucQ1By1221B5221B2221BD221BB221B3221BM221Bt4221Bo2221Bq2221BD221BL221BQ221BJ221x3mWQRhdQi5l_2tcQ4v3lXQmdQW9m_2udQ1Be1221B5221Bf4221By4221BP221BY1221A221B5221BG221Bj5221BW5221BT221Bc1221BN221Bl4221Bc5221BD221B6221B2221BL221BS221Bb5221Be4221BM221BG221BH221BI221Bh1221BY1221BR221Bd4221Be5221B9221Bz4221Be5221BN221B5221Bf4221By4221B2221B6221B4221BN221Bl4221BY4221BQ221BJ221Bd4221Bu4221BD221B7221B6221BU221Bb5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bw4221B4221BC221B1221BN221Bl4221B-422");
+replay.events.push("1BH221Bh4221BY4221BX4221Bc5221BB221BN221BM221A221Bt4221Bc4221B3221Bg1221BX1221Bj3221BR221A221BY2221BX2221Bc5221BJ221B3221BE221Bx4221By4221BH221B7221BY1221BV221Bk1221Bn5221Ba5221BP221B7221B6221BU221Bb5221B4221Ba3221By1221BP221B7221Ba1221B4221B5221BP221Bf4221Bi3221BM221Be1221BH221BG221Bd5221BY2221Ba2221A221B4221BS221A221BX5221BK221BN221Ba4221Bc1221B1221Bd5221Be4221BA221B5221A221B1221BQ221BP221BI221BC221Bd5221Bm4221BD221BQ221BJ221Bc1221B9221BH221BM221BL221BA221BD221Bj4221Bm4221BD221Ba1221Bb5221Bc4221BU221B5221B8221A221BR221B1221Bd4221Be5221BN221B2221BK221Bb5221B-4221BC221B1221Bd5221BY4221BQ221BJ221Bd4221Bk5221B9221BH221BM221A221BT221BI221Bx4221B4221Bq2221Bg1221BG221BI221BZ5221B-4221BH221Bh4221Bm2221Bk2221B6221A221BH221BD221BK221BD221Bf4221Bw2221Ba2221B1221BA221B2221BT221BQ221BX5221B1221A221BY2221Bs2221A221Bt4221By4221B2221B1221BX4221Bc4221BD221BI221BX1221Bc1221BT221BS221Bb5221Bs4221BB221A221BM221B_4221B-4221BC221B1221Bb5221B2221BO221x3yaQdFtsQ_8l_2tdQ11pdQB_1W3KKDb321_1_2JJEc318v3WtQXzAb6ihBvyA");
+replay.modes.push([18424, "input"]);
+replay.modes.push([18430, "output"]);
+replay.events.push("2v3dmQXiQ6xh8XiQ1B2221B6221B4221BN221x3qmQ7whQ5yh8YiQ1BC222x3fmQ1thQ6xh8rhQ1B7221BC221B1221BN221x3WnQ5mhQ5yh8shQ1_3xsQt9r9aEUrh8cE19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n12221n12621n12421n12N21z1egDqcDA592Z8qy4qeD1Ggl23v3hv4qtQl5m_2ytQ1By1221B5221B2221BD221BB221B3221BM221Bt4221Bc2221By1221Bg1221BX1221x3onQNhuQm5l_2xtQ4v3foQmuQk7m_2uuQ1Bi1221BC221Bf5221Bc5221B2221Bb1221BQ221BJ221Bd4221BY4221Bc1221Bd5221Be5221BN221B5221Bf4221Bg4221BI221BC221B3221BX1221BQ221BL221B4221Bf4221Be5221B9221Bz4221BY4221BX4221By4221BP221Bc1221B2221B5221BX1221BM221Bt4221Bc4221B3221Bg1221BX1221Bf4221Bk5221BT221B2221BB221BA221Bl4221Bu4221B6221A221B7221BG221Bb5221Bu4221B5221B4221BB221Bf4221Bo4221BM221Bd5221Bm4221BD221Ba1221B9221Bj4221Bw4221Bd5221Ba4221B6221A221BI221Bx4221Bi5221BP221BK221BJ221BM221BT221B1221Bd4221Bo4221BA221Bx4221BY5221B8221BN221BM221BT221Bf4221Bc5221B7221B3221BF221Bf4221Be5221BL221B8221BF221Bj3221BR221A221Bu2221Bw1221B3221B2221BO221Bd522");
+replay.modes.push([18726, "input"]);
+replay.modes.push([18732, "output"]);
+replay.events.push("1BW5221B1221BC221B5221B2221Bb5221Bo4221BA221Bx4221Be5221BN221BK221B5221BC221BR221B2221Bl4221Be5221BN221B5221Bf4221B-4221B2221BL221BI221B9221BA221BD221Bj4221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bc5221B7221BC221B1221BN221Bt3221BN221Bk5221BT221B2221B6221BD221Bf4221Bi4221B6221BI221BP221B2221BC221B5221B7221BS221Bb5221Bu4221B5221B3221B2221BO221Bd5221Be5221BN221B5221Bf4221BW5221BT221Bc1221BN221Bl4221Bi4221BU221B5221B4221BN221B5221BQ221BZ5221Bo4221BA221BC221B9221Bz4221Be5221BN221B5221Bf4221Bc4221B3221Bg1221BX1221Bf4221Be5221B9221Bz4221Be5221BN221B5221Bf4221By4221B2221B6221B4221BN221Bp3221x3yrQrDbcRj7l_2tuQ11puQB_1W3KKDb321_1_2JJEc318v3kcRryAb6ihBjyA2v3r_Q_yP6xh8_yP1B2221B6221B4221BN221x3YWR7uyP5yh8WzP1BC222x3t_Q1ryP6xh8pyP1B7221BC221B1221BN221x3kWR5kyP5yh8qyP1_3fcRt9r9uDUrh8wD19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n12221n12621n12421n12N21z1egDqcDA592Z8-y4qeD1Gll23v3rv4YdRl5m_2gdR1By1221B5221B2221BD221BB221B3221BM221Bt4221Bc222");
+replay.modes.push([18930, "input"]);
+replay.events.push("1By1221Bg1221BX1221x3WXRNvdRm5l_2fdR4v3zYR-dRg1m_2ceR1Bc2221BI221BP221B2221BC221B5221B7221BS221Bb5221Bc5221BD221B6221BG221BL221BQ221Bn5221Be4221BS221BH221B5221BS221Bd5221BY4221BY1221B5221BC221BD221BJ221Bd4221Bo5221BJ221BC221Bf5221BY4221BQ221BJ221Bd4221Bu4221B5221B3221B2221BO221Bd5221Be5221BN221B5221Bf4221Be5221B2221BD221A221BH221BE221B_3221BN221Bk5221BT221B2221BB221BA221Bl4221Bc5221BR221A221BG221BC221Bb5221Be5221B9221Bz4221Bk4221B3221BU221Bd5221Ba4221BW1221BH221B3221B2221BO221BT221BQ221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bc5221B7221BC221B1221BN221Bt3221BN221Ba4221Bc1221B1221Bd5221Be4221BA221B8221A221BF221BQ221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221By4221B2221B6221B4221BN221Bp3221x3gbRn7llRf1l_2beR11XeRB_1W3KKDb321_1_2JJEc318v3ulRfyAb6ihBXyA2v3_eRXqP6xh8XqP1B2221B6221B4221BN221x3ifR7wpP5yh8YqP1BC222x3XfR1tpP6xh8rpP1B7221BC221B1221BN221x3ufR5mpP5yh8spP1_3plRt9r9iDUrh8kD19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n1222");
+replay.modes.push([18936, "output"]);
+replay.text.push(" feet above you where the rock walls end.\n\nThere are 2 exits:\n- north\n- south\n\nWhat do you do?\nnorth\n\n\n== Tropical Island ==\nThe narrow path slopes downward to the north and leads to the mouth of a small cave.  A sign nearby reads \"Treasure Vault Access\", but different handwriting has crossed this out and written \"Lair of Horrible Monster!  All non-pirates keep out!\".\n\nThere are 2 exits:\n- north\n- south\n\nWhat do you do?\nnorth\n\n\n== Tropical Cave ==\nYou stand at the entrance to a natural cave which looks like it hasn't been visited in quite some time.  Light pours in through the opening to the south, while fireflies light the path further into the cave to the north.\n\nThere are 2 exits:\n- north\n- south\n\nWhat do you do?\nnorth\n\n\n== Tropical Cave ==\nFireflies slowly drift around you and light the tunnel, which seems to get brighter to the south, but dimmer to the north.\n\nThere are 2 exits:\n- north\n- south\n\nWhat do you do?\nnorth\n\n\n== Tropical Cave ==\nThe cave is a little wider here.  You find");
+replay.keyframes.push([19000, 90708, 18999, [100, 41, 0, 14146, 322, 1528, 14104, 25734], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 32767, 0, 2623, 2643, 0, 2553, 2548]]);
+replay.events.push("1n12621n12421n12N21z1egDqcDA592Z8ez4qeD1Gql23v3_v4imRl5m_2qmR1By1221B5221B2221BD221BB221B3221BM221Bt4221Bc2221By1221Bg1221BX1221x3ggRNZnRm5l_2pmR4v3hhRenRwDm_2mnR1Be1221B5221Bf4221Bc4221B3221Bg1221BX1221Bf4221Bo4221BK221Bb5221BY4221BX4221Bu4221B5221BM221A221BF221BD221Bf4221Bk5221BR221B9221B2221BQ221BZ5221Bm4221B5221BQ221BP221Bj3221BR221A221Bo3221Bi1221BC221Bf5221Bi4221B6221BA221BJ221Bd4221Be5221BN221B5221Bf4221Bc4221BO221BP221Bg1221BZ1221B5221Bf3221Bm3221BI221BL221BU221B6221B3221B2221BT221B1221Bd4221Ba5221BP221BG221BN221BG221BA221BA221Bb5221B-4221BH221Bh4221BY4221BX4221Bc5221BB221BN221BM221A221Bt4221Bc4221B3221BO221B6221Bd4221BN221BY4221BQ221BJ221Bd4221BY4221BM221BG221BN221BE221BC221BR221B2221Bl4221Bo5221BJ221BC221Bf5221Be4221BM221B1221Bj4221Bw4221Bd5221Bc5221B4221B3221B5221BL221B3221BY1221Bd5221Be5221BN221B5221Bf4221Ba4221BW1221B5221B7221BB221BI221Bx4221BW5221BD221B7221B3221B4221BS221Bb5221B-4221BH221Bh4221Be5221Bb1221B2221BK221BD221BS221Bb5221BY4221BQ221BJ221Bd4221Bc4221BA221BD221BG22");
+replay.events.push("1BI221B2221Bb5221Bk5221BR221B6221A221Bt4221BW5221B4221B5221BE221BX1221Bf4221Bg5221B3221BR221B2221BU221BH221Bt4221Be5221B9221Bz4221Bo5221BJ221BC221B5221BZ5221BY5221B8221BV221BS221B2221Bl4221BN221Be5221BN221B5221Bf4221Bi4221B6221BI221BP221B2221BC221B5221B7221BS221Bb5221Bc5221BR221A221BG221Bv4221Be5221B9221Bz4221Bu4221B5221B4221BB221Bf4221Bg5221B3221BJ221BA221BD221Bj4221Be5221BN221B5221Bf4221Be4221B2221B5221BW1221BH221BK221Bb5221BY4221Ba1221Bb5221BY4221BX4221Bc5221BL221B5221BE221BG221BT221BQ221Bd4221BR221A221BY2221BX2221BW5221BT221Ba1221A221BZ1221BC221B3221Ba1221Bh1221Bm1221Bn5221Bu4221BD221B7221B6221BU221Bb5221By4221B2221B6221B4221BN221Bl4221BY4221BQ221BJ221Bd4221Bc5221B7221BC221B1221BN221Bt3221BN221BY4221BQ221BJ221Bd4221Be5221BN221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BQ221Bx4221BY4221BM221BH221BO221BE221BX1221Bf4221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bg4221B7221Ba1221B2221Bh4221x3qkRXKfbSvDl_2lnR11fnRB_1W3KKFZ321_1_2JJGa318v3mbSzxAZ6ihBrxA2v3v-Rp-O4xh8p-O1B2221B6221B4221BN221x3c_R7i-O3yh8q-O");
+replay.modes.push([19341, "input"]);
+replay.modes.push([19346, "output"]);
+replay.events.push("1BC222x3x-R1f-O4xh8d-O1B7221BC221B1221BN221x3o_R5Y-O3yh8e-O1BC222x3ZWS3_zO2xh8xzO1B7221Ba1221B2221x3c_R1wzO1yh8yzO1_3vbSv9r9-CSrh8YD19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1X1221n12721n12a121n12221z1ggDqcDAT72h8oz4qeD11Gvl23v3fw4ocSX5m_2ucS1By1221B5221B2221BD221BB221B3221BM221Bt4221Bc2221By1221Bg1221BX1221Bf4221BY2221Bs2221BH221BO221BE221BX1221x3kWSb1tdSY5l_2tcS4v3rYSydSy3m_2YeS1Bc3221Bd5221Be5221BN221B5221Bf4221Ba4221B1221B4221BG221Br4221B-4221BH221Bh4221Be5221BN221B2221BK221Bb5221BY4221BM221BH221BO221BE221BX1221Bn3221BN221Be5221BN221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221Bc5221BB221BN221BM221A221Bt4221Be5221Bb1221B2221BK221BD221Bn3221BN221BY4221BX4221Bc4221BA221BD221BG221BI221Bh4221BN221BY4221BQ221BJ221Bd4221BY4221BX4221Ba4221BW1221B5221B7221BB221BI221Bx4221Bu4221BL221BQ221BC221BT221BQ221B7221B_3221BR221A221Bo2221Bs2221Bd5221Bu4221B6221A221B7221BG221Bb5221Bu4221B5221B4221BB221Bf4221Be5221BN221B2221BK221Bb5221Bc5221B522");
+replay.modes.push([19617, "input"]);
+replay.modes.push([19630, "output"]);
+replay.events.push("1BT221B4221B4221Bf4221Bk5221Bh1221Ba1221Bb5221Bg5221B3221BR221B1221Bd4221Bw4221BG221BZ1221BA221Bl4221Bw4221B4221B6221BP221Bf4221Ba5221BP221B3221B4221BI221BC221BF221BQ221Bn5221Be5221BN221BD221BQ221Bx4221Be5221BN221B5221Bf4221Bc4221B3221BO221B6221B_4221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bk5221BZ1221BS221B2221Bh4221x3cbSZA_nSx3l_2XeS1_3jdSu_Hu_HdiAr4s_2XiA19q4219e12192219A219D219O219b5219-4219H219h4219o4219A219C219T219Q219P219S2192219d5219m42195219Q219P219r2219_221_3vxKz-HbWDmgAJqm8p42x3wXLPbxKHvm8lgA1BA221BC221B5221B7221BP221BM221x3zXLEwwKIwm8mgA1_3exKPl_46g5fmBsmAA_1W3KI9d321_1_2JHAe317v3eoShxAd6ihBbxA2v3xgSloO6xh8loO1BZ1221BS221B2221x3YhS5goO5yh8moO1_3rnSr9t9oCW1rh8oC19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12U21n12b121n12K21n12B21n12f421n12q421n12A21n12C21n12521n12721n12P21n12M21z1wfDqcD8DN2_Be3feNYlRvc9x5s_2pc91F019Q219K219B219I219_3219d221-2tuRtuRhe1K_d119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_22");
+replay.modes.push([19656, "input"]);
+replay.modes.push([19669, "output"]);
+replay.events.push("19f321_3bfDz-CzyCojAe5r_2qkA1n12E21n12621X1221n12721n12r421n12q421n12A21n12C21n12521n12721n12P21n12M21z1wfDycDEDN2x3i2qeDXxK-a7m_2rwK1Bc2221BI221BP221B2221BC221B5221B7221BS221Bb5221Bk5221BZ1221BQ221BP221Bf4221Bg5221B3221BJ221BA221BD221Bj4221Be5221BN221B2221BK221Bb5221Be4221BY1221B3221B2221BA221Bn5221B-4221B5221BF221Bd4221Bq4221BA221BC221B5221B7221BP221BM221Bt4221BY4221Ba1221Bb5221BY4221BX4221Ba5221BP221BS221B2221BL221BA221BD221Bj4221Bc5221B5221B1221BA221Bd5221Bg5221BD221BC221BL221B6221Bt4221Bo5221BJ221BC221Bf5221Bc5221BV221B3221BY1221BP221B1221Bd4221Be5221BN221B5221BG221Bv4221B-4221BH221A221Bl3221BR221A221Bo2221Bs2221Bd5221Ba5221BP221B7221B6221BU221Bn3221B_2221A221Bq3221Bw1221Bm1221Bn5221BY1221BI221Bp1221Bk3221BS221Bf4221Bm4221BD221Bg1221BX1221Bf4221Ba5221BP221B7221B4221BA221B5221B1221Bd4221Bk5221BT221BD221Bc1221Bd5221Bc5221BR221A221BG221BC221Bb5221Be5221B9221Bz4221Ba4221B6221Bf4221Be5221BN221B5221Bf4221Bi4221B6221BA221BP221BM221Bt4221Bo4221BA221Bx4221BY4221BX4221Bc5221BR221BQ221BH221B722");
+replay.text.push(" the cobweb-encrusted remains of a small camp, and although you don't suspect the broken pieces of tables and chairs will prove useful to your quest, the fireflies seem to like using the debris as a shelter.  A passageway leads north and south, and there is an alcove to the east.\n\nThere are 3 exits:\n- north\n- south\n- east\n\nWhat do you do?\neast\n\n\n== Tropical Cave Alcove ==\nAt the back of this alcove, there is a small table, a chair, and a broken lantern.  It looks like this space was used much more recently than the camp to the west.\n\nThings of interest here:\n- journal\n\nThere is 1 exit:\n- west\n\nWhat do you do?\ntake journal\n\n\nTaken.\n\nWhat do you do?\nlook journal\n\n\nFireflies were using this dusty old journal as a resting spot until you scared them off.  It reads:\n\nDay 1: We have reached what seems to be the final in a series of puzzles guarding an ancient treasure.  I suspect most adventurers give up long before this point, but we're so close!  We must press on!\n\nDay 1: P.S.: It's a good ");
+replay.keyframes.push([20000, 96262, 19999, [32, 328, 4, 22430, 3764, 1528, 22101, 25734], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 32767, 0, 2623, 2643, 0, 0, 2553]]);
+replay.events.push("1BS221Bb5221B-4221BH221Bh4221BW5221BA221BA221A221BR221BD221BS221Bb5221Bk4221BS221Bd1221BY1221BR221BA221BA221BD221Bj4221BY4221BQ221Bx4221BY4221BQ221BL221BC221B7221BI221BC221Bd5221Be5221B3221BP221B7221Ba1221B4221B5221BP221Bj3221BR221A221Bo2221Bn2221Bc5221B4221B3221B5221BL221B3221BY1221Bd5221Bw4221B4221B8221B2221Bd5221BY4221B6221Ba1221BX1221BI221BC221B2221B5221BP221BQ221B2221Bb5221Bk4221B4221BQ221BX1221Bf4221Bg5221B9221B_4221Bu4221B6221B1221BD221Bj4221Ba4221B6221B2221BI221B6221BP221Bf4221Be5221BN221B2221BK221Bb5221BW5221B1221BB221BA221BC221Bl4221BN221Ba4221Bc1221B1221Bd5221Bk5221BZ1221Bx3221Bs4221BP221Bf4221Bc5221B7221Bz4221Bc4221BI221B6221B8221BR221Bd4221B1221A221Bk3221BS221Bf4221Bw4221BG221B3221B2221Bd5221BW5221B4221BP221BS221A221Bb5221B-4221B1221Bv4221Bj1221A221Bq3221Bw1221Bm1221Bn5221BY1221BI221Bp1221BW3221BZ2221Bg2221Bf2221BO221Bp1221Bo2221Bs2221Bv4221Bu4221Bb5221BY4221BX4221Bk4221BG221A221BL221Bd4221Be5221BN221B2221BA221BD221Bj4221Be5221BN221B5221Bf4221Bo4221BK221BD221BL221BQ221BJ22");
+replay.events.push("1Bd4221Bo4221BK221Bb5221Be5221B3221B5221B2221BD221BB221B3221BM221Bx3221BR221A221Bk3221BS221Bf4221Bc5221BL221BE221BC221BH221BF221Bd4221Bm4221BD221Bg1221BX1221Bf4221Bi4221BI221A221BL221Bd4221Bi4221BI221B6221BZ5221Bk5221BZ1221A221BC221BG221BZ5221Bj1221A221Bq3221Bw1221Bm1221Bn5221Ba1221BG221Bp1221Be3221Be1221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bd5221BY4221BU221A221BL221B7221BY1221B2221Bb5221Be5221B9221Bz4221Ba4221B6221Bf4221Bc5221BR221B7221BM221BD221B1221Bd4221Ba4221Bk1221Bn5221BY4221BX4221Bw4221BO221BB221B2221BT221BQ221BH221BC221BC221B3221Bb5221Bi4221BI221B6221BT221B4221Bf4221BQ221BP221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Bk5221BF221B1221Bj4221Bw4221Bd5221Ba4221Bc1221BX1221B6221B3221Bf4221BY4221BQ221Bx4221Bo4221BA221BL221BA221Bp3221BR221A221Bk3221BS221Bf4221Be4221BM221B1221Bj4221Bw4221Bd5221Bm4221BD221Bg1221BX1221Bf4221Be5221BN221B5221Bf4221Ba5221BP221BS221B7221BC221B5221BT221B4221BS221Bb5221Be5221B9221Bz4221Ba4221BK221B6221BG221Bj5221Bo4221BM221Bd5221B-4221B2221BL221BI221BZ422");
+replay.events.push("1BN221BY4221BQ221BJ221Bd4221Bo2221Bn2221Bk5221BF221BC221BH221BF221BK221Bj4221Bw4221Bd5221Ba5221BH221BK221BF221Br4221Be4221B5221BO221BN221BC221B4221BA221BD221Bj4221Be5221BN221B5221Bf4221Bc4221BO221B1221BC221BT221BI221BC221B1221Bb5221Bg4221BY1221BX1221BI221Bx4221Bo4221B5221Bh4221Bk5221BZ1221Bf4221Be4221BA221B9221Bh3221BR221A221Bk3221BS221Bx3221Bg4221A221Bt4221Bm4221BD221Bg1221BX1221Bf4221Be5221B9221Bz4221Bi4221B6221B3221BS221B5221BP221Bf4221B-4221BC221B1221Bd5221Be5221BN221B5221Bf4221Bu4221B6221BN221BG221Br4221Bw4221BF221B3221BA221BD221BQ221B9221BK221BB221Bz3221Bd2221A221Bq3221Bw1221Bm1221Bn5221Bc1221BE221Bp1221Be3221Be1221B5221Bf4221Be4221BM221A221B6221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bd5221Bm4221BD221Ba1221Bb5221BY4221BX4221By4221BE221BF221BL221B6221BQ221BZ5221Bc4221B3221BY1221B8221BX1221B1221Bd4221Bo4221BA221BC221B9221Bz4221Bo4221BM221Bh4221BR221A221Bg2221Bu1221B4221BA221Bl4221Ba5221B5221A221B3221Bv4221Bu4221BD221B7221B6221BA221BA221BD221Bj4221Bg522");
+replay.events.push("1B9221B_4221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bd5221Bm4221BD221Ba1221Bb5221Bw4221B4221B6221BP221Bf4221By4221BE221BF221BL221B6221BQ221B2221Bb5221B-4221B6221BZ5221Bc5221BC221BN221BL221BQ221B5221BE221Bb5221Bg4221BG221BL221B6221B1221A221B2221B1221Bd4221Bo4221BA221Bx4221Bw4221B4221B8221BZ1221BG221BB221BW1221Bb5221Bo4221BA221Bx4221Be5221BN221B5221Bf4221Bi4221BC221B6221A221B6221B2221Bf4221BR221A221Bk3221BS221Bf4221Bg4221BY1221BX1221BI221Bx4221Bi4221BI221BC221BD221BJ221Bd4221BY4221BX4221Bc5221B2221B3221BX1221BQ221BD221B3221Bf4221Bk4221BA221BL221Ba1221A221Bb5221B-4221B6221BV221BZ4221Bo4221BA221Bx4221Be5221BN221B5221Bf4221BY4221BQ221BC221BT221B3221BA221BD221BO221BL221B6221BQ221BZ5221B-4221B1221Bx4221BY4221BX4221BW5221BL221B1221B2221BS221B2221Bb1221BM221Bt4221Bo4221BM221B1221BR221BE221BB221Bh4221Bu4221BL221B2221B6221BE221BD221B1221Bd4221Bk5221BR221BM221BN221Bl4221BY4221BX4221By4221BE221BF221BL221B6221BQ221Bd4221BR221A221Bk3221BY1221BD221Bc1221Bd5221Bc4221BO221BC22");
+replay.events.push("1BH221BF221Bd4221Be5221BN221B5221Be1221Bn5221Bw4221BF221B7221BQ221Bz2221Bf3221A221Bq3221Bw1221Bm1221Bn5221Bg1221BA221Bp1221Bk3221BS221Bf4221Bi4221B6221BA221BP221BM221A221BQ221Bn5221Ba4221Bc1221BN221B6221BG221Bd5221Bg5221B9221B_4221Be5221BN221B5221Bf4221Bc4221BO221BC221B5221BX1221BC221B3221Bf4221Be5221B9221Bz4221Be5221B9221BC221BZ1221BA221Bl4221Be5221BN221B5221Bf4221Bc5221B2221B3221BX1221BQ221BD221B3221Bf4221B-4221B6221BV221BZ4221Bo4221BA221Bx4221Be5221BN221B5221Bf4221BY4221BQ221BC221BT221B3221BA221BD221BO221BL221B6221BQ221Bd4221BR221A221Bo2221Bs2221Bd5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221Bc4221BO221B5221B6221B6221B2221Bb5221BY4221Ba1221Bb5221Bk5221BZ1221Bf4221Bc4221B3221BY1221A221BE221Bn5221Bo4221BM221Bd5221Bi4221BO221B5221B3221Bv4221Ba5221B5221A221B3221Bv4221Be5221B9221Bz4221Ba5221B5221A221B3221BX4221BN221BY4221BQ221BJ221Bd4221Bc5221B7221B3221BF221BU221BL221B8221BF221BS221Bb5221Be5221BN221B5221Bf4221Bc5221BC221BN221BL221BQ221B5221BE221Bb5221Bo4221BA221Bx4221Be5221BN221B5221Bf422");
+replay.events.push("1Ba5221B5221A221B3221BC221Bb5221Bi4221BC221BL221Ba1221BL221Bl4221Bc4221BO221B5221B6221B6221B2221Bb5221BY4221Ba1221Bb5221Bk5221BZ1221BE221A221Bx3221BR221A221Bo2221Bs2221Bd5221Bc5221BJ221B8221B6221B7221BQ221Bn5221Bg4221BY1221Bf1221BU221B1221B6221BX1221Bc1221BT221BS221Bb5221Bo4221B5221Bh4221Bk5221BZ1221Bf4221Be5221B3221BE221Bn5221Be5221B9221Bz4221Bu4221BD221B7221Bg1221BX1221Bf4221Bk5221BR221BM221BN221Bl4221Bo4221BM221Bl4221BN221Ba4221Bc1221B1221Bd5221BY4221BQ221B2221BA221BN221B5221BQ221BZ5221BY4221BU221A221BL221B7221BY1221B2221Bb5221B-4221B1221Bx4221Be5221BN221B5221Bf4221BW5221BL221B1221B2221BS221B2221Bb1221BM221Bt4221Bo4221BA221Bx4221Be5221BN221B5221Bf4221BY4221BQ221BC221BT221B3221BA221BD221BO221BL221B6221BQ221BZ5221Bc5221BL221BE221B6221B4221BF221BQ221Bn5221Be5221BN221B5221BQ221BP221B7221BA221BS221BT221BQ221Bd4221BR221A221Bo2221Bs2221Bd5221BY4221BM221BE221B7221Bz4221Bc5221BR221A221BG221BC221Bb5221Be5221B9221Bz4221Be4221BM221Bz4221Be5221BN221B2221BK221Bb5221Bg4221BY1221BX1221BI221Bx4221Bk522");
+replay.text.push("thing the island is tropical.  We should have food for weeks!\n\nDay 2: The vault appears to be sealed by a mysterious force - the door won't budge an inch.  We don't have the resources to blow it open, and I wouldn't risk damaging the contents even if we did.  We'll have to figure out the lock mechanism.\n\nDay 3: The door to the vault has a number carved into it.  Each room leading up to the vault has more numbers or symbols embedded in mosaics in the floors.  We even found a strange glass orb in the antechamber on a pedestal itself labeled with a number.  What could they mean?\n\nDay 5: We finally built up the courage to touch the strange orb in the antechamber.  It flashes colors as we carry it from room to room, and sometimes the symbols in the rooms flash colors as well.  It simply evaporates if we try to leave with it, but another appears on the pedestal in the antechamber shortly thereafter.  It also seems to do this even when we return with it to the antechamber from the other rooms");
+replay.keyframes.push([21000, 101687, 20999, [115, 1328, 4, 23430, 3764, 1528, 22101, 25734], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 32767, 0, 2623, 2643, 0, 0, 2553]]);
+replay.events.push("1BT221B5221BI221Bx4221Bk5221BZ1221Bf4221Ba5221BP221BU221B2221B5221B7221Bx4221Bk5221BR221BM221BN221Bl4221Bo4221BM221Bd5221Be5221B9221Bz4221Be5221BN221B5221Bf4221BY4221BQ221BC221BT221B3221BA221BD221BO221BL221B6221BQ221BZ5221Bi4221BO221B5221B3221Bv4221Be5221BN221B5221Bf4221B-4221BA221BN221B5221BQ221BZ5221Ba5221B5221A221B3221BC221Bf4221Bd2221A221Bq3221Bw1221Bm1221Bn5221Bm1221B4221Bp1221Bk3221BY1221B5221BI221Bx4221Be5221BN221B5221Bf4221B-4221B6221BV221BZ4221Bo4221BK221Bb5221Bc4221B3221BY1221A221BH221B7221B1221Bd4221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bd5221Be4221BM221A221B6221Bh4221BN221Be5221BN221B5221Bf4221By4221BE221BF221BL221B6221BQ221B2221Bb5221B-4221B1221Bx4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Bi4221BC221BL221Ba1221BL221Bl4221Ba4221BK221BL221B4221BG221Bz3221BN221BY4221BQ221BJ221Bd4221Be5221BN221B5221BI221Bx4221Be5221BN221B5221Bf4221B-4221B6221BV221BZ4221Bg4221BY1221Bf1221BU221B1221B6221BX1221Bc1221BT221BS221Bf4221BR221A221Be2221Bg2221B9221Bd422");
+replay.events.push("1Bk5221BZ1221Bf4221Be4221BM221Bz4221Bc5221B7221B3221BF221BU221BN221B2221BA221BD221Bj4221Bk5221B9221B5221B1221BD221Bl2221Bz1221A221Be2221Bs2221BJ221BS221B9221Bj4221Bw4221Bd5221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Bu4221B5221B4221BB221Bf4221Bg5221B3221Bd3221Bz1221A221Bk3221BS221Bf4221BY4221BM221BE221B7221Bz4221Bi4221BI221BC221BD221BJ221Bd4221BY4221BX4221Bc5221BB221BN221BM221A221Bt4221Bm4221BE221BC221B5221BL221BA221BL221Ba1221A221Bb5221By4221BH221B7221BY1221BZ5221Be5221BN221B5221Bf4221Be4221BM221A221B6221Bh4221BN221Bg4221BI221BJ221BG221BD221BS221A221BD221BQ221Bn5221Ba5221B6221BD221A221B9221BA221BD221Bn3221BR221A221Bo2221Bq2221Bb5221Bo4221BM221Bd5221Bk5221Bh1221BG221BM221BL221BA221BD221Bj4221Bi4221BI221B6221BZ5221Bc5221B7221B3221BF221BU221BN221B2221BA221BD221Bl2221Bf3221A221Bq3221Bw1221Bm1221Bn5221BY1221B4221BE221Bp1221Bc3221Bu1221B3221BF221Bf4221B-4221BH221Bh4221Bw4221BO221Bn5221Bc4221BU221BP221Ba1221Bj5221Bc5221B8221BZ1221B7221BY1221BZ5221Be5221BN221B5221Bf4221B-4221B6221BV221BZ422");
+replay.events.push("1BY4221B4221BY1221B2221Bd1221BM221A221BQ221Bn5221Bk4221B3221BU221B1221Bb5221Bm4221B5221B7221Bg1221BX1221BQ221BZ5221B-4221B6221BZ5221Bu4221B5221B3221B2221BO221BT221BQ221BZ5221BY4221Ba1221Bb5221Be5221BN221B5221Be1221Bn5221Bk5221Bh1221BM221B1221Br4221BY4221BY1221B5221BC221BD221BJ221Bd4221Bk5221BR221BM221BN221Bl4221Bo4221BM221Bh4221BR221A221Bo2221Bq2221Bb5221Be5221BN221BD221Bc1221Bd5221Bg4221BY1221BX1221BI221Bx4221BW5221B1221B8221A221BJ221BD221BK221BD221Bh2221Bz1221A221Be3221Be1221B5221Be1221Bn5221Bc5221BZ1221Bm1221Bn5221Be5221BN221BD221Bc1221Bd5221Bo4221B5221Bh4221Be5221BN221B5221Be1221Bn5221Bk5221Bh1221BM221B1221Br4221Be5221BN221BK221B5221BC221BR221B2221Bl4221Bc4221B4221BQ221B4221Bb1221BG221BA221Bx4221Ba5221B5221A221B3221BC221Bb5221Ba5221BP221BM221BL221B7221Bc1221BT221B1221BG221BQ221Bv4221BN221Be5221BN221B5221Be1221Bn5221Bi4221B1221A221BE221Bt4221Bo4221BM221Bd5221Bk4221B3221BU221A221BL221BA221BD221Bj4221Bu4221B5221B3221B2221BO221BT221BQ221BZ5221BY4221BQ221BJ221Bd4221Bu4221B5221B3221B2221BO22");
+replay.events.push("1BT221BQ221Bh4221BN221Ba4221Bc1221B1221Bd5221Bo4221BM221Bd5221Bg4221BY1221BX1221BI221BC221B2221Bd1221BM221A221BQ221Bn5221Bq4221BM221B3221B2221Bd5221Bg4221BY1221Bf1221BU221B1221B6221BX1221Bc1221BT221BS221Bb5221BY4221BQ221BJ221Bd4221BY4221BX4221By4221BH221Ba1221Bj5221B-4221B1221BH221Bf4221BY4221BU221A221BL221B7221BY1221B2221Bb5221BY4221Ba1221Bb5221Bg5221B3221B4221Bd1221BM221Bx3221Bd2221A221Bq3221Bw1221Bm1221Bn5221Ba1221B1221BI221Bp1221By2221BY2221BG221Bj5221Bo2221Bn2221Bc4221B3221BQ221Bx4221Bi4221B1221A221BE221Bt4221Be5221BN221B5221Bf4221B-4221B6221BV221BZ4221Bc4221BA221BD221BQ221BD221B4221BA221BD221Bj4221Bk5221BZ1221B8221B3221B2221BO221Bd5221BY4221Ba1221Bb5221Bo2221Bn2221Bk5221Bh1221BM221B1221Br4221BY4221BY1221B5221BC221BD221BJ221Bh3221BR221A221Bo2221Bs2221Bd5221Be4221B2221BM221BL221BI221BJ221BU221Bb5221B-4221B1221Bx4221Be5221BN221B5221Bf4221BY4221BY1221BP221B7221BX4221BQ221BP221Be5221BN221B5221Bf4221Bc4221BA221BD221BQ221BD221B3221Bf4221Bo4221BK221Bb5221Bi5221BX1221BQ221BE221Bn5221Bc522");
+replay.events.push("1B4221Bb1221Ba1221BF221BD221Bf4221Bo4221BA221Bx4221Bc5221B7221B3221BF221Bf4221BW5221B7221BL221B4221B4221BS221Bj4221BN221Ba4221Bc1221B1221Bd5221Bc4221B4221BQ221B4221Bb1221BG221BA221B3221BQ221Bn5221Bw4221B4221B6221BP221Bf4221By4221B2221BA221BL221BB221B4221B7221B2221BK221BD221Bf4221Bo4221BA221Bx4221B-4221BA221BN221B5221BQ221B2221Bj4221BN221Bg4221BS221B5221BL221B3221BC221BF221BM221A221BQ221Bn5221Bk5221BT221B5221BI221Bx4221Bo2221Bn2221Bk5221Bh1221BM221B1221Br4221Bo4221BA221BC221B9221Bz4221BY4221BX4221Ba5221B5221A221B3221Bv4221Bk5221BR221BM221BN221Bl4221BY4221BX4221Bu4221BL221BY1221BL221B3221BQ221BZ5221By4221BE221BF221BL221B6221BQ221BZ5221B-4221B6221BZ5221B-4221BC221B1221Bd5221B-4221BH221Bh4221BY4221BX4221Ba5221B5221A221B3221Bv4221Bw4221BN221BY1221BD221BB221B1221Bd4221BE221B6221B5221BE221BR221A221BW3221Bg1221BQ221BJ221BD221BU221B6221Bb5221Bk5221BZ1221Bf4221Bc4221B3221BQ221Bx4221BY4221B4221BY1221B2221Bd1221BM221A221BQ221Bn5221Bc4221BO221B1221BC221B3221B5221B5221Bt4221Be5221BN221B5221Bf4221Bk522");
+replay.text.push(".\n\nDay 8: When the orb is carried to the vault door, the numbers on the door flash black, and then the orb evaporates.  Did we do something wrong?  Doesn't the door like us?  We also found a small hourglass near the door, endlessly running.  Is it waiting for something?\n\nDay 13: Some of my crew swear the orb actually gets heaver or lighter as they walk around with it.  Is that even possible?  They say that if they walk through certain rooms repeatedly, they feel it getting lighter and lighter, but it eventually just evaporates and a new one appears as usual.\n\nDay 21: Now I can feel the orb changing weight as I walk around.  It depends on the area - the change is very subtle in some places, but certainly more noticeable in others, especially when I walk into a room with a larger number or out of a room marked '*'.  Perhaps we can actually control the weight of this mysterious orb?\n\nDay 34: One of the crewmembers was wandering the rooms today and claimed that the numbers on the door flas");
+replay.keyframes.push([22000, 107117, 21999, [115, 2328, 4, 24430, 3764, 1528, 22101, 25734], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 32767, 0, 2623, 2643, 0, 0, 2553]]);
+replay.events.push("1BZ1221B8221B3221B2221BO221Bd5221B-4221BH221Bh4221Be5221BN221B2221BK221Bb5221Bw4221BO221BB221B2221BT221BQ221BH221BC221BC221B3221Bb5221B-4221B6221BV221Bb2221Bf3221A221Bq3221Bw1221Bm1221Bn5221Bc1221B2221BC221Bp1221B-2221B-1221BH221Bf4221B-4221BH221Bh4221Be5221BN221B5221Bf4221Bc4221BU221BP221Ba1221BJ221BF221BG221BL221B6221BQ221B2221Bb5221Bk5221Bh1221Ba1221Bb5221Bk5221Bh1221BQ221BJ221B2221BQ221BH221BA221BD221Bj4221Be5221BN221B5221Bf4221Ba5221B5221A221B3221BC221Bb5221Be5221B9221BL221B5221Bm1221Bn5221BY4221BQ221BJ221Bd4221Bc4221BI221BL221BG221B8221BF221B1221Bd4221Be5221BN221BD221Bc1221Bd5221Be5221BN221B5221Bf4221By4221BE221BF221BL221B6221BQ221B2221Bb5221B-4221B1221Bx4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Bi4221BC221BL221Ba1221BL221B5221B1221Bd4221Bk5221BT221B2221BM221BT221Bf4221BY4221Ba1221Bb5221Bm4221B5221Bf4221BY4221BU221A221B4221B5221BR221B4221BA221B5221B1221Bb4221B1221A221Bm2221Bw1221Bf4221Bc5221BZ1221BG221B9221Bd4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Bc5221B222");
+replay.events.push("1BL221B6221A221Bt4221Be4221BA221B9221BK221Bj4221Bw4221Bd5221B-4221B2221BL221BI221BZ4221BN221Ba4221Bc1221B1221Bd5221Bm4221B5221Bf4221By4221B2221BA221BL221BB221B4221B1221Bd4221Be5221BN221BD221Bc1221Bd5221Be5221BN221B5221Bf4221Bm4221BE221BC221B5221BL221BA221BL221Ba1221A221Bb5221Bm4221BD221B6221Bd4221Ba5221B6221BD221Bx4221B-4221BC221B1221Bd5221BY4221BQ221BJ221Bd4221Bi4221BC221BL221Ba1221BL221B5221B1221Bd4221Ba4221BK221BL221B4221BG221Bv3221BR221A221Bk3221BY1221B5221BI221Bx4221Bk5221BZ1221Bf4221Bk5221BZ1221BI221BC221Bd5221Be5221B9221Bz4221Bc4221BA221B5221B3221BG221Br4221B-4221B1221Bx4221Bo4221BM221Bl4221BN221Bo4221BM221Bd5221Bk5221Bh1221Ba1221Bb5221Bc5221B2221BL221B6221A221Bt4221Ba5221B6221BD221A221B9221BA221BD221Bj4221Bu4221B5221B4221BB221Bf4221Bo4221BM221Bd5221BY4221BM221BM221Bh1221Bm1221BB221Bb5221Be4221BM221BJ221BS221Bf4221BR221A221BW3221Bg1221BQ221BJ221BD221BU221B6221Bb5221Bm4221B5221Bf4221Bo4221BK221Bb5221Bk4221BG221BB221BA221BD221Bj4221Bw4221BN221B6221Bf2221Bz1221A221Bo2221Bw1221Bh422");
+replay.events.push("1By4221B2221BA221Bl4221BN221Bk5221BT221B2221BB221BA221Bl4221Be4221BM221Bz4221Bk5221BZ1221Bf4221By4221BH221A221B1221Bd4221Be5221B9221Bz4221BY4221BU221A221BL221B7221Ba1221BR221Br2221Bp1221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221B-4221B6221BZ5221Be5221BN221B5221Bf4221Bm4221BE221BC221B5221BL221BA221BL221Ba1221A221Bd3221Bz1221A221Ba2221Bw2221BA221BN221Bn2221Bf3221A221Bq3221Bw1221Bm1221Bn5221Bg1221A221BA221Bp1221Be3221Be1221B5221Bf4221Bi4221B6221BI221BP221B2221BC221B5221B7221BS221Bb5221BY4221BY1221BP221Bf4221Bk4221B3221BU221A221BL221BA221BD221Bj4221Bc5221B4221B3221B5221BD221BB221BC221BC221BC221B3221Bf4221BR221A221B-2221B-1221BH221Bf4221B-4221BH221Bh4221Be5221BN221B5221BG221Bv4221Bu4221B6221A221B7221BB221B1221Bd4221BY4221Bc1221Bd5221Bw4221BF221Bf4221Bi4221BU221BD221A221BM221Bn5221Be5221B9221BL221B5221Bm1221Bn5221BY4221BQ221BJ221Bd4221Be5221BN221B5221BI221Bx4221Bi4221BC221BD221Ba1221Bj5221B-4221BH221A221Bl3221BR221A221Bo2221Bn2221Be5221BN221B2221BA221B5221Br4221Bo2221Bn2221Bc5221BZ1221Bi122");
+replay.events.push("1Bj5221BY4221BQ221B2221BA221BN221B5221BQ221BZ5221B-4221B1221BH221Bf4221Ba4221BK221B5221BA221B5221B3221BA221BD221Bj4221BY4221BX4221Bu4221B5221BM221A221BF221BD221Bf4221Bi4221B9221Ba1221B2221BT221BQ221BZ5221Be5221BN221BD221BQ221Bx4221Bg5221B3221B4221Bd1221BM221Bx3221BR221A221B-2221Bc2221BZ5221Bk5221Bh1221Ba1221Bb5221Bo4221BM221Bd5221BY4221BX4221Bu4221B5221BM221A221BF221BD221Bf4221Bc5221BD221B6221BG221BZ1221BQ221Bb3221Bz1221A221Bk3221BS221Bf4221BY4221BY1221BP221Bf4221Bk4221B3221BU221A221BL221BA221BD221Bj4221Ba4221B6221BU221A221BT221BQ221BZ5221BY4221Bc1221Bd5221Bc4221BO221B1221BC221B3221B5221B5221A221B5221BA221BD221Bj4221Be5221BN221B5221Bf4221Bk5221BZ1221B8221B3221B2221BO221Bd5221B-4221BH221Bh4221Be5221BN221B5221Bf4221B-4221B6221BV221Bh3221BN221BY4221BQ221BJ221Bd4221Bk5221BZ1221Bf4221Be5221BN221B2221BA221B5221Br4221Be5221BN221BD221Bc1221Bv4221Bu4221Bb5221Bk5221BT221BD221Bc1221Bd5221Be5221BN221B5221Bf4221By4221BE221BF221BL221B6221BQ221B2221Bb5221BY4221BY1221BP221Bf4221BY4221BM221A221Bt4221BY422");
+replay.events.push("1B2221BQ221BC221B1221Bh4221BR221A221Be3221Be1221B5221Bf4221B-4221B6221BV221BZ4221Bc5221B2221Bb1221BY1221B4221B1221Bb5221BY4221Bc1221Bd5221Be5221BN221B5221Bf4221Bk5221BZ1221B8221B3221B2221BO221Bd5221Bu4221BL221B2221B6221BE221BD221B1221Bd4221B-4221B1221Bx4221Be5221BN221B5221Bf4221BW5221BL221B1221B2221BS221B2221Bb1221BM221B_3221BN221BY4221BQ221BJ221Bd4221Bk4221BG221BJ221BS221Bb5221Be4221BM221BG221BH221Bx4221BY4221Ba1221Bb5221Bk5221BZ1221Bf4221Bu4221BD221B7221Bg1221BX1221Bf4221BY4221BX4221Ba5221B5221A221B3221Bv4221Bw4221BN221BY1221BD221BB221B1221Bd4221BE221BC221BB221BA221BN221Bg5221B9221B_4221BY4221Ba1221Bb5221Bk5221BZ1221Bf4221Bu4221BD221B7221Bg1221BX1221Bf4221BY4221BX4221Ba5221B5221A221B3221Bv4221Bw4221BN221BY1221BD221BB221B1221Bd4221BE221B8221B7221BA221BN221BY4221BQ221BJ221Bd4221Bg5221B9221B_4221Bg4221BY1221BX1221BI221Bx4221Bw4221B4221B6221BP221Bf4221BY4221Ba1221Bb5221Bk5221BZ1221Bf4221Bu4221BD221B7221Bg1221BX1221Bf4221BY4221BX4221Ba5221B5221A221B3221Bv4221Bw4221BN221BY1221BD221BB221B122");
+replay.events.push("1Bd4221BE221B6221B5221BE221BR221A221Bg2221Bo2221BC221BT221BQ221BH221BA221BD221Bj4221Ba5221B5221A221B3221BC221Bb5221Bk5221BR221BM221BN221Bl4221Bu4221BL221BY1221BL221B3221BQ221BZ5221By4221BE221BF221BL221B6221BQ221B2221Bb5221Bm4221BD221Ba1221Bb5221BY4221BX4221Bk4221BM221BP221B7221Bc1221BT221BQ221BZ5221Bg4221B2221A221B1221B3221BY1221Bh4221Bd2221A221Bq3221Bw1221Bm1221Bn5221Bm1221B2221B2221Bp1221Bg2221BY3221BX1221BQ221BE221Bn5221B-4221B1221BL221B4221Bf4221Bo4221BA221Bx4221BY4221BX4221Bk4221BM221BP221B7221Bc1221Bd5221Bk5221BT221B2221B6221BD221Bn3221BN221B-4221B1221BH221Bf4221B-4221BH221Bh4221Be5221BN221B5221Bf4221Bc4221BU221BP221Ba1221BJ221BF221BG221BL221B6221BQ221B2221Bb5221Bm4221BD221Ba1221Bb5221Be5221BN221B5221Bf4221Bc5221BZ1221BO221BF221Bf4221Bc5221B2221B9221B6221BE221Bz3221Bp1221Be5221BN221BD221Bc1221Bd5221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221Bk5221BT221B2221BM221BT221Bn3221BN221Be5221BN221B5221Bf4221Bm4221BE221BC221B5221BL221BA221BL22");
+replay.text.push("hed white as he approached!  He said the door still didn't open, but he noticed that the hourglass had run out and flashed black.  When we went to check on it, it was still running like it always does.  Perhaps he is going mad?  If not, which do we need to appease: the door or the hourglass?  Both?\n\nDay 55: The fireflies are getting suspicious.  One of them looked at me funny today and then flew off.  I think I saw another one blinking a little faster than usual.  Or was it a little slower?  We are getting better at controlling the weight of the orb, and we think that's what the numbers are all about.  The orb starts at the weight labeled on the pedestal, and goes down as we leave a room marked '-', up as we leave a room marked '+', and up even more as we leave a room marked '*'.  Entering rooms with larger numbers has a greater effect.\n\nDay 89: Every once in a great while, one of the crewmembers has the same story: that the door flashes white, the hourglass had already run out, it fla");
+replay.keyframes.push([23000, 112548, 22999, [97, 3328, 4, 25430, 3764, 1528, 22101, 25734], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 32767, 0, 2623, 2643, 0, 0, 2553]]);
+replay.events.push("1Ba1221A221Bb5221Bm4221BD221B6221Bd4221BY4221BM221BC221BP221B7221B6221Bg1221Bn5221Ba5221B6221BD221Bx4221B-4221BC221B1221Bl4221BN221Bo4221BM221Bd5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221Ba4221BK221BL221B4221BG221Bz3221BN221BY4221BQ221BJ221Bd4221Be5221BN221B5221Bf4221B-4221B6221BV221BZ4221Bg4221BY1221Bf1221BU221B1221B6221BX1221Bc1221BT221BS221Bf4221BR221A221BY2221BY3221BP221Bf4221Bk5221BZ1221Bf4221Be5221B9221A221Bz4221Bc5221BD221B6221BG221Bl3221Bz1221A221Bk3221BS221Bf4221Bc4221B3221BQ221Bj4221Bw4221Bd5221Bc5221BR221A221BG221Bv4221Be5221B9221Bz4221Bi4221B6221BA221BJ221Bd4221BY4221BX4221Bk5221Bh1221Bm1221Bn5221Be5221B9221Bz4221Bw4221BN221BK221BB221Bf4221Be5221BN221B5221Bf4221B-4221B6221BV221Br3221Bu4221Bb5221Bk5221BZ1221B8221B3221B2221BO221Bd5221Bw4221BN221Bc1221BX1221BA221Bl4221Bk5221BT221BD221Bc1221Bd5221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Bk5221Bh1221BQ221BC221B1221Bb5221Ba4221B6221B2221BI221B6221BP221Bf4221Be5221BN221B5221Bf4221Bm4221BE221BC221B5221BL221BA221BL221Ba122");
+replay.events.push("1A221Bb5221Ba5221B6221BD221BA221Bb5221B-4221BC221B1221Bh4221BR221A221Bo2221Bw1221Bh4221B-4221B1221B3221BQ221Bn5221Bk5221BZ1221Bf4221Bc4221BO221BC221BH221BF221Bd4221Bi4221B6221BA221BJ221Bd4221BY4221BX4221Bc5221BL221BE221B6221B4221BT221BQ221BZ5221Ba5221B5221BC221B1221BT221Bf4221Be5221BN221BK221B5221BC221BR221B2221Bl4221Be5221BN221B5221Bf4221Ba5221B5221A221B3221BC221Bf4221A221A221Bd2221A221Bq3221Bw1221Bm1221Bn5221BY1221B6221A221BC221Bp1221Bk3221BS221Bf4221BY4221BY1221BP221Bf4221BY4221B2221B1221BQ221BJ221BM221B1221B9221BA221BD221Bj4221Be5221BN221B5221Bf4221Bw4221B7221BK221A221BJ221BC221B1221B_3221BR221A221By2221BY2221B1221BH221Bf4221B-4221BH221Bh4221Bg5221B3221Bb5221Bc4221B3221BQ221Bx4221Bk5221BF221B6221BD221Br4221B-4221BC221B1221Bd5221Be5221BN221B5221Bf4221Bc5221B7221B5221BI221B1221BL221BC221B1221Bx4221Be5221B9221Bz4221Be5221BN221B5221Bf4221BW5221BA221BA221A221BR221BD221Bj3221BR221A221Bo2221Bn2221Bk5221BR221B6221A221Bt4221Bu4221BD221B7221Bg1221BX1221Bf4221Be5221BN221B2221BK221Bb5221Bq4221BA22");
+replay.modes.push([23453, "input"]);
+replay.modes.push([23458, "output"]);
+replay.events.push("1BC221B5221B7221BP221BM221Bt4221Bm4221B5221BQ221BP221Bf4221Be5221B9221Bz4221Bm4221B5221BE221B8221B_4221Bi4221BU221B1221B2221B5221BP221Bf4221BY4221B6221Ba1221BX1221BI221BC221B2221B5221BP221BQ221B2221Bj4221BN221Be5221BN221BE221BC221BR221B2221Bl4221Bo2221Bn2221BY4221BO221Bv4221By4221B2221BA221Bd5221Bc5221B4221B5221BP221Bf4221Bk5221BT221BD221Bc1221Bd5221Bm4221B5221BE221B8221B_4221Bo4221BM221Bd5221Bk5221BR221B6221A221Bt4221Bk4221B4221BQ221BX1221Bj3221BR221A221Bk2221Bm2221A221BL221Bd4221Bu4221BI221BZ1221BG221Bp4221x3tyKpW2ylDza7l_2swK1_3gxKdq5z9_kAd5s_2pkA19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12a121n12Z121n12S21n12221z1ggDycDET72l8ez4qeD751Gql23v3_v4kmRl5m_2qmR1By1221B5221B2221BD221BB221B3221BM221Bt4221Bc2221By1221Bg1221BX1221x3ggRNbnRm5l_2pmR4v3hhRgnRwDm_2mnR1Be1221B5221Bf4221Bc4221B3221Bg1221BX1221Bf4221Bo4221BK221Bb5221BY4221BX4221Bu4221B5221BM221A221BF221BD221Bf4221Bk5221BR221B9221B2221BQ221BZ5221Bm4221B5221BQ221BP221Bj3221BR22");
+replay.events.push("1A221Bo3221Bi1221BC221Bf5221Bi4221B6221BA221BJ221Bd4221Be5221BN221B5221Bf4221Bc4221BO221BP221Bg1221BZ1221B5221Bf3221Bm3221BI221BL221BU221B6221B3221B2221BT221B1221Bd4221Ba5221BP221BG221BN221BG221BA221BA221Bb5221B-4221BH221Bh4221BY4221BX4221Bc5221BB221BN221BM221A221Bt4221Bc4221B3221BO221B6221Bd4221BN221BY4221BQ221BJ221Bd4221BY4221BM221BG221BN221BE221BC221BR221B2221Bl4221Bo5221BJ221BC221Bf5221Be4221BM221B1221Bj4221Bw4221Bd5221Bc5221B4221B3221B5221BL221B3221BY1221Bd5221Be5221BN221B5221Bf4221Ba4221BW1221B5221B7221BB221BI221Bx4221BW5221BD221B7221B3221B4221BS221Bb5221B-4221BH221Bh4221Be5221Bb1221B2221BK221BD221BS221Bb5221BY4221BQ221BJ221Bd4221Bc4221BA221BD221BG221BI221B2221Bb5221Bk5221BR221B6221A221Bt4221BW5221B4221B5221BE221BX1221Bf4221Bg5221B3221BR221B2221BU221BH221Bt4221Be5221B9221Bz4221Bo5221BJ221BC221B5221BZ5221BY5221B8221BV221BS221B2221Bl4221BN221Be5221BN221B5221Bf4221Bi4221B6221BI221BP221B2221BC221B5221B7221BS221Bb5221Bc5221BR221A221BG221Bv4221Be5221B9221Bz4221Bu4221B5221B4221BB221Bf422");
+replay.modes.push([23863, "input"]);
+replay.modes.push([23869, "output"]);
+replay.events.push("1Bg5221B3221BJ221BA221BD221Bj4221Be5221BN221B5221Bf4221Be4221B2221B5221BW1221BH221BK221Bb5221BY4221Ba1221Bb5221BY4221BX4221Bc5221BL221B5221BE221BG221BT221BQ221Bd4221BR221A221BY2221BX2221BW5221BT221Ba1221A221BZ1221BC221B3221Ba1221Bh1221Bm1221Bn5221Bu4221BD221B7221B6221BU221Bb5221By4221B2221B6221B4221BN221Bl4221BY4221BQ221BJ221Bd4221Bc5221B7221BC221B1221BN221Bt3221BN221BY4221BQ221BJ221Bd4221Be5221BN221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BQ221Bx4221BY4221BM221BH221BO221BE221BX1221Bf4221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bg4221B7221Ba1221B2221Bh4221x3qkRXKhbSvDl_2lnR11fnRB_1W3KKDZ321_1_2JJEa318v3mbSxxAZ6ihBrxA2v3v-Rp-O4xh8p-O1B2221B6221B4221BN221x3c_R7i-O3yh8q-O1BC222x3x-R1f-O4xh8d-O1B7221BC221B1221BN221x3o_R5Y-O3yh8e-O1BC222x3ZWS3_zO2xh8xzO1B7221Ba1221B2221x3c_R1wzO1yh8yzO1_3vbSv9r9-CSrh8YD19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n12221n12621n12421n12N21z1egDqcD8592h8yz4qeD21G-l23v3pw4ioSl5m_2qoS1By1221B5221B2221BD22");
+replay.text.push("shes black, and the orb evaporates.  Are we too slow?  We can't seem to find a way to make the orb's weight match what the door wants before the hourglass runs out.  If only we could find a shorter route through the rooms...\n\nDay 144: We are abandoning the mission.  None of us can work out the solution to the puzzle.  I will leave this journal here to help future adventurers, though I am not sure what help it will give.  Good luck!\n\nWhat do you do?\nwest\n\n\n== Tropical Cave ==\nThe cave is a little wider here.  You find the cobweb-encrusted remains of a small camp, and although you don't suspect the broken pieces of tables and chairs will prove useful to your quest, the fireflies seem to like using the debris as a shelter.  A passageway leads north and south, and there is an alcove to the east.\n\nThere are 3 exits:\n- north\n- south\n- east\n\nWhat do you do?\nnorth\n\n\n== Tropical Cave ==\nThis tunnel slopes deeper underground to the north, but the fireflies are all around to light your path.\n\nThe");
+replay.keyframes.push([24000, 118049, 23996, [2, 0, 0, 5, 101, 0, 0, 25734], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 32767, 0, 2623, 2643, 0, 0, 2558]]);
+replay.modes.push([24049, "input"]);
+replay.modes.push([24055, "output"]);
+replay.events.push("1BB221B3221BM221Bt4221Bc2221By1221Bg1221BX1221x3giSNZpSm5l_2poS4v3hjSepS6m_2mpS1Be1221B2221BK221Bb5221Be5221B2221BD221A221BH221BE221Bt4221Bc5221BD221B6221B2221BL221BS221Bb5221Be4221B2221A221BM221BL221BQ221BZ5221Bg5221BD221BJ221B2221BQ221BL221BM221B5221BC221BD221BJ221Bd4221Be5221B9221Bz4221Be5221BN221B5221Bf4221By4221B2221B6221B4221BN221Bt3221BN221Ba4221Bc1221B1221Bd5221Be5221BN221B5221Bf4221Bi4221B6221BI221BP221B2221BC221B5221B7221BS221Bb5221BY4221BY1221BP221Bf4221BY4221BM221A221Bt4221BY4221BY1221B5221BC221BD221BJ221Bd4221Be5221B9221Bz4221Bu4221B5221B3221B2221BO221Bd5221Bo5221BJ221BC221B5221BZ5221BW5221BT221Bc1221BN221Bp3221x3qmSj6rvS5l_2lpS11hpSB_1W3KKDb321_1_2JJEc318v3-vSbxAb6ihBzwA2v3bpS_gO6xh8_gO1B2221B6221B4221BN221x3opS7ugO5yh8WhO1BC222x3dpS1rgO6xh8pgO1B7221BC221B1221BN221x3-pS5kgO5yh8qgO1_3vvSt9r9eCUrh8gC19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n12221n12621n12421n12N21z1egDqcDA592Z8-X5qeD1G_n23v3n-4vcVd5m_2ncV1BM221Be122");
+replay.events.push("1BH221BG221Bd5221BY2221Bw2221BC221BT221B3221BA221BD221BO221BL221B6221BQ221x3rjVVwbVe5l_2ocV4v3aiVrbVs2m_2jbV1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221Be5221BN221B5221Bf4221BY4221BQ221BC221BT221B3221BA221BD221BO221BL221B6221BQ221BZ5221Be5221B9221Bz4221BY4221BX4221Bk4221BM221BH221B9221Bd4221B-4221BH221Bh4221Ba5221B5221A221B3221BC221Bb5221Be5221BN221BD221Bc1221Bd5221Bc4221BO221B1221BC221B3221B5221B5221Bt4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bh4221BR221A221Bo3221Bi1221BC221Bf5221By4221B2221BA221BL221BB221B4221Bf4221Be5221BN221B5221Bf4221By4221BE221BF221BL221B6221BQ221BZ5221BE221BM221A221BL221BD221Bo4221BK221Bb5221Bc4221B3221BY1221B8221BX1221B1221Bd4221Bo4221BA221BC221B9221Bz4221Be5221BN221B5221Bf4221B-4221B6221BV221Br3221Bu4221Bb5221BW5221BL221B1221B2221BS221B2221Bb1221BM221Bx3221x3feVz8uyUr2l_2kbV1_3YcVu_Hu_HfiAr4s_2XiA19q4219e12192219A219D219O219b5219-4219H219h4219o4219A219C219T219Q219P219S21922");
+replay.modes.push([24318, "input"]);
+replay.modes.push([24327, "output"]);
+replay.modes.push([24476, "input"]);
+replay.modes.push([24482, "output"]);
+replay.events.push("19d5219m42195219Q219P219r2219_221_3ZnQx-HvxCmgAJqm8p42x3ktQRlmQPvm8v_F1B6221BV221x3psQOimQQwm8w_F1_3smQRzZ58g5fmBsmAB_1W3KKFZ321_1_2JJGa318v3nyUjqAZ6ihBbqA2v3eZVbeK4xh8beK1B2221B6221B4221BN221x3xYV7-dK3yh8ceK1BC222x3gYV1xdK2xh8vdK1B7221Ba1221B2221x3dZV3sdK1yh8wdK1BA222x3yYV3pdK4xh8ldK1B7221BC221B1221BN221x3bYV3idK3yh8mdK1_3gyUv9r9k5Srh8o519w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12U21n12b121n12K21n12B21n12f421n12-421n12621n12V21z1YgDqcDA6F2_Be3feNYlRxc9x5s_2pc91C019Q219K219B219I219_3219d221-2tuRtuRhe1K_d119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkAy3n12I21n12221n12621n12421n12N21z1egDycD6592_BY2qeD7pbDh2m_2lbD1Ghn21Ba3221Bb5221Bo5221BJ221BC221Bf5221Bg4221BI221BC221BT221BQ221BZ5221Be5221BN221B5221Bf4221Ba5221B5221A221B3221BX4221BN221Be5221BN221B5221Bf4221Bc5221BC221BN221BL221BQ221B5221Bt4221B-4221B1221Bx4221Be5221BN221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221Ba4221BW1221BH221B722");
+replay.events.push("1B2221BC221BQ221Bn5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221x2k4x3z4p3X11BM221BP221A221BI221x2_37w4u1Y51BR221A221Be3221Be1221B5221Bf4221B-4221B6221BV221BZ4221Ba4221B6221B4221B4221BA221BA221Bb5221Bc5221B4221Bb1221Ba1221BF221BQ221Bn5221Bk4221BA221B6221BG221BR221BA221BD221Bj4221x2k4_1X7t1X51BM221BP221A221BI221x3jjDvcDocDW6l_2ocD33efIocD3v3fz4WnVr5m_2enV1BM221Be1221BH221BG221Bd5221Bu2221Bc2221BN221BG221x3ogVHnnVs5l_2dnV4v3rhVsnVs1m_2-nV1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bk4221BM221BH221B9221Bd4221B-4221BH221Bh4221Ba5221B5221A221B3221BC221Bb5221Be5221BN221BD221Bc1221Bd5221Bc4221BO221B1221BC221B3221B5221B5221Bt4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bh4221Bd2221A221Bq4221Be1221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221B-4221BH221Bh4221Be5221BN221B2221BK221Bb5221Ba5221B5221A221B3221Bv4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bw4221B4221B8221BZ1221BG221BB22");
+replay.modes.push([24799, "input"]);
+replay.modes.push([24804, "output"]);
+replay.events.push("1Bb4221Be4221B2221BM221BD221BB221BY1221BL221BA221BD221Bj4221BY4221BX4221BE221B8221B7221BD221Bc5221BC221BN221BL221BQ221B5221Bx3221x3YlVz7pvVr1l_2znV11tnVB_1W3KKFZ321_1_2JJGa318v3wvVrsAZ6ihBjsA2v3ZpVnlL4xh8nlL1B2221B6221B4221BN221x3mpV7glL3yh8olL1BC222x3XqV1dlL2xh8blL1B7221Ba1221B2221x3apV3YlL1yh8clL1BA222x3lpV3_kL4xh8xkL1B7221BC221B1221BN221x3cqV3ukL3yh8ykL1_3XwVv9r9s7Srh8w719w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1X1221n12721n12a121n12221z1ggDqcDAT72xBY2qeDp_Ch3m_2h_C1Gmn21Ba3221Bb5221Bo5221BJ221BC221Bf5221Bg4221BI221BC221BT221BQ221BZ5221Be5221BN221B5221Bf4221Ba5221B5221A221B3221BX4221BN221Be5221BN221B5221Bf4221B-4221B6221BV221BZ4221Ba4221BW1221BH221B7221B2221BC221BQ221Bn5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221x2k4x2XAp2b71BM221BP221A221BI221x2_37-9s3cA1BR221A221Be3221Be1221B5221Bf4221By4221BE221BF221BL221B6221BQ221BZ5221B-4221B1221Bx4221Be5221BN221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221Bi5221BP221BD221BW1221BX1221Bc122");
+replay.text.push("re are 2 exits:\n- north\n- south\n\nWhat do you do?\nnorth\n\n\n== Vault Antechamber ==\nYou are in the antechamber to a grid of rooms that control the door to the vault.  You notice the number '22' is carved into the orb's pedestal.\n\nThings of interest here:\n- orb\n\nThere are 3 exits:\n- north\n- east\n- south\n\nWhat do you do?\ntake orb\n\n\nTaken.\n\nWhat do you do?\n# At this point we're entering a maze.  The \"vaults\" helper solves the maze and finds the following path to run through it\nnorth\n\n\nAs you enter the room, the symbol on the floor briefly flashes green.  The orb begins subtly glowing green.\n\n== Vault Lock ==\nYou are in a grid of rooms that control the door to the vault.\n\nThe floor of this room is a large mosaic depicting a '+' symbol.\n\nThere are 3 exits:\n- north\n- east\n- south\n\nWhat do you do?\neast\n\n\nAs you enter the room, the orb briefly flashes green.  The number on the floor vibrates strangely beneath your feet.  The orb seems to get heavier.\n\n== Vault Lock ==\nYou are in a grid of rooms t");
+replay.keyframes.push([25000, 123026, 24999, [116, 27, 0, 16344, 130, 1528, 16316, 25734], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 32767, 0, 0, 2643, 0, 0, 2608]]);
+replay.events.push("1BT221BS221Bb5221Bc5221B2221B3221BX1221BQ221BD221B3221BE221BQ221Bn5221Ba4221B6221BI221BH221B7221Bc1221BN221Bl4221Bo5221BJ221BC221B5221BZ5221Bi4221B1221A221BU221Bh4221_2Rz324X2Y41A221Be3221Be1221B5221Bf4221B-4221B6221BV221BZ4221Bc5221BR221A221BG221BC221Bb5221Be5221B9221Bz4221Bk4221B3221BU221Bd5221Bm4221B5221B7221Bg1221BP221B7221BQ221Bd4221_3d1F1qsCi4l_2guC23iX5h13v3pz4ywVr5m_2YxV1BM221Be1221BH221BG221Bd5221Bu2221Bc2221BN221BG221x3iqVHjxVs5l_2XxV4v3lrVoxVw1m_2uxV1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bk4221BM221BH221B9221Bd4221B-4221BH221Bh4221Ba5221B5221A221B3221BC221Bb5221Be5221BN221BD221Bc1221Bd5221Bc4221BO221B1221BC221B3221B5221B5221Bt4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bh4221Bd2221A221Bq4221Be1221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221B-4221BH221Bh4221Be5221BN221B2221BK221Bb5221Ba5221B5221A221B3221Bv4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bw422");
+replay.modes.push([25170, "input"]);
+replay.modes.push([25175, "output"]);
+replay.events.push("1B4221B8221BZ1221BG221BB221Bb4221Be4221B2221BM221BD221BB221BY1221BL221BA221BD221Bj4221Be5221BN221B5221Bf4221By4221BE221BF221BL221B6221BQ221BZ5221BE221BQ221BP221BE221x3yuVX8iyVv1l_2txV11lxVB_1W3KKFX321_1_2JJGY318v3fyVZsAX6ihBzrA2v3XzVZcL2xh8ZcL1B2221B6221B4221BN221x3kzV7ybL1yh8acL1BC222h3_zV1vbLxh8tbL1B7221Ba1221B2221h3YzV3qbLyh8ubL1BA222x3jzV3nbL2xh8jbL1B7221BC221B1221BN221x3a-V3gbL1yh8kbL1BC222h3nzV5dbLxh8XbL1BZ1221BS221B2221f3uzVYbLyh8YbL1_3qxVx9r9a7Qrh8g719w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1X1221n12721n12a121n12221z1ggDqcD8T72xBY2qeDrbDh2m_2lbD1Grn21Ba3221Bb5221Bo5221BJ221BC221Bf5221Bg4221BI221BC221BT221BQ221BZ5221Be5221BN221B5221Bf4221Ba5221B5221A221B3221BX4221BN221Be5221BN221B5221Bf4221Bc5221BC221BN221BL221BQ221B5221Bt4221B-4221B1221Bx4221Be5221BN221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221Ba4221BW1221BH221B7221B2221BC221BQ221Bn5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221x2a5x3n4t3L1BP221B1221x2h33o4y1s41BR221A221Be322");
+replay.events.push("1Be1221B5221Bf4221B-4221B6221BV221BZ4221Ba4221B6221B4221B4221BA221BA221Bb5221Bc5221B4221Bb1221Ba1221BF221BQ221Bn5221Bk4221BA221B6221BG221BR221BA221BD221Bj4221x2a5_1r6x1r41BP221B1221x3jiDfcDecDa6l_2ccD33mfIccD3v3zz4xwVr5m_2rwV1BM221Be1221BH221BG221Bd5221Bu2221Bc2221BN221BG221x3q-VHgwVs5l_2swV4v3t_VbwVs1m_2_vV1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bk4221BM221BH221B9221Bd4221B-4221BH221Bh4221Ba5221B5221A221B3221BC221Bb5221Be5221BN221BD221Bc1221Bd5221Bc4221BO221B1221BC221B3221B5221B5221Bt4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bh4221Bd2221A221Bq4221Be1221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221B-4221BH221Bh4221Be5221BN221B2221BK221Bb5221Ba5221B5221A221B3221Bv4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bw4221B4221B8221BZ1221BG221BB221Bb4221Be4221B2221BM221BD221BB221BY1221BL221BA221BD221Bj4221BY4221BX4221BE221BC221BB221BD221Bc5221BC221BN221BL221BQ221B5221Bx322");
+replay.modes.push([25495, "input"]);
+replay.modes.push([25501, "output"]);
+replay.events.push("1x3xyVz7eoVr1l_2WwV11ewVB_1W3KKFX321_1_2JJGY318v3boVlrAX6ihBfrA2v3wuVpyK2xh8pyK1B2221B6221B4221BN221x3juV7iyK1yh8qyK1BC222h3ytV1fyKxh8dyK1B7221Ba1221B2221h3vuV3ayKyh8eyK1BA222x3kuV3XyK2xh8zxK1B7221BC221B1221BN221x3ttV3wxK1yh8-xK1BC222h3guV5txKxh8nxK1BZ1221BS221B2221f3ZuVoxKyh8oxK1_3mnVx9r9m6Qrh8s619w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n12221n12621n12421n12N21z1egDqcD8592xBY2qeDn_Ch3m_2h_C1GXn21Ba3221Bb5221Bo5221BJ221BC221Bf5221Bg4221BI221BC221BT221BQ221BZ5221Be5221BN221B5221Bf4221Ba5221B5221A221B3221BX4221BN221Be5221BN221B5221Bf4221B-4221B6221BV221BZ4221Ba4221BW1221BH221B7221B2221BC221BQ221Bn5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221x2a5x2r9t2v61BP221B1221x2h33s9w3w91BR221A221Be3221Be1221B5221Bf4221By4221BE221BF221BL221B6221BQ221BZ5221B-4221B1221Bx4221Be5221BN221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221Bi5221BP221BD221BW1221BX1221Bc1221BT221BS221Bb5221Bc5221B2221B3221BX1221BQ221BD221B3221BE221BQ221Bn5221Ba4221B6221BI22");
+replay.events.push("1BH221B7221Bc1221BN221Bl4221Bo5221BJ221BC221B5221BZ5221Bi4221B1221A221BU221Bh4221_2Rz32a2X2Y61A221Be3221Be1221B5221Bf4221B-4221B6221BV221BZ4221Bc5221BR221A221BG221BC221Bb5221Be5221B9221Bz4221Bk4221B3221BU221Bd5221Bu4221B5221B3221B2221BO221BT221BQ221Bd4221x3z17sqCi4l_2gsC27aX5p113v3ry4yyUr5m_2azU1BM221Be1221BH221BG221Bd5221Bu2221Bc2221BN221BG221x3ksUHjzUs5l_2ZzU4v3ntUozUy1m_2wzU1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bk4221BM221BH221B9221Bd4221B-4221BH221Bh4221Ba5221B5221A221B3221BC221Bb5221Be5221BN221BD221Bc1221Bd5221Bc4221BO221B1221BC221B3221B5221B5221Bt4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bh4221Bd2221A221Bq4221Be1221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221B-4221BH221Bh4221Be5221BN221B2221BK221Bb5221Ba5221B5221A221B3221Bv4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bw4221B4221B8221BZ1221BG221BB221Bb4221Be4221B2221BM221BD221BB221BY1221BL221BA221BD221Bj422");
+replay.modes.push([25866, "input"]);
+replay.modes.push([25871, "output"]);
+replay.events.push("1Be5221BN221B5221Bf4221By4221BE221BF221BL221B6221BQ221BZ5221BE221BK221A221BJ221BE221x3-wUZ8rbVx1l_2vzU11nzUB_1W3KKHX321_1_2JJIY318v3wbVvtAX6ihBntA2v3b_UhYM2xh8hYM1B2221B6221B4221BN221x3o_U7aYM1yh8iYM1BC222h3ZWV1XYMxh8_XM1B7221Ba1221B2221h3c_U3yXMyh8WYM1BA222x3n_U3vXM2xh8rXM1B7221BC221B1221BN221x3eWV3oXM1yh8sXM1BC222h3r_U5lXMxh8fXM1BZ1221BS221B2221f3y_UgXMyh8gXM1_3lcVx9r9u8Qrh8-819w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12a121n12Z121n12S21n12221z1ggDqcDAT72xBY2qeDtbDh2m_2lbD1Gym21Ba3221Bb5221Bo5221BJ221BC221Bf5221Bg4221BI221BC221BT221BQ221BZ5221Be5221BN221B5221Bf4221Ba5221B5221A221B3221BX4221BN221Be5221BN221B5221Bf4221Bc5221BC221BN221BL221BQ221B5221Bt4221B-4221B1221Bx4221Be5221BN221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221Ba4221BW1221BH221B7221B2221BC221BQ221Bn5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221x2o5x3f4n3D1Bd1221BE221A221B6221BG221x2n49a4s1k41BR221A221Be3221Be1221B5221Bf4221B-4221B6221BV221BZ4221Ba4221B6221B4221B4221BA22");
+replay.text.push("hat control the door to the vault.\n\nThe floor of this room is a large mosaic depicting the number '4'.\n\nThere are 4 exits:\n- north\n- east\n- south\n- west\n\nWhat do you do?\neast\n\n\nAs you enter the room, the symbol on the floor briefly flashes red.  The orb begins subtly glowing red.\n\n== Vault Lock ==\nYou are in a grid of rooms that control the door to the vault.\n\nThe floor of this room is a large mosaic depicting a '-' symbol.\n\nThere are 4 exits:\n- north\n- east\n- south\n- west\n\nWhat do you do?\nnorth\n\n\nAs you enter the room, the orb briefly flashes red.  The number on the floor vibrates strangely beneath your feet.  The orb seems to get lighter.\n\n== Vault Lock ==\nYou are in a grid of rooms that control the door to the vault.\n\nThe floor of this room is a large mosaic depicting the number '11'.\n\nThere are 4 exits:\n- north\n- east\n- south\n- west\n\nWhat do you do?\nwest\n\n\nAs you enter the room, the symbol on the floor briefly flashes yellow.  The orb begins subtly glowing yellow.\n\n== Vault Lock ==");
+replay.keyframes.push([26000, 128668, 25997, [15664, 0, 0, 4, 101, 0, 0, 25734], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 32767, 0, 0, 2643, 0, 0, 2588]]);
+replay.events.push("1BA221Bb5221Bc5221B4221Bb1221Ba1221BF221BQ221Bn5221Bk4221BA221B6221BG221BR221BA221BD221Bj4221x2o5_1j6r1j41Bd1221BE221A221B6221BG221x3hjDdcDwbD-5l_2-bD33sdI-bD3v3hy4woUr5m_2WpU1BM221Be1221BH221BG221Bd5221Bu2221Bc2221BN221BG221x3giUHhpUs5l_2_oU4v3jjUmpUs1m_2spU1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bk4221BM221BH221B9221Bd4221B-4221BH221Bh4221Ba5221B5221A221B3221BC221Bb5221Be5221BN221BD221Bc1221Bd5221Bc4221BO221B1221BC221B3221B5221B5221Bt4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bh4221Bd2221A221Bq4221Be1221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221B-4221BH221Bh4221Be5221BN221B2221BK221Bb5221Ba5221B5221A221B3221Bv4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bw4221B4221B8221BZ1221BG221BB221Bb4221Be4221B2221BM221BD221BB221BY1221BL221BA221BD221Bj4221BY4221BX4221BE221B6221B5221BD221Bc5221BC221BN221BL221BQ221B5221Bx3221x3wmUz7jxUr1l_2rpU11jpUB_1W3KKFX321_1_2JJGY318v3mxUhuAX6ihBbuA");
+replay.modes.push([26197, "input"]);
+replay.modes.push([26203, "output"]);
+replay.events.push("2v3xqUXiM2xh8XiM1B2221B6221B4221BN221x3erU7whM1yh8YiM1BC222h3vrU1thMxh8rhM1B7221Ba1221B2221h3yqU3ohMyh8shM1BA222x3drU3lhM2xh8hhM1B7221BC221B1221BN221x3-rU3ehM1yh8ihM1BC222h3hrU5bhMxh8_gM1BZ1221BS221B2221f3orUWhMyh8WhM1_3byUx9r9i9Qrh8o919w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12S21n12721n12C21n12121n12N21z1egDqcD8592xBY2qeDn_Ch3m_2h_C1Gmn21Ba3221Bb5221Bo5221BJ221BC221Bf5221Bg4221BI221BC221BT221BQ221BZ5221Be5221BN221B5221Bf4221Ba5221B5221A221B3221BX4221BN221Be5221BN221B5221Bf4221B-4221B6221BV221BZ4221Ba4221BW1221BH221B7221B2221BC221BQ221Bn5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221x2o5x2j9n2n61Bd1221BE221A221B6221BG221x2n49e9q3o91BR221A221Be3221Be1221B5221Bf4221By4221BE221BF221BL221B6221BQ221BZ5221B-4221B1221Bx4221Be5221BN221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221Bi5221BP221BD221BW1221BX1221Bc1221BT221BS221Bb5221Bc5221B2221B3221BX1221BQ221BD221B3221BE221BQ221Bn5221Ba4221B6221BI221BH221B7221Bc1221BN221Bl4221Bo5221BJ221BC221B522");
+replay.events.push("1BZ5221Bi4221B1221A221BU221Bh4221_2Rz324X2Y41A221Be3221Be1221B5221Bf4221B-4221B6221BV221BZ4221Bc5221BR221A221BG221BC221Bb5221Be5221B9221Bz4221Bk4221B3221BU221Bd5221Bm4221B5221B7221Bg1221BP221B7221BQ221Bd4221_3ST1ssCi4l_2guC23e_4T3v3pz4wwVr5m_2YxV1BM221Be1221BH221BG221Bd5221Bu2221Bc2221BN221BG221x3iqVHhxVs5l_2XxV4v3lrVmxVw1m_2uxV1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bk4221BM221BH221B9221Bd4221B-4221BH221Bh4221Ba5221B5221A221B3221BC221Bb5221Be5221BN221BD221Bc1221Bd5221Bc4221BO221B1221BC221B3221B5221B5221Bt4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bh4221Bd2221A221Bq4221Be1221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221B-4221BH221Bh4221Be5221BN221B2221BK221Bb5221Ba5221B5221A221B3221Bv4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bw4221B4221B8221BZ1221BG221BB221Bb4221Be4221B2221BM221BD221BB221BY1221BL221BA221BD221Bj4221Be5221BN221B5221Bf4221By4221BE221BF221BL221B622");
+replay.modes.push([26570, "input"]);
+replay.modes.push([26575, "output"]);
+replay.events.push("1BQ221BZ5221BE221BQ221BP221BE221x3yuVX8kyVv1l_2txV11lxVB_1W3KKHX321_1_2JJIY318v3fyVbsAX6ihBzrA2v3XzVZcL2xh8ZcL1B2221B6221B4221BN221x3kzV7ybL1yh8acL1BC222h3_zV1vbLxh8tbL1B7221Ba1221B2221h3YzV3qbLyh8ubL1BA222x3jzV3nbL2xh8jbL1B7221BC221B1221BN221x3a-V3gbL1yh8kbL1BC222h3nzV5dbLxh8XbL1BZ1221BS221B2221f3uzVYbLyh8YbL1_3qxVx9r9a7Qrh8g719w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1X1221n12721n12a121n12221z1ggDqcDAT72xBY2qeDtbDh2m_2lbD1Grn21Ba3221Bb5221Bo5221BJ221BC221Bf5221Bg4221BI221BC221BT221BQ221BZ5221Be5221BN221B5221Bf4221Ba5221B5221A221B3221BX4221BN221Be5221BN221B5221Bf4221Bc5221BC221BN221BL221BQ221B5221Bt4221B-4221B1221Bx4221Be5221BN221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221Ba4221BW1221BH221B7221B2221BC221BQ221Bn5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221x2a5x3n4t3L1BP221B1221x2h33o4y1s41BR221A221Be3221Be1221B5221Bf4221B-4221B6221BV221BZ4221Ba4221B6221B4221B4221BA221BA221Bb5221Bc5221B4221Bb1221Ba1221BF221BQ221Bn5221Bk4221BA221B622");
+replay.events.push("1BG221BR221BA221BD221Bj4221x2a5_1r6x1r41BP221B1221x3jiDfcDecDa6l_2ccD33mfIccD3v3zz4xwVr5m_2rwV1BM221Be1221BH221BG221Bd5221Bu2221Bc2221BN221BG221x3q-VHgwVs5l_2swV4v3t_VbwVs1m_2_vV1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bk4221BM221BH221B9221Bd4221B-4221BH221Bh4221Ba5221B5221A221B3221BC221Bb5221Be5221BN221BD221Bc1221Bd5221Bc4221BO221B1221BC221B3221B5221B5221Bt4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bh4221Bd2221A221Bq4221Be1221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221B-4221BH221Bh4221Be5221BN221B2221BK221Bb5221Ba5221B5221A221B3221Bv4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bw4221B4221B8221BZ1221BG221BB221Bb4221Be4221B2221BM221BD221BB221BY1221BL221BA221BD221Bj4221BY4221BX4221BE221BC221BB221BD221Bc5221BC221BN221BL221BQ221B5221Bx3221x3xyVz7eoVr1l_2WwV11ewVB_1W3KKFX321_1_2JJGY318v3boVlrAX6ihBfrA2v3wuVpyK2xh8pyK1B2221B6221B4221BN221x3juV7iyK1yh8qyK1BC222h3ytV1fyKxh8dyK");
+replay.modes.push([26895, "input"]);
+replay.modes.push([26900, "output"]);
+replay.text.push("\nYou are in a grid of rooms that control the door to the vault.\n\nThe floor of this room is a large mosaic depicting a '*' symbol.\n\nThere are 4 exits:\n- north\n- east\n- south\n- west\n\nWhat do you do?\nsouth\n\n\nAs you enter the room, the orb briefly flashes yellow.  The number on the floor vibrates strangely beneath your feet.  The orb seems to get heavier.\n\n== Vault Lock ==\nYou are in a grid of rooms that control the door to the vault.\n\nThe floor of this room is a large mosaic depicting the number '4'.\n\nThere are 4 exits:\n- north\n- east\n- south\n- west\n\nWhat do you do?\neast\n\n\nAs you enter the room, the symbol on the floor briefly flashes red.  The orb begins subtly glowing red.\n\n== Vault Lock ==\nYou are in a grid of rooms that control the door to the vault.\n\nThe floor of this room is a large mosaic depicting a '-' symbol.\n\nThere are 4 exits:\n- north\n- east\n- south\n- west\n\nWhat do you do?\neast\n\n\nAs you enter the room, the orb briefly flashes red.  The number on the floor vibrates strangely be");
+replay.keyframes.push([27000, 134306, 26999, [101, 47, 0, 26218, 64, 1528, 26170, 25734], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 32767, 0, 0, 2643, 0, 0, 2618]]);
+replay.events.push("1B7221Ba1221B2221h3vuV3ayKyh8eyK1BA222x3kuV3XyK2xh8zxK1B7221BC221B1221BN221x3ttV3wxK1yh8-xK1BC222h3guV5txKxh8nxK1BZ1221BS221B2221f3ZuVoxKyh8oxK1_3mnVx9r9m6Qrh8s619w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1X1221n12721n12a121n12221z1ggDqcD8T72xBY2qeDn_Ch3m_2h_C1Gwn21Ba3221Bb5221Bo5221BJ221BC221Bf5221Bg4221BI221BC221BT221BQ221BZ5221Be5221BN221B5221Bf4221Ba5221B5221A221B3221BX4221BN221Be5221BN221B5221Bf4221B-4221B6221BV221BZ4221Ba4221BW1221BH221B7221B2221BC221BQ221Bn5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221x2a5x2r9t2v61BP221B1221x2h33s9w3w91BR221A221Be3221Be1221B5221Bf4221By4221BE221BF221BL221B6221BQ221BZ5221B-4221B1221Bx4221Be5221BN221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221Bi5221BP221BD221BW1221BX1221Bc1221BT221BS221Bb5221Bc5221B2221B3221BX1221BQ221BD221B3221BE221BQ221Bn5221Ba4221B6221BI221BH221B7221Bc1221BN221Bl4221Bo5221BJ221BC221B5221BZ5221Bi4221B1221A221BU221Bh4221_2Rz32a2X2Y61A221Be3221Be1221B5221Bf4221B-4221B6221BV221BZ422");
+replay.events.push("1Bc5221BR221A221BG221BC221Bb5221Be5221B9221Bz4221Bk4221B3221BU221Bd5221Bu4221B5221B3221B2221BO221BT221BQ221Bd4221x37y1qqCi4l_2gsC27WX5t313v3d-4tmVr5m_2nmV1BM221Be1221BH221BG221Bd5221Bu2221Bc2221BN221BG221x3dtVHcmVs5l_2omV4v3asVXmVy1m_2xlV1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bk4221BM221BH221B9221Bd4221B-4221BH221Bh4221Ba5221B5221A221B3221BC221Bb5221Be5221BN221BD221Bc1221Bd5221Bc4221BO221B1221BC221B3221B5221B5221Bt4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bh4221Bd2221A221Bq4221Be1221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221B-4221BH221Bh4221Be5221BN221B2221BK221Bb5221Ba5221B5221A221B3221Bv4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bw4221B4221B8221BZ1221BG221BB221Bb4221Be4221B2221BM221BD221BB221BY1221BL221BA221BD221Bj4221Be5221BN221B5221Bf4221By4221BE221BF221BL221B6221BQ221BZ5221BE221BK221BE221BX1221BE221x3toVZ8-dVx1l_2ylV11YmVB_1W3KKDZ321_1_2JJEa318v3vdVxqAZ6ihBrqA");
+replay.modes.push([27258, "input"]);
+replay.modes.push([27263, "output"]);
+replay.events.push("2v3mkVzoK4xh8zoK1B2221B6221B4221BN221x3ZkV7soK3yh8-oK1BC222x3kkV1poK4xh8noK1B7221BC221B1221BN221x3tjV5ioK3yh8ooK1BC222x3gkV3foK2xh8boK1BZ1221BS221B2221x3ZkV1aoK1yh8coK1_3mdVv9r9-5Srh8Y619w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12a121n12Z121n12S21n12221z1ggDqcD8T72xBY2qeDrbDh2m_2lbD1Grn21Ba3221Bb5221Bo5221BJ221BC221Bf5221Bg4221BI221BC221BT221BQ221BZ5221Be5221BN221B5221Bf4221Ba5221B5221A221B3221BX4221BN221Be5221BN221B5221Bf4221Bc5221BC221BN221BL221BQ221B5221Bt4221B-4221B1221Bx4221Be5221BN221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221Ba4221BW1221BH221B7221B2221BC221BQ221Bn5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221x2a5x3n4t3L1BP221B1221x2h33o4y1s41BR221A221Be3221Be1221B5221Bf4221B-4221B6221BV221BZ4221Ba4221B6221B4221B4221BA221BA221Bb5221Bc5221B4221Bb1221Ba1221BF221BQ221Bn5221Bk4221BA221B6221BG221BR221BA221BD221Bj4221x2a5_1r6x1r41BP221B1221x3jiDfcDecDa6l_2ccD33mfIccD3v3zz4xwVr5m_2rwV1BM221Be1221BH221BG221Bd5221Bu2221Bc2221BN221BG22");
+replay.events.push("1x3q-VHgwVs5l_2swV4v3t_VbwVs1m_2_vV1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bk4221BM221BH221B9221Bd4221B-4221BH221Bh4221Ba5221B5221A221B3221BC221Bb5221Be5221BN221BD221Bc1221Bd5221Bc4221BO221B1221BC221B3221B5221B5221Bt4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bh4221Bd2221A221Bq4221Be1221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221B-4221BH221Bh4221Be5221BN221B2221BK221Bb5221Ba5221B5221A221B3221Bv4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bw4221B4221B8221BZ1221BG221BB221Bb4221Be4221B2221BM221BD221BB221BY1221BL221BA221BD221Bj4221BY4221BX4221BE221BC221BB221BD221Bc5221BC221BN221BL221BQ221B5221Bx3221x3xyVz7eoVr1l_2WwV11ewVB_1W3KKFX321_1_2JJGY318v3boVlrAX6ihBfrA2v3wuVpyK2xh8pyK1B2221B6221B4221BN221x3juV7iyK1yh8qyK1BC222h3ytV1fyKxh8dyK1B7221Ba1221B2221h3vuV3ayKyh8eyK1BA222x3kuV3XyK2xh8zxK1B7221BC221B1221BN221x3ttV3wxK1yh8-xK1BC222h3guV5txKxh8nxK1BZ1221BS221B2221f3ZuVoxKyh8oxK");
+replay.modes.push([27583, "input"]);
+replay.modes.push([27589, "output"]);
+replay.events.push("1_3mnVx9r9m6Qrh8s619w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n12221n12621n12421n12N21z1egDqcD8592xBY2qeDn_Ch3m_2h_C1GXn21Ba3221Bb5221Bo5221BJ221BC221Bf5221Bg4221BI221BC221BT221BQ221BZ5221Be5221BN221B5221Bf4221Ba5221B5221A221B3221BX4221BN221Be5221BN221B5221Bf4221B-4221B6221BV221BZ4221Ba4221BW1221BH221B7221B2221BC221BQ221Bn5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221x2a5x2r9t2v61BP221B1221x2h33s9w3w91BR221A221Be3221Be1221B5221Bf4221By4221BE221BF221BL221B6221BQ221BZ5221B-4221B1221Bx4221Be5221BN221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221Bi5221BP221BD221BW1221BX1221Bc1221BT221BS221Bb5221Bc5221B2221B3221BX1221BQ221BD221B3221BE221BQ221Bn5221Ba4221B6221BI221BH221B7221Bc1221BN221Bl4221Bo5221BJ221BC221B5221BZ5221Bi4221B1221A221BU221Bh4221_2Rz32a2X2Y61A221Be3221Be1221B5221Bf4221B-4221B6221BV221BZ4221Bc5221BR221A221BG221BC221Bb5221Be5221B9221Bz4221Bk4221B3221BU221Bd5221Bu4221B5221B3221B2221BO221BT221BQ221Bd4221x3TOsqCi4l_2gsC27aW5p21");
+replay.events.push("3v3ry4yyUr5m_2azU1BM221Be1221BH221BG221Bd5221Bu2221Bc2221BN221BG221x3ksUHjzUs5l_2ZzU4v3ntUozUy1m_2wzU1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bk4221BM221BH221B9221Bd4221B-4221BH221Bh4221Ba5221B5221A221B3221BC221Bb5221Be5221BN221BD221Bc1221Bd5221Bc4221BO221B1221BC221B3221B5221B5221Bt4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bh4221Bd2221A221Bq4221Be1221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221B-4221BH221Bh4221Be5221BN221B2221BK221Bb5221Ba5221B5221A221B3221Bv4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bw4221B4221B8221BZ1221BG221BB221Bb4221Be4221B2221BM221BD221BB221BY1221BL221BA221BD221Bj4221Be5221BN221B5221Bf4221By4221BE221BF221BL221B6221BQ221BZ5221BE221BK221A221BJ221BE221x3-wUZ8rbVx1l_2vzU11nzUB_1W3KKHX321_1_2JJIY318v3wbVvtAX6ihBntA2v3b_UhYM2xh8hYM1B2221B6221B4221BN221x3o_U7aYM1yh8iYM1BC222h3ZWV1XYMxh8_XM1B7221Ba1221B2221h3c_U3yXMyh8WYM1BA222x3n_U3vXM2xh8rXM1B722");
+replay.modes.push([27954, "input"]);
+replay.modes.push([27960, "output"]);
+replay.text.push("neath your feet.  The orb seems to get lighter.\n\n== Vault Lock ==\nYou are in a grid of rooms that control the door to the vault.\n\nThe floor of this room is a large mosaic depicting the number '18'.\n\nThere are 3 exits:\n- north\n- south\n- west\n\nWhat do you do?\nwest\n\n\nAs you enter the room, the symbol on the floor briefly flashes red.  The orb begins subtly glowing red.\n\n== Vault Lock ==\nYou are in a grid of rooms that control the door to the vault.\n\nThe floor of this room is a large mosaic depicting a '-' symbol.\n\nThere are 4 exits:\n- north\n- east\n- south\n- west\n\nWhat do you do?\nnorth\n\n\nAs you enter the room, the orb briefly flashes red.  The number on the floor vibrates strangely beneath your feet.  The orb seems to get lighter.\n\n== Vault Lock ==\nYou are in a grid of rooms that control the door to the vault.\n\nThe floor of this room is a large mosaic depicting the number '11'.\n\nThere are 4 exits:\n- north\n- east\n- south\n- west\n\nWhat do you do?\nnorth\n\n\nAs you enter the room, the symbol on t");
+replay.keyframes.push([28000, 139940, 27999, [116, 37, 0, 26062, 63, 1528, 26024, 25734], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 32767, 0, 0, 2643, 0, 0, 2573]]);
+replay.events.push("1BC221B1221BN221x3eWV3oXM1yh8sXM1BC222h3r_U5lXMxh8fXM1BZ1221BS221B2221f3y_UgXMyh8gXM1_3lcVx9r9u8Qrh8-819w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12I21n12221n12621n12421n12N21z1egDqcDA592xBY2qeDtbDh2m_2lbD1Gjm21Ba3221Bb5221Bo5221BJ221BC221Bf5221Bg4221BI221BC221BT221BQ221BZ5221Be5221BN221B5221Bf4221Ba5221B5221A221B3221BX4221BN221Be5221BN221B5221Bf4221Bc5221BC221BN221BL221BQ221B5221Bt4221B-4221B1221Bx4221Be5221BN221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221Ba4221BW1221BH221B7221B2221BC221BQ221Bn5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221x2a5x3n4t3L1BP221B1221x2h33o4y1s41BR221A221Be3221Be1221B5221Bf4221B-4221B6221BV221BZ4221Ba4221B6221B4221B4221BA221BA221Bb5221Bc5221B4221Bb1221Ba1221BF221BQ221Bn5221Bk4221BA221B6221BG221BR221BA221BD221Bj4221x2a5_1r6x1r41BP221B1221x3jiDfcDgcDa6l_2ccD33WdIccD3v3jx4yjTr5m_2akT1BM221Be1221BH221BG221Bd5221Bu2221Bc2221BN221BG221x3kdTHjkTs5l_2ZkT4v3neTokTs1m_2wkT1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo422");
+replay.modes.push([28272, "input"]);
+replay.events.push("1BA221Bx4221BY4221BX4221Bk4221BM221BH221B9221Bd4221B-4221BH221Bh4221Ba5221B5221A221B3221BC221Bb5221Be5221BN221BD221Bc1221Bd5221Bc4221BO221B1221BC221B3221B5221B5221Bt4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bh4221Bd2221A221Bq4221Be1221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221B-4221BH221Bh4221Be5221BN221B2221BK221Bb5221Ba5221B5221A221B3221Bv4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bw4221B4221B8221BZ1221BG221BB221Bb4221Be4221B2221BM221BD221BB221BY1221BL221BA221BD221Bj4221BY4221BX4221BE221BC221BB221BD221Bc5221BC221BN221BL221BQ221B5221Bx3221x3-hTz7lsTr1l_2vkT11pkTB_1W3KKFZ321_1_2JJGa318v3ssTzvAZ6ihBrvA2v3nmTjlN2xh8jlN1B7221Ba1221B2221x3qlT5elN1yh8klN1BA222x3_lT1blN4xh8ZlN1B7221BC221B1221BN221x3smT5-kN3yh8alN1BC222x3ZmT3xkN2xh8tkN1BZ1221BS221B2221x3gmT1skN1yh8ukN1_3zsTv9r9-ASrh8YB19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1X1221n12721n12a12");
+replay.modes.push([28277, "output"]);
+replay.events.push("1n12221z1ggDqcDAT72xBY2qeDp_Ch3m_2h_C1Gom21Ba3221Bb5221Bo5221BJ221BC221Bf5221Bg4221BI221BC221BT221BQ221BZ5221Be5221BN221B5221Bf4221Ba5221B5221A221B3221BX4221BN221Be5221BN221B5221Bf4221B-4221B6221BV221BZ4221Ba4221BW1221BH221B7221B2221BC221BQ221Bn5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221x2a5x2r9t2v61BP221B1221x2h33s9w3w91BR221A221Be3221Be1221B5221Bf4221By4221BE221BF221BL221B6221BQ221BZ5221B-4221B1221Bx4221Be5221BN221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221Bi5221BP221BD221BW1221BX1221Bc1221BT221BS221Bb5221Bc5221B2221B3221BX1221BQ221BD221B3221BE221BQ221Bn5221Ba4221B6221BI221BH221B7221Bc1221BN221Bl4221Bo5221BJ221BC221B5221BZ5221Bi4221B1221A221BU221Bh4221_2Rz32a2X2Y61A221Be3221Be1221B5221Bf4221B-4221B6221BV221BZ4221Bc5221BR221A221BG221BC221Bb5221Be5221B9221Bz4221Bk4221B3221BU221Bd5221Bu4221B5221B3221B2221BO221BT221BQ221Bd4221x3V2qqCi4l_2gsC2_3c2z11ZpCf4m_2zoC1Ba3221Bb5221Bo5221BJ221BC221Bf5221BY4221BU221A221B4221B5221BR221B4221BA221Bl4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG22");
+replay.events.push("1Bd5221Be4221BM221A221B6221Bh4221BN221x2e5z1m5Mk71BN221B5221Bf4221By4221BE221BF221BL221B6221BQ221BZ5221B-4221B1221Bx4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bd5221Be4221BM221A221B6221BZ5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221Bk5221BT221B2221BM221BT221Bd4221x21p2i6o5W91A221Be3221Be1221B5221Bf4221Bm4221BE221BC221B5221BL221BA221BL221Ba1221A221Bb5221Bo4221BK221Bb5221Bc5221B2221BL221B6221A221Bt4221Ba5221B6221BD221A221B9221BA221BD221Bh4221B1221A221Bo2221Bs2221Bd5221Bi4221BC221BL221Ba1221BL221B5221BS221Bb5221Bk5221BT221B2221BM221BT221Bd4221B1221A221Bo3221Bi1221BC221Bf5221Bm4221B5221B7221BY1221BZ5221BY4221BX4221Bc4221BI221B5221BB221BG221Br4221Bi4221BO221B5221B3221Bv4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bd5221Be4221BM221A221B6221Bd4221BR221A221Be3221Be1221B5221Bf4221B-4221B6221BV221BZ4221Bg4221BY1221Bf1221BU221B1221B6221BX1221Bc1221BT221BS221Bb5221B-4221BC221B1221Bd5221B-4221BH221Bh4221Bm4221BE221BC221B5221BZ5221Bm4221BD221BQ221BJ221BU221Bf4221Bd2221A221xBmW5b8mwBz1l_2mYC1C__V");
+replay.events.push("3v3tx4stTr5m_2ytT1BM221Be1221BH221BG221Bd5221Be2221Bs2221A221B6221x3umTHduTs5l_2xtT4v3foTiuTY9m_2ouT1Bi1221BC221Bf5221Bc5221B2221Bb1221BQ221BJ221Bd4221Ba4221B6221B2221BI221B6221BP221Bf4221Be5221BN221B5221Bf4221Be4221BM221A221B6221BZ5221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bi5221Bf1221Be1221BH221BG221Bn3221Br1221Bo4221BM221Bd5221Bm4221BD221Ba1221Bb5221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221BE221BO221B5221BH221BD221Bc4221B3221BY1221B8221BX1221B1221Bd4221Bo4221BA221BC221B9221Bz4221Bo4221BM221Bh4221BR221A221BY2221Bg2221A221B6221BU221Bb1221B1221Bd4221Be5221B9221Bz4221Be5221BN221B5221Bf4221Bk5221Bh1221BM221A221Bt4221By4221BH221B7221BY1221BZ5221Be5221BN221B5221Bf4221Be4221BM221A221B6221Bh4221BN221Be5221BN221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221Ba5221B6221BD221A221B9221BA221BD221Bj4221Bm4221BE221BC221B5221BL221BA221BL221Ba1221A221Bb5221Bk5221BT221B2221BB221BA221Bl4221By4221BH221BY1221BX1221BQ221BZ5221Bc5221BR221A221BG221BC221Bb5221Be5221B9221Bz4221Ba5221B6221BD221Bx4221B-422");
+replay.modes.push([28957, "input"]);
+replay.modes.push([28963, "output"]);
+replay.events.push("1BC221B1221Bd5221B-4221BH221Bh4221Bc5221BZ1221BQ221BJ221Bh3221Bd2221A221Bq4221Be1221B5221Bf4221Bi4221BC221B6221A221B6221BZ5221B-4221BH221Bh4221Be5221BN221B2221BK221Bb5221Ba5221B5221A221B3221Bv4221Bo4221BK221Bb5221BY4221BX4221Bu4221BL221BY1221BL221B3221Bf4221Bw4221B4221B8221BZ1221BG221BB221Bb4221Be4221B2221BM221BD221BB221BY1221BL221BA221BD221Bj4221Be5221BN221B5221Bf4221By4221BE221BF221BL221B6221BQ221BZ5221BE221BK221BJ221BE221x3srTfFrdUX9l_2nuT11huTB_1W3KKDZ321_1_2JJEa318v3wdUhvAZ6ihBbvA2v3vWUv-M4xh8v-M1B7221BC221B1221BN221x3mXU7o-M3yh8w-M1BC222x3zWU1l-M2xh8j-M1BZ1221BS221B2221x3aXU3g-M1yh8k-M1BA222x3fXU3d-M4xh8Z-M1Bf1221Be1221BH221BG221x3kXU3W-M3yh8a-M1_3XeUv9r9kASrh8oA19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12Y121n12f121n12e121n12H21n12G21z1egDqcD8T92h8cZ5qeD21Gpo23v3v_4l-T_5m_2d-T1BM221Be1221BH221BG221x3lbU7e-TW6l_2e-T4v3mZUZ-T-6m_2xzT1Be1221B2221BK221Bb5221Bi5221Bf1221Be1221BH221BG221Bd5221Bc4221BO221B1221BC221Bb1221BG221BA22");
+replay.text.push("he floor briefly flashes red.  The orb begins subtly glowing red.\n\n== Vault Lock ==\nYou are in a grid of rooms that control the door to the vault.\n\nThe floor of this room is a large mosaic depicting a '-' symbol.\n\nThere are 3 exits:\n- east\n- south\n- west\n\nWhat do you do?\neast\n\n\nAs you enter the room, the orb briefly flashes red.  The number on the floor vibrates strangely beneath your feet.  The orb seems to get lighter.\n\nAs you approach the vault door, the number on the vault door flashes white!  The hourglass is still running!  It flashes white!  You hear a click from the vault door.  The orb evaporates out of hour hands.\n\n== Vault Door ==\nYou stand before the door to the vault; it has a large '30' carved into it.  Affixed to the wall near the door, there is a running hourglass which never seems to run out of sand.\n\nThe floor of this room is a large mosaic depicting the number '1'.\n\nThere are 3 exits:\n- south\n- west\n- vault\n\nWhat do you do?\nvault\n\n\n== Vault ==\nThis vault contains inc");
+replay.keyframes.push([29000, 145533, 28999, [99, 22, 0, 17465, 212, 1528, 17442, 25734], [0, 32767, 32767, 0, 32767, 32767, 32767, 32767, 32767, 32767, 32767, 0, 32767, 2643, 0, 0, 2643]]);
+replay.events.push("1BA221Bb5221Bo4221BA221BL221BU221BP221B1221BA221BD221BK221BD221Bf4221Ba5221BH221BB221BA221B5221BS221BZ5221B1221A221BW3221Bo1221B6221BD221BS221Bb5221B-4221BH221Bh4221Bk4221BG221B5221BF221Bd4221BY4221BQ221BJ221Bd4221BW5221B7221BL221Bc1221BL221BA221BE221BF221Bv4221Bc4221BO221BB221BA221BA221Bb5221Bc5221B4221B5221A221B5221BC221BD221BJ221Bd4221Bo5221BJ221BC221Bn4221BN221BY4221BQ221BJ221Bd4221Be5221BN221B5221Bf4221Bk5221Bh1221BM221A221BE221Bb5221BY4221BY1221BP221Bf4221BY4221B6221BM221B6221B7221BH221B1221Bd4221Bk5221BR221BM221BN221Bl4221Be5221B9221B2221BT221Bo1221Bf1221BS221Bj4221BN221Ba5221B6221Bb1221BE221B7221BS221Bj4221BN221Bc5221BZ1221BU221A221BF221B2221BI221BP221BS221Bj4221BN221Bg4221BG221BF221BQ221BX1221BM221BF221BU221Bj4221BN221B-4221B2221BT221BM221BE221Bj4221BN221Be4221BA221B6221B5221BM221BN221B2221BO221BF221Bv4221Bc4221BU221BE221BB221B2221Bb1221BM221BE221Bj4221BN221Bg4221BE221BD221BQ221BH221BO221BF221B_3221B8221A221B8221BH221BN221BY4221BQ221BJ221Bd4221Bg5221BD221B2221BP221Ba1221Bb1221BG22");
+replay.modes.push([29268, "input"]);
+replay.modes.push([29280, "output"]);
+replay.modes.push([29306, "input"]);
+replay.modes.push([29317, "output"]);
+replay.events.push("1BA221B9221BO221BF221Bz3221x3tWUbD-mTz6l_2yzT1_3m-Tu_Hu_HfiAr4s_2XiA19q4219e12192219A219D219O219b5219-4219H219h4219o4219A219C219T219Q219P219S2192219d5219m42195219Q219P219r2219_221_3_iQv-HnwCmgAJqm8p42x3cpQThiQJvm8rxF1B7221BI221A221B5221B6221x3lpQKYiQKwm8sxF1_3kiQTZb58g5fmBsmAA_1W3KIBd321_1_2JHCe317v3pmTnoAd6ihBfoA2v3gtTd-I8xh8d-I1BD221B7221Bg1221BX1221x3xsT7W-I7yh8e-I1_3cnTr9t9s3W1rh8s319w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12U21n12b121n12K21n12B21n12f421n12w421n12721n12I21X1221n12521n12621z1yfDqcDAPL2_Be3feNYlRxc9x5s_2pc91D019Q219K219B219I219_3219d221-2tuRtuRhe1K_d119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12W121n12321n12R21n12f421n12w421n12721n12I21X1221n12521n12621z1-fDycDCPJ2_3o3ZWA_eNly5c5s_2by519i1219C219f5219k4219B219o1219f1219f4219o4219A219C2199219z4219e5219N2195219f4219w42197219I21821952196219h4219N219Y4219Q219J219d4219o5219J219C219f5219c5219R218219f4219o5219J2");
+replay.events.push("19C21952192219R219E219B219h4219k4219B219o1219X1219A219D219j4219a421912194219G219v3219R218219a2219c32191219d5219k5219h1219G219M219b52191218219o2219s2219d5219u421962182197219G219b5219u421952194219B219f4219c521972193219F219K2191219H219f4219k521992195219A219T219f4219-42191219x4219o5219J219C2195219Z5219i4219921942194219f4219k5219T21922196219D219f4219o5219J219C219f5219k5219Z1219Q219P219f4219g5219D219L219O2191219A219V219C219C219C2193219b5219-42191219x4219e5219N2195219f4219a4219621972194219A219j42191218219e3219e1219K2195219C219R2192219l4219e5219N2195219f4219w42197219I21821952196219h4219N219o5219J219C219f5219c5219R218219f4219421_3k3ueNWfNwlHtA5exH1Bm1221Bv1221Bs1221BB221BX1221Bk1221Bp1221Bk1221Bj1221BB221BK221_3j3Zg1rf1ZmHs56jlH193219c5219V219U219X1219i1219L219D2191219d4219o4219A219x4219c4219A219D219Y1219T219O219R219M219t4219-42191219x4219o5219J219C2195219Z5219i4219I2196219P2196219521972196219h3219d2218219o3219u22191219D219M219X1219c12192219H219L219c1219L219C2191219A219l3219r1219o5219J219C219f52");
+replay.modes.push([29726, "input"]);
+replay.modes.push([29743, "output"]);
+replay.modes.push([29772, "code"]);
+replay.modes.push([29784, "output"]);
+replay.codes.push([29772, "YOUlUoXioTpY"]);
+replay.modes.push([29804, "input"]);
+replay.modes.push([29810, "output"]);
+replay.text.push("redible riches!  Piles of gold and platinum coins surround you, and the walls are adorned with topazes, rubies, sapphires, emeralds, opals, dilithium crystals, elerium-115, and unobtainium.\n\nThings of interest here:\n- mirror\n\nThere is 1 exit:\n- leave\n\nWhat do you do?\ntake mirror\n\n\nTaken.\n\nWhat do you do?\nuse mirror\n\n\nYou gaze into the mirror, and you see yourself gazing back.  But wait!  It looks like someone wrote on your face while you were unconscious on the beach!  Through the mirror, you see \"YqToiXoUlUOY\" scrawled in charcoal on your forehead.\n\nCongratulations; you have reached the end of the challenge!\n\n\nWhat do you do?\n# That code is reflected in a mirror, using a helper to decode it to reveal the final code\n! reverse_mirror\n> The code in the mirror is \"YOUlUoXioTpY\"\n# We're all done!\n! end\n> Goodbye!\n");
+replay.events.push("19m4219D219g1219X1219f4219a5219P21972194219A21952191219d4219e5219N2195219f4219g4219I219J219d4219-4219H219h4219e5219N2195219f4219c4219A219D219M218219D219I219D2193219d4219j121821-2uVuVpa5h5d-419w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA");
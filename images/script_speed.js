@@ -1,419 +1,100 @@
-var script = '';
-script += '~r00,10,20,30,40,50,60,70~# A "speedrun" through this challenge\n# The first code is in the machine '
-script += 'spec itself\n~minput~! type arch-spec:30,30\n~moutput~> - Here\'s a code for the challenge website: '
-script += '~mcode~fbCcIPhFoGGd~moutput~\n# Running the machine now will reveal the second and third code\n~minput~'
-script += '! run\n~v26902452,27222643,26942473,27262488,26982483,27182623,27322317,27302553,26702317,27022468,26742357,27062478,267832767,27102463,27142488,268232767,26862417~'
-script += '~moutput~Welcome to the Synacor Challenge!\nPlease record your progress by putting codes like\nthis '
-script += 'one into the challenge website: ~mcode~KtYzSlsHSBIz~moutput~\n\nExecuting self-test...\n\n~r0115,26124,36081,435,51528,66080~'
-script += 's~r0101,11,36082~e~r0108,12,36083~l~r0102,13,36084~f~r045,14,36085~-~r0116,15,36086~t~r0101,16,36087~'
-script += 'e~r0115,17,36088~s~r0116,18,36089~t~r032,19,36090~ ~r099,110,36091~c~r0111,111,36092~o~r0109,112,36093~'
-script += 'm~r0112,113,36094~p~r0108,114,36095~l~r0101,115,36096~e~r0116,116,36097~t~r0101,117,36098~e~r044,118,36099~'
-script += ',~r032,119,36100~ ~r097,120,36101~a~r0108,121,36102~l~r122,36103~l~r032,123,36104~ ~r0116,124,36105~'
-script += 't~r0101,125,36106~e~r0115,126,36107~s~r0116,127,36108~t~r0115,128,36109~s~r032,129,36110~ ~r0112,130,36111~'
-script += 'p~r097,131,36112~a~r0115,132,36113~s~r133,36114~s~r010,134,36115~\n~r084,17799,27799,326852,448,51531,626851~'
-script += 'T~r0104,326853~h~r0101,326854~e~r032,326855~ ~r0115,326856~s~r0101,326857~e~r0108,326858~l~r0102,326859~'
-script += 'f~r045,326860~-~r0116,326861~t~r0101,326862~e~r0115,326863~s~r0116,326864~t~r032,326865~ ~r099,326866~'
-script += 'c~r0111,326867~o~r0109,326868~m~r0112,326869~p~r0108,326870~l~r0101,326871~e~r0116,326872~t~r0105,326873~'
-script += 'i~r0111,326874~o~r0110,326875~n~r032,326876~ ~r099,326877~c~r0111,326878~o~r0100,326879~d~r0101,326880~'
-script += 'e~r032,326881~ ~r0105,326882~i~r0115,326883~s~r058,326884~:~r032,326885~ ~r0111,326886~~mcode~o~r078,326887~'
-script += 'N~r084,326888~T~r070,326889~F~r0109,326890~m~r0111,326891~o~r0105,326892~i~r084,326893~T~r082,326894~'
-script += 'R~r084,326895~T~r077,326896~M~r071,326897~G~moutput~~r010,326898~\n~r326899~\n~r02317,10,26124,31,4101,50,60~'
-script += '== ~r070,36143,49,51528,66142~F~r0111,11,36144~o~r12,36145~o~r0116,13,36146~t~r0104,14,36147~h~r0105,15,36148~'
-script += 'i~r0108,16,36149~l~r17,36150~l~r0115,18,36151~s~r06142,10,31,4101,50,60~ ==\n~r089,36153,4183,51528,66152~'
-script += 'Y~r0111,11,36154~o~r0117,12,36155~u~r032,13,36156~ ~r0102,14,36157~f~r0105,15,36158~i~r0110,16,36159~'
-script += 'n~r0100,17,36160~d~r032,18,36161~ ~r0121,19,36162~y~r0111,110,36163~o~r0117,111,36164~u~r0114,112,36165~'
-script += 'r~r0115,113,36166~s~r0101,114,36167~e~r0108,115,36168~l~r0102,116,36169~f~r032,117,36170~ ~r0115,118,36171~'
-script += 's~r0116,119,36172~t~r097,120,36173~a~r0110,121,36174~n~r0100,122,36175~d~r0105,123,36176~i~r0110,124,36177~'
-script += 'n~r0103,125,36178~g~r032,126,36179~ ~r097,127,36180~a~r0116,128,36181~t~r032,129,36182~ ~r0116,130,36183~'
-script += 't~r0104,131,36184~h~r0101,132,36185~e~r032,133,36186~ ~r098,134,36187~b~r097,135,36188~a~r0115,136,36189~'
-script += 's~r0101,137,36190~e~r032,138,36191~ ~r0111,139,36192~o~r0102,140,36193~f~r032,141,36194~ ~r097,142,36195~'
-script += 'a~r0110,143,36196~n~r032,144,36197~ ~r0101,145,36198~e~r0110,146,36199~n~r0111,147,36200~o~r0114,148,36201~'
-script += 'r~r0109,149,36202~m~r0111,150,36203~o~r0117,151,36204~u~r0115,152,36205~s~r032,153,36206~ ~r0109,154,36207~'
-script += 'm~r0111,155,36208~o~r0117,156,36209~u~r0110,157,36210~n~r0116,158,36211~t~r097,159,36212~a~r0105,160,36213~'
-script += 'i~r0110,161,36214~n~r046,162,36215~.~r032,163,36216~ ~r164,36217~ ~r065,165,36218~A~r0116,166,36219~'
-script += 't~r032,167,36220~ ~r0105,168,36221~i~r0116,169,36222~t~r0115,170,36223~s~r032,171,36224~ ~r098,172,36225~'
-script += 'b~r097,173,36226~a~r0115,174,36227~s~r0101,175,36228~e~r032,176,36229~ ~r0116,177,36230~t~r0111,178,36231~'
-script += 'o~r032,179,36232~ ~r0116,180,36233~t~r0104,181,36234~h~r0101,182,36235~e~r032,183,36236~ ~r0110,184,36237~'
-script += 'n~r0111,185,36238~o~r0114,186,36239~r~r0116,187,36240~t~r0104,188,36241~h~r044,189,36242~,~r032,190,36243~'
-script += ' ~r0116,191,36244~t~r0104,192,36245~h~r0101,193,36246~e~r0114,194,36247~r~r0101,195,36248~e~r032,196,36249~'
-script += ' ~r0105,197,36250~i~r0115,198,36251~s~r032,199,36252~ ~r097,1100,36253~a~r032,1101,36254~ ~r0109,1102,36255~'
-script += 'm~r097,1103,36256~a~r0115,1104,36257~s~r1105,36258~s~r0105,1106,36259~i~r0118,1107,36260~v~r0101,1108,36261~'
-script += 'e~r032,1109,36262~ ~r0100,1110,36263~d~r0111,1111,36264~o~r1112,36265~o~r0114,1113,36266~r~r0119,1114,36267~'
-script += 'w~r097,1115,36268~a~r0121,1116,36269~y~r046,1117,36270~.~r032,1118,36271~ ~r1119,36272~ ~r065,1120,36273~'
-script += 'A~r032,1121,36274~ ~r0115,1122,36275~s~r0105,1123,36276~i~r0103,1124,36277~g~r0110,1125,36278~n~r032,1126,36279~'
-script += ' ~r0110,1127,36280~n~r0101,1128,36281~e~r097,1129,36282~a~r0114,1130,36283~r~r098,1131,36284~b~r0121,1132,36285~'
-script += 'y~r032,1133,36286~ ~r0114,1134,36287~r~r0101,1135,36288~e~r097,1136,36289~a~r0100,1137,36290~d~r0115,1138,36291~'
-script += 's~r032,1139,36292~ ~r034,1140,36293~"~r075,1141,36294~K~r0101,1142,36295~e~r1143,36296~e~r0112,1144,36297~'
-script += 'p~r032,1145,36298~ ~r0111,1146,36299~o~r0117,1147,36300~u~r0116,1148,36301~t~r033,1149,36302~!~r032,1150,36303~'
-script += ' ~r1151,36304~ ~r068,1152,36305~D~r0101,1153,36306~e~r0102,1154,36307~f~r0105,1155,36308~i~r0110,1156,36309~'
-script += 'n~r0105,1157,36310~i~r0116,1158,36311~t~r0101,1159,36312~e~r0108,1160,36313~l~r0121,1161,36314~y~r032,1162,36315~'
-script += ' ~r0110,1163,36316~n~r0111,1164,36317~o~r032,1165,36318~ ~r0116,1166,36319~t~r0114,1167,36320~r~r0101,1168,36321~'
-script += 'e~r097,1169,36322~a~r0115,1170,36323~s~r0117,1171,36324~u~r0114,1172,36325~r~r0101,1173,36326~e~r032,1174,36327~'
-script += ' ~r0119,1175,36328~w~r0105,1176,36329~i~r0116,1177,36330~t~r0104,1178,36331~h~r0105,1179,36332~i~r0110,1180,36333~'
-script += 'n~r033,1181,36334~!~r034,1182,36335~"~r06152,10,31,4101,50,60~\n~r010,19212,29212,327456,426,51531,627455~'
-script += '\n~r084,327457~T~r0104,327458~h~r0105,327459~i~r0110,327460~n~r0103,327461~g~r0115,327462~s~r032,327463~'
-script += ' ~r0111,327464~o~r0102,327465~f~r032,327466~ ~r0105,327467~i~r0110,327468~n~r0116,327469~t~r0101,327470~'
-script += 'e~r0114,327471~r~r0101,327472~e~r0115,327473~s~r0116,327474~t~r032,327475~ ~r0104,327476~h~r0101,327477~'
-script += 'e~r0114,327478~r~r0101,327479~e~r058,327480~:~r010,327481~\n~r018062,10,22317,31,416,55893,627381~- '
-script += '~r0116,318063,46,51528,618062~t~r097,11,318064~a~r098,12,318065~b~r0108,13,318066~l~r0101,14,318067~'
-script += 'e~r0116,15,318068~t~r018062,10,31,416,55893,627381~\n~r02,20,4101,50,60~\nThere are ~r050,110,210,332766,450,51~'
-script += '2~r02,10,20,31,4101,50~ exits:\n~r06336,326901,42,55814,626900~- ~r0100,36337,47,51528,66336~d~r0111,11,36338~'
-script += 'o~r12,36339~o~r0114,13,36340~r~r0119,14,36341~w~r097,15,36342~a~r0121,16,36343~y~r06336,10,326901,42,55814,626900~'
-script += '\n~r06344,11,326902~- ~r0115,10,36345,45,51528,66344~s~r0111,11,36346~o~r0117,12,36347~u~r0116,13,36348~'
-script += 't~r0104,14,36349~h~r06344,11,326902,42,55814,626900~\n~r010,132613,232613,327415,417,51531,627414~\n'
-script += '~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~~minput~t~r025976,4116,51~a~r025977,497,52~'
-script += 'k~r025978,4107,53~e~r025979,4101,54~ ~r025980,432,55~t~r025981,4116,56~a~r025982,497,57~b~r025983,498,58~'
-script += 'l~r025984,4108,59~e~r025985,4101,510~t~r025986,4116,511~\n~r032,26124,31,4101,50~~moutput~\n\n~r084,114065,214065,328055,47,51531,628054~'
-script += '~v26700~T~r097,328056~a~r0107,328057~k~r0101,328058~e~r0110,328059~n~r046,328060~.~r010,328061~\n~r132613,232613,327415,417,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~# Using the tablet reveals the fo'
-script += 'urth code\n~minput~u~r025976,4117,51~s~r025977,4115,52~e~r025978,4101,53~ ~r025979,432,54~t~r025980,4116,55~'
-script += 'a~r025981,497,56~b~r025982,498,57~l~r025983,4108,58~e~r025984,4101,59~t~r025985,4116,510~\n~r032,24,36,4101,50~'
-script += '~moutput~\n\n~r089,114053,214053,328370,427,51531,628369~Y~r0111,328371~o~r0117,328372~u~r032,328373~'
-script += ' ~r0102,328374~f~r0105,328375~i~r0110,328376~n~r0100,328377~d~r032,328378~ ~r0121,328379~y~r0111,328380~'
-script += 'o~r0117,328381~u~r0114,328382~r~r0115,328383~s~r0101,328384~e~r0108,328385~l~r0102,328386~f~r032,328387~'
-script += ' ~r0119,328388~w~r0114,328389~r~r0105,328390~i~r0116,328391~t~r0105,328392~i~r0110,328393~n~r0103,328394~'
-script += 'g~r032,328395~ ~r034,328396~"~r077,10,232767,36130,412,51528,66129~~mcode~M~r066,11,36131~B~r084,12,36132~'
-script += 'T~r0100,13,36133~d~r071,14,36134~G~r0103,15,36135~g~r0117,16,36136~u~r0110,17,36137~n~r0100,18,36138~'
-script += 'd~r072,19,36139~H~r081,110,36140~Q~r071,111,36141~G~moutput~~r034,132127,232127,328402,451,51531,628401~'
-script += '"~r032,328403~ ~r0111,328404~o~r0110,328405~n~r032,328406~ ~r0116,328407~t~r0104,328408~h~r0101,328409~'
-script += 'e~r032,328410~ ~r0116,328411~t~r097,328412~a~r098,328413~b~r0108,328414~l~r0101,328415~e~r0116,328416~'
-script += 't~r046,328417~.~r032,328418~ ~r328419~ ~r080,328420~P~r0101,328421~e~r0114,328422~r~r0104,328423~h~r097,328424~'
-script += 'a~r0112,328425~p~r0115,328426~s~r032,328427~ ~r0105,328428~i~r0116,328429~t~r039,328430~\'~r0115,328431~'
-script += 's~r032,328432~ ~r0115,328433~s~r0111,328434~o~r0109,328435~m~r0101,328436~e~r032,328437~ ~r0107,328438~'
-script += 'k~r0105,328439~i~r0110,328440~n~r0100,328441~d~r032,328442~ ~r0111,328443~o~r0102,328444~f~r032,328445~'
-script += ' ~r099,328446~c~r0111,328447~o~r0100,328448~d~r0101,328449~e~r063,328450~?~r010,328451~\n~r328452~\n'
-script += '~r132613,232613,327415,417,627414~\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~'
-script += ' ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~'
-script += ' ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~# T'
-script += 'ransport to before the sign\n~minput~! set_memory 2732 2402\n~v27322402~~moutput~> Memory address 27'
-script += '32 set to 2402\n~minput~! set_memory 2733 2402\n~moutput~> Memory address 2733 set to 2402\n~minput~'
-script += '! set_memory 3726 24\n~moutput~> Memory address 3726 set to 24\n# This will show the fifth code\n~minput~'
-script += 'n~r025976,4110,51~o~r025977,4111,52~r~r025978,4114,53~t~r025979,4116,54~h~r025980,4104,55~\n~r032,23,36,4101,50~'
-script += '~moutput~\n\n~r067,130181,230181,328237,462,51531,628236~~v27322412~C~r0104,328238~h~r0105,328239~i~r0115,328240~'
-script += 's~r0101,328241~e~r0108,328242~l~r0101,328243~e~r0100,328244~d~r032,328245~ ~r0111,328246~o~r0110,328247~'
-script += 'n~r032,328248~ ~r0116,328249~t~r0104,328250~h~r0101,328251~e~r032,328252~ ~r0119,328253~w~r097,328254~'
-script += 'a~r0108,328255~l~r328256~l~r032,328257~ ~r0111,328258~o~r0102,328259~f~r032,328260~ ~r0111,328261~o~r0110,328262~'
-script += 'n~r0101,328263~e~r032,328264~ ~r0111,328265~o~r0102,328266~f~r032,328267~ ~r0116,328268~t~r0104,328269~'
-script += 'h~r0101,328270~e~r032,328271~ ~r0112,328272~p~r097,328273~a~r0115,328274~s~r328275~s~r097,328276~a~r0103,328277~'
-script += 'g~r0101,328278~e~r0119,328279~w~r097,328280~a~r0121,328281~y~r0115,328282~s~r044,328283~,~r032,328284~'
-script += ' ~r0121,328285~y~r0111,328286~o~r0117,328287~u~r032,328288~ ~r0115,328289~s~r0101,328290~e~r328291~e'
-script += '~r058,328292~:~r010,328293~\n~r328294~\n~r032,328295~ ~r328296~ ~r328297~ ~r328298~ ~r0101,10,232767,36130,412,51528,66129~'
-script += '~mcode~e~r0109,11,36131~m~r066,12,36132~B~r076,13,36133~L~r098,14,36134~b~r087,15,36135~W~r077,16,36136~'
-script += 'M~r0103,17,36137~g~r068,18,36138~D~r0104,19,36139~h~r0100,110,36140~d~r0115,111,36141~s~moutput~~r010,1738,2738,328304,443,51531,628303~'
-script += '\n~r328305~\n~r089,328306~Y~r0111,328307~o~r0117,328308~u~r032,328309~ ~r0116,328310~t~r097,328311~a'
-script += '~r0107,328312~k~r0101,328313~e~r032,328314~ ~r0110,328315~n~r0111,328316~o~r0116,328317~t~r0101,328318~'
-script += 'e~r032,328319~ ~r0111,328320~o~r0102,328321~f~r032,328322~ ~r0116,328323~t~r0104,328324~h~r0105,328325~'
-script += 'i~r0115,328326~s~r032,328327~ ~r097,328328~a~r0110,328329~n~r0100,328330~d~r032,328331~ ~r0107,328332~'
-script += 'k~r0101,328333~e~r328334~e~r0112,328335~p~r032,328336~ ~r0119,328337~w~r097,328338~a~r0108,328339~l~r0107,328340~'
-script += 'k~r0105,328341~i~r0110,328342~n~r0103,328343~g~r046,328344~.~r010,328345~\n~r328346~\n~r02417,10,20,35,4101,50,60~'
-script += '~v27322417~== ~r084,39099,415,51528,69098~T~r0119,11,39100~w~r0105,12,39101~i~r0115,13,39102~s~r0116,14,39103~'
-script += 't~r0121,15,39104~y~r032,16,39105~ ~r0112,17,39106~p~r097,18,39107~a~r0115,19,39108~s~r110,39109~s~r097,111,39110~'
-script += 'a~r0103,112,39111~g~r0101,113,39112~e~r0115,114,39113~s~r09098,10,35,4101,50,60~ ==\n~r089,39115,455,51528,69114~'
-script += 'Y~r0111,11,39116~o~r0117,12,39117~u~r032,13,39118~ ~r097,14,39119~a~r0114,15,39120~r~r0101,16,39121~'
-script += 'e~r032,17,39122~ ~r0105,18,39123~i~r0110,19,39124~n~r032,110,39125~ ~r097,111,39126~a~r032,112,39127~'
-script += ' ~r0109,113,39128~m~r097,114,39129~a~r0122,115,39130~z~r0101,116,39131~e~r032,117,39132~ ~r0111,118,39133~'
-script += 'o~r0102,119,39134~f~r032,120,39135~ ~r0116,121,39136~t~r0119,122,39137~w~r0105,123,39138~i~r0115,124,39139~'
-script += 's~r0116,125,39140~t~r0121,126,39141~y~r032,127,39142~ ~r0108,128,39143~l~r0105,129,39144~i~r0116,130,39145~'
-script += 't~r131,39146~t~r0108,132,39147~l~r0101,133,39148~e~r032,134,39149~ ~r0112,135,39150~p~r097,136,39151~'
-script += 'a~r0115,137,39152~s~r138,39153~s~r097,139,39154~a~r0103,140,39155~g~r0101,141,39156~e~r0115,142,39157~'
-script += 's~r044,143,39158~,~r032,144,39159~ ~r097,145,39160~a~r0108,146,39161~l~r147,39162~l~r032,148,39163~ '
-script += '~r097,149,39164~a~r0108,150,39165~l~r0105,151,39166~i~r0107,152,39167~k~r0101,153,39168~e~r046,154,39169~'
-script += '.~r09114,10,35,4101,50,60~\n~r010,19212,29212,327456,426,51531,627455~\n~r084,327457~T~r0104,327458~'
-script += 'h~r0105,327459~i~r0110,327460~n~r0103,327461~g~r0115,327462~s~r032,327463~ ~r0111,327464~o~r0102,327465~'
-script += 'f~r032,327466~ ~r0105,327467~i~r0110,327468~n~r0116,327469~t~r0101,327470~e~r0114,327471~r~r0101,327472~'
-script += 'e~r0115,327473~s~r0116,327474~t~r032,327475~ ~r0104,327476~h~r0101,327477~e~r0114,327478~r~r0101,327479~'
-script += 'e~r058,327480~:~r010,327481~\n~r018568,14,22417,31,416,55893,627381~- ~r099,10,318569,43,51528,618568~'
-script += 'c~r097,11,318570~a~r0110,12,318571~n~r018568,14,31,416,55893,627381~\n~r01,10,21,35,4101,50,60~\nThe'
-script += 're is ~r049,110,210,332767,449,51~1~r01,10,21,35,4101,50~ exit:\n~r09170,327040,41,55814,627039~- ~r0119,39171,44,51528,69170~'
-script += 'w~r0101,11,39172~e~r0115,12,39173~s~r0116,13,39174~t~r09170,10,327040,41,55814,627039~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~# While we don\'t need the coins,'
-script += ' we do need the values that get set when they\'re picked up, the transporter uses these for its code'
-script += 's\n~minput~! set_memory 27102 9\n~moutput~> Memory address 27102 set to 9\n~minput~! set_memory 2710'
-script += '3 2\n~moutput~> Memory address 27103 set to 2\n~minput~! set_memory 27104 5\n~moutput~> Memory addre'
-script += 'ss 27104 set to 5\n~minput~! set_memory 27105 7\n~moutput~> Memory address 27105 set to 7\n~minput~!'
-script += ' set_memory 27106 3\n~moutput~> Memory address 27106 set to 3\n# Pick up the teleporter\n~minput~! s'
-script += 'et_memory 2710 0\n~v27100~~moutput~> Memory address 2710 set to 0\n# Using the teleporter reveals th'
-script += 'e sixth code\n~minput~u~r025976,4117,51~s~r025977,4115,52~e~r025978,4101,53~ ~r025979,432,54~t~r025980,4116,55~'
-script += 'e~r025981,4101,56~l~r025982,4108,57~e~r025983,4101,58~p~r025984,4112,59~o~r025985,4111,510~r~r025986,4114,511~'
-script += 't~r025987,4116,512~e~r025988,4101,513~r~r025989,4114,514~\n~r032,20,35,4101,50~~moutput~\n\n~r089,117255,217255,329546,4117,51531,629545~'
-script += 'Y~r0111,329547~o~r0117,329548~u~r032,329549~ ~r097,329550~a~r099,329551~c~r0116,329552~t~r0105,329553~'
-script += 'i~r0118,329554~v~r097,329555~a~r0116,329556~t~r0101,329557~e~r032,329558~ ~r0116,329559~t~r0104,329560~'
-script += 'h~r0101,329561~e~r032,329562~ ~r0116,329563~t~r0101,329564~e~r0108,329565~l~r0101,329566~e~r0112,329567~'
-script += 'p~r0111,329568~o~r0114,329569~r~r0116,329570~t~r0101,329571~e~r0114,329572~r~r033,329573~!~r032,329574~'
-script += ' ~r329575~ ~r065,329576~A~r0115,329577~s~r032,329578~ ~r0121,329579~y~r0111,329580~o~r0117,329581~u~r032,329582~'
-script += ' ~r0115,329583~s~r0112,329584~p~r0105,329585~i~r0114,329586~r~r097,329587~a~r0108,329588~l~r032,329589~'
-script += ' ~r0116,329590~t~r0104,329591~h~r0114,329592~r~r0111,329593~o~r0117,329594~u~r0103,329595~g~r0104,329596~'
-script += 'h~r032,329597~ ~r0116,329598~t~r0105,329599~i~r0109,329600~m~r0101,329601~e~r032,329602~ ~r097,329603~'
-script += 'a~r0110,329604~n~r0100,329605~d~r032,329606~ ~r0115,329607~s~r0112,329608~p~r097,329609~a~r099,329610~'
-script += 'c~r0101,329611~e~r044,329612~,~r032,329613~ ~r0121,329614~y~r0111,329615~o~r0117,329616~u~r032,329617~'
-script += ' ~r0116,329618~t~r0104,329619~h~r0105,329620~i~r0110,329621~n~r0107,329622~k~r032,329623~ ~r0121,329624~'
-script += 'y~r0111,329625~o~r0117,329626~u~r032,329627~ ~r0115,329628~s~r0101,329629~e~r329630~e~r032,329631~ ~r097,329632~'
-script += 'a~r032,329633~ ~r0112,329634~p~r097,329635~a~r0116,329636~t~r329637~t~r0101,329638~e~r0114,329639~r~r0110,329640~'
-script += 'n~r032,329641~ ~r0105,329642~i~r0110,329643~n~r032,329644~ ~r0116,329645~t~r0104,329646~h~r0101,329647~'
-script += 'e~r032,329648~ ~r0115,329649~s~r0116,329650~t~r097,329651~a~r0114,329652~r~r0115,329653~s~r046,329654~'
-script += '.~r329655~.~r329656~.~r010,329657~\n~r329658~\n~r032,329659~ ~r329660~ ~r329661~ ~r329662~ ~r0105,10,232767,36130,412,51528,66129~'
-script += '~mcode~i~r0112,11,36131~p~r077,12,36132~M~r0108,13,36133~l~r0103,14,36134~g~r0114,15,36135~r~r0103,16,36136~'
-script += 'g~r068,17,36137~D~r0121,18,36138~y~r098,19,36139~b~r079,110,36140~O~r090,111,36141~Z~moutput~~r010,111636,211636,329668,489,51531,629667~'
-script += '\n~r329669~\n~r065,329670~A~r0102,329671~f~r0116,329672~t~r0101,329673~e~r0114,329674~r~r032,329675~'
-script += ' ~r097,329676~a~r032,329677~ ~r0102,329678~f~r0101,329679~e~r0119,329680~w~r032,329681~ ~r0109,329682~'
-script += 'm~r0111,329683~o~r0109,329684~m~r0101,329685~e~r0110,329686~n~r0116,329687~t~r0115,329688~s~r044,329689~'
-script += ',~r032,329690~ ~r0121,329691~y~r0111,329692~o~r0117,329693~u~r032,329694~ ~r0102,329695~f~r0105,329696~'
-script += 'i~r0110,329697~n~r0100,329698~d~r032,329699~ ~r0121,329700~y~r0111,329701~o~r0117,329702~u~r0114,329703~'
-script += 'r~r0115,329704~s~r0101,329705~e~r0108,329706~l~r0102,329707~f~r032,329708~ ~r098,329709~b~r097,329710~'
-script += 'a~r099,329711~c~r0107,329712~k~r032,329713~ ~r0111,329714~o~r0110,329715~n~r032,329716~ ~r0115,329717~'
-script += 's~r0111,329718~o~r0108,329719~l~r0105,329720~i~r0100,329721~d~r032,329722~ ~r0103,329723~g~r0114,329724~'
-script += 'r~r0111,329725~o~r0117,329726~u~r0110,329727~n~r0100,329728~d~r032,329729~ ~r097,329730~a~r0110,329731~'
-script += 'n~r0100,329732~d~r032,329733~ ~r097,329734~a~r032,329735~ ~r0108,329736~l~r0105,329737~i~r0116,329738~'
-script += 't~r329739~t~r0108,329740~l~r0101,329741~e~r032,329742~ ~r0100,329743~d~r0105,329744~i~r0115,329745~s'
-script += '~r0111,329746~o~r0114,329747~r~r0105,329748~i~r0101,329749~e~r0110,329750~n~r0116,329751~t~r0101,329752~'
-script += 'e~r0100,329753~d~r046,329754~.~r010,329755~\n~r329756~\n~r02488,10,23,310,4101,50,60~~v27322488~== ~r083,311268,420,51528,611267~'
-script += 'S~r0121,11,311269~y~r0110,12,311270~n~r097,13,311271~a~r099,14,311272~c~r0111,15,311273~o~r0114,16,311274~'
-script += 'r~r032,17,311275~ ~r072,18,311276~H~r0101,19,311277~e~r097,110,311278~a~r0100,111,311279~d~r0113,112,311280~'
-script += 'q~r0117,113,311281~u~r097,114,311282~a~r0114,115,311283~r~r0116,116,311284~t~r0101,117,311285~e~r0114,118,311286~'
-script += 'r~r0115,119,311287~s~r011267,10,310,4101,50,60~ ==\n~r089,311289,4255,51528,611288~Y~r0111,11,311290~'
-script += 'o~r0117,12,311291~u~r032,13,311292~ ~r0115,14,311293~s~r0116,15,311294~t~r097,16,311295~a~r0110,17,311296~'
-script += 'n~r0100,18,311297~d~r032,19,311298~ ~r0105,110,311299~i~r0110,111,311300~n~r032,112,311301~ ~r0116,113,311302~'
-script += 't~r0104,114,311303~h~r0101,115,311304~e~r032,116,311305~ ~r0108,117,311306~l~r0111,118,311307~o~r098,119,311308~'
-script += 'b~r120,311309~b~r0121,121,311310~y~r032,122,311311~ ~r0111,123,311312~o~r0102,124,311313~f~r032,125,311314~'
-script += ' ~r0119,126,311315~w~r0104,127,311316~h~r097,128,311317~a~r0116,129,311318~t~r032,130,311319~ ~r097,131,311320~'
-script += 'a~r0112,132,311321~p~r133,311322~p~r0101,134,311323~e~r097,135,311324~a~r0114,136,311325~r~r0115,137,311326~'
-script += 's~r032,138,311327~ ~r0116,139,311328~t~r0111,140,311329~o~r032,141,311330~ ~r098,142,311331~b~r0101,143,311332~'
-script += 'e~r032,144,311333~ ~r097,145,311334~a~r032,146,311335~ ~r0114,147,311336~r~r0101,148,311337~e~r097,149,311338~'
-script += 'a~r0108,150,311339~l~r151,311340~l~r0121,152,311341~y~r032,153,311342~ ~r0102,154,311343~f~r0117,155,311344~'
-script += 'u~r0110,156,311345~n~r032,157,311346~ ~r0112,158,311347~p~r0108,159,311348~l~r097,160,311349~a~r099,161,311350~'
-script += 'c~r0101,162,311351~e~r032,163,311352~ ~r0116,164,311353~t~r0111,165,311354~o~r032,166,311355~ ~r0119,167,311356~'
-script += 'w~r0111,168,311357~o~r0114,169,311358~r~r0107,170,311359~k~r033,171,311360~!~r032,172,311361~ ~r173,311362~'
-script += ' ~r083,174,311363~S~r097,175,311364~a~r0100,176,311365~d~r0108,177,311366~l~r0121,178,311367~y~r044,179,311368~'
-script += ',~r032,180,311369~ ~r0116,181,311370~t~r0104,182,311371~h~r0101,183,311372~e~r0114,184,311373~r~r0101,185,311374~'
-script += 'e~r032,186,311375~ ~r0100,187,311376~d~r0111,188,311377~o~r0101,189,311378~e~r0115,190,311379~s~r0110,191,311380~'
-script += 'n~r039,192,311381~\'~r0116,193,311382~t~r032,194,311383~ ~r0115,195,311384~s~r0101,196,311385~e~r197,311386~'
-script += 'e~r0109,198,311387~m~r032,199,311388~ ~r0116,1100,311389~t~r0111,1101,311390~o~r032,1102,311391~ ~r098,1103,311392~'
-script += 'b~r0101,1104,311393~e~r032,1105,311394~ ~r097,1106,311395~a~r0110,1107,311396~n~r0121,1108,311397~y~r0111,1109,311398~'
-script += 'o~r0110,1110,311399~n~r0101,1111,311400~e~r032,1112,311401~ ~r097,1113,311402~a~r0114,1114,311403~r~r0111,1115,311404~'
-script += 'o~r0117,1116,311405~u~r0110,1117,311406~n~r0100,1118,311407~d~r032,1119,311408~ ~r097,1120,311409~a~r0116,1121,311410~'
-script += 't~r032,1122,311411~ ~r0116,1123,311412~t~r0104,1124,311413~h~r0101,1125,311414~e~r032,1126,311415~ ~r0109,1127,311416~'
-script += 'm~r0111,1128,311417~o~r0109,1129,311418~m~r0101,1130,311419~e~r0110,1131,311420~n~r0116,1132,311421~'
-script += 't~r044,1133,311422~,~r032,1134,311423~ ~r0115,1135,311424~s~r0111,1136,311425~o~r032,1137,311426~ ~r0121,1138,311427~'
-script += 'y~r0111,1139,311428~o~r0117,1140,311429~u~r032,1141,311430~ ~r0109,1142,311431~m~r097,1143,311432~a~r0107,1144,311433~'
-script += 'k~r0101,1145,311434~e~r032,1146,311435~ ~r097,1147,311436~a~r032,1148,311437~ ~r0110,1149,311438~n~r0111,1150,311439~'
-script += 'o~r0116,1151,311440~t~r0101,1152,311441~e~r032,1153,311442~ ~r0116,1154,311443~t~r0111,1155,311444~o'
-script += '~r032,1156,311445~ ~r099,1157,311446~c~r097,1158,311447~a~r0108,1159,311448~l~r1160,311449~l~r032,1161,311450~'
-script += ' ~r0116,1162,311451~t~r0104,1163,311452~h~r0101,1164,311453~e~r0109,1165,311454~m~r032,1166,311455~ '
-script += '~r0108,1167,311456~l~r097,1168,311457~a~r0116,1169,311458~t~r0101,1170,311459~e~r0114,1171,311460~r~r046,1172,311461~'
-script += '.~r032,1173,311462~ ~r1174,311463~ ~r084,1175,311464~T~r0104,1176,311465~h~r0101,1177,311466~e~r032,1178,311467~'
-script += ' ~r098,1179,311468~b~r0111,1180,311469~o~r1181,311470~o~r0107,1182,311471~k~r0115,1183,311472~s~r0104,1184,311473~'
-script += 'h~r0101,1185,311474~e~r0108,1186,311475~l~r0102,1187,311476~f~r032,1188,311477~ ~r0104,1189,311478~h'
-script += '~r0101,1190,311479~e~r0114,1191,311480~r~r0101,1192,311481~e~r032,1193,311482~ ~r0108,1194,311483~l~r0111,1195,311484~'
-script += 'o~r1196,311485~o~r0107,1197,311486~k~r0115,1198,311487~s~r032,1199,311488~ ~r0108,1200,311489~l~r0105,1201,311490~'
-script += 'i~r0107,1202,311491~k~r0101,1203,311492~e~r032,1204,311493~ ~r0105,1205,311494~i~r0116,1206,311495~t'
-script += '~r032,1207,311496~ ~r0109,1208,311497~m~r0105,1209,311498~i~r0103,1210,311499~g~r0104,1211,311500~h~r0116,1212,311501~'
-script += 't~r032,1213,311502~ ~r0104,1214,311503~h~r097,1215,311504~a~r0118,1216,311505~v~r0101,1217,311506~e~r032,1218,311507~'
-script += ' ~r0115,1219,311508~s~r0111,1220,311509~o~r0109,1221,311510~m~r0101,1222,311511~e~r0116,1223,311512~'
-script += 't~r0104,1224,311513~h~r0105,1225,311514~i~r0110,1226,311515~n~r0103,1227,311516~g~r032,1228,311517~ '
-script += '~r0105,1229,311518~i~r0110,1230,311519~n~r0116,1231,311520~t~r0101,1232,311521~e~r0114,1233,311522~r'
-script += '~r0101,1234,311523~e~r0115,1235,311524~s~r0116,1236,311525~t~r0105,1237,311526~i~r0110,1238,311527~n'
-script += '~r0103,1239,311528~g~r032,1240,311529~ ~r0105,1241,311530~i~r0110,1242,311531~n~r032,1243,311532~ ~r0105,1244,311533~'
-script += 'i~r0116,1245,311534~t~r044,1246,311535~,~r032,1247,311536~ ~r0116,1248,311537~t~r0104,1249,311538~h~r0111,1250,311539~'
-script += 'o~r0117,1251,311540~u~r0103,1252,311541~g~r0104,1253,311542~h~r046,1254,311543~.~r011288,10,310,4101,50,60~'
-script += '\n~r010,19212,29212,327456,426,51531,627455~\n~r084,327457~T~r0104,327458~h~r0105,327459~i~r0110,327460~'
-script += 'n~r0103,327461~g~r0115,327462~s~r032,327463~ ~r0111,327464~o~r0102,327465~f~r032,327466~ ~r0105,327467~'
-script += 'i~r0110,327468~n~r0116,327469~t~r0101,327470~e~r0114,327471~r~r0101,327472~e~r0115,327473~s~r0116,327474~'
-script += 't~r032,327475~ ~r0104,327476~h~r0101,327477~e~r0114,327478~r~r0101,327479~e~r058,327480~:~r010,327481~'
-script += '\n~r019113,111,22488,31,416,55893,627381~- ~r098,10,319114,413,51528,619113~b~r0117,11,319115~u~r0115,12,319116~'
-script += 's~r0105,13,319117~i~r0110,14,319118~n~r0101,15,319119~e~r0115,16,319120~s~r17,319121~s~r032,18,319122~'
-script += ' ~r099,19,319123~c~r097,110,319124~a~r0114,111,319125~r~r0100,112,319126~d~r019113,111,31,416,55893,627381~'
-script += '\n~r019384,112~- ~r0115,10,319385,412,51528,619384~s~r0116,11,319386~t~r0114,12,319387~r~r097,13,319388~'
-script += 'a~r0110,14,319389~n~r0103,15,319390~g~r0101,16,319391~e~r032,17,319392~ ~r098,18,319393~b~r0111,19,319394~'
-script += 'o~r110,319395~o~r0107,111,319396~k~r019384,112,31,416,55893,627381~\n~r01,10,21,310,4101,50,60~\nThe'
-script += 're is ~r049,110,210,332767,449,51~1~r01,10,21,310,4101,50~ exit:\n~r011544,327132,41,55814,627131~- '
-script += '~r0111,311545,47,51528,611544~o~r0117,11,311546~u~r0116,12,311547~t~r0115,13,311548~s~r0105,14,311549~'
-script += 'i~r0100,15,311550~d~r0101,16,311551~e~r011544,10,327132,41,55814,627131~\n~r010,132613,232613,327415,417,51531,627414~'
-script += '\n~r087,327416~W~r0104,327417~h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~'
-script += 'o~r032,327423~ ~r0121,327424~y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~'
-script += 'o~r063,327430~?~r010,327431~\n~r025975,125974,226006,30,4101,50,60~# We still need to set the 8th re'
-script += 'gister so the code is properly revealed, as the code uses this register\n~minput~! set_register 8 25'
-script += '734\n~r725734~~moutput~> Register #8 set to 25734\n# Disable the jump to the confirmation process, i'
-script += 't takes forever\n~minput~! no_op 5489\n~moutput~> Set 2 values starting at 5489 to noop\n# And the i'
-script += 'nvert the logic of this jump, thus continuing as if the confirmation worked.\n~minput~! op 5495 jt\n'
-script += '~moutput~> Set 5495 to jt\n# This will reveal the seventh code\n~minput~u~r025976,4117,51~s~r025977,4115,52~'
-script += 'e~r025978,4101,53~ ~r025979,432,54~t~r025980,4116,55~e~r025981,4101,56~l~r025982,4108,57~e~r025983,4101,58~'
-script += 'p~r025984,4112,59~o~r025985,4111,510~r~r025986,4114,511~t~r025987,4116,512~e~r025988,4101,513~r~r025989,4114,514~'
-script += '\n~r032,23,310,4101,50~~moutput~\n\n~r065,131974,231974,328845,4169,51531,628844~A~r032,328846~ ~r0115,328847~'
-script += 's~r0116,328848~t~r0114,328849~r~r097,328850~a~r0110,328851~n~r0103,328852~g~r0101,328853~e~r044,328854~'
-script += ',~r032,328855~ ~r0101,328856~e~r0108,328857~l~r0101,328858~e~r099,328859~c~r0116,328860~t~r0114,328861~'
-script += 'r~r0111,328862~o~r0110,328863~n~r0105,328864~i~r099,328865~c~r032,328866~ ~r0118,328867~v~r0111,328868~'
-script += 'o~r0105,328869~i~r099,328870~c~r0101,328871~e~r032,328872~ ~r0105,328873~i~r0115,328874~s~r032,328875~'
-script += ' ~r0112,328876~p~r0114,328877~r~r0111,328878~o~r0106,328879~j~r0101,328880~e~r099,328881~c~r0116,328882~'
-script += 't~r0101,328883~e~r0100,328884~d~r032,328885~ ~r0105,328886~i~r0110,328887~n~r0116,328888~t~r0111,328889~'
-script += 'o~r032,328890~ ~r0121,328891~y~r0111,328892~o~r0117,328893~u~r0114,328894~r~r032,328895~ ~r0109,328896~'
-script += 'm~r0105,328897~i~r0110,328898~n~r0100,328899~d~r058,328900~:~r010,328901~\n~r328902~\n~r032,328903~ '
-script += '~r328904~ ~r034,328905~"~r085,328906~U~r0110,328907~n~r0117,328908~u~r0115,328909~s~r0117,328910~u~r097,328911~'
-script += 'a~r0108,328912~l~r032,328913~ ~r0115,328914~s~r0101,328915~e~r0116,328916~t~r328917~t~r0105,328918~i'
-script += '~r0110,328919~n~r0103,328920~g~r032,328921~ ~r0100,328922~d~r0101,328923~e~r0116,328924~t~r0101,328925~'
-script += 'e~r099,328926~c~r0116,328927~t~r0101,328928~e~r0100,328929~d~r033,328930~!~r032,328931~ ~r328932~ ~r083,328933~'
-script += 'S~r0116,328934~t~r097,328935~a~r0114,328936~r~r0116,328937~t~r0105,328938~i~r0110,328939~n~r0103,328940~'
-script += 'g~r032,328941~ ~r099,328942~c~r0111,328943~o~r0110,328944~n~r0102,328945~f~r0105,328946~i~r0114,328947~'
-script += 'r~r0109,328948~m~r097,328949~a~r0116,328950~t~r0105,328951~i~r0111,328952~o~r0110,328953~n~r032,328954~'
-script += ' ~r0112,328955~p~r0114,328956~r~r0111,328957~o~r099,328958~c~r0101,328959~e~r0115,328960~s~r328961~s'
-script += '~r033,328962~!~r032,328963~ ~r328964~ ~r069,328965~E~r0115,328966~s~r0116,328967~t~r0105,328968~i~r0109,328969~'
-script += 'm~r097,328970~a~r0116,328971~t~r0101,328972~e~r0100,328973~d~r032,328974~ ~r0116,328975~t~r0105,328976~'
-script += 'i~r0109,328977~m~r0101,328978~e~r032,328979~ ~r0116,328980~t~r0111,328981~o~r032,328982~ ~r099,328983~'
-script += 'c~r0111,328984~o~r0109,328985~m~r0112,328986~p~r0108,328987~l~r0101,328988~e~r0116,328989~t~r0105,328990~'
-script += 'i~r0111,328991~o~r0110,328992~n~r058,328993~:~r032,328994~ ~r049,328995~1~r032,328996~ ~r098,328997~'
-script += 'b~r0105,328998~i~r0108,328999~l~r329000~l~r0105,329001~i~r0111,329002~o~r0110,329003~n~r032,329004~ '
-script += '~r0121,329005~y~r0101,329006~e~r097,329007~a~r0114,329008~r~r0115,329009~s~r046,329010~.~r034,329011~'
-script += '"~r010,329012~\n~r329013~\n~r089,18175,28175,329015,4226,629014~Y~r0111,329016~o~r0117,329017~u~r032,329018~'
-script += ' ~r0119,329019~w~r097,329020~a~r0107,329021~k~r0101,329022~e~r032,329023~ ~r0117,329024~u~r0112,329025~'
-script += 'p~r032,329026~ ~r0111,329027~o~r0110,329028~n~r032,329029~ ~r097,329030~a~r032,329031~ ~r0115,329032~'
-script += 's~r097,329033~a~r0110,329034~n~r0100,329035~d~r0121,329036~y~r032,329037~ ~r098,329038~b~r0101,329039~'
-script += 'e~r097,329040~a~r099,329041~c~r0104,329042~h~r032,329043~ ~r0119,329044~w~r0105,329045~i~r0116,329046~'
-script += 't~r0104,329047~h~r032,329048~ ~r097,329049~a~r032,329050~ ~r0115,329051~s~r0108,329052~l~r0105,329053~'
-script += 'i~r0103,329054~g~r0104,329055~h~r0116,329056~t~r032,329057~ ~r0104,329058~h~r0101,329059~e~r097,329060~'
-script += 'a~r0100,329061~d~r097,329062~a~r099,329063~c~r0104,329064~h~r0101,329065~e~r046,329066~.~r032,329067~'
-script += ' ~r329068~ ~r084,329069~T~r0104,329070~h~r0101,329071~e~r032,329072~ ~r0108,329073~l~r097,329074~a~r0115,329075~'
-script += 's~r0116,329076~t~r032,329077~ ~r0116,329078~t~r0104,329079~h~r0105,329080~i~r0110,329081~n~r0103,329082~'
-script += 'g~r032,329083~ ~r0121,329084~y~r0111,329085~o~r0117,329086~u~r032,329087~ ~r0114,329088~r~r0101,329089~'
-script += 'e~r0109,329090~m~r0101,329091~e~r0109,329092~m~r098,329093~b~r0101,329094~e~r0114,329095~r~r032,329096~'
-script += ' ~r0105,329097~i~r0115,329098~s~r032,329099~ ~r097,329100~a~r099,329101~c~r0116,329102~t~r0105,329103~'
-script += 'i~r0118,329104~v~r097,329105~a~r0116,329106~t~r0105,329107~i~r0110,329108~n~r0103,329109~g~r032,329110~'
-script += ' ~r0116,329111~t~r0104,329112~h~r097,329113~a~r0116,329114~t~r032,329115~ ~r0116,329116~t~r0101,329117~'
-script += 'e~r0108,329118~l~r0101,329119~e~r0112,329120~p~r0111,329121~o~r0114,329122~r~r0116,329123~t~r0101,329124~'
-script += 'e~r0114,329125~r~r046,329126~.~r329127~.~r329128~.~r032,329129~ ~r098,329130~b~r0117,329131~u~r0116,329132~'
-script += 't~r032,329133~ ~r0110,329134~n~r0111,329135~o~r0119,329136~w~r032,329137~ ~r0121,329138~y~r0111,329139~'
-script += 'o~r0117,329140~u~r032,329141~ ~r099,329142~c~r097,329143~a~r0110,329144~n~r039,329145~\'~r0116,329146~'
-script += 't~r032,329147~ ~r0102,329148~f~r0105,329149~i~r0110,329150~n~r0100,329151~d~r032,329152~ ~r0105,329153~'
-script += 'i~r0116,329154~t~r032,329155~ ~r097,329156~a~r0110,329157~n~r0121,329158~y~r0119,329159~w~r0104,329160~'
-script += 'h~r0101,329161~e~r0114,329162~r~r0101,329163~e~r032,329164~ ~r0105,329165~i~r0110,329166~n~r032,329167~'
-script += ' ~r0121,329168~y~r0111,329169~o~r0117,329170~u~r0114,329171~r~r032,329172~ ~r0112,329173~p~r097,329174~'
-script += 'a~r099,329175~c~r0107,329176~k~r046,329177~.~r032,329178~ ~r329179~ ~r083,329180~S~r0111,329181~o~r0109,329182~'
-script += 'm~r0101,329183~e~r0111,329184~o~r0110,329185~n~r0101,329186~e~r032,329187~ ~r0115,329188~s~r0101,329189~'
-script += 'e~r329190~e~r0109,329191~m~r0115,329192~s~r032,329193~ ~r0116,329194~t~r0111,329195~o~r032,329196~ ~r0104,329197~'
-script += 'h~r097,329198~a~r0118,329199~v~r0101,329200~e~r032,329201~ ~r0100,329202~d~r0114,329203~r~r097,329204~'
-script += 'a~r0119,329205~w~r0110,329206~n~r032,329207~ ~r097,329208~a~r032,329209~ ~r0109,329210~m~r0101,329211~'
-script += 'e~r0115,329212~s~r329213~s~r097,329214~a~r0103,329215~g~r0101,329216~e~r032,329217~ ~r0105,329218~i~r0110,329219~'
-script += 'n~r032,329220~ ~r0116,329221~t~r0104,329222~h~r0101,329223~e~r032,329224~ ~r0115,329225~s~r097,329226~'
-script += 'a~r0110,329227~n~r0100,329228~d~r032,329229~ ~r0104,329230~h~r0101,329231~e~r0114,329232~r~r0101,329233~'
-script += 'e~r058,329234~:~r010,329235~\n~r329236~\n~r032,329237~ ~r329238~ ~r329239~ ~r329240~ ~r083,10,232767,36130,412,51528,66129~'
-script += '~mcode~S~r0108,11,36131~l~r0112,12,36132~p~r0110,13,36133~n~r071,14,36134~G~r0117,15,36135~u~r069,16,36136~'
-script += 'E~r0110,17,36137~n~r0102,18,36138~f~r0104,19,36139~h~r099,110,36140~c~r069,111,36141~E~moutput~~r010,121987,221987,329246,4154,51531,629245~'
-script += '\n~r329247~\n~r073,329248~I~r0116,329249~t~r032,329250~ ~r098,329251~b~r0101,329252~e~r0103,329253~g'
-script += '~r0105,329254~i~r0110,329255~n~r0115,329256~s~r032,329257~ ~r0116,329258~t~r0111,329259~o~r032,329260~'
-script += ' ~r0114,329261~r~r097,329262~a~r0105,329263~i~r0110,329264~n~r046,329265~.~r032,329266~ ~r329267~ ~r084,329268~'
-script += 'T~r0104,329269~h~r0101,329270~e~r032,329271~ ~r0109,329272~m~r0101,329273~e~r0115,329274~s~r329275~s'
-script += '~r097,329276~a~r0103,329277~g~r0101,329278~e~r032,329279~ ~r0119,329280~w~r097,329281~a~r0115,329282~'
-script += 's~r0104,329283~h~r0101,329284~e~r0115,329285~s~r032,329286~ ~r097,329287~a~r0119,329288~w~r097,329289~'
-script += 'a~r0121,329290~y~r046,329291~.~r032,329292~ ~r329293~ ~r089,329294~Y~r0111,329295~o~r0117,329296~u~r032,329297~'
-script += ' ~r0116,329298~t~r097,329299~a~r0107,329300~k~r0101,329301~e~r032,329302~ ~r097,329303~a~r032,329304~'
-script += ' ~r0100,329305~d~r0101,329306~e~r329307~e~r0112,329308~p~r032,329309~ ~r098,329310~b~r0114,329311~r~r0101,329312~'
-script += 'e~r097,329313~a~r0116,329314~t~r0104,329315~h~r032,329316~ ~r097,329317~a~r0110,329318~n~r0100,329319~'
-script += 'd~r032,329320~ ~r0102,329321~f~r0101,329322~e~r329323~e~r0108,329324~l~r032,329325~ ~r0102,329326~f~r0105,329327~'
-script += 'i~r0114,329328~r~r0109,329329~m~r0108,329330~l~r0121,329331~y~r032,329332~ ~r0103,329333~g~r0114,329334~'
-script += 'r~r0111,329335~o~r0117,329336~u~r0110,329337~n~r0100,329338~d~r0101,329339~e~r0100,329340~d~r032,329341~'
-script += ' ~r0105,329342~i~r0110,329343~n~r032,329344~ ~r0114,329345~r~r0101,329346~e~r097,329347~a~r0108,329348~'
-script += 'l~r0105,329349~i~r0116,329350~t~r0121,329351~y~r032,329352~ ~r097,329353~a~r0115,329354~s~r032,329355~'
-script += ' ~r0116,329356~t~r0104,329357~h~r0101,329358~e~r032,329359~ ~r0101,329360~e~r0102,329361~f~r329362~f'
-script += '~r0101,329363~e~r099,329364~c~r0116,329365~t~r0115,329366~s~r032,329367~ ~r0111,329368~o~r0102,329369~'
-script += 'f~r032,329370~ ~r0116,329371~t~r0104,329372~h~r0101,329373~e~r032,329374~ ~r0116,329375~t~r0101,329376~'
-script += 'e~r0108,329377~l~r0101,329378~e~r0112,329379~p~r0111,329380~o~r0114,329381~r~r0116,329382~t~r097,329383~'
-script += 'a~r0116,329384~t~r0105,329385~i~r0111,329386~o~r0110,329387~n~r032,329388~ ~r0119,329389~w~r0101,329390~'
-script += 'e~r097,329391~a~r0114,329392~r~r032,329393~ ~r0111,329394~o~r0102,329395~f~r329396~f~r046,329397~.~r010,329398~'
-script += '\n~r329399~\n~r02498,10,23,310,4101,50,60~~v27322498,271032767~== ~r066,311727,45,51528,611726~B~r0101,11,311728~'
-script += 'e~r097,12,311729~a~r099,13,311730~c~r0104,14,311731~h~r011726,10,310,4101,50,60~ ==\n~r084,311733,4170,51528,611732~'
-script += 'T~r0104,11,311734~h~r0105,12,311735~i~r0115,13,311736~s~r032,14,311737~ ~r0105,15,311738~i~r0115,16,311739~'
-script += 's~r032,17,311740~ ~r097,18,311741~a~r032,19,311742~ ~r0115,110,311743~s~r097,111,311744~a~r0110,112,311745~'
-script += 'n~r0100,113,311746~d~r0121,114,311747~y~r032,115,311748~ ~r098,116,311749~b~r0101,117,311750~e~r097,118,311751~'
-script += 'a~r099,119,311752~c~r0104,120,311753~h~r032,121,311754~ ~r0105,122,311755~i~r0110,123,311756~n~r032,124,311757~'
-script += ' ~r097,125,311758~a~r032,126,311759~ ~r099,127,311760~c~r0111,128,311761~o~r0118,129,311762~v~r0101,130,311763~'
-script += 'e~r032,131,311764~ ~r0111,132,311765~o~r0110,133,311766~n~r032,134,311767~ ~r0115,135,311768~s~r0111,136,311769~'
-script += 'o~r0109,137,311770~m~r0101,138,311771~e~r032,139,311772~ ~r0116,140,311773~t~r0114,141,311774~r~r0111,142,311775~'
-script += 'o~r0112,143,311776~p~r0105,144,311777~i~r099,145,311778~c~r097,146,311779~a~r0108,147,311780~l~r032,148,311781~'
-script += ' ~r0105,149,311782~i~r0115,150,311783~s~r0108,151,311784~l~r097,152,311785~a~r0110,153,311786~n~r0100,154,311787~'
-script += 'd~r046,155,311788~.~r032,156,311789~ ~r157,311790~ ~r073,158,311791~I~r0116,159,311792~t~r032,160,311793~'
-script += ' ~r0105,161,311794~i~r0115,162,311795~s~r032,163,311796~ ~r0114,164,311797~r~r097,165,311798~a~r0105,166,311799~'
-script += 'i~r0110,167,311800~n~r0105,168,311801~i~r0110,169,311802~n~r0103,170,311803~g~r046,171,311804~.~r032,172,311805~'
-script += ' ~r173,311806~ ~r084,174,311807~T~r0104,175,311808~h~r0101,176,311809~e~r032,177,311810~ ~r0111,178,311811~'
-script += 'o~r099,179,311812~c~r0101,180,311813~e~r097,181,311814~a~r0110,182,311815~n~r032,183,311816~ ~r0105,184,311817~'
-script += 'i~r0115,185,311818~s~r032,186,311819~ ~r0116,187,311820~t~r0111,188,311821~o~r032,189,311822~ ~r0121,190,311823~'
-script += 'y~r0111,191,311824~o~r0117,192,311825~u~r0114,193,311826~r~r032,194,311827~ ~r0115,195,311828~s~r0111,196,311829~'
-script += 'o~r0117,197,311830~u~r0116,198,311831~t~r0104,199,311832~h~r044,1100,311833~,~r032,1101,311834~ ~r097,1102,311835~'
-script += 'a~r0110,1103,311836~n~r0100,1104,311837~d~r032,1105,311838~ ~r0104,1106,311839~h~r0101,1107,311840~e'
-script += '~r097,1108,311841~a~r0118,1109,311842~v~r0121,1110,311843~y~r032,1111,311844~ ~r0102,1112,311845~f~r0111,1113,311846~'
-script += 'o~r0108,1114,311847~l~r0105,1115,311848~i~r097,1116,311849~a~r0103,1117,311850~g~r0101,1118,311851~e'
-script += '~r032,1119,311852~ ~r0105,1120,311853~i~r0115,1121,311854~s~r032,1122,311855~ ~r0116,1123,311856~t~r0111,1124,311857~'
-script += 'o~r032,1125,311858~ ~r0121,1126,311859~y~r0111,1127,311860~o~r0117,1128,311861~u~r0114,1129,311862~r'
-script += '~r032,1130,311863~ ~r0110,1131,311864~n~r0111,1132,311865~o~r0114,1133,311866~r~r0116,1134,311867~t~r0104,1135,311868~'
-script += 'h~r059,1136,311869~;~r032,1137,311870~ ~r0116,1138,311871~t~r0104,1139,311872~h~r0101,1140,311873~e~r032,1141,311874~'
-script += ' ~r098,1142,311875~b~r0101,1143,311876~e~r097,1144,311877~a~r099,1145,311878~c~r0104,1146,311879~h~r032,1147,311880~'
-script += ' ~r0101,1148,311881~e~r0120,1149,311882~x~r0116,1150,311883~t~r0101,1151,311884~e~r0110,1152,311885~'
-script += 'n~r0100,1153,311886~d~r0115,1154,311887~s~r032,1155,311888~ ~r0119,1156,311889~w~r0101,1157,311890~e'
-script += '~r0115,1158,311891~s~r0116,1159,311892~t~r032,1160,311893~ ~r097,1161,311894~a~r0110,1162,311895~n~r0100,1163,311896~'
-script += 'd~r032,1164,311897~ ~r0101,1165,311898~e~r097,1166,311899~a~r0115,1167,311900~s~r0116,1168,311901~t~r046,1169,311902~'
-script += '.~r011732,10,310,4101,50,60~\n~r03,20~\nThere are ~r051,110,210,332765,451,51~3~r03,10,20,310,4101,50~'
-script += ' exits:\n~r011903,327140,43,55814,627139~- ~r0119,311904,44,51528,611903~w~r0101,11,311905~e~r0115,12,311906~'
-script += 's~r0116,13,311907~t~r011903,10,327140,43,55814,627139~\n~r011908,11,327141~- ~r0101,10,311909,44,51528,611908~'
-script += 'e~r097,11,311910~a~r0115,12,311911~s~r0116,13,311912~t~r011908,11,327141,43,55814,627139~\n~r011913,12,327142~'
-script += '- ~r0110,10,311914,45,51528,611913~n~r0111,11,311915~o~r0114,12,311916~r~r0116,13,311917~t~r0104,14,311918~'
-script += 'h~r011913,12,327142,43,55814,627139~\n~r010,132613,232613,327415,417,51531,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~# Pick up the mirror\n~minput~! set_memory 2722 0\n~v27220~~moutput~'
-script += '> Memory address 2722 set to 0\n# These values are used during the maze and they\'re input to the mi'
-script += 'rror code\n~minput~! set_memory 3955 31318\n~moutput~> Memory address 3955 set to 31318\n~minput~! s'
-script += 'et_memory 3956 9258\n~moutput~> Memory address 3956 set to 9258\n~minput~! set_memory 3957 10600\n~moutput~'
-script += '> Memory address 3957 set to 10600\n# And using the mirror shows the code\n~minput~u~r025976,4117,51~'
-script += 's~r025977,4115,52~e~r025978,4101,53~ ~r025979,432,54~m~r025980,4109,55~i~r025981,4105,56~r~r025982,4114,57~'
-script += 'r~r025983,58~o~r025984,4111,59~r~r025985,4114,510~\n~r032,23,310,4101,50~~moutput~\n\n~r089,120852,220852,329758,4184,51531,629757~'
-script += 'Y~r0111,329759~o~r0117,329760~u~r032,329761~ ~r0103,329762~g~r097,329763~a~r0122,329764~z~r0101,329765~'
-script += 'e~r032,329766~ ~r0105,329767~i~r0110,329768~n~r0116,329769~t~r0111,329770~o~r032,329771~ ~r0116,329772~'
-script += 't~r0104,329773~h~r0101,329774~e~r032,329775~ ~r0109,329776~m~r0105,329777~i~r0114,329778~r~r329779~r'
-script += '~r0111,329780~o~r0114,329781~r~r044,329782~,~r032,329783~ ~r097,329784~a~r0110,329785~n~r0100,329786~'
-script += 'd~r032,329787~ ~r0121,329788~y~r0111,329789~o~r0117,329790~u~r032,329791~ ~r0115,329792~s~r0101,329793~'
-script += 'e~r329794~e~r032,329795~ ~r0121,329796~y~r0111,329797~o~r0117,329798~u~r0114,329799~r~r0115,329800~s'
-script += '~r0101,329801~e~r0108,329802~l~r0102,329803~f~r032,329804~ ~r0103,329805~g~r097,329806~a~r0122,329807~'
-script += 'z~r0105,329808~i~r0110,329809~n~r0103,329810~g~r032,329811~ ~r098,329812~b~r097,329813~a~r099,329814~'
-script += 'c~r0107,329815~k~r046,329816~.~r032,329817~ ~r329818~ ~r066,329819~B~r0117,329820~u~r0116,329821~t~r032,329822~'
-script += ' ~r0119,329823~w~r097,329824~a~r0105,329825~i~r0116,329826~t~r033,329827~!~r032,329828~ ~r329829~ ~r073,329830~'
-script += 'I~r0116,329831~t~r032,329832~ ~r0108,329833~l~r0111,329834~o~r329835~o~r0107,329836~k~r0115,329837~s'
-script += '~r032,329838~ ~r0108,329839~l~r0105,329840~i~r0107,329841~k~r0101,329842~e~r032,329843~ ~r0115,329844~'
-script += 's~r0111,329845~o~r0109,329846~m~r0101,329847~e~r0111,329848~o~r0110,329849~n~r0101,329850~e~r032,329851~'
-script += ' ~r0119,329852~w~r0114,329853~r~r0111,329854~o~r0116,329855~t~r0101,329856~e~r032,329857~ ~r0111,329858~'
-script += 'o~r0110,329859~n~r032,329860~ ~r0121,329861~y~r0111,329862~o~r0117,329863~u~r0114,329864~r~r032,329865~'
-script += ' ~r0102,329866~f~r097,329867~a~r099,329868~c~r0101,329869~e~r032,329870~ ~r0119,329871~w~r0104,329872~'
-script += 'h~r0105,329873~i~r0108,329874~l~r0101,329875~e~r032,329876~ ~r0121,329877~y~r0111,329878~o~r0117,329879~'
-script += 'u~r032,329880~ ~r0119,329881~w~r0101,329882~e~r0114,329883~r~r0101,329884~e~r032,329885~ ~r0117,329886~'
-script += 'u~r0110,329887~n~r099,329888~c~r0111,329889~o~r0110,329890~n~r0115,329891~s~r099,329892~c~r0105,329893~'
-script += 'i~r0111,329894~o~r0117,329895~u~r0115,329896~s~r032,329897~ ~r0111,329898~o~r0110,329899~n~r032,329900~'
-script += ' ~r0116,329901~t~r0104,329902~h~r0101,329903~e~r032,329904~ ~r098,329905~b~r0101,329906~e~r097,329907~'
-script += 'a~r099,329908~c~r0104,329909~h~r033,329910~!~r032,329911~ ~r329912~ ~r084,329913~T~r0104,329914~h~r0114,329915~'
-script += 'r~r0111,329916~o~r0117,329917~u~r0103,329918~g~r0104,329919~h~r032,329920~ ~r0116,329921~t~r0104,329922~'
-script += 'h~r0101,329923~e~r032,329924~ ~r0109,329925~m~r0105,329926~i~r0114,329927~r~r329928~r~r0111,329929~o'
-script += '~r0114,329930~r~r044,329931~,~r032,329932~ ~r0121,329933~y~r0111,329934~o~r0117,329935~u~r032,329936~'
-script += ' ~r0115,329937~s~r0101,329938~e~r329939~e~r032,329940~ ~r034,329941~"~r089,10,24,36130,412,51528,66129~'
-script += 'Y~r0113,11,36131~q~r084,12,36132~T~r0111,13,36133~o~r0105,14,36134~i~r088,15,36135~X~r0111,16,36136~'
-script += 'o~r085,17,36137~U~r0108,18,36138~l~r085,19,36139~U~r079,110,36140~O~r089,111,36141~Y~r034,132105,232105,329947,4103,51531,629946~'
-script += '"~r032,329948~ ~r0115,329949~s~r099,329950~c~r0114,329951~r~r097,329952~a~r0119,329953~w~r0108,329954~'
-script += 'l~r0101,329955~e~r0100,329956~d~r032,329957~ ~r0105,329958~i~r0110,329959~n~r032,329960~ ~r099,329961~'
-script += 'c~r0104,329962~h~r097,329963~a~r0114,329964~r~r099,329965~c~r0111,329966~o~r097,329967~a~r0108,329968~'
-script += 'l~r032,329969~ ~r0111,329970~o~r0110,329971~n~r032,329972~ ~r0121,329973~y~r0111,329974~o~r0117,329975~'
-script += 'u~r0114,329976~r~r032,329977~ ~r0102,329978~f~r0111,329979~o~r0114,329980~r~r0101,329981~e~r0104,329982~'
-script += 'h~r0101,329983~e~r097,329984~a~r0100,329985~d~r046,329986~.~r010,329987~\n~r329988~\n~r067,329989~C~r0111,329990~'
-script += 'o~r0110,329991~n~r0103,329992~g~r0114,329993~r~r097,329994~a~r0116,329995~t~r0117,329996~u~r0108,329997~'
-script += 'l~r097,329998~a~r0116,329999~t~r0105,330000~i~r0111,330001~o~r0110,330002~n~r0115,330003~s~r059,330004~'
-script += ';~r032,330005~ ~r0121,330006~y~r0111,330007~o~r0117,330008~u~r032,330009~ ~r0104,330010~h~r097,330011~'
-script += 'a~r0118,330012~v~r0101,330013~e~r032,330014~ ~r0114,330015~r~r0101,330016~e~r097,330017~a~r099,330018~'
-script += 'c~r0104,330019~h~r0101,330020~e~r0100,330021~d~r032,330022~ ~r0116,330023~t~r0104,330024~h~r0101,330025~'
-script += 'e~r032,330026~ ~r0101,330027~e~r0110,330028~n~r0100,330029~d~r032,330030~ ~r0111,330031~o~r0102,330032~'
-script += 'f~r032,330033~ ~r0116,330034~t~r0104,330035~h~r0101,330036~e~r032,330037~ ~r099,330038~c~r0104,330039~'
-script += 'h~r097,330040~a~r0108,330041~l~r330042~l~r0101,330043~e~r0110,330044~n~r0103,330045~g~r0101,330046~e'
-script += '~r033,330047~!~r010,330048~\n~r330049~\n~r132613,232613,327415,417,627414~\n~r087,327416~W~r0104,327417~'
-script += 'h~r097,327418~a~r0116,327419~t~r032,327420~ ~r0100,327421~d~r0111,327422~o~r032,327423~ ~r0121,327424~'
-script += 'y~r0111,327425~o~r0117,327426~u~r032,327427~ ~r0100,327428~d~r0111,327429~o~r063,327430~?~r010,327431~'
-script += '\n~r025975,125974,226006,30,4101,50,60~# That code is reflected in a mirror, using a helper to decod'
-script += 'e it to reveal the final code\n~minput~! reverse_mirror\n~moutput~> The code in the mirror is "~mcode~'
-script += 'YOUlUoXioTpY~moutput~"\n# We\'re all done!\n~minput~! end\n~moutput~> Goodbye!\n'
+var replay = {version: 2, tracked: [2670, 2674, 2678, 2682, 2686, 2690, 2694, 2698, 2702, 2706, 2710, 2714, 2718, 2722, 2726, 2730, 2732], text: [], modes: [], events: [], keyframes: [], codes: []};
+replay.modes.push([85, "input"]);
+replay.modes.push([108, "output"]);
+replay.modes.push([153, "code"]);
+replay.modes.push([165, "output"]);
+replay.codes.push([153, "fbCcIPhFoGGd"]);
+replay.modes.push([230, "input"]);
+replay.modes.push([236, "output"]);
+replay.modes.push([357, "code"]);
+replay.modes.push([369, "output"]);
+replay.codes.push([357, "KtYzSlsHSBIz"]);
+replay.modes.push([464, "code"]);
+replay.modes.push([476, "output"]);
+replay.codes.push([464, "oNTFmoiTRTMG"]);
+replay.events.push("0_700000000i7W8H0je21rf22__V3__V4nh25qi26fj27pj28aj29kj2A_i2Buj2C_n2Dpo2Euj2Fvl2Gje2_4z3c7u-BYyBc2m_2WyB1BR221BE221BB221Bn3221Bk4221BT221BS221B2221Bd5221Bc4221BO221B3221B6221B7221BD221BU221BT221Bn3221BN221BY4221BM221A221Bt4221Be5221BT221BS221B2221B1221Bb5221BW5221BT221Ba1221A221Bn6221_3q4gbFse3zlNQ6vjN19e12195219f4219c5219R219E219B219n3219k4219T219S2192219d5219c4219O219321962197219D219U219L219C2191219x4219c4219O219L2192219f4219o4219K219n3219p1219-4219X2219C219R219k22194219B219f121932194219D219B219v321821_3cm4jdFre3ykBg3r_2wnB3v3ji4y_Bt5m_2y_B1Bo2221A221BA221BN221B2221B6221A221BE221x3suBFhWCu5l_2x_B4v3fwBmWCa5m_2mWC1Bi1221BC221Bf5221Bi4221B6221BA221BJ221Bd4221Bo5221BJ221BC221B5221B2221BR221BE221BB221Bh4221Bc5221B2221Bb1221BQ221BJ221BA221BA221BD221Bj4221BY4221Bc1221Bd5221Be5221BN221B5221Bf4221Ba4221B1221Ba1221BR221Bf4221B-4221BH221Bh4221BY4221BQ221Bx4221Bg4221BI221B2221B6221B9221B4221BC221B3221Bb5221Bw4221B4221BC221BD221BC221Bb1221BG221BA221B_3221BR221A221BY2221Bc3221Bd5221Bo4221BM221B122");
+replay.events.push("1Bb5221Ba4221B1221Ba1221BR221Bf4221Be5221B9221Bz4221Be5221BN221B5221Bf4221By4221B2221B6221B4221BN221Bt3221BN221Be5221BN221B5221BQ221BP221Bf4221Bo4221BK221Bb5221BY4221BX4221Bw4221BN221Ba1221A221BJ221BQ221BX1221Bf4221Be4221BM221A221B6221BA221Bh1221Bm1221Br4221BR221A221BY2221BX2221Bc5221BJ221B3221BE221Bx4221By4221BH221B7221BY1221BV221Bk1221Bn5221Ba5221BP221B7221B6221BU221Bb5221B4221Bo2221Bq1221A221BM221B_4221B-4221BC221B1221Bb5221B1221A221Be2221BY2221B2221B6221BA221B9221BM221BT221BE221BQ221Bn5221By4221B2221Bz4221Be5221B3221BP221B7221Ba1221B4221B5221BP221Bf4221Bk5221BR221BM221BN221B2221BA221Bv4221B2221x3i-BhBxhCZ5l_2lWC1_3x_Bu_HWX6XiAr4s_2XiA19q4219e12192219A219D219O219b5219-4219H219h4219o4219A219C219T219Q219P219S2192219d5219m42195219Q219P219r2219_221_3ttSt_HzkDmgAJqm8p42v3i-SZtSJvm8jcI1Bb1221B2221BK221BD221BU221x3h-S9wsSKwm8kcI1r3etSvm4g5fmBsmAB_1W3KK5b321_1_2JJ6c318v3yhCtkBb6ihBtkB2v3tbCuwNAxh8uwN1BM221A221B6221BA221Bh1221Bm1221x3kaCBZxN9yh8twN1BG222x3fbC1cxN6xh8exN1B7221BC221B1221BN221x3WcC5jxN5yh8dxN");
+replay.modes.push([768, "input"]);
+replay.modes.push([780, "output"]);
+replay.modes.push([849, "input"]);
+replay.modes.push([860, "output"]);
+replay.modes.push([889, "code"]);
+replay.modes.push([901, "output"]);
+replay.codes.push([889, "MBTdGgundHQG"]);
+replay.events.push("1_3xhCt9r9YW1Urh8aW119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA1n12U21n12b121n12K21n12B21n12f421n12e521n12b121n12221n12K21n12D21n12U21z1yfDibP2TL2_Be3feNgmFpc9x5s_2pc910019Q219K219B219I219_3219d221-2tuRtuRhe1K_d119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkAi1n12W121n12321n12R21n12f421n12e521n12b121n12221n12K21n12D21n12U21z1-fDycDCTJ2_3o3XfNYkRdp8p4s_2zo819i1219C219f5219i42196219A219J219d4219o5219J219C21952192219R219E219B219h4219k52199219H219M219L219A219D219j4219421_3s2fkRhkRimKT5WoK1BL221Ba1221BW1221Bv1221BW2221BS221BD221BJ221Bt1221BI221BJ221_3f2te1_d1rmKk26_lK193219-42191219x4219e5219N2195219f4219e5219b12192219K219D219U219h4219R218219W3219g1219Q219J219D219U2196219b5219o4219M219v4219u4219b5219c521972193219F219f4219s42193219A219J219d4219-4219H219h4219c4219O219L2192219h2219f321821-2iUiUvW2Z2rz119w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA");
+replay.text.push("# A \"speedrun\" through this challenge\n# The first code is in the machine spec itself\n! type arch-spec:30,30\n> - Here's a code for the challenge website: fbCcIPhFoGGd\n# Running the machine now will reveal the second and third code\n! run\nWelcome to the Synacor Challenge!\nPlease record your progress by putting codes like\nthis one into the challenge website: KtYzSlsHSBIz\n\nExecuting self-test...\n\nself-test complete, all tests pass\nThe self-test completion code is: oNTFmoiTRTMG\n\n== Foothills ==\nYou find yourself standing at the base of an enormous mountain.  At its base to the north, there is a massive doorway.  A sign nearby reads \"Keep out!  Definitely no treasure within!\"\n\nThings of interest here:\n- tablet\n\nThere are 2 exits:\n- doorway\n- south\n\nWhat do you do?\ntake tablet\n\n\nTaken.\n\nWhat do you do?\n# Using the tablet reveals the fourth code\nuse tablet\n\n\nYou find yourself writing \"MBTdGgundHQG\" on the tablet.  Perhaps it's some kind of code?\n\n\nWhat do you do?\n# Transport to before the sign\n");
+replay.keyframes.push([1000, 3025, 969, [25975, 25974, 26006, 0, 101, 0, 0, 0], [0, 2357, 32767, 32767, 2417, 2452, 2473, 2483, 2468, 2478, 2463, 2488, 2623, 2643, 2488, 2553, 2317]]);
+replay.modes.push([1000, "input"]);
+replay.modes.push([1023, "output"]);
+replay.modes.push([1057, "input"]);
+replay.modes.push([1080, "output"]);
+replay.modes.push([1114, "input"]);
+replay.modes.push([1135, "output"]);
+replay.modes.push([1199, "input"]);
+replay.modes.push([1205, "output"]);
+replay.modes.push([1269, "code"]);
+replay.modes.push([1281, "output"]);
+replay.codes.push([1269, "emBLbWMgDhds"]);
+replay.events.push("s1W81GYh2n5n12I21n12221n12621n12421n12N21z1egDwcDC592_Bc2-c8xX5nx8j2s_2dx81Gih219g22192219K219R219E219D2191219d4219-42191219x4219e5219N2195219f4219k5219h1219M218219t4219-4219H219h4219-42191219H219f4219-4219H219h4219e5219N2195219f4219W5219T219a1218219Z1219C2193219a1219h1219m1219B219j4219N219o5219J219C219f5219c5219R218219r2219_2218219i121821821821_3g4sX5qX5msKZ35gwK1BG221Br2221BK221Bi1221BL221BJ221Bq1221Bb2221Be2221B7221BU221_3n6kj1ck1vsK-16ZsK18219-4219i1219C219f5219e5219b1219K219B219f4219y42192219A219T219f4219-4219H219h4219e5219N2192219K219b5219Y4219Q219J219d4219s4219B218219M219_4219k5219h1219M21912193219A219D219n3219d221821_Bks4Zk1Zk1sq8q3r_2Yt81Gnh23v3vn4iuHh5m_2quH1Bc2221BR221BK221B2221BA221Bn5221BW5221BT221Ba1221A221BZ1221BC221B3221BS221x3knHRdvHi5l_2puH4v3XpHivHx2m_2qvH1Bi1221BC221Bf5221BY4221BY1221BP221Bf4221Bo4221BA221Bx4221BY4221BX4221Bw4221BN221Bo1221Bf1221Bf4221B-4221BH221Bh4221Be5221B6221BR221BK221B2221BA221Bn5221Bu4221B5221BM221A221BF221BD221Bf4221BW5221BT221Ba1221A221BZ122");
+replay.modes.push([1609, "input"]);
+replay.modes.push([1630, "output"]);
+replay.modes.push([1662, "input"]);
+replay.modes.push([1683, "output"]);
+replay.modes.push([1715, "input"]);
+replay.modes.push([1736, "output"]);
+replay.modes.push([1768, "input"]);
+replay.modes.push([1789, "output"]);
+replay.modes.push([1821, "input"]);
+replay.modes.push([1842, "output"]);
+replay.modes.push([1899, "input"]);
+replay.modes.push([1919, "output"]);
+replay.modes.push([1996, "input"]);
+replay.text.push("! set_memory 2732 2402\n> Memory address 2732 set to 2402\n! set_memory 2733 2402\n> Memory address 2733 set to 2402\n! set_memory 3726 24\n> Memory address 3726 set to 24\n# This will show the fifth code\nnorth\n\n\nChiseled on the wall of one of the passageways, you see:\n\n    emBLbWMgDhds\n\nYou take note of this and keep walking.\n\n== Twisty passages ==\nYou are in a maze of twisty little passages, all alike.\n\nThings of interest here:\n- can\n\nThere is 1 exit:\n- west\n\nWhat do you do?\n# While we don't need the coins, we do need the values that get set when they're picked up, the transporter uses these for its codes\n! set_memory 27102 9\n> Memory address 27102 set to 9\n! set_memory 27103 2\n> Memory address 27103 set to 2\n! set_memory 27104 5\n> Memory address 27104 set to 5\n! set_memory 27105 7\n> Memory address 27105 set to 7\n! set_memory 27106 3\n> Memory address 27106 set to 3\n# Pick up the teleporter\n! set_memory 2710 0\n> Memory address 2710 set to 0\n# Using the teleporter reveals the sixth code\nuse ");
+replay.keyframes.push([2000, 4572, 1999, [25978, 25974, 26006, 0, 101, 3, 0, 0], [0, 2357, 32767, 32767, 2417, 2452, 2473, 2483, 2468, 2478, 0, 2488, 2623, 2643, 2488, 2553, 2417]]);
+replay.modes.push([2011, "output"]);
+replay.events.push("1BC221B3221BS221Bj4221BN221BY4221BM221A221Bt4221BY4221BM221B5221B4221BB221Bj3221x3usHh3tyHy2l_2pvH1_3_uHu_Hu_HfiAr4s_2XiA19q4219e12192219A219D219O219b5219-4219H219h4219o4219A219C219T219Q219P219S2192219d5219m42195219Q219P219r2219_221_3ZuRl_HreDmgAJqm8p42x3szR7ltRPvm8vcH1B3221BQ221x3h-R4itRQwm8wcH1_3otR7_s48g5fmBsmAA_1W3KIBd321_1_2JHCe317v3YzHfcBd6ihBXcB2v3rrHcZT6xh8cZT1BZ1221BS221B2221x3yrH5hZT5yh8bZT1_3lyHr9t9kNW1rh8kN19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkAxDW81A0k2n12W121n12321n12R21n12f421n12e521n12T21n12E21n12D21n12M21n12121n12621n12421n12T21n12Q21z1sfDqcDAPR2_3o3zWHnfUrf6W1s_2jf619i1219C219f5219Y42194219Y1219L219Q219f1219c1219T219f4219e5219N2195219f4219e5219T219E219D219M219121962194219T219Q219X52191218219Y2219a3219b5219o5219J219C219f5219c52195219D219I219X1219M219t4219e5219N219K2195219C219R2192219l4219e5219L2198219F219f4219Y4219Q219J219d4219c52195219T21942194219n3219N219o5219J219C219f5219e5219N2192219A2195219r4219o5219J219C2");
+replay.modes.push([2130, "code"]);
+replay.modes.push([2142, "output"]);
+replay.codes.push([2130, "ipMlgrgDybOZ"]);
+replay.events.push("19f5219c5219R218219f4219Y4219X4219W5219T219c1218219T219Q2197219x4219o4219A219x4219e5219N2195219f4219c52192219b1219Y12192219f4218218219d2218219i121821821821_3o4ofUmfUeXIn65meI1BE221Bb2221B-1221B9221BM221BL221Bb2221Bg3221Bj1221Bb1221BM221_3_4osMgtMnXIw46xWI18219k3219g2219S219T219Q219Z5219Y4219X4219i42191219a1219j5219w421942193219F219I219C2191219j4219N219o5219J219C219f5219i42196219A219J219d4219o5219J219C21952192219R219E219B219h4219a421912194219G219r4219-42191219x4219c52197219521952199219d4219k4219M2195219C219D219J219d4219Y4219Q219J219d4219Y4219X4219u42195219M218219F219D219f4219e4219A219K21972196219H2197219I219C219T2191219h3219d221821_Byw4dtMXtMyy5Or_2wX61Guj23v3fs4q_LX5m_2cWM1Bi2221BL221BP221B4221BO221B6221BZ5221Bm2221Bw1221B7221B6221BQ221B8221Bd1221BY1221B4221BT221BQ221B2221x3WvLb1vWMY5l_2bWM4v3pwL-WMq9m_2mXM1Bi1221BC221Bf5221Bc5221B2221Bb1221BQ221BJ221Bd4221Bo4221BA221Bx4221Be5221BN221B5221Bf4221Bu4221B6221BP221A221Bk1221Bn5221B-4221BH221Bh4221Bk5221BT221BD221Bc1221Bd5221BY4221BU221A221BL22");
+replay.events.push("1B7221BY1221B2221Bb5221Be5221B9221Bz4221Ba4221B6221Bf4221BY4221BX4221Ba5221BP221B7221BM221A221BQ221Bn5221Bi4221BU221BD221Bx4221BW5221B7221BL221B4221B4221Bf4221Be5221B9221Bz4221Bk5221BF221B6221BD221Bp4221B1221A221Bc3221BS221B6221BG221BQ221Bv4221BN221Be5221BN221B5221BQ221BP221Bf4221Be4221BM221BJ221BS221B9221Bj4221Bw4221Bd5221Bc5221BR221A221BG221Bv4221Be5221B9221Bz4221Ba4221B6221Bf4221BY4221BQ221BM221BJ221B1221BH221Bf4221BY4221BY1221B5221BC221BD221BJ221Bd4221BY4221Bc1221Bd5221Be5221BN221B5221Bf4221Bw4221B4221B3221BF221BI221BC221Bl4221BN221Bc5221B7221Bz4221Bo5221BJ221BC221Bf5221Bw4221BN221BK221BB221Bf4221BY4221BX4221By4221B2221BA221BT221Bf4221Be5221B9221Bz4221Bc4221B3221BM221A221Bt4221Be5221BN221B5221BG221Bv4221Bu4221BL221Bc1221BT221BQ221Bd4221BR221A221Be3221Be1221B5221Bf4221Ba4221BQ221A221B7221BG221BL221B5221BE221BB221Bh4221Bm4221B5221BQ221BP221Bf4221Bu4221B6221A221B7221BG221Bb5221Bu4221B5221B4221BB221Bf4221Bo4221BM221Bd5221Bw4221B7221B3221B2221BO221Bd5221Bm4221BD221Bg1221BX1221Bf4221Bc522");
+replay.modes.push([2721, "input"]);
+replay.modes.push([2744, "output"]);
+replay.modes.push([2836, "input"]);
+replay.modes.push([2849, "output"]);
+replay.modes.push([2977, "input"]);
+replay.modes.push([2990, "output"]);
+replay.text.push("teleporter\n\n\nYou activate the teleporter!  As you spiral through time and space, you think you see a pattern in the stars...\n\n    ipMlgrgDybOZ\n\nAfter a few moments, you find yourself back on solid ground and a little disoriented.\n\n== Synacor Headquarters ==\nYou stand in the lobby of what appears to be a really fun place to work!  Sadly, there doesn't seem to be anyone around at the moment, so you make a note to call them later.  The bookshelf here looks like it might have something interesting in it, though.\n\nThings of interest here:\n- business card\n- strange book\n\nThere is 1 exit:\n- outside\n\nWhat do you do?\n# We still need to set the 8th register so the code is properly revealed, as the code uses this register\n! set_register 8 25734\n> Register #8 set to 25734\n# Disable the jump to the confirmation process, it takes forever\n! no_op 5489\n> Set 2 values starting at 5489 to noop\n# And the invert the logic of this jump, thus continuing as if the confirmation worked.\n! op 5495 jt\n> Set 5495");
+replay.keyframes.push([3000, 7825, 2744, [25975, 25974, 26006, 0, 101, 0, 0, 25734], [0, 2357, 32767, 32767, 2417, 2452, 2473, 2483, 2468, 2478, 0, 2488, 2623, 2643, 2488, 2553, 2488]]);
+replay.modes.push([3043, "input"]);
+replay.modes.push([3058, "output"]);
+replay.events.push("1B7221B3221BF221BU221BN221B2221BA221BD221Bj4221Bo4221BA221BC221BT221BQ221BP221BS221B2221BL221BA221BD221Bj4221Bo4221BA221Bx4221Bo4221BM221Bl4221BN221Be5221BN221BE221BC221BR221B2221Bp3221x3q-LxFvmMp9l_2lXM1_3xWMu_Ho_HpiAr4s_2XiA19q4219e12192219A219D219O219b5219-4219H219h4219o4219A219C219T219Q219P219S2192219d5219m42195219Q219P219r2219_221_3XsQX_HdaDmgAJqm8p42x3oxQLjrQ5vm8taG1Bc1221B3221BJ221BA221BH221BS221A221Bb5221Bc4221B3221BY1221BR221x3rxQ1sqQ6wm8uaG13-G22x3shQNlaQ7vm8vpF1B2221B3221BX1221BQ221BD221B3221Bf4221Ba4221BQ221A221B7221x3bhQ2wZQ8wm8wpF1_3oaQNjx4Ig5fmBsmAA_1W3KILd321_1_2JHMe317v3knMxWBd6ihBfWB2v3ngMbkUCxh8bkU1BC221B1221B1221BJ221B9221B2221x3chMBwjUByh8ckU1_3xmMr9t9sHW1rh8sH19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkAW4W4ptDi9n12W121n12321n12R21n12f421n12e521n12T21n12E21n12D21n12M21n12121n12621n12421n12T21n12Q21z1sfDwcDKPR2_3Y2WtBvn1vr7e4s_2dr719X2219c521922193219X1219Q219D2193219n3219N219g4219E219D2193219Y12193219521912199219B2");
+replay.events.push("19b4219i5219D219B219B2194219f4219o4219K219b5219W521942195219921992193219Y1219T2191219d4219o4219A219C2199219z4219o5219J219C2195219Z5219w42197219A219J219p2219_2218219i12182194219c3219o1219E21932194219d1219M219t4219c5219R219U218219L219A219D219j4219e42192219U219T2193219Y1219T2191219b42191218219c3219Y2219b1219Y12194219L219A219D219j4219c4219O2191219F2196219I2199219N219c1219L219C2191219x4219W521942195219N2194219S218219Z52191218219g2219y22192219L2198219N219c1219T2191219d4219e5219L2198219F219f4219e52199219z4219c4219O219321962197219D219U219L219C2191219d3219p1219Y1219X1219a4219E21962182195219C2191219x4219o5219d12197219Y12192219f4219N219l121821_2-4omHomH4o3qA19i1219C219f5219k5219h1219K219B219f4219g52199219_4219-42191219x4219Y4219X4219c5219Z1219Q219J219g1219n5219a4219621972194219A219l4219k5219R219M219N219l4219Y4219X4219c5219D219521932192219O219d5219m421952197219621952194219A2195219j3219R218219e3219e12195219f4219u4219L219a12192219d5219e5219N2192219A219D219j4219o5219J219C219f5219a5219P219G219F219G219L2");
+replay.modes.push([3455, "code"]);
+replay.modes.push([3467, "output"]);
+replay.codes.push([3455, "SlpnGuEnfhcE"]);
+replay.events.push("196219Q219Z5219o4219K219b5219Y42194219Y1219L219Q219f1219c1219L219A219D219j4219e5219N219D219c1219d5219e5219T219E219D219M219121962194219T219Q219d4218218219R219a4219c12191219d5219y42192219G219j5219o5219J219C219f5219c42193219Q219j4219w4219d5219i42196219A219J219d4219o4219M219d5219Y4219Q219M2193219T2195219Q219P219f4219o4219A219x4219o5219J219C2195219Z5219W5219T2194219G219v3219R218219c3219u12193219F219K2191219H219f4219c5219R218219G219C219b5219e52199219z4219m4219D219g1219X1219f4219e4219S219X1219i1219H219x4219Y4219X4219w4219F219S218219Z1219C2193219f4219o4219A219x4219e5219N2195219f4219c5219Z1219Q219J219d4219m42195219Q219P219r2219_2218219i121821821821_3c3z-F_-FqxIhD5sfJ1Bo1221B8221B3221Bj2221By2221B_2221Bo2221BF221B4221B9221Bx1221_3r3lYLtXLzxIy86dxI18219-3219s2219d5219a4219621942194219A219A219b5219e52199219z4219a5219X1219G219A219_3219R218219e3219e12195219f4219w4219F219S218219Z1219C2193219f4219k5219h1219a1219L2195219S219b5219Y4219i1219h1219m1219r4219R218219o3219i1219C219f5219e5219b1219K219B219f4219Y42");
+replay.events.push("19X4219e42192218219M219_4219a4219W1219P2197219c1219N219l4219Y4219Q219J219d4219i42191218219E219t4219i42196219I21992191219Q219n5219k4219M2195219C219D219J21922191219d4219o4219A219x4219a5219P2197219M2195219M219A219n5219Y4219a1219b5219e5219N2195219f4219g4219221821912193219Y12191219b5219-4219H219h4219e5219N2195219f4219e5219T219E219D219M219121962194219b1219c1219L219C2191219x4219k5219Z12197219Y1219Z5219-4219H218219l3219d221821_Bmx4wXLWYLcp6f3r_2cy62A__VGYk23v3_t4gyM_5m_2yyM1Bc2221B7221B4221BA221x3isM7nyMW6l_2xyM4v3ptMsyMg4m_2ezM1Be1221B2221BK221Bb5221Bo4221BK221Bb5221BY4221BX4221Bc5221BZ1221BQ221BJ221Bg1221Bn5221Ba4221B6221B7221B4221BA221Bl4221Bo4221BA221Bx4221BY4221BX4221Bc4221BO221BE221BX1221Bf4221B-4221B1221Bx4221Bc5221B7221B3221BF221Bf4221Be5221B3221B5221B2221BD221BB221B3221BM221Bt4221Bo4221BK221BD221BL221BQ221BJ221Bh3221BR221A221Bo2221Bs2221Bd5221Bo4221BK221Bb5221Ba5221BX1221BG221BA221B9221BA221BD221Bn3221BR221A221Be3221Be1221B5221Bf4221B-4221BN221B4221B7221BQ221Bx4221Bo4221BK221Bb5221Be522");
+replay.modes.push([3884, "input"]);
+replay.modes.push([3904, "output"]);
+replay.text.push(" to jt\n# This will reveal the seventh code\nuse teleporter\n\n\nA strange, electronic voice is projected into your mind:\n\n  \"Unusual setting detected!  Starting confirmation process!  Estimated time to completion: 1 billion years.\"\n\nYou wake up on a sandy beach with a slight headache.  The last thing you remember is activating that teleporter... but now you can't find it anywhere in your pack.  Someone seems to have drawn a message in the sand here:\n\n    SlpnGuEnfhcE\n\nIt begins to rain.  The message washes away.  You take a deep breath and feel firmly grounded in reality as the effects of the teleportation wear off.\n\n== Beach ==\nThis is a sandy beach in a cove on some tropical island.  It is raining.  The ocean is to your south, and heavy foliage is to your north; the beach extends west and east.\n\nThere are 3 exits:\n- west\n- east\n- north\n\nWhat do you do?\n# Pick up the mirror\n! set_memory 2722 0\n> Memory address 2722 set to 0\n# These values are used during the maze and they're input to the ");
+replay.keyframes.push([4000, 11836, 3904, [25975, 25974, 26006, 0, 101, 0, 0, 25734], [0, 2357, 32767, 32767, 2417, 2452, 2473, 2483, 2468, 2478, 32767, 2488, 2623, 0, 2488, 2553, 2498]]);
+replay.modes.push([4012, "input"]);
+replay.modes.push([4036, "output"]);
+replay.modes.push([4071, "input"]);
+replay.modes.push([4094, "output"]);
+replay.modes.push([4128, "input"]);
+replay.modes.push([4152, "output"]);
+replay.modes.push([4225, "input"]);
+replay.modes.push([4236, "output"]);
+replay.events.push("1B9221Bz4221Bo5221BJ221BC221B5221BZ5221Bc5221B7221BC221B1221BN221Bt3221BN221BY4221BQ221BJ221Bd4221Bm4221B5221B7221Bg1221B6221Bn5221Bi4221BI221B5221B5221BF221BC221B3221Bf4221Bo4221BK221Bb5221Be5221B9221Bz4221Bo5221BJ221BC221B5221BZ5221By4221B2221B6221B4221BN221Bv2221Br1221Be5221BN221B5221Bf4221Ba4221B6221B7221B4221BA221Bl4221Bg4221Bc1221B7221BT221BI221BJ221BU221Bb5221Bk5221BZ1221BS221B2221Bd5221BY4221BQ221BJ221Bd4221Bg4221B7221Ba1221B2221Bh4221x3iwMnAddNf4l_2dzM15XzM5B_1W3KKPZ321_1_2JJQa318v3udNhWBZ6ihBv_A2v3lWNduT2xh8duT1BZ1221BS221B2221x3sWN5YuT1yh8euT1BA222x3zXN1_tT2xh8ztT1B7221Ba1221B2221x3WXN3wtT1yh8-tT1BA222x3rXN3ttT4xh8ptT1B2221B6221B4221BN221x3YYN3mtT3yh8qtT1_3zdNv9r9YHSrh8cH19w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkAf1W81D0YAn12W121n12321n12R21n12f421n12w421n12721n12I21X1221n12521n12621z1-fDwcDKPJ2_3o3ZWAzeNty5c5s_2by519i1219C219f5219k4219B219o1219f1219f4219o4219A219C2199219z4219e5219N2195219f4219w42197219I21821952196219h42");
+replay.events.push("19N219Y4219Q219J219d4219o5219J219C219f5219c5219R218219f4219o5219J219C21952192219R219E219B219h4219k4219B219o1219X1219A219D219j4219a421912194219G219v3219R218219a2219c32191219d5219k5219h1219G219M219b52191218219o2219s2219d5219u421962182197219G219b5219u421952194219B219f4219c521972193219F219K2191219H219f4219k521992195219A219T219f4219-42191219x4219o5219J219C2195219Z5219i4219921942194219f4219k5219T21922196219D219f4219o5219J219C219f5219k5219Z1219Q219P219f4219g5219D219L219O2191219A219V219C219C219C2193219b5219-42191219x4219e5219N2195219f4219a4219621972194219A219j42191218219e3219e1219K2195219C219R2192219l4219e5219N2195219f4219w42197219I21821952196219h4219N219o5219J219C219f5219c5219R218219f4219421_3k3ueNWfNwlHtA5exH1Bm1221Bv1221Bs1221BB221BX1221Bk1221Bp1221Bk1221Bj1221BB221BK221_3j3Zg1rf1ZmHs56jlH193219c5219V219U219X1219i1219L219D2191219d4219o4219A219x4219c4219A219D219Y1219T219O219R219M219t4219-42191219x4219o5219J219C2195219Z5219i4219I2196219P2196219521972196219h3219d2218219o3219u22191219D219M219X12");
+replay.modes.push([4645, "input"]);
+replay.modes.push([4662, "output"]);
+replay.modes.push([4691, "code"]);
+replay.modes.push([4703, "output"]);
+replay.codes.push([4691, "YOUlUoXioTpY"]);
+replay.modes.push([4723, "input"]);
+replay.modes.push([4729, "output"]);
+replay.text.push("mirror code\n! set_memory 3955 31318\n> Memory address 3955 set to 31318\n! set_memory 3956 9258\n> Memory address 3956 set to 9258\n! set_memory 3957 10600\n> Memory address 3957 set to 10600\n# And using the mirror shows the code\nuse mirror\n\n\nYou gaze into the mirror, and you see yourself gazing back.  But wait!  It looks like someone wrote on your face while you were unconscious on the beach!  Through the mirror, you see \"YqToiXoUlUOY\" scrawled in charcoal on your forehead.\n\nCongratulations; you have reached the end of the challenge!\n\n\nWhat do you do?\n# That code is reflected in a mirror, using a helper to decode it to reveal the final code\n! reverse_mirror\n> The code in the mirror is \"YOUlUoXioTpY\"\n# We're all done!\n! end\n> Goodbye!\n");
+replay.events.push("19c12192219H219L219c1219L219C2191219A219l3219r1219o5219J219C219f5219m4219D219g1219X1219f4219a5219P21972194219A21952191219d4219e5219N2195219f4219g4219I219J219d4219-4219H219h4219e5219N2195219f4219c4219A219D219M218219D219I219D2193219d4219j121821-2uVuVpa5h5d-419w4219Y1219D219c1219d5219e4219M219z4219o5219J219C219f5219e4219M219_2219f321_3bfDz-CzyCojAe5r_2qkA");
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+# Native versions of subroutines in the challenge binary.  These know what
+# the routines do, not where they live, so they're attached to an address
+# with Program.add_intrinsic, or "! intrinsic <name> <address>" in a script
+
+from program import intrinsic, op_out
+
+# The rows of the confirmation function for the last r7 seen
+_confirm_rows = {'r7': None, 'rows': None}
+
+
+@intrinsic("xor", "r0 = r0 ^ r1")
+def xor(program):
+    regs = program.registers
+    regs[0] = regs[0] ^ regs[1]
+    return True
+
+
+@intrinsic("out", "Output r0")
+def out(program):
+    op_out(program, program.registers[0])
+    return True
+
+
+@intrinsic("out_xor", "r0 = r0 ^ r2, then output r0")
+def out_xor(program):
+    regs = program.registers
+    regs[0] = regs[0] ^ regs[2]
+    op_out(program, regs[0])
+    return True
+
+
+@intrinsic("each", "Call r1 for each item of the length prefixed list at r0")
+def each(program):
+    # Only worth doing if the callback is native too, otherwise the VM
+    # would still have to run it once per item
+    regs = program.registers
+    func = program.intrinsics.get(regs[1])
+    if func is None:
+        return False
+    base = regs[0]
+    callback = regs[1]
+    for i in range(program.memory[base]):
+        regs[0] = program.memory[base + 1 + i]
+        regs[1] = i
+        if not func(program):
+            raise Exception(f"Intrinsic at {callback} declined partway through a list")
+    regs[0] = base
+    regs[1] = program.memory[base]
+    return True
+
+
+@intrinsic("confirm", "The teleporter confirmation, r0 = f(r0, r1) using r7")
+def confirm(program):
+    # f(0, n) = n + 1, f(m, 0) = f(m - 1, r7), f(m, n) = f(m - 1, f(m, n - 1))
+    # all mod 32768, built up a row of m at a time.  Every path through the
+    # routine returns from the f(0, n) case, so r1 always ends up as r0 - 1
+    regs = program.registers
+    m, n, r7 = regs[0], regs[1], regs[7]
+    if _confirm_rows['r7'] != r7:
+        _confirm_rows['r7'] = r7
+        _confirm_rows['rows'] = [[(x + 1) & 0x7fff for x in range(32768)]]
+    rows = _confirm_rows['rows']
+    while len(rows) <= m:
+        prev = rows[-1]
+        row = [prev[r7]]
+        for _ in range(32767):
+            row.append(prev[row[-1]])
+        rows.append(row)
+    regs[0] = rows[m][n]
+    regs[1] = (regs[0] - 1) & 0x7fff
+    return True
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+
+# Translates hot basic blocks of VM code into Python functions.  A block runs
+# from its start address up to and including the first jump, call, or ret,
+# and stops short of anything that has to go back through the interpreter
+# (in, out, halt, unknown opcodes, and writes to a literal).  Registers live
+# in local variables for the life of the block, and each block returns the
+# next pc along with the number of instructions it ran.
+
+from program import _opcodes, ProgramException, MEMORY_OUT_OF_RANGE
+
+_ARITH = {
+    "add": "({a} + {b}) & 32767",
+    "mult": "({a} * {b}) & 32767",
+    "mod": "{a} % {b}",
+    "eq": "1 if {a} == {b} else 0",
+    "gt": "1 if {a} > {b} else 0",
+    "and": "{a} & {b}",
+    "or": "{a} | {b}",
+}
+
+_FOLD = {
+    "add": lambda a, b: (a + b) & 32767,
+    "mult": lambda a, b: (a * b) & 32767,
+    "mod": lambda a, b: a % b,
+    "eq": lambda a, b: 1 if a == b else 0,
+    "gt": lambda a, b: 1 if a > b else 0,
+    "and": lambda a, b: a & b,
+    "or": lambda a, b: a | b,
+}
+
+_WRITES = set(_ARITH) | {"set", "rmem", "not", "pop"}
+_ENDS = {"jmp", "jt", "jf", "call", "ret"}
+_STOPS = {"halt", "in", "out"}
+
+
+class Jit:
+    def __init__(self, threshold=20, max_size=256):
+        self.threshold = threshold
+        self.max_size = max_size
+        self.hits = {}
+        self.skip = set()
+        # Compiled functions, keyed on the start address and the words they
+        # were built from, so they can be shared by every Program
+        self.compiled = {}
+
+    def hit(self, pc):
+        count = self.hits.get(pc, 0) + 1
+        self.hits[pc] = count
+        return count >= self.threshold and pc not in self.skip
+
+    def compile(self, program, pc):
+        instructions = []
+        cur = pc
+        while len(instructions) < self.max_size:
+            if cur >= len(program.memory) or program.memory[cur] not in _opcodes:
+                break
+            entry = program.decoded_at(cur)
+            name = _opcodes[entry[3]]['name']
+            if name in _STOPS or not _compilable(name, entry[1]):
+                break
+            instructions.append((cur, name, entry[1], entry[2]))
+            cur = entry[2]
+            if name in _ENDS:
+                break
+
+        if len(instructions) == 0:
+            self.skip.add(pc)
+            return None
+
+        key = (pc, tuple(program.memory[pc:cur]))
+        func = self.compiled.get(key)
+        if func is None:
+            func = _build(pc, instructions)
+            self.compiled[key] = func
+        program.add_block(pc, cur, func)
+        return func
+
+
+def _compilable(name, args):
+    if name in _WRITES:
+        return args[0] >= 32768
+    return True
+
+
+def _build(start, instructions):
+    used = set()
+    written = set()
+    for _, name, args, _ in instructions:
+        for value in args:
+            if value >= 32768:
+                used.add(value - 32768)
+        if name in _WRITES:
+            written.add(args[0] - 32768)
+
+    def val(value):
+        return f"r{value - 32768}" if value >= 32768 else str(value)
+
+    def flush():
+        return [f"    regs[{x}] = r{x}" for x in sorted(written)]
+
+    lines = [f"def block_{start}(program):"]
+    lines.append("    regs = program.registers")
+    if any(name in {"rmem", "wmem"} for _, name, _, _ in instructions):
+        lines.append("    memory = program.memory")
+    if any(name == "rmem" for _, name, _, _ in instructions):
+        lines.append("    size = len(memory)")
+    if any(name in {"push", "pop", "call", "ret"} for _, name, _, _ in instructions):
+        lines.append("    stack = program.stack")
+    for x in sorted(used):
+        lines.append(f"    r{x} = regs[{x}]")
+
+    count = 0
+    ended = False
+    for pc, name, args, next_pc in instructions:
+        count += 1
+        if name in _ARITH:
+            dest, a, b = args
+            if a < 32768 and b < 32768 and not (name == "mod" and b == 0):
+                lines.append(f"    {val(dest)} = {_FOLD[name](a, b)}")
+            else:
+                lines.append(f"    {val(dest)} = " + _ARITH[name].format(a=val(a), b=val(b)))
+        elif name == "set":
+            lines.append(f"    {val(args[0])} = {val(args[1])}")
+        elif name == "not":
+            if args[1] < 32768:
+                lines.append(f"    {val(args[0])} = {args[1] ^ 32767}")
+            else:
+                lines.append(f"    {val(args[0])} = {val(args[1])} ^ 32767")
+        elif name == "rmem":
+            lines.append(f"    if {val(args[1])} >= size:")
+            lines.extend("    " + x for x in flush())
+            lines.append("        raise ProgramException(MEMORY_OUT_OF_RANGE)")
+            lines.append(f"    {val(args[0])} = memory[{val(args[1])}]")
+        elif name == "wmem":
+            # The write may land on code, including this block, so leave
+            # as soon as that happens and let the caller pick up from here
+            lines.append(f"    dest = {val(args[0])}")
+            lines.append(f"    program.write(dest, {val(args[1])})")
+            lines.append(f"    if program.covers_code(dest):")
+            lines.extend("    " + x for x in flush())
+            lines.append(f"        return {next_pc}, {count}")
+        elif name == "push":
+            lines.append(f"    stack.append({val(args[0])})")
+        elif name == "pop":
+            lines.append(f"    {val(args[0])} = stack.pop()")
+        elif name == "noop":
+            pass
+        elif name == "jmp":
+            lines.extend(flush())
+            lines.append(f"    return {val(args[0])}, {count}")
+            ended = True
+        elif name in {"jt", "jf"}:
+            value, target = args
+            lines.extend(flush())
+            if value < 32768:
+                taken = (value != 0) == (name == "jt")
+                lines.append(f"    return {val(target) if taken else next_pc}, {count}")
+            else:
+                test = val(value) if name == "jt" else f"not {val(value)}"
+                lines.append(f"    if {test}:")
+                lines.append(f"        return {val(target)}, {count}")
+                lines.append(f"    return {next_pc}, {count}")
+            ended = True
+        elif name == "call":
+            lines.extend(flush())
+            lines.append(f"    if program.intrinsics:")
+            lines.append(f"        func = program.intrinsics.get({val(args[0])})")
+            lines.append(f"        if func is not None and func(program):")
+            lines.append(f"            return {next_pc}, {count}")
+            lines.append(f"    stack.append({next_pc})")
+            lines.append(f"    return {val(args[0])}, {count}")
+            ended = True
+        elif name == "ret":
+            lines.extend(flush())
+            lines.append(f"    return stack.pop(), {count}")
+            ended = True
+        else:
+            raise Exception(f"Unable to compile '{name}'")
+
+    if not ended:
+        lines.extend(flush())
+        lines.append(f"    return {instructions[-1][3]}, {count}")
+
+    scope = {'ProgramException': ProgramException, 'MEMORY_OUT_OF_RANGE': MEMORY_OUT_OF_RANGE}
+    exec("\n".join(lines), scope)
+    return scope[f"block_{start}"]
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+# Counts where a program spends its instructions.  Every instruction bumps a
+# counter for its pc and one for its opcode.  Calls and returns keep a stack
+# of the functions being run, and each time it changes, the instructions
+# since the last change go to the function on top and to the whole stack,
+# so nothing more than the counters happens per instruction.  Functions are
+# named by their address, and "main" is whatever was running when
+# profiling started.
+
+from array import array
+
+from program import _opcodes
+
+_op_call = _opcodes['names']['call']
+_op_ret = _opcodes['names']['ret']
+
+
+class Profiler:
+    def __init__(self):
+        self.pcs = array('Q', bytes(8 * 32768))
+        self.ops = array('Q', bytes(8 * 256))
+        self.total = 0
+        # (function, total when it was called), outermost first
+        self.frames = [("main", 0)]
+        self.path = ("main",)
+        # Instructions run with exactly this stack of functions
+        self.stacks = {}
+        # Instructions run in each function itself, and including what it
+        # called
+        self.exclusive = {}
+        self.inclusive = {}
+        # (caller, callee) to the number of calls
+        self.calls = {}
+        self._mark = 0
+
+    def hit(self, pc, opcode):
+        # Called before each instruction while profiling
+        self.pcs[pc] += 1
+        self.ops[opcode] += 1
+        self.total += 1
+
+    def after(self, program, entry):
+        # Called after each call and ret
+        if entry[3] == _op_call:
+            # A call an intrinsic handled carries on at the next instruction
+            if program.pc != entry[2]:
+                self._settle()
+                self.calls[(self.path[-1], program.pc)] = self.calls.get((self.path[-1], program.pc), 0) + 1
+                self.frames.append((program.pc, self.total))
+                self.path += (program.pc,)
+        elif len(self.frames) > 1:
+            self._settle()
+            func, start = self.frames.pop()
+            self.path = self.path[:-1]
+            # Recursive calls are already covered by the outer call
+            if func not in self.path:
+                self.inclusive[func] = self.inclusive.get(func, 0) + self.total - start
+
+    def _settle(self):
+        count = self.total - self._mark
+        if count > 0:
+            self.stacks[self.path] = self.stacks.get(self.path, 0) + count
+            self.exclusive[self.path[-1]] = self.exclusive.get(self.path[-1], 0) + count
+            self._mark = self.total
+
+    def functions(self):
+        # [(function, calls, inclusive, exclusive)], most inclusive first,
+        # counting the functions that are still running up to now
+        self._settle()
+        inclusive = dict(self.inclusive)
+        seen = set()
+        for func, start in self.frames:
+            if func not in seen:
+                seen.add(func)
+                inclusive[func] = inclusive.get(func, 0) + self.total - start
+        calls = {}
+        for (_, callee), count in self.calls.items():
+            calls[callee] = calls.get(callee, 0) + count
+        ret = [(func, calls.get(func, 0), inclusive[func], self.exclusive.get(func, 0)) for func in inclusive]
+        ret.sort(key=lambda x: (-x[2], str(x[0])))
+        return ret
+
+    def write_report(self, filename, top=40):
+        with open(filename, "w") as f:
+            f.write(f"{self.total} instructions\n\n")
+            f.write("Opcodes:\n")
+            for opcode in sorted(range(len(self.ops)), key=lambda x: -self.ops[x]):
+                if self.ops[opcode] > 0:
+                    name = _opcodes[opcode]['name'] if opcode in _opcodes else str(opcode)
+                    f.write(f"  {name:<4} {self.ops[opcode]:12d}\n")
+            f.write("\nFunctions:\n")
+            f.write(f"  {'function':>8} {'calls':>10} {'inclusive':>12} {'exclusive':>12}\n")
+            for func, calls, inclusive, exclusive in self.functions()[:top]:
+                f.write(f"  {func:>8} {calls:10d} {inclusive:12d} {exclusive:12d}\n")
+            f.write("\nInstructions:\n")
+            for pc in sorted(range(len(self.pcs)), key=lambda x: -self.pcs[x])[:top]:
+                if self.pcs[pc] > 0:
+                    f.write(f"  {pc:8d} {self.pcs[pc]:12d}\n")
+
+    def write_collapsed(self, filename):
+        # One "main;caller;callee count" line per stack, as flame graph
+        # tools expect
+        self._settle()
+        with open(filename, "w") as f:
+            for path, count in sorted(self.stacks.items(), key=lambda x: [str(y) for y in x[0]]):
+                f.write(";".join(str(x) for x in path) + f" {count}\n")
+
+    def write_call_graph(self, filename):
+        # Graphviz dot, each function with its counts, each edge with how
+        # often it was taken
+        with open(filename, "w") as f:
+            f.write("digraph calls {\n")
+            f.write("    node [shape=box];\n")
+            for func, calls, inclusive, exclusive in self.functions():
+                f.write(f'    "{func}" [label="{func}\\ncalls {calls}\\ninclusive {inclusive}\\nexclusive {exclusive}"];\n')
+            for (caller, callee), count in sorted(self.calls.items(), key=lambda x: -x[1]):
+                f.write(f'    "{caller}" -> "{callee}" [label="{count}"];\n')
+            f.write("}\n")
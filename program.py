@@ -2,11 +2,18 @@
 
 from collections import deque, defaultdict
 from struct import unpack, pack
+from array import array
+from itertools import compress
+import sys
 from datetime import datetime
 from inspect import signature
+import atexit
 import zipfile
 
 _opcodes = {"names": {}}
+# Every opcode, whatever '! opcodes' has left enabled in _opcodes
+_all_opcodes = {"names": {}}
+_intrinsics = {}
 _io_logger = None
 
 
@@ -23,20 +30,79 @@ def opcode(name, opcode_num):
             'opcode': opcode_num,
             'size': len(signature(func).parameters),
         }
+        _all_opcodes['names'][name] = opcode_num
+        _all_opcodes[opcode_num] = _opcodes[opcode_num]
         def wrapper(*args2, **kwargs):
             return func(*args2, **kwargs)
         return wrapper
     return real_opts
 
 
+def intrinsic(name, help):
+    # Register a Python replacement for a VM subroutine.  The function gets
+    # the program when the routine is called, and either leaves the registers
+    # and stack as the routine's ret would and returns True, or returns False
+    # without changing anything to let the VM run the routine itself
+    def real_opts(func):
+        if name in _intrinsics:
+            raise Exception(f"intrinsic '{name}' used more than once")
+        _intrinsics[name] = {
+            'func': func,
+            'name': name,
+            'help': help,
+        }
+        return func
+    return real_opts
+
+
 class ProgramException(BaseException):
     def __init__(self, msg):
         self.msg = msg
 
 
+HALTED = "Halt instruction hit!"
+MEMORY_OUT_OF_RANGE = "Memory access out of range"
+BUDGET_EXHAUSTED = "Instruction budget exhausted"
+
+
+class Event:
+    # Something Program.execute() stopped for
+    __slots__ = ("value",)
+
+    def __init__(self, value=None):
+        self.value = value
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.value!r})"
+
+
+class OutputLine(Event):
+    # value is the line, without the newline
+    __slots__ = ()
+
+
+class InputNeeded(Event):
+    # send() the next line of input to continue
+    __slots__ = ()
+
+
+class BudgetExhausted(Event):
+    # value is the number of instructions run in this slice
+    __slots__ = ()
+
+
+class Halted(Event):
+    __slots__ = ()
+
+
+class VMError(Event):
+    # value is the error message
+    __slots__ = ()
+
+
 @opcode("halt", 0)
 def op_halt(program):
-    raise ProgramException("Halt instruction hit!")
+    raise ProgramException(HALTED)
 
 
 @opcode("add", 9)
@@ -60,23 +126,26 @@ def op_mod(program, dest, a, b):
 @opcode("rmem", 15)
 def op_rmem(program, dest, src):
     src = program.get_val(src)
+    try:
+        value = program.memory[src]
+    except IndexError:
+        raise ProgramException(MEMORY_OUT_OF_RANGE)
     if program.log_reads:
-        program.show(f">> Memory read {src} > {program.memory[src]}")
-    program.set_val(dest, program.memory[src])
+        program.show(f">> Memory read {src} > {value}")
+    program.set_val(dest, value)
 
 
 @opcode("wmem", 16)
 def op_wmem(program, dest, src):
     src = program.get_val(src)
     dest = program.get_val(dest)
-    program.memory[dest] = src
-    program.changed[dest] = src
+    program.write(dest, src)
 
 
 @opcode("out", 19)
 def op_out(program, value):
-    if "bpo" in program.breakpoints:
-        if program.output_buffer == "":
+    if program.break_output:
+        if len(program._output) == 0:
             program.breakpoint()
     value = program.get_val(value)
     valid = True
@@ -86,6 +155,10 @@ def op_out(program, value):
         valid = False
     if not valid:
         raise ProgramException("Unknown output character")
+    if program.output_limit is not None:
+        if program.output_limit <= 0:
+            raise ProgramException("Output limit reached")
+        program.output_limit -= 1
     if _io_logger:
         _io_logger.handle_output(program, chr(value))
     if value < 32 and value != ord('\n'):
@@ -93,13 +166,18 @@ def op_out(program, value):
     else:
         value = chr(value)
     if value == '\n':
-        program.room.append(program.output_buffer)
-        program.handle_io("   " + program.output_buffer)
-        program.output_buffer = ""
+        line = "".join(program._output)
+        program.room.append(line)
+        if len(program.room) > ROOM_LIMIT:
+            del program.room[:-ROOM_LIMIT]
+        program.handle_io("   " + line)
+        if program.lines is not None:
+            program.lines.append(line)
+        program._output = []
     else:
-        program.output_buffer += value
+        program._output.append(value)
     if not program.hide_output:
-        print(value, end='', flush=True)
+        program.sink.write(value)
 
 
 def debugger(program, value):
@@ -111,9 +189,47 @@ def debugger(program, value):
         print("inv #    = Invert the meaning of #")
         print("jmp #    = Jump to a PC")
         print("noop #   = Noop an instruction")
+        print("rec [#]  = Record every # instructions so the program can go back, 'rec off' stops")
+        print("back [#] = Step back # instructions")
+        print("backw #  = Run back to the last write to address #")
+        print("whenr #  = Show when register # last changed")
+        return True
+    if value == "rec" or value.startswith("rec "):
+        from timetravel import Recorder
+        if value == "rec off":
+            program.recorder = None
+            print("Recording stopped")
+        else:
+            program.recorder = Recorder(*[int(x) for x in value.split(' ')[1:]])
+            print("Recording")
+        return True
+    if value == "back" or value.startswith("back ") or value.startswith("backw ") or value.startswith("whenr "):
+        recorder = program.recorder
+        if recorder is None:
+            print("Not recording, use 'rec' first")
+            return True
+        value = value.split(' ')
+        try:
+            if value[0] == "whenr":
+                i = recorder.last_write(32768 + int(value[1]))
+                if i is None:
+                    print(f"Register {value[1]} hasn't changed since step {recorder.oldest()}")
+                else:
+                    print(f"Register {value[1]} last changed at {recorder.describe(program, i)}")
+                return True
+            if value[0] == "backw":
+                recorder.back_to_write(program, int(value[1]))
+            else:
+                recorder.step_back(program, int(value[1]) if len(value) > 1 else 1)
+        except Exception as e:
+            print(e)
+            return True
+        _, info = program.decode(program.pc)
+        print(f"Back to step {recorder.step}: {info.strip()}")
+        print(list(program.registers))
         return True
     if value.startswith("noop "):
-        program.memory[int(value[5:])] = 21
+        program.poke(int(value[5:]), 21)
         print("noop set")
         return True
     if value.startswith("jmp "):
@@ -121,15 +237,15 @@ def debugger(program, value):
         print("PC set")
         return True
     if value.startswith("inv "):
-        program.breakpoints.add(value)
+        program.inverted.add(int(value[4:]))
         print("Inverted meaning added")
         return True
     if value.startswith("bpr "):
-        program.breakpoints.add(value)
+        program.break_registers.add(int(value[4:]))
         print("Breakpoint added")
         return True
     if value.startswith("bpo"):
-        program.breakpoints.add(value)
+        program.break_output = True
         print("Breakpoint added")
         return True
     if value.startswith("setr"):
@@ -148,6 +264,7 @@ def debugger(program, value):
 def op_in(program, dest):
     if len(program.input_buffer) == 0:
         program.room = []
+        program.sink.flush()
         temp = ""
         while len(temp) == 0:
             temp = input()
@@ -162,6 +279,11 @@ def op_in(program, dest):
                 temp = ""
         temp += "\n"
         program.input_buffer += temp
+        if program.recorder is not None and program.recorder.moved:
+            # The debugger went back to before this instruction, so it never
+            # ran.  What was typed waits for the program to ask for input
+            program.recorder.moved = False
+            return
 
     if program.input_buffer[0] == "\n":
         program.handle_io("+> " + program.input_buffer_echo)
@@ -175,7 +297,7 @@ def op_in(program, dest):
     program.input_buffer = program.input_buffer[1:]
 
     if len(program.input_buffer) == 0:
-        program.save_state = program.clone()
+        program.checkpoint()
 
 
 @opcode("noop", 21)
@@ -192,6 +314,10 @@ def op_jmp(program, target):
 @opcode("call", 17)
 def op_call(program, target):
     target = program.get_val(target)
+    if program.intrinsics:
+        func = program.intrinsics.get(target)
+        if func is not None and func(program):
+            return
     program.stack.append(program.pc)
     program.pc = target
 
@@ -206,7 +332,8 @@ def op_ret(program):
 def op_jt(program, value, target):
     target = program.get_val(target)
     value = program.get_val(value)
-    if f"inv {program.history[-1]}" in program.breakpoints:
+    if program.inverted and program.history[-1] in program.inverted:
+        program.sink.flush()
         print(f"Invert logic hit for {program.history[-1]}")
         if value == 0:
             program.pc = target
@@ -219,7 +346,8 @@ def op_jt(program, value, target):
 def op_jf(program, value, target):
     target = program.get_val(target)
     value = program.get_val(value)
-    if f"inv {program.history[-1]}" in program.breakpoints:
+    if program.inverted and program.history[-1] in program.inverted:
+        program.sink.flush()
         print(f"Invert logic hit for {program.history[-1]}")
         if value != 0:
             program.pc = target
@@ -279,6 +407,10 @@ def op_pop(program, dest):
     program.set_val(dest, program.stack.pop())
 
 
+# Opcodes that end a basic block
+_leaders = {_opcodes['names'][x] for x in ["halt", "jmp", "jt", "jf", "call", "ret", "in", "out"]}
+
+
 class Serialize:
     def __init__(self):
         self.buffer = []
@@ -290,10 +422,19 @@ class Serialize:
         return ret
 
     def read_list(self):
-        ret = []
-        count = self.read_int()
-        for _ in range(count):
-            ret.append(self.read_int())
+        return self.read_array('H', self.read_int()).tolist()
+
+    def read_array(self, typecode, count=None):
+        # A whole typed array in one copy, stored little endian
+        if count is None:
+            count = unpack("<I", self.buffer[self.offset:self.offset+4])[0]
+            self.offset += 4
+        ret = array(typecode)
+        size = count * ret.itemsize
+        ret.frombytes(self.buffer[self.offset:self.offset+size])
+        if sys.byteorder == "big":
+            ret.byteswap()
+        self.offset += size
         return ret
 
     def read_str(self):
@@ -307,8 +448,15 @@ class Serialize:
 
     def add_list(self, value):
         self.add_int(len(value))
-        for cur in value:
-            self.add_int(cur)
+        self.add_array(array('H', value), False)
+
+    def add_array(self, value, count=True):
+        if count:
+            self.buffer.append(pack('<I', len(value)))
+        if sys.byteorder == "big":
+            value = value[:]
+            value.byteswap()
+        self.buffer.append(value.tobytes())
 
     def add_str(self, value):
         value = value.encode("utf-8")
@@ -316,79 +464,500 @@ class Serialize:
         self.buffer.append(value)
 
 
+# Snapshots are a zip holding either state.bin, the original format with
+# every changed address and value, or snapshot.bin, which starts with a
+# version number and stores whole pages
+SNAPSHOT_VERSION = 2
+SNAPSHOT_COMPRESSION = {
+    "none": zipfile.ZIP_STORED,
+    "zlib": zipfile.ZIP_DEFLATED,
+    "bzip2": zipfile.ZIP_BZIP2,
+    "lzma": zipfile.ZIP_LZMA,
+}
+
+
+PAGE_BITS = 8
+PAGE_SIZE = 1 << PAGE_BITS
+PAGE_MASK = PAGE_SIZE - 1
+
+# Where registers and the stack sit in the space state_hash() keys on
+HASH_REGISTERS = 32768
+HASH_STACK = 1 << 16
+
+
+def zobrist(addr, value):
+    # The 64-bit key for value at addr.  It's a fixed mix of the two rather
+    # than a random table, so every process agrees on it
+    x = ((addr << 16) | value) * 0x9E3779B97F4A7C15 & 0xFFFFFFFFFFFFFFFF
+    x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9 & 0xFFFFFFFFFFFFFFFF
+    x = (x ^ (x >> 27)) * 0x94D049BB133111EB & 0xFFFFFFFFFFFFFFFF
+    return x ^ (x >> 31)
+
+
+def format_instruction(pc, words, opcodes=_opcodes):
+    # The disassembly of the instruction at pc, words starts with its opcode
+    if words[0] not in opcodes:
+        return f"{pc:5d}: {words[0]}"
+    info = f"{pc:5d}: {opcodes[words[0]]['name']:<4}"
+    for value in words[1:]:
+        if value < 32768:
+            info += f" {value}"
+        else:
+            info += f" [{value - 32768}]"
+    return info
+
+
+class OutputSink:
+    # Where a program's terminal output and log lines go.  Output is held
+    # until a line is complete, and the log file is kept open between lines
+    def __init__(self, stream=None, log_name="program.log"):
+        self.stream = stream
+        self.log_name = log_name
+        self.log_file = None
+        self.pending = []
+
+    def write(self, value):
+        self.pending.append(value)
+        if value == "\n":
+            self.flush(False)
+
+    def flush(self, force=True):
+        stream = sys.stdout if self.stream is None else self.stream
+        if len(self.pending) > 0:
+            stream.write("".join(self.pending))
+            self.pending = []
+        if force:
+            stream.flush()
+            if self.log_file is not None:
+                self.log_file.flush()
+
+    def log(self, value):
+        if self.log_name is not None:
+            if self.log_file is None:
+                self.log_file = open(self.log_name, "a")
+            self.log_file.write(value + "\n")
+
+    def close(self):
+        self.flush()
+        if self.log_file is not None:
+            self.log_file.close()
+            self.log_file = None
+
+
+_default_sink = OutputSink()
+atexit.register(_default_sink.close)
+ROOM_LIMIT = 1000
+
+
+class PagedArray:
+    # A fixed size typed array split into pages.  Copies share every page,
+    # and a page is only copied the first time one side writes to it
+    __slots__ = ("typecode", "size", "pages", "owned")
+
+    def __init__(self, typecode, values):
+        self.typecode = typecode
+        self.size = len(values)
+        self.pages = [array(typecode, values[i:i + PAGE_SIZE]) for i in range(0, self.size, PAGE_SIZE)]
+        self.owned = bytearray(len(self.pages))
+
+    @staticmethod
+    def zeros(typecode, size):
+        # Every page starts out as the same zero page, which is safe since
+        # none of them are owned
+        ret = PagedArray(typecode, [])
+        ret.size = size
+        ret.pages = [array(typecode, bytes(PAGE_SIZE * array(typecode).itemsize))] * ((size + PAGE_MASK) >> PAGE_BITS)
+        ret.owned = bytearray(len(ret.pages))
+        return ret
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, addr):
+        if isinstance(addr, slice):
+            return array(self.typecode, [self[i] for i in range(*addr.indices(self.size))])
+        return self.pages[addr >> PAGE_BITS][addr & PAGE_MASK]
+
+    def __setitem__(self, addr, value):
+        page = addr >> PAGE_BITS
+        if self.owned is None:
+            self.pages = self.pages[:]
+            self.owned = bytearray(len(self.pages))
+        if not self.owned[page]:
+            self.pages[page] = self.pages[page][:]
+            self.owned[page] = 1
+        self.pages[page][addr & PAGE_MASK] = value
+
+    def __iter__(self):
+        for page in self.pages:
+            yield from page
+
+    def __eq__(self, other):
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def copy(self):
+        ret = PagedArray.__new__(PagedArray)
+        ret.typecode = self.typecode
+        ret.size = self.size
+        ret.pages = self.pages
+        ret.owned = None
+        self.owned = None
+        return ret
+
+    def tobytes(self):
+        return b''.join(page.tobytes() for page in self.pages)
+
+    def diff(self, base):
+        # The pages that differ from base as (index, bytes) pairs.  Pages
+        # still shared with base are skipped without looking at them
+        return [
+            (i, page.tobytes()) for i, (page, other) in enumerate(zip(self.pages, base.pages))
+            if page is not other and page != other
+        ]
+
+    def patch(self, pages):
+        # Undoes diff(), given a copy of the same base
+        if self.owned is None:
+            self.pages = self.pages[:]
+            self.owned = bytearray(len(self.pages))
+        for i, data in pages:
+            page = array(self.typecode)
+            page.frombytes(data)
+            self.pages[i] = page
+            self.owned[i] = 1
+
+
+class ChangeMap:
+    # The memory writes a program has made, stored as a flag and a value for
+    # every address rather than as a dict, so copies share pages like memory
+    __slots__ = ("mask", "data", "count")
+
+    def __init__(self, size=32768):
+        self.mask = PagedArray.zeros('B', size)
+        self.data = PagedArray.zeros('H', size)
+        self.count = 0
+
+    def __setitem__(self, key, value):
+        if not self.mask[key]:
+            self.mask[key] = 1
+            self.count += 1
+        self.data[key] = value
+
+    def __getitem__(self, key):
+        if not self.mask[key]:
+            raise KeyError(key)
+        return self.data[key]
+
+    def __contains__(self, key):
+        return 0 <= key < len(self.mask) and self.mask[key] != 0
+
+    def __delitem__(self, key):
+        if not self.mask[key]:
+            raise KeyError(key)
+        self.mask[key] = 0
+        self.data[key] = 0
+        self.count -= 1
+
+    def __len__(self):
+        return self.count
+
+    def get(self, key, default=None):
+        return self.data[key] if key in self else default
+
+    def keys(self):
+        ret = []
+        for i, page in enumerate(self.mask.pages):
+            if any(page):
+                ret.extend(compress(range(i * PAGE_SIZE, (i + 1) * PAGE_SIZE), page))
+        return ret
+
+    def values(self):
+        ret = []
+        for page, data in zip(self.mask.pages, self.data.pages):
+            if any(page):
+                ret.extend(compress(data, page))
+        return ret
+
+    def items(self):
+        # In address order, not the order they were written in like a dict
+        return zip(self.keys(), self.values())
+
+    def copy(self):
+        ret = ChangeMap.__new__(ChangeMap)
+        ret.mask = self.mask.copy()
+        ret.data = self.data.copy()
+        ret.count = self.count
+        return ret
+
+
 class Program:
+    __slots__ = (
+        "pc", "memory", "image", "changed", "registers", "stack",
+        "input_buffer", "input_buffer_echo", "_output", "room", "lines", "sink",
+        "need_header", "journal", "_checkpoint", "hide_output", "output_limit", "log_all", "log_reads",
+        "break_output", "break_registers", "inverted", "history", "jit", "intrinsics",
+        "_decoded", "_decoded_covers", "_decoded_shared", "_blocks", "_block_at",
+        "hash_mask", "hash_registers", "hash_stack", "_hash", "recorder", "tracer", "profiler",
+        "watched", "watchers", "watch_registers",
+    )
+
     @staticmethod
     def set_logger(logger):
+        # Returns the logger it replaces
         global _io_logger
-        _io_logger = logger
+        ret, _io_logger = _io_logger, logger
+        return ret
 
     def __init__(self):
         self.pc = 0
-        self.memory = []
-        self.changed = {}
-        self.registers = [0] * 8
-        self.stack = deque()
+        self.memory = PagedArray('H', [])
+        # Memory as it was loaded, snapshots only store pages that differ
+        self.image = None
+        self.changed = ChangeMap()
+        self.registers = array('H', [0] * 8)
+        self.stack = array('H')
         self.input_buffer = ""
         self.input_buffer_echo = ""
-        self.output_buffer = ""
+        self._output = []
         self.room = []
+        self.lines = None
+        self.sink = _default_sink
 
         self.need_header = True
-        self.save_state = None
+        # Every memory write as (addr, old value, old changed value or -1),
+        # so save_state can be rebuilt from the last checkpoint on demand
+        self.journal = array('i')
+        self._checkpoint = None
         self.hide_output = False
+        self.output_limit = None
         self.log_all = False
         self.log_reads = False
-        self.breakpoints = set()
+        self.break_output = False
+        self.break_registers = set()
+        self.inverted = set()
         self.history = deque()
+        # A timetravel.Recorder while the debugger is recording
+        self.recorder = None
+        # A tracer.Tracer while tracing
+        self.tracer = None
+        # A profiler.Profiler while profiling
+        self.profiler = None
+        # Watchpoints: a flag for each address and register (32768 + n)
+        # with callbacks in watchers, None until something is watched
+        self.watched = None
+        self.watchers = {}
+        self.watch_registers = False
+        self.jit = None
+        self.intrinsics = {}
+        # The addresses state_hash() covers, and the running hash of them
+        self.hash_mask = None
+        self.hash_registers = False
+        self.hash_stack = False
+        self._hash = 0
+        self.reset_decoded()
+
+    def reset_decoded(self):
+        # Decoded instructions, keyed by address, along with a map of every
+        # address any decoded instruction covers so writes can invalidate them
+        self._decoded = {}
+        self._decoded_covers = bytearray(32768)
+        self._decoded_shared = False
+        # Compiled blocks from the JIT, and the blocks that cover each address
+        self._blocks = {}
+        self._block_at = {}
 
     def clone(self):
         ret = Program()
         ret.pc = self.pc
-        ret.memory = self.memory[:]
+        ret.memory = self.memory.copy()
+        ret.image = self.image
+        # The decoded cache is shared until one side needs to change it
+        ret._decoded = self._decoded
+        ret._decoded_covers = self._decoded_covers
+        ret._decoded_shared = True
+        ret._blocks = self._blocks
+        ret._block_at = self._block_at
+        ret.jit = self.jit
+        ret.intrinsics = self.intrinsics
+        self._decoded_shared = True
         ret.changed = self.changed.copy()
         ret.registers = self.registers[:]
-        ret.stack = self.stack.copy()
+        ret.stack = self.stack[:]
         ret.input_buffer = self.input_buffer
         ret.input_buffer_echo = self.input_buffer_echo
         ret.output_buffer = self.output_buffer
+        ret.sink = self.sink
+        ret.hash_mask = self.hash_mask
+        ret.hash_registers = self.hash_registers
+        ret.hash_stack = self.hash_stack
+        ret._hash = self._hash
         return ret
 
+    def restore(self, other):
+        # Turns this program back into other in place, for the debugger,
+        # which runs inside an instruction and can't swap programs.  The
+        # debugger settings and where output goes stay as they are
+        state = other.clone()
+        for name in (
+            "pc", "memory", "image", "changed", "registers", "stack", "input_buffer", "input_buffer_echo",
+            "_output", "_decoded", "_decoded_covers", "_decoded_shared", "_blocks", "_block_at", "_hash",
+        ):
+            setattr(self, name, getattr(state, name))
+        self.history = other.history.copy()
+        self.reset_checkpoint()
+
+    def delta(self, base):
+        # What it takes to turn a clone of base into this program.  Much
+        # smaller than a snapshot when most pages are still shared, which
+        # makes it the cheap way to hand a program to another process
+        return (
+            self.pc, self.registers.tobytes(), self.stack.tobytes(),
+            self.memory.diff(base.memory), self.changed.mask.diff(base.changed.mask),
+            self.changed.data.diff(base.changed.data), self.changed.count,
+            self.input_buffer, self.input_buffer_echo, self.output_buffer,
+        )
+
+    def apply_delta(self, delta):
+        pc, registers, stack, memory, mask, data, count, input_buffer, input_buffer_echo, output_buffer = delta
+        self.pc = pc
+        self.registers = array('H')
+        self.registers.frombytes(registers)
+        self.stack = array('H')
+        self.stack.frombytes(stack)
+        for i, page in memory:
+            old = self.memory.pages[i]
+            self.memory.patch([(i, page)])
+            new = self.memory.pages[i]
+            for j in range(len(new)):
+                if old[j] != new[j]:
+                    addr = (i << PAGE_BITS) + j
+                    if self._decoded_covers[addr]:
+                        self.invalidate(addr)
+                    if self.hash_mask is not None and self.hash_mask[addr]:
+                        self._hash ^= zobrist(addr, old[j]) ^ zobrist(addr, new[j])
+        self.changed.mask.patch(mask)
+        self.changed.data.patch(data)
+        self.changed.count = count
+        self.reset_checkpoint()
+        self.input_buffer = input_buffer
+        self.input_buffer_echo = input_buffer_echo
+        self.output_buffer = output_buffer
+
     def deserialize(self, filename):
+        # filename is a zip snapshot, a file-like object holding one, or
+        # "store.db/name" for a snapshot in a SnapshotStore
+        from snapshots import split_name, open_store
+        stored = split_name(filename)
+        if stored is not None:
+            return open_store(stored[0]).load(stored[1], self)
         data = Serialize()
         with zipfile.ZipFile(filename, 'r') as zip:
-            data.buffer = zip.read('state.bin')
+            if 'snapshot.bin' in zip.namelist():
+                data.buffer = zip.read('snapshot.bin')
+            else:
+                data.buffer = zip.read('state.bin')
+                return self._deserialize_v1(data)
+        version = data.read_int()
+        if version > SNAPSHOT_VERSION:
+            raise Exception(f"Snapshot version {version} is newer than this code understands")
+        self.pc = data.read_int()
+        self.registers = data.read_array('H')
+        self.stack = data.read_array('H')
+        if data.read_array('I')[0] != len(self.memory):
+            raise Exception("Snapshot was saved from a different sized program")
+        # Pages that differ from the program as loaded, then the pages of
+        # the change map that have anything in them
+        memory = self.image.copy() if self.image is not None else self.memory
+        indexes = data.read_array('H')
+        values = data.read_array('H')
+        pages = []
+        offset = 0
+        for i in indexes:
+            size = min(PAGE_SIZE, memory.size - (i << PAGE_BITS))
+            pages.append((i, values[offset:offset + size].tobytes()))
+            offset += size
+        memory.patch(pages)
+        self.memory = memory
+        indexes = data.read_array('H')
+        mask = data.read_array('B')
+        values = data.read_array('H')
+        self.changed = ChangeMap()
+        self.changed.mask.patch([(x, mask[i * PAGE_SIZE:(i + 1) * PAGE_SIZE].tobytes()) for i, x in enumerate(indexes)])
+        self.changed.data.patch([(x, values[i * PAGE_SIZE:(i + 1) * PAGE_SIZE].tobytes()) for i, x in enumerate(indexes)])
+        self.changed.count = mask.count(1)
+        self.reset_decoded()
+        self.reset_checkpoint()
+        self.rehash()
+        self.input_buffer = data.read_str()
+        self.input_buffer_echo = data.read_str()
+        self.output_buffer = data.read_str()
+
+    def _deserialize_v1(self, data):
         self.pc = data.read_int()
-        self.registers = data.read_list()
-        self.stack = deque(data.read_list())
+        self.registers = array('H', data.read_list())
+        self.stack = array('H', data.read_list())
         keys = data.read_list()
         values = data.read_list()
-        self.changed = {keys[x]: values[x] for x in range(len(keys))}
-        for key, value in self.changed.items():
-            self.memory[key] = value
+        # The writes it lists go over the program as loaded, same as v2
+        memory = self.image.copy() if self.image is not None else self.memory
+        self.changed = ChangeMap()
+        for i in range(len(keys)):
+            self.changed[keys[i]] = values[i]
+            memory[keys[i]] = values[i]
+        self.memory = memory
+        self.reset_decoded()
+        self.reset_checkpoint()
+        self.rehash()
         self.input_buffer = data.read_str()
         self.input_buffer_echo = data.read_str()
         self.output_buffer = data.read_str()
 
-    def serialize(self, filename):
+    def serialize(self, filename, compression="zlib"):
+        # compression is one of SNAPSHOT_COMPRESSION's keys.  Like
+        # deserialize, "store.db/name" saves to a SnapshotStore instead
+        from snapshots import split_name, open_store
+        stored = split_name(filename)
+        if stored is not None:
+            return open_store(stored[0]).save(stored[1], self)
+        if compression not in SNAPSHOT_COMPRESSION:
+            raise Exception(f"Unknown compression '{compression}'")
+        if self.image is not None:
+            memory = self.memory.diff(self.image)
+        else:
+            memory = [(i, page.tobytes()) for i, page in enumerate(self.memory.pages)]
+        changed = [i for i, page in enumerate(self.changed.mask.pages) if any(page)]
+
         data = Serialize()
+        data.add_int(SNAPSHOT_VERSION)
         data.add_int(self.pc)
-        data.add_list(self.registers)
-        data.add_list(self.stack)
-        data.add_list(self.changed.keys())
-        data.add_list(self.changed.values())
+        data.add_array(self.registers)
+        data.add_array(self.stack)
+        data.add_array(array('I', [len(self.memory)]))
+        data.add_array(array('H', [i for i, _ in memory]))
+        data.add_array(array('H', b''.join(page for _, page in memory)))
+        data.add_array(array('H', changed))
+        data.add_array(array('B', b''.join(self.changed.mask.pages[i].tobytes() for i in changed)))
+        data.add_array(array('H', b''.join(self.changed.data.pages[i].tobytes() for i in changed)))
         data.add_str(self.input_buffer)
         data.add_str(self.input_buffer_echo)
         data.add_str(self.output_buffer)
-        with zipfile.ZipFile(filename, 'w', compression=zipfile.ZIP_BZIP2, compresslevel=9) as zip:
-            zip.writestr('state.bin', b''.join(data.buffer))
+        with zipfile.ZipFile(filename, 'w', compression=SNAPSHOT_COMPRESSION[compression]) as zip:
+            zip.writestr('snapshot.bin', b''.join(data.buffer))
+
+    @property
+    def output_buffer(self):
+        return "".join(self._output)
+
+    @output_buffer.setter
+    def output_buffer(self, value):
+        self._output = list(value)
 
     def handle_io(self, value):
         if self.need_header:
             self.need_header = False
             self.handle_io("----- Program Log for " + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + " -----")
             self.handle_io("")
-        with open("program.log", "a") as f:
-            f.write(value + "\n")
+        self.sink.log(value)
 
     def show(self, value, input=False):
         if _io_logger:
@@ -396,52 +965,285 @@ class Program:
                 [_io_logger.handle_input(self, x) for x in value + "\n"]
             else:
                 [_io_logger.handle_output(self, x) for x in value + "\n"]
+        self.sink.flush(False)
         print(value)
         self.handle_io(value)
 
     def load_string(self, value):
-        self.memory = [int(x) for x in value.split(',')]
-        self.changed = {}
+        self.memory = PagedArray('H', [int(x) for x in value.split(',')])
+        self.image = self.memory.copy()
+        self.changed = ChangeMap()
+        self.rehash()
+        self.reset_decoded()
+        self.reset_checkpoint()
 
     def load_bytes(self, value):
-        self.memory = list(unpack('<' + 'H' * (len(value) // 2), value))
-        self.changed = {}
+        memory = array('H')
+        memory.frombytes(value[:len(value) // 2 * 2])
+        if sys.byteorder == "big":
+            memory.byteswap()
+        self.memory = PagedArray('H', memory)
+        self.image = self.memory.copy()
+        self.changed = ChangeMap()
+        self.rehash()
+        self.reset_decoded()
+        self.reset_checkpoint()
+
+    def poke(self, addr, value):
+        if self._checkpoint is not None:
+            self.journal.extend((addr, self.memory[addr], self.changed.get(addr, -1)))
+        if self.recorder is not None:
+            self.recorder.wrote(addr, self.memory[addr], value)
+        if self.hash_mask is not None and self.hash_mask[addr]:
+            self._hash ^= zobrist(addr, self.memory[addr]) ^ zobrist(addr, value)
+        if self.watched is not None and self.watched[addr] and self.memory[addr] != value:
+            old = self.memory[addr]
+            self.memory[addr] = value
+            self._fire(addr, old, value)
+        else:
+            self.memory[addr] = value
+        if self._decoded_covers[addr]:
+            self.invalidate(addr)
+
+    def watch(self, addresses, callback):
+        # Calls callback(program, addr, old, new) whenever a write changes
+        # one of addresses, registers are 32768 + n.  Memory is checked as
+        # it's written, so watching it costs nothing until it changes.
+        # Registers are compared after each instruction instead, since the
+        # JIT and intrinsics set them directly
+        if self.watched is None:
+            self.watched = bytearray(32768 + 8)
+        for addr in addresses:
+            self.watched[addr] = 1
+            callbacks = self.watchers.setdefault(addr, [])
+            if callback not in callbacks:
+                callbacks.append(callback)
+            if addr >= 32768:
+                self.watch_registers = True
+
+    def unwatch(self, addresses, callback):
+        if self.watched is None:
+            return
+        for addr in addresses:
+            callbacks = self.watchers.get(addr, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if len(callbacks) == 0:
+                self.watchers.pop(addr, None)
+                self.watched[addr] = 0
+        self.watch_registers = any(x >= 32768 for x in self.watchers)
+
+    def _fire(self, addr, old, value):
+        for callback in self.watchers[addr]:
+            callback(self, addr, old, value)
+
+    def _registers_changed(self, before):
+        before = array('H', before)
+        for i in range(len(before)):
+            if before[i] != self.registers[i] and self.watched[32768 + i]:
+                self._fire(32768 + i, before[i], self.registers[i])
+
+    def write(self, addr, value):
+        # A write by the program, which can't go past the end of memory
+        if addr >= len(self.memory):
+            raise ProgramException(MEMORY_OUT_OF_RANGE)
+        self.poke(addr, value)
+        self.changed[addr] = value
+
+    def set_hash_mask(self, addresses=None, registers=False, stack=False):
+        # Starts keeping state_hash() up to date.  addresses is any iterable
+        # of memory addresses to cover, or None for all of memory, so that
+        # counters and scratch memory can be left out
+        if addresses is None:
+            addresses = range(len(self.memory))
+        mask = bytearray(32768)
+        for addr in addresses:
+            mask[addr] = 1
+        self.hash_mask = mask
+        self.hash_registers = registers
+        self.hash_stack = stack
+        self.rehash()
+
+    def rehash(self):
+        # Works the memory part of the hash out from scratch, only needed
+        # when memory is replaced without going through poke()
+        self._hash = 0
+        if self.hash_mask is not None:
+            for addr in compress(range(min(len(self.memory), len(self.hash_mask))), self.hash_mask):
+                self._hash ^= zobrist(addr, self.memory[addr])
+
+    def state_hash(self):
+        # A 64-bit fingerprint of the covered memory, and optionally the
+        # registers and stack.  Memory is hashed as it's written, so this
+        # costs the same however long the program has run.  Registers and
+        # the stack are folded in here since the JIT and intrinsics change
+        # them without going through set_val()
+        ret = self._hash
+        if self.hash_registers:
+            for i, value in enumerate(self.registers):
+                ret ^= zobrist(HASH_REGISTERS + i, value)
+        if self.hash_stack:
+            for i, value in enumerate(self.stack):
+                ret ^= zobrist(HASH_STACK + i, value)
+        return ret
+
+    def reset_checkpoint(self):
+        self._checkpoint = None
+        del self.journal[:]
+
+    def checkpoint(self):
+        # Only remember enough to rebuild this state later, the journal
+        # covers everything that's written from here on
+        del self.journal[:]
+        self._checkpoint = (
+            self.pc, self.registers[:], self.stack[:], len(self.journal),
+            self.input_buffer, self.input_buffer_echo, self.output_buffer,
+        )
+
+    @property
+    def save_state(self):
+        # The program as it was at the last checkpoint, or None
+        if self._checkpoint is None:
+            return None
+        ret = self.clone()
+        pc, registers, stack, position, input_buffer, input_buffer_echo, output_buffer = self._checkpoint
+        for i in range(len(self.journal) - 3, position - 3, -3):
+            addr, value, changed = self.journal[i:i + 3]
+            ret.poke(addr, value)
+            if changed == -1:
+                if addr in ret.changed:
+                    del ret.changed[addr]
+            else:
+                ret.changed[addr] = changed
+        ret.pc = pc
+        ret.registers = registers[:]
+        ret.stack = stack[:]
+        ret.input_buffer = input_buffer
+        ret.input_buffer_echo = input_buffer_echo
+        ret.output_buffer = output_buffer
+        return ret
+
+    def invalidate(self, addr):
+        # Drop any decoded instruction or compiled block that covers addr
+        for start in range(max(0, addr - 3), addr + 1):
+            entry = self._decoded.get(start)
+            if entry is not None and entry[2] > addr:
+                if self._decoded_shared:
+                    self._unshare_decoded()
+                del self._decoded[start]
+        if addr in self._block_at:
+            if self._decoded_shared:
+                self._unshare_decoded()
+            for start in self._block_at.pop(addr):
+                self._blocks.pop(start, None)
+
+    def covers_code(self, addr):
+        return self._decoded_covers[addr] != 0
+
+    def _unshare_decoded(self):
+        self._decoded = self._decoded.copy()
+        self._decoded_covers = self._decoded_covers[:]
+        self._blocks = self._blocks.copy()
+        self._block_at = self._block_at.copy()
+        self._decoded_shared = False
+
+    def enable_jit(self, threshold=20):
+        from jit import Jit
+        self.jit = Jit(threshold)
+
+    def enable_trace(self, filename=None, pcs=None, addresses=None):
+        # Traces each instruction to filename, see tracer.py.  pcs and
+        # addresses are (first, last) ranges to limit what's kept
+        from tracer import Tracer
+        self.disable_trace()
+        self.tracer = Tracer(filename, pcs, addresses)
+
+    def disable_trace(self):
+        if self.tracer is not None:
+            self.tracer.close()
+            self.tracer = None
+
+    def enable_profile(self):
+        from profiler import Profiler
+        self.profiler = Profiler()
+
+    def add_intrinsic(self, address, func):
+        # func is either a function, or the name of a registered intrinsic
+        if isinstance(func, str):
+            if func not in _intrinsics:
+                raise Exception(f"Unknown intrinsic '{func}'")
+            func = _intrinsics[func]['func']
+        self.intrinsics = dict(self.intrinsics)
+        self.intrinsics[address] = func
+
+    def add_block(self, start, end, func):
+        if self._decoded_shared:
+            self._unshare_decoded()
+        self._blocks[start] = func
+        for addr in range(start, end):
+            self._block_at[addr] = self._block_at.get(addr, ()) + (start,)
+
+    def decoded_at(self, pc):
+        entry = self._decoded.get(pc)
+        if entry is None:
+            entry = self.decode_entry(pc)
+        return entry
+
+    def decode_entry(self, pc):
+        # Turn the instruction at pc into (func, args, next_pc, opcode)
+        if pc >= len(self.memory):
+            raise ProgramException("End of program")
+        opcode = self.memory[pc]
+        if opcode not in _opcodes:
+            raise ProgramException(f"Unknown opcode: {opcode}")
+        op = _opcodes[opcode]
+        next_pc = pc + op['size']
+        entry = (op['func'], tuple(self.memory[pc + 1:next_pc]), next_pc, opcode)
+        if self._decoded_shared:
+            self._unshare_decoded()
+        self._decoded[pc] = entry
+        for i in range(pc, min(next_pc, 32768)):
+            self._decoded_covers[i] = 1
+        return entry
 
     def get_val(self, value):
         if value < 32768:
             return value
-        else:
-            if f"bpr {value - 32768}" in self.breakpoints:
+        value -= 32768
+        if self.break_registers or self.log_reads:
+            if value in self.break_registers:
                 self.breakpoint()
             if self.log_reads:
-                self.show(f">> Register read {value - 32768} > {self.registers[value - 32768]}")
-            return self.registers[value - 32768]
+                self.show(f">> Register read {value} > {self.registers[value]}")
+        return self.registers[value]
 
     def decode(self, pc):
-        if self.memory[pc] in _opcodes:
-            op = _opcodes[self.memory[pc]]
-            info = f"{pc:5d}: {op['name']:<4}"
-            pc += 1
-            for _ in range(op['size']-1):
-                if self.memory[pc] < 32768:
-                    info += f" {self.memory[pc]}"
-                else:
-                    info += f" [{self.memory[pc] - 32768}]"
-                pc += 1
-        else:
-            info = f"{pc:5d}: {self.memory[pc]}"
-            pc += 1
-        return pc, info
+        size = _opcodes[self.memory[pc]]['size'] if self.memory[pc] in _opcodes else 1
+        return pc + size, format_instruction(pc, self.memory[pc:pc + size])
+
+    def analysis(self):
+        # What analysis.py worked out about the code this program was
+        # loaded from
+        from analysis import analysis_for
+        return analysis_for(self)
+
+    def listing(self, first=0, last=None):
+        # (pc, text) for each instruction or data word from first to last
+        from analysis import listing
+        return listing(self, first, last)
 
     def dump(self, filename):
+        # While profiling, each instruction shows how many times it ran
         with open(filename, "w") as f:
-            pc = 0
-            while pc < len(self.memory):
-                pc, info = self.decode(pc)
+            for pc, info in self.listing():
+                if self.profiler is not None:
+                    count = self.profiler.pcs[pc]
+                    info = (f"{count:10d}  " if count > 0 else " " * 12) + info
                 f.write(info + "\n")
 
     def breakpoint(self):
-        print(self.registers)
+        self.sink.flush()
+        print(list(self.registers))
         temp = self.history.copy()
         for _ in range(20):
             if len(temp) > 0:
@@ -467,35 +1269,163 @@ class Program:
         else:
             self.registers[dest - 32768] = value
 
-    def run(self, abort_on_input=False, hide_output=False):
+    def debugging(self):
+        return (
+            self.log_all or self.log_reads or self.break_output or len(self.break_registers) > 0 or
+            len(self.inverted) > 0 or self.recorder is not None or self.tracer is not None or
+            self.profiler is not None or self.watch_registers
+        )
+
+    def run(self, abort_on_input=False, hide_output=False, budget=None, max_output=None):
+        # budget limits the number of instructions run, and max_output the
+        # number of characters output, before giving up with an error.  Either
+        # way the program is left between instructions and can be run again
         self.hide_output = hide_output
+        self.output_limit = max_output
+        if budget is None:
+            budget = sys.maxsize
         try:
-            while True:
-                if self.pc >= len(self.memory):
-                    raise ProgramException("End of program")
-                if self.log_all:
-                    _, info = self.decode(self.pc)
-                    self.handle_io(info)
-                self.history.append(self.pc)
-                while len(self.history) > 5:
-                    self.history.popleft()
-                opcode = self.memory[self.pc]
-                if abort_on_input and len(self.input_buffer) == 0:
-                    if opcode == _opcodes['names']['in']:
-                        return ""
-                if opcode not in _opcodes:
-                    raise ProgramException(f"Unknown opcode: {opcode}")
-                opcode = _opcodes[opcode]
-                args = [self]
-                for i in range(1, opcode['size']):
-                    args.append(self.memory[self.pc + i])
-                self.pc += opcode['size']
-                opcode['func'](*args)
-            return ""
+            if self.debugging():
+                return self._run_instrumented(abort_on_input, budget)
+            elif self.jit is not None:
+                return self._run_jit(abort_on_input, budget)
+            else:
+                return self._run_fast(abort_on_input, budget)
         except ProgramException as msg:
             if not self.hide_output:
-                if len(self.output_buffer) > 0:
+                self.sink.flush(False)
+                if len(self._output) > 0:
                     print("", flush=True)
                 print(f"ERROR: {msg.msg}")
                 self.handle_io(f"ERROR: {msg.msg}")
             return msg.msg
+        finally:
+            self.sink.flush(False)
+
+    def execute(self, quantum=None):
+        # Runs the program as a generator of Events.  Output is never shown,
+        # each complete line is yielded instead.  When input is needed, the
+        # caller send()s the next line back.  With a quantum, it also stops
+        # to yield BudgetExhausted after that many instructions, and picks up
+        # where it left off on the next call.  It ends after Halted or VMError
+        self.lines = []
+        try:
+            while True:
+                try:
+                    reason = self.run(abort_on_input=True, hide_output=True, budget=quantum)
+                except Exception as e:
+                    reason = f"{type(e).__name__}: {e}"
+                lines, self.lines = self.lines, []
+                for line in lines:
+                    yield OutputLine(line)
+                if reason == "":
+                    value = None
+                    while value is None:
+                        value = yield InputNeeded()
+                    self.input_buffer += value + "\n"
+                elif reason == BUDGET_EXHAUSTED:
+                    yield BudgetExhausted(quantum)
+                elif reason == HALTED:
+                    yield Halted()
+                    return
+                else:
+                    yield VMError(reason)
+                    return
+        finally:
+            self.lines = None
+
+    def _run_instrumented(self, abort_on_input, budget):
+        # Keeps the history, honors log_all, feeds the recorder for the
+        # debugger, the tracer, and the profiler, and checks for register
+        # watchpoints
+        op_in = _opcodes['names']['in']
+        op_call = _opcodes['names']['call']
+        op_ret = _opcodes['names']['ret']
+        recorder = self.recorder
+        tracer = self.tracer
+        profiler = self.profiler
+        watch_registers = self.watch_registers
+        for _ in range(budget):
+            entry = self._decoded.get(self.pc)
+            if entry is None:
+                entry = self.decode_entry(self.pc)
+            if self.log_all:
+                _, info = self.decode(self.pc)
+                self.handle_io(info)
+            self.history.append(self.pc)
+            while len(self.history) > 5:
+                self.history.popleft()
+            if abort_on_input and entry[3] == op_in and len(self.input_buffer) == 0:
+                return ""
+            if recorder is not None:
+                recorder.before(self, entry)
+            if profiler is not None:
+                profiler.hit(self.pc, entry[3])
+            if watch_registers:
+                registers = self.registers.tobytes()
+            if tracer is not None:
+                pc = self.pc
+                self.pc = entry[2]
+                tracer.step(self, pc, entry)
+            else:
+                self.pc = entry[2]
+                entry[0](self, *entry[1])
+            if profiler is not None and (entry[3] == op_call or entry[3] == op_ret):
+                profiler.after(self, entry)
+            if watch_registers and self.registers.tobytes() != registers:
+                self._registers_changed(registers)
+            if recorder is not None:
+                recorder.after(self, entry)
+            # The debugger may have started or stopped recording
+            recorder = self.recorder
+        raise ProgramException(BUDGET_EXHAUSTED)
+
+    def _run_fast(self, abort_on_input, budget):
+        # No debugging features are on, so skip the history and only look
+        # at the debugger state again after input, since that's the only
+        # place the debugger can turn them on
+        op_in = _opcodes['names']['in']
+        for i in range(budget):
+            entry = self._decoded.get(self.pc)
+            if entry is None:
+                entry = self.decode_entry(self.pc)
+            if entry[3] == op_in:
+                if abort_on_input and len(self.input_buffer) == 0:
+                    return ""
+                self.pc = entry[2]
+                entry[0](self, *entry[1])
+                if self.debugging():
+                    return self._run_instrumented(abort_on_input, budget - i - 1)
+            else:
+                self.pc = entry[2]
+                entry[0](self, *entry[1])
+        raise ProgramException(BUDGET_EXHAUSTED)
+
+    def _run_jit(self, abort_on_input, budget):
+        # Same as _run_fast, but hot blocks are handed off to the JIT, and
+        # only instructions that start a block count towards heat.  A block
+        # can run a little past the budget, but never starts once it's gone
+        jit = self.jit
+        op_in = _opcodes['names']['in']
+        leader = True
+        while budget > 0:
+            block = self._blocks.get(self.pc)
+            if block is None and leader and jit.hit(self.pc):
+                block = jit.compile(self, self.pc)
+            if block is not None:
+                self.pc, count = block(self)
+                budget -= count
+                leader = True
+                continue
+            entry = self._decoded.get(self.pc)
+            if entry is None:
+                entry = self.decode_entry(self.pc)
+            if abort_on_input and entry[3] == op_in and len(self.input_buffer) == 0:
+                return ""
+            self.pc = entry[2]
+            entry[0](self, *entry[1])
+            budget -= 1
+            leader = entry[3] in _leaders
+            if entry[3] == op_in and self.debugging():
+                return self._run_instrumented(abort_on_input, budget)
+        raise ProgramException(BUDGET_EXHAUSTED)
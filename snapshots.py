@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+
+# A single file of saved program states that share storage.  Every page of
+# memory and of the change map is stored once, keyed by a hash of its
+# contents, however many states use it.  A page table lists the pages of a
+# state, and each state only records where its table differs from a shared
+# base table, so a new state costs its manifest and the pages nobody else
+# had.  It's a SQLite file, so looking up a name goes through an index
+#
+#   objects (key, data)        zlib compressed pages, little endian, and
+#                              base tables
+#   snapshots (name, manifest) JSON: registers, stack, buffers, the base
+#                              table and the entries that differ from it
+#   meta (key, value)          the base table new states start from
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import zlib
+from array import array
+from collections import OrderedDict
+from struct import pack, unpack
+
+from program import ChangeMap
+
+_HEADER = b"SQLite format 3\0"
+_KEY = 12
+_NONE = bytes(_KEY)
+# A table entry is a page index, then the keys of the memory page, change
+# map mask page and change map data page, _NONE where there isn't one
+_ENTRY = 2 + 3 * _KEY
+# Past this many differences a state's table becomes the new base
+_MAX_DELTA = 16
+# Objects kept in memory, most recently used, so a long run that saves a
+# lot of states doesn't hold on to every page
+_CACHE_SIZE = 4096
+
+
+def _little(data):
+    # A page of 16-bit words between the machine's byte order and little
+    # endian, which is how they're stored, same as the v2 snapshot format
+    if sys.byteorder == "big":
+        page = array('H', data)
+        page.byteswap()
+        return page.tobytes()
+    return data
+
+
+class SnapshotStore:
+    def __init__(self, path="snapshots.db"):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute("CREATE TABLE IF NOT EXISTS objects (key BLOB PRIMARY KEY, data BLOB)")
+        self.db.execute("CREATE TABLE IF NOT EXISTS snapshots (name TEXT PRIMARY KEY, manifest TEXT)")
+        self.db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.db.commit()
+        self._cache = OrderedDict()
+
+    @staticmethod
+    def is_store(path):
+        if not os.path.isfile(path):
+            return False
+        with open(path, "rb") as f:
+            return f.read(len(_HEADER)) == _HEADER
+
+    def _remember(self, key, data):
+        self._cache[key] = data
+        self._cache.move_to_end(key)
+        if len(self._cache) > _CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _put(self, data):
+        key = hashlib.blake2b(data, digest_size=_KEY).digest()
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        else:
+            self.db.execute("INSERT OR IGNORE INTO objects VALUES (?, ?)", (key, zlib.compress(data)))
+            self._remember(key, data)
+        return key
+
+    def _get(self, key):
+        data = self._cache.get(key)
+        if data is None:
+            row = self.db.execute("SELECT data FROM objects WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                raise Exception(f"Snapshot store {self.path} is missing object {key.hex()}")
+            data = zlib.decompress(row[0])
+        self._remember(key, data)
+        return data
+
+    @staticmethod
+    def _pack(table):
+        return b''.join(pack("<H", i) + b''.join(table[i]) for i in sorted(table))
+
+    @staticmethod
+    def _unpack(data):
+        ret = {}
+        for offset in range(0, len(data), _ENTRY):
+            entry = data[offset:offset + _ENTRY]
+            ret[unpack("<H", entry[:2])[0]] = tuple(entry[2 + x * _KEY:2 + (x + 1) * _KEY] for x in range(3))
+        return ret
+
+    def _table(self, manifest):
+        table = self._unpack(self._get(bytes.fromhex(manifest['base'])))
+        table.update(self._unpack(bytes.fromhex(manifest['delta'])))
+        return table
+
+    def __contains__(self, name):
+        return self.db.execute("SELECT 1 FROM snapshots WHERE name = ?", (name,)).fetchone() is not None
+
+    def names(self):
+        return [x[0] for x in self.db.execute("SELECT name FROM snapshots ORDER BY name")]
+
+    def save(self, name, program):
+        if program.image is not None:
+            memory = dict(program.memory.diff(program.image))
+        else:
+            memory = {i: page.tobytes() for i, page in enumerate(program.memory.pages)}
+        mask = program.changed.mask.pages
+        data = program.changed.data.pages
+        table = {}
+        for i in range(max(len(mask), len(program.memory.pages))):
+            entry = [_NONE, _NONE, _NONE]
+            if i in memory:
+                entry[0] = self._put(_little(memory[i]))
+            if i < len(mask) and any(mask[i]):
+                entry[1] = self._put(mask[i].tobytes())
+                entry[2] = self._put(_little(data[i].tobytes()))
+            table[i] = tuple(entry)
+
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'base'").fetchone()
+        delta = None
+        if row is not None:
+            base = self._unpack(self._get(bytes.fromhex(row[0])))
+            delta = {i: entry for i, entry in table.items() if base.get(i) != entry}
+        if delta is None or len(delta) > _MAX_DELTA:
+            row = (self._put(self._pack(table)).hex(),)
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('base', ?)", row)
+            delta = {}
+
+        manifest = {
+            'pc': program.pc,
+            'registers': program.registers.tolist(),
+            'stack': program.stack.tolist(),
+            'size': len(program.memory),
+            'base': row[0],
+            'delta': self._pack(delta).hex(),
+            'input_buffer': program.input_buffer,
+            'input_buffer_echo': program.input_buffer_echo,
+            'output_buffer': program.output_buffer,
+        }
+        self.db.execute("INSERT OR REPLACE INTO snapshots VALUES (?, ?)", (name, json.dumps(manifest)))
+        self.db.commit()
+
+    def load(self, name, program):
+        # Same result as Program.deserialize, from the shared pages
+        row = self.db.execute("SELECT manifest FROM snapshots WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            raise Exception(f"No snapshot named '{name}' in {self.path}")
+        manifest = json.loads(row[0])
+        if manifest['size'] != len(program.memory):
+            raise Exception("Snapshot was saved from a different sized program")
+        table = self._table(manifest)
+        memory = program.image.copy() if program.image is not None else program.memory
+        memory.patch([(i, _little(self._get(x[0]))) for i, x in table.items() if x[0] != _NONE])
+        program.memory = memory
+        mask = [(i, self._get(x[1])) for i, x in table.items() if x[1] != _NONE]
+        program.changed = ChangeMap()
+        program.changed.mask.patch(mask)
+        program.changed.data.patch([(i, _little(self._get(x[2]))) for i, x in table.items() if x[2] != _NONE])
+        program.changed.count = sum(page.count(1) for _, page in mask)
+        program.pc = manifest['pc']
+        program.registers = array('H', manifest['registers'])
+        program.stack = array('H', manifest['stack'])
+        program.reset_decoded()
+        program.reset_checkpoint()
+        program.rehash()
+        program.input_buffer = manifest['input_buffer']
+        program.input_buffer_echo = manifest['input_buffer_echo']
+        program.output_buffer = manifest['output_buffer']
+
+    def remove(self, name):
+        # The pages stay until gc()
+        self.db.execute("DELETE FROM snapshots WHERE name = ?", (name,))
+        self.db.commit()
+
+    def gc(self):
+        # Deletes every object no snapshot refers to, returns how many went.
+        # The current base table stays too, new states are still built on it
+        keep = set()
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'base'").fetchone()
+        if row is not None:
+            keep.add(bytes.fromhex(row[0]))
+            for entry in self._unpack(self._get(bytes.fromhex(row[0]))).values():
+                keep.update(entry)
+        for row in self.db.execute("SELECT manifest FROM snapshots").fetchall():
+            manifest = json.loads(row[0])
+            keep.add(bytes.fromhex(manifest['base']))
+            for entry in self._table(manifest).values():
+                keep.update(entry)
+        unused = [x[0] for x in self.db.execute("SELECT key FROM objects").fetchall() if x[0] not in keep]
+        self.db.executemany("DELETE FROM objects WHERE key = ?", [(x,) for x in unused])
+        self.db.commit()
+        self.db.execute("VACUUM")
+        for key in unused:
+            self._cache.pop(key, None)
+        return len(unused)
+
+
+_stores = {}
+
+
+def open_store(path):
+    # One SnapshotStore per path, so pages loaded once stay cached
+    path = os.path.normpath(path)
+    if path not in _stores:
+        _stores[path] = SnapshotStore(path)
+    return _stores[path]
+
+
+def split_name(filename):
+    # "store.db/name" names a snapshot in a store when store.db is a
+    # snapshot store, otherwise returns None
+    if not isinstance(filename, str) or os.path.exists(filename):
+        return None
+    path, name = os.path.split(filename)
+    if len(path) == 0 or not SnapshotStore.is_store(path):
+        return None
+    return path, name
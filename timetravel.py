@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+# Records a running program so the debugger can go backwards.  Every
+# interval instructions, and whenever the program waits for input, it keeps
+# a clone of the program, which is cheap since clones share pages.  Between
+# those it journals every memory and register write, along with the input
+# that was typed.  Going back to any instruction means restoring the last
+# clone before it and running forward at most interval instructions, with
+# the recorded input fed back in.
+
+from array import array
+from bisect import bisect_left
+
+from program import _opcodes, OutputSink, Program
+
+_op_in = _opcodes['names']['in']
+
+
+class Recorder:
+    def __init__(self, interval=10000, max_checkpoints=1000):
+        self.interval = interval
+        self.max_checkpoints = max_checkpoints
+        # Instructions run since recording started
+        self.step = 0
+        # (step, clone of the program before that step ran)
+        self.checkpoints = []
+        # The write journal, one entry per write across these arrays.  addr
+        # is a memory address, or 32768 + n for register n
+        self.steps = array('Q')
+        self.pcs = array('H')
+        self.addrs = array('H')
+        self.olds = array('H')
+        self.news = array('H')
+        # Input typed at a step, so it can be fed back in
+        self.inputs = {}
+        # Set when the debugger moves the program to another step
+        self.moved = False
+        self._registers = None
+        self._reading = False
+        self._pc = 0
+        self._replaying = False
+
+    def before(self, program, entry):
+        # Called before each instruction while recording.  Anything that
+        # moved the program before now was outside of an instruction
+        self.moved = False
+        self._reading = entry[3] == _op_in and len(program.input_buffer) == 0
+        if self._reading or self.step % self.interval == 0:
+            self._checkpoint(program)
+        self._registers = program.registers.tobytes()
+        self._pc = program.pc
+
+    def after(self, program, entry):
+        if self._registers is None:
+            # The debugger moved the program during this instruction
+            return
+        if self._reading:
+            self.inputs[self.step] = chr(program.registers[entry[1][0] - 32768]) + program.input_buffer
+        registers = program.registers.tobytes()
+        if registers != self._registers:
+            old = array('H', self._registers)
+            for i in range(len(old)):
+                if old[i] != program.registers[i]:
+                    self._journal(32768 + i, old[i], program.registers[i])
+        self.step += 1
+
+    def wrote(self, addr, old, value):
+        # Called by Program.poke
+        if not self._replaying:
+            self._journal(addr, old, value)
+
+    def _journal(self, addr, old, value):
+        self.steps.append(self.step)
+        self.pcs.append(self._pc)
+        self.addrs.append(addr)
+        self.olds.append(old)
+        self.news.append(value)
+
+    def _checkpoint(self, program):
+        if len(self.checkpoints) > 0 and self.checkpoints[-1][0] == self.step:
+            return
+        state = program.clone()
+        # inv needs the history to give the same answers again
+        state.history = program.history.copy()
+        self.checkpoints.append((self.step, state))
+        if len(self.checkpoints) > self.max_checkpoints:
+            # Forget the oldest half, along with their part of the journal
+            del self.checkpoints[:len(self.checkpoints) // 2]
+            self._trim(self.checkpoints[0][0], None)
+
+    def _trim(self, first, last):
+        # Keeps the journal for steps in [first, last), steps is in order
+        start = bisect_left(self.steps, first)
+        end = len(self.steps) if last is None else max(start, bisect_left(self.steps, last))
+        for journal in (self.steps, self.pcs, self.addrs, self.olds, self.news):
+            del journal[end:]
+            del journal[:start]
+        self.inputs = {k: v for k, v in self.inputs.items() if first <= k and (last is None or k < last)}
+
+    def oldest(self):
+        return self.checkpoints[0][0] if len(self.checkpoints) > 0 else self.step
+
+    def travel(self, program, target):
+        # Puts program back to how it was before step target ran.  What was
+        # recorded after that is dropped, running on records it again
+        if target < self.oldest() or target > self.step:
+            raise Exception(f"Can only go back to steps {self.oldest()} through {self.step}")
+        while self.checkpoints[-1][0] > target:
+            self.checkpoints.pop()
+        cstep, state = self.checkpoints[-1]
+        program.restore(state)
+        self.step = cstep
+        self._replay(program, target)
+        self._trim(self.oldest(), target)
+        self.moved = True
+        self._registers = None
+
+    def _replay(self, program, target):
+        # Runs forward to target with nothing shown or logged, and the
+        # recorded input in place of the user
+        sink, hide_output = program.sink, program.hide_output
+        breaks = program.break_output, program.break_registers
+        program.sink, program.hide_output = OutputSink(log_name=None), True
+        program.break_output, program.break_registers = False, set()
+        logger = Program.set_logger(None)
+        self._replaying = True
+        try:
+            while self.step < target:
+                entry = program.decoded_at(program.pc)
+                if entry[3] == _op_in and len(program.input_buffer) == 0:
+                    program.input_buffer = self.inputs[self.step]
+                program.history.append(program.pc)
+                while len(program.history) > 5:
+                    program.history.popleft()
+                program.pc = entry[2]
+                entry[0](program, *entry[1])
+                self.step += 1
+        finally:
+            self._replaying = False
+            Program.set_logger(logger)
+            program.sink, program.hide_output = sink, hide_output
+            program.break_output, program.break_registers = breaks
+
+    def step_back(self, program, count=1):
+        self.travel(program, self.step - count)
+
+    def last_write(self, addr, before=None):
+        # The journal index of the last write to addr before step before
+        if before is None:
+            before = self.step
+        for i in range(bisect_left(self.steps, before) - 1, -1, -1):
+            if self.addrs[i] == addr:
+                return i
+        return None
+
+    def back_to_write(self, program, addr):
+        # Goes back to just before the last instruction that wrote addr
+        i = self.last_write(addr)
+        if i is None:
+            raise Exception(f"No write to {addr} since step {self.oldest()}")
+        self.travel(program, self.steps[i])
+
+    def describe(self, program, i):
+        _, info = program.decode(self.pcs[i])
+        return f"step {self.steps[i]} ({self.step - self.steps[i]} ago), {info.strip()}, {self.olds[i]} -> {self.news[i]}"
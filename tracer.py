@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+# Traces every instruction a program runs as fixed size binary records, with
+# nothing formatted until the trace is read back.  Records go into a buffer
+# that's written out in one go when it fills, or without a file, wraps
+# around and keeps the most recent ones.  A record is
+#
+#   step, pc, opcode, three operands (0 past the end), then what it did:
+#   the register (32768 + n) or memory address it wrote and the value,
+#   and the memory address it read and the value, 0xffff where there's none
+
+from struct import pack, unpack, Struct
+
+from program import _opcodes, format_instruction
+
+_MAGIC = b"SYNTRACE"
+_VERSION = 2
+_RECORD = Struct("<QHH3HHHHH")
+# Version 1 had a 32-bit step, which ran out after 4G instructions
+_RECORDS = {1: Struct("<IHH3HHHHH"), _VERSION: _RECORD}
+_NONE = 0xffff
+_PAD = ((0, 0, 0), (0, 0), (0,), ())
+
+_op_rmem = _opcodes['names']['rmem']
+_op_wmem = _opcodes['names']['wmem']
+# Every opcode that leaves its result in the register named by its first
+# operand
+_WRITES = {
+    _opcodes['names'][x] for x in
+    ("set", "add", "mult", "mod", "eq", "gt", "and", "or", "not", "pop", "in")
+}
+
+
+class Tracer:
+    def __init__(self, filename=None, pcs=None, addresses=None, capacity=65536):
+        # pcs and addresses are (first, last) ranges.  With addresses, only
+        # instructions that read or write memory in that range are kept
+        self.filename = filename
+        self.pc_first, self.pc_last = pcs if pcs is not None else (0, 32767)
+        self.addresses = addresses
+        self.buffer = bytearray(capacity * _RECORD.size)
+        self.offset = 0
+        self.wrapped = False
+        # Instructions run since the trace started, traced or not
+        self.count = 0
+        self.file = None
+        if filename is not None:
+            self.file = open(filename, "wb")
+            self.file.write(_MAGIC + pack("<HH", _VERSION, _RECORD.size))
+
+    def step(self, program, pc, entry):
+        # Runs the instruction, called by the run loop in its place
+        func, args, _, opcode = entry
+        self.count += 1
+        if pc < self.pc_first or pc > self.pc_last:
+            func(program, *args)
+            return
+
+        dest = value = read = read_value = _NONE
+        if opcode == _op_rmem:
+            read = args[1] if args[1] < 32768 else program.registers[args[1] - 32768]
+            read_value = program.memory[read]
+        elif opcode == _op_wmem:
+            dest = args[0] if args[0] < 32768 else program.registers[args[0] - 32768]
+        func(program, *args)
+        if opcode == _op_wmem:
+            value = program.memory[dest]
+        elif opcode in _WRITES or opcode == _op_rmem:
+            dest = args[0]
+            value = program.registers[dest - 32768]
+
+        if self.addresses is not None:
+            addr = read if opcode == _op_rmem else dest if opcode == _op_wmem else None
+            if addr is None or addr < self.addresses[0] or addr > self.addresses[1]:
+                return
+        _RECORD.pack_into(
+            self.buffer, self.offset, self.count - 1, pc, opcode,
+            *args, *_PAD[len(args)], dest, value, read, read_value,
+        )
+        self.offset += _RECORD.size
+        if self.offset == len(self.buffer):
+            if self.file is not None:
+                self.file.write(self.buffer)
+            else:
+                self.wrapped = True
+            self.offset = 0
+
+    def records(self):
+        # What's still in the buffer, oldest first
+        if self.wrapped:
+            return self.buffer[self.offset:] + self.buffer[:self.offset]
+        return self.buffer[:self.offset]
+
+    def save(self, filename):
+        # Writes out the buffer, for a trace without a file
+        with open(filename, "wb") as f:
+            f.write(_MAGIC + pack("<HH", _VERSION, _RECORD.size))
+            f.write(self.records())
+
+    def close(self):
+        if self.file is not None:
+            self.file.write(self.buffer[:self.offset])
+            self.file.close()
+            self.file = None
+            self.offset = 0
+
+
+def read_trace(filename, chunk=65536):
+    # Yields each record as a tuple, in the order of the struct above
+    with open(filename, "rb") as f:
+        header = f.read(len(_MAGIC) + 4)
+        if header[:len(_MAGIC)] != _MAGIC:
+            raise Exception(f"{filename} isn't a trace")
+        version, size = unpack("<HH", header[len(_MAGIC):])
+        record = _RECORDS.get(version)
+        if record is None or size != record.size:
+            raise Exception(f"{filename} is trace version {version}, only {', '.join(str(x) for x in _RECORDS)} are supported")
+        while True:
+            data = f.read(chunk * size)
+            if len(data) == 0:
+                break
+            yield from record.iter_unpack(data[:len(data) - len(data) % size])
+
+
+def render(record):
+    # One line of text for a record, with the same disassembly as dump()
+    step, pc, opcode, a, b, c, dest, value, read, read_value = record
+    size = _opcodes[opcode]['size'] if opcode in _opcodes else 1
+    ret = f"{step:10d} {format_instruction(pc, (opcode, a, b, c)[:size]):<28}"
+    if read != _NONE:
+        ret += f" mem[{read}] -> {read_value}"
+    if dest != _NONE:
+        if dest >= 32768:
+            ret += f" r{dest - 32768} <- {value}"
+        else:
+            ret += f" mem[{dest}] <- {value}"
+    return ret.rstrip()
+
+
+def render_trace(filename, output=None):
+    # Decodes a trace into text, written to output, or printed
+    f = open(output, "w") if output is not None else None
+    try:
+        for record in read_trace(filename):
+            line = render(record)
+            if f is not None:
+                f.write(line + "\n")
+            else:
+                print(line)
+    finally:
+        if f is not None:
+            f.close()